@@ -0,0 +1,9 @@
+"""Benchmarks del API del taller
+
+Se ejecutan como módulos desde la raíz del proyecto, p. ej.:
+
+    python -m benchmarks.api
+    python -m benchmarks.api --update-baseline
+    python -m benchmarks.concurrencia --readers 4 --writers 4
+    python -m benchmarks.arranque --runs 10
+"""
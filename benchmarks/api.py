@@ -0,0 +1,245 @@
+"""Benchmark en proceso de las rutas GET de /api con presupuestos de consultas y latencia
+
+Arranca create_app() contra un conjunto de datos sintético, recorre cada
+caso de CASOS con el cliente de pruebas de Flask y mide latencia (p50, p95 y
+p99), número de sentencias SQL y pico de memoria (tracemalloc). Los
+resultados se comparan con baseline_api.json:
+
+- El número de consultas no admite margen: una ruta que pasa de 3 consultas
+  a una por fila (N+1) falla siempre, sea cual sea la máquina.
+- Latencia y memoria admiten TOLERANCIA_* sobre la línea base y sólo se
+  comparan si la escala coincide con la de la línea base.
+
+Sale con código 1 si alguna ruta supera su presupuesto o si hay rutas GET de
+/api sin ningún caso.
+
+La caché de respuestas se desactiva por defecto: con ella cada iteración tras
+la primera sería un acierto y no se mediría la vista. --cache memoria|sqlite
+la activa para ver el coste de servir desde ella.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from benchmarks.comun import crear_app_benchmark, percentil
+
+from sqlalchemy import event, text
+from src.models import db
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline_api.json')
+
+# Margen sobre la línea base antes de considerar una regresión
+TOLERANCIA_LATENCIA = 2.0
+HOLGURA_LATENCIA_MS = 5.0
+TOLERANCIA_MEMORIA = 1.5
+HOLGURA_MEMORIA_KB = 256
+
+# (nombre, ruta); los {marcadores} se rellenan con ids del conjunto de datos
+CASOS = [
+    ('clientes', '/api/clientes'),
+    ('clientes_busqueda', '/api/clientes?search=garcia'),
+    ('clientes_cursor', '/api/clientes?cursor=&total=exact'),
+    ('cliente', '/api/clientes/{cliente_id}'),
+    ('cliente_historial', '/api/clientes/{cliente_id}/historial'),
+    ('vehiculos', '/api/vehiculos'),
+    ('vehiculos_busqueda', '/api/vehiculos?search=seat'),
+    ('vehiculos_cursor', '/api/vehiculos?cursor='),
+    ('vehiculos_ultimo_servicio', '/api/vehiculos?orden=ultimo_servicio'),
+    ('vehiculos_sin_servicio', '/api/vehiculos?sin_servicio_meses=6'),
+    ('vehiculo', '/api/vehiculos/{vehiculo_id}'),
+    ('vehiculos_lookup', '/api/vehiculos/lookup?q={prefijo_matricula}'),
+    ('diagnosticos', '/api/diagnosticos'),
+    ('diagnosticos_estado', '/api/diagnosticos?estado=pendiente'),
+    ('diagnosticos_busqueda', '/api/diagnosticos?search=frenos'),
+    ('diagnosticos_cursor', '/api/diagnosticos?cursor='),
+    ('citas', '/api/citas?per_page=50'),
+    ('citas_tecnico', '/api/citas?tecnico_id={tecnico_id}&per_page=50'),
+    ('facturas', '/api/facturas'),
+    ('facturas_export_ndjson', '/api/facturas/export?format=ndjson'),
+    ('facturas_export_csv', '/api/facturas/export?format=csv&estado=pagada'),
+    ('repuestos_solicitudes', '/api/repuestos/solicitudes'),
+    ('proveedores', '/api/proveedores'),
+    ('tecnicos', '/api/tecnicos'),
+    ('tecnicos_especialidad', '/api/tecnicos?especialidad=Frenos'),
+    ('users', '/api/users'),
+    ('user', '/api/users/{user_id}'),
+    ('dashboard_stats', '/api/dashboard/stats'),
+    ('dashboard_revenue_chart', '/api/dashboard/revenue-chart?months=12'),
+    ('dashboard_revenue_chart_semanal', '/api/dashboard/revenue-chart?months=6&granularity=week'),
+    ('dashboard_repair_types', '/api/dashboard/repair-types'),
+    ('dashboard_recent_activity', '/api/dashboard/recent-activity'),
+    ('dashboard_diagnosticos_stats', '/api/dashboard/diagnosticos-stats'),
+]
+
+
+def _marcadores():
+    """Ids reales para las rutas con parámetros: el cliente y el vehículo con más historial"""
+    from src.models.user import User
+    
+    if not User.query.first():
+        db.session.add(User(username='benchmark', email='benchmark@taller.com'))
+        db.session.commit()
+    
+    consulta = lambda sql: db.session.execute(text(sql)).scalar()
+    vehiculo_id = consulta(
+        'SELECT vehiculo_id FROM diagnosticos GROUP BY vehiculo_id ORDER BY count(*) DESC, vehiculo_id LIMIT 1'
+    )
+    return {
+        'vehiculo_id': vehiculo_id,
+        'cliente_id': consulta(f'SELECT cliente_id FROM vehiculos WHERE id = {int(vehiculo_id)}'),
+        'prefijo_matricula': consulta('SELECT matricula_norm FROM vehiculos ORDER BY id LIMIT 1')[:3],
+        'tecnico_id': consulta('SELECT min(id) FROM tecnicos'),
+        'user_id': consulta('SELECT min(id) FROM user'),
+    }
+
+
+class ContadorConsultas:
+    """Cuenta las sentencias que llegan al cursor del engine"""
+    
+    def __init__(self, engine):
+        self.total = 0
+        event.listen(engine, 'before_cursor_execute', self._contar)
+    
+    def _contar(self, *args):
+        self.total += 1
+
+
+def medir(cliente, ruta, iteraciones, contador):
+    respuesta = cliente.get(ruta)
+    respuesta.get_data()
+    if respuesta.status_code >= 400:
+        raise RuntimeError(f'{ruta} devolvió {respuesta.status_code}: {respuesta.get_data(as_text=True)[:200]}')
+    
+    latencias = []
+    consultas = 0
+    for _ in range(iteraciones):
+        contador.total = 0
+        inicio = time.perf_counter()
+        cliente.get(ruta).get_data()
+        latencias.append((time.perf_counter() - inicio) * 1000)
+        consultas = max(consultas, contador.total)
+    
+    tracemalloc.start()
+    try:
+        cliente.get(ruta).get_data()
+        pico = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    
+    return {
+        'ruta': ruta,
+        'consultas': consultas,
+        'p50_ms': round(percentil(latencias, 50), 2),
+        'p95_ms': round(percentil(latencias, 95), 2),
+        'p99_ms': round(percentil(latencias, 99), 2),
+        'memoria_pico_kb': round(pico / 1024),
+    }
+
+
+def rutas_sin_casos(app, rutas):
+    """Reglas GET de /api que ninguna de las rutas medidas ejercita (salvo las internas, /api/_*)"""
+    adaptador = app.url_map.bind('localhost')
+    cubiertos = {adaptador.match(ruta.split('?')[0], method='GET')[0] for ruta in rutas}
+    return sorted(
+        regla.rule for regla in app.url_map.iter_rules()
+        if regla.rule.startswith('/api/') and not regla.rule.startswith('/api/_')
+        and 'GET' in regla.methods and regla.endpoint not in cubiertos
+    )
+
+
+def comparar(resultados, linea_base, escala):
+    """Lista de mensajes de regresión respecto a la línea base"""
+    fallos = []
+    misma_escala = linea_base.get('escala') == escala
+    for nombre, medida in resultados.items():
+        presupuesto = linea_base.get('rutas', {}).get(nombre)
+        if presupuesto is None:
+            fallos.append(f'{nombre}: sin presupuesto en la línea base (ejecute con --update-baseline)')
+            continue
+        
+        if medida['consultas'] > presupuesto['consultas']:
+            fallos.append(
+                f'{nombre}: {medida["consultas"]} consultas SQL, presupuesto {presupuesto["consultas"]} '
+                f'(¿N+1 o carga perezosa nueva?)'
+            )
+        if not misma_escala:
+            continue
+        
+        limite_ms = max(presupuesto['p95_ms'] * TOLERANCIA_LATENCIA, presupuesto['p95_ms'] + HOLGURA_LATENCIA_MS)
+        if medida['p95_ms'] > limite_ms:
+            fallos.append(f'{nombre}: p95 {medida["p95_ms"]} ms, límite {limite_ms:.2f} ms')
+        
+        limite_kb = presupuesto['memoria_pico_kb'] * TOLERANCIA_MEMORIA + HOLGURA_MEMORIA_KB
+        if medida['memoria_pico_kb'] > limite_kb:
+            fallos.append(f'{nombre}: pico de memoria {medida["memoria_pico_kb"]} KB, límite {limite_kb:.0f} KB')
+    return fallos
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=int, default=1, help='Escala del conjunto sintético (1000 clientes por unidad).')
+    parser.add_argument('--iterations', type=int, default=20, help='Peticiones medidas por ruta.')
+    parser.add_argument('--db', help='Fichero SQLite a reutilizar entre ejecuciones (se genera si no existe).')
+    parser.add_argument('--baseline', default=BASELINE, help='Fichero JSON con los presupuestos.')
+    parser.add_argument('--update-baseline', action='store_true', help='Guarda las medidas como nueva línea base.')
+    parser.add_argument('--only', help='Mide sólo los casos cuyo nombre contiene este texto.')
+    parser.add_argument('--cache', choices=('off', 'memoria', 'sqlite'), default='off', help='Almacén de la caché de respuestas.')
+    args = parser.parse_args(argv)
+    if args.update_baseline and args.cache != 'off':
+        parser.error('la línea base se mide sin caché de respuestas')
+    
+    app, _ = crear_app_benchmark(args.scale, args.db, config={'CACHE_RESPUESTAS': args.cache})
+    casos = [(nombre, ruta) for nombre, ruta in CASOS if not args.only or args.only in nombre]
+    
+    # Las peticiones se lanzan sin un contexto de aplicación abierto alrededor: cada una
+    # abre el suyo y su propia sesión, como en el servidor, sin identity map compartido
+    with app.app_context():
+        marcadores = _marcadores()
+        contador = ContadorConsultas(db.engine)
+    cliente = app.test_client()
+    
+    resultados = {}
+    print(f'{"caso":<34}{"consultas":>10}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}{"pico KB":>10}')
+    for nombre, plantilla in casos:
+        medida = medir(cliente, plantilla.format(**marcadores), args.iterations, contador)
+        resultados[nombre] = medida
+        print(
+            f'{nombre:<34}{medida["consultas"]:>10}{medida["p50_ms"]:>10}{medida["p95_ms"]:>10}'
+            f'{medida["p99_ms"]:>10}{medida["memoria_pico_kb"]:>10}'
+        )
+    
+    sin_casos = [] if args.only else rutas_sin_casos(app, [ruta.format(**marcadores) for _, ruta in CASOS])
+    
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'escala': args.scale, 'iteraciones': args.iterations, 'rutas': resultados},
+                      f, indent=2, ensure_ascii=False, sort_keys=True)
+            f.write('\n')
+        print(f'\nLínea base guardada en {args.baseline}')
+        return 0
+    
+    fallos = [f'{regla}: ruta GET sin caso de benchmark' for regla in sin_casos]
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            linea_base = json.load(f)
+        if linea_base.get('escala') != args.scale:
+            print(f'\nAviso: la línea base es de escala {linea_base.get("escala")}; sólo se comparan las consultas.')
+        fallos += comparar(resultados, linea_base, args.scale)
+    else:
+        fallos.append(f'No existe {args.baseline} (ejecute con --update-baseline)')
+    
+    if fallos:
+        print('\nREGRESIONES:', file=sys.stderr)
+        for fallo in fallos:
+            print(f'  - {fallo}', file=sys.stderr)
+        return 1
+    
+    print('\nTodas las rutas dentro de presupuesto.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
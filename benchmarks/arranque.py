@@ -0,0 +1,108 @@
+"""Tiempo de arranque de un worker: en frío y con fork desde un maestro precargado
+
+- frio: un intérprete nuevo importa src.main (que crea la app) y atiende una
+  primera petición, como un worker de gunicorn sin --preload.
+- preload: la app ya está creada en este proceso y cada worker es un fork que
+  atiende su primera petición, como gunicorn --preload.
+
+Para cada modo se informa de la mediana y el p95 del tiempo hasta importar la
+app y hasta completar la primera petición, sobre --runs arranques.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.comun import crear_app_benchmark, percentil
+
+from src.models import db
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RUTA_PRIMERA_PETICION = '/api/dashboard/stats'
+
+# Se ejecuta en un intérprete nuevo; los tiempos se cuentan desde antes de cualquier import
+CODIGO_FRIO = f'''
+import json, time
+inicio = time.perf_counter()
+from src.main import application
+importado = time.perf_counter()
+respuesta = application.test_client().get({RUTA_PRIMERA_PETICION!r})
+assert respuesta.status_code == 200, respuesta.status_code
+print(json.dumps({{'import_ms': (importado - inicio) * 1000, 'peticion_ms': (time.perf_counter() - inicio) * 1000}}))
+'''
+
+
+def arranque_frio(ruta_db):
+    entorno = dict(os.environ, DATABASE_URL=f'sqlite:///{ruta_db}', PYTHONPATH=RAIZ)
+    inicio = time.perf_counter()
+    salida = subprocess.run(
+        [sys.executable, '-c', CODIGO_FRIO], cwd=RAIZ, env=entorno,
+        capture_output=True, text=True, check=True
+    ).stdout
+    medida = json.loads(salida.strip().splitlines()[-1])
+    # Incluye el arranque del propio intérprete
+    medida['proceso_ms'] = (time.perf_counter() - inicio) * 1000
+    return medida
+
+
+def arranque_preload(app):
+    lectura, escritura = os.pipe()
+    inicio = time.perf_counter()
+    pid = os.fork()
+    if pid == 0:
+        os.close(lectura)
+        codigo = 1
+        try:
+            respuesta = app.test_client().get(RUTA_PRIMERA_PETICION)
+            os.write(escritura, str(respuesta.status_code).encode())
+            codigo = 0
+        finally:
+            os._exit(codigo)
+    
+    os.close(escritura)
+    estado = os.read(lectura, 16).decode()
+    peticion_ms = (time.perf_counter() - inicio) * 1000
+    os.close(lectura)
+    os.waitpid(pid, 0)
+    if estado != '200':
+        raise RuntimeError(f'El worker devolvió {estado or "un error"}')
+    return {'import_ms': 0.0, 'peticion_ms': peticion_ms, 'proceso_ms': peticion_ms}
+
+
+def resumen(medidas, clave):
+    valores = [m[clave] for m in medidas]
+    return f'{statistics.median(valores):>10.1f}{percentil(valores, 95):>10.1f}'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=int, default=1, help='Escala del conjunto sintético (1000 clientes por unidad).')
+    parser.add_argument('--db', help='Fichero SQLite a reutilizar entre ejecuciones (se genera si no existe).')
+    parser.add_argument('--runs', type=int, default=10, help='Arranques medidos por modo.')
+    args = parser.parse_args(argv)
+    
+    app, ruta_db = crear_app_benchmark(args.scale, args.db)
+    ruta_db = os.path.abspath(ruta_db)
+    with app.app_context():
+        # Como en gunicorn --preload: el maestro no debe tener conexiones abiertas al hacer fork
+        db.engine.dispose()
+    
+    modos = {'frio': [arranque_frio(ruta_db) for _ in range(args.runs)]}
+    if hasattr(os, 'fork'):
+        modos['preload'] = [arranque_preload(app) for _ in range(args.runs)]
+    
+    print(f'{"modo":<10}{"import p50":>10}{"p95":>10}{"1ª pet. p50":>12}{"p95":>10}{"proceso p50":>12}{"p95":>10}   (ms)')
+    for nombre, medidas in modos.items():
+        print(
+            f'{nombre:<10}{resumen(medidas, "import_ms")}  {resumen(medidas, "peticion_ms")}'
+            f'  {resumen(medidas, "proceso_ms")}'
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,54 @@
+import os
+import sys
+import tempfile
+import time
+
+# Raíz del proyecto en sys.path para poder importar src.* al ejecutar python -m benchmarks.xxx
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.main import create_app
+from src.models import db
+from src.models.cliente import Cliente
+from src.utils.datos_sinteticos import CLIENTES_POR_ESCALA, generar_datos_sinteticos
+from src.utils.inicializacion import inicializar_base_datos, sembrar_datos_ejemplo
+
+
+def percentil(valores, p):
+    """Percentil p (0-100) por interpolación lineal entre las muestras ordenadas"""
+    ordenados = sorted(valores)
+    if not ordenados:
+        return 0.0
+    posicion = (len(ordenados) - 1) * p / 100
+    inferior = int(posicion)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicion - inferior)
+
+
+def crear_app_benchmark(escala, ruta_db=None, semilla=42, config=None):
+    """App contra una base de datos SQLite con escala × CLIENTES_POR_ESCALA clientes sintéticos
+
+    Si ruta_db ya existe y tiene datos se reutiliza tal cual, para no
+    regenerar el conjunto en cada ejecución; si no se indica, se crea en un
+    directorio temporal.
+    """
+    if ruta_db is None:
+        ruta_db = os.path.join(tempfile.mkdtemp(prefix='taller-bench-'), 'taller.db')
+    existia = os.path.exists(ruta_db)
+    
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{os.path.abspath(ruta_db)}', **(config or {})})
+    
+    with app.app_context():
+        # Lo mismo que `flask init-db --seed`; los datos sintéticos se añaden a continuación
+        inicializar_base_datos()
+        sembrar_datos_ejemplo()
+        if not existia or Cliente.query.count() < escala * CLIENTES_POR_ESCALA:
+            inicio = time.perf_counter()
+            totales = generar_datos_sinteticos(escala, semilla=semilla)
+            print(
+                f'Datos sintéticos (escala {escala}): {sum(totales.values())} filas '
+                f'en {time.perf_counter() - inicio:.1f} s -> {ruta_db}',
+                file=sys.stderr
+            )
+        db.session.remove()
+    
+    return app, ruta_db
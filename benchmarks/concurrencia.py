@@ -0,0 +1,137 @@
+"""Rendimiento de lecturas y escrituras concurrentes sobre SQLite, antes y después de los pragmas
+
+Lanza varios procesos lectores y escritores (como workers de gunicorn) contra
+el mismo fichero SQLite durante unos segundos con cada configuración:
+
+- antes: los valores por defecto de SQLite (rollback journal, synchronous=FULL)
+- despues: PRAGMAS_SQLITE de src/utils/motor.py (WAL, synchronous=NORMAL, ...)
+
+Cada proceso crea su propia app con create_app() y lanza peticiones con el
+cliente de pruebas de Flask. Los lectores alternan rutas de consulta y los
+escritores dan de alta clientes. Se informa de operaciones por segundo,
+latencia p95 y errores de cada tipo.
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+from benchmarks.comun import crear_app_benchmark, percentil
+
+from src.main import create_app
+from src.models import db
+from src.models.cliente import Cliente
+from src.utils.motor import PRAGMAS_SQLITE
+
+CONFIGURACIONES = {
+    # Se fijan explícitamente porque journal_mode=WAL persiste en el fichero
+    'antes': {'journal_mode': 'DELETE', 'synchronous': 'FULL'},
+    'despues': PRAGMAS_SQLITE,
+}
+
+RUTAS_LECTURA = (
+    '/api/clientes/{id}',
+    '/api/clientes?per_page=20',
+    '/api/dashboard/stats',
+    '/api/vehiculos?per_page=20',
+)
+
+
+def _trabajador(tipo, indice, ruta_db, pragmas, num_clientes, inicio, duracion, resultados):
+    app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{ruta_db}', 'SQLITE_PRAGMAS': pragmas})
+    cliente = app.test_client()
+    aleatorio = random.Random(indice)
+    latencias = []
+    errores = 0
+    
+    inicio.wait()
+    fin = time.perf_counter() + duracion
+    n = 0
+    while time.perf_counter() < fin:
+        n += 1
+        t = time.perf_counter()
+        if tipo == 'lectura':
+            ruta = aleatorio.choice(RUTAS_LECTURA).format(id=aleatorio.randint(1, num_clientes))
+            respuesta = cliente.get(ruta)
+        else:
+            respuesta = cliente.post('/api/clientes', json={
+                'nombre_completo': f'Concurrencia {indice}-{n}',
+                'dni': f'C{indice:03d}{n:07d}{time.time_ns() % 10000:04d}',
+                'telefono': '600000000',
+                'email': f'concurrencia{indice}.{n}@taller.com',
+                'direccion': 'Calle Benchmark 1',
+                'persona_contacto': 'Benchmark',
+            })
+        respuesta.get_data()
+        if respuesta.status_code >= 400:
+            errores += 1
+        else:
+            latencias.append((time.perf_counter() - t) * 1000)
+    
+    resultados.put((tipo, latencias, errores))
+
+
+def ejecutar(nombre, ruta_db, lectores, escritores, duracion, num_clientes):
+    contexto = multiprocessing.get_context('spawn')
+    inicio = contexto.Event()
+    resultados = contexto.Queue()
+    procesos = [
+        contexto.Process(target=_trabajador, args=(
+            tipo, i, ruta_db, CONFIGURACIONES[nombre], num_clientes, inicio, duracion, resultados
+        ))
+        for i, tipo in enumerate(['lectura'] * lectores + ['escritura'] * escritores)
+    ]
+    for proceso in procesos:
+        proceso.start()
+    # Margen para que todos los procesos terminen de importar y crear su app
+    time.sleep(min(10, 2 + len(procesos)))
+    inicio.set()
+    
+    por_tipo = {'lectura': ([], 0), 'escritura': ([], 0)}
+    for _ in procesos:
+        tipo, latencias, errores = resultados.get()
+        acumuladas, total_errores = por_tipo[tipo]
+        por_tipo[tipo] = (acumuladas + latencias, total_errores + errores)
+    for proceso in procesos:
+        proceso.join()
+    
+    return {
+        tipo: {
+            'ops_s': round(len(latencias) / duracion, 1),
+            'p95_ms': round(percentil(latencias, 95), 2),
+            'errores': errores,
+        }
+        for tipo, (latencias, errores) in por_tipo.items()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=int, default=1, help='Escala del conjunto sintético (1000 clientes por unidad).')
+    parser.add_argument('--db', help='Fichero SQLite a reutilizar entre ejecuciones (se genera si no existe).')
+    parser.add_argument('--readers', type=int, default=4, help='Procesos lectores.')
+    parser.add_argument('--writers', type=int, default=2, help='Procesos escritores.')
+    parser.add_argument('--seconds', type=float, default=10, help='Duración de cada medición.')
+    args = parser.parse_args(argv)
+    
+    app, ruta_db = crear_app_benchmark(args.scale, args.db)
+    ruta_db = os.path.abspath(ruta_db)
+    with app.app_context():
+        num_clientes = Cliente.query.count()
+        db.session.remove()
+        # Sin conexiones abiertas en este proceso, para que los trabajadores puedan cambiar journal_mode
+        db.engine.dispose()
+    
+    print(f'{args.readers} lectores y {args.writers} escritores durante {args.seconds:g} s por configuración')
+    print(f'{"configuración":<14}{"tipo":<11}{"ops/s":>10}{"p95 ms":>10}{"errores":>10}')
+    for nombre in CONFIGURACIONES:
+        medidas = ejecutar(nombre, ruta_db, args.readers, args.writers, args.seconds, num_clientes)
+        for tipo, medida in medidas.items():
+            print(f'{nombre:<14}{tipo:<11}{medida["ops_s"]:>10}{medida["p95_ms"]:>10}{medida["errores"]:>10}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
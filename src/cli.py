@@ -0,0 +1,148 @@
+import click
+import os
+import time
+
+from src.models import db
+from src.models.contador import reconciliar_contadores
+from src.models.revenue_rollup import reconstruir_revenue_rollup
+from src.models.vehiculo import recalcular_ultimo_servicio
+from src.models.version_tabla import incrementar_versiones
+from src.utils.busqueda import crear_indices_busqueda
+from src.utils.datos_sinteticos import CLIENTES_POR_ESCALA, generar_datos_sinteticos
+from src.utils.estaticos import assets_sin_referencias
+from src.utils.facturacion import ESTADOS_RECALCULABLES, recalcular_facturas
+from src.utils.importacion import FORMATOS_IMPORTACION, IMPORTADORES, leer_registros
+from src.utils.inicializacion import inicializar_base_datos, migrar_base_datos, sembrar_datos_ejemplo
+
+
+def register_commands(app):
+    """Registra los comandos de mantenimiento en la CLI de Flask (flask --app src.main ...)"""
+
+    @app.cli.command('init-db')
+    @click.option('--seed', is_flag=True, help='Crea también los datos de ejemplo si no hay clientes.')
+    def init_db(seed):
+        """Crea o actualiza el esquema e inicializa contadores y rollup de ingresos."""
+        aplicadas = inicializar_base_datos()
+        click.echo(f'Base de datos lista ({len(aplicadas)} migraciones de datos aplicadas).')
+        if seed and sembrar_datos_ejemplo():
+            click.echo('Datos de ejemplo creados.')
+
+    @app.cli.command('migrate')
+    def migrate():
+        """Añade tablas, columnas e índices nuevos y aplica las migraciones de datos pendientes."""
+        aplicadas = migrar_base_datos()
+        if aplicadas:
+            click.echo(f'Migraciones aplicadas: {", ".join(aplicadas)}')
+        else:
+            click.echo('El esquema ya estaba al día.')
+
+    @app.cli.command('seed')
+    def seed():
+        """Crea los datos de ejemplo si la base de datos no tiene clientes."""
+        if sembrar_datos_ejemplo():
+            click.echo('Datos de ejemplo creados.')
+        else:
+            click.echo('La base de datos ya tiene clientes, no se crean datos de ejemplo.')
+
+    @app.cli.command('reconcile-counters')
+    def reconcile_counters():
+        """Recalcula los contadores del dashboard desde las tablas de origen."""
+        valores = reconciliar_contadores()
+        click.echo(f'{len(valores)} contadores reconciliados.')
+
+    @app.cli.command('rebuild-revenue-rollup')
+    def rebuild_revenue_rollup():
+        """Reconstruye desde cero el rollup mensual de ingresos."""
+        filas = reconstruir_revenue_rollup()
+        click.echo(f'Rollup de ingresos reconstruido: {filas} filas.')
+
+    @app.cli.command('rebuild-search-index')
+    def rebuild_search_index():
+        """Reconstruye los índices FTS5 de clientes, vehículos y diagnósticos."""
+        reconstruidos = crear_indices_busqueda(reconstruir=True)
+        if reconstruidos:
+            click.echo(f'Índices reconstruidos: {", ".join(reconstruidos)}')
+        else:
+            click.echo('El motor de base de datos no es SQLite, la búsqueda usa ILIKE.')
+
+    @app.cli.command('backfill-ultimo-servicio')
+    def backfill_ultimo_servicio():
+        """Recalcula fecha_ultimo_servicio de todos los vehículos."""
+        with db.engine.begin() as connection:
+            vehiculos = recalcular_ultimo_servicio(connection)
+            incrementar_versiones(connection, ['vehiculos'])
+        click.echo(f'fecha_ultimo_servicio recalculada en {vehiculos} vehículos.')
+
+    @app.cli.command('recalculate-invoices')
+    @click.option('--margen-nuevos', type=float, default=20, show_default=True, help='Margen (%) de repuestos nuevos.')
+    @click.option('--margen-usados', type=float, default=30, show_default=True, help='Margen (%) de repuestos usados.')
+    @click.option('--iva', type=float, default=21, show_default=True, help='IVA (%).')
+    @click.option('--estado', 'estados', multiple=True, type=click.Choice(ESTADOS_RECALCULABLES),
+                  help='Estado a recalcular (repetible). Por defecto borrador y enviada.')
+    @click.option('--dry-run', is_flag=True, help='Sólo informa de la diferencia, sin guardar cambios.')
+    def recalculate_invoices(margen_nuevos, margen_usados, iva, estados, dry_run):
+        """Recalcula en bloque los importes de las facturas abiertas."""
+        resumen = recalcular_facturas(
+            margen_nuevos=margen_nuevos,
+            margen_usados=margen_usados,
+            iva_porcentaje=iva,
+            estados=estados or ESTADOS_RECALCULABLES,
+            dry_run=dry_run
+        )
+        for estado, datos in sorted(resumen['por_estado'].items()):
+            click.echo(f'  {estado}: {datos["facturas"]} facturas, diferencia {datos["diferencia"]:+.2f}')
+        accion = 'se recalcularían' if dry_run else 'recalculadas'
+        click.echo(
+            f'{resumen["facturas"]} facturas {accion}: total {resumen["total_anterior"]:.2f} -> '
+            f'{resumen["total_nuevo"]:.2f} ({resumen["diferencia"]:+.2f}).'
+        )
+
+    @app.cli.command('import')
+    @click.argument('entidad', type=click.Choice(list(IMPORTADORES)))
+    @click.argument('archivo', type=click.File('rb'))
+    @click.option('--format', 'formato', type=click.Choice(FORMATOS_IMPORTACION),
+                  help='Formato del fichero. Por defecto se deduce de la extensión (.csv o NDJSON).')
+    def import_data(entidad, archivo, formato):
+        """Importa clientes o vehículos en bloque desde un fichero CSV o NDJSON."""
+        if not formato:
+            formato = 'csv' if archivo.name.lower().endswith('.csv') else 'ndjson'
+        informe = IMPORTADORES[entidad](leer_registros(archivo, formato))
+        for error in informe['detalle_errores']:
+            click.echo(f'  línea {error["linea"]}: {error["error"]}', err=True)
+        click.echo(
+            f'{informe["importados"]} de {informe["procesados"]} registros importados, '
+            f'{informe["errores"]} con errores.'
+        )
+
+    @app.cli.command('generate-data')
+    @click.option('--scale', 'escala', type=click.IntRange(min=1), required=True,
+                  help='Tamaño del conjunto: --clients-per-scale clientes (y sus vehículos, diagnósticos...) por unidad.')
+    @click.option('--clients-per-scale', 'clientes_por_escala', type=click.IntRange(min=1), default=CLIENTES_POR_ESCALA,
+                  show_default=True, help='Clientes por unidad de escala.')
+    @click.option('--seed', 'semilla', type=int, default=42, show_default=True, help='Semilla del generador aleatorio.')
+    def generate_data(escala, clientes_por_escala, semilla):
+        """Genera datos sintéticos realistas para pruebas de carga y benchmarks."""
+        inicio = time.perf_counter()
+        totales = generar_datos_sinteticos(
+            escala, semilla=semilla, clientes_por_escala=clientes_por_escala,
+            progreso=lambda hechos, total: click.echo(f'  {hechos}/{total} clientes', err=True)
+        )
+        for tabla, filas in totales.items():
+            click.echo(f'  {tabla}: {filas}')
+        click.echo(f'{sum(totales.values())} filas generadas en {time.perf_counter() - inicio:.1f} s.')
+
+    @app.cli.command('prune-assets')
+    @click.option('--dry-run', is_flag=True, help='Sólo lista los ficheros, sin borrarlos.')
+    def prune_assets(dry_run):
+        """Borra de static/assets los bundles que ningún HTML publicado referencia."""
+        carpeta = app.config['ESTATICOS_CARPETA']
+        sobrantes = assets_sin_referencias(carpeta)
+        liberado = 0
+        for ruta in sobrantes:
+            ruta_completa = os.path.join(carpeta, ruta)
+            liberado += os.path.getsize(ruta_completa)
+            click.echo(f'  {ruta}')
+            if not dry_run:
+                os.remove(ruta_completa)
+        accion = 'se borrarían' if dry_run else 'borrados'
+        click.echo(f'{len(sobrantes)} ficheros sin referencias {accion} ({liberado / 1024:.0f} KB).')
@@ -1,11 +1,12 @@
 
 import os
 import sys
+import tempfile
 
 # Añadir la ruta raíz del proyecto para que Flask y Python encuentren los módulos
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from flask import Flask, send_from_directory
+from flask import Flask
 from flask_cors import CORS
 
 # Modelos y base de datos
@@ -19,6 +20,10 @@ from src.models.repuesto import Repuesto, SolicitudRepuesto, CotizacionRepuesto
 from src.models.proveedor import Proveedor
 from src.models.cita import Cita
 from src.models.factura import Factura
+from src.models.secuencia import Secuencia
+from src.models.contador import Contador, programar_reconciliacion_periodica
+from src.models.revenue_rollup import RevenueRollup
+from src.models.version_tabla import VersionTabla
 
 # Rutas
 from src.routes.user import user_bp
@@ -31,28 +36,66 @@ from src.routes.repuestos import repuestos_bp
 from src.routes.proveedores import proveedores_bp
 from src.routes.citas import citas_bp
 from src.routes.facturas import facturas_bp
+from src.routes.metricas import metricas_bp
 
-# Datos de prueba
-from src.utils.seed_data import create_sample_data
+# Comandos de la CLI de Flask
+from src.cli import register_commands
 
-def create_app():
-    app = Flask(__name__, static_folder='../static', static_url_path='')
+from src.utils.cache_respuestas import iniciar_cache_respuestas
+from src.utils.instrumentacion import iniciar_instrumentacion
+from src.utils.motor import configuracion_base_datos, configurar_motor
+from src.utils.estaticos import ManifiestoEstaticos, servir_estatico
+
+def create_app(config=None):
+    # Sin la ruta de estáticos de Flask: los sirve serve_static desde el manifiesto en memoria
+    app = Flask(__name__, static_folder=None)
 
     # Configuración
     app.config['SECRET_KEY'] = 'tu-clave-secreta-aqui'
-    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///taller.db'
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['ESTATICOS_CARPETA'] = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+    # URI, pool, límite de duración de las sentencias y pragmas de SQLite (ver src/utils/motor.py)
+    app.config.update(configuracion_base_datos())
+    # Segundos entre reconciliaciones de los contadores del dashboard (0 = desactivado); los workers se turnan
+    app.config['CONTADORES_RECONCILIAR_SEGUNDOS'] = int(os.environ.get('CONTADORES_RECONCILIAR_SEGUNDOS', 0))
+    # Numeración de facturas: serie por año (FT2026-000123) y números reservados por worker de una vez (no con SQLite)
+    app.config['FACTURA_SERIE_ANUAL'] = os.environ.get('FACTURA_SERIE_ANUAL', '0') == '1'
+    app.config['FACTURA_BLOQUE_NUMEROS'] = int(os.environ.get('FACTURA_BLOQUE_NUMEROS', 1))
+    # Medición de SQL por petición (cabeceras Server-Timing y /api/_metrics); avisa de las peticiones lentas
+    app.config['INSTRUMENTACION_SQL'] = os.environ.get('INSTRUMENTACION_SQL', '0') == '1'
+    app.config['INSTRUMENTACION_SQL_LENTA_MS'] = int(os.environ.get('INSTRUMENTACION_SQL_LENTA_MS', 500))
+    # Caché de respuestas GET invalidada por escrituras: 'memoria' (por worker), 'sqlite' (un fichero
+    # compartido por los workers de la máquina) u 'off'; ver src/utils/cache_respuestas.py
+    app.config['CACHE_RESPUESTAS'] = os.environ.get('CACHE_RESPUESTAS', 'memoria')
+    app.config['CACHE_RESPUESTAS_RUTA'] = os.environ.get(
+        'CACHE_RESPUESTAS_RUTA', os.path.join(tempfile.gettempdir(), 'taller_cache_respuestas.db')
+    )
+    app.config['CACHE_RESPUESTAS_MAX_ENTRADAS'] = int(os.environ.get('CACHE_RESPUESTAS_MAX_ENTRADAS', 1000))
+    app.config['CACHE_RESPUESTAS_TTL'] = int(os.environ.get('CACHE_RESPUESTAS_TTL', 300))
+    # Sobrescrituras explícitas (benchmarks, scripts): p. ej. otra SQLALCHEMY_DATABASE_URI
+    if config:
+        app.config.update(config)
 
     # Inicializar extensiones
     db.init_app(app)
+    configurar_motor(app)
     CORS(app, origins="*")
 
-    # Crear tablas y datos de ejemplo
-    with app.app_context():
-        db.create_all()
-        if not Cliente.query.first():
-            create_sample_data()
-            print("✅ Datos de ejemplo creados exitosamente.")
+    # Sin E/S de base de datos aquí: el esquema y los datos de ejemplo se crean con
+    # `flask init-db` / `flask migrate` / `flask seed`, una vez por despliegue y no en
+    # cada worker. Así la app se puede crear en el maestro de gunicorn --preload sin
+    # abrir conexiones que los workers heredarían con el fork.
+    if app.config['CONTADORES_RECONCILIAR_SEGUNDOS'] > 0:
+        programar_reconciliacion_periodica(app, app.config['CONTADORES_RECONCILIAR_SEGUNDOS'])
+
+    if app.config['INSTRUMENTACION_SQL']:
+        iniciar_instrumentacion(app)
+    if app.config['CACHE_RESPUESTAS'] != 'off':
+        iniciar_cache_respuestas(app)
+    if app.config['INSTRUMENTACION_SQL'] or app.config['CACHE_RESPUESTAS'] != 'off':
+        app.register_blueprint(metricas_bp, url_prefix='/api')
+
+    register_commands(app)
 
     # Registrar Blueprints
     app.register_blueprint(user_bp, url_prefix='/api')
@@ -66,20 +109,33 @@ def create_app():
     app.register_blueprint(citas_bp, url_prefix='/api')
     app.register_blueprint(facturas_bp, url_prefix='/api')
 
+    # Frontend: índice en memoria de static/ con ETag y variantes gzip/brotli precalculadas
+    estaticos = ManifiestoEstaticos(app.config['ESTATICOS_CARPETA'])
+
+    def servir_indice():
+        # Sin build del frontend (static/ vacío o sin index.html) no hay SPA que servir
+        indice = estaticos.get('index.html')
+        if indice is None:
+            return {'error': 'index.html not found'}, 404
+        return servir_estatico(indice)
+
     # Ruta principal del frontend
     @app.route('/')
     def serve_frontend():
-        return send_from_directory(app.static_folder, 'index.html')
+        return servir_indice()
 
     # Archivos estáticos o rutas SPA
     @app.route('/<path:path>')
     def serve_static(path):
         if path.startswith('api/'):
             return {'error': 'API endpoint not found'}, 404
-        static_path = os.path.join(app.static_folder, path)
-        if os.path.exists(static_path):
-            return send_from_directory(app.static_folder, path)
-        return send_from_directory(app.static_folder, 'index.html')
+        archivo = estaticos.get(path)
+        if archivo is not None:
+            return servir_estatico(archivo)
+        # Un bundle que ya no existe (build anterior) no debe recibir el HTML de la SPA
+        if path.startswith('assets/'):
+            return {'error': 'Asset not found'}, 404
+        return servir_indice()
 
     return app
 
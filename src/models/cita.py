@@ -1,8 +1,16 @@
 from src.models import db
+from src.models.diagnostico import Diagnostico
+from src.models.vehiculo import Vehiculo
 from datetime import datetime
+from sqlalchemy.orm import joinedload
 
 class Cita(db.Model):
     __tablename__ = 'citas'
+    __table_args__ = (
+        # Filtros por rango de fecha_hora, globales o de la agenda de un técnico
+        db.Index('ix_citas_fecha_hora', 'fecha_hora'),
+        db.Index('ix_citas_tecnico_id_fecha_hora', 'tecnico_id', 'fecha_hora'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     diagnostico_id = db.Column(db.Integer, db.ForeignKey('diagnosticos.id'), nullable=False)
@@ -14,6 +22,14 @@ class Cita(db.Model):
     observaciones = db.Column(db.Text)
     fecha_creacion = db.Column(db.DateTime, default=datetime.utcnow)
     
+    @classmethod
+    def opciones_carga(cls):
+        """Carga en la misma consulta diagnóstico, vehículo, cliente y técnico para to_dict()"""
+        return (
+            joinedload(cls.diagnostico).joinedload(Diagnostico.vehiculo).joinedload(Vehiculo.cliente),
+            joinedload(cls.tecnico)
+        )
+    
     def to_dict(self):
         return {
             'id': self.id,
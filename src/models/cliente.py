@@ -1,8 +1,14 @@
 from src.models import db
+from src.models.vehiculo import Vehiculo
 from datetime import datetime
+from sqlalchemy import func
 
 class Cliente(db.Model):
     __tablename__ = 'clientes'
+    __table_args__ = (
+        # Recorrido de ?cursor= en GET /api/clientes
+        db.Index('ix_clientes_fecha_registro_id', 'fecha_registro', 'id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     nombre_completo = db.Column(db.String(200), nullable=False)
@@ -17,6 +23,12 @@ class Cliente(db.Model):
     # Relaciones
     vehiculos = db.relationship('Vehiculo', backref='cliente', lazy=True, cascade='all, delete-orphan')
     
+    # Recuento como subconsulta correlacionada: se resuelve en el mismo SELECT
+    # que carga el cliente, sin traer la colección de vehículos
+    vehiculos_count = db.column_property(
+        db.select(func.count(Vehiculo.id)).where(Vehiculo.cliente_id == id).correlate_except(Vehiculo).scalar_subquery()
+    )
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -28,7 +40,7 @@ class Cliente(db.Model):
             'persona_contacto': self.persona_contacto,
             'fecha_registro': self.fecha_registro.isoformat() if self.fecha_registro else None,
             'activo': self.activo,
-            'vehiculos_count': len(self.vehiculos) if self.vehiculos else 0
+            'vehiculos_count': self.vehiculos_count or 0
         }
     
     def __repr__(self):
@@ -0,0 +1,236 @@
+from src.models import db
+from src.models.cliente import Cliente
+from src.models.vehiculo import Vehiculo
+from src.models.cita import Cita
+from src.models.factura import Factura
+from src.models.repuesto import SolicitudRepuesto
+from src.models.secuencia import reclamar_turno
+from src.models.version_tabla import incrementar_versiones
+from src.utils.sql import upsert_incremento
+from collections import defaultdict
+from datetime import datetime
+from sqlalchemy import func
+import os
+import threading
+import time
+
+ESTADOS_REPUESTO_PENDIENTE = ('solicitado', 'cotizado', 'pedido')
+
+class Contador(db.Model):
+    """Contadores del dashboard mantenidos por eventos del ORM
+
+    Cada fila es un agregado ya calculado (p. ej. 'clientes_activos' o
+    'citas_dia:2025-07-28') que los listeners de este módulo ajustan en la
+    misma transacción que inserta, modifica o borra las filas de origen, de
+    modo que /dashboard/stats sólo tiene que leerlos por clave primaria.
+    reconciliar_contadores() los recalcula desde cero para corregir cualquier
+    desviación (escrituras fuera del ORM, actualizaciones masivas, etc.).
+    """
+    __tablename__ = 'contadores'
+    
+    clave = db.Column(db.String(50), primary_key=True)
+    valor = db.Column(db.Float, nullable=False, default=0.0)
+    
+    def __repr__(self):
+        return f'<Contador {self.clave}={self.valor}>'
+
+
+def clave_citas_dia(fecha):
+    return f'citas_dia:{fecha.isoformat()}'
+
+
+# Aportación de una fila a cada contador a partir de sus valores
+def _aporte_vehiculo(v):
+    return {'vehiculos_en_taller': 1} if v['estado'] == 'en_taller' else {}
+
+def _aporte_cita(v):
+    return {clave_citas_dia(v['fecha_hora'].date()): 1} if v['fecha_hora'] else {}
+
+def _aporte_factura(v):
+    return {'facturas_pendientes': 1} if v['estado'] == 'enviada' else {}
+
+def _aporte_cliente(v):
+    return {'clientes_activos': 1} if v['activo'] else {}
+
+def _aporte_solicitud(v):
+    return {'repuestos_pendientes': 1} if v['estado'] in ESTADOS_REPUESTO_PENDIENTE else {}
+
+APORTES = {
+    Vehiculo: (('estado',), _aporte_vehiculo),
+    Cita: (('fecha_hora',), _aporte_cita),
+    Factura: (('estado',), _aporte_factura),
+    Cliente: (('activo',), _aporte_cliente),
+    SolicitudRepuesto: (('estado',), _aporte_solicitud)
+}
+
+
+def valores_atributos(target, atributos, anteriores=False):
+    """Valores actuales de los atributos, o los que tenían en base de datos si anteriores
+
+    Pensado para listeners after_update/after_delete: el historial del atributo
+    todavía conserva el valor previo al flush.
+    """
+    estado = db.inspect(target)
+    valores = {}
+    for nombre in atributos:
+        historia = estado.attrs[nombre].history
+        if anteriores and historia.deleted:
+            valores[nombre] = historia.deleted[0]
+        else:
+            valores[nombre] = getattr(target, nombre)
+    return valores
+
+def historial_activo(modelo, atributos):
+    """Hace que asignar estos atributos cargue antes su valor previo si estaba expirado
+
+    Sin esto, modificar un objeto recién expirado (p. ej. tras un commit) deja
+    vacío history.deleted y los listeners no podrían restar la aportación
+    anterior de la fila.
+    """
+    for nombre in atributos:
+        db.event.listen(getattr(modelo, nombre), 'set', _sin_efecto, active_history=True)
+
+def _sin_efecto(target, value, oldvalue, initiator):
+    return value
+
+def _aplicar(connection, deltas):
+    tabla = Contador.__table__
+    for clave, delta in deltas.items():
+        if delta:
+            upsert_incremento(connection, tabla, {'clave': clave}, {'valor': delta})
+
+def ajustar_contadores(connection, modelo, filas, signo=1):
+    """Suma (o resta con signo=-1) a los contadores la aportación de filas escritas sin el ORM
+
+    Para inserciones y borrados masivos con Core, que no disparan los
+    listeners: filas son dicts con los atributos que usa APORTES[modelo].
+    """
+    atributos, aporte = APORTES[modelo]
+    deltas = defaultdict(float)
+    for fila in filas:
+        for clave, valor in aporte(fila).items():
+            deltas[clave] += signo * valor
+    _aplicar(connection, deltas)
+
+def _registrar_listeners(modelo, atributos, aporte):
+    historial_activo(modelo, atributos)
+    
+    @db.event.listens_for(modelo, 'after_insert')
+    def after_insert(mapper, connection, target):
+        _aplicar(connection, aporte(valores_atributos(target, atributos)))
+
+    @db.event.listens_for(modelo, 'after_update')
+    def after_update(mapper, connection, target):
+        deltas = defaultdict(float)
+        for clave, valor in aporte(valores_atributos(target, atributos, anteriores=True)).items():
+            deltas[clave] -= valor
+        for clave, valor in aporte(valores_atributos(target, atributos)).items():
+            deltas[clave] += valor
+        _aplicar(connection, deltas)
+
+    @db.event.listens_for(modelo, 'after_delete')
+    def after_delete(mapper, connection, target):
+        _aplicar(connection, {
+            clave: -valor for clave, valor in aporte(valores_atributos(target, atributos, anteriores=True)).items()
+        })
+
+for _modelo, (_atributos, _aporte) in APORTES.items():
+    _registrar_listeners(_modelo, _atributos, _aporte)
+
+
+def leer_contadores(claves):
+    """Devuelve {clave: valor} para las claves pedidas con una sola lectura por clave primaria"""
+    valores = dict.fromkeys(claves, 0)
+    filas = db.session.query(Contador.clave, Contador.valor).filter(Contador.clave.in_(claves)).all()
+    valores.update(dict(filas))
+    return valores
+
+
+def reconciliar_contadores():
+    """Recalcula todos los contadores a partir de las tablas de origen y los reemplaza
+
+    El borrado inicial abre la transacción de escritura antes de leer, para
+    que en SQLite ninguna escritura concurrente quede entre el cálculo y el
+    reemplazo. La versión de la tabla contadores se incrementa para que los
+    ETag y la caché de respuestas dejen de servir los valores anteriores.
+    """
+    db.session.query(Contador).delete()
+    
+    valores = {
+        'vehiculos_en_taller': Vehiculo.query.filter_by(estado='en_taller').count(),
+        'facturas_pendientes': Factura.query.filter_by(estado='enviada').count(),
+        'clientes_activos': Cliente.query.filter_by(activo=True).count(),
+        'repuestos_pendientes': SolicitudRepuesto.query.filter(
+            SolicitudRepuesto.estado.in_(ESTADOS_REPUESTO_PENDIENTE)
+        ).count()
+    }
+    
+    citas_por_dia = db.session.query(
+        func.date(Cita.fecha_hora), func.count(Cita.id)
+    ).filter(Cita.fecha_hora.isnot(None)).group_by(func.date(Cita.fecha_hora))
+    for dia, total in citas_por_dia:
+        if isinstance(dia, str):
+            dia = datetime.strptime(dia, '%Y-%m-%d').date()
+        valores[clave_citas_dia(dia)] = total
+    
+    db.session.bulk_insert_mappings(Contador, [
+        {'clave': clave, 'valor': valor} for clave, valor in valores.items()
+    ])
+    incrementar_versiones(db.session.connection(), [Contador.__tablename__])
+    db.session.commit()
+    
+    return valores
+
+
+def reconciliar_si_toca(intervalo):
+    """Reconcilia los contadores si ningún otro proceso lo ha hecho en los últimos intervalo segundos
+
+    El turno se reclama en la misma transacción que la reconstrucción, así
+    que con N workers la reconciliación se ejecuta una vez por intervalo y no
+    N. Devuelve si se ha reconciliado.
+    """
+    if not reclamar_turno(db.session.connection(), 'reconciliar_contadores', intervalo):
+        db.session.rollback()
+        return False
+    reconciliar_contadores()
+    return True
+
+
+def iniciar_reconciliacion_periodica(app, intervalo):
+    """Lanza un hilo en segundo plano que intenta reconciliar los contadores cada intervalo segundos"""
+    def bucle():
+        while True:
+            time.sleep(intervalo)
+            with app.app_context():
+                try:
+                    reconciliar_si_toca(intervalo)
+                except Exception:
+                    db.session.rollback()
+                    app.logger.exception('Error al reconciliar los contadores del dashboard')
+    
+    hilo = threading.Thread(target=bucle, name='reconciliar-contadores', daemon=True)
+    hilo.start()
+    return hilo
+
+
+def programar_reconciliacion_periodica(app, intervalo):
+    """Lanza el hilo de reconciliación en la primera petición que atiende cada proceso
+
+    Con gunicorn --preload create_app() se ejecuta en el proceso maestro y un
+    hilo lanzado ahí no existe en los workers creados con fork, así que cada
+    worker arranca el suyo al recibir su primera petición. Los hilos se
+    turnan con reclamar_turno(): en cada intervalo sólo uno reconstruye.
+    Está desactivado por defecto (CONTADORES_RECONCILIAR_SEGUNDOS=0); la
+    alternativa es programar `flask reconcile-counters` con cron.
+    """
+    hilos = {}
+    lock = threading.Lock()
+    
+    @app.before_request
+    def arrancar_reconciliacion():
+        pid = os.getpid()
+        if pid in hilos:
+            return
+        with lock:
+            if pid not in hilos:
+                hilos[pid] = iniciar_reconciliacion_periodica(app, intervalo)
@@ -1,11 +1,24 @@
 from src.models import db
+from src.models.vehiculo import Vehiculo, recalcular_ultimo_servicio
+from src.models.repuesto import SolicitudRepuesto
 from datetime import datetime
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 class Diagnostico(db.Model):
     __tablename__ = 'diagnosticos'
+    __table_args__ = (
+        db.Index('ix_diagnosticos_fecha_diagnostico_id', 'fecha_diagnostico', 'id'),
+        # Recuento de diagnósticos activos por técnico
+        db.Index('ix_diagnosticos_tecnico_id_estado', 'tecnico_id', 'estado'),
+        # max(fecha_diagnostico) por vehículo para Vehiculo.fecha_ultimo_servicio
+        db.Index('ix_diagnosticos_vehiculo_id_fecha_diagnostico', 'vehiculo_id', 'fecha_diagnostico'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
-    vehiculo_id = db.Column(db.Integer, db.ForeignKey('vehiculos.id'), nullable=False)
+    # active_history: al reasignar el vehículo hace falta el anterior para recalcular su último servicio
+    vehiculo_id = db.column_property(
+        db.Column(db.Integer, db.ForeignKey('vehiculos.id'), nullable=False), active_history=True
+    )
     tecnico_id = db.Column(db.Integer, db.ForeignKey('tecnicos.id'), nullable=False)
     descripcion_fallo = db.Column(db.Text, nullable=False)
     fecha_diagnostico = db.Column(db.DateTime, default=datetime.utcnow)
@@ -20,6 +33,20 @@ class Diagnostico(db.Model):
     cita = db.relationship('Cita', backref='diagnostico', uselist=False, cascade='all, delete-orphan')
     factura = db.relationship('Factura', backref='diagnostico', uselist=False, cascade='all, delete-orphan')
     
+    @classmethod
+    def opciones_carga(cls):
+        """Opciones de carga ansiosa con todo lo que recorre to_dict()
+
+        Vehículo, cliente y técnico se traen con JOIN en la misma consulta y
+        las solicitudes de repuestos con un único SELECT ... IN adicional, de
+        modo que serializar una página cuesta un número fijo de consultas.
+        """
+        return (
+            joinedload(cls.vehiculo).joinedload(Vehiculo.cliente),
+            joinedload(cls.tecnico),
+            selectinload(cls.solicitudes_repuestos).joinedload(SolicitudRepuesto.repuesto)
+        )
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -41,3 +68,42 @@ class Diagnostico(db.Model):
     def __repr__(self):
         return f'<Diagnostico {self.id} - {self.vehiculo.matricula if self.vehiculo else "N/A"}>'
 
+
+
+
+# Mantenimiento de Vehiculo.fecha_ultimo_servicio. La actualización se lanza
+# sobre la conexión del flush; los ids afectados se anotan en la sesión para
+# expirar después el atributo en los vehículos que ya estén cargados.
+def _ultimo_servicio_modificado(target, vehiculo_ids, connection):
+    recalcular_ultimo_servicio(connection, vehiculo_ids)
+    sesion = db.inspect(target).session
+    if sesion is not None:
+        sesion.info.setdefault('vehiculos_ultimo_servicio', set()).update(vehiculo_ids)
+
+@db.event.listens_for(Diagnostico, 'after_insert')
+def _diagnostico_insertado(mapper, connection, target):
+    _ultimo_servicio_modificado(target, {target.vehiculo_id}, connection)
+
+@db.event.listens_for(Diagnostico, 'after_update')
+def _diagnostico_actualizado(mapper, connection, target):
+    estado = db.inspect(target)
+    vehiculo = estado.attrs.vehiculo_id.history
+    fecha = estado.attrs.fecha_diagnostico.history
+    if not vehiculo.has_changes() and not fecha.has_changes():
+        return
+    _ultimo_servicio_modificado(target, {target.vehiculo_id, *vehiculo.deleted}, connection)
+
+@db.event.listens_for(Diagnostico, 'after_delete')
+def _diagnostico_borrado(mapper, connection, target):
+    vehiculo = db.inspect(target).attrs.vehiculo_id.history
+    _ultimo_servicio_modificado(target, {target.vehiculo_id, *vehiculo.deleted}, connection)
+
+@db.event.listens_for(Session, 'after_flush_postexec')
+def _expirar_ultimo_servicio(session, flush_context):
+    vehiculo_ids = session.info.pop('vehiculos_ultimo_servicio', None)
+    if not vehiculo_ids:
+        return
+    for vehiculo_id in vehiculo_ids:
+        vehiculo = session.identity_map.get(db.inspect(Vehiculo).identity_key_from_primary_key([vehiculo_id]))
+        if vehiculo is not None:
+            session.expire(vehiculo, ['fecha_ultimo_servicio'])
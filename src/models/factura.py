@@ -1,8 +1,25 @@
 from src.models import db
+from src.models.diagnostico import Diagnostico
+from src.models.secuencia import bloquear_secuencia, reservar_valores, siguiente_valor_bloque
+from src.models.vehiculo import Vehiculo
+from src.utils.schema import migracion
 from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy.ext.mutable import MutableList
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.attributes import flag_modified
+import json
+import re
+
+PREFIJO_FACTURA = 'FT'
 
 class Factura(db.Model):
     __tablename__ = 'facturas'
+    __table_args__ = (
+        db.Index('ix_facturas_fecha_emision', 'fecha_emision'),
+        # Anti-join de diagnósticos completados todavía sin factura
+        db.Index('ix_facturas_diagnostico_id', 'diagnostico_id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     numero_factura = db.Column(db.String(20), unique=True, nullable=False)
@@ -18,31 +35,26 @@ class Factura(db.Model):
     iva = db.Column(db.Float, default=0.0)
     total = db.Column(db.Float, default=0.0)
     
-    # Detalles JSON
-    detalle_repuestos = db.Column(db.Text)  # JSON con detalles de repuestos
-    detalle_mano_obra = db.Column(db.Text)  # JSON con detalles de mano de obra
+    # Detalles JSON: se decodifican una vez al cargar la fila y MutableList marca
+    # la columna como modificada al añadir, quitar o reemplazar elementos
+    detalle_repuestos = db.Column(MutableList.as_mutable(db.JSON(none_as_null=True)))  # lista de repuestos
+    detalle_mano_obra = db.Column(MutableList.as_mutable(db.JSON(none_as_null=True)))  # lista de trabajos
     
     # Archivo PDF
     ruta_pdf = db.Column(db.String(500))
     
+    @classmethod
+    def opciones_carga(cls):
+        """Carga diagnóstico, vehículo y cliente con JOIN para to_dict()
+
+        Sólo son relaciones muchos-a-uno, por lo que también es compatible con
+        yield_per() en las exportaciones por lotes.
+        """
+        return (
+            joinedload(cls.diagnostico).joinedload(Diagnostico.vehiculo).joinedload(Vehiculo.cliente),
+        )
+    
     def to_dict(self):
-        import json
-        
-        detalle_repuestos_list = []
-        detalle_mano_obra_list = []
-        
-        if self.detalle_repuestos:
-            try:
-                detalle_repuestos_list = json.loads(self.detalle_repuestos)
-            except:
-                pass
-        
-        if self.detalle_mano_obra:
-            try:
-                detalle_mano_obra_list = json.loads(self.detalle_mano_obra)
-            except:
-                pass
-        
         return {
             'id': self.id,
             'numero_factura': self.numero_factura,
@@ -58,8 +70,8 @@ class Factura(db.Model):
             'subtotal_mano_obra': self.subtotal_mano_obra,
             'iva': self.iva,
             'total': self.total,
-            'detalle_repuestos': detalle_repuestos_list,
-            'detalle_mano_obra': detalle_mano_obra_list,
+            'detalle_repuestos': list(self.detalle_repuestos or []),
+            'detalle_mano_obra': list(self.detalle_mano_obra or []),
             'ruta_pdf': self.ruta_pdf
         }
     
@@ -77,53 +89,39 @@ class Factura(db.Model):
         return None
     
     def set_detalle_repuestos(self, detalle_list):
-        import json
-        self.detalle_repuestos = json.dumps(detalle_list)
+        self.detalle_repuestos = list(detalle_list)
     
     def set_detalle_mano_obra(self, detalle_list):
-        import json
-        self.detalle_mano_obra = json.dumps(detalle_list)
+        self.detalle_mano_obra = list(detalle_list)
     
     def calcular_totales(self, margen_nuevos=20, margen_usados=30, iva_porcentaje=21):
         """Calcula automáticamente los totales de la factura"""
-        import json
-        
         # Calcular subtotal repuestos con margen
         subtotal_repuestos_base = 0
         margen_total = 0
         
         if self.detalle_repuestos:
-            try:
-                repuestos = json.loads(self.detalle_repuestos)
-                for repuesto in repuestos:
-                    precio_base = repuesto.get('precio', 0)
-                    tipo = repuesto.get('tipo', 'nuevo')
-                    margen_porcentaje = margen_usados if tipo == 'usado' else margen_nuevos
-                    margen_item = precio_base * (margen_porcentaje / 100)
-                    
-                    subtotal_repuestos_base += precio_base
-                    margen_total += margen_item
-                    
-                    # Actualizar precio final en el detalle
-                    repuesto['precio_final'] = precio_base + margen_item
-                    repuesto['margen'] = margen_porcentaje
+            for repuesto in self.detalle_repuestos:
+                precio_base = repuesto.get('precio', 0)
+                tipo = repuesto.get('tipo', 'nuevo')
+                margen_porcentaje = margen_usados if tipo == 'usado' else margen_nuevos
+                margen_item = precio_base * (margen_porcentaje / 100)
+                
+                subtotal_repuestos_base += precio_base
+                margen_total += margen_item
                 
-                self.detalle_repuestos = json.dumps(repuestos)
-            except:
-                pass
+                # Actualizar precio final en el detalle
+                repuesto['precio_final'] = precio_base + margen_item
+                repuesto['margen'] = margen_porcentaje
+            
+            # MutableList no detecta cambios dentro de sus elementos
+            flag_modified(self, 'detalle_repuestos')
         
         self.subtotal_repuestos = subtotal_repuestos_base
         self.margen_repuestos = margen_total
         
         # Calcular subtotal mano de obra
-        subtotal_mano_obra = 0
-        if self.detalle_mano_obra:
-            try:
-                trabajos = json.loads(self.detalle_mano_obra)
-                for trabajo in trabajos:
-                    subtotal_mano_obra += trabajo.get('total', 0)
-            except:
-                pass
+        subtotal_mano_obra = sum(trabajo.get('total', 0) for trabajo in self.detalle_mano_obra or [])
         
         self.subtotal_mano_obra = subtotal_mano_obra
         
@@ -137,21 +135,123 @@ class Factura(db.Model):
             self.fecha_vencimiento = self.fecha_emision + timedelta(days=30)
     
     def generar_numero_factura(self):
-        """Genera un número de factura único"""
+        """Asigna el siguiente número de la serie si la factura todavía no tiene uno"""
         if not self.numero_factura:
-            # Buscar el último número de factura
-            ultima_factura = Factura.query.order_by(Factura.id.desc()).first()
-            if ultima_factura and ultima_factura.numero_factura:
-                try:
-                    ultimo_numero = int(ultima_factura.numero_factura.replace('FT', ''))
-                    nuevo_numero = ultimo_numero + 1
-                except:
-                    nuevo_numero = 1
-            else:
-                nuevo_numero = 1
-            
-            self.numero_factura = f"FT{nuevo_numero:03d}"
+            self.numero_factura = reservar_numeros_factura(1, self.fecha_emision)[0]
     
     def __repr__(self):
         return f'<Factura {self.numero_factura}>'
 
+
+
+def _serie_factura(fecha):
+    """Nombre de la secuencia, prefijo y ancho del número para la fecha de emisión
+
+    Con FACTURA_SERIE_ANUAL la numeración se reinicia cada año (FT2026-000123);
+    si no, es una única serie FT001, FT002...
+    """
+    if current_app.config.get('FACTURA_SERIE_ANUAL'):
+        año = (fecha or datetime.utcnow()).year
+        return f'facturas:{año}', f'{PREFIJO_FACTURA}{año}-', 6
+    return 'facturas', PREFIJO_FACTURA, 3
+
+def _ultimo_numero_existente(prefijo):
+    """Valor inicial de la secuencia: el mayor número ya emitido con ese prefijo"""
+    patron = re.compile(rf'^{re.escape(prefijo)}(\d+)$')
+    
+    def valor_inicial(connection):
+        numeros = connection.execute(
+            db.select(Factura.numero_factura).where(Factura.numero_factura.like(f'{prefijo}%'))
+        ).scalars()
+        return max((int(m.group(1)) for m in map(patron.match, numeros) if m), default=0)
+    
+    return valor_inicial
+
+def reservar_numeros_factura(cantidad=1, fecha=None):
+    """Devuelve `cantidad` números de factura consecutivos de la serie de `fecha`
+
+    Por defecto la reserva se hace en la transacción de la sesión actual, así
+    que la numeración no tiene huecos: si la factura no llega a guardarse el
+    número se libera. Con FACTURA_BLOQUE_NUMEROS > 1 cada worker reserva un
+    bloque de números por adelantado y las facturas individuales no tocan la
+    tabla secuencias hasta agotarlo (ver siguiente_valor_bloque).
+    """
+    nombre, prefijo, ancho = _serie_factura(fecha)
+    valor_inicial = _ultimo_numero_existente(prefijo)
+    bloque = current_app.config.get('FACTURA_BLOQUE_NUMEROS', 1)
+    
+    if cantidad == 1 and bloque > 1:
+        numeros = [siguiente_valor_bloque(nombre, bloque, valor_inicial)]
+    else:
+        primero = reservar_valores(db.session.connection(), nombre, cantidad, valor_inicial)
+        numeros = range(primero, primero + cantidad)
+    
+    return [f'{prefijo}{numero:0{ancho}d}' for numero in numeros]
+
+def bloquear_numeracion_factura(fecha=None):
+    """Bloquea la serie de `fecha` hasta el commit o rollback de la sesión actual, sin reservar números"""
+    nombre, prefijo, _ = _serie_factura(fecha)
+    bloquear_secuencia(db.session.connection(), nombre, _ultimo_numero_existente(prefijo))
+
+
+
+# Texto original de los detalles que la migración a JSON no pudo convertir, para revisarlos a mano
+detalles_cuarentena = db.Table(
+    'facturas_detalles_cuarentena',
+    db.Column('id', db.Integer, primary_key=True),
+    db.Column('factura_id', db.Integer, nullable=False, index=True),
+    db.Column('numero_factura', db.String(20), nullable=False),
+    db.Column('columna', db.String(50), nullable=False),
+    db.Column('contenido', db.Text, nullable=False),
+    db.Column('fecha', db.DateTime, nullable=False)
+)
+
+def _detalle_valido(valor):
+    return isinstance(valor, list) and all(isinstance(item, dict) for item in valor)
+
+@migracion('0001_facturas_detalles_json')
+def _migrar_detalles_json(connection):
+    """Valida los detalles guardados como texto antes de leerlos como columnas JSON
+
+    El contenido que no es una lista JSON de objetos se copia íntegro a
+    facturas_detalles_cuarentena y sólo entonces se deja a NULL en la
+    factura, en la misma transacción, así que ninguna línea se pierde y la
+    factura se puede cargar. El log indica qué facturas hay que revisar. En
+    PostgreSQL se convierte además el tipo de las columnas.
+    """
+    filas = connection.execute(db.text(
+        'SELECT id, numero_factura, detalle_repuestos, detalle_mano_obra FROM facturas '
+        'WHERE detalle_repuestos IS NOT NULL OR detalle_mano_obra IS NOT NULL'
+    )).all()
+    
+    en_cuarentena = []
+    for id, numero_factura, *detalles in filas:
+        for columna, texto in zip(('detalle_repuestos', 'detalle_mano_obra'), detalles):
+            if texto is None or not isinstance(texto, str):
+                continue
+            try:
+                valido = _detalle_valido(json.loads(texto))
+            except ValueError:
+                valido = False
+            if not valido:
+                connection.execute(detalles_cuarentena.insert().values(
+                    factura_id=id, numero_factura=numero_factura, columna=columna,
+                    contenido=texto, fecha=datetime.utcnow()
+                ))
+                connection.execute(
+                    db.text(f'UPDATE facturas SET {columna} = NULL WHERE id = :id'), {'id': id}
+                )
+                en_cuarentena.append(numero_factura)
+    
+    if en_cuarentena:
+        current_app.logger.warning(
+            '%d detalles de factura no eran listas JSON válidas y se han movido a '
+            'facturas_detalles_cuarentena; facturas afectadas: %s',
+            len(en_cuarentena), ', '.join(dict.fromkeys(en_cuarentena))
+        )
+    
+    if connection.dialect.name == 'postgresql':
+        for columna in ('detalle_repuestos', 'detalle_mano_obra'):
+            connection.exec_driver_sql(
+                f'ALTER TABLE facturas ALTER COLUMN {columna} TYPE JSON USING {columna}::json'
+            )
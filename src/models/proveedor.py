@@ -1,5 +1,7 @@
 from src.models import db
+from src.models.repuesto import SolicitudRepuesto, CotizacionRepuesto
 from datetime import datetime
+from sqlalchemy import func
 
 class Proveedor(db.Model):
     __tablename__ = 'proveedores'
@@ -18,6 +20,18 @@ class Proveedor(db.Model):
     solicitudes_seleccionadas = db.relationship('SolicitudRepuesto', backref='proveedor_seleccionado', lazy=True)
     repuestos_preferidos = db.relationship('Repuesto', backref='proveedor_preferido', lazy=True)
     
+    # Contadores como subconsultas correlacionadas, sin cargar las colecciones
+    cotizaciones_count = db.column_property(
+        db.select(func.count(CotizacionRepuesto.id)).where(
+            CotizacionRepuesto.proveedor_id == id
+        ).correlate_except(CotizacionRepuesto).scalar_subquery()
+    )
+    pedidos_count = db.column_property(
+        db.select(func.count(SolicitudRepuesto.id)).where(
+            SolicitudRepuesto.proveedor_seleccionado_id == id
+        ).correlate_except(SolicitudRepuesto).scalar_subquery()
+    )
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -28,8 +42,8 @@ class Proveedor(db.Model):
             'activo': self.activo,
             'tiempo_respuesta_promedio': self.tiempo_respuesta_promedio,
             'fecha_registro': self.fecha_registro.isoformat() if self.fecha_registro else None,
-            'cotizaciones_enviadas': len(self.cotizaciones) if self.cotizaciones else 0,
-            'pedidos_realizados': len(self.solicitudes_seleccionadas) if self.solicitudes_seleccionadas else 0
+            'cotizaciones_enviadas': self.cotizaciones_count or 0,
+            'pedidos_realizados': self.pedidos_count or 0
         }
     
     def __repr__(self):
@@ -1,5 +1,6 @@
 from src.models import db
 from datetime import datetime
+from sqlalchemy.orm import joinedload, selectinload
 
 class Repuesto(db.Model):
     __tablename__ = 'repuestos'
@@ -32,18 +33,31 @@ class SolicitudRepuesto(db.Model):
     __tablename__ = 'solicitudes_repuestos'
     
     id = db.Column(db.Integer, primary_key=True)
-    diagnostico_id = db.Column(db.Integer, db.ForeignKey('diagnosticos.id'), nullable=False)
+    diagnostico_id = db.Column(db.Integer, db.ForeignKey('diagnosticos.id'), nullable=False, index=True)
     repuesto_id = db.Column(db.Integer, db.ForeignKey('repuestos.id'), nullable=False)
     cantidad = db.Column(db.Integer, nullable=False, default=1)
     estado = db.Column(db.String(20), default='solicitado')  # solicitado, cotizado, pedido, recibido, cancelado
     fecha_solicitud = db.Column(db.DateTime, default=datetime.utcnow)
     precio_mejor_oferta = db.Column(db.Float)
-    proveedor_seleccionado_id = db.Column(db.Integer, db.ForeignKey('proveedores.id'))
+    proveedor_seleccionado_id = db.Column(db.Integer, db.ForeignKey('proveedores.id'), index=True)
     tiempo_entrega = db.Column(db.String(50))
     
     # Relaciones
     cotizaciones = db.relationship('CotizacionRepuesto', backref='solicitud', lazy=True, cascade='all, delete-orphan')
     
+    @classmethod
+    def opciones_carga(cls):
+        """Repuesto, proveedores y cotizaciones con un SELECT ... IN por relación
+
+        Los proveedores no se cargan con JOIN: sus contadores (column_property)
+        se evaluarían una vez por fila en lugar de una por proveedor distinto.
+        """
+        return (
+            joinedload(cls.repuesto),
+            selectinload(cls.proveedor_seleccionado),
+            selectinload(cls.cotizaciones).selectinload(CotizacionRepuesto.proveedor)
+        )
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -68,8 +82,8 @@ class CotizacionRepuesto(db.Model):
     __tablename__ = 'cotizaciones_repuestos'
     
     id = db.Column(db.Integer, primary_key=True)
-    solicitud_id = db.Column(db.Integer, db.ForeignKey('solicitudes_repuestos.id'), nullable=False)
-    proveedor_id = db.Column(db.Integer, db.ForeignKey('proveedores.id'), nullable=False)
+    solicitud_id = db.Column(db.Integer, db.ForeignKey('solicitudes_repuestos.id'), nullable=False, index=True)
+    proveedor_id = db.Column(db.Integer, db.ForeignKey('proveedores.id'), nullable=False, index=True)
     precio = db.Column(db.Float, nullable=False)
     tiempo_entrega = db.Column(db.String(50))
     fecha_cotizacion = db.Column(db.DateTime, default=datetime.utcnow)
@@ -0,0 +1,122 @@
+from src.models import db
+from src.models.factura import Factura
+from src.models.contador import historial_activo, valores_atributos
+from src.models.version_tabla import incrementar_versiones
+from src.utils.sql import upsert_incremento
+from collections import defaultdict
+from sqlalchemy import extract, func
+
+class RevenueRollup(db.Model):
+    """Total facturado por (año, mes, estado), mantenido de forma incremental
+
+    Los listeners de Factura de este módulo restan la aportación anterior de la
+    factura y suman la nueva cada vez que cambian estado, total o fecha_emision,
+    así que las consultas de ingresos del dashboard leen unas pocas filas en
+    lugar de agregar toda la tabla facturas.
+    """
+    __tablename__ = 'revenue_rollup'
+    
+    año = db.Column(db.Integer, primary_key=True)
+    mes = db.Column(db.Integer, primary_key=True)
+    estado = db.Column(db.String(20), primary_key=True)
+    total = db.Column(db.Float, nullable=False, default=0.0)
+    num_facturas = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<RevenueRollup {self.año}-{self.mes:02d} {self.estado}: {self.total}>'
+
+
+ATRIBUTOS_FACTURA = ('estado', 'total', 'fecha_emision')
+historial_activo(Factura, ATRIBUTOS_FACTURA)
+
+def _aporte(valores):
+    """Clave del rollup y (total, num_facturas) con que contribuye una factura"""
+    if not valores['fecha_emision']:
+        return None
+    clave = (valores['fecha_emision'].year, valores['fecha_emision'].month, valores['estado'] or '')
+    return clave, (valores['total'] or 0, 1)
+
+def ajustar_rollup(connection, deltas):
+    """Aplica {(año, mes, estado): (delta_total, delta_num_facturas)} a la tabla"""
+    for (año, mes, estado), (total, num_facturas) in deltas.items():
+        if not total and not num_facturas:
+            continue
+        upsert_incremento(
+            connection, RevenueRollup.__table__,
+            {'año': año, 'mes': mes, 'estado': estado},
+            {'total': total, 'num_facturas': num_facturas}
+        )
+
+def _delta(deltas, aporte, signo):
+    if aporte:
+        clave, (total, num_facturas) = aporte
+        total_previo, num_previo = deltas[clave]
+        deltas[clave] = (total_previo + signo * total, num_previo + signo * num_facturas)
+
+def deltas_rollup(filas, signo=1):
+    """Deltas del rollup para facturas insertadas (o borradas con signo=-1) fuera del ORM
+
+    filas son dicts con estado, total y fecha_emision.
+    """
+    deltas = defaultdict(lambda: (0, 0))
+    for fila in filas:
+        _delta(deltas, _aporte(fila), signo)
+    return deltas
+
+@db.event.listens_for(Factura, 'after_insert')
+def _factura_insertada(mapper, connection, target):
+    deltas = defaultdict(lambda: (0, 0))
+    _delta(deltas, _aporte(valores_atributos(target, ATRIBUTOS_FACTURA)), 1)
+    ajustar_rollup(connection, deltas)
+
+@db.event.listens_for(Factura, 'after_update')
+def _factura_actualizada(mapper, connection, target):
+    deltas = defaultdict(lambda: (0, 0))
+    _delta(deltas, _aporte(valores_atributos(target, ATRIBUTOS_FACTURA, anteriores=True)), -1)
+    _delta(deltas, _aporte(valores_atributos(target, ATRIBUTOS_FACTURA)), 1)
+    ajustar_rollup(connection, deltas)
+
+@db.event.listens_for(Factura, 'after_delete')
+def _factura_borrada(mapper, connection, target):
+    deltas = defaultdict(lambda: (0, 0))
+    _delta(deltas, _aporte(valores_atributos(target, ATRIBUTOS_FACTURA, anteriores=True)), -1)
+    ajustar_rollup(connection, deltas)
+
+
+def ingresos_mensuales(desde, hasta, estado='pagada'):
+    """Devuelve {(año, mes): total} para los meses de [desde, hasta] con el estado indicado
+
+    desde y hasta son tuplas (año, mes), ambas incluidas.
+    """
+    filas = db.session.query(RevenueRollup.año, RevenueRollup.mes, RevenueRollup.total).filter(
+        RevenueRollup.estado == estado,
+        RevenueRollup.año.between(desde[0], hasta[0])
+    )
+    return {(año, mes): total for año, mes, total in filas if desde <= (año, mes) <= hasta}
+
+
+def reconstruir_revenue_rollup():
+    """Vacía la tabla y la recalcula agregando todas las facturas
+
+    Incrementa la versión de revenue_rollup, de la que dependen los ETag de
+    las rutas de ingresos del dashboard.
+    """
+    db.session.query(RevenueRollup).delete()
+    
+    año = extract('year', Factura.fecha_emision)
+    mes = extract('month', Factura.fecha_emision)
+    estado = func.coalesce(Factura.estado, '')
+    filas = db.session.query(
+        año, mes, estado, func.sum(Factura.total), func.count(Factura.id)
+    ).filter(
+        Factura.fecha_emision.isnot(None)
+    ).group_by(año, mes, estado).all()
+    
+    db.session.bulk_insert_mappings(RevenueRollup, [
+        {'año': int(a), 'mes': int(m), 'estado': e, 'total': t or 0, 'num_facturas': n}
+        for a, m, e, t, n in filas
+    ])
+    incrementar_versiones(db.session.connection(), [RevenueRollup.__tablename__])
+    db.session.commit()
+    
+    return len(filas)
@@ -0,0 +1,130 @@
+from src.models import db
+from sqlalchemy import insert, select, update
+import os
+import threading
+import time
+
+class Secuencia(db.Model):
+    """Último valor asignado de cada serie de numeración (p. ej. 'facturas' o 'facturas:2026')
+
+    El valor se incrementa con un único UPDATE atómico, de modo que dos
+    workers nunca obtienen el mismo número aunque reserven a la vez y no hace
+    falta leer la última fila de la tabla numerada. Las filas 'turno:...'
+    guardan en cambio el instante de la última ejecución de una tarea
+    periódica (ver reclamar_turno).
+    """
+    __tablename__ = 'secuencias'
+    
+    nombre = db.Column(db.String(50), primary_key=True)
+    valor = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<Secuencia {self.nombre}={self.valor}>'
+
+
+def _crear_si_no_existe(connection, nombre, valor):
+    """Inserta la fila de la secuencia; devuelve False si otro proceso se ha adelantado"""
+    tabla = Secuencia.__table__
+    dialecto = connection.dialect.name
+    
+    if dialecto in ('sqlite', 'postgresql'):
+        if dialecto == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        stmt = dialect_insert(tabla).values(nombre=nombre, valor=valor).on_conflict_do_nothing()
+        return connection.execute(stmt).rowcount > 0
+    
+    connection.execute(insert(tabla).values(nombre=nombre, valor=valor))
+    return True
+
+def reservar_valores(connection, nombre, cantidad=1, valor_inicial=0):
+    """Reserva `cantidad` valores consecutivos de la secuencia y devuelve el primero
+
+    La reserva forma parte de la transacción de `connection`: si se deshace,
+    los valores vuelven a quedar libres. valor_inicial (un entero o una función
+    que recibe la conexión) sólo se usa la primera vez, cuando la fila todavía
+    no existe, para continuar la numeración que ya hubiera en la base de datos.
+    """
+    tabla = Secuencia.__table__
+    stmt = update(tabla).where(tabla.c.nombre == nombre).values(valor=tabla.c.valor + cantidad)
+    
+    if connection.dialect.update_returning:
+        ultimo = connection.execute(stmt.returning(tabla.c.valor)).scalar()
+    elif connection.execute(stmt).rowcount:
+        ultimo = connection.execute(select(tabla.c.valor).where(tabla.c.nombre == nombre)).scalar()
+    else:
+        ultimo = None
+    
+    if ultimo is None:
+        base = valor_inicial(connection) if callable(valor_inicial) else valor_inicial
+        if not _crear_si_no_existe(connection, nombre, base + cantidad):
+            return reservar_valores(connection, nombre, cantidad, valor_inicial)
+        ultimo = base + cantidad
+    
+    return ultimo - cantidad + 1
+
+def bloquear_secuencia(connection, nombre, valor_inicial=0):
+    """Bloquea la fila de la secuencia hasta que termine la transacción de `connection`
+
+    No reserva ningún valor: es un UPDATE que deja la fila como estaba (o la
+    crea con valor_inicial si no existe). Sirve para serializar procesos que
+    tienen que ver lo que haya escrito el anterior antes de numerar.
+    """
+    tabla = Secuencia.__table__
+    stmt = update(tabla).where(tabla.c.nombre == nombre).values(valor=tabla.c.valor)
+    if connection.execute(stmt).rowcount:
+        return
+    
+    base = valor_inicial(connection) if callable(valor_inicial) else valor_inicial
+    if not _crear_si_no_existe(connection, nombre, base):
+        bloquear_secuencia(connection, nombre, valor_inicial)
+
+def reclamar_turno(connection, tarea, intervalo):
+    """Devuelve True si este proceso debe ejecutar ahora la tarea periódica `tarea`
+
+    La fila 'turno:<tarea>' guarda el segundo (epoch) de la última ejecución y
+    el UPDATE sólo la modifica si ya ha pasado `intervalo`: de todos los
+    workers que lo intentan en un mismo intervalo sólo uno obtiene True. El
+    turno queda reclamado al confirmar la transacción de `connection`, así
+    que si la tarea falla y se deshace otro proceso puede reintentarla.
+    """
+    tabla = Secuencia.__table__
+    nombre = f'turno:{tarea}'
+    ahora = int(time.time())
+    stmt = update(tabla).where(tabla.c.nombre == nombre, tabla.c.valor <= ahora - intervalo).values(valor=ahora)
+    if connection.execute(stmt).rowcount:
+        return True
+    return _crear_si_no_existe(connection, nombre, ahora)
+
+
+# Bloques reservados por este proceso: {nombre: [pid, siguiente, ultimo]}
+_bloques = {}
+_bloques_lock = threading.Lock()
+
+def siguiente_valor_bloque(nombre, bloque, valor_inicial=0):
+    """Devuelve el siguiente valor de un bloque reservado por adelantado para este proceso
+
+    Cada `bloque` valores se reserva un bloque nuevo en una transacción propia
+    y ya confirmada, así que el resto de peticiones del worker no tocan la
+    tabla secuencias. A cambio la numeración puede tener huecos (los valores
+    que un worker no llega a usar) y no es estrictamente creciente en el tiempo
+    entre workers. El pid forma parte de la entrada para que un proceso hijo
+    creado con fork no reutilice el bloque de su padre.
+
+    La reserva abre otra conexión. Con SQLite esperaría al bloqueo de
+    escritura que tenga la sesión actual, así que configurar_motor() no
+    permite bloques en ese dialecto.
+    """
+    with _bloques_lock:
+        pid = os.getpid()
+        entrada = _bloques.get(nombre)
+        
+        if entrada is None or entrada[0] != pid or entrada[1] > entrada[2]:
+            with db.engine.begin() as connection:
+                primero = reservar_valores(connection, nombre, bloque, valor_inicial)
+            entrada = _bloques[nombre] = [pid, primero, primero + bloque - 1]
+        
+        valor = entrada[1]
+        entrada[1] += 1
+        return valor
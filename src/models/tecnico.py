@@ -1,5 +1,10 @@
 from src.models import db
+from src.utils.schema import relleno_tabla
 from datetime import datetime
+from sqlalchemy import func
+
+# Estados de diagnóstico que cuentan como carga de trabajo de un técnico
+ESTADOS_DIAGNOSTICO_ACTIVO = ('pendiente', 'en_proceso')
 
 class Tecnico(db.Model):
     __tablename__ = 'tecnicos'
@@ -8,7 +13,6 @@ class Tecnico(db.Model):
     nombre = db.Column(db.String(100), nullable=False)
     telefono = db.Column(db.String(20), nullable=False)
     email = db.Column(db.String(120), nullable=False)
-    especialidades = db.Column(db.Text)  # JSON string con lista de especialidades
     tarifa_hora = db.Column(db.Float, nullable=False)
     activo = db.Column(db.Boolean, default=True)
     fecha_registro = db.Column(db.DateTime, default=datetime.utcnow)
@@ -16,41 +20,91 @@ class Tecnico(db.Model):
     # Relaciones
     diagnosticos = db.relationship('Diagnostico', backref='tecnico', lazy=True)
     citas = db.relationship('Cita', backref='tecnico', lazy=True)
+    especialidades_asignadas = db.relationship(
+        'TecnicoEspecialidad', lazy=True, cascade='all, delete-orphan',
+        order_by='TecnicoEspecialidad.especialidad'
+    )
     
-    def to_dict(self):
-        import json
-        especialidades_list = []
-        if self.especialidades:
-            try:
-                especialidades_list = json.loads(self.especialidades)
-            except:
-                especialidades_list = []
+    def to_dict(self, diagnosticos_activos=None):
+        """Serializa el técnico
+
+        diagnosticos_activos permite pasar el recuento ya calculado para toda
+        una lista con contar_diagnosticos_activos(); si se omite se consulta.
+        """
+        if diagnosticos_activos is None:
+            diagnosticos_activos = Tecnico.contar_diagnosticos_activos([self.id]).get(self.id, 0)
         
         return {
             'id': self.id,
             'nombre': self.nombre,
             'telefono': self.telefono,
             'email': self.email,
-            'especialidades': especialidades_list,
+            'especialidades': self.get_especialidades(),
             'tarifa_hora': self.tarifa_hora,
             'activo': self.activo,
             'fecha_registro': self.fecha_registro.isoformat() if self.fecha_registro else None,
-            'diagnosticos_activos': len([d for d in self.diagnosticos if d.estado in ['pendiente', 'en_proceso']]) if self.diagnosticos else 0
+            'diagnosticos_activos': diagnosticos_activos
         }
     
+    @staticmethod
+    def contar_diagnosticos_activos(tecnico_ids):
+        """Devuelve {tecnico_id: diagnósticos pendientes o en proceso} con una sola consulta agrupada"""
+        from src.models.diagnostico import Diagnostico
+        
+        if not tecnico_ids:
+            return {}
+        
+        filas = db.session.query(Diagnostico.tecnico_id, func.count(Diagnostico.id)).filter(
+            Diagnostico.tecnico_id.in_(tecnico_ids),
+            Diagnostico.estado.in_(ESTADOS_DIAGNOSTICO_ACTIVO)
+        ).group_by(Diagnostico.tecnico_id)
+        return dict(filas.all())
+    
     def set_especialidades(self, especialidades_list):
-        import json
-        self.especialidades = json.dumps(especialidades_list)
+        self.especialidades_asignadas = [
+            TecnicoEspecialidad(especialidad=especialidad)
+            for especialidad in dict.fromkeys(especialidades_list)
+        ]
     
     def get_especialidades(self):
-        import json
-        if self.especialidades:
-            try:
-                return json.loads(self.especialidades)
-            except:
-                return []
-        return []
+        return [e.especialidad for e in self.especialidades_asignadas]
     
     def __repr__(self):
         return f'<Tecnico {self.nombre}>'
 
+
+class TecnicoEspecialidad(db.Model):
+    __tablename__ = 'tecnico_especialidades'
+    __table_args__ = (
+        # Filtro ?especialidad= de GET /api/tecnicos
+        db.Index('ix_tecnico_especialidades_especialidad', 'especialidad', 'tecnico_id'),
+    )
+    
+    tecnico_id = db.Column(db.Integer, db.ForeignKey('tecnicos.id'), primary_key=True)
+    especialidad = db.Column(db.String(50), primary_key=True)
+    
+    def __repr__(self):
+        return f'<TecnicoEspecialidad {self.tecnico_id} - {self.especialidad}>'
+
+
+@relleno_tabla('tecnico_especialidades')
+def _migrar_especialidades(connection):
+    """Traslada las especialidades guardadas como JSON en tecnicos.especialidades"""
+    import json
+    
+    filas = connection.execute(
+        db.text('SELECT id, especialidades FROM tecnicos WHERE especialidades IS NOT NULL')
+    ).all()
+    
+    parametros = []
+    for tecnico_id, especialidades in filas:
+        try:
+            lista = json.loads(especialidades)
+        except ValueError:
+            continue
+        for especialidad in dict.fromkeys(lista if isinstance(lista, list) else []):
+            if isinstance(especialidad, str) and especialidad:
+                parametros.append({'tecnico_id': tecnico_id, 'especialidad': especialidad})
+    
+    if parametros:
+        connection.execute(TecnicoEspecialidad.__table__.insert(), parametros)
@@ -1,11 +1,30 @@
 from src.models import db
+from src.utils.schema import relleno_columna
 from datetime import datetime
+from sqlalchemy.orm import validates
+import re
+
+
+def normalizar_identificador(valor):
+    """Forma canónica de matrícula y bastidor: mayúsculas y sin espacios, guiones ni signos"""
+    return re.sub(r'[\W_]+', '', valor.upper()) if valor else valor
+
 
 class Vehiculo(db.Model):
     __tablename__ = 'vehiculos'
+    __table_args__ = (
+        # Orden de la paginación por cursor
+        db.Index('ix_vehiculos_fecha_registro_id', 'fecha_registro', 'id'),
+        # Búsqueda exacta y por prefijo en /api/vehiculos/lookup
+        db.Index('ix_vehiculos_matricula_norm', 'matricula_norm'),
+        db.Index('ix_vehiculos_bastidor_norm', 'bastidor_norm'),
+        db.Index('ix_vehiculos_bastidor_norm_inv', 'bastidor_norm_inv'),
+        # Orden y filtro por antigüedad del último servicio
+        db.Index('ix_vehiculos_fecha_ultimo_servicio', 'fecha_ultimo_servicio'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
-    cliente_id = db.Column(db.Integer, db.ForeignKey('clientes.id'), nullable=False)
+    cliente_id = db.Column(db.Integer, db.ForeignKey('clientes.id'), nullable=False, index=True)
     marca = db.Column(db.String(50), nullable=False)
     modelo = db.Column(db.String(50), nullable=False)
     año = db.Column(db.Integer, nullable=False)
@@ -15,9 +34,42 @@ class Vehiculo(db.Model):
     fecha_registro = db.Column(db.DateTime, default=datetime.utcnow)
     estado = db.Column(db.String(20), default='activo')  # activo, en_taller, inactivo
     
+    # Copias normalizadas para búsquedas indexadas; el bastidor invertido
+    # convierte la búsqueda por final del número en una búsqueda por prefijo
+    matricula_norm = db.Column(db.String(20))
+    bastidor_norm = db.Column(db.String(50))
+    bastidor_norm_inv = db.Column(db.String(50))
+    
+    # Fecha del diagnóstico más reciente, mantenida por los eventos de Diagnostico
+    fecha_ultimo_servicio = db.Column(db.DateTime)
+    
     # Relaciones
     diagnosticos = db.relationship('Diagnostico', backref='vehiculo', lazy=True, cascade='all, delete-orphan')
     
+    @validates('matricula')
+    def _normalizar_matricula(self, key, matricula):
+        self.matricula_norm = normalizar_identificador(matricula)
+        return matricula
+    
+    @validates('numero_bastidor')
+    def _normalizar_bastidor(self, key, numero_bastidor):
+        self.bastidor_norm = normalizar_identificador(numero_bastidor)
+        self.bastidor_norm_inv = self.bastidor_norm[::-1] if self.bastidor_norm else None
+        return numero_bastidor
+    
+    def to_lookup_dict(self):
+        """Representación reducida para el autocompletado de /api/vehiculos/lookup"""
+        return {
+            'id': self.id,
+            'cliente_id': self.cliente_id,
+            'cliente_nombre': self.cliente.nombre_completo if self.cliente else None,
+            'marca': self.marca,
+            'modelo': self.modelo,
+            'matricula': self.matricula,
+            'numero_bastidor': self.numero_bastidor,
+            'estado': self.estado
+        }
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -35,11 +87,63 @@ class Vehiculo(db.Model):
         }
     
     def get_ultimo_servicio(self):
-        if self.diagnosticos:
-            ultimo = max(self.diagnosticos, key=lambda d: d.fecha_diagnostico)
-            return ultimo.fecha_diagnostico.isoformat()
+        if self.fecha_ultimo_servicio:
+            return self.fecha_ultimo_servicio.isoformat()
         return None
     
     def __repr__(self):
         return f'<Vehiculo {self.marca} {self.modelo} - {self.matricula}>'
 
+
+
+
+@relleno_columna('vehiculos', 'matricula_norm')
+def _rellenar_matricula_norm(connection):
+    filas = connection.execute(db.text('SELECT id, matricula FROM vehiculos')).all()
+    if filas:
+        connection.execute(
+            db.text('UPDATE vehiculos SET matricula_norm = :norm WHERE id = :id'),
+            [{'id': id, 'norm': normalizar_identificador(matricula)} for id, matricula in filas]
+        )
+
+
+@relleno_columna('vehiculos', 'bastidor_norm_inv')
+def _rellenar_bastidor_norm(connection):
+    filas = connection.execute(db.text('SELECT id, numero_bastidor FROM vehiculos')).all()
+    parametros = []
+    for id, numero_bastidor in filas:
+        norm = normalizar_identificador(numero_bastidor)
+        parametros.append({'id': id, 'norm': norm, 'inv': norm[::-1] if norm else None})
+    if parametros:
+        connection.execute(
+            db.text('UPDATE vehiculos SET bastidor_norm = :norm, bastidor_norm_inv = :inv WHERE id = :id'),
+            parametros
+        )
+
+
+
+def recalcular_ultimo_servicio(connection, vehiculo_ids=None):
+    """Recalcula fecha_ultimo_servicio de los vehículos indicados, o de todos si vehiculo_ids es None
+
+    El máximo se resuelve con el índice (vehiculo_id, fecha_diagnostico) de
+    diagnosticos, así que cuesta lo mismo aunque el vehículo tenga cientos.
+    """
+    sql = (
+        'UPDATE vehiculos SET fecha_ultimo_servicio = ('
+        'SELECT max(fecha_diagnostico) FROM diagnosticos WHERE diagnosticos.vehiculo_id = vehiculos.id)'
+    )
+    if vehiculo_ids is None:
+        return connection.execute(db.text(sql)).rowcount
+    
+    vehiculo_ids = [id for id in vehiculo_ids if id is not None]
+    if not vehiculo_ids:
+        return 0
+    return connection.execute(
+        db.text(sql + ' WHERE vehiculos.id IN :ids').bindparams(db.bindparam('ids', expanding=True)),
+        {'ids': vehiculo_ids}
+    ).rowcount
+
+
+@relleno_columna('vehiculos', 'fecha_ultimo_servicio')
+def _rellenar_ultimo_servicio(connection):
+    recalcular_ultimo_servicio(connection)
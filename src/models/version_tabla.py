@@ -0,0 +1,95 @@
+from src.models import db
+from src.utils.sql import upsert_incremento
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# Tablas de infraestructura: sus cambios no alteran ninguna respuesta. contadores y revenue_rollup sí
+# se versionan, pero sólo al reconstruirlos: sus ajustes incrementales ya van con la versión de la tabla de origen
+TABLAS_SIN_VERSION = {'versiones_tablas', 'secuencias', 'migraciones'}
+
+class VersionTabla(db.Model):
+    """Número de versión de cada tabla, incrementado en la misma transacción que la modifica
+
+    Las respuestas GET derivan su ETag de las versiones de las tablas que leen
+    (ver src/utils/etag.py): mientras ninguna cambie, el ETag es el mismo en
+    todos los workers y la petición se responde con 304 sin consultar nada
+    más. Las escrituras del ORM incrementan la versión desde el listener
+    after_flush de este módulo; las escrituras masivas con Core deben llamar a
+    incrementar_versiones() ellas mismas.
+    """
+    __tablename__ = 'versiones_tablas'
+    
+    tabla = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<VersionTabla {self.tabla}={self.version}>'
+
+
+# Funciones llamadas con el conjunto de tablas cada vez que se confirma una transacción que las versionó
+_al_confirmar = []
+
+def incrementar_versiones(connection, tablas):
+    """Incrementa en 1 la versión de cada tabla, en orden fijo para no cruzar bloqueos"""
+    tablas = sorted(set(tablas) - TABLAS_SIN_VERSION)
+    for tabla in tablas:
+        upsert_incremento(connection, VersionTabla.__table__, {'tabla': tabla}, {'version': 1})
+    connection.info.setdefault('versiones_pendientes', set()).update(tablas)
+
+
+def al_confirmar_versiones(funcion):
+    """Registra funcion(tablas) para cuando se confirme una transacción que haya versionado tablas
+
+    Se llama desde el evento commit del engine, justo antes del COMMIT real:
+    sirve para liberar lo que dependa de esas tablas (p. ej. la caché de
+    respuestas), no para leer ya los datos nuevos. Vale para escrituras del
+    ORM y para las masivas con Core que llaman a incrementar_versiones().
+    """
+    _al_confirmar.append(funcion)
+    return funcion
+
+
+def leer_versiones(tablas):
+    """Devuelve {tabla: version} con una sola lectura por clave primaria; 0 si nunca ha cambiado"""
+    versiones = dict.fromkeys(tablas, 0)
+    if tablas:
+        filas = db.session.query(VersionTabla.tabla, VersionTabla.version).filter(
+            VersionTabla.tabla.in_(list(tablas))
+        ).all()
+        versiones.update(dict(filas))
+    return versiones
+
+
+def _tablas_modificadas(session):
+    tablas = set()
+    for objeto in session.new | session.deleted:
+        tablas.update(tabla.name for tabla in db.inspect(objeto).mapper.tables)
+    for objeto in session.dirty:
+        if session.is_modified(objeto, include_collections=False):
+            tablas.update(tabla.name for tabla in db.inspect(objeto).mapper.tables)
+    return tablas
+
+@db.event.listens_for(Session, 'after_flush')
+def _versionar_flush(session, flush_context):
+    # Basta un incremento por tabla y transacción: el cambio se ve entero al confirmar
+    versionadas = session.info.setdefault('tablas_versionadas', set())
+    pendientes = _tablas_modificadas(session) - versionadas - TABLAS_SIN_VERSION
+    if pendientes:
+        incrementar_versiones(session.connection(), pendientes)
+        versionadas.update(pendientes)
+
+@db.event.listens_for(Session, 'after_transaction_end')
+def _fin_transaccion(session, transaction):
+    if transaction.parent is None:
+        session.info.pop('tablas_versionadas', None)
+
+@db.event.listens_for(Engine, 'commit')
+def _confirmar_versiones(connection):
+    tablas = connection.info.pop('versiones_pendientes', None)
+    if tablas:
+        for funcion in _al_confirmar:
+            funcion(tablas)
+
+@db.event.listens_for(Engine, 'rollback')
+def _descartar_versiones(connection):
+    connection.info.pop('versiones_pendientes', None)
@@ -1,19 +1,76 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, request, jsonify
 from src.models.cita import Cita
+from src.utils.fechas import parse_rango_fechas
+from src.utils.paginacion import parametros_paginacion
+from datetime import timedelta
 
 citas_bp = Blueprint('citas', __name__)
 
+# Ventana máxima que se devuelve sin paginar: un mes de calendario con las semanas que lo rodean
+MAX_DIAS_SIN_PAGINAR = 42
+
 @citas_bp.route('/citas', methods=['GET'])
 def get_citas():
-    """Obtener lista de citas"""
+    """Obtener lista de citas con filtros opcionales
+
+    ?desde= y ?hasta= acotan fecha_hora (ver parse_rango_fechas); ?tecnico_id=
+    y ?estado= filtran por igualdad. La respuesta se pagina siempre salvo que
+    se pida una ventana desde/hasta de como mucho MAX_DIAS_SIN_PAGINAR días
+    sin ?page= ni ?per_page=: así la vista de calendario obtiene su semana o
+    su mes de una vez, pero nunca se descarga todo el histórico.
+    """
     try:
-        citas = Cita.query.order_by(Cita.fecha_hora.desc()).all()
+        try:
+            desde, hasta = parse_rango_fechas(request.args.get('desde'), request.args.get('hasta'))
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        
+        tecnico_id = request.args.get('tecnico_id', type=int)
+        if 'tecnico_id' in request.args and tecnico_id is None:
+            return jsonify({'success': False, 'error': 'El parámetro tecnico_id debe ser un entero'}), 400
+        
+        try:
+            page, per_page = parametros_paginacion(request.args)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        
+        estado = request.args.get('estado')
+        
+        query = Cita.query.options(*Cita.opciones_carga())
+        
+        if desde:
+            query = query.filter(Cita.fecha_hora >= desde)
+        
+        if hasta:
+            query = query.filter(Cita.fecha_hora < hasta)
+        
+        if tecnico_id is not None:
+            query = query.filter(Cita.tecnico_id == tecnico_id)
+        
+        if estado and estado != 'todos':
+            query = query.filter(Cita.estado == estado)
+        
+        query = query.order_by(Cita.fecha_hora.desc())
+        
+        ventana_calendario = desde and hasta and hasta - desde <= timedelta(days=MAX_DIAS_SIN_PAGINAR)
+        if ventana_calendario and 'page' not in request.args and 'per_page' not in request.args:
+            return jsonify({
+                'success': True,
+                'data': [cita.to_dict() for cita in query.all()]
+            })
+        
+        citas = query.paginate(page=page, per_page=per_page, error_out=False)
         
         return jsonify({
             'success': True,
-            'data': [cita.to_dict() for cita in citas]
+            'data': [cita.to_dict() for cita in citas.items],
+            'pagination': {
+                'page': page,
+                'pages': citas.pages,
+                'per_page': per_page,
+                'total': citas.total
+            }
         })
     
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
-
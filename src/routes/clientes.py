@@ -2,31 +2,47 @@ from flask import Blueprint, request, jsonify
 from src.models import db
 from src.models.cliente import Cliente
 from src.models.vehiculo import Vehiculo
+from src.utils.paginacion import paginar_por_cursor, parametros_paginacion
+from src.utils.busqueda import filtrar_busqueda, orden_busqueda
+from src.utils.importacion import importar_clientes, leer_registros, origen_importacion
+from src.utils.etag import etag_tablas
 from datetime import datetime
 
 clientes_bp = Blueprint('clientes', __name__)
 
 @clientes_bp.route('/clientes', methods=['GET'])
+@etag_tablas('clientes', 'vehiculos')
 def get_clientes():
     """Obtener lista de clientes con filtros opcionales"""
     try:
         search = request.args.get('search', '')
-        page = int(request.args.get('page', 1))
-        per_page = int(request.args.get('per_page', 50))
+        try:
+            page, per_page = parametros_paginacion(request.args)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         
         query = Cliente.query
         
+        rank = None
         if search:
-            query = query.filter(
-                db.or_(
-                    Cliente.nombre_completo.ilike(f'%{search}%'),
-                    Cliente.dni.ilike(f'%{search}%'),
-                    Cliente.telefono.ilike(f'%{search}%'),
-                    Cliente.email.ilike(f'%{search}%')
+            query, rank = filtrar_busqueda(query, Cliente, search)
+        
+        if 'cursor' in request.args:
+            try:
+                items, pagination = paginar_por_cursor(
+                    query, Cliente.fecha_registro, Cliente.id, request.args['cursor'], per_page,
+                    con_total=request.args.get('total') == 'exact'
                 )
-            )
+            except ValueError as e:
+                return jsonify({'success': False, 'error': str(e)}), 400
+            
+            return jsonify({
+                'success': True,
+                'data': [cliente.to_dict() for cliente in items],
+                'pagination': pagination
+            })
         
-        clientes = query.order_by(Cliente.fecha_registro.desc()).paginate(
+        clientes = query.order_by(*orden_busqueda(rank), Cliente.fecha_registro.desc()).paginate(
             page=page, per_page=per_page, error_out=False
         )
         
@@ -82,6 +98,31 @@ def create_cliente():
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@clientes_bp.route('/clientes/import', methods=['POST'])
+def import_clientes():
+    """Importar clientes en bloque desde CSV o NDJSON
+
+    El fichero se envía como cuerpo de la petición o en el campo 'file' de un
+    formulario, y se procesa a medida que se lee. Las filas con errores no
+    detienen la importación: se devuelven en el informe con su número de línea.
+    """
+    try:
+        stream, formato = origen_importacion(request)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    try:
+        informe = importar_clientes(leer_registros(stream, formato))
+        
+        return jsonify({
+            'success': True,
+            'message': f"{informe['importados']} de {informe['procesados']} registros importados",
+            'data': informe
+        })
+    
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @clientes_bp.route('/clientes/<int:cliente_id>', methods=['GET'])
 def get_cliente(cliente_id):
     """Obtener cliente por ID"""
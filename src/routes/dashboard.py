@@ -1,48 +1,41 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, request, jsonify
 from src.models import db
-from src.models.cliente import Cliente
-from src.models.vehiculo import Vehiculo
 from src.models.diagnostico import Diagnostico
 from src.models.cita import Cita
 from src.models.factura import Factura
-from src.models.repuesto import SolicitudRepuesto
-from datetime import datetime, timedelta
-from sqlalchemy import func, extract
+from src.models.contador import clave_citas_dia, leer_contadores
+from src.models.revenue_rollup import ingresos_mensuales
+from src.utils.etag import etag_tablas
+from datetime import date, datetime, timedelta
+from sqlalchemy import func
 
 dashboard_bp = Blueprint('dashboard', __name__)
 
 @dashboard_bp.route('/dashboard/stats', methods=['GET'])
+@etag_tablas('vehiculos', 'citas', 'facturas', 'clientes', 'solicitudes_repuestos', 'contadores', 'revenue_rollup', cache=True)
 def get_dashboard_stats():
-    """Obtener estadísticas principales del dashboard"""
+    """Obtener estadísticas principales del dashboard
+
+    Los valores se leen de la tabla de contadores (src/models/contador.py) y
+    del rollup de ingresos (src/models/revenue_rollup.py), ambos mantenidos por
+    eventos del ORM, en lugar de agregarse en cada petición.
+    """
     try:
-        # Estadísticas básicas
-        vehiculos_en_taller = Vehiculo.query.filter_by(estado='en_taller').count()
+        ahora = datetime.now()
+        clave_citas_hoy = clave_citas_dia(ahora.date())
         
-        # Citas de hoy
-        hoy = datetime.now().date()
-        citas_hoy = Cita.query.filter(
-            func.date(Cita.fecha_hora) == hoy
-        ).count()
-        
-        # Facturas pendientes
-        facturas_pendientes = Factura.query.filter_by(estado='enviada').count()
-        
-        # Ingresos del mes actual
-        mes_actual = datetime.now().month
-        año_actual = datetime.now().year
-        ingresos_mes = db.session.query(func.sum(Factura.total)).filter(
-            Factura.estado == 'pagada',
-            extract('month', Factura.fecha_emision) == mes_actual,
-            extract('year', Factura.fecha_emision) == año_actual
-        ).scalar() or 0
-        
-        # Clientes activos
-        clientes_activos = Cliente.query.filter_by(activo=True).count()
-        
-        # Repuestos pendientes
-        repuestos_pendientes = SolicitudRepuesto.query.filter(
-            SolicitudRepuesto.estado.in_(['solicitado', 'cotizado', 'pedido'])
-        ).count()
+        contadores = leer_contadores([
+            'vehiculos_en_taller', clave_citas_hoy, 'facturas_pendientes',
+            'clientes_activos', 'repuestos_pendientes'
+        ])
+        mes_actual = (ahora.year, ahora.month)
+        
+        vehiculos_en_taller = int(contadores['vehiculos_en_taller'])
+        citas_hoy = int(contadores[clave_citas_hoy])
+        facturas_pendientes = int(contadores['facturas_pendientes'])
+        ingresos_mes = ingresos_mensuales(mes_actual, mes_actual).get(mes_actual, 0)
+        clientes_activos = int(contadores['clientes_activos'])
+        repuestos_pendientes = int(contadores['repuestos_pendientes'])
         
         return jsonify({
             'success': True,
@@ -59,50 +52,111 @@ def get_dashboard_stats():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# Nombres de meses en español
+NOMBRES_MESES = ['', 'Ene', 'Feb', 'Mar', 'Abr', 'May', 'Jun',
+                 'Jul', 'Ago', 'Sep', 'Oct', 'Nov', 'Dic']
+
+# Horizonte máximo del gráfico de ingresos
+MAX_MESES_GRAFICO = 60
+
 @dashboard_bp.route('/dashboard/revenue-chart', methods=['GET'])
+@etag_tablas('facturas', 'revenue_rollup', cache=True)
 def get_revenue_chart():
-    """Obtener datos para el gráfico de ingresos mensuales"""
+    """Obtener datos para el gráfico de ingresos
+
+    ?months=N fija el horizonte (6 por defecto, hasta MAX_MESES_GRAFICO) y
+    ?granularity=month|week el tamaño de cada barra. Los meses se leen del
+    rollup de ingresos; las semanas se obtienen con una única consulta
+    agrupada sobre el rango semiabierto [inicio, fin) de fecha_emision. En
+    ambos casos el número de consultas no depende del horizonte.
+    """
     try:
-        # Obtener ingresos de los últimos 6 meses
-        meses = []
-        año_actual = datetime.now().year
-        mes_actual = datetime.now().month
-        
-        for i in range(6):
-            mes = mes_actual - i
-            año = año_actual
-            
-            if mes <= 0:
-                mes += 12
-                año -= 1
-            
-            ingresos = db.session.query(func.sum(Factura.total)).filter(
-                Factura.estado == 'pagada',
-                extract('month', Factura.fecha_emision) == mes,
-                extract('year', Factura.fecha_emision) == año
-            ).scalar() or 0
-            
-            # Nombres de meses en español
-            nombres_meses = ['', 'Ene', 'Feb', 'Mar', 'Abr', 'May', 'Jun', 
-                           'Jul', 'Ago', 'Sep', 'Oct', 'Nov', 'Dic']
+        try:
+            meses = int(request.args.get('months', 6))
+        except ValueError:
+            return jsonify({'success': False, 'error': 'El parámetro months debe ser un entero'}), 400
+        granularidad = request.args.get('granularity', 'month')
+        
+        if not 1 <= meses <= MAX_MESES_GRAFICO:
+            return jsonify({'success': False, 'error': f'El parámetro months debe estar entre 1 y {MAX_MESES_GRAFICO}'}), 400
+        if granularidad not in ('month', 'week'):
+            return jsonify({'success': False, 'error': 'El parámetro granularity debe ser month o week'}), 400
+        
+        hoy = datetime.now().date()
+        año_inicio, mes_inicio = divmod(hoy.year * 12 + hoy.month - 1 - (meses - 1), 12)
+        inicio = date(año_inicio, mes_inicio + 1, 1)
+        fin = date(hoy.year + hoy.month // 12, hoy.month % 12 + 1, 1)
+        
+        if granularidad == 'week':
+            # Las semanas empiezan en lunes, la primera puede comenzar antes del mes inicial
+            inicio -= timedelta(days=inicio.weekday())
+            periodos = [inicio + timedelta(weeks=i) for i in range((fin - inicio).days // 7 + 1)]
+            periodos = [p for p in periodos if p < fin]
+        else:
+            periodos = []
+            año, mes = inicio.year, inicio.month
+            for _ in range(meses):
+                periodos.append(date(año, mes, 1))
+                año, mes = (año + 1, 1) if mes == 12 else (año, mes + 1)
+        
+        ingresos = _ingresos_por_periodo(granularidad, inicio, fin)
+        
+        data = []
+        for periodo in periodos:
+            if granularidad == 'week':
+                etiqueta = f"{periodo.day:02d} {NOMBRES_MESES[periodo.month]}"
+            elif meses > 12:
+                etiqueta = f"{NOMBRES_MESES[periodo.month]} {periodo.year % 100:02d}"
+            else:
+                etiqueta = NOMBRES_MESES[periodo.month]
             
-            meses.append({
-                'month': nombres_meses[mes],
-                'revenue': round(ingresos, 2)
+            data.append({
+                'month': etiqueta,
+                'period': periodo.isoformat(),
+                'revenue': round(ingresos.get(periodo, 0) or 0, 2)
             })
         
-        # Invertir para mostrar cronológicamente
-        meses.reverse()
-        
         return jsonify({
             'success': True,
-            'data': meses
+            'data': data
         })
     
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+def _ingresos_por_periodo(granularidad, inicio, fin):
+    """Suma de facturas pagadas en [inicio, fin) agrupada por el primer día de cada periodo"""
+    if granularidad == 'month':
+        ultimo_mes = fin - timedelta(days=1)
+        ingresos = ingresos_mensuales((inicio.year, inicio.month), (ultimo_mes.year, ultimo_mes.month))
+        return {date(año, mes, 1): total for (año, mes), total in ingresos.items()}
+    
+    filtros = (
+        Factura.estado == 'pagada',
+        Factura.fecha_emision >= inicio,
+        Factura.fecha_emision < fin
+    )
+    dialecto = db.engine.dialect.name
+    
+    if dialecto == 'sqlite':
+        # Retrocede al lunes de la semana: 'weekday 0' avanza al domingo y -6 days vuelve al lunes
+        periodo = func.date(Factura.fecha_emision, 'weekday 0', '-6 days')
+    elif dialecto == 'postgresql':
+        periodo = func.to_char(func.date_trunc('week', Factura.fecha_emision), 'YYYY-MM-DD')
+    else:
+        # Sin expresión de truncado conocida: se agrupa en Python sobre el mismo rango
+        ingresos = {}
+        for fecha, total in db.session.query(Factura.fecha_emision, Factura.total).filter(*filtros):
+            dia = fecha.date()
+            clave = dia - timedelta(days=dia.weekday())
+            ingresos[clave] = ingresos.get(clave, 0) + (total or 0)
+        return ingresos
+    
+    filas = db.session.query(periodo, func.sum(Factura.total)).filter(*filtros).group_by(periodo)
+    return {date.fromisoformat(clave): total for clave, total in filas}
+
 @dashboard_bp.route('/dashboard/repair-types', methods=['GET'])
+@etag_tablas(cache=True)
 def get_repair_types():
     """Obtener distribución de tipos de reparación"""
     try:
@@ -124,7 +178,9 @@ def get_repair_types():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# Las citas de las últimas 24 horas cambian con el reloj: el ETag caduca cada minuto
 @dashboard_bp.route('/dashboard/recent-activity', methods=['GET'])
+@etag_tablas('diagnosticos', 'vehiculos', 'citas', 'facturas', ventana=60, cache=True)
 def get_recent_activity():
     """Obtener actividad reciente del taller"""
     try:
@@ -185,6 +241,7 @@ def get_recent_activity():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @dashboard_bp.route('/dashboard/diagnosticos-stats', methods=['GET'])
+@etag_tablas('diagnosticos', cache=True)
 def get_diagnosticos_stats():
     """Obtener estadísticas de diagnósticos por estado"""
     try:
@@ -1,6 +1,8 @@
 from flask import Blueprint, request, jsonify
 from src.models import db
 from src.models.diagnostico import Diagnostico
+from src.utils.paginacion import paginar_por_cursor, parametros_paginacion
+from src.utils.busqueda import filtrar_busqueda, orden_busqueda
 
 diagnosticos_bp = Blueprint('diagnosticos', __name__)
 
@@ -10,23 +12,36 @@ def get_diagnosticos():
     try:
         search = request.args.get('search', '')
         estado = request.args.get('estado')
-        page = int(request.args.get('page', 1))
-        per_page = int(request.args.get('per_page', 50))
+        try:
+            page, per_page = parametros_paginacion(request.args)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         
-        query = Diagnostico.query
+        query = Diagnostico.query.options(*Diagnostico.opciones_carga())
         
+        rank = None
         if search:
-            query = query.join(Diagnostico.vehiculo).filter(
-                db.or_(
-                    Diagnostico.descripcion_fallo.ilike(f'%{search}%'),
-                    db.text("vehiculos.matricula ILIKE :search").params(search=f'%{search}%')
-                )
-            )
+            query, rank = filtrar_busqueda(query, Diagnostico, search)
         
         if estado and estado != 'todos':
-            query = query.filter_by(estado=estado)
+            query = query.filter(Diagnostico.estado == estado)
+        
+        if 'cursor' in request.args:
+            try:
+                items, pagination = paginar_por_cursor(
+                    query, Diagnostico.fecha_diagnostico, Diagnostico.id, request.args['cursor'], per_page,
+                    con_total=request.args.get('total') == 'exact'
+                )
+            except ValueError as e:
+                return jsonify({'success': False, 'error': str(e)}), 400
+            
+            return jsonify({
+                'success': True,
+                'data': [diagnostico.to_dict() for diagnostico in items],
+                'pagination': pagination
+            })
         
-        diagnosticos = query.order_by(Diagnostico.fecha_diagnostico.desc()).paginate(
+        diagnosticos = query.order_by(*orden_busqueda(rank), Diagnostico.fecha_diagnostico.desc()).paginate(
             page=page, per_page=per_page, error_out=False
         )
         
@@ -1,13 +1,28 @@
-from flask import Blueprint, jsonify
+import csv
+import io
+import json
+from flask import Blueprint, Response, request, jsonify, stream_with_context
 from src.models.factura import Factura
+from src.utils.facturacion import ESTADOS_RECALCULABLES, generar_facturas_pendientes, recalcular_facturas
+from src.utils.fechas import parse_rango_fechas
 
 facturas_bp = Blueprint('facturas', __name__)
 
+# Filas que se piden al cursor de la base de datos en cada lote de la exportación
+EXPORT_BATCH_SIZE = 500
+
+EXPORT_CSV_COLUMNS = [
+    'id', 'numero_factura', 'diagnostico_id', 'fecha_emision', 'fecha_vencimiento', 'estado',
+    'cliente_nombre', 'cliente_dni', 'vehiculo_info',
+    'subtotal_repuestos', 'margen_repuestos', 'subtotal_mano_obra', 'iva', 'total',
+    'detalle_repuestos', 'detalle_mano_obra'
+]
+
 @facturas_bp.route('/facturas', methods=['GET'])
 def get_facturas():
     """Obtener lista de facturas"""
     try:
-        facturas = Factura.query.order_by(Factura.fecha_emision.desc()).all()
+        facturas = Factura.query.options(*Factura.opciones_carga()).order_by(Factura.fecha_emision.desc()).all()
         
         return jsonify({
             'success': True,
@@ -17,3 +32,186 @@ def get_facturas():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+def _parametros_importes(data):
+    """Márgenes de repuestos nuevos/usados e IVA del cuerpo de la petición, con sus valores por defecto"""
+    try:
+        return (
+            float(data.get('margen_nuevos', 20)),
+            float(data.get('margen_usados', 30)),
+            float(data.get('iva_porcentaje', 21))
+        )
+    except (TypeError, ValueError):
+        raise ValueError('Los márgenes y el IVA deben ser numéricos')
+
+@facturas_bp.route('/facturas/bulk-generate', methods=['POST'])
+def bulk_generate():
+    """Generar las facturas de todos los diagnósticos completados que aún no tienen
+
+    Acepta margen_nuevos, margen_usados, iva_porcentaje, estado de las nuevas
+    facturas (borrador por defecto, o enviada) y limite para facturar sólo los
+    N diagnósticos más antiguos.
+    """
+    data = request.get_json(silent=True) or {}
+    
+    try:
+        margen_nuevos, margen_usados, iva_porcentaje = _parametros_importes(data)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    estado = data.get('estado', 'borrador')
+    if estado not in ('borrador', 'enviada'):
+        return jsonify({'success': False, 'error': 'El estado de las facturas debe ser borrador o enviada'}), 400
+    
+    limite = data.get('limite')
+    # bool es subclase de int: "limite": true no debe pasar por 1
+    if limite is not None and (not isinstance(limite, int) or isinstance(limite, bool) or limite < 1):
+        return jsonify({'success': False, 'error': 'limite debe ser un entero positivo'}), 400
+    
+    try:
+        resumen = generar_facturas_pendientes(
+            margen_nuevos=margen_nuevos,
+            margen_usados=margen_usados,
+            iva_porcentaje=iva_porcentaje,
+            estado=estado,
+            limite=limite
+        )
+        
+        return jsonify({
+            'success': True,
+            'message': f"{resumen['facturas']} facturas generadas",
+            'data': resumen
+        }), 201 if resumen['facturas'] else 200
+    
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@facturas_bp.route('/facturas/recalcular', methods=['POST'])
+def recalcular():
+    """Recalcular en bloque los importes de las facturas abiertas
+
+    Acepta margen_nuevos, margen_usados, iva_porcentaje, estados (por defecto
+    borrador y enviada) y dry_run. Con dry_run no se guarda nada y la respuesta
+    sólo indica cuánto cambiaría el total facturado.
+    """
+    data = request.get_json(silent=True) or {}
+    
+    try:
+        margen_nuevos, margen_usados, iva_porcentaje = _parametros_importes(data)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    estados = data.get('estados') or list(ESTADOS_RECALCULABLES)
+    if not isinstance(estados, list) or not set(estados) <= set(ESTADOS_RECALCULABLES):
+        return jsonify({
+            'success': False,
+            'error': f'Sólo se pueden recalcular facturas en estado {", ".join(ESTADOS_RECALCULABLES)}'
+        }), 400
+    
+    try:
+        resumen = recalcular_facturas(
+            margen_nuevos=margen_nuevos,
+            margen_usados=margen_usados,
+            iva_porcentaje=iva_porcentaje,
+            estados=estados,
+            dry_run=bool(data.get('dry_run', False))
+        )
+        
+        return jsonify({
+            'success': True,
+            'data': resumen
+        })
+    
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@facturas_bp.route('/facturas/export', methods=['GET'])
+def export_facturas():
+    """Exportar facturas en streaming como NDJSON (por defecto) o CSV
+
+    Acepta ?format=ndjson|csv, ?desde=&hasta= sobre fecha_emision y ?estado=.
+    Las filas se leen por lotes con yield_per() y se escriben a la respuesta
+    según llegan, así que la memoria del worker no crece con el número de
+    facturas exportadas.
+    """
+    formato = request.args.get('format', 'ndjson')
+    if formato not in ('ndjson', 'csv'):
+        return jsonify({'success': False, 'error': 'Formato no soportado, use ndjson o csv'}), 400
+    
+    try:
+        desde, hasta = parse_rango_fechas(request.args.get('desde'), request.args.get('hasta'))
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    query = Factura.query.options(*Factura.opciones_carga())
+    
+    if desde:
+        query = query.filter(Factura.fecha_emision >= desde)
+    
+    if hasta:
+        query = query.filter(Factura.fecha_emision < hasta)
+    
+    estado = request.args.get('estado')
+    if estado and estado != 'todos':
+        query = query.filter(Factura.estado == estado)
+    
+    facturas = query.order_by(Factura.fecha_emision, Factura.id).yield_per(EXPORT_BATCH_SIZE)
+    
+    if formato == 'csv':
+        generador = _generar_csv(facturas)
+        mimetype = 'text/csv'
+    else:
+        generador = _generar_ndjson(facturas)
+        mimetype = 'application/x-ndjson'
+    
+    return Response(
+        stream_with_context(generador),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename=facturas.{formato}'}
+    )
+
+def _generar_ndjson(facturas):
+    lineas = []
+    for factura in facturas:
+        lineas.append(json.dumps(factura.to_dict(), ensure_ascii=False))
+        if len(lineas) >= EXPORT_BATCH_SIZE:
+            yield '\n'.join(lineas) + '\n'
+            lineas = []
+    if lineas:
+        yield '\n'.join(lineas) + '\n'
+
+def _generar_csv(facturas):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_CSV_COLUMNS)
+    
+    filas = 0
+    for factura in facturas:
+        vehiculo = factura.diagnostico.vehiculo if factura.diagnostico else None
+        cliente = vehiculo.cliente if vehiculo else None
+        
+        writer.writerow([
+            factura.id,
+            factura.numero_factura,
+            factura.diagnostico_id,
+            factura.fecha_emision.isoformat() if factura.fecha_emision else '',
+            factura.fecha_vencimiento.isoformat() if factura.fecha_vencimiento else '',
+            factura.estado,
+            cliente.nombre_completo if cliente else '',
+            cliente.dni if cliente else '',
+            f"{vehiculo.marca} {vehiculo.modelo} - {vehiculo.matricula}" if vehiculo else '',
+            factura.subtotal_repuestos,
+            factura.margen_repuestos,
+            factura.subtotal_mano_obra,
+            factura.iva,
+            factura.total,
+            json.dumps(list(factura.detalle_repuestos), ensure_ascii=False) if factura.detalle_repuestos is not None else '',
+            json.dumps(list(factura.detalle_mano_obra), ensure_ascii=False) if factura.detalle_mano_obra is not None else ''
+        ])
+        
+        filas += 1
+        if filas % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    
+    yield buffer.getvalue()
@@ -0,0 +1,16 @@
+from flask import Blueprint, Response, current_app
+from src.utils.cache_respuestas import cache_actual
+from src.utils.instrumentacion import registro_metricas
+
+metricas_bp = Blueprint('metricas', __name__)
+
+@metricas_bp.route('/_metrics', methods=['GET'])
+def get_metricas():
+    """Histogramas por endpoint y contadores de la caché de respuestas en formato de texto de Prometheus"""
+    partes = []
+    if current_app.config['INSTRUMENTACION_SQL']:
+        partes.append(registro_metricas.exportar())
+    cache = cache_actual()
+    if cache is not None:
+        partes.append(cache.exportar())
+    return Response(''.join(partes), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -1,9 +1,11 @@
 from flask import Blueprint, jsonify
 from src.models.proveedor import Proveedor
+from src.utils.etag import etag_tablas
 
 proveedores_bp = Blueprint('proveedores', __name__)
 
 @proveedores_bp.route('/proveedores', methods=['GET'])
+@etag_tablas('proveedores', 'cotizaciones_repuestos', 'solicitudes_repuestos', cache=True)
 def get_proveedores():
     """Obtener lista de proveedores"""
     try:
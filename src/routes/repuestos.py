@@ -1,13 +1,15 @@
 from flask import Blueprint, jsonify
 from src.models.repuesto import SolicitudRepuesto
+from src.utils.etag import etag_tablas
 
 repuestos_bp = Blueprint('repuestos', __name__)
 
 @repuestos_bp.route('/repuestos/solicitudes', methods=['GET'])
+@etag_tablas('solicitudes_repuestos', 'repuestos', 'cotizaciones_repuestos', 'proveedores', cache=True)
 def get_solicitudes_repuestos():
     """Obtener lista de solicitudes de repuestos"""
     try:
-        solicitudes = SolicitudRepuesto.query.order_by(SolicitudRepuesto.fecha_solicitud.desc()).all()
+        solicitudes = SolicitudRepuesto.query.options(*SolicitudRepuesto.opciones_carga()).order_by(SolicitudRepuesto.fecha_solicitud.desc()).all()
         
         return jsonify({
             'success': True,
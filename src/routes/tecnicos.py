@@ -1,19 +1,32 @@
-from flask import Blueprint, jsonify
-from src.models.tecnico import Tecnico
+from flask import Blueprint, request, jsonify
+from src.models.tecnico import Tecnico, TecnicoEspecialidad
+from src.utils.etag import etag_tablas
+from sqlalchemy.orm import selectinload
 
 tecnicos_bp = Blueprint('tecnicos', __name__)
 
 @tecnicos_bp.route('/tecnicos', methods=['GET'])
+@etag_tablas('tecnicos', 'tecnico_especialidades', 'diagnosticos', cache=True)
 def get_tecnicos():
-    """Obtener lista de técnicos"""
+    """Obtener lista de técnicos, opcionalmente filtrada por ?especialidad="""
     try:
-        tecnicos = Tecnico.query.filter_by(activo=True).all()
+        query = Tecnico.query.options(
+            selectinload(Tecnico.especialidades_asignadas)
+        ).filter_by(activo=True)
+        
+        especialidad = request.args.get('especialidad')
+        if especialidad:
+            query = query.filter(Tecnico.especialidades_asignadas.any(
+                TecnicoEspecialidad.especialidad == especialidad
+            ))
+        
+        tecnicos = query.all()
+        activos = Tecnico.contar_diagnosticos_activos([tecnico.id for tecnico in tecnicos])
         
         return jsonify({
             'success': True,
-            'data': [tecnico.to_dict() for tecnico in tecnicos]
+            'data': [tecnico.to_dict(diagnosticos_activos=activos.get(tecnico.id, 0)) for tecnico in tecnicos]
         })
     
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
-
@@ -1,39 +1,90 @@
 from flask import Blueprint, request, jsonify
 from src.models import db
-from src.models.vehiculo import Vehiculo
+from src.models.vehiculo import Vehiculo, normalizar_identificador
 from src.models.cliente import Cliente
+from src.utils.paginacion import paginar_por_cursor, parametros_paginacion
+from src.utils.busqueda import filtrar_busqueda, orden_busqueda
+from src.utils.importacion import importar_vehiculos, leer_registros, origen_importacion
+from src.utils.etag import etag_tablas
+from sqlalchemy.orm import joinedload
+from datetime import datetime
+import calendar
 
 vehiculos_bp = Blueprint('vehiculos', __name__)
 
+# Máximo de coincidencias devueltas por /vehiculos/lookup
+LOOKUP_LIMIT = 20
+
+# Rango admitido para ?sin_servicio_meses (hasta cien años atrás)
+MAX_MESES_SIN_SERVICIO = 1200
+
 @vehiculos_bp.route('/vehiculos', methods=['GET'])
+@etag_tablas('vehiculos', 'clientes', 'diagnosticos')
 def get_vehiculos():
-    """Obtener lista de vehículos con filtros opcionales"""
+    """Obtener lista de vehículos con filtros opcionales
+
+    ?sin_servicio_meses=N devuelve los vehículos sin diagnósticos en los
+    últimos N meses (o sin ninguno) y ?orden=ultimo_servicio los ordena del
+    servicio más antiguo al más reciente.
+    """
     try:
         search = request.args.get('search', '')
         cliente_id = request.args.get('cliente_id')
         estado = request.args.get('estado')
-        page = int(request.args.get('page', 1))
-        per_page = int(request.args.get('per_page', 50))
+        sin_servicio_meses = request.args.get('sin_servicio_meses', type=int)
+        if 'sin_servicio_meses' in request.args and (
+            sin_servicio_meses is None or not 0 <= sin_servicio_meses <= MAX_MESES_SIN_SERVICIO
+        ):
+            return jsonify({
+                'success': False,
+                'error': f'Parámetro sin_servicio_meses debe ser un entero entre 0 y {MAX_MESES_SIN_SERVICIO}'
+            }), 400
+        orden = request.args.get('orden')
+        try:
+            page, per_page = parametros_paginacion(request.args)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         
-        query = Vehiculo.query
+        query = Vehiculo.query.options(joinedload(Vehiculo.cliente))
         
+        rank = None
         if search:
-            query = query.filter(
-                db.or_(
-                    Vehiculo.matricula.ilike(f'%{search}%'),
-                    Vehiculo.marca.ilike(f'%{search}%'),
-                    Vehiculo.modelo.ilike(f'%{search}%'),
-                    Vehiculo.numero_bastidor.ilike(f'%{search}%')
-                )
-            )
+            query, rank = filtrar_busqueda(query, Vehiculo, search)
         
         if cliente_id:
-            query = query.filter_by(cliente_id=cliente_id)
+            query = query.filter(Vehiculo.cliente_id == cliente_id)
         
         if estado:
-            query = query.filter_by(estado=estado)
+            query = query.filter(Vehiculo.estado == estado)
+        
+        if sin_servicio_meses is not None:
+            limite = _restar_meses(datetime.now(), sin_servicio_meses)
+            query = query.filter(db.or_(
+                Vehiculo.fecha_ultimo_servicio < limite,
+                Vehiculo.fecha_ultimo_servicio.is_(None)
+            ))
+        
+        if 'cursor' in request.args:
+            try:
+                items, pagination = paginar_por_cursor(
+                    query, Vehiculo.fecha_registro, Vehiculo.id, request.args['cursor'], per_page,
+                    con_total=request.args.get('total') == 'exact'
+                )
+            except ValueError as e:
+                return jsonify({'success': False, 'error': str(e)}), 400
+            
+            return jsonify({
+                'success': True,
+                'data': [vehiculo.to_dict() for vehiculo in items],
+                'pagination': pagination
+            })
         
-        vehiculos = query.order_by(Vehiculo.fecha_registro.desc()).paginate(
+        if orden == 'ultimo_servicio':
+            criterios = [Vehiculo.fecha_ultimo_servicio.asc(), Vehiculo.id]
+        else:
+            criterios = [*orden_busqueda(rank), Vehiculo.fecha_registro.desc()]
+        
+        vehiculos = query.order_by(*criterios).paginate(
             page=page, per_page=per_page, error_out=False
         )
         
@@ -51,6 +102,69 @@ def get_vehiculos():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+def _restar_meses(fecha, meses):
+    año, mes = divmod(fecha.year * 12 + fecha.month - 1 - meses, 12)
+    mes += 1
+    dias_mes = calendar.monthrange(año, mes)[1]
+    return fecha.replace(year=año, month=mes, day=min(fecha.day, dias_mes))
+
+@vehiculos_bp.route('/vehiculos/lookup', methods=['GET'])
+def lookup_vehiculos():
+    """Búsqueda rápida por matrícula o número de bastidor
+
+    ?q= se normaliza (mayúsculas, sin espacios ni guiones), así que "1234-abc"
+    encuentra 1234ABC. Se devuelven primero las coincidencias exactas, después
+    las de matrícula o bastidor que empiezan por q y por último los bastidores
+    que terminan en q. Cada paso es un rango sobre un índice B-tree de las
+    columnas normalizadas, sin recorrer la tabla.
+    """
+    try:
+        q = normalizar_identificador(request.args.get('q', ''))
+        if not q:
+            return jsonify({'success': False, 'error': 'Parámetro q es requerido'}), 400
+        
+        # Con type=int un valor no numérico da None; si se pasara el valor por defecto se ignoraría en silencio
+        limite = request.args.get('limit', type=int) if 'limit' in request.args else LOOKUP_LIMIT
+        if limite is None or limite < 1:
+            return jsonify({'success': False, 'error': 'Parámetro limit debe ser un entero positivo'}), 400
+        limite = min(limite, LOOKUP_LIMIT)
+        query = Vehiculo.query.options(joinedload(Vehiculo.cliente))
+        
+        pasos = [
+            ('exacta', db.or_(Vehiculo.matricula_norm == q, Vehiculo.bastidor_norm == q)),
+            ('matricula', _prefijo(Vehiculo.matricula_norm, q)),
+            ('bastidor', _prefijo(Vehiculo.bastidor_norm, q)),
+            ('final_bastidor', _prefijo(Vehiculo.bastidor_norm_inv, q[::-1]))
+        ]
+        
+        resultados = []
+        vistos = set()
+        for coincidencia, condicion in pasos:
+            restantes = limite - len(resultados)
+            if restantes <= 0:
+                break
+            
+            candidatos = query.filter(condicion)
+            if vistos:
+                candidatos = candidatos.filter(Vehiculo.id.notin_(vistos))
+            
+            for vehiculo in candidatos.limit(restantes):
+                vistos.add(vehiculo.id)
+                resultados.append({**vehiculo.to_lookup_dict(), 'coincidencia': coincidencia})
+        
+        return jsonify({
+            'success': True,
+            'data': resultados
+        })
+    
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+def _prefijo(columna, prefijo):
+    """columna empieza por prefijo, como rango [prefijo, siguiente) que puede resolverse con el índice"""
+    siguiente = prefijo[:-1] + chr(ord(prefijo[-1]) + 1)
+    return db.and_(columna >= prefijo, columna < siguiente)
+
 @vehiculos_bp.route('/vehiculos', methods=['POST'])
 def create_vehiculo():
     """Crear nuevo vehículo"""
@@ -100,6 +214,32 @@ def create_vehiculo():
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@vehiculos_bp.route('/vehiculos/import', methods=['POST'])
+def import_vehiculos():
+    """Importar vehículos en bloque desde CSV o NDJSON
+
+    El fichero se envía como cuerpo de la petición o en el campo 'file' de un
+    formulario, y se procesa a medida que se lee. Las filas con errores no
+    detienen la importación: se devuelven en el informe con su número de línea.
+    El cliente de cada vehículo se indica con cliente_id o con cliente_dni.
+    """
+    try:
+        stream, formato = origen_importacion(request)
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    try:
+        informe = importar_vehiculos(leer_registros(stream, formato))
+        
+        return jsonify({
+            'success': True,
+            'message': f"{informe['importados']} de {informe['procesados']} registros importados",
+            'data': informe
+        })
+    
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @vehiculos_bp.route('/vehiculos/<int:vehiculo_id>', methods=['GET'])
 def get_vehiculo(vehiculo_id):
     """Obtener vehículo por ID"""
@@ -0,0 +1,244 @@
+import re
+
+from sqlalchemy import inspect
+
+from src.models import db
+from src.models.cliente import Cliente
+from src.models.vehiculo import Vehiculo, normalizar_identificador
+from src.models.diagnostico import Diagnostico
+
+# Índices FTS5 de contenido externo: guardan sólo los tokens y leen el texto
+# de la tabla de origen. unicode61 con remove_diacritics 2 pliega los acentos,
+# de modo que "perez" encuentra "Pérez" y "leon" encuentra "León".
+INDICES_FTS = {
+    'clientes': ('clientes_fts', ('nombre_completo', 'dni', 'telefono', 'email')),
+    'vehiculos': ('vehiculos_fts', ('matricula', 'marca', 'modelo', 'numero_bastidor')),
+    'diagnosticos': ('diagnosticos_fts', ('descripcion_fallo',))
+}
+
+TOKENIZADOR = "unicode61 remove_diacritics 2"
+
+# Índices trigram sobre los identificadores normalizados (sin espacios, guiones
+# ni signos): encuentran cualquier fragmento de 3 o más caracteres, no sólo
+# prefijos de palabra, así que "ABC" encuentra el DNI 1234ABC y "1234-abc" la
+# matrícula 1234 ABC. Son tablas sin contenido propio (content=''), rellenadas
+# por triggers que se disparan al cambiar las columnas de origen, con la
+# expresión SQL de cada columna indexada sobre la fila.
+SEPARADORES_IDENTIFICADOR = (' ', '-', '.', '/', '_', '(', ')', '+')
+
+def _sql_normalizado(columna):
+    expresion = '{fila}.' + columna
+    for separador in SEPARADORES_IDENTIFICADOR:
+        expresion = f"replace({expresion}, '{separador}', '')"
+    return f'upper({expresion})'
+
+INDICES_IDENTIFICADORES = {
+    'clientes': ('clientes_ident_fts', ('dni', 'telefono'), {
+        'dni': _sql_normalizado('dni'),
+        'telefono': _sql_normalizado('telefono'),
+    }),
+    'vehiculos': ('vehiculos_ident_fts', ('matricula_norm', 'bastidor_norm'), {
+        'matricula_norm': '{fila}.matricula_norm',
+        'bastidor_norm': '{fila}.bastidor_norm',
+    }),
+}
+
+# El tokenizador trigram llegó en SQLite 3.34; sin él no se crean estos índices y se busca con ILIKE
+VERSION_TRIGRAM = (3, 34, 0)
+# Fragmento mínimo que puede buscar un índice trigram
+LONGITUD_MINIMA_IDENTIFICADOR = 3
+
+# Columnas usadas cuando no hay FTS5 disponible (motores distintos de SQLite)
+COLUMNAS_ILIKE = {
+    Cliente: (Cliente.nombre_completo, Cliente.dni, Cliente.telefono, Cliente.email),
+    Vehiculo: (Vehiculo.matricula, Vehiculo.marca, Vehiculo.modelo, Vehiculo.numero_bastidor)
+}
+
+_fts_disponible = {}
+
+
+def crear_indices_busqueda(reconstruir=False):
+    """Crea las tablas FTS5 y los triggers que las sincronizan con sus tablas de origen
+
+    Sólo aplica a SQLite. Una tabla FTS recién creada se rellena a partir del
+    contenido existente; con reconstruir=True se rehacen todas. Devuelve la
+    lista de índices (re)construidos. Los índices trigram de identificadores
+    se crean si la versión de SQLite lo permite.
+    """
+    engine = db.engine
+    if engine.dialect.name != 'sqlite':
+        return []
+
+    existentes = set(inspect(engine).get_table_names())
+    reconstruidos = []
+
+    with engine.begin() as connection:
+        for tabla, (fts, columnas) in INDICES_FTS.items():
+            lista = ', '.join(columnas)
+            nuevos = ', '.join(f'new.{c}' for c in columnas)
+            viejos = ', '.join(f'old.{c}' for c in columnas)
+
+            connection.exec_driver_sql(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+                f"{lista}, content='{tabla}', content_rowid='id', tokenize='{TOKENIZADOR}')"
+            )
+            connection.exec_driver_sql(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {tabla} BEGIN "
+                f"INSERT INTO {fts}(rowid, {lista}) VALUES (new.id, {nuevos}); END"
+            )
+            connection.exec_driver_sql(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {tabla} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {lista}) VALUES ('delete', old.id, {viejos}); END"
+            )
+            # Sólo se reindexa cuando cambia alguna columna indexada
+            connection.exec_driver_sql(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {lista} ON {tabla} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {lista}) VALUES ('delete', old.id, {viejos}); "
+                f"INSERT INTO {fts}(rowid, {lista}) VALUES (new.id, {nuevos}); END"
+            )
+
+            if reconstruir or fts not in existentes:
+                connection.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+                reconstruidos.append(fts)
+
+        if _trigram_disponible(connection):
+            reconstruidos += _crear_indices_identificadores(connection, existentes, reconstruir)
+
+    _fts_disponible.clear()
+    return reconstruidos
+
+
+def _trigram_disponible(connection):
+    version = connection.exec_driver_sql('SELECT sqlite_version()').scalar()
+    return tuple(int(parte) for parte in version.split('.')) >= VERSION_TRIGRAM
+
+
+def _crear_indices_identificadores(connection, existentes, reconstruir):
+    reconstruidos = []
+    for tabla, (fts, origen, expresiones) in INDICES_IDENTIFICADORES.items():
+        columnas = ', '.join(expresiones)
+        valores = lambda fila: ', '.join(expresion.format(fila=fila) for expresion in expresiones.values())
+
+        connection.exec_driver_sql(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({columnas}, content='', tokenize='trigram')"
+        )
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {tabla} BEGIN "
+            f"INSERT INTO {fts}(rowid, {columnas}) VALUES (new.id, {valores('new')}); END"
+        )
+        # Una tabla sin contenido necesita los valores indexados para poder borrar la fila
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {tabla} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {columnas}) VALUES ('delete', old.id, {valores('old')}); END"
+        )
+        connection.exec_driver_sql(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {', '.join(origen)} ON {tabla} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {columnas}) VALUES ('delete', old.id, {valores('old')}); "
+            f"INSERT INTO {fts}(rowid, {columnas}) VALUES (new.id, {valores('new')}); END"
+        )
+
+        if reconstruir or fts not in existentes:
+            connection.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('delete-all')")
+            connection.exec_driver_sql(
+                f"INSERT INTO {fts}(rowid, {columnas}) SELECT id, {valores(tabla)} FROM {tabla}"
+            )
+            reconstruidos.append(fts)
+    return reconstruidos
+
+
+def expresion_fts(termino):
+    """Traduce el texto del buscador a una consulta FTS5 de prefijos unidos por AND
+
+    Cada palabra se entrecomilla para que la sintaxis de FTS5 (NEAR, OR, *,
+    comillas...) escrita por el usuario no se interprete.
+    """
+    return ' '.join(f'"{token}"*' for token in re.findall(r'\w+', termino))
+
+
+def expresion_identificador(termino):
+    """Consulta trigram con el término normalizado como identificador, o None si es demasiado corto"""
+    normalizado = normalizar_identificador(termino)
+    if not normalizado or len(normalizado) < LONGITUD_MINIMA_IDENTIFICADOR:
+        return None
+    return f'"{normalizado}"'
+
+
+def usa_fts():
+    """True si el motor actual es SQLite y los índices FTS5 (de texto e identificadores) están creados"""
+    engine = db.engine
+    if engine not in _fts_disponible:
+        tablas = inspect(engine).get_table_names() if engine.dialect.name == 'sqlite' else []
+        _fts_disponible[engine] = bool(tablas) and all(
+            fts in tablas
+            for fts in [fts for fts, _ in INDICES_FTS.values()] + [fts for fts, _, _ in INDICES_IDENTIFICADORES.values()]
+        )
+    return _fts_disponible[engine]
+
+
+def filtrar_busqueda(query, modelo, termino):
+    """Restringe query a las filas de modelo que coinciden con termino
+
+    Devuelve (query, rank): rank es una columna por la que ordenar de más a
+    menos relevante (bm25) o None cuando se usa el filtro ILIKE de respaldo.
+    Una fila coincide si sus palabras empiezan por las del término o si
+    alguno de sus identificadores (DNI, teléfono, matrícula, bastidor)
+    contiene el término normalizado.
+    """
+    if not usa_fts():
+        return _filtrar_ilike(query, modelo, termino), None
+
+    expresion = expresion_fts(termino)
+    if not expresion:
+        return query, None
+    identificador = expresion_identificador(termino)
+
+    if modelo is Diagnostico:
+        # Coincidencias en la descripción o en los datos del vehículo
+        ramas = [
+            "SELECT rowid AS id, bm25(diagnosticos_fts) AS rank FROM diagnosticos_fts "
+            "WHERE diagnosticos_fts MATCH :expresion",
+            "SELECT diagnosticos.id AS id, bm25(vehiculos_fts) AS rank FROM vehiculos_fts "
+            "JOIN diagnosticos ON diagnosticos.vehiculo_id = vehiculos_fts.rowid "
+            "WHERE vehiculos_fts MATCH :expresion",
+        ]
+        if identificador:
+            ramas.append(
+                "SELECT diagnosticos.id AS id, bm25(vehiculos_ident_fts) AS rank FROM vehiculos_ident_fts "
+                "JOIN diagnosticos ON diagnosticos.vehiculo_id = vehiculos_ident_fts.rowid "
+                "WHERE vehiculos_ident_fts MATCH :identificador"
+            )
+    else:
+        fts = INDICES_FTS[modelo.__tablename__][0]
+        ramas = [f"SELECT rowid AS id, bm25({fts}) AS rank FROM {fts} WHERE {fts} MATCH :expresion"]
+        if identificador:
+            ident = INDICES_IDENTIFICADORES[modelo.__tablename__][0]
+            ramas.append(f"SELECT rowid AS id, bm25({ident}) AS rank FROM {ident} WHERE {ident} MATCH :identificador")
+
+    sql = f"SELECT id, min(rank) AS rank FROM ({' UNION ALL '.join(ramas)}) GROUP BY id"
+    parametros = {'expresion': expresion}
+    if identificador:
+        parametros['identificador'] = identificador
+
+    coincidencias = db.text(sql).bindparams(**parametros).columns(
+        id=db.Integer, rank=db.Float
+    ).subquery(f'{modelo.__tablename__}_busqueda')
+
+    query = query.join(coincidencias, coincidencias.c.id == modelo.id)
+    return query, coincidencias.c.rank
+
+
+def _filtrar_ilike(query, modelo, termino):
+    patron = f'%{termino}%'
+    if modelo is Diagnostico:
+        return query.join(Diagnostico.vehiculo).filter(
+            db.or_(
+                Diagnostico.descripcion_fallo.ilike(patron),
+                Vehiculo.matricula.ilike(patron)
+            )
+        )
+    return query.filter(db.or_(*[columna.ilike(patron) for columna in COLUMNAS_ILIKE[modelo]]))
+
+
+def orden_busqueda(rank):
+    """Criterios de orden previos al orden habitual: relevancia si hay búsqueda FTS"""
+    return [rank] if rank is not None else []
@@ -0,0 +1,276 @@
+from collections import Counter, OrderedDict, defaultdict
+from flask import current_app, has_app_context
+from src.models import db
+from src.models.version_tabla import al_confirmar_versiones
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+ALMACENES = ('memoria', 'sqlite')
+
+# Las etiquetas se borran en cascada con su entrada; ix_etiquetas_tabla resuelve las invalidaciones
+ESQUEMA_SQLITE = '''
+CREATE TABLE IF NOT EXISTS entradas (
+    clave TEXT PRIMARY KEY,
+    expira REAL NOT NULL,
+    uso REAL NOT NULL,
+    mimetype TEXT NOT NULL,
+    cuerpo BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_entradas_uso ON entradas (uso);
+CREATE TABLE IF NOT EXISTS etiquetas (
+    clave TEXT NOT NULL REFERENCES entradas (clave) ON DELETE CASCADE,
+    tabla TEXT NOT NULL,
+    PRIMARY KEY (clave, tabla)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_etiquetas_tabla ON etiquetas (tabla);
+'''
+
+# Un acierto sólo reescribe la marca de uso LRU si es más vieja que esto: leer no debe bloquear a los demás workers
+RESOLUCION_USO_SEGUNDOS = 1.0
+
+
+class AlmacenMemoria:
+    """Entradas en un dict del proceso, LRU con límite de entradas y TTL
+
+    Cada worker de gunicorn tiene el suyo. Las invalidaciones de las
+    escrituras de otros workers no llegan aquí, pero no hace falta para
+    servir datos correctos: la clave incluye las versiones de las tablas, así
+    que una entrada anterior a una escritura deja de pedirse y sale por LRU o
+    por TTL.
+    """
+    
+    def __init__(self, max_entradas):
+        self.max_entradas = max_entradas
+        self._entradas = OrderedDict()
+        self._por_tabla = defaultdict(set)
+        self._lock = threading.Lock()
+    
+    def obtener(self, clave):
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is None:
+                return None
+            expira, _, valor = entrada
+            if expira <= time.monotonic():
+                self._quitar(clave)
+                return None
+            self._entradas.move_to_end(clave)
+            return valor
+    
+    def guardar(self, clave, tablas, valor, ttl):
+        with self._lock:
+            if clave in self._entradas:
+                self._quitar(clave)
+            self._entradas[clave] = (time.monotonic() + ttl, tablas, valor)
+            for tabla in tablas:
+                self._por_tabla[tabla].add(clave)
+            while len(self._entradas) > self.max_entradas:
+                self._quitar(next(iter(self._entradas)))
+    
+    def invalidar(self, tablas):
+        with self._lock:
+            claves = set()
+            for tabla in tablas:
+                claves.update(self._por_tabla.pop(tabla, ()))
+            for clave in claves:
+                self._quitar(clave)
+            return len(claves)
+    
+    def _quitar(self, clave):
+        _, tablas, _ = self._entradas.pop(clave)
+        for tabla in tablas:
+            claves = self._por_tabla.get(tabla)
+            if claves is not None:
+                claves.discard(clave)
+                if not claves:
+                    del self._por_tabla[tabla]
+
+
+class AlmacenSQLite:
+    """Entradas en un fichero SQLite compartido por todos los workers de la máquina
+
+    Una respuesta generada por un worker la sirven los demás, y una escritura
+    en cualquiera de ellos borra del fichero las entradas de las tablas que
+    ha modificado. Es una caché: se abre con synchronous=OFF y, si el fichero
+    se pierde, simplemente se vuelve a llenar. Cada hilo de cada proceso usa
+    su propia conexión. Apps sobre bases de datos distintas pueden compartir
+    el fichero porque CacheRespuestas separa sus claves y etiquetas.
+    """
+    
+    def __init__(self, ruta, max_entradas):
+        self.ruta = ruta
+        self.max_entradas = max_entradas
+        self._local = threading.local()
+    
+    def _conexion(self):
+        # Después de un fork (gunicorn --preload) no se reutiliza la conexión del maestro
+        if getattr(self._local, 'pid', None) != os.getpid():
+            conexion = sqlite3.connect(self.ruta, timeout=5, isolation_level=None, check_same_thread=False)
+            conexion.execute('PRAGMA journal_mode=WAL')
+            conexion.execute('PRAGMA synchronous=OFF')
+            conexion.execute('PRAGMA foreign_keys=ON')
+            conexion.executescript(ESQUEMA_SQLITE)
+            self._local.conexion = conexion
+            self._local.pid = os.getpid()
+        return self._local.conexion
+    
+    def obtener(self, clave):
+        conexion = self._conexion()
+        ahora = time.time()
+        fila = conexion.execute(
+            'SELECT mimetype, cuerpo, uso FROM entradas WHERE clave = ? AND expira > ?', (clave, ahora)
+        ).fetchone()
+        if fila is None:
+            return None
+        mimetype, cuerpo, uso = fila
+        if ahora - uso > RESOLUCION_USO_SEGUNDOS:
+            conexion.execute('UPDATE entradas SET uso = ? WHERE clave = ?', (ahora, clave))
+        return cuerpo, mimetype
+    
+    def guardar(self, clave, tablas, valor, ttl):
+        cuerpo, mimetype = valor
+        ahora = time.time()
+        conexion = self._conexion()
+        conexion.execute('BEGIN IMMEDIATE')
+        try:
+            conexion.execute(
+                'INSERT INTO entradas (clave, expira, uso, mimetype, cuerpo) VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT (clave) DO UPDATE SET expira = excluded.expira, uso = excluded.uso, '
+                'mimetype = excluded.mimetype, cuerpo = excluded.cuerpo',
+                (clave, ahora + ttl, ahora, mimetype, cuerpo)
+            )
+            conexion.executemany(
+                'INSERT OR IGNORE INTO etiquetas (clave, tabla) VALUES (?, ?)', [(clave, tabla) for tabla in tablas]
+            )
+            conexion.execute('DELETE FROM entradas WHERE expira <= ?', (ahora,))
+            sobrantes = conexion.execute('SELECT count(*) FROM entradas').fetchone()[0] - self.max_entradas
+            if sobrantes > 0:
+                conexion.execute(
+                    'DELETE FROM entradas WHERE clave IN (SELECT clave FROM entradas ORDER BY uso LIMIT ?)', (sobrantes,)
+                )
+            conexion.execute('COMMIT')
+        except BaseException:
+            conexion.execute('ROLLBACK')
+            raise
+    
+    def invalidar(self, tablas):
+        tablas = list(tablas)
+        marcadores = ', '.join('?' * len(tablas))
+        return self._conexion().execute(
+            f'DELETE FROM entradas WHERE clave IN (SELECT clave FROM etiquetas WHERE tabla IN ({marcadores}))', tablas
+        ).rowcount
+
+
+class CacheRespuestas:
+    """Caché de cuerpos de respuestas GET sobre un almacén, con contadores de aciertos y fallos
+
+    La clave es el ETag de etag_tablas() (endpoint, argumentos normalizados,
+    versiones de las tablas leídas y fecha) y cada entrada se etiqueta con
+    esas tablas. Claves y etiquetas llevan delante `espacio`, la identidad de
+    la base de datos: dos bases con las mismas versiones darían el mismo ETag
+    y no deben servirse respuestas la una a la otra. Un error del almacén
+    nunca rompe la petición: se registra y se trata como un fallo. Los
+    contadores son del proceso, como los histogramas de /api/_metrics.
+    """
+    
+    def __init__(self, almacen, ttl, logger=None, espacio=''):
+        self.almacen = almacen
+        self.ttl = ttl
+        self.logger = logger
+        self.espacio = espacio
+        self.aciertos = Counter()
+        self.fallos = Counter()
+        self.invalidaciones = 0
+        self._lock = threading.Lock()
+    
+    def _con_espacio(self, nombre):
+        return f'{self.espacio}:{nombre}' if self.espacio else nombre
+    
+    def obtener(self, endpoint, clave):
+        try:
+            valor = self.almacen.obtener(self._con_espacio(clave))
+        except Exception:
+            self._avisar('leer de')
+            valor = None
+        with self._lock:
+            (self.fallos if valor is None else self.aciertos)[endpoint] += 1
+        return valor
+    
+    def guardar(self, clave, tablas, cuerpo, mimetype, ttl=None):
+        try:
+            self.almacen.guardar(
+                self._con_espacio(clave), tuple(map(self._con_espacio, tablas)), (cuerpo, mimetype), ttl or self.ttl
+            )
+        except Exception:
+            self._avisar('guardar en')
+    
+    def invalidar(self, tablas):
+        try:
+            eliminadas = self.almacen.invalidar([self._con_espacio(tabla) for tabla in tablas])
+        except Exception:
+            self._avisar('invalidar')
+            return
+        with self._lock:
+            self.invalidaciones += eliminadas
+    
+    def _avisar(self, accion):
+        if self.logger is not None:
+            self.logger.warning('No se pudo %s la caché de respuestas', accion, exc_info=True)
+    
+    def exportar(self):
+        """Contadores en formato de exposición de Prometheus (text/plain; version=0.0.4)"""
+        lineas = []
+        with self._lock:
+            for nombre, ayuda, contador in (
+                ('taller_cache_respuestas_aciertos_total', 'Respuestas servidas desde la caché', self.aciertos),
+                ('taller_cache_respuestas_fallos_total', 'Respuestas que hubo que generar', self.fallos),
+            ):
+                lineas.append(f'# HELP {nombre} {ayuda}')
+                lineas.append(f'# TYPE {nombre} counter')
+                for endpoint, total in sorted(contador.items()):
+                    lineas.append(f'{nombre}{{endpoint="{endpoint}"}} {total}')
+            lineas.append('# HELP taller_cache_respuestas_invalidaciones_total Entradas eliminadas por escrituras')
+            lineas.append('# TYPE taller_cache_respuestas_invalidaciones_total counter')
+            lineas.append(f'taller_cache_respuestas_invalidaciones_total {self.invalidaciones}')
+        return '\n'.join(lineas) + '\n'
+
+
+def crear_almacen(config):
+    tipo = config['CACHE_RESPUESTAS']
+    if tipo == 'memoria':
+        return AlmacenMemoria(config['CACHE_RESPUESTAS_MAX_ENTRADAS'])
+    if tipo == 'sqlite':
+        return AlmacenSQLite(config['CACHE_RESPUESTAS_RUTA'], config['CACHE_RESPUESTAS_MAX_ENTRADAS'])
+    raise ValueError(f'CACHE_RESPUESTAS debe ser uno de {", ".join(ALMACENES)} u "off", no {tipo!r}')
+
+
+def identidad_base_datos(app):
+    """Resumen de la URL efectiva del engine de la app (sin contraseña, con la ruta de SQLite ya resuelta)"""
+    with app.app_context():
+        url = db.engine.url.render_as_string(hide_password=True)
+    return hashlib.sha1(url.encode()).hexdigest()[:16]
+
+
+def iniciar_cache_respuestas(app):
+    """Crea la caché de respuestas de la app según CACHE_RESPUESTAS y la deja en app.extensions"""
+    cache = CacheRespuestas(
+        crear_almacen(app.config), app.config['CACHE_RESPUESTAS_TTL'], app.logger, identidad_base_datos(app)
+    )
+    app.extensions['cache_respuestas'] = cache
+    return cache
+
+
+def cache_actual():
+    if not has_app_context():
+        return None
+    return current_app.extensions.get('cache_respuestas')
+
+
+@al_confirmar_versiones
+def _invalidar_tablas(tablas):
+    cache = cache_actual()
+    if cache is not None:
+        cache.invalidar(tablas)
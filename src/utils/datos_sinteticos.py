@@ -0,0 +1,407 @@
+from src.models import db
+from src.models.cliente import Cliente
+from src.models.vehiculo import Vehiculo, normalizar_identificador, recalcular_ultimo_servicio
+from src.models.tecnico import Tecnico, TecnicoEspecialidad
+from src.models.diagnostico import Diagnostico
+from src.models.repuesto import Repuesto, SolicitudRepuesto, CotizacionRepuesto
+from src.models.proveedor import Proveedor
+from src.models.cita import Cita
+from src.models.factura import Factura, reservar_numeros_factura
+from src.models.contador import reconciliar_contadores
+from src.models.revenue_rollup import reconstruir_revenue_rollup
+from src.models.version_tabla import incrementar_versiones
+from src.utils.facturacion import horas_estimadas
+from collections import defaultdict
+from datetime import datetime, timedelta
+from sqlalchemy import func, insert, select
+import random
+
+# Clientes por unidad de --scale; el resto de tablas sale de las proporciones de abajo
+CLIENTES_POR_ESCALA = 1000
+
+# Clientes (con todo lo que cuelga de ellos) que se generan e insertan por transacción
+BLOQUE_CLIENTES = 2000
+
+# Días hacia atrás desde la fecha de referencia que cubre el histórico generado
+DIAS_HISTORICO = 3 * 365
+
+# Distribuciones (valor, peso)
+VEHICULOS_POR_CLIENTE = ((1, 60), (2, 25), (3, 10), (4, 5))
+DIAGNOSTICOS_POR_VEHICULO = ((0, 10), (1, 20), (2, 25), (3, 20), (4, 12), (5, 8), (6, 5))
+SOLICITUDES_POR_DIAGNOSTICO = ((0, 25), (1, 30), (2, 25), (3, 15), (4, 5))
+
+MARGEN_NUEVOS = 20
+MARGEN_USADOS = 30
+IVA_PORCENTAJE = 21
+
+LETRAS_DNI = 'TRWAGMYFPDXBNJZSQVHLCKE'
+CONSONANTES_MATRICULA = 'BCDFGHJKLMNPRSTVWXYZ'
+
+NOMBRES = [
+    'Antonio', 'Manuel', 'José', 'Francisco', 'David', 'Juan', 'Javier', 'Daniel', 'Carlos', 'Jesús',
+    'María', 'Carmen', 'Ana', 'Isabel', 'Laura', 'Cristina', 'Marta', 'Lucía', 'Elena', 'Pilar'
+]
+APELLIDOS = [
+    'García', 'Rodríguez', 'González', 'Fernández', 'López', 'Martínez', 'Sánchez', 'Pérez', 'Gómez', 'Martín',
+    'Jiménez', 'Ruiz', 'Hernández', 'Díaz', 'Moreno', 'Muñoz', 'Álvarez', 'Romero', 'Alonso', 'Gutiérrez'
+]
+CALLES = ['Calle Mayor', 'Avenida de la Paz', 'Plaza España', 'Calle Alcalá', 'Gran Vía', 'Paseo del Prado', 'Calle Real']
+CIUDADES = ['Madrid', 'Barcelona', 'Valencia', 'Sevilla', 'Zaragoza', 'Málaga', 'Bilbao', 'Valladolid']
+MODELOS = {
+    'Toyota': ['Corolla', 'Yaris', 'RAV4'], 'Volkswagen': ['Golf', 'Polo', 'Passat'],
+    'Ford': ['Focus', 'Fiesta', 'Kuga'], 'Seat': ['León', 'Ibiza', 'Arona'],
+    'Renault': ['Clio', 'Megane', 'Captur'], 'BMW': ['Serie 1', 'Serie 3', 'X3'],
+    'Audi': ['A3', 'A4', 'Q5'], 'Mercedes': ['Clase A', 'Clase C', 'GLC'],
+    'Peugeot': ['208', '308', '3008'], 'Citroën': ['C3', 'C4', 'Berlingo']
+}
+ESPECIALIDADES = ['Motor', 'Transmisión', 'Frenos', 'Suspensión', 'Eléctrico', 'Aire Acondicionado', 'Carrocería', 'Neumáticos']
+CATALOGO_REPUESTOS = [
+    ('Pastillas de freno delanteras', 'Frenos', 45.0), ('Discos de freno', 'Frenos', 65.0),
+    ('Filtro de aceite', 'Motor', 12.0), ('Filtro de aire', 'Motor', 15.0), ('Bujías', 'Motor', 8.0),
+    ('Correa de distribución', 'Motor', 35.0), ('Amortiguador delantero', 'Suspensión', 85.0),
+    ('Batería 12V 60Ah', 'Eléctrico', 120.0), ('Alternador', 'Eléctrico', 180.0),
+    ('Compresor de aire acondicionado', 'Aire Acondicionado', 260.0), ('Embrague', 'Transmisión', 210.0),
+    ('Neumático 205/55 R16', 'Neumáticos', 70.0)
+]
+DESCRIPCIONES_FALLO = [
+    'Ruido extraño en el motor al acelerar', 'Frenos que chirrían al frenar', 'Problema con el aire acondicionado',
+    'Batería que se descarga rápidamente', 'Vibración en el volante a alta velocidad', 'Pérdida de potencia en subidas',
+    'Luces que parpadean intermitentemente', 'Problema con la transmisión automática',
+    'Escape que hace ruido excesivo', 'Sistema de dirección asistida con problemas', 'Revisión periódica'
+]
+TIEMPOS_ESTIMADOS = ['1-2h', '2-3h', '4-6h', '1 día', '2-3 días']
+
+
+def _eleccion(rnd, distribucion):
+    valores, pesos = zip(*distribucion)
+    return rnd.choices(valores, pesos)[0]
+
+def _fecha_entre(rnd, desde, hasta):
+    if hasta <= desde:
+        return desde
+    return desde + timedelta(seconds=rnd.randint(0, int((hasta - desde).total_seconds())))
+
+def _dni(numero):
+    numero %= 100_000_000
+    return f'{numero:08d}{LETRAS_DNI[numero % 23]}'
+
+def _matricula(numero):
+    """Matrícula con formato 0000 BBB; el multiplicador reparte los ids sin repetirlos"""
+    combinaciones = 10_000 * len(CONSONANTES_MATRICULA) ** 3
+    n = numero * 7_919 % combinaciones
+    digitos, letras = n % 10_000, n // 10_000
+    sufijo = ''
+    for _ in range(3):
+        letras, resto = divmod(letras, len(CONSONANTES_MATRICULA))
+        sufijo = CONSONANTES_MATRICULA[resto] + sufijo
+    return f'{digitos:04d}{sufijo}'
+
+def _siguiente_id(modelo):
+    return (db.session.execute(select(func.max(modelo.id))).scalar() or 0) + 1
+
+def _insertar(filas_por_modelo):
+    for modelo, filas in filas_por_modelo:
+        if filas:
+            db.session.execute(insert(modelo.__table__), filas)
+    incrementar_versiones(db.session.connection(), [modelo.__tablename__ for modelo, filas in filas_por_modelo if filas])
+
+
+class _Generador:
+    """Genera filas como dicts con ids asignados aquí, para insertarlas sin RETURNING"""
+    
+    def __init__(self, semilla, referencia):
+        self.rnd = random.Random(semilla)
+        self.referencia = referencia
+        self.inicio = referencia - timedelta(days=DIAS_HISTORICO)
+        self.ids = {}
+    
+    def nuevo_id(self, modelo):
+        if modelo not in self.ids:
+            self.ids[modelo] = _siguiente_id(modelo)
+        valor = self.ids[modelo]
+        self.ids[modelo] += 1
+        return valor
+    
+    def catalogo(self, num_tecnicos, num_proveedores, num_repuestos):
+        rnd = self.rnd
+        tecnicos, especialidades, proveedores, repuestos = [], [], [], []
+        
+        for _ in range(num_tecnicos):
+            id = self.nuevo_id(Tecnico)
+            nombre = f'{rnd.choice(NOMBRES)} {rnd.choice(APELLIDOS)}'
+            tecnicos.append({
+                'id': id, 'nombre': nombre, 'telefono': f'6{rnd.randint(0, 99_999_999):08d}',
+                'email': f'tecnico{id}@taller.com', 'tarifa_hora': float(rnd.choice([28, 30, 32, 35, 38, 42])),
+                'activo': rnd.random() > 0.05, 'fecha_registro': _fecha_entre(rnd, self.inicio, self.referencia)
+            })
+            for especialidad in rnd.sample(ESPECIALIDADES, rnd.randint(1, 3)):
+                especialidades.append({'tecnico_id': id, 'especialidad': especialidad})
+        
+        for _ in range(num_proveedores):
+            id = self.nuevo_id(Proveedor)
+            tipo = 'usado' if rnd.random() < 0.3 else 'nuevo'
+            proveedores.append({
+                'id': id, 'nombre': f'{"Desguace" if tipo == "usado" else "Recambios"} {rnd.choice(APELLIDOS)} {id}',
+                'email': f'ventas{id}@proveedor.com', 'telefono': f'9{rnd.randint(0, 99_999_999):08d}',
+                'tipo': tipo, 'activo': True, 'tiempo_respuesta_promedio': rnd.choice(['1-2h', '2-4h', '4-8h']),
+                'fecha_registro': _fecha_entre(rnd, self.inicio, self.referencia)
+            })
+        
+        for i in range(num_repuestos):
+            nombre, categoria, precio = CATALOGO_REPUESTOS[i % len(CATALOGO_REPUESTOS)]
+            marca = rnd.choice(list(MODELOS))
+            repuestos.append({
+                'id': self.nuevo_id(Repuesto), 'nombre': f'{nombre} {marca}', 'categoria': categoria,
+                'precio_referencia': round(precio * rnd.uniform(0.8, 1.4), 2),
+                'proveedor_preferido_id': rnd.choice(proveedores)['id']
+            })
+        
+        return tecnicos, especialidades, proveedores, repuestos
+    
+    def bloque(self, num_clientes, tecnicos, proveedores, repuestos):
+        """Filas de num_clientes clientes con sus vehículos, diagnósticos, repuestos, citas y facturas"""
+        rnd = self.rnd
+        referencia = self.referencia
+        filas = defaultdict(list)
+        
+        for _ in range(num_clientes):
+            cliente_id = self.nuevo_id(Cliente)
+            nombre, apellido1, apellido2 = rnd.choice(NOMBRES), rnd.choice(APELLIDOS), rnd.choice(APELLIDOS)
+            fecha_cliente = _fecha_entre(rnd, self.inicio, referencia)
+            filas[Cliente].append({
+                'id': cliente_id, 'nombre_completo': f'{nombre} {apellido1} {apellido2}', 'dni': _dni(cliente_id * 7_919 + 10_000_000),
+                'telefono': f'6{rnd.randint(0, 99_999_999):08d}', 'email': f'cliente{cliente_id}@email.com',
+                'direccion': f'{rnd.choice(CALLES)}, {rnd.randint(1, 250)}, {rnd.choice(CIUDADES)}',
+                'persona_contacto': f'{nombre} {apellido1}', 'fecha_registro': fecha_cliente, 'activo': rnd.random() > 0.08
+            })
+            
+            for _ in range(_eleccion(rnd, VEHICULOS_POR_CLIENTE)):
+                self._vehiculo(filas, cliente_id, fecha_cliente, tecnicos, proveedores, repuestos)
+        
+        return filas
+    
+    def _vehiculo(self, filas, cliente_id, fecha_cliente, tecnicos, proveedores, repuestos):
+        rnd = self.rnd
+        vehiculo_id = self.nuevo_id(Vehiculo)
+        marca = rnd.choice(list(MODELOS))
+        matricula = _matricula(vehiculo_id)
+        bastidor = f'{marca[:2].upper()}S{vehiculo_id:014d}'
+        fecha_vehiculo = _fecha_entre(rnd, fecha_cliente, self.referencia)
+        diagnosticos_recientes = 0
+        
+        for _ in range(_eleccion(rnd, DIAGNOSTICOS_POR_VEHICULO)):
+            fecha = _fecha_entre(rnd, fecha_vehiculo, self.referencia)
+            if self._diagnostico(filas, vehiculo_id, fecha, tecnicos, proveedores, repuestos):
+                diagnosticos_recientes += 1
+        
+        estado = 'en_taller' if diagnosticos_recientes else ('inactivo' if rnd.random() < 0.05 else 'activo')
+        filas[Vehiculo].append({
+            'id': vehiculo_id, 'cliente_id': cliente_id, 'marca': marca, 'modelo': rnd.choice(MODELOS[marca]),
+            'año': rnd.randint(2005, self.referencia.year), 'matricula': matricula, 'numero_bastidor': bastidor,
+            'kilometraje': rnd.randint(5_000, 250_000), 'fecha_registro': fecha_vehiculo, 'estado': estado,
+            'matricula_norm': normalizar_identificador(matricula),
+            'bastidor_norm': normalizar_identificador(bastidor),
+            'bastidor_norm_inv': normalizar_identificador(bastidor)[::-1]
+        })
+    
+    def _diagnostico(self, filas, vehiculo_id, fecha, tecnicos, proveedores, repuestos):
+        """Añade un diagnóstico con sus dependencias; devuelve True si sigue abierto"""
+        rnd = self.rnd
+        referencia = self.referencia
+        diagnostico_id = self.nuevo_id(Diagnostico)
+        tecnico = rnd.choice(tecnicos)
+        antiguedad = (referencia - fecha).days
+        
+        if antiguedad > 30:
+            estado = 'cancelado' if rnd.random() < 0.05 else 'completado'
+        else:
+            estado = rnd.choice(['pendiente', 'en_proceso', 'en_proceso', 'completado'])
+        tiempo_estimado = rnd.choice(TIEMPOS_ESTIMADOS)
+        
+        filas[Diagnostico].append({
+            'id': diagnostico_id, 'vehiculo_id': vehiculo_id, 'tecnico_id': tecnico['id'],
+            'descripcion_fallo': rnd.choice(DESCRIPCIONES_FALLO), 'fecha_diagnostico': fecha, 'estado': estado,
+            'prioridad': rnd.choice(['baja', 'media', 'media', 'alta']), 'tiempo_estimado': tiempo_estimado,
+            'costo_estimado': round(rnd.uniform(80, 1200), 2)
+        })
+        
+        detalle_repuestos = []
+        for _ in range(_eleccion(rnd, SOLICITUDES_POR_DIAGNOSTICO)):
+            linea = self._solicitud(filas, diagnostico_id, estado, fecha, proveedores, repuestos)
+            if linea:
+                detalle_repuestos.append(linea)
+        
+        if rnd.random() < 0.7:
+            fecha_hora = (fecha + timedelta(days=rnd.randint(0, 5))).replace(
+                hour=rnd.randint(8, 17), minute=rnd.choice([0, 30]), second=0, microsecond=0
+            )
+            if fecha_hora > referencia:
+                estado_cita = 'programada'
+            else:
+                estado_cita = 'cancelada' if rnd.random() < 0.05 else 'completada'
+            filas[Cita].append({
+                'id': self.nuevo_id(Cita), 'diagnostico_id': diagnostico_id, 'tecnico_id': tecnico['id'],
+                'fecha_hora': fecha_hora, 'duracion_estimada': rnd.choice([60, 120, 180, 240, 480]),
+                'estado': estado_cita, 'tipo': rnd.choice(['reparacion', 'mantenimiento', 'diagnostico']),
+                'fecha_creacion': fecha
+            })
+        
+        if estado == 'completado' and rnd.random() < 0.95:
+            self._factura(filas, diagnostico_id, fecha, tecnico, tiempo_estimado, detalle_repuestos)
+        
+        return estado in ('pendiente', 'en_proceso')
+    
+    def _solicitud(self, filas, diagnostico_id, estado_diagnostico, fecha, proveedores, repuestos):
+        """Añade una solicitud con sus cotizaciones; devuelve su línea de factura o None"""
+        rnd = self.rnd
+        solicitud_id = self.nuevo_id(SolicitudRepuesto)
+        repuesto = rnd.choice(repuestos)
+        cantidad = rnd.randint(1, 4)
+        
+        if estado_diagnostico == 'completado':
+            estado = 'cancelado' if rnd.random() < 0.05 else 'recibido'
+        elif estado_diagnostico == 'cancelado':
+            estado = 'cancelado'
+        else:
+            estado = rnd.choice(['solicitado', 'cotizado', 'pedido'])
+        
+        mejor = None
+        if estado != 'solicitado':
+            for proveedor in rnd.sample(proveedores, min(len(proveedores), rnd.randint(1, 3))):
+                precio = round(repuesto['precio_referencia'] * rnd.uniform(0.6, 1.3), 2)
+                filas[CotizacionRepuesto].append({
+                    'id': self.nuevo_id(CotizacionRepuesto), 'solicitud_id': solicitud_id, 'proveedor_id': proveedor['id'],
+                    'precio': precio, 'tiempo_entrega': rnd.choice(['24h', '48h', '3-5 días']),
+                    'fecha_cotizacion': fecha, 'valida_hasta': fecha + timedelta(days=15)
+                })
+                if mejor is None or precio < mejor[0]:
+                    mejor = (precio, proveedor)
+        
+        filas[SolicitudRepuesto].append({
+            'id': solicitud_id, 'diagnostico_id': diagnostico_id, 'repuesto_id': repuesto['id'], 'cantidad': cantidad,
+            'estado': estado, 'fecha_solicitud': fecha, 'precio_mejor_oferta': mejor[0] if mejor else None,
+            'proveedor_seleccionado_id': mejor[1]['id'] if mejor else None,
+            'tiempo_entrega': rnd.choice(['24h', '48h', '3-5 días']) if mejor else None
+        })
+        
+        if estado == 'cancelado' or not mejor:
+            return None
+        return {
+            'nombre': repuesto['nombre'], 'cantidad': cantidad, 'precio_unitario': mejor[0],
+            'precio': round(cantidad * mejor[0], 2), 'tipo': mejor[1]['tipo']
+        }
+    
+    def _factura(self, filas, diagnostico_id, fecha, tecnico, tiempo_estimado, detalle_repuestos):
+        rnd = self.rnd
+        fecha_emision = min(fecha + timedelta(days=rnd.randint(1, 7), hours=rnd.randint(0, 8)), self.referencia)
+        antiguedad = (self.referencia - fecha_emision).days
+        
+        if antiguedad > 60:
+            estado = 'vencida' if rnd.random() < 0.05 else 'pagada'
+        elif antiguedad > 15:
+            estado = rnd.choice(['pagada', 'pagada', 'enviada', 'vencida'])
+        else:
+            estado = rnd.choice(['borrador', 'enviada', 'enviada'])
+        
+        subtotal_repuestos = margen = 0
+        for linea in detalle_repuestos:
+            porcentaje = MARGEN_USADOS if linea['tipo'] == 'usado' else MARGEN_NUEVOS
+            linea['margen'] = porcentaje
+            linea['precio_final'] = linea['precio'] * (1 + porcentaje / 100)
+            subtotal_repuestos += linea['precio']
+            margen += linea['precio'] * porcentaje / 100
+        
+        horas = horas_estimadas(tiempo_estimado)
+        mano_obra = horas * tecnico['tarifa_hora']
+        iva = (subtotal_repuestos + margen + mano_obra) * IVA_PORCENTAJE / 100
+        
+        filas[Factura].append({
+            'id': self.nuevo_id(Factura), 'diagnostico_id': diagnostico_id, 'fecha_emision': fecha_emision,
+            'fecha_vencimiento': fecha_emision + timedelta(days=30), 'estado': estado,
+            'subtotal_repuestos': subtotal_repuestos, 'margen_repuestos': margen, 'subtotal_mano_obra': mano_obra,
+            'iva': iva, 'total': subtotal_repuestos + margen + mano_obra + iva,
+            'detalle_repuestos': detalle_repuestos,
+            'detalle_mano_obra': [{
+                'descripcion': f'Mano de obra ({tecnico["nombre"]})', 'horas': horas,
+                'tarifa_hora': tecnico['tarifa_hora'], 'total': mano_obra
+            }]
+        })
+
+
+def _numerar_facturas(facturas):
+    """Asigna números reservando un bloque consecutivo por cada serie (año de emisión)"""
+    por_año = defaultdict(list)
+    for factura in sorted(facturas, key=lambda f: (f['fecha_emision'], f['id'])):
+        por_año[factura['fecha_emision'].year].append(factura)
+    for año, grupo in sorted(por_año.items()):
+        numeros = reservar_numeros_factura(len(grupo), grupo[0]['fecha_emision'])
+        for factura, numero in zip(grupo, numeros):
+            factura['numero_factura'] = numero
+
+
+def generar_datos_sinteticos(escala, semilla=42, referencia=None, progreso=None, clientes_por_escala=CLIENTES_POR_ESCALA):
+    """Genera un conjunto de datos realista de escala × clientes_por_escala clientes
+
+    Cada cliente tiene de 1 a 4 vehículos, cada vehículo un historial de
+    diagnósticos repartidos en los últimos DIAS_HISTORICO días, y de ellos
+    cuelgan solicitudes de repuestos con sus cotizaciones, citas y facturas
+    coherentes con el estado y la antigüedad del diagnóstico. Con la misma
+    semilla y fecha de referencia (por defecto hoy a las 00:00) el resultado
+    es idéntico.
+
+    Las filas se añaden a las que ya hubiera, con ids a continuación de los
+    existentes, y se insertan con Core en bloques de BLOQUE_CLIENTES clientes
+    por transacción. Al terminar se recalculan los datos derivados que los
+    INSERT masivos no mantienen: último servicio de cada vehículo, contadores
+    del dashboard y rollup de ingresos. progreso, si se indica, se llama con
+    (clientes generados, total) tras cada bloque. clientes_por_escala permite
+    conjuntos más pequeños que CLIENTES_POR_ESCALA, p. ej. para los tests.
+    """
+    if referencia is None:
+        referencia = datetime.combine(datetime.now().date(), datetime.min.time())
+    generador = _Generador(semilla, referencia)
+    
+    num_clientes = escala * clientes_por_escala
+    tecnicos, especialidades, proveedores, repuestos = generador.catalogo(
+        num_tecnicos=max(3, 4 * escala), num_proveedores=min(max(3, 2 * escala), 200),
+        num_repuestos=min(max(len(CATALOGO_REPUESTOS), 20 * escala), 2000)
+    )
+    tecnicos_activos = [tecnico for tecnico in tecnicos if tecnico['activo']] or tecnicos
+    
+    totales = defaultdict(int)
+    try:
+        _insertar([(Tecnico, tecnicos), (TecnicoEspecialidad, especialidades), (Proveedor, proveedores), (Repuesto, repuestos)])
+        db.session.commit()
+        for modelo, filas in ((Tecnico, tecnicos), (Proveedor, proveedores), (Repuesto, repuestos)):
+            totales[modelo.__tablename__] += len(filas)
+        
+        generados = 0
+        while generados < num_clientes:
+            cantidad = min(BLOQUE_CLIENTES, num_clientes - generados)
+            filas = generador.bloque(cantidad, tecnicos_activos, proveedores, repuestos)
+            _numerar_facturas(filas[Factura])
+            
+            _insertar([
+                (Cliente, filas[Cliente]), (Vehiculo, filas[Vehiculo]), (Diagnostico, filas[Diagnostico]),
+                (SolicitudRepuesto, filas[SolicitudRepuesto]), (CotizacionRepuesto, filas[CotizacionRepuesto]),
+                (Cita, filas[Cita]), (Factura, filas[Factura])
+            ])
+            db.session.commit()
+            
+            for modelo, lista in filas.items():
+                totales[modelo.__tablename__] += len(lista)
+            generados += cantidad
+            if progreso:
+                progreso(generados, num_clientes)
+        
+        recalcular_ultimo_servicio(db.session.connection())
+        incrementar_versiones(db.session.connection(), [Vehiculo.__tablename__])
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    
+    reconciliar_contadores()
+    reconstruir_revenue_rollup()
+    
+    return dict(totales)
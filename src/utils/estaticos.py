@@ -0,0 +1,192 @@
+from flask import Response, request
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+
+try:
+    import brotli
+except ImportError:  # dependencia opcional: sin ella sólo se sirve gzip
+    brotli = None
+
+# Nombres con hash de contenido que genera Vite (index-Dl6bL3vS.js): nunca cambian de contenido
+PATRON_CON_HASH = re.compile(r'-[A-Za-z0-9_-]{8,}\.[a-z0-9]+$')
+
+CACHE_INMUTABLE = 'public, max-age=31536000, immutable'
+# index.html y el resto de ficheros sin hash se revalidan siempre (respuesta 304 si no cambian)
+CACHE_REVALIDAR = 'no-cache'
+
+# Tipos que merece la pena comprimir; las imágenes y fuentes ya van comprimidas
+TIPOS_COMPRIMIBLES = (
+    'text/', 'application/javascript', 'application/json', 'image/svg+xml', 'image/x-icon',
+    'image/vnd.microsoft.icon',
+)
+TAMAÑO_MINIMO_COMPRESION = 1024
+NIVEL_GZIP = 9
+CALIDAD_BROTLI = 9
+
+# Extensiones de las variantes precomprimidas que pueda dejar el build del frontend
+EXTENSIONES_VARIANTE = {'.br': 'br', '.gz': 'gzip'}
+
+# Referencias a otros ficheros dentro de HTML, CSS y JS: "/assets/x.js", './x.css', url(x.woff2)
+PATRON_REFERENCIA = re.compile(r'''["'(]\.?/?((?:assets/)?[\w.-]+\.[a-z0-9]+)["')?#]''')
+
+
+class ArchivoEstatico:
+    """Contenido de un fichero estático y sus variantes comprimidas, con las cabeceras ya calculadas"""
+    
+    __slots__ = ('ruta', 'mimetype', 'contenido', 'variantes', 'etag', 'cache_control')
+    
+    def __init__(self, ruta, contenido):
+        self.ruta = ruta
+        self.contenido = contenido
+        self.mimetype = mimetypes.guess_type(ruta)[0] or 'application/octet-stream'
+        self.variantes = {}
+        # ETag fuerte: el mismo para los mismos bytes en cualquier worker y despliegue
+        self.etag = hashlib.sha256(contenido).hexdigest()[:32]
+        con_hash = ruta.startswith('assets/') and PATRON_CON_HASH.search(ruta)
+        self.cache_control = CACHE_INMUTABLE if con_hash else CACHE_REVALIDAR
+    
+    @property
+    def comprimible(self):
+        return len(self.contenido) >= TAMAÑO_MINIMO_COMPRESION and self.mimetype.startswith(TIPOS_COMPRIMIBLES)
+    
+    def añadir_variante(self, codificacion, datos):
+        # Una variante que no ahorra al menos un 10 % no compensa la descompresión
+        if len(datos) < len(self.contenido) * 0.9:
+            self.variantes[codificacion] = datos
+    
+    def comprimir(self):
+        if not self.comprimible:
+            return
+        if 'gzip' not in self.variantes:
+            self.añadir_variante('gzip', gzip.compress(self.contenido, NIVEL_GZIP, mtime=0))
+        if brotli is not None and 'br' not in self.variantes:
+            self.añadir_variante('br', brotli.compress(self.contenido, quality=CALIDAD_BROTLI))
+    
+    def etag_codificacion(self, codificacion):
+        # Cada representación necesita su propio ETag fuerte
+        return self.etag if codificacion is None else f'{self.etag}-{codificacion}'
+
+
+class ManifiestoEstaticos:
+    """Índice en memoria de la carpeta de estáticos, construido una vez al crear la app
+
+    Se lee cada fichero, se calcula su ETag y se comprimen con gzip (y brotli
+    si está instalado) los que lo merecen; si el build ya dejó un .gz o .br al
+    lado se usa ése. Atender una petición es una búsqueda en un dict, sin
+    tocar el disco. Un build nuevo del frontend requiere reiniciar la app.
+    """
+    
+    def __init__(self, carpeta):
+        self.carpeta = carpeta
+        self.archivos = {}
+        if not os.path.isdir(carpeta):
+            return
+        
+        precomprimidos = []
+        for raiz, _, nombres in os.walk(carpeta):
+            for nombre in nombres:
+                ruta = os.path.relpath(os.path.join(raiz, nombre), carpeta).replace(os.sep, '/')
+                base, extension = os.path.splitext(ruta)
+                if extension in EXTENSIONES_VARIANTE:
+                    precomprimidos.append((base, EXTENSIONES_VARIANTE[extension], ruta))
+                    continue
+                with open(os.path.join(carpeta, ruta), 'rb') as f:
+                    self.archivos[ruta] = ArchivoEstatico(ruta, f.read())
+        
+        for base, codificacion, ruta in precomprimidos:
+            if base in self.archivos:
+                with open(os.path.join(carpeta, ruta), 'rb') as f:
+                    self.archivos[base].añadir_variante(codificacion, f.read())
+        for archivo in self.archivos.values():
+            archivo.comprimir()
+    
+    def get(self, ruta):
+        return self.archivos.get(ruta)
+    
+    def tamaño(self):
+        return sum(
+            len(archivo.contenido) + sum(len(v) for v in archivo.variantes.values())
+            for archivo in self.archivos.values()
+        )
+
+
+def _codificacion_aceptada(archivo):
+    aceptadas = request.accept_encodings
+    for codificacion in ('br', 'gzip'):
+        if codificacion in archivo.variantes and aceptadas[codificacion]:
+            return codificacion
+    return None
+
+
+def servir_estatico(archivo):
+    """Respuesta para un ArchivoEstatico: variante comprimida según Accept-Encoding, ETag y 304"""
+    codificacion = _codificacion_aceptada(archivo)
+    etag = archivo.etag_codificacion(codificacion)
+    
+    # Cualquier representación del mismo contenido sirve para revalidar: la caché del
+    # navegador puede tener la variante gzip y ahora aceptar brotli
+    etags = [archivo.etag_codificacion(c) for c in (None, *archivo.variantes)]
+    if any(request.if_none_match.contains_weak(e) for e in etags):
+        respuesta = Response(status=304)
+    else:
+        cuerpo = archivo.variantes[codificacion] if codificacion else archivo.contenido
+        respuesta = Response(cuerpo, mimetype=archivo.mimetype)
+        if codificacion:
+            respuesta.headers['Content-Encoding'] = codificacion
+    
+    respuesta.set_etag(etag)
+    respuesta.headers['Cache-Control'] = archivo.cache_control
+    if archivo.variantes:
+        respuesta.vary.add('Accept-Encoding')
+    return respuesta
+
+
+def referencias_html(carpeta):
+    """Rutas (relativas a la carpeta) alcanzables desde los .html de la raíz
+
+    Se siguen también las referencias dentro de los CSS y JS alcanzados
+    (chunks importados, fuentes e imágenes), así que el resultado incluye todo
+    lo que puede cargar el frontend publicado.
+    """
+    existentes = set()
+    for raiz, _, nombres in os.walk(carpeta):
+        for nombre in nombres:
+            existentes.add(os.path.relpath(os.path.join(raiz, nombre), carpeta).replace(os.sep, '/'))
+    por_nombre = {}
+    for ruta in existentes:
+        por_nombre.setdefault(os.path.basename(ruta), []).append(ruta)
+    
+    pendientes = [ruta for ruta in existentes if '/' not in ruta and ruta.endswith('.html')]
+    alcanzadas = set(pendientes)
+    while pendientes:
+        ruta = pendientes.pop()
+        if not ruta.endswith(('.html', '.css', '.js', '.mjs')):
+            continue
+        with open(os.path.join(carpeta, ruta), encoding='utf-8', errors='ignore') as f:
+            texto = f.read()
+        for referencia in PATRON_REFERENCIA.findall(texto):
+            for candidata in por_nombre.get(os.path.basename(referencia), []):
+                if candidata not in alcanzadas:
+                    alcanzadas.add(candidata)
+                    pendientes.append(candidata)
+    return alcanzadas
+
+
+def assets_sin_referencias(carpeta):
+    """Ficheros de assets/ que ningún HTML publicado carga, directa o indirectamente"""
+    directorio = os.path.join(carpeta, 'assets')
+    if not os.path.isdir(directorio):
+        return []
+    alcanzadas = referencias_html(carpeta)
+    sobrantes = []
+    for nombre in sorted(os.listdir(directorio)):
+        ruta = f'assets/{nombre}'
+        base, extension = os.path.splitext(ruta)
+        # Las variantes .gz/.br siguen a su original
+        original = base if extension in EXTENSIONES_VARIANTE else ruta
+        if original not in alcanzadas and os.path.isfile(os.path.join(directorio, nombre)):
+            sobrantes.append(ruta)
+    return sobrantes
@@ -0,0 +1,76 @@
+from datetime import date
+from flask import Response, make_response, request
+from functools import wraps
+from src.models.version_tabla import leer_versiones
+from src.utils.cache_respuestas import cache_actual
+import hashlib
+import time
+
+
+def etag_de(endpoint, argumentos_ruta, argumentos_consulta, versiones, ventana=None):
+    """ETag débil de una respuesta a partir de lo único de lo que depende
+
+    Entran el endpoint, los argumentos de la ruta, los de la consulta
+    normalizados (ordenados, con sus valores repetidos), las versiones de las
+    tablas leídas y la fecha del día, porque varias rutas calculan «hoy» o
+    «los últimos N meses». Con ventana (segundos) además cambia cada ventana,
+    para las respuestas con intervalos deslizantes más cortos que un día.
+    """
+    partes = [
+        endpoint,
+        repr(sorted(argumentos_ruta.items())),
+        repr(sorted((clave, sorted(valores)) for clave, valores in argumentos_consulta.lists())),
+        repr(sorted(versiones.items())),
+        date.today().isoformat(),
+    ]
+    if ventana:
+        partes.append(str(int(time.time() // ventana)))
+    return hashlib.sha1('\x1f'.join(partes).encode()).hexdigest()
+
+
+def etag_tablas(*tablas, ventana=None, cache=False):
+    """Decorador de vistas GET: ETag débil a partir de las versiones de las tablas que leen
+
+    Si el If-None-Match de la petición coincide se responde 304 sin ejecutar
+    la vista: la única consulta es la lectura de las versiones por clave
+    primaria. Las respuestas 200 llevan el ETag y Cache-Control: no-cache, de
+    modo que el navegador siempre revalida y sólo descarga si algo cambió.
+
+    Con cache=True el cuerpo de las respuestas 200 se guarda además en la
+    caché de respuestas de la app (src/utils/cache_respuestas.py) con el ETag
+    como clave, así que también los clientes sin copia propia se ahorran la
+    vista mientras no cambie ninguna de las tablas. La cabecera X-Cache
+    indica si la respuesta salió de ella (HIT) o se generó (MISS).
+    """
+    def decorador(vista):
+        @wraps(vista)
+        def envoltura(*args, **kwargs):
+            # Las versiones se leen antes que los datos: lo que devuelva la vista es como
+            # mínimo tan reciente como ellas, y nunca se guarda contenido viejo bajo un ETag nuevo
+            etag = etag_de(request.endpoint, kwargs, request.args, leer_versiones(tablas), ventana)
+            if request.if_none_match.contains_weak(etag):
+                return _con_etag(Response(status=304), etag)
+            
+            almacen = cache_actual() if cache else None
+            guardada = almacen.obtener(request.endpoint, etag) if almacen is not None else None
+            if guardada is not None:
+                cuerpo, mimetype = guardada
+                respuesta = Response(cuerpo, mimetype=mimetype)
+                respuesta.headers['X-Cache'] = 'HIT'
+                return _con_etag(respuesta, etag)
+            
+            respuesta = make_response(vista(*args, **kwargs))
+            if respuesta.status_code != 200:
+                return respuesta
+            if almacen is not None and not respuesta.is_streamed:
+                almacen.guardar(etag, tablas, respuesta.get_data(), respuesta.mimetype)
+                respuesta.headers['X-Cache'] = 'MISS'
+            return _con_etag(respuesta, etag)
+        return envoltura
+    return decorador
+
+
+def _con_etag(respuesta, etag):
+    respuesta.set_etag(etag, weak=True)
+    respuesta.headers['Cache-Control'] = 'no-cache'
+    return respuesta
@@ -0,0 +1,357 @@
+from src.models import db
+from src.models.contador import ajustar_contadores
+from src.models.diagnostico import Diagnostico
+from src.models.factura import Factura, bloquear_numeracion_factura, reservar_numeros_factura
+from src.models.repuesto import Repuesto, SolicitudRepuesto
+from src.models.revenue_rollup import ajustar_rollup, deltas_rollup
+from src.models.tecnico import Tecnico
+from src.models.version_tabla import incrementar_versiones
+from collections import defaultdict
+from datetime import datetime, timedelta
+from sqlalchemy import bindparam, insert, select, update
+from types import SimpleNamespace
+import re
+
+# Estados de factura que todavía se pueden recalcular; pagada y vencida quedan fijas
+ESTADOS_RECALCULABLES = ('borrador', 'enviada')
+
+# Facturas que se leen, calculan y escriben en cada transacción
+RECALCULO_CHUNK = 1000
+
+# Facturas por cada INSERT (executemany) de la generación masiva
+GENERACION_LOTE = 500
+
+# Conversión de tiempo_estimado a horas facturables
+HORAS_POR_DIA = 8
+HORAS_POR_DEFECTO = 1
+
+_PATRON_TIEMPO = re.compile(
+    r'(\d+(?:[.,]\d+)?)(?:\s*-\s*(\d+(?:[.,]\d+)?))?\s*(h|hora|horas|d|día|días|dia|dias|min|minutos)?\b',
+    re.IGNORECASE
+)
+
+def _a_float(valor):
+    try:
+        return float(valor or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+def _calcular_lote(filas, margen_nuevos, margen_usados, iva_porcentaje):
+    """Calcula los importes de un lote de facturas con arrays columnares
+    
+    Replica Factura.calcular_totales(): cada línea de repuestos se aplana en
+    arrays (precio, es_usado, índice de factura) y las sumas por factura se
+    hacen con np.bincount, de modo que el coste en Python es un recorrido de
+    las líneas para extraer sus valores. Devuelve un dict de arrays por factura
+    y el array de precio_final por línea, en el orden de las filas.
+    """
+    # numpy sólo se carga en los recálculos en bloque, no en el arranque de cada worker
+    import numpy as np
+    
+    n = len(filas)
+    precios, usados, indices_rep = [], [], []
+    totales_mo, indices_mo = [], []
+    
+    for i, fila in enumerate(filas):
+        for repuesto in fila.detalle_repuestos or []:
+            precios.append(_a_float(repuesto.get('precio', 0)))
+            usados.append(repuesto.get('tipo', 'nuevo') == 'usado')
+            indices_rep.append(i)
+        for trabajo in fila.detalle_mano_obra or []:
+            totales_mo.append(_a_float(trabajo.get('total', 0)))
+            indices_mo.append(i)
+    
+    precios = np.asarray(precios, dtype=np.float64)
+    indices_rep = np.asarray(indices_rep, dtype=np.intp)
+    margen_pct = np.where(np.asarray(usados, dtype=bool), margen_usados, margen_nuevos).astype(np.float64)
+    margen_linea = precios * (margen_pct / 100)
+    
+    subtotal_repuestos = np.bincount(indices_rep, weights=precios, minlength=n)
+    margen_repuestos = np.bincount(indices_rep, weights=margen_linea, minlength=n)
+    subtotal_mano_obra = np.bincount(
+        np.asarray(indices_mo, dtype=np.intp), weights=np.asarray(totales_mo, dtype=np.float64), minlength=n
+    )
+    
+    subtotal_sin_iva = subtotal_repuestos + margen_repuestos + subtotal_mano_obra
+    iva = subtotal_sin_iva * (iva_porcentaje / 100)
+    
+    importes = {
+        'subtotal_repuestos': subtotal_repuestos,
+        'margen_repuestos': margen_repuestos,
+        'subtotal_mano_obra': subtotal_mano_obra,
+        'iva': iva,
+        'total': subtotal_sin_iva + iva,
+    }
+    return importes, precios + margen_linea
+
+def _detalle_actualizado(detalle, precios_finales, inicio, margen_nuevos, margen_usados):
+    """Copia del detalle de repuestos con precio_final y margen recalculados"""
+    nuevo = []
+    for j, repuesto in enumerate(detalle):
+        repuesto = dict(repuesto)
+        repuesto['precio_final'] = float(precios_finales[inicio + j])
+        repuesto['margen'] = margen_usados if repuesto.get('tipo', 'nuevo') == 'usado' else margen_nuevos
+        nuevo.append(repuesto)
+    return nuevo
+
+def recalcular_facturas(margen_nuevos=20, margen_usados=30, iva_porcentaje=21,
+                        estados=ESTADOS_RECALCULABLES, dry_run=False, chunk=RECALCULO_CHUNK):
+    """Recalcula en bloque los importes de las facturas con los estados indicados
+    
+    Las facturas se recorren por id en lotes de `chunk`: se leen sólo las
+    columnas necesarias con Core, los importes se calculan con NumPy y se
+    escriben con un UPDATE ejecutado como executemany. Como las escrituras no
+    pasan por el ORM, el rollup de ingresos se ajusta aquí con la diferencia de
+    totales; los contadores no dependen de los importes.
+    
+    Cada lote se confirma en su propia transacción, así que un recálculo
+    interrumpido se puede relanzar con los mismos parámetros. Con dry_run=True
+    no se escribe nada y sólo se devuelve el resumen de diferencias.
+
+    Las facturas del lote quedan bloqueadas desde que se leen hasta el commit,
+    para que una edición simultánea no se pierda bajo importes calculados con
+    los datos anteriores: con SELECT ... FOR UPDATE donde el motor lo admite y
+    en SQLite, que bloquea la base de datos entera, escribiendo la versión de
+    la tabla antes de leer el lote.
+    """
+    import numpy as np
+    
+    tabla = Factura.__table__
+    estados = list(estados)
+    bloqueo_previo = not dry_run and db.engine.dialect.name == 'sqlite'
+    
+    consulta = select(
+        tabla.c.id, tabla.c.estado, tabla.c.fecha_emision, tabla.c.fecha_vencimiento,
+        tabla.c.total, tabla.c.detalle_repuestos, tabla.c.detalle_mano_obra
+    ).where(tabla.c.estado.in_(estados)).order_by(tabla.c.id).limit(chunk)
+    if not dry_run and not bloqueo_previo:
+        consulta = consulta.with_for_update()
+    
+    actualizacion = update(tabla).where(tabla.c.id == bindparam('b_id')).values(
+        subtotal_repuestos=bindparam('b_subtotal_repuestos'),
+        margen_repuestos=bindparam('b_margen_repuestos'),
+        subtotal_mano_obra=bindparam('b_subtotal_mano_obra'),
+        iva=bindparam('b_iva'),
+        total=bindparam('b_total'),
+        fecha_vencimiento=bindparam('b_fecha_vencimiento'),
+        detalle_repuestos=bindparam('b_detalle_repuestos'),
+    )
+    
+    resumen = {
+        'facturas': 0,
+        'total_anterior': 0.0,
+        'total_nuevo': 0.0,
+        'por_estado': defaultdict(lambda: {'facturas': 0, 'diferencia': 0.0}),
+    }
+    ultimo_id = 0
+    
+    try:
+        while True:
+            if bloqueo_previo:
+                incrementar_versiones(db.session.connection(), [tabla.name])
+            filas = db.session.execute(consulta.where(tabla.c.id > ultimo_id)).all()
+            if not filas:
+                break
+            ultimo_id = filas[-1].id
+            
+            importes, precios_finales = _calcular_lote(
+                filas, margen_nuevos, margen_usados, iva_porcentaje
+            )
+            anteriores = np.asarray([_a_float(fila.total) for fila in filas])
+            diferencias = importes['total'] - anteriores
+            
+            resumen['facturas'] += len(filas)
+            resumen['total_anterior'] += float(anteriores.sum())
+            resumen['total_nuevo'] += float(importes['total'].sum())
+            
+            parametros = []
+            deltas = defaultdict(lambda: (0, 0))
+            inicio = 0
+            for i, fila in enumerate(filas):
+                por_estado = resumen['por_estado'][fila.estado]
+                por_estado['facturas'] += 1
+                por_estado['diferencia'] += float(diferencias[i])
+                
+                detalle = fila.detalle_repuestos or []
+                if not dry_run:
+                    if fila.fecha_emision and diferencias[i]:
+                        clave = (fila.fecha_emision.year, fila.fecha_emision.month, fila.estado)
+                        deltas[clave] = (deltas[clave][0] + float(diferencias[i]), 0)
+                    
+                    fecha_vencimiento = fila.fecha_vencimiento
+                    if not fecha_vencimiento and fila.fecha_emision:
+                        fecha_vencimiento = fila.fecha_emision + timedelta(days=30)
+                    
+                    parametros.append({
+                        'b_id': fila.id,
+                        'b_subtotal_repuestos': float(importes['subtotal_repuestos'][i]),
+                        'b_margen_repuestos': float(importes['margen_repuestos'][i]),
+                        'b_subtotal_mano_obra': float(importes['subtotal_mano_obra'][i]),
+                        'b_iva': float(importes['iva'][i]),
+                        'b_total': float(importes['total'][i]),
+                        'b_fecha_vencimiento': fecha_vencimiento,
+                        'b_detalle_repuestos': _detalle_actualizado(
+                            detalle, precios_finales, inicio, margen_nuevos, margen_usados
+                        )
+                        if fila.detalle_repuestos is not None else None,
+                    })
+                inicio += len(detalle)
+            
+            if not dry_run:
+                db.session.execute(actualizacion, parametros)
+                ajustar_rollup(db.session.connection(), deltas)
+                if not bloqueo_previo:
+                    incrementar_versiones(db.session.connection(), [tabla.name])
+                db.session.commit()
+    finally:
+        db.session.rollback()
+    
+    resumen['diferencia'] = resumen['total_nuevo'] - resumen['total_anterior']
+    resumen['por_estado'] = dict(resumen['por_estado'])
+    resumen['dry_run'] = dry_run
+    return resumen
+
+
+def horas_estimadas(tiempo_estimado):
+    """Horas de mano de obra a partir de textos como '2-3h', '1 día' o '2-3 días'
+
+    Los rangos se facturan por su punto medio y cada día como HORAS_POR_DIA.
+    Si el texto está vacío o no contiene ningún número se usa HORAS_POR_DEFECTO.
+    """
+    coincidencia = _PATRON_TIEMPO.search(tiempo_estimado or '')
+    if not coincidencia:
+        return HORAS_POR_DEFECTO
+    
+    desde = float(coincidencia.group(1).replace(',', '.'))
+    hasta = float(coincidencia.group(2).replace(',', '.')) if coincidencia.group(2) else desde
+    horas = (desde + hasta) / 2
+    
+    unidad = (coincidencia.group(3) or 'h').lower()
+    if unidad.startswith('d'):
+        horas *= HORAS_POR_DIA
+    elif unidad.startswith('m'):
+        horas /= 60
+    return horas
+
+def _detalles_repuestos(diagnostico_ids):
+    """{diagnostico_id: detalle_repuestos} con las solicitudes no canceladas de esos diagnósticos"""
+    detalles = defaultdict(list)
+    filas = db.session.execute(
+        select(
+            SolicitudRepuesto.diagnostico_id, SolicitudRepuesto.cantidad,
+            SolicitudRepuesto.precio_mejor_oferta, Repuesto.nombre, Repuesto.precio_referencia
+        ).join(
+            Repuesto, Repuesto.id == SolicitudRepuesto.repuesto_id
+        ).where(
+            SolicitudRepuesto.diagnostico_id.in_(diagnostico_ids),
+            SolicitudRepuesto.estado != 'cancelado'
+        ).order_by(SolicitudRepuesto.id)
+    )
+    for fila in filas:
+        precio_unitario = fila.precio_mejor_oferta if fila.precio_mejor_oferta is not None else (fila.precio_referencia or 0)
+        cantidad = fila.cantidad or 1
+        detalles[fila.diagnostico_id].append({
+            'nombre': fila.nombre,
+            'cantidad': cantidad,
+            'precio_unitario': precio_unitario,
+            'precio': cantidad * precio_unitario,
+            'tipo': 'nuevo'
+        })
+    return detalles
+
+def _detalle_mano_obra(pendiente):
+    horas = horas_estimadas(pendiente.tiempo_estimado)
+    tarifa = pendiente.tarifa_hora or 0
+    return [{
+        'descripcion': f'Mano de obra ({pendiente.tecnico_nombre})' if pendiente.tecnico_nombre else 'Mano de obra',
+        'horas': horas,
+        'tarifa_hora': tarifa,
+        'total': horas * tarifa
+    }]
+
+def generar_facturas_pendientes(margen_nuevos=20, margen_usados=30, iva_porcentaje=21,
+                                estado='borrador', limite=None, lote=GENERACION_LOTE):
+    """Crea una factura por cada diagnóstico completado que todavía no tiene ninguna
+
+    Los diagnósticos se eligen con un anti-join contra facturas. El detalle de
+    repuestos sale de sus solicitudes (cantidad × precio_mejor_oferta) y el de
+    mano de obra de tiempo_estimado × tarifa_hora del técnico. Los números se
+    reservan como un único bloque consecutivo y las facturas se insertan con
+    Core en lotes de `lote`, todo en una sola transacción; el rollup de
+    ingresos y los contadores se ajustan en esa misma transacción porque los
+    INSERT no pasan por los listeners del ORM.
+    """
+    fecha_emision = datetime.utcnow()
+    
+    try:
+        # La fila de la secuencia queda bloqueada hasta el commit: dos generaciones
+        # simultáneas se serializan aquí y la segunda ya ve en el anti-join las
+        # facturas creadas por la primera.
+        bloquear_numeracion_factura(fecha_emision)
+        
+        consulta = select(
+            Diagnostico.id, Diagnostico.tiempo_estimado,
+            Tecnico.nombre.label('tecnico_nombre'), Tecnico.tarifa_hora
+        ).outerjoin(
+            Tecnico, Tecnico.id == Diagnostico.tecnico_id
+        ).outerjoin(
+            Factura, Factura.diagnostico_id == Diagnostico.id
+        ).where(
+            Diagnostico.estado == 'completado',
+            Factura.id.is_(None)
+        ).order_by(Diagnostico.id)
+        if limite:
+            consulta = consulta.limit(limite)
+        pendientes = db.session.execute(consulta).all()
+        
+        numeros = reservar_numeros_factura(len(pendientes), fecha_emision) if pendientes else []
+        filas = []
+        
+        for inicio in range(0, len(pendientes), lote):
+            grupo = pendientes[inicio:inicio + lote]
+            repuestos = _detalles_repuestos([pendiente.id for pendiente in grupo])
+            detalles = [
+                SimpleNamespace(detalle_repuestos=repuestos.get(pendiente.id, []), detalle_mano_obra=_detalle_mano_obra(pendiente))
+                for pendiente in grupo
+            ]
+            importes, precios_finales = _calcular_lote(detalles, margen_nuevos, margen_usados, iva_porcentaje)
+            
+            grupo_filas = []
+            posicion = 0
+            for i, (pendiente, detalle) in enumerate(zip(grupo, detalles)):
+                grupo_filas.append({
+                    'numero_factura': numeros[inicio + i],
+                    'diagnostico_id': pendiente.id,
+                    'fecha_emision': fecha_emision,
+                    'fecha_vencimiento': fecha_emision + timedelta(days=30),
+                    'estado': estado,
+                    'subtotal_repuestos': float(importes['subtotal_repuestos'][i]),
+                    'margen_repuestos': float(importes['margen_repuestos'][i]),
+                    'subtotal_mano_obra': float(importes['subtotal_mano_obra'][i]),
+                    'iva': float(importes['iva'][i]),
+                    'total': float(importes['total'][i]),
+                    'detalle_repuestos': _detalle_actualizado(
+                        detalle.detalle_repuestos, precios_finales, posicion, margen_nuevos, margen_usados
+                    ),
+                    'detalle_mano_obra': detalle.detalle_mano_obra
+                })
+                posicion += len(detalle.detalle_repuestos)
+            
+            db.session.execute(insert(Factura.__table__), grupo_filas)
+            filas.extend(grupo_filas)
+        
+        connection = db.session.connection()
+        ajustar_rollup(connection, deltas_rollup(filas))
+        ajustar_contadores(connection, Factura, filas)
+        incrementar_versiones(connection, [Factura.__tablename__])
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    
+    return {
+        'facturas': len(filas),
+        'total': sum(fila['total'] for fila in filas),
+        'primer_numero': numeros[0] if numeros else None,
+        'ultimo_numero': numeros[-1] if numeros else None
+    }
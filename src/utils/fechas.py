@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta, timezone
+
+
+def parse_rango_fechas(desde, hasta):
+    """Convierte los parámetros ?desde=&hasta= en un intervalo semiabierto [inicio, fin)
+
+    Ambos aceptan una fecha (YYYY-MM-DD) o una fecha y hora ISO 8601. Cuando
+    hasta es sólo una fecha se incluye el día completo. Los valores con zona
+    horaria se pasan a UTC sin zona, como se guardan las fechas en la base de
+    datos, para poder compararlos con los que no la llevan. Devolver límites
+    semiabiertos permite filtrar con columna >= inicio AND columna < fin, que
+    el motor resuelve con un rango sobre el índice de la columna en lugar de
+    aplicar una función a cada fila. Lanza ValueError si el formato no es
+    válido o el rango está invertido.
+    """
+    inicio = _parse_fecha(desde, 'desde') if desde else None
+    fin = None
+    if hasta:
+        fin = _parse_fecha(hasta, 'hasta')
+        if len(hasta) == 10:
+            fin = fin + timedelta(days=1)
+
+    if inicio and fin and inicio >= fin:
+        raise ValueError('El parámetro desde debe ser anterior a hasta')
+
+    return inicio, fin
+
+
+def _parse_fecha(valor, nombre):
+    try:
+        fecha = datetime.fromisoformat(valor)
+    except ValueError:
+        raise ValueError(f'Fecha inválida en el parámetro {nombre}: {valor}')
+    if fecha.tzinfo is not None:
+        fecha = fecha.astimezone(timezone.utc).replace(tzinfo=None)
+    return fecha
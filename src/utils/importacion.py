@@ -0,0 +1,276 @@
+from src.models import db
+from src.models.cliente import Cliente
+from src.models.contador import ajustar_contadores
+from src.models.vehiculo import Vehiculo, normalizar_identificador
+from src.models.version_tabla import incrementar_versiones
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+import csv
+import io
+import json
+
+FORMATOS_IMPORTACION = ('ndjson', 'csv')
+
+# Filas insertadas (executemany) y confirmadas en cada transacción
+IMPORT_CHUNK = 1000
+
+# Errores detallados que se incluyen en el informe; el resto sólo se cuentan
+MAX_ERRORES_INFORME = 1000
+
+CAMPOS_CLIENTE = ['nombre_completo', 'dni', 'telefono', 'email', 'direccion', 'persona_contacto']
+CAMPOS_VEHICULO = ['marca', 'modelo', 'año', 'matricula', 'numero_bastidor', 'kilometraje']
+ESTADOS_VEHICULO = ('activo', 'en_taller', 'inactivo')
+
+
+class ErrorFila(ValueError):
+    pass
+
+
+def leer_registros(stream, formato):
+    """Genera (número de línea, dict) leyendo el flujo binario poco a poco
+
+    En CSV la primera línea es la cabecera con los nombres de los campos. Las
+    líneas que no se pueden decodificar se devuelven como (línea, ErrorFila)
+    para que el llamador las anote sin interrumpir la importación.
+    """
+    texto = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    
+    if formato == 'csv':
+        lector = csv.DictReader(texto)
+        for registro in lector:
+            if None in registro:
+                yield lector.line_num, ErrorFila('La fila tiene más columnas que la cabecera')
+            else:
+                yield lector.line_num, registro
+        return
+    
+    for numero, linea in enumerate(texto, start=1):
+        if not linea.strip():
+            continue
+        try:
+            registro = json.loads(linea)
+        except ValueError as e:
+            yield numero, ErrorFila(f'JSON inválido: {e}')
+            continue
+        if not isinstance(registro, dict):
+            yield numero, ErrorFila('Cada línea debe ser un objeto JSON')
+        else:
+            yield numero, registro
+
+
+def origen_importacion(request):
+    """Flujo binario y formato de una petición de importación
+
+    El fichero puede llegar en el campo 'file' de un formulario multipart o
+    directamente como cuerpo de la petición. El formato se toma de ?format=,
+    de la extensión del fichero o del Content-Type, por ese orden.
+    """
+    archivo = request.files.get('file')
+    formato = request.args.get('format')
+    
+    if not formato:
+        nombre = (archivo.filename if archivo else '') or ''
+        tipo = (archivo.mimetype if archivo else request.mimetype) or ''
+        formato = 'csv' if nombre.lower().endswith('.csv') or tipo == 'text/csv' else 'ndjson'
+    
+    if formato not in FORMATOS_IMPORTACION:
+        raise ValueError('Formato no soportado, use ndjson o csv')
+    
+    return (archivo.stream if archivo else request.stream), formato
+
+
+def _texto(registro, campo):
+    valor = registro.get(campo)
+    if valor is None:
+        return ''
+    return str(valor).strip()
+
+def _entero(registro, campo):
+    try:
+        return int(registro[campo])
+    except (TypeError, ValueError):
+        raise ErrorFila(f'Campo {campo} debe ser un número entero')
+
+def _booleano(valor):
+    if isinstance(valor, bool):
+        return valor
+    return str(valor).strip().lower() not in ('0', 'false', 'no', 'n', '')
+
+def _requeridos(registro, campos):
+    for campo in campos:
+        if not _texto(registro, campo):
+            raise ErrorFila(f'Campo {campo} es requerido')
+
+
+class _Importacion:
+    """Acumula filas válidas, las inserta por lotes y lleva el informe de errores"""
+    
+    def __init__(self, modelo, chunk):
+        self.modelo = modelo
+        self.chunk = chunk
+        self.pendientes = []
+        self.importados = 0
+        self.procesados = 0
+        self.errores = []
+        self.num_errores = 0
+    
+    def error(self, linea, mensaje):
+        self.num_errores += 1
+        if len(self.errores) < MAX_ERRORES_INFORME:
+            self.errores.append({'linea': linea, 'error': mensaje})
+    
+    def añadir(self, linea, fila):
+        self.pendientes.append((linea, fila))
+        if len(self.pendientes) >= self.chunk:
+            self.volcar()
+    
+    def _insertar(self, filas):
+        db.session.execute(insert(self.modelo.__table__), filas)
+        ajustar_contadores(db.session.connection(), self.modelo, filas)
+        incrementar_versiones(db.session.connection(), [self.modelo.__tablename__])
+        db.session.commit()
+    
+    def volcar(self):
+        if not self.pendientes:
+            return
+        pendientes, self.pendientes = self.pendientes, []
+        
+        try:
+            self._insertar([fila for _, fila in pendientes])
+            self.importados += len(pendientes)
+        except IntegrityError:
+            # Otra escritura concurrente ha ocupado alguna clave entre la precarga y el
+            # INSERT: se repite el lote fila a fila para aislar las que fallan
+            db.session.rollback()
+            for linea, fila in pendientes:
+                try:
+                    self._insertar([fila])
+                    self.importados += 1
+                except IntegrityError as e:
+                    db.session.rollback()
+                    self.error(linea, f'Registro duplicado: {e.orig}')
+    
+    def informe(self):
+        return {
+            'procesados': self.procesados,
+            'importados': self.importados,
+            'errores': self.num_errores,
+            'detalle_errores': self.errores
+        }
+
+
+def importar_clientes(registros, chunk=IMPORT_CHUNK):
+    """Importa clientes desde (línea, dict) de leer_registros()
+
+    Los DNI existentes se precargan en un conjunto, así que validar cada fila
+    no cuesta ninguna consulta. Las filas erróneas o duplicadas se anotan en el
+    informe y el resto se inserta en lotes de `chunk` confirmados por separado.
+    """
+    importacion = _Importacion(Cliente, chunk)
+    dnis = set(db.session.execute(select(Cliente.dni)).scalars())
+    
+    try:
+        for linea, registro in registros:
+            importacion.procesados += 1
+            try:
+                if isinstance(registro, ErrorFila):
+                    raise registro
+                _requeridos(registro, CAMPOS_CLIENTE)
+                
+                dni = _texto(registro, 'dni')
+                if dni in dnis:
+                    raise ErrorFila('Ya existe un cliente con este DNI')
+                
+                fila = {campo: _texto(registro, campo) for campo in CAMPOS_CLIENTE}
+                fila['activo'] = _booleano(registro['activo']) if _texto(registro, 'activo') else True
+            except ErrorFila as e:
+                importacion.error(linea, str(e))
+                continue
+            
+            dnis.add(dni)
+            importacion.añadir(linea, fila)
+        
+        importacion.volcar()
+    finally:
+        db.session.rollback()
+    
+    return importacion.informe()
+
+
+def importar_vehiculos(registros, chunk=IMPORT_CHUNK):
+    """Importa vehículos desde (línea, dict) de leer_registros()
+
+    El cliente se indica con cliente_id o con cliente_dni. Matrículas,
+    bastidores y clientes existentes se precargan en memoria en lugar de
+    consultarlos fila a fila, y las columnas normalizadas se calculan aquí
+    porque los INSERT con Core no pasan por los @validates del modelo.
+    """
+    importacion = _Importacion(Vehiculo, chunk)
+    clientes_por_dni = dict(db.session.execute(select(Cliente.dni, Cliente.id)).all())
+    cliente_ids = set(clientes_por_dni.values())
+    matriculas = set(db.session.execute(select(Vehiculo.matricula)).scalars())
+    bastidores = set(db.session.execute(select(Vehiculo.numero_bastidor)).scalars())
+    
+    try:
+        for linea, registro in registros:
+            importacion.procesados += 1
+            try:
+                if isinstance(registro, ErrorFila):
+                    raise registro
+                _requeridos(registro, CAMPOS_VEHICULO)
+                
+                if _texto(registro, 'cliente_dni'):
+                    cliente_id = clientes_por_dni.get(_texto(registro, 'cliente_dni'))
+                elif _texto(registro, 'cliente_id'):
+                    cliente_id = _entero(registro, 'cliente_id')
+                    if cliente_id not in cliente_ids:
+                        cliente_id = None
+                else:
+                    raise ErrorFila('Campo cliente_id o cliente_dni es requerido')
+                if cliente_id is None:
+                    raise ErrorFila('Cliente no encontrado')
+                
+                matricula = _texto(registro, 'matricula')
+                numero_bastidor = _texto(registro, 'numero_bastidor')
+                if matricula in matriculas:
+                    raise ErrorFila('Ya existe un vehículo con esta matrícula')
+                if numero_bastidor in bastidores:
+                    raise ErrorFila('Ya existe un vehículo con este número de bastidor')
+                
+                estado = _texto(registro, 'estado') or 'activo'
+                if estado not in ESTADOS_VEHICULO:
+                    raise ErrorFila(f'Estado {estado} no válido')
+                
+                bastidor_norm = normalizar_identificador(numero_bastidor)
+                fila = {
+                    'cliente_id': cliente_id,
+                    'marca': _texto(registro, 'marca'),
+                    'modelo': _texto(registro, 'modelo'),
+                    'año': _entero(registro, 'año'),
+                    'matricula': matricula,
+                    'numero_bastidor': numero_bastidor,
+                    'kilometraje': _entero(registro, 'kilometraje'),
+                    'estado': estado,
+                    'matricula_norm': normalizar_identificador(matricula),
+                    'bastidor_norm': bastidor_norm,
+                    'bastidor_norm_inv': bastidor_norm[::-1]
+                }
+            except ErrorFila as e:
+                importacion.error(linea, str(e))
+                continue
+            
+            matriculas.add(matricula)
+            bastidores.add(numero_bastidor)
+            importacion.añadir(linea, fila)
+        
+        importacion.volcar()
+    finally:
+        db.session.rollback()
+    
+    return importacion.informe()
+
+
+IMPORTADORES = {
+    'clientes': importar_clientes,
+    'vehiculos': importar_vehiculos
+}
@@ -0,0 +1,43 @@
+from src.models.cliente import Cliente
+from src.models.contador import Contador, reconciliar_contadores
+from src.models.factura import Factura
+from src.models.revenue_rollup import RevenueRollup, reconstruir_revenue_rollup
+from src.utils.busqueda import crear_indices_busqueda
+from src.utils.schema import actualizar_esquema
+
+
+def migrar_base_datos():
+    """Pone el esquema al día: tablas, columnas e índices nuevos, índices FTS y migraciones de datos
+
+    Es idempotente. Devuelve los nombres de las migraciones de datos aplicadas.
+    """
+    aplicadas = actualizar_esquema()
+    crear_indices_busqueda()
+    return aplicadas
+
+
+def inicializar_base_datos():
+    """Esquema al día y estado derivado (contadores del dashboard, rollup de ingresos) creado
+
+    Es lo que create_app() hacía en cada arranque de cada worker; ahora se
+    ejecuta una vez por despliegue con `flask init-db`.
+    """
+    aplicadas = migrar_base_datos()
+    if not Contador.query.first():
+        reconciliar_contadores()
+    if not RevenueRollup.query.first() and Factura.query.first():
+        reconstruir_revenue_rollup()
+    return aplicadas
+
+
+def sembrar_datos_ejemplo():
+    """Crea los datos de ejemplo si la base de datos no tiene clientes; devuelve si los ha creado"""
+    # El módulo de datos de ejemplo no se carga en los workers, sólo al sembrar
+    from src.utils.seed_data import create_sample_data
+    
+    if Cliente.query.first():
+        return False
+    create_sample_data()
+    reconciliar_contadores()
+    reconstruir_revenue_rollup()
+    return True
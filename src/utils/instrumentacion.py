@@ -0,0 +1,202 @@
+from flask import g, has_request_context, request, request_finished, request_started
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event
+from src.models import db
+import heapq
+import threading
+import time
+
+# Límites superiores (le) de los histogramas, en segundos y en número de sentencias
+BUCKETS_SEGUNDOS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BUCKETS_CONSULTAS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+# Sentencias más lentas que se conservan por petición y longitud máxima de su texto
+CONSULTAS_LENTAS_POR_PETICION = 3
+LONGITUD_SENTENCIA = 300
+
+
+class MedidaPeticion:
+    """Lo que ha hecho la base de datos durante una petición"""
+    
+    __slots__ = ('inicio', 'consultas', 'tiempo_db', 'tiempo_serializacion', 'lentas')
+    
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.consultas = 0
+        self.tiempo_db = 0.0
+        self.tiempo_serializacion = 0.0
+        self.lentas = []
+    
+    def anotar(self, sentencia, duracion):
+        self.consultas += 1
+        self.tiempo_db += duracion
+        # Montículo de mínimos con las N más lentas: la más rápida de ellas sale primero
+        entrada = (duracion, self.consultas, sentencia)
+        if len(self.lentas) < CONSULTAS_LENTAS_POR_PETICION:
+            heapq.heappush(self.lentas, entrada)
+        elif duracion > self.lentas[0][0]:
+            heapq.heapreplace(self.lentas, entrada)
+    
+    def mas_lentas(self):
+        return [
+            {'ms': round(duracion * 1000, 2), 'sql': ' '.join(sentencia.split())[:LONGITUD_SENTENCIA]}
+            for duracion, _, sentencia in sorted(self.lentas, reverse=True)
+        ]
+
+
+def _medida_actual():
+    if not has_request_context():
+        return None
+    return g.get('_medida_sql')
+
+
+class Histograma:
+    """Histograma acumulativo al estilo Prometheus para un conjunto de etiquetas"""
+    
+    __slots__ = ('buckets', 'cuentas', 'suma', 'total')
+    
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.cuentas = [0] * len(buckets)
+        self.suma = 0.0
+        self.total = 0
+    
+    def observar(self, valor):
+        self.suma += valor
+        self.total += 1
+        for i, limite in enumerate(self.buckets):
+            if valor <= limite:
+                self.cuentas[i] += 1
+                break
+
+
+class RegistroMetricas:
+    """Histogramas por endpoint acumulados en memoria del proceso
+
+    Con varios workers de gunicorn cada proceso tiene su propio registro, igual
+    que con el cliente oficial de Prometheus sin modo multiproceso.
+    """
+    
+    METRICAS = (
+        ('taller_http_duracion_segundos', 'Duración de la petición HTTP', BUCKETS_SEGUNDOS),
+        ('taller_db_duracion_segundos', 'Tiempo en la base de datos por petición', BUCKETS_SEGUNDOS),
+        ('taller_db_consultas', 'Sentencias SQL por petición', BUCKETS_CONSULTAS),
+        ('taller_serializacion_segundos', 'Tiempo de serialización JSON por petición', BUCKETS_SEGUNDOS),
+    )
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series = {nombre: {} for nombre, _, _ in self.METRICAS}
+        self._buckets = {nombre: buckets for nombre, _, buckets in self.METRICAS}
+    
+    def observar(self, etiquetas, valores):
+        with self._lock:
+            for nombre, valor in valores.items():
+                serie = self._series[nombre].get(etiquetas)
+                if serie is None:
+                    serie = self._series[nombre][etiquetas] = Histograma(self._buckets[nombre])
+                serie.observar(valor)
+    
+    def exportar(self):
+        """Texto en formato de exposición de Prometheus (text/plain; version=0.0.4)"""
+        lineas = []
+        with self._lock:
+            for nombre, ayuda, _ in self.METRICAS:
+                lineas.append(f'# HELP {nombre} {ayuda}')
+                lineas.append(f'# TYPE {nombre} histogram')
+                for (endpoint, metodo), serie in sorted(self._series[nombre].items()):
+                    etiquetas = f'endpoint="{_escapar(endpoint)}",method="{metodo}"'
+                    acumulado = 0
+                    for limite, cuenta in zip(serie.buckets, serie.cuentas):
+                        acumulado += cuenta
+                        lineas.append(f'{nombre}_bucket{{{etiquetas},le="{limite}"}} {acumulado}')
+                    lineas.append(f'{nombre}_bucket{{{etiquetas},le="+Inf"}} {serie.total}')
+                    lineas.append(f'{nombre}_sum{{{etiquetas}}} {serie.suma:.6f}')
+                    lineas.append(f'{nombre}_count{{{etiquetas}}} {serie.total}')
+        return '\n'.join(lineas) + '\n'
+
+
+def _escapar(valor):
+    return valor.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+registro_metricas = RegistroMetricas()
+
+
+class ProveedorJSONMedido(DefaultJSONProvider):
+    """Proveedor JSON de Flask que suma a la petición el tiempo de jsonify()"""
+    
+    def response(self, *args, **kwargs):
+        inicio = time.perf_counter()
+        try:
+            return super().response(*args, **kwargs)
+        finally:
+            medida = _medida_actual()
+            if medida is not None:
+                medida.tiempo_serializacion += time.perf_counter() - inicio
+
+
+def _antes_de_sentencia(conn, cursor, statement, parameters, context, executemany):
+    # En el contexto de ejecución y no en la conexión: si la sentencia falla no queda nada pendiente
+    context._instrumentacion_inicio = time.perf_counter()
+
+
+def _despues_de_sentencia(conn, cursor, statement, parameters, context, executemany):
+    medida = _medida_actual()
+    if medida is not None:
+        medida.anotar(statement, time.perf_counter() - context._instrumentacion_inicio)
+
+
+def _al_empezar_peticion(app, **extra):
+    g._medida_sql = MedidaPeticion()
+
+
+def _al_terminar_peticion(app, response, **extra):
+    medida = g.pop('_medida_sql', None)
+    if medida is None:
+        return
+    total = time.perf_counter() - medida.inicio
+    
+    response.headers['X-Query-Count'] = str(medida.consultas)
+    response.headers['Server-Timing'] = ', '.join([
+        f'db;dur={medida.tiempo_db * 1000:.2f};desc="{medida.consultas} consultas"',
+        f'serializacion;dur={medida.tiempo_serializacion * 1000:.2f}',
+        f'total;dur={total * 1000:.2f}',
+    ])
+    
+    # Sólo las rutas registradas: las URL desconocidas no crean series nuevas
+    endpoint = request.url_rule.rule if request.url_rule else 'sin_ruta'
+    registro_metricas.observar((endpoint, request.method), {
+        'taller_http_duracion_segundos': total,
+        'taller_db_duracion_segundos': medida.tiempo_db,
+        'taller_db_consultas': medida.consultas,
+        'taller_serializacion_segundos': medida.tiempo_serializacion,
+    })
+    
+    umbral = app.config['INSTRUMENTACION_SQL_LENTA_MS']
+    if umbral and total * 1000 >= umbral:
+        app.logger.warning(
+            'Petición lenta %s %s: %.1f ms, %d consultas, %.1f ms en BD; más lentas: %s',
+            request.method, request.path, total * 1000, medida.consultas,
+            medida.tiempo_db * 1000, medida.mas_lentas()
+        )
+
+
+def iniciar_instrumentacion(app):
+    """Engancha la medición de SQL por petición a la app y a su engine
+
+    Sólo se llama con INSTRUMENTACION_SQL activado: desactivada no queda
+    ningún listener ni señal registrados y el coste es nulo. Las respuestas
+    en streaming (exportaciones) envían las cabeceras antes de generar el
+    cuerpo, así que sólo reflejan las consultas hechas hasta ese momento.
+    El tiempo de BD cubre la ejecución de cada sentencia: con SQLite las filas
+    se leen después, al recorrer el resultado, y cuentan como tiempo de la app.
+    """
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', _antes_de_sentencia)
+    event.listen(engine, 'after_cursor_execute', _despues_de_sentencia)
+    
+    request_started.connect(_al_empezar_peticion, app)
+    request_finished.connect(_al_terminar_peticion, app)
+    app.json = ProveedorJSONMedido(app)
@@ -0,0 +1,150 @@
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from src.models import db
+import os
+import re
+import time
+
+URI_POR_DEFECTO = 'sqlite:///taller.db'
+
+# Pragmas que se aplican a cada conexión SQLite nueva, en este orden (busy_timeout
+# primero para que el cambio de journal_mode espere a los bloqueos en lugar de fallar).
+# Con WAL los lectores no se bloquean mientras otro proceso escribe y
+# synchronous=NORMAL sólo sincroniza el disco en los checkpoints del WAL.
+PRAGMAS_SQLITE = {
+    'busy_timeout': 5000,       # ms esperando un bloqueo antes de "database is locked"
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -20000,       # negativo = KiB: 20 MB de caché de páginas por conexión
+    'mmap_size': 268435456,     # 256 MB leídos mediante mmap
+    'temp_store': 'MEMORY',
+}
+
+# Opciones del pool de SQLAlchemy que se pueden fijar por variable de entorno
+OPCIONES_POOL = {
+    'DB_POOL_SIZE': 'pool_size',
+    'DB_MAX_OVERFLOW': 'max_overflow',
+    'DB_POOL_RECYCLE': 'pool_recycle',
+    'DB_POOL_TIMEOUT': 'pool_timeout',
+}
+
+# Instrucciones de la VM de SQLite entre comprobaciones del límite de duración
+PASOS_COMPROBACION_SQLITE = 1000
+
+_VALOR_PRAGMA = re.compile(r'^-?\w+$')
+
+
+def _entero(entorno, nombre):
+    valor = entorno.get(nombre)
+    if valor in (None, ''):
+        return None
+    return int(valor)
+
+
+def configuracion_base_datos(entorno=None):
+    """Claves de app.config de la base de datos a partir de variables de entorno
+
+    - DATABASE_URL: URI de SQLAlchemy (por defecto sqlite:///taller.db). Se
+      acepta el esquema postgres:// que publican Render y Heroku.
+    - DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE, DB_POOL_TIMEOUT: pool.
+    - DB_STATEMENT_TIMEOUT_MS: duración máxima de una sentencia (0 = sin límite).
+    - SQLITE_BUSY_TIMEOUT, SQLITE_JOURNAL_MODE, SQLITE_SYNCHRONOUS,
+      SQLITE_CACHE_SIZE, SQLITE_MMAP_SIZE, SQLITE_TEMP_STORE: sustituyen el
+      valor de PRAGMAS_SQLITE correspondiente.
+    """
+    entorno = os.environ if entorno is None else entorno
+    
+    uri = entorno.get('DATABASE_URL') or URI_POR_DEFECTO
+    if uri.startswith('postgres://'):
+        uri = 'postgresql://' + uri[len('postgres://'):]
+    
+    opciones = {}
+    for variable, opcion in OPCIONES_POOL.items():
+        valor = _entero(entorno, variable)
+        if valor is not None:
+            opciones[opcion] = valor
+    if make_url(uri).get_backend_name() != 'sqlite':
+        # Las conexiones de red que el servidor ha cerrado se detectan antes de usarlas
+        opciones['pool_pre_ping'] = True
+    
+    pragmas = {
+        nombre: entorno.get(f'SQLITE_{nombre.upper()}') or valor
+        for nombre, valor in PRAGMAS_SQLITE.items()
+    }
+    
+    return {
+        'SQLALCHEMY_DATABASE_URI': uri,
+        'SQLALCHEMY_ENGINE_OPTIONS': opciones,
+        'DB_STATEMENT_TIMEOUT_MS': _entero(entorno, 'DB_STATEMENT_TIMEOUT_MS') or 0,
+        'SQLITE_PRAGMAS': pragmas,
+    }
+
+
+def _aplicar_pragmas(dbapi_connection, pragmas):
+    cursor = dbapi_connection.cursor()
+    try:
+        for nombre, valor in pragmas.items():
+            if not _VALOR_PRAGMA.match(str(valor)):
+                raise ValueError(f'Valor no válido para PRAGMA {nombre}: {valor!r}')
+            cursor.execute(f'PRAGMA {nombre} = {valor}')
+    finally:
+        cursor.close()
+
+
+def _limitar_duracion_sqlite(engine, limite_ms):
+    """Interrumpe las sentencias de SQLite que superan limite_ms
+
+    SQLite no tiene statement_timeout: un progress handler comprueba cada
+    PASOS_COMPROBACION_SQLITE instrucciones si la sentencia en curso ha
+    superado su plazo y, si es así, la aborta con OperationalError
+    ("interrupted"). El plazo cubre la ejecución hasta la primera fila.
+    """
+    limite = limite_ms / 1000
+    
+    @event.listens_for(engine, 'connect')
+    def instalar(dbapi_connection, connection_record):
+        info = connection_record.info
+        dbapi_connection.set_progress_handler(
+            lambda: time.perf_counter() > info.get('plazo_sentencia', float('inf')),
+            PASOS_COMPROBACION_SQLITE
+        )
+    
+    @event.listens_for(engine, 'before_cursor_execute')
+    def abrir_plazo(conn, cursor, statement, parameters, context, executemany):
+        conn.info['plazo_sentencia'] = time.perf_counter() + limite
+    
+    @event.listens_for(engine, 'after_cursor_execute')
+    def cerrar_plazo(conn, cursor, statement, parameters, context, executemany):
+        conn.info.pop('plazo_sentencia', None)
+
+
+def configurar_motor(app):
+    """Ajustes por conexión del engine de la app según su dialecto
+
+    Se llama justo después de db.init_app(), antes de abrir ninguna conexión,
+    para que todas reciban los pragmas (SQLite) o el statement_timeout
+    (PostgreSQL). También rechaza las opciones que el dialecto no admite.
+    """
+    with app.app_context():
+        engine = db.engine
+    limite_ms = app.config.get('DB_STATEMENT_TIMEOUT_MS') or 0
+    
+    if engine.dialect.name == 'sqlite':
+        # siguiente_valor_bloque() reserva en otra conexión: con SQLite esperaría al bloqueo de escritura de la sesión
+        if app.config.get('FACTURA_BLOQUE_NUMEROS', 1) > 1:
+            raise ValueError('FACTURA_BLOQUE_NUMEROS > 1 no está soportado con SQLite')
+        pragmas = app.config.get('SQLITE_PRAGMAS') or {}
+        if pragmas:
+            event.listen(engine, 'connect', lambda dbapi_connection, _: _aplicar_pragmas(dbapi_connection, pragmas))
+        if limite_ms:
+            _limitar_duracion_sqlite(engine, limite_ms)
+    
+    elif engine.dialect.name == 'postgresql' and limite_ms:
+        @event.listens_for(engine, 'connect')
+        def fijar_statement_timeout(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute(f'SET statement_timeout = {int(limite_ms)}')
+            cursor.close()
+            dbapi_connection.commit()
+    
+    return engine
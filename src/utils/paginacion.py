@@ -0,0 +1,98 @@
+import base64
+import json
+from datetime import datetime
+
+from src.models import db
+
+# Tamaño de página admitido en los listados paginados (por offset o por cursor)
+MAX_PER_PAGE = 200
+
+
+def parametros_paginacion(args, per_page=50):
+    """Devuelve (page, per_page) de los argumentos de la petición; lanza ValueError si no son válidos"""
+    try:
+        page = int(args.get('page', 1))
+        per_page = int(args.get('per_page', per_page))
+    except ValueError:
+        raise ValueError('Los parámetros page y per_page deben ser enteros')
+    if page < 1:
+        raise ValueError('El parámetro page debe ser mayor que 0')
+    if not 1 <= per_page <= MAX_PER_PAGE:
+        raise ValueError(f'El parámetro per_page debe estar entre 1 y {MAX_PER_PAGE}')
+    return page, per_page
+
+
+def codificar_cursor(fecha, id):
+    """Codifica la clave (fecha, id) de la última fila devuelta en un cursor opaco"""
+    payload = json.dumps([fecha.isoformat() if fecha else None, id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decodificar_cursor(cursor):
+    """Devuelve la tupla (fecha, id) de un cursor; lanza ValueError si no es válido"""
+    try:
+        relleno = '=' * (-len(cursor) % 4)
+        fecha, id = json.loads(base64.urlsafe_b64decode(cursor + relleno))
+        return (datetime.fromisoformat(fecha) if fecha else None), int(id)
+    except (TypeError, ValueError) as e:
+        raise ValueError('Cursor inválido') from e
+
+
+def paginar_por_cursor(query, columna_fecha, columna_id, cursor, per_page, con_total=False):
+    """Paginación por clave (keyset) ordenada por (fecha, id) descendente
+
+    En lugar de OFFSET se filtran las filas estrictamente posteriores a la
+    última clave entregada, lo que permite recorrer el índice compuesto
+    (fecha, id) desde ese punto sin importar lo profunda que sea la página.
+    El COUNT(*) sólo se ejecuta si se pide explícitamente con con_total.
+
+    Las filas sin fecha van al final, ordenadas por id descendente: cuando se
+    agotan las fechadas la misma página se completa con ellas (una consulta
+    más, sólo en esa página) y su cursor lleva fecha None. Una comparación
+    fecha < x nunca las alcanzaría.
+
+    Devuelve (items, pagination) donde pagination incluye next_cursor, que es
+    None cuando no quedan más resultados.
+    """
+    if not 1 <= per_page <= MAX_PER_PAGE:
+        raise ValueError(f'El parámetro per_page debe estar entre 1 y {MAX_PER_PAGE}')
+    
+    total = query.order_by(None).count() if con_total else None
+    query = query.order_by(None)
+
+    fecha, id = decodificar_cursor(cursor) if cursor else (None, None)
+    # Se pide una fila de más para saber si existe una página siguiente
+    limite = per_page + 1
+
+    items = []
+    if not cursor or fecha is not None:
+        con_fecha = query.filter(columna_fecha.isnot(None))
+        if cursor:
+            con_fecha = con_fecha.filter(
+                db.or_(
+                    columna_fecha < fecha,
+                    db.and_(columna_fecha == fecha, columna_id < id)
+                )
+            )
+        items = con_fecha.order_by(columna_fecha.desc(), columna_id.desc()).limit(limite).all()
+
+    if len(items) < limite:
+        sin_fecha = query.filter(columna_fecha.is_(None))
+        if cursor and fecha is None:
+            sin_fecha = sin_fecha.filter(columna_id < id)
+        items += sin_fecha.order_by(columna_id.desc()).limit(limite - len(items)).all()
+
+    has_more = len(items) > per_page
+    items = items[:per_page]
+
+    next_cursor = None
+    if has_more:
+        ultimo = items[-1]
+        next_cursor = codificar_cursor(getattr(ultimo, columna_fecha.key), getattr(ultimo, columna_id.key))
+
+    return items, {
+        'per_page': per_page,
+        'next_cursor': next_cursor,
+        'has_more': has_more,
+        'total': total
+    }
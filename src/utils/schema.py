@@ -0,0 +1,121 @@
+from datetime import datetime
+
+from sqlalchemy import inspect
+
+from src.models import db
+
+# Registro de las migraciones de datos ya aplicadas
+migraciones = db.Table(
+    'migraciones',
+    db.Column('nombre', db.String(100), primary_key=True),
+    db.Column('fecha_aplicacion', db.DateTime, nullable=False)
+)
+
+# Migraciones de datos pendientes de aplicar: [(nombre, funcion(connection))]
+_migraciones = []
+
+# Funciones que rellenan una columna recién añadida: {(tabla, columna): funcion(connection)}
+_rellenos = {}
+
+# Funciones que rellenan una tabla recién creada: {tabla: funcion(connection)}
+_rellenos_tabla = {}
+
+
+def relleno_columna(tabla, columna):
+    """Registra la función que calcula los valores de una columna nueva en filas existentes
+
+    actualizar_esquema() la ejecuta una única vez, justo después de añadir la
+    columna y antes de crear sus índices.
+    """
+    def registrar(funcion):
+        _rellenos[(tabla, columna)] = funcion
+        return funcion
+    return registrar
+
+
+def relleno_tabla(tabla):
+    """Registra la función que puebla una tabla nueva a partir de datos ya existentes
+
+    Se ejecuta una única vez, cuando actualizar_esquema() crea la tabla en una
+    base de datos que ya tenía el resto del esquema.
+    """
+    def registrar(funcion):
+        _rellenos_tabla[tabla] = funcion
+        return funcion
+    return registrar
+
+
+def migracion(nombre):
+    """Registra una migración de datos que se aplica una sola vez
+
+    Las migraciones se ejecutan por orden de nombre al final de
+    actualizar_esquema(), cada una en la misma transacción que la anotación
+    en la tabla migraciones.
+    """
+    def registrar(funcion):
+        _migraciones.append((nombre, funcion))
+        return funcion
+    return registrar
+
+
+def actualizar_esquema():
+    """Crea las tablas que faltan y completa las existentes con columnas e índices nuevos
+
+    db.create_all() sólo crea las tablas que faltan, así que una base de datos
+    ya desplegada no recibe las columnas o índices nuevos de un modelo. Aquí se
+    añaden las columnas ausentes con ALTER TABLE ... ADD COLUMN y se crean los
+    índices declarados que aún no existen. Las columnas y tablas con un relleno
+    registrado (ver relleno_columna y relleno_tabla) se calculan a partir de
+    las filas existentes y por último se aplican las migraciones de datos
+    pendientes. Es idempotente. Devuelve los nombres de las migraciones
+    aplicadas.
+    """
+    engine = db.engine
+    preparer = engine.dialect.identifier_preparer
+    inspector = inspect(engine)
+    tablas_existentes = set(inspector.get_table_names())
+
+    db.create_all()
+
+    with engine.begin() as connection:
+        for tabla in db.metadata.sorted_tables:
+            if tabla.name not in tablas_existentes:
+                continue
+
+            columnas_existentes = {c['name'] for c in inspector.get_columns(tabla.name)}
+            añadidas = []
+            for columna in tabla.columns:
+                if columna.name in columnas_existentes:
+                    continue
+                tipo = columna.type.compile(dialect=engine.dialect)
+                connection.exec_driver_sql(
+                    f'ALTER TABLE {preparer.format_table(tabla)} '
+                    f'ADD COLUMN {preparer.format_column(columna)} {tipo}'
+                )
+                añadidas.append(columna.name)
+
+            for nombre in añadidas:
+                if (tabla.name, nombre) in _rellenos:
+                    _rellenos[(tabla.name, nombre)](connection)
+
+            for indice in tabla.indexes:
+                indice.create(bind=connection, checkfirst=True)
+
+        # Sólo se rellenan tablas nuevas en una base de datos que ya tenía datos
+        if tablas_existentes:
+            for tabla in db.metadata.sorted_tables:
+                if tabla.name not in tablas_existentes and tabla.name in _rellenos_tabla:
+                    _rellenos_tabla[tabla.name](connection)
+
+    aplicadas = []
+    with engine.connect() as connection:
+        hechas = {fila.nombre for fila in connection.execute(db.select(migraciones.c.nombre))}
+    for nombre, funcion in sorted(_migraciones, key=lambda m: m[0]):
+        if nombre in hechas:
+            continue
+        with engine.begin() as connection:
+            funcion(connection)
+            connection.execute(migraciones.insert().values(nombre=nombre, fecha_aplicacion=datetime.utcnow()))
+        aplicadas.append(nombre)
+
+    return aplicadas
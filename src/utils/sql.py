@@ -0,0 +1,36 @@
+from sqlalchemy import insert, update
+
+
+def upsert_incremento(connection, tabla, clave, incrementos):
+    """Suma incrementos a las columnas de la fila identificada por clave, creándola si no existe
+
+    clave es un dict {columna: valor} con la clave primaria de la tabla e
+    incrementos un dict {columna: delta}. En SQLite y PostgreSQL se resuelve
+    con un único INSERT ... ON CONFLICT DO UPDATE atómico; en otros motores se
+    intenta primero el UPDATE y sólo si no afecta a ninguna fila el INSERT.
+    """
+    dialecto = connection.dialect.name
+    valores = {**clave, **incrementos}
+
+    if dialecto in ('sqlite', 'postgresql'):
+        if dialecto == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+        stmt = dialect_insert(tabla).values(**valores)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(clave),
+            set_={columna: tabla.c[columna] + stmt.excluded[columna] for columna in incrementos}
+        )
+        connection.execute(stmt)
+        return
+
+    condicion = [tabla.c[columna] == valor for columna, valor in clave.items()]
+    resultado = connection.execute(
+        update(tabla).where(*condicion).values(
+            **{columna: tabla.c[columna] + delta for columna, delta in incrementos.items()}
+        )
+    )
+    if resultado.rowcount == 0:
+        connection.execute(insert(tabla).values(**valores))
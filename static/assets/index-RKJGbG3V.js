@@ -1,399 +0,0 @@
-function Sq(e,t){for(var n=0;n<t.length;n++){const r=t[n];if(typeof r!="string"&&!Array.isArray(r)){for(const i in r)if(i!=="default"&&!(i in e)){const l=Object.getOwnPropertyDescriptor(r,i);l&&Object.defineProperty(e,i,l.get?l:{enumerable:!0,get:()=>r[i]})}}}return Object.freeze(Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}))}(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const i of document.querySelectorAll('link[rel="modulepreload"]'))r(i);new MutationObserver(i=>{for(const l of i)if(l.type==="childList")for(const s of l.addedNodes)s.tagName==="LINK"&&s.rel==="modulepreload"&&r(s)}).observe(document,{childList:!0,subtree:!0});function n(i){const l={};return i.integrity&&(l.integrity=i.integrity),i.referrerPolicy&&(l.referrerPolicy=i.referrerPolicy),i.crossOrigin==="use-credentials"?l.credentials="include":i.crossOrigin==="anonymous"?l.credentials="omit":l.credentials="same-origin",l}function r(i){if(i.ep)return;i.ep=!0;const l=n(i);fetch(i.href,l)}})();var Wf=typeof globalThis<"u"?globalThis:typeof window<"u"?window:typeof global<"u"?global:typeof self<"u"?self:{};function rt(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var Kv={exports:{}},cc={};/**
- * @license React
- * react-jsx-runtime.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var bA;function jq(){if(bA)return cc;bA=1;var e=Symbol.for("react.transitional.element"),t=Symbol.for("react.fragment");function n(r,i,l){var s=null;if(l!==void 0&&(s=""+l),i.key!==void 0&&(s=""+i.key),"key"in i){l={};for(var u in i)u!=="key"&&(l[u]=i[u])}else l=i;return i=l.ref,{$$typeof:e,type:r,key:s,ref:i!==void 0?i:null,props:l}}return cc.Fragment=t,cc.jsx=n,cc.jsxs=n,cc}var xA;function Oq(){return xA||(xA=1,Kv.exports=jq()),Kv.exports}var p=Oq(),Xv={exports:{}},$e={};/**
- * @license React
- * react.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var wA;function _q(){if(wA)return $e;wA=1;var e=Symbol.for("react.transitional.element"),t=Symbol.for("react.portal"),n=Symbol.for("react.fragment"),r=Symbol.for("react.strict_mode"),i=Symbol.for("react.profiler"),l=Symbol.for("react.consumer"),s=Symbol.for("react.context"),u=Symbol.for("react.forward_ref"),f=Symbol.for("react.suspense"),d=Symbol.for("react.memo"),m=Symbol.for("react.lazy"),v=Symbol.iterator;function g(k){return k===null||typeof k!="object"?null:(k=v&&k[v]||k["@@iterator"],typeof k=="function"?k:null)}var x={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},j=Object.assign,w={};function b(k,X,te){this.props=k,this.context=X,this.refs=w,this.updater=te||x}b.prototype.isReactComponent={},b.prototype.setState=function(k,X){if(typeof k!="object"&&typeof k!="function"&&k!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,k,X,"setState")},b.prototype.forceUpdate=function(k){this.updater.enqueueForceUpdate(this,k,"forceUpdate")};function _(){}_.prototype=b.prototype;function O(k,X,te){this.props=k,this.context=X,this.refs=w,this.updater=te||x}var E=O.prototype=new _;E.constructor=O,j(E,b.prototype),E.isPureReactComponent=!0;var C=Array.isArray,A={H:null,A:null,T:null,S:null,V:null},N=Object.prototype.hasOwnProperty;function P(k,X,te,ne,ue,ge){return te=ge.ref,{$$typeof:e,type:k,key:X,ref:te!==void 0?te:null,props:ge}}function D(k,X){return P(k.type,X,void 0,void 0,void 0,k.props)}function L(k){return typeof k=="object"&&k!==null&&k.$$typeof===e}function G(k){var X={"=":"=0",":":"=2"};return"$"+k.replace(/[=:]/g,function(te){return X[te]})}var I=/\/+/g;function H(k,X){return typeof k=="object"&&k!==null&&k.key!=null?G(""+k.key):X.toString(36)}function V(){}function Z(k){switch(k.status){case"fulfilled":return k.value;case"rejected":throw k.reason;default:switch(typeof k.status=="string"?k.then(V,V):(k.status="pending",k.then(function(X){k.status==="pending"&&(k.status="fulfilled",k.value=X)},function(X){k.status==="pending"&&(k.status="rejected",k.reason=X)})),k.status){case"fulfilled":return k.value;case"rejected":throw k.reason}}throw k}function Y(k,X,te,ne,ue){var ge=typeof k;(ge==="undefined"||ge==="boolean")&&(k=null);var me=!1;if(k===null)me=!0;else switch(ge){case"bigint":case"string":case"number":me=!0;break;case"object":switch(k.$$typeof){case e:case t:me=!0;break;case m:return me=k._init,Y(me(k._payload),X,te,ne,ue)}}if(me)return ue=ue(k),me=ne===""?"."+H(k,0):ne,C(ue)?(te="",me!=null&&(te=me.replace(I,"$&/")+"/"),Y(ue,X,te,"",function(ce){return ce})):ue!=null&&(L(ue)&&(ue=D(ue,te+(ue.key==null||k&&k.key===ue.key?"":(""+ue.key).replace(I,"$&/")+"/")+me)),X.push(ue)),1;me=0;var de=ne===""?".":ne+":";if(C(k))for(var ve=0;ve<k.length;ve++)ne=k[ve],ge=de+H(ne,ve),me+=Y(ne,X,te,ge,ue);else if(ve=g(k),typeof ve=="function")for(k=ve.call(k),ve=0;!(ne=k.next()).done;)ne=ne.value,ge=de+H(ne,ve++),me+=Y(ne,X,te,ge,ue);else if(ge==="object"){if(typeof k.then=="function")return Y(Z(k),X,te,ne,ue);throw X=String(k),Error("Objects are not valid as a React child (found: "+(X==="[object Object]"?"object with keys {"+Object.keys(k).join(", ")+"}":X)+"). If you meant to render a collection of children, use an array instead.")}return me}function $(k,X,te){if(k==null)return k;var ne=[],ue=0;return Y(k,ne,"","",function(ge){return X.call(te,ge,ue++)}),ne}function U(k){if(k._status===-1){var X=k._result;X=X(),X.then(function(te){(k._status===0||k._status===-1)&&(k._status=1,k._result=te)},function(te){(k._status===0||k._status===-1)&&(k._status=2,k._result=te)}),k._status===-1&&(k._status=0,k._result=X)}if(k._status===1)return k._result.default;throw k._result}var B=typeof reportError=="function"?reportError:function(k){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var X=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof k=="object"&&k!==null&&typeof k.message=="string"?String(k.message):String(k),error:k});if(!window.dispatchEvent(X))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",k);return}console.error(k)};function re(){}return $e.Children={map:$,forEach:function(k,X,te){$(k,function(){X.apply(this,arguments)},te)},count:function(k){var X=0;return $(k,function(){X++}),X},toArray:function(k){return $(k,function(X){return X})||[]},only:function(k){if(!L(k))throw Error("React.Children.only expected to receive a single React element child.");return k}},$e.Component=b,$e.Fragment=n,$e.Profiler=i,$e.PureComponent=O,$e.StrictMode=r,$e.Suspense=f,$e.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=A,$e.__COMPILER_RUNTIME={__proto__:null,c:function(k){return A.H.useMemoCache(k)}},$e.cache=function(k){return function(){return k.apply(null,arguments)}},$e.cloneElement=function(k,X,te){if(k==null)throw Error("The argument must be a React element, but you passed "+k+".");var ne=j({},k.props),ue=k.key,ge=void 0;if(X!=null)for(me in X.ref!==void 0&&(ge=void 0),X.key!==void 0&&(ue=""+X.key),X)!N.call(X,me)||me==="key"||me==="__self"||me==="__source"||me==="ref"&&X.ref===void 0||(ne[me]=X[me]);var me=arguments.length-2;if(me===1)ne.children=te;else if(1<me){for(var de=Array(me),ve=0;ve<me;ve++)de[ve]=arguments[ve+2];ne.children=de}return P(k.type,ue,void 0,void 0,ge,ne)},$e.createContext=function(k){return k={$$typeof:s,_currentValue:k,_currentValue2:k,_threadCount:0,Provider:null,Consumer:null},k.Provider=k,k.Consumer={$$typeof:l,_context:k},k},$e.createElement=function(k,X,te){var ne,ue={},ge=null;if(X!=null)for(ne in X.key!==void 0&&(ge=""+X.key),X)N.call(X,ne)&&ne!=="key"&&ne!=="__self"&&ne!=="__source"&&(ue[ne]=X[ne]);var me=arguments.length-2;if(me===1)ue.children=te;else if(1<me){for(var de=Array(me),ve=0;ve<me;ve++)de[ve]=arguments[ve+2];ue.children=de}if(k&&k.defaultProps)for(ne in me=k.defaultProps,me)ue[ne]===void 0&&(ue[ne]=me[ne]);return P(k,ge,void 0,void 0,null,ue)},$e.createRef=function(){return{current:null}},$e.forwardRef=function(k){return{$$typeof:u,render:k}},$e.isValidElement=L,$e.lazy=function(k){return{$$typeof:m,_payload:{_status:-1,_result:k},_init:U}},$e.memo=function(k,X){return{$$typeof:d,type:k,compare:X===void 0?null:X}},$e.startTransition=function(k){var X=A.T,te={};A.T=te;try{var ne=k(),ue=A.S;ue!==null&&ue(te,ne),typeof ne=="object"&&ne!==null&&typeof ne.then=="function"&&ne.then(re,B)}catch(ge){B(ge)}finally{A.T=X}},$e.unstable_useCacheRefresh=function(){return A.H.useCacheRefresh()},$e.use=function(k){return A.H.use(k)},$e.useActionState=function(k,X,te){return A.H.useActionState(k,X,te)},$e.useCallback=function(k,X){return A.H.useCallback(k,X)},$e.useContext=function(k){return A.H.useContext(k)},$e.useDebugValue=function(){},$e.useDeferredValue=function(k,X){return A.H.useDeferredValue(k,X)},$e.useEffect=function(k,X,te){var ne=A.H;if(typeof te=="function")throw Error("useEffect CRUD overload is not enabled in this build of React.");return ne.useEffect(k,X)},$e.useId=function(){return A.H.useId()},$e.useImperativeHandle=function(k,X,te){return A.H.useImperativeHandle(k,X,te)},$e.useInsertionEffect=function(k,X){return A.H.useInsertionEffect(k,X)},$e.useLayoutEffect=function(k,X){return A.H.useLayoutEffect(k,X)},$e.useMemo=function(k,X){return A.H.useMemo(k,X)},$e.useOptimistic=function(k,X){return A.H.useOptimistic(k,X)},$e.useReducer=function(k,X,te){return A.H.useReducer(k,X,te)},$e.useRef=function(k){return A.H.useRef(k)},$e.useState=function(k){return A.H.useState(k)},$e.useSyncExternalStore=function(k,X,te){return A.H.useSyncExternalStore(k,X,te)},$e.useTransition=function(){return A.H.useTransition()},$e.version="19.1.0",$e}var SA;function J1(){return SA||(SA=1,Xv.exports=_q()),Xv.exports}var T=J1();const z=rt(T),cR=Sq({__proto__:null,default:z},[T]);var Wv={exports:{}},uc={},Zv={exports:{}},Qv={};/**
- * @license React
- * scheduler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var jA;function Aq(){return jA||(jA=1,function(e){function t($,U){var B=$.length;$.push(U);e:for(;0<B;){var re=B-1>>>1,k=$[re];if(0<i(k,U))$[re]=U,$[B]=k,B=re;else break e}}function n($){return $.length===0?null:$[0]}function r($){if($.length===0)return null;var U=$[0],B=$.pop();if(B!==U){$[0]=B;e:for(var re=0,k=$.length,X=k>>>1;re<X;){var te=2*(re+1)-1,ne=$[te],ue=te+1,ge=$[ue];if(0>i(ne,B))ue<k&&0>i(ge,ne)?($[re]=ge,$[ue]=B,re=ue):($[re]=ne,$[te]=B,re=te);else if(ue<k&&0>i(ge,B))$[re]=ge,$[ue]=B,re=ue;else break e}}return U}function i($,U){var B=$.sortIndex-U.sortIndex;return B!==0?B:$.id-U.id}if(e.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var l=performance;e.unstable_now=function(){return l.now()}}else{var s=Date,u=s.now();e.unstable_now=function(){return s.now()-u}}var f=[],d=[],m=1,v=null,g=3,x=!1,j=!1,w=!1,b=!1,_=typeof setTimeout=="function"?setTimeout:null,O=typeof clearTimeout=="function"?clearTimeout:null,E=typeof setImmediate<"u"?setImmediate:null;function C($){for(var U=n(d);U!==null;){if(U.callback===null)r(d);else if(U.startTime<=$)r(d),U.sortIndex=U.expirationTime,t(f,U);else break;U=n(d)}}function A($){if(w=!1,C($),!j)if(n(f)!==null)j=!0,N||(N=!0,H());else{var U=n(d);U!==null&&Y(A,U.startTime-$)}}var N=!1,P=-1,D=5,L=-1;function G(){return b?!0:!(e.unstable_now()-L<D)}function I(){if(b=!1,N){var $=e.unstable_now();L=$;var U=!0;try{e:{j=!1,w&&(w=!1,O(P),P=-1),x=!0;var B=g;try{t:{for(C($),v=n(f);v!==null&&!(v.expirationTime>$&&G());){var re=v.callback;if(typeof re=="function"){v.callback=null,g=v.priorityLevel;var k=re(v.expirationTime<=$);if($=e.unstable_now(),typeof k=="function"){v.callback=k,C($),U=!0;break t}v===n(f)&&r(f),C($)}else r(f);v=n(f)}if(v!==null)U=!0;else{var X=n(d);X!==null&&Y(A,X.startTime-$),U=!1}}break e}finally{v=null,g=B,x=!1}U=void 0}}finally{U?H():N=!1}}}var H;if(typeof E=="function")H=function(){E(I)};else if(typeof MessageChannel<"u"){var V=new MessageChannel,Z=V.port2;V.port1.onmessage=I,H=function(){Z.postMessage(null)}}else H=function(){_(I,0)};function Y($,U){P=_(function(){$(e.unstable_now())},U)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function($){$.callback=null},e.unstable_forceFrameRate=function($){0>$||125<$?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):D=0<$?Math.floor(1e3/$):5},e.unstable_getCurrentPriorityLevel=function(){return g},e.unstable_next=function($){switch(g){case 1:case 2:case 3:var U=3;break;default:U=g}var B=g;g=U;try{return $()}finally{g=B}},e.unstable_requestPaint=function(){b=!0},e.unstable_runWithPriority=function($,U){switch($){case 1:case 2:case 3:case 4:case 5:break;default:$=3}var B=g;g=$;try{return U()}finally{g=B}},e.unstable_scheduleCallback=function($,U,B){var re=e.unstable_now();switch(typeof B=="object"&&B!==null?(B=B.delay,B=typeof B=="number"&&0<B?re+B:re):B=re,$){case 1:var k=-1;break;case 2:k=250;break;case 5:k=1073741823;break;case 4:k=1e4;break;default:k=5e3}return k=B+k,$={id:m++,callback:U,priorityLevel:$,startTime:B,expirationTime:k,sortIndex:-1},B>re?($.sortIndex=B,t(d,$),n(f)===null&&$===n(d)&&(w?(O(P),P=-1):w=!0,Y(A,B-re))):($.sortIndex=k,t(f,$),j||x||(j=!0,N||(N=!0,H()))),$},e.unstable_shouldYield=G,e.unstable_wrapCallback=function($){var U=g;return function(){var B=g;g=U;try{return $.apply(this,arguments)}finally{g=B}}}}(Qv)),Qv}var OA;function Eq(){return OA||(OA=1,Zv.exports=Aq()),Zv.exports}var Jv={exports:{}},on={};/**
- * @license React
- * react-dom.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var _A;function Tq(){if(_A)return on;_A=1;var e=J1();function t(f){var d="https://react.dev/errors/"+f;if(1<arguments.length){d+="?args[]="+encodeURIComponent(arguments[1]);for(var m=2;m<arguments.length;m++)d+="&args[]="+encodeURIComponent(arguments[m])}return"Minified React error #"+f+"; visit "+d+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function n(){}var r={d:{f:n,r:function(){throw Error(t(522))},D:n,C:n,L:n,m:n,X:n,S:n,M:n},p:0,findDOMNode:null},i=Symbol.for("react.portal");function l(f,d,m){var v=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:i,key:v==null?null:""+v,children:f,containerInfo:d,implementation:m}}var s=e.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function u(f,d){if(f==="font")return"";if(typeof d=="string")return d==="use-credentials"?d:""}return on.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=r,on.createPortal=function(f,d){var m=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!d||d.nodeType!==1&&d.nodeType!==9&&d.nodeType!==11)throw Error(t(299));return l(f,d,null,m)},on.flushSync=function(f){var d=s.T,m=r.p;try{if(s.T=null,r.p=2,f)return f()}finally{s.T=d,r.p=m,r.d.f()}},on.preconnect=function(f,d){typeof f=="string"&&(d?(d=d.crossOrigin,d=typeof d=="string"?d==="use-credentials"?d:"":void 0):d=null,r.d.C(f,d))},on.prefetchDNS=function(f){typeof f=="string"&&r.d.D(f)},on.preinit=function(f,d){if(typeof f=="string"&&d&&typeof d.as=="string"){var m=d.as,v=u(m,d.crossOrigin),g=typeof d.integrity=="string"?d.integrity:void 0,x=typeof d.fetchPriority=="string"?d.fetchPriority:void 0;m==="style"?r.d.S(f,typeof d.precedence=="string"?d.precedence:void 0,{crossOrigin:v,integrity:g,fetchPriority:x}):m==="script"&&r.d.X(f,{crossOrigin:v,integrity:g,fetchPriority:x,nonce:typeof d.nonce=="string"?d.nonce:void 0})}},on.preinitModule=function(f,d){if(typeof f=="string")if(typeof d=="object"&&d!==null){if(d.as==null||d.as==="script"){var m=u(d.as,d.crossOrigin);r.d.M(f,{crossOrigin:m,integrity:typeof d.integrity=="string"?d.integrity:void 0,nonce:typeof d.nonce=="string"?d.nonce:void 0})}}else d==null&&r.d.M(f)},on.preload=function(f,d){if(typeof f=="string"&&typeof d=="object"&&d!==null&&typeof d.as=="string"){var m=d.as,v=u(m,d.crossOrigin);r.d.L(f,m,{crossOrigin:v,integrity:typeof d.integrity=="string"?d.integrity:void 0,nonce:typeof d.nonce=="string"?d.nonce:void 0,type:typeof d.type=="string"?d.type:void 0,fetchPriority:typeof d.fetchPriority=="string"?d.fetchPriority:void 0,referrerPolicy:typeof d.referrerPolicy=="string"?d.referrerPolicy:void 0,imageSrcSet:typeof d.imageSrcSet=="string"?d.imageSrcSet:void 0,imageSizes:typeof d.imageSizes=="string"?d.imageSizes:void 0,media:typeof d.media=="string"?d.media:void 0})}},on.preloadModule=function(f,d){if(typeof f=="string")if(d){var m=u(d.as,d.crossOrigin);r.d.m(f,{as:typeof d.as=="string"&&d.as!=="script"?d.as:void 0,crossOrigin:m,integrity:typeof d.integrity=="string"?d.integrity:void 0})}else r.d.m(f)},on.requestFormReset=function(f){r.d.r(f)},on.unstable_batchedUpdates=function(f,d){return f(d)},on.useFormState=function(f,d,m){return s.H.useFormState(f,d,m)},on.useFormStatus=function(){return s.H.useHostTransitionStatus()},on.version="19.1.0",on}var AA;function uR(){if(AA)return Jv.exports;AA=1;function e(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}return e(),Jv.exports=Tq(),Jv.exports}/**
- * @license React
- * react-dom-client.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var EA;function Cq(){if(EA)return uc;EA=1;var e=Eq(),t=J1(),n=uR();function r(a){var o="https://react.dev/errors/"+a;if(1<arguments.length){o+="?args[]="+encodeURIComponent(arguments[1]);for(var c=2;c<arguments.length;c++)o+="&args[]="+encodeURIComponent(arguments[c])}return"Minified React error #"+a+"; visit "+o+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function i(a){return!(!a||a.nodeType!==1&&a.nodeType!==9&&a.nodeType!==11)}function l(a){var o=a,c=a;if(a.alternate)for(;o.return;)o=o.return;else{a=o;do o=a,(o.flags&4098)!==0&&(c=o.return),a=o.return;while(a)}return o.tag===3?c:null}function s(a){if(a.tag===13){var o=a.memoizedState;if(o===null&&(a=a.alternate,a!==null&&(o=a.memoizedState)),o!==null)return o.dehydrated}return null}function u(a){if(l(a)!==a)throw Error(r(188))}function f(a){var o=a.alternate;if(!o){if(o=l(a),o===null)throw Error(r(188));return o!==a?null:a}for(var c=a,h=o;;){var y=c.return;if(y===null)break;var S=y.alternate;if(S===null){if(h=y.return,h!==null){c=h;continue}break}if(y.child===S.child){for(S=y.child;S;){if(S===c)return u(y),a;if(S===h)return u(y),o;S=S.sibling}throw Error(r(188))}if(c.return!==h.return)c=y,h=S;else{for(var M=!1,R=y.child;R;){if(R===c){M=!0,c=y,h=S;break}if(R===h){M=!0,h=y,c=S;break}R=R.sibling}if(!M){for(R=S.child;R;){if(R===c){M=!0,c=S,h=y;break}if(R===h){M=!0,h=S,c=y;break}R=R.sibling}if(!M)throw Error(r(189))}}if(c.alternate!==h)throw Error(r(190))}if(c.tag!==3)throw Error(r(188));return c.stateNode.current===c?a:o}function d(a){var o=a.tag;if(o===5||o===26||o===27||o===6)return a;for(a=a.child;a!==null;){if(o=d(a),o!==null)return o;a=a.sibling}return null}var m=Object.assign,v=Symbol.for("react.element"),g=Symbol.for("react.transitional.element"),x=Symbol.for("react.portal"),j=Symbol.for("react.fragment"),w=Symbol.for("react.strict_mode"),b=Symbol.for("react.profiler"),_=Symbol.for("react.provider"),O=Symbol.for("react.consumer"),E=Symbol.for("react.context"),C=Symbol.for("react.forward_ref"),A=Symbol.for("react.suspense"),N=Symbol.for("react.suspense_list"),P=Symbol.for("react.memo"),D=Symbol.for("react.lazy"),L=Symbol.for("react.activity"),G=Symbol.for("react.memo_cache_sentinel"),I=Symbol.iterator;function H(a){return a===null||typeof a!="object"?null:(a=I&&a[I]||a["@@iterator"],typeof a=="function"?a:null)}var V=Symbol.for("react.client.reference");function Z(a){if(a==null)return null;if(typeof a=="function")return a.$$typeof===V?null:a.displayName||a.name||null;if(typeof a=="string")return a;switch(a){case j:return"Fragment";case b:return"Profiler";case w:return"StrictMode";case A:return"Suspense";case N:return"SuspenseList";case L:return"Activity"}if(typeof a=="object")switch(a.$$typeof){case x:return"Portal";case E:return(a.displayName||"Context")+".Provider";case O:return(a._context.displayName||"Context")+".Consumer";case C:var o=a.render;return a=a.displayName,a||(a=o.displayName||o.name||"",a=a!==""?"ForwardRef("+a+")":"ForwardRef"),a;case P:return o=a.displayName||null,o!==null?o:Z(a.type)||"Memo";case D:o=a._payload,a=a._init;try{return Z(a(o))}catch{}}return null}var Y=Array.isArray,$=t.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,U=n.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,B={pending:!1,data:null,method:null,action:null},re=[],k=-1;function X(a){return{current:a}}function te(a){0>k||(a.current=re[k],re[k]=null,k--)}function ne(a,o){k++,re[k]=a.current,a.current=o}var ue=X(null),ge=X(null),me=X(null),de=X(null);function ve(a,o){switch(ne(me,o),ne(ge,a),ne(ue,null),o.nodeType){case 9:case 11:a=(a=o.documentElement)&&(a=a.namespaceURI)?Y_(a):0;break;default:if(a=o.tagName,o=o.namespaceURI)o=Y_(o),a=K_(o,a);else switch(a){case"svg":a=1;break;case"math":a=2;break;default:a=0}}te(ue),ne(ue,a)}function ce(){te(ue),te(ge),te(me)}function he(a){a.memoizedState!==null&&ne(de,a);var o=ue.current,c=K_(o,a.type);o!==c&&(ne(ge,a),ne(ue,c))}function pe(a){ge.current===a&&(te(ue),te(ge)),de.current===a&&(te(de),ac._currentValue=B)}var ae=Object.prototype.hasOwnProperty,Le=e.unstable_scheduleCallback,Ce=e.unstable_cancelCallback,ft=e.unstable_shouldYield,dt=e.unstable_requestPaint,Je=e.unstable_now,qn=e.unstable_getCurrentPriorityLevel,vn=e.unstable_ImmediatePriority,pi=e.unstable_UserBlockingPriority,Bn=e.unstable_NormalPriority,$r=e.unstable_LowPriority,fo=e.unstable_IdlePriority,Du=e.log,ku=e.unstable_setDisableYieldValue,ds=null,On=null;function Oa(a){if(typeof Du=="function"&&ku(a),On&&typeof On.setStrictMode=="function")try{On.setStrictMode(ds,a)}catch{}}var _n=Math.clz32?Math.clz32:sL,oL=Math.log,lL=Math.LN2;function sL(a){return a>>>=0,a===0?32:31-(oL(a)/lL|0)|0}var $u=256,Lu=4194304;function mi(a){var o=a&42;if(o!==0)return o;switch(a&-a){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return a&4194048;case 4194304:case 8388608:case 16777216:case 33554432:return a&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return a}}function Iu(a,o,c){var h=a.pendingLanes;if(h===0)return 0;var y=0,S=a.suspendedLanes,M=a.pingedLanes;a=a.warmLanes;var R=h&134217727;return R!==0?(h=R&~S,h!==0?y=mi(h):(M&=R,M!==0?y=mi(M):c||(c=R&~a,c!==0&&(y=mi(c))))):(R=h&~S,R!==0?y=mi(R):M!==0?y=mi(M):c||(c=h&~a,c!==0&&(y=mi(c)))),y===0?0:o!==0&&o!==y&&(o&S)===0&&(S=y&-y,c=o&-o,S>=c||S===32&&(c&4194048)!==0)?o:y}function hs(a,o){return(a.pendingLanes&~(a.suspendedLanes&~a.pingedLanes)&o)===0}function cL(a,o){switch(a){case 1:case 2:case 4:case 8:case 64:return o+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return o+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function NS(){var a=$u;return $u<<=1,($u&4194048)===0&&($u=256),a}function MS(){var a=Lu;return Lu<<=1,(Lu&62914560)===0&&(Lu=4194304),a}function Lp(a){for(var o=[],c=0;31>c;c++)o.push(a);return o}function ps(a,o){a.pendingLanes|=o,o!==268435456&&(a.suspendedLanes=0,a.pingedLanes=0,a.warmLanes=0)}function uL(a,o,c,h,y,S){var M=a.pendingLanes;a.pendingLanes=c,a.suspendedLanes=0,a.pingedLanes=0,a.warmLanes=0,a.expiredLanes&=c,a.entangledLanes&=c,a.errorRecoveryDisabledLanes&=c,a.shellSuspendCounter=0;var R=a.entanglements,q=a.expirationTimes,Q=a.hiddenUpdates;for(c=M&~c;0<c;){var oe=31-_n(c),se=1<<oe;R[oe]=0,q[oe]=-1;var J=Q[oe];if(J!==null)for(Q[oe]=null,oe=0;oe<J.length;oe++){var ee=J[oe];ee!==null&&(ee.lane&=-536870913)}c&=~se}h!==0&&PS(a,h,0),S!==0&&y===0&&a.tag!==0&&(a.suspendedLanes|=S&~(M&~o))}function PS(a,o,c){a.pendingLanes|=o,a.suspendedLanes&=~o;var h=31-_n(o);a.entangledLanes|=o,a.entanglements[h]=a.entanglements[h]|1073741824|c&4194090}function RS(a,o){var c=a.entangledLanes|=o;for(a=a.entanglements;c;){var h=31-_n(c),y=1<<h;y&o|a[h]&o&&(a[h]|=o),c&=~y}}function Ip(a){switch(a){case 2:a=1;break;case 8:a=4;break;case 32:a=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:a=128;break;case 268435456:a=134217728;break;default:a=0}return a}function qp(a){return a&=-a,2<a?8<a?(a&134217727)!==0?32:268435456:8:2}function DS(){var a=U.p;return a!==0?a:(a=window.event,a===void 0?32:hA(a.type))}function fL(a,o){var c=U.p;try{return U.p=a,o()}finally{U.p=c}}var _a=Math.random().toString(36).slice(2),rn="__reactFiber$"+_a,yn="__reactProps$"+_a,ho="__reactContainer$"+_a,Bp="__reactEvents$"+_a,dL="__reactListeners$"+_a,hL="__reactHandles$"+_a,kS="__reactResources$"+_a,ms="__reactMarker$"+_a;function zp(a){delete a[rn],delete a[yn],delete a[Bp],delete a[dL],delete a[hL]}function po(a){var o=a[rn];if(o)return o;for(var c=a.parentNode;c;){if(o=c[ho]||c[rn]){if(c=o.alternate,o.child!==null||c!==null&&c.child!==null)for(a=Q_(a);a!==null;){if(c=a[rn])return c;a=Q_(a)}return o}a=c,c=a.parentNode}return null}function mo(a){if(a=a[rn]||a[ho]){var o=a.tag;if(o===5||o===6||o===13||o===26||o===27||o===3)return a}return null}function vs(a){var o=a.tag;if(o===5||o===26||o===27||o===6)return a.stateNode;throw Error(r(33))}function vo(a){var o=a[kS];return o||(o=a[kS]={hoistableStyles:new Map,hoistableScripts:new Map}),o}function Ft(a){a[ms]=!0}var $S=new Set,LS={};function vi(a,o){yo(a,o),yo(a+"Capture",o)}function yo(a,o){for(LS[a]=o,a=0;a<o.length;a++)$S.add(o[a])}var pL=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),IS={},qS={};function mL(a){return ae.call(qS,a)?!0:ae.call(IS,a)?!1:pL.test(a)?qS[a]=!0:(IS[a]=!0,!1)}function qu(a,o,c){if(mL(o))if(c===null)a.removeAttribute(o);else{switch(typeof c){case"undefined":case"function":case"symbol":a.removeAttribute(o);return;case"boolean":var h=o.toLowerCase().slice(0,5);if(h!=="data-"&&h!=="aria-"){a.removeAttribute(o);return}}a.setAttribute(o,""+c)}}function Bu(a,o,c){if(c===null)a.removeAttribute(o);else{switch(typeof c){case"undefined":case"function":case"symbol":case"boolean":a.removeAttribute(o);return}a.setAttribute(o,""+c)}}function Lr(a,o,c,h){if(h===null)a.removeAttribute(c);else{switch(typeof h){case"undefined":case"function":case"symbol":case"boolean":a.removeAttribute(c);return}a.setAttributeNS(o,c,""+h)}}var Up,BS;function go(a){if(Up===void 0)try{throw Error()}catch(c){var o=c.stack.trim().match(/\n( *(at )?)/);Up=o&&o[1]||"",BS=-1<c.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<c.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+Up+a+BS}var Hp=!1;function Fp(a,o){if(!a||Hp)return"";Hp=!0;var c=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var h={DetermineComponentFrameRoot:function(){try{if(o){var se=function(){throw Error()};if(Object.defineProperty(se.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(se,[])}catch(ee){var J=ee}Reflect.construct(a,[],se)}else{try{se.call()}catch(ee){J=ee}a.call(se.prototype)}}else{try{throw Error()}catch(ee){J=ee}(se=a())&&typeof se.catch=="function"&&se.catch(function(){})}}catch(ee){if(ee&&J&&typeof ee.stack=="string")return[ee.stack,J.stack]}return[null,null]}};h.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var y=Object.getOwnPropertyDescriptor(h.DetermineComponentFrameRoot,"name");y&&y.configurable&&Object.defineProperty(h.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var S=h.DetermineComponentFrameRoot(),M=S[0],R=S[1];if(M&&R){var q=M.split(`
-`),Q=R.split(`
-`);for(y=h=0;h<q.length&&!q[h].includes("DetermineComponentFrameRoot");)h++;for(;y<Q.length&&!Q[y].includes("DetermineComponentFrameRoot");)y++;if(h===q.length||y===Q.length)for(h=q.length-1,y=Q.length-1;1<=h&&0<=y&&q[h]!==Q[y];)y--;for(;1<=h&&0<=y;h--,y--)if(q[h]!==Q[y]){if(h!==1||y!==1)do if(h--,y--,0>y||q[h]!==Q[y]){var oe=`
-`+q[h].replace(" at new "," at ");return a.displayName&&oe.includes("<anonymous>")&&(oe=oe.replace("<anonymous>",a.displayName)),oe}while(1<=h&&0<=y);break}}}finally{Hp=!1,Error.prepareStackTrace=c}return(c=a?a.displayName||a.name:"")?go(c):""}function vL(a){switch(a.tag){case 26:case 27:case 5:return go(a.type);case 16:return go("Lazy");case 13:return go("Suspense");case 19:return go("SuspenseList");case 0:case 15:return Fp(a.type,!1);case 11:return Fp(a.type.render,!1);case 1:return Fp(a.type,!0);case 31:return go("Activity");default:return""}}function zS(a){try{var o="";do o+=vL(a),a=a.return;while(a);return o}catch(c){return`
-Error generating stack: `+c.message+`
-`+c.stack}}function zn(a){switch(typeof a){case"bigint":case"boolean":case"number":case"string":case"undefined":return a;case"object":return a;default:return""}}function US(a){var o=a.type;return(a=a.nodeName)&&a.toLowerCase()==="input"&&(o==="checkbox"||o==="radio")}function yL(a){var o=US(a)?"checked":"value",c=Object.getOwnPropertyDescriptor(a.constructor.prototype,o),h=""+a[o];if(!a.hasOwnProperty(o)&&typeof c<"u"&&typeof c.get=="function"&&typeof c.set=="function"){var y=c.get,S=c.set;return Object.defineProperty(a,o,{configurable:!0,get:function(){return y.call(this)},set:function(M){h=""+M,S.call(this,M)}}),Object.defineProperty(a,o,{enumerable:c.enumerable}),{getValue:function(){return h},setValue:function(M){h=""+M},stopTracking:function(){a._valueTracker=null,delete a[o]}}}}function zu(a){a._valueTracker||(a._valueTracker=yL(a))}function HS(a){if(!a)return!1;var o=a._valueTracker;if(!o)return!0;var c=o.getValue(),h="";return a&&(h=US(a)?a.checked?"true":"false":a.value),a=h,a!==c?(o.setValue(a),!0):!1}function Uu(a){if(a=a||(typeof document<"u"?document:void 0),typeof a>"u")return null;try{return a.activeElement||a.body}catch{return a.body}}var gL=/[\n"\\]/g;function Un(a){return a.replace(gL,function(o){return"\\"+o.charCodeAt(0).toString(16)+" "})}function Gp(a,o,c,h,y,S,M,R){a.name="",M!=null&&typeof M!="function"&&typeof M!="symbol"&&typeof M!="boolean"?a.type=M:a.removeAttribute("type"),o!=null?M==="number"?(o===0&&a.value===""||a.value!=o)&&(a.value=""+zn(o)):a.value!==""+zn(o)&&(a.value=""+zn(o)):M!=="submit"&&M!=="reset"||a.removeAttribute("value"),o!=null?Vp(a,M,zn(o)):c!=null?Vp(a,M,zn(c)):h!=null&&a.removeAttribute("value"),y==null&&S!=null&&(a.defaultChecked=!!S),y!=null&&(a.checked=y&&typeof y!="function"&&typeof y!="symbol"),R!=null&&typeof R!="function"&&typeof R!="symbol"&&typeof R!="boolean"?a.name=""+zn(R):a.removeAttribute("name")}function FS(a,o,c,h,y,S,M,R){if(S!=null&&typeof S!="function"&&typeof S!="symbol"&&typeof S!="boolean"&&(a.type=S),o!=null||c!=null){if(!(S!=="submit"&&S!=="reset"||o!=null))return;c=c!=null?""+zn(c):"",o=o!=null?""+zn(o):c,R||o===a.value||(a.value=o),a.defaultValue=o}h=h??y,h=typeof h!="function"&&typeof h!="symbol"&&!!h,a.checked=R?a.checked:!!h,a.defaultChecked=!!h,M!=null&&typeof M!="function"&&typeof M!="symbol"&&typeof M!="boolean"&&(a.name=M)}function Vp(a,o,c){o==="number"&&Uu(a.ownerDocument)===a||a.defaultValue===""+c||(a.defaultValue=""+c)}function bo(a,o,c,h){if(a=a.options,o){o={};for(var y=0;y<c.length;y++)o["$"+c[y]]=!0;for(c=0;c<a.length;c++)y=o.hasOwnProperty("$"+a[c].value),a[c].selected!==y&&(a[c].selected=y),y&&h&&(a[c].defaultSelected=!0)}else{for(c=""+zn(c),o=null,y=0;y<a.length;y++){if(a[y].value===c){a[y].selected=!0,h&&(a[y].defaultSelected=!0);return}o!==null||a[y].disabled||(o=a[y])}o!==null&&(o.selected=!0)}}function GS(a,o,c){if(o!=null&&(o=""+zn(o),o!==a.value&&(a.value=o),c==null)){a.defaultValue!==o&&(a.defaultValue=o);return}a.defaultValue=c!=null?""+zn(c):""}function VS(a,o,c,h){if(o==null){if(h!=null){if(c!=null)throw Error(r(92));if(Y(h)){if(1<h.length)throw Error(r(93));h=h[0]}c=h}c==null&&(c=""),o=c}c=zn(o),a.defaultValue=c,h=a.textContent,h===c&&h!==""&&h!==null&&(a.value=h)}function xo(a,o){if(o){var c=a.firstChild;if(c&&c===a.lastChild&&c.nodeType===3){c.nodeValue=o;return}}a.textContent=o}var bL=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function YS(a,o,c){var h=o.indexOf("--")===0;c==null||typeof c=="boolean"||c===""?h?a.setProperty(o,""):o==="float"?a.cssFloat="":a[o]="":h?a.setProperty(o,c):typeof c!="number"||c===0||bL.has(o)?o==="float"?a.cssFloat=c:a[o]=(""+c).trim():a[o]=c+"px"}function KS(a,o,c){if(o!=null&&typeof o!="object")throw Error(r(62));if(a=a.style,c!=null){for(var h in c)!c.hasOwnProperty(h)||o!=null&&o.hasOwnProperty(h)||(h.indexOf("--")===0?a.setProperty(h,""):h==="float"?a.cssFloat="":a[h]="");for(var y in o)h=o[y],o.hasOwnProperty(y)&&c[y]!==h&&YS(a,y,h)}else for(var S in o)o.hasOwnProperty(S)&&YS(a,S,o[S])}function Yp(a){if(a.indexOf("-")===-1)return!1;switch(a){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var xL=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),wL=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function Hu(a){return wL.test(""+a)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":a}var Kp=null;function Xp(a){return a=a.target||a.srcElement||window,a.correspondingUseElement&&(a=a.correspondingUseElement),a.nodeType===3?a.parentNode:a}var wo=null,So=null;function XS(a){var o=mo(a);if(o&&(a=o.stateNode)){var c=a[yn]||null;e:switch(a=o.stateNode,o.type){case"input":if(Gp(a,c.value,c.defaultValue,c.defaultValue,c.checked,c.defaultChecked,c.type,c.name),o=c.name,c.type==="radio"&&o!=null){for(c=a;c.parentNode;)c=c.parentNode;for(c=c.querySelectorAll('input[name="'+Un(""+o)+'"][type="radio"]'),o=0;o<c.length;o++){var h=c[o];if(h!==a&&h.form===a.form){var y=h[yn]||null;if(!y)throw Error(r(90));Gp(h,y.value,y.defaultValue,y.defaultValue,y.checked,y.defaultChecked,y.type,y.name)}}for(o=0;o<c.length;o++)h=c[o],h.form===a.form&&HS(h)}break e;case"textarea":GS(a,c.value,c.defaultValue);break e;case"select":o=c.value,o!=null&&bo(a,!!c.multiple,o,!1)}}}var Wp=!1;function WS(a,o,c){if(Wp)return a(o,c);Wp=!0;try{var h=a(o);return h}finally{if(Wp=!1,(wo!==null||So!==null)&&(Cf(),wo&&(o=wo,a=So,So=wo=null,XS(o),a)))for(o=0;o<a.length;o++)XS(a[o])}}function ys(a,o){var c=a.stateNode;if(c===null)return null;var h=c[yn]||null;if(h===null)return null;c=h[o];e:switch(o){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(h=!h.disabled)||(a=a.type,h=!(a==="button"||a==="input"||a==="select"||a==="textarea")),a=!h;break e;default:a=!1}if(a)return null;if(c&&typeof c!="function")throw Error(r(231,o,typeof c));return c}var Ir=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),Zp=!1;if(Ir)try{var gs={};Object.defineProperty(gs,"passive",{get:function(){Zp=!0}}),window.addEventListener("test",gs,gs),window.removeEventListener("test",gs,gs)}catch{Zp=!1}var Aa=null,Qp=null,Fu=null;function ZS(){if(Fu)return Fu;var a,o=Qp,c=o.length,h,y="value"in Aa?Aa.value:Aa.textContent,S=y.length;for(a=0;a<c&&o[a]===y[a];a++);var M=c-a;for(h=1;h<=M&&o[c-h]===y[S-h];h++);return Fu=y.slice(a,1<h?1-h:void 0)}function Gu(a){var o=a.keyCode;return"charCode"in a?(a=a.charCode,a===0&&o===13&&(a=13)):a=o,a===10&&(a=13),32<=a||a===13?a:0}function Vu(){return!0}function QS(){return!1}function gn(a){function o(c,h,y,S,M){this._reactName=c,this._targetInst=y,this.type=h,this.nativeEvent=S,this.target=M,this.currentTarget=null;for(var R in a)a.hasOwnProperty(R)&&(c=a[R],this[R]=c?c(S):S[R]);return this.isDefaultPrevented=(S.defaultPrevented!=null?S.defaultPrevented:S.returnValue===!1)?Vu:QS,this.isPropagationStopped=QS,this}return m(o.prototype,{preventDefault:function(){this.defaultPrevented=!0;var c=this.nativeEvent;c&&(c.preventDefault?c.preventDefault():typeof c.returnValue!="unknown"&&(c.returnValue=!1),this.isDefaultPrevented=Vu)},stopPropagation:function(){var c=this.nativeEvent;c&&(c.stopPropagation?c.stopPropagation():typeof c.cancelBubble!="unknown"&&(c.cancelBubble=!0),this.isPropagationStopped=Vu)},persist:function(){},isPersistent:Vu}),o}var yi={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(a){return a.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Yu=gn(yi),bs=m({},yi,{view:0,detail:0}),SL=gn(bs),Jp,em,xs,Ku=m({},bs,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:nm,button:0,buttons:0,relatedTarget:function(a){return a.relatedTarget===void 0?a.fromElement===a.srcElement?a.toElement:a.fromElement:a.relatedTarget},movementX:function(a){return"movementX"in a?a.movementX:(a!==xs&&(xs&&a.type==="mousemove"?(Jp=a.screenX-xs.screenX,em=a.screenY-xs.screenY):em=Jp=0,xs=a),Jp)},movementY:function(a){return"movementY"in a?a.movementY:em}}),JS=gn(Ku),jL=m({},Ku,{dataTransfer:0}),OL=gn(jL),_L=m({},bs,{relatedTarget:0}),tm=gn(_L),AL=m({},yi,{animationName:0,elapsedTime:0,pseudoElement:0}),EL=gn(AL),TL=m({},yi,{clipboardData:function(a){return"clipboardData"in a?a.clipboardData:window.clipboardData}}),CL=gn(TL),NL=m({},yi,{data:0}),ej=gn(NL),ML={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},PL={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},RL={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function DL(a){var o=this.nativeEvent;return o.getModifierState?o.getModifierState(a):(a=RL[a])?!!o[a]:!1}function nm(){return DL}var kL=m({},bs,{key:function(a){if(a.key){var o=ML[a.key]||a.key;if(o!=="Unidentified")return o}return a.type==="keypress"?(a=Gu(a),a===13?"Enter":String.fromCharCode(a)):a.type==="keydown"||a.type==="keyup"?PL[a.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:nm,charCode:function(a){return a.type==="keypress"?Gu(a):0},keyCode:function(a){return a.type==="keydown"||a.type==="keyup"?a.keyCode:0},which:function(a){return a.type==="keypress"?Gu(a):a.type==="keydown"||a.type==="keyup"?a.keyCode:0}}),$L=gn(kL),LL=m({},Ku,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),tj=gn(LL),IL=m({},bs,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:nm}),qL=gn(IL),BL=m({},yi,{propertyName:0,elapsedTime:0,pseudoElement:0}),zL=gn(BL),UL=m({},Ku,{deltaX:function(a){return"deltaX"in a?a.deltaX:"wheelDeltaX"in a?-a.wheelDeltaX:0},deltaY:function(a){return"deltaY"in a?a.deltaY:"wheelDeltaY"in a?-a.wheelDeltaY:"wheelDelta"in a?-a.wheelDelta:0},deltaZ:0,deltaMode:0}),HL=gn(UL),FL=m({},yi,{newState:0,oldState:0}),GL=gn(FL),VL=[9,13,27,32],rm=Ir&&"CompositionEvent"in window,ws=null;Ir&&"documentMode"in document&&(ws=document.documentMode);var YL=Ir&&"TextEvent"in window&&!ws,nj=Ir&&(!rm||ws&&8<ws&&11>=ws),rj=" ",aj=!1;function ij(a,o){switch(a){case"keyup":return VL.indexOf(o.keyCode)!==-1;case"keydown":return o.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function oj(a){return a=a.detail,typeof a=="object"&&"data"in a?a.data:null}var jo=!1;function KL(a,o){switch(a){case"compositionend":return oj(o);case"keypress":return o.which!==32?null:(aj=!0,rj);case"textInput":return a=o.data,a===rj&&aj?null:a;default:return null}}function XL(a,o){if(jo)return a==="compositionend"||!rm&&ij(a,o)?(a=ZS(),Fu=Qp=Aa=null,jo=!1,a):null;switch(a){case"paste":return null;case"keypress":if(!(o.ctrlKey||o.altKey||o.metaKey)||o.ctrlKey&&o.altKey){if(o.char&&1<o.char.length)return o.char;if(o.which)return String.fromCharCode(o.which)}return null;case"compositionend":return nj&&o.locale!=="ko"?null:o.data;default:return null}}var WL={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function lj(a){var o=a&&a.nodeName&&a.nodeName.toLowerCase();return o==="input"?!!WL[a.type]:o==="textarea"}function sj(a,o,c,h){wo?So?So.push(h):So=[h]:wo=h,o=kf(o,"onChange"),0<o.length&&(c=new Yu("onChange","change",null,c,h),a.push({event:c,listeners:o}))}var Ss=null,js=null;function ZL(a){U_(a,0)}function Xu(a){var o=vs(a);if(HS(o))return a}function cj(a,o){if(a==="change")return o}var uj=!1;if(Ir){var am;if(Ir){var im="oninput"in document;if(!im){var fj=document.createElement("div");fj.setAttribute("oninput","return;"),im=typeof fj.oninput=="function"}am=im}else am=!1;uj=am&&(!document.documentMode||9<document.documentMode)}function dj(){Ss&&(Ss.detachEvent("onpropertychange",hj),js=Ss=null)}function hj(a){if(a.propertyName==="value"&&Xu(js)){var o=[];sj(o,js,a,Xp(a)),WS(ZL,o)}}function QL(a,o,c){a==="focusin"?(dj(),Ss=o,js=c,Ss.attachEvent("onpropertychange",hj)):a==="focusout"&&dj()}function JL(a){if(a==="selectionchange"||a==="keyup"||a==="keydown")return Xu(js)}function eI(a,o){if(a==="click")return Xu(o)}function tI(a,o){if(a==="input"||a==="change")return Xu(o)}function nI(a,o){return a===o&&(a!==0||1/a===1/o)||a!==a&&o!==o}var An=typeof Object.is=="function"?Object.is:nI;function Os(a,o){if(An(a,o))return!0;if(typeof a!="object"||a===null||typeof o!="object"||o===null)return!1;var c=Object.keys(a),h=Object.keys(o);if(c.length!==h.length)return!1;for(h=0;h<c.length;h++){var y=c[h];if(!ae.call(o,y)||!An(a[y],o[y]))return!1}return!0}function pj(a){for(;a&&a.firstChild;)a=a.firstChild;return a}function mj(a,o){var c=pj(a);a=0;for(var h;c;){if(c.nodeType===3){if(h=a+c.textContent.length,a<=o&&h>=o)return{node:c,offset:o-a};a=h}e:{for(;c;){if(c.nextSibling){c=c.nextSibling;break e}c=c.parentNode}c=void 0}c=pj(c)}}function vj(a,o){return a&&o?a===o?!0:a&&a.nodeType===3?!1:o&&o.nodeType===3?vj(a,o.parentNode):"contains"in a?a.contains(o):a.compareDocumentPosition?!!(a.compareDocumentPosition(o)&16):!1:!1}function yj(a){a=a!=null&&a.ownerDocument!=null&&a.ownerDocument.defaultView!=null?a.ownerDocument.defaultView:window;for(var o=Uu(a.document);o instanceof a.HTMLIFrameElement;){try{var c=typeof o.contentWindow.location.href=="string"}catch{c=!1}if(c)a=o.contentWindow;else break;o=Uu(a.document)}return o}function om(a){var o=a&&a.nodeName&&a.nodeName.toLowerCase();return o&&(o==="input"&&(a.type==="text"||a.type==="search"||a.type==="tel"||a.type==="url"||a.type==="password")||o==="textarea"||a.contentEditable==="true")}var rI=Ir&&"documentMode"in document&&11>=document.documentMode,Oo=null,lm=null,_s=null,sm=!1;function gj(a,o,c){var h=c.window===c?c.document:c.nodeType===9?c:c.ownerDocument;sm||Oo==null||Oo!==Uu(h)||(h=Oo,"selectionStart"in h&&om(h)?h={start:h.selectionStart,end:h.selectionEnd}:(h=(h.ownerDocument&&h.ownerDocument.defaultView||window).getSelection(),h={anchorNode:h.anchorNode,anchorOffset:h.anchorOffset,focusNode:h.focusNode,focusOffset:h.focusOffset}),_s&&Os(_s,h)||(_s=h,h=kf(lm,"onSelect"),0<h.length&&(o=new Yu("onSelect","select",null,o,c),a.push({event:o,listeners:h}),o.target=Oo)))}function gi(a,o){var c={};return c[a.toLowerCase()]=o.toLowerCase(),c["Webkit"+a]="webkit"+o,c["Moz"+a]="moz"+o,c}var _o={animationend:gi("Animation","AnimationEnd"),animationiteration:gi("Animation","AnimationIteration"),animationstart:gi("Animation","AnimationStart"),transitionrun:gi("Transition","TransitionRun"),transitionstart:gi("Transition","TransitionStart"),transitioncancel:gi("Transition","TransitionCancel"),transitionend:gi("Transition","TransitionEnd")},cm={},bj={};Ir&&(bj=document.createElement("div").style,"AnimationEvent"in window||(delete _o.animationend.animation,delete _o.animationiteration.animation,delete _o.animationstart.animation),"TransitionEvent"in window||delete _o.transitionend.transition);function bi(a){if(cm[a])return cm[a];if(!_o[a])return a;var o=_o[a],c;for(c in o)if(o.hasOwnProperty(c)&&c in bj)return cm[a]=o[c];return a}var xj=bi("animationend"),wj=bi("animationiteration"),Sj=bi("animationstart"),aI=bi("transitionrun"),iI=bi("transitionstart"),oI=bi("transitioncancel"),jj=bi("transitionend"),Oj=new Map,um="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");um.push("scrollEnd");function ar(a,o){Oj.set(a,o),vi(o,[a])}var _j=new WeakMap;function Hn(a,o){if(typeof a=="object"&&a!==null){var c=_j.get(a);return c!==void 0?c:(o={value:a,source:o,stack:zS(o)},_j.set(a,o),o)}return{value:a,source:o,stack:zS(o)}}var Fn=[],Ao=0,fm=0;function Wu(){for(var a=Ao,o=fm=Ao=0;o<a;){var c=Fn[o];Fn[o++]=null;var h=Fn[o];Fn[o++]=null;var y=Fn[o];Fn[o++]=null;var S=Fn[o];if(Fn[o++]=null,h!==null&&y!==null){var M=h.pending;M===null?y.next=y:(y.next=M.next,M.next=y),h.pending=y}S!==0&&Aj(c,y,S)}}function Zu(a,o,c,h){Fn[Ao++]=a,Fn[Ao++]=o,Fn[Ao++]=c,Fn[Ao++]=h,fm|=h,a.lanes|=h,a=a.alternate,a!==null&&(a.lanes|=h)}function dm(a,o,c,h){return Zu(a,o,c,h),Qu(a)}function Eo(a,o){return Zu(a,null,null,o),Qu(a)}function Aj(a,o,c){a.lanes|=c;var h=a.alternate;h!==null&&(h.lanes|=c);for(var y=!1,S=a.return;S!==null;)S.childLanes|=c,h=S.alternate,h!==null&&(h.childLanes|=c),S.tag===22&&(a=S.stateNode,a===null||a._visibility&1||(y=!0)),a=S,S=S.return;return a.tag===3?(S=a.stateNode,y&&o!==null&&(y=31-_n(c),a=S.hiddenUpdates,h=a[y],h===null?a[y]=[o]:h.push(o),o.lane=c|536870912),S):null}function Qu(a){if(50<Ws)throw Ws=0,gv=null,Error(r(185));for(var o=a.return;o!==null;)a=o,o=a.return;return a.tag===3?a.stateNode:null}var To={};function lI(a,o,c,h){this.tag=a,this.key=c,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=o,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=h,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function En(a,o,c,h){return new lI(a,o,c,h)}function hm(a){return a=a.prototype,!(!a||!a.isReactComponent)}function qr(a,o){var c=a.alternate;return c===null?(c=En(a.tag,o,a.key,a.mode),c.elementType=a.elementType,c.type=a.type,c.stateNode=a.stateNode,c.alternate=a,a.alternate=c):(c.pendingProps=o,c.type=a.type,c.flags=0,c.subtreeFlags=0,c.deletions=null),c.flags=a.flags&65011712,c.childLanes=a.childLanes,c.lanes=a.lanes,c.child=a.child,c.memoizedProps=a.memoizedProps,c.memoizedState=a.memoizedState,c.updateQueue=a.updateQueue,o=a.dependencies,c.dependencies=o===null?null:{lanes:o.lanes,firstContext:o.firstContext},c.sibling=a.sibling,c.index=a.index,c.ref=a.ref,c.refCleanup=a.refCleanup,c}function Ej(a,o){a.flags&=65011714;var c=a.alternate;return c===null?(a.childLanes=0,a.lanes=o,a.child=null,a.subtreeFlags=0,a.memoizedProps=null,a.memoizedState=null,a.updateQueue=null,a.dependencies=null,a.stateNode=null):(a.childLanes=c.childLanes,a.lanes=c.lanes,a.child=c.child,a.subtreeFlags=0,a.deletions=null,a.memoizedProps=c.memoizedProps,a.memoizedState=c.memoizedState,a.updateQueue=c.updateQueue,a.type=c.type,o=c.dependencies,a.dependencies=o===null?null:{lanes:o.lanes,firstContext:o.firstContext}),a}function Ju(a,o,c,h,y,S){var M=0;if(h=a,typeof a=="function")hm(a)&&(M=1);else if(typeof a=="string")M=cq(a,c,ue.current)?26:a==="html"||a==="head"||a==="body"?27:5;else e:switch(a){case L:return a=En(31,c,o,y),a.elementType=L,a.lanes=S,a;case j:return xi(c.children,y,S,o);case w:M=8,y|=24;break;case b:return a=En(12,c,o,y|2),a.elementType=b,a.lanes=S,a;case A:return a=En(13,c,o,y),a.elementType=A,a.lanes=S,a;case N:return a=En(19,c,o,y),a.elementType=N,a.lanes=S,a;default:if(typeof a=="object"&&a!==null)switch(a.$$typeof){case _:case E:M=10;break e;case O:M=9;break e;case C:M=11;break e;case P:M=14;break e;case D:M=16,h=null;break e}M=29,c=Error(r(130,a===null?"null":typeof a,"")),h=null}return o=En(M,c,o,y),o.elementType=a,o.type=h,o.lanes=S,o}function xi(a,o,c,h){return a=En(7,a,h,o),a.lanes=c,a}function pm(a,o,c){return a=En(6,a,null,o),a.lanes=c,a}function mm(a,o,c){return o=En(4,a.children!==null?a.children:[],a.key,o),o.lanes=c,o.stateNode={containerInfo:a.containerInfo,pendingChildren:null,implementation:a.implementation},o}var Co=[],No=0,ef=null,tf=0,Gn=[],Vn=0,wi=null,Br=1,zr="";function Si(a,o){Co[No++]=tf,Co[No++]=ef,ef=a,tf=o}function Tj(a,o,c){Gn[Vn++]=Br,Gn[Vn++]=zr,Gn[Vn++]=wi,wi=a;var h=Br;a=zr;var y=32-_n(h)-1;h&=~(1<<y),c+=1;var S=32-_n(o)+y;if(30<S){var M=y-y%5;S=(h&(1<<M)-1).toString(32),h>>=M,y-=M,Br=1<<32-_n(o)+y|c<<y|h,zr=S+a}else Br=1<<S|c<<y|h,zr=a}function vm(a){a.return!==null&&(Si(a,1),Tj(a,1,0))}function ym(a){for(;a===ef;)ef=Co[--No],Co[No]=null,tf=Co[--No],Co[No]=null;for(;a===wi;)wi=Gn[--Vn],Gn[Vn]=null,zr=Gn[--Vn],Gn[Vn]=null,Br=Gn[--Vn],Gn[Vn]=null}var fn=null,Et=null,et=!1,ji=null,br=!1,gm=Error(r(519));function Oi(a){var o=Error(r(418,""));throw Ts(Hn(o,a)),gm}function Cj(a){var o=a.stateNode,c=a.type,h=a.memoizedProps;switch(o[rn]=a,o[yn]=h,c){case"dialog":Ge("cancel",o),Ge("close",o);break;case"iframe":case"object":case"embed":Ge("load",o);break;case"video":case"audio":for(c=0;c<Qs.length;c++)Ge(Qs[c],o);break;case"source":Ge("error",o);break;case"img":case"image":case"link":Ge("error",o),Ge("load",o);break;case"details":Ge("toggle",o);break;case"input":Ge("invalid",o),FS(o,h.value,h.defaultValue,h.checked,h.defaultChecked,h.type,h.name,!0),zu(o);break;case"select":Ge("invalid",o);break;case"textarea":Ge("invalid",o),VS(o,h.value,h.defaultValue,h.children),zu(o)}c=h.children,typeof c!="string"&&typeof c!="number"&&typeof c!="bigint"||o.textContent===""+c||h.suppressHydrationWarning===!0||V_(o.textContent,c)?(h.popover!=null&&(Ge("beforetoggle",o),Ge("toggle",o)),h.onScroll!=null&&Ge("scroll",o),h.onScrollEnd!=null&&Ge("scrollend",o),h.onClick!=null&&(o.onclick=$f),o=!0):o=!1,o||Oi(a)}function Nj(a){for(fn=a.return;fn;)switch(fn.tag){case 5:case 13:br=!1;return;case 27:case 3:br=!0;return;default:fn=fn.return}}function As(a){if(a!==fn)return!1;if(!et)return Nj(a),et=!0,!1;var o=a.tag,c;if((c=o!==3&&o!==27)&&((c=o===5)&&(c=a.type,c=!(c!=="form"&&c!=="button")||Dv(a.type,a.memoizedProps)),c=!c),c&&Et&&Oi(a),Nj(a),o===13){if(a=a.memoizedState,a=a!==null?a.dehydrated:null,!a)throw Error(r(317));e:{for(a=a.nextSibling,o=0;a;){if(a.nodeType===8)if(c=a.data,c==="/$"){if(o===0){Et=or(a.nextSibling);break e}o--}else c!=="$"&&c!=="$!"&&c!=="$?"||o++;a=a.nextSibling}Et=null}}else o===27?(o=Et,Ua(a.type)?(a=Iv,Iv=null,Et=a):Et=o):Et=fn?or(a.stateNode.nextSibling):null;return!0}function Es(){Et=fn=null,et=!1}function Mj(){var a=ji;return a!==null&&(wn===null?wn=a:wn.push.apply(wn,a),ji=null),a}function Ts(a){ji===null?ji=[a]:ji.push(a)}var bm=X(null),_i=null,Ur=null;function Ea(a,o,c){ne(bm,o._currentValue),o._currentValue=c}function Hr(a){a._currentValue=bm.current,te(bm)}function xm(a,o,c){for(;a!==null;){var h=a.alternate;if((a.childLanes&o)!==o?(a.childLanes|=o,h!==null&&(h.childLanes|=o)):h!==null&&(h.childLanes&o)!==o&&(h.childLanes|=o),a===c)break;a=a.return}}function wm(a,o,c,h){var y=a.child;for(y!==null&&(y.return=a);y!==null;){var S=y.dependencies;if(S!==null){var M=y.child;S=S.firstContext;e:for(;S!==null;){var R=S;S=y;for(var q=0;q<o.length;q++)if(R.context===o[q]){S.lanes|=c,R=S.alternate,R!==null&&(R.lanes|=c),xm(S.return,c,a),h||(M=null);break e}S=R.next}}else if(y.tag===18){if(M=y.return,M===null)throw Error(r(341));M.lanes|=c,S=M.alternate,S!==null&&(S.lanes|=c),xm(M,c,a),M=null}else M=y.child;if(M!==null)M.return=y;else for(M=y;M!==null;){if(M===a){M=null;break}if(y=M.sibling,y!==null){y.return=M.return,M=y;break}M=M.return}y=M}}function Cs(a,o,c,h){a=null;for(var y=o,S=!1;y!==null;){if(!S){if((y.flags&524288)!==0)S=!0;else if((y.flags&262144)!==0)break}if(y.tag===10){var M=y.alternate;if(M===null)throw Error(r(387));if(M=M.memoizedProps,M!==null){var R=y.type;An(y.pendingProps.value,M.value)||(a!==null?a.push(R):a=[R])}}else if(y===de.current){if(M=y.alternate,M===null)throw Error(r(387));M.memoizedState.memoizedState!==y.memoizedState.memoizedState&&(a!==null?a.push(ac):a=[ac])}y=y.return}a!==null&&wm(o,a,c,h),o.flags|=262144}function nf(a){for(a=a.firstContext;a!==null;){if(!An(a.context._currentValue,a.memoizedValue))return!0;a=a.next}return!1}function Ai(a){_i=a,Ur=null,a=a.dependencies,a!==null&&(a.firstContext=null)}function an(a){return Pj(_i,a)}function rf(a,o){return _i===null&&Ai(a),Pj(a,o)}function Pj(a,o){var c=o._currentValue;if(o={context:o,memoizedValue:c,next:null},Ur===null){if(a===null)throw Error(r(308));Ur=o,a.dependencies={lanes:0,firstContext:o},a.flags|=524288}else Ur=Ur.next=o;return c}var sI=typeof AbortController<"u"?AbortController:function(){var a=[],o=this.signal={aborted:!1,addEventListener:function(c,h){a.push(h)}};this.abort=function(){o.aborted=!0,a.forEach(function(c){return c()})}},cI=e.unstable_scheduleCallback,uI=e.unstable_NormalPriority,It={$$typeof:E,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Sm(){return{controller:new sI,data:new Map,refCount:0}}function Ns(a){a.refCount--,a.refCount===0&&cI(uI,function(){a.controller.abort()})}var Ms=null,jm=0,Mo=0,Po=null;function fI(a,o){if(Ms===null){var c=Ms=[];jm=0,Mo=_v(),Po={status:"pending",value:void 0,then:function(h){c.push(h)}}}return jm++,o.then(Rj,Rj),o}function Rj(){if(--jm===0&&Ms!==null){Po!==null&&(Po.status="fulfilled");var a=Ms;Ms=null,Mo=0,Po=null;for(var o=0;o<a.length;o++)(0,a[o])()}}function dI(a,o){var c=[],h={status:"pending",value:null,reason:null,then:function(y){c.push(y)}};return a.then(function(){h.status="fulfilled",h.value=o;for(var y=0;y<c.length;y++)(0,c[y])(o)},function(y){for(h.status="rejected",h.reason=y,y=0;y<c.length;y++)(0,c[y])(void 0)}),h}var Dj=$.S;$.S=function(a,o){typeof o=="object"&&o!==null&&typeof o.then=="function"&&fI(a,o),Dj!==null&&Dj(a,o)};var Ei=X(null);function Om(){var a=Ei.current;return a!==null?a:yt.pooledCache}function af(a,o){o===null?ne(Ei,Ei.current):ne(Ei,o.pool)}function kj(){var a=Om();return a===null?null:{parent:It._currentValue,pool:a}}var Ps=Error(r(460)),$j=Error(r(474)),of=Error(r(542)),_m={then:function(){}};function Lj(a){return a=a.status,a==="fulfilled"||a==="rejected"}function lf(){}function Ij(a,o,c){switch(c=a[c],c===void 0?a.push(o):c!==o&&(o.then(lf,lf),o=c),o.status){case"fulfilled":return o.value;case"rejected":throw a=o.reason,Bj(a),a;default:if(typeof o.status=="string")o.then(lf,lf);else{if(a=yt,a!==null&&100<a.shellSuspendCounter)throw Error(r(482));a=o,a.status="pending",a.then(function(h){if(o.status==="pending"){var y=o;y.status="fulfilled",y.value=h}},function(h){if(o.status==="pending"){var y=o;y.status="rejected",y.reason=h}})}switch(o.status){case"fulfilled":return o.value;case"rejected":throw a=o.reason,Bj(a),a}throw Rs=o,Ps}}var Rs=null;function qj(){if(Rs===null)throw Error(r(459));var a=Rs;return Rs=null,a}function Bj(a){if(a===Ps||a===of)throw Error(r(483))}var Ta=!1;function Am(a){a.updateQueue={baseState:a.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Em(a,o){a=a.updateQueue,o.updateQueue===a&&(o.updateQueue={baseState:a.baseState,firstBaseUpdate:a.firstBaseUpdate,lastBaseUpdate:a.lastBaseUpdate,shared:a.shared,callbacks:null})}function Ca(a){return{lane:a,tag:0,payload:null,callback:null,next:null}}function Na(a,o,c){var h=a.updateQueue;if(h===null)return null;if(h=h.shared,(at&2)!==0){var y=h.pending;return y===null?o.next=o:(o.next=y.next,y.next=o),h.pending=o,o=Qu(a),Aj(a,null,c),o}return Zu(a,h,o,c),Qu(a)}function Ds(a,o,c){if(o=o.updateQueue,o!==null&&(o=o.shared,(c&4194048)!==0)){var h=o.lanes;h&=a.pendingLanes,c|=h,o.lanes=c,RS(a,c)}}function Tm(a,o){var c=a.updateQueue,h=a.alternate;if(h!==null&&(h=h.updateQueue,c===h)){var y=null,S=null;if(c=c.firstBaseUpdate,c!==null){do{var M={lane:c.lane,tag:c.tag,payload:c.payload,callback:null,next:null};S===null?y=S=M:S=S.next=M,c=c.next}while(c!==null);S===null?y=S=o:S=S.next=o}else y=S=o;c={baseState:h.baseState,firstBaseUpdate:y,lastBaseUpdate:S,shared:h.shared,callbacks:h.callbacks},a.updateQueue=c;return}a=c.lastBaseUpdate,a===null?c.firstBaseUpdate=o:a.next=o,c.lastBaseUpdate=o}var Cm=!1;function ks(){if(Cm){var a=Po;if(a!==null)throw a}}function $s(a,o,c,h){Cm=!1;var y=a.updateQueue;Ta=!1;var S=y.firstBaseUpdate,M=y.lastBaseUpdate,R=y.shared.pending;if(R!==null){y.shared.pending=null;var q=R,Q=q.next;q.next=null,M===null?S=Q:M.next=Q,M=q;var oe=a.alternate;oe!==null&&(oe=oe.updateQueue,R=oe.lastBaseUpdate,R!==M&&(R===null?oe.firstBaseUpdate=Q:R.next=Q,oe.lastBaseUpdate=q))}if(S!==null){var se=y.baseState;M=0,oe=Q=q=null,R=S;do{var J=R.lane&-536870913,ee=J!==R.lane;if(ee?(Xe&J)===J:(h&J)===J){J!==0&&J===Mo&&(Cm=!0),oe!==null&&(oe=oe.next={lane:0,tag:R.tag,payload:R.payload,callback:null,next:null});e:{var Ne=a,Ae=R;J=o;var ct=c;switch(Ae.tag){case 1:if(Ne=Ae.payload,typeof Ne=="function"){se=Ne.call(ct,se,J);break e}se=Ne;break e;case 3:Ne.flags=Ne.flags&-65537|128;case 0:if(Ne=Ae.payload,J=typeof Ne=="function"?Ne.call(ct,se,J):Ne,J==null)break e;se=m({},se,J);break e;case 2:Ta=!0}}J=R.callback,J!==null&&(a.flags|=64,ee&&(a.flags|=8192),ee=y.callbacks,ee===null?y.callbacks=[J]:ee.push(J))}else ee={lane:J,tag:R.tag,payload:R.payload,callback:R.callback,next:null},oe===null?(Q=oe=ee,q=se):oe=oe.next=ee,M|=J;if(R=R.next,R===null){if(R=y.shared.pending,R===null)break;ee=R,R=ee.next,ee.next=null,y.lastBaseUpdate=ee,y.shared.pending=null}}while(!0);oe===null&&(q=se),y.baseState=q,y.firstBaseUpdate=Q,y.lastBaseUpdate=oe,S===null&&(y.shared.lanes=0),Ia|=M,a.lanes=M,a.memoizedState=se}}function zj(a,o){if(typeof a!="function")throw Error(r(191,a));a.call(o)}function Uj(a,o){var c=a.callbacks;if(c!==null)for(a.callbacks=null,a=0;a<c.length;a++)zj(c[a],o)}var Ro=X(null),sf=X(0);function Hj(a,o){a=Wr,ne(sf,a),ne(Ro,o),Wr=a|o.baseLanes}function Nm(){ne(sf,Wr),ne(Ro,Ro.current)}function Mm(){Wr=sf.current,te(Ro),te(sf)}var Ma=0,Be=null,lt=null,Dt=null,cf=!1,Do=!1,Ti=!1,uf=0,Ls=0,ko=null,hI=0;function Pt(){throw Error(r(321))}function Pm(a,o){if(o===null)return!1;for(var c=0;c<o.length&&c<a.length;c++)if(!An(a[c],o[c]))return!1;return!0}function Rm(a,o,c,h,y,S){return Ma=S,Be=o,o.memoizedState=null,o.updateQueue=null,o.lanes=0,$.H=a===null||a.memoizedState===null?AO:EO,Ti=!1,S=c(h,y),Ti=!1,Do&&(S=Gj(o,c,h,y)),Fj(a),S}function Fj(a){$.H=vf;var o=lt!==null&&lt.next!==null;if(Ma=0,Dt=lt=Be=null,cf=!1,Ls=0,ko=null,o)throw Error(r(300));a===null||Gt||(a=a.dependencies,a!==null&&nf(a)&&(Gt=!0))}function Gj(a,o,c,h){Be=a;var y=0;do{if(Do&&(ko=null),Ls=0,Do=!1,25<=y)throw Error(r(301));if(y+=1,Dt=lt=null,a.updateQueue!=null){var S=a.updateQueue;S.lastEffect=null,S.events=null,S.stores=null,S.memoCache!=null&&(S.memoCache.index=0)}$.H=xI,S=o(c,h)}while(Do);return S}function pI(){var a=$.H,o=a.useState()[0];return o=typeof o.then=="function"?Is(o):o,a=a.useState()[0],(lt!==null?lt.memoizedState:null)!==a&&(Be.flags|=1024),o}function Dm(){var a=uf!==0;return uf=0,a}function km(a,o,c){o.updateQueue=a.updateQueue,o.flags&=-2053,a.lanes&=~c}function $m(a){if(cf){for(a=a.memoizedState;a!==null;){var o=a.queue;o!==null&&(o.pending=null),a=a.next}cf=!1}Ma=0,Dt=lt=Be=null,Do=!1,Ls=uf=0,ko=null}function bn(){var a={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Dt===null?Be.memoizedState=Dt=a:Dt=Dt.next=a,Dt}function kt(){if(lt===null){var a=Be.alternate;a=a!==null?a.memoizedState:null}else a=lt.next;var o=Dt===null?Be.memoizedState:Dt.next;if(o!==null)Dt=o,lt=a;else{if(a===null)throw Be.alternate===null?Error(r(467)):Error(r(310));lt=a,a={memoizedState:lt.memoizedState,baseState:lt.baseState,baseQueue:lt.baseQueue,queue:lt.queue,next:null},Dt===null?Be.memoizedState=Dt=a:Dt=Dt.next=a}return Dt}function Lm(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function Is(a){var o=Ls;return Ls+=1,ko===null&&(ko=[]),a=Ij(ko,a,o),o=Be,(Dt===null?o.memoizedState:Dt.next)===null&&(o=o.alternate,$.H=o===null||o.memoizedState===null?AO:EO),a}function ff(a){if(a!==null&&typeof a=="object"){if(typeof a.then=="function")return Is(a);if(a.$$typeof===E)return an(a)}throw Error(r(438,String(a)))}function Im(a){var o=null,c=Be.updateQueue;if(c!==null&&(o=c.memoCache),o==null){var h=Be.alternate;h!==null&&(h=h.updateQueue,h!==null&&(h=h.memoCache,h!=null&&(o={data:h.data.map(function(y){return y.slice()}),index:0})))}if(o==null&&(o={data:[],index:0}),c===null&&(c=Lm(),Be.updateQueue=c),c.memoCache=o,c=o.data[o.index],c===void 0)for(c=o.data[o.index]=Array(a),h=0;h<a;h++)c[h]=G;return o.index++,c}function Fr(a,o){return typeof o=="function"?o(a):o}function df(a){var o=kt();return qm(o,lt,a)}function qm(a,o,c){var h=a.queue;if(h===null)throw Error(r(311));h.lastRenderedReducer=c;var y=a.baseQueue,S=h.pending;if(S!==null){if(y!==null){var M=y.next;y.next=S.next,S.next=M}o.baseQueue=y=S,h.pending=null}if(S=a.baseState,y===null)a.memoizedState=S;else{o=y.next;var R=M=null,q=null,Q=o,oe=!1;do{var se=Q.lane&-536870913;if(se!==Q.lane?(Xe&se)===se:(Ma&se)===se){var J=Q.revertLane;if(J===0)q!==null&&(q=q.next={lane:0,revertLane:0,action:Q.action,hasEagerState:Q.hasEagerState,eagerState:Q.eagerState,next:null}),se===Mo&&(oe=!0);else if((Ma&J)===J){Q=Q.next,J===Mo&&(oe=!0);continue}else se={lane:0,revertLane:Q.revertLane,action:Q.action,hasEagerState:Q.hasEagerState,eagerState:Q.eagerState,next:null},q===null?(R=q=se,M=S):q=q.next=se,Be.lanes|=J,Ia|=J;se=Q.action,Ti&&c(S,se),S=Q.hasEagerState?Q.eagerState:c(S,se)}else J={lane:se,revertLane:Q.revertLane,action:Q.action,hasEagerState:Q.hasEagerState,eagerState:Q.eagerState,next:null},q===null?(R=q=J,M=S):q=q.next=J,Be.lanes|=se,Ia|=se;Q=Q.next}while(Q!==null&&Q!==o);if(q===null?M=S:q.next=R,!An(S,a.memoizedState)&&(Gt=!0,oe&&(c=Po,c!==null)))throw c;a.memoizedState=S,a.baseState=M,a.baseQueue=q,h.lastRenderedState=S}return y===null&&(h.lanes=0),[a.memoizedState,h.dispatch]}function Bm(a){var o=kt(),c=o.queue;if(c===null)throw Error(r(311));c.lastRenderedReducer=a;var h=c.dispatch,y=c.pending,S=o.memoizedState;if(y!==null){c.pending=null;var M=y=y.next;do S=a(S,M.action),M=M.next;while(M!==y);An(S,o.memoizedState)||(Gt=!0),o.memoizedState=S,o.baseQueue===null&&(o.baseState=S),c.lastRenderedState=S}return[S,h]}function Vj(a,o,c){var h=Be,y=kt(),S=et;if(S){if(c===void 0)throw Error(r(407));c=c()}else c=o();var M=!An((lt||y).memoizedState,c);M&&(y.memoizedState=c,Gt=!0),y=y.queue;var R=Xj.bind(null,h,y,a);if(qs(2048,8,R,[a]),y.getSnapshot!==o||M||Dt!==null&&Dt.memoizedState.tag&1){if(h.flags|=2048,$o(9,hf(),Kj.bind(null,h,y,c,o),null),yt===null)throw Error(r(349));S||(Ma&124)!==0||Yj(h,o,c)}return c}function Yj(a,o,c){a.flags|=16384,a={getSnapshot:o,value:c},o=Be.updateQueue,o===null?(o=Lm(),Be.updateQueue=o,o.stores=[a]):(c=o.stores,c===null?o.stores=[a]:c.push(a))}function Kj(a,o,c,h){o.value=c,o.getSnapshot=h,Wj(o)&&Zj(a)}function Xj(a,o,c){return c(function(){Wj(o)&&Zj(a)})}function Wj(a){var o=a.getSnapshot;a=a.value;try{var c=o();return!An(a,c)}catch{return!0}}function Zj(a){var o=Eo(a,2);o!==null&&Pn(o,a,2)}function zm(a){var o=bn();if(typeof a=="function"){var c=a;if(a=c(),Ti){Oa(!0);try{c()}finally{Oa(!1)}}}return o.memoizedState=o.baseState=a,o.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Fr,lastRenderedState:a},o}function Qj(a,o,c,h){return a.baseState=c,qm(a,lt,typeof h=="function"?h:Fr)}function mI(a,o,c,h,y){if(mf(a))throw Error(r(485));if(a=o.action,a!==null){var S={payload:y,action:a,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(M){S.listeners.push(M)}};$.T!==null?c(!0):S.isTransition=!1,h(S),c=o.pending,c===null?(S.next=o.pending=S,Jj(o,S)):(S.next=c.next,o.pending=c.next=S)}}function Jj(a,o){var c=o.action,h=o.payload,y=a.state;if(o.isTransition){var S=$.T,M={};$.T=M;try{var R=c(y,h),q=$.S;q!==null&&q(M,R),eO(a,o,R)}catch(Q){Um(a,o,Q)}finally{$.T=S}}else try{S=c(y,h),eO(a,o,S)}catch(Q){Um(a,o,Q)}}function eO(a,o,c){c!==null&&typeof c=="object"&&typeof c.then=="function"?c.then(function(h){tO(a,o,h)},function(h){return Um(a,o,h)}):tO(a,o,c)}function tO(a,o,c){o.status="fulfilled",o.value=c,nO(o),a.state=c,o=a.pending,o!==null&&(c=o.next,c===o?a.pending=null:(c=c.next,o.next=c,Jj(a,c)))}function Um(a,o,c){var h=a.pending;if(a.pending=null,h!==null){h=h.next;do o.status="rejected",o.reason=c,nO(o),o=o.next;while(o!==h)}a.action=null}function nO(a){a=a.listeners;for(var o=0;o<a.length;o++)(0,a[o])()}function rO(a,o){return o}function aO(a,o){if(et){var c=yt.formState;if(c!==null){e:{var h=Be;if(et){if(Et){t:{for(var y=Et,S=br;y.nodeType!==8;){if(!S){y=null;break t}if(y=or(y.nextSibling),y===null){y=null;break t}}S=y.data,y=S==="F!"||S==="F"?y:null}if(y){Et=or(y.nextSibling),h=y.data==="F!";break e}}Oi(h)}h=!1}h&&(o=c[0])}}return c=bn(),c.memoizedState=c.baseState=o,h={pending:null,lanes:0,dispatch:null,lastRenderedReducer:rO,lastRenderedState:o},c.queue=h,c=jO.bind(null,Be,h),h.dispatch=c,h=zm(!1),S=Ym.bind(null,Be,!1,h.queue),h=bn(),y={state:o,dispatch:null,action:a,pending:null},h.queue=y,c=mI.bind(null,Be,y,S,c),y.dispatch=c,h.memoizedState=a,[o,c,!1]}function iO(a){var o=kt();return oO(o,lt,a)}function oO(a,o,c){if(o=qm(a,o,rO)[0],a=df(Fr)[0],typeof o=="object"&&o!==null&&typeof o.then=="function")try{var h=Is(o)}catch(M){throw M===Ps?of:M}else h=o;o=kt();var y=o.queue,S=y.dispatch;return c!==o.memoizedState&&(Be.flags|=2048,$o(9,hf(),vI.bind(null,y,c),null)),[h,S,a]}function vI(a,o){a.action=o}function lO(a){var o=kt(),c=lt;if(c!==null)return oO(o,c,a);kt(),o=o.memoizedState,c=kt();var h=c.queue.dispatch;return c.memoizedState=a,[o,h,!1]}function $o(a,o,c,h){return a={tag:a,create:c,deps:h,inst:o,next:null},o=Be.updateQueue,o===null&&(o=Lm(),Be.updateQueue=o),c=o.lastEffect,c===null?o.lastEffect=a.next=a:(h=c.next,c.next=a,a.next=h,o.lastEffect=a),a}function hf(){return{destroy:void 0,resource:void 0}}function sO(){return kt().memoizedState}function pf(a,o,c,h){var y=bn();h=h===void 0?null:h,Be.flags|=a,y.memoizedState=$o(1|o,hf(),c,h)}function qs(a,o,c,h){var y=kt();h=h===void 0?null:h;var S=y.memoizedState.inst;lt!==null&&h!==null&&Pm(h,lt.memoizedState.deps)?y.memoizedState=$o(o,S,c,h):(Be.flags|=a,y.memoizedState=$o(1|o,S,c,h))}function cO(a,o){pf(8390656,8,a,o)}function uO(a,o){qs(2048,8,a,o)}function fO(a,o){return qs(4,2,a,o)}function dO(a,o){return qs(4,4,a,o)}function hO(a,o){if(typeof o=="function"){a=a();var c=o(a);return function(){typeof c=="function"?c():o(null)}}if(o!=null)return a=a(),o.current=a,function(){o.current=null}}function pO(a,o,c){c=c!=null?c.concat([a]):null,qs(4,4,hO.bind(null,o,a),c)}function Hm(){}function mO(a,o){var c=kt();o=o===void 0?null:o;var h=c.memoizedState;return o!==null&&Pm(o,h[1])?h[0]:(c.memoizedState=[a,o],a)}function vO(a,o){var c=kt();o=o===void 0?null:o;var h=c.memoizedState;if(o!==null&&Pm(o,h[1]))return h[0];if(h=a(),Ti){Oa(!0);try{a()}finally{Oa(!1)}}return c.memoizedState=[h,o],h}function Fm(a,o,c){return c===void 0||(Ma&1073741824)!==0?a.memoizedState=o:(a.memoizedState=c,a=b_(),Be.lanes|=a,Ia|=a,c)}function yO(a,o,c,h){return An(c,o)?c:Ro.current!==null?(a=Fm(a,c,h),An(a,o)||(Gt=!0),a):(Ma&42)===0?(Gt=!0,a.memoizedState=c):(a=b_(),Be.lanes|=a,Ia|=a,o)}function gO(a,o,c,h,y){var S=U.p;U.p=S!==0&&8>S?S:8;var M=$.T,R={};$.T=R,Ym(a,!1,o,c);try{var q=y(),Q=$.S;if(Q!==null&&Q(R,q),q!==null&&typeof q=="object"&&typeof q.then=="function"){var oe=dI(q,h);Bs(a,o,oe,Mn(a))}else Bs(a,o,h,Mn(a))}catch(se){Bs(a,o,{then:function(){},status:"rejected",reason:se},Mn())}finally{U.p=S,$.T=M}}function yI(){}function Gm(a,o,c,h){if(a.tag!==5)throw Error(r(476));var y=bO(a).queue;gO(a,y,o,B,c===null?yI:function(){return xO(a),c(h)})}function bO(a){var o=a.memoizedState;if(o!==null)return o;o={memoizedState:B,baseState:B,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Fr,lastRenderedState:B},next:null};var c={};return o.next={memoizedState:c,baseState:c,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Fr,lastRenderedState:c},next:null},a.memoizedState=o,a=a.alternate,a!==null&&(a.memoizedState=o),o}function xO(a){var o=bO(a).next.queue;Bs(a,o,{},Mn())}function Vm(){return an(ac)}function wO(){return kt().memoizedState}function SO(){return kt().memoizedState}function gI(a){for(var o=a.return;o!==null;){switch(o.tag){case 24:case 3:var c=Mn();a=Ca(c);var h=Na(o,a,c);h!==null&&(Pn(h,o,c),Ds(h,o,c)),o={cache:Sm()},a.payload=o;return}o=o.return}}function bI(a,o,c){var h=Mn();c={lane:h,revertLane:0,action:c,hasEagerState:!1,eagerState:null,next:null},mf(a)?OO(o,c):(c=dm(a,o,c,h),c!==null&&(Pn(c,a,h),_O(c,o,h)))}function jO(a,o,c){var h=Mn();Bs(a,o,c,h)}function Bs(a,o,c,h){var y={lane:h,revertLane:0,action:c,hasEagerState:!1,eagerState:null,next:null};if(mf(a))OO(o,y);else{var S=a.alternate;if(a.lanes===0&&(S===null||S.lanes===0)&&(S=o.lastRenderedReducer,S!==null))try{var M=o.lastRenderedState,R=S(M,c);if(y.hasEagerState=!0,y.eagerState=R,An(R,M))return Zu(a,o,y,0),yt===null&&Wu(),!1}catch{}finally{}if(c=dm(a,o,y,h),c!==null)return Pn(c,a,h),_O(c,o,h),!0}return!1}function Ym(a,o,c,h){if(h={lane:2,revertLane:_v(),action:h,hasEagerState:!1,eagerState:null,next:null},mf(a)){if(o)throw Error(r(479))}else o=dm(a,c,h,2),o!==null&&Pn(o,a,2)}function mf(a){var o=a.alternate;return a===Be||o!==null&&o===Be}function OO(a,o){Do=cf=!0;var c=a.pending;c===null?o.next=o:(o.next=c.next,c.next=o),a.pending=o}function _O(a,o,c){if((c&4194048)!==0){var h=o.lanes;h&=a.pendingLanes,c|=h,o.lanes=c,RS(a,c)}}var vf={readContext:an,use:ff,useCallback:Pt,useContext:Pt,useEffect:Pt,useImperativeHandle:Pt,useLayoutEffect:Pt,useInsertionEffect:Pt,useMemo:Pt,useReducer:Pt,useRef:Pt,useState:Pt,useDebugValue:Pt,useDeferredValue:Pt,useTransition:Pt,useSyncExternalStore:Pt,useId:Pt,useHostTransitionStatus:Pt,useFormState:Pt,useActionState:Pt,useOptimistic:Pt,useMemoCache:Pt,useCacheRefresh:Pt},AO={readContext:an,use:ff,useCallback:function(a,o){return bn().memoizedState=[a,o===void 0?null:o],a},useContext:an,useEffect:cO,useImperativeHandle:function(a,o,c){c=c!=null?c.concat([a]):null,pf(4194308,4,hO.bind(null,o,a),c)},useLayoutEffect:function(a,o){return pf(4194308,4,a,o)},useInsertionEffect:function(a,o){pf(4,2,a,o)},useMemo:function(a,o){var c=bn();o=o===void 0?null:o;var h=a();if(Ti){Oa(!0);try{a()}finally{Oa(!1)}}return c.memoizedState=[h,o],h},useReducer:function(a,o,c){var h=bn();if(c!==void 0){var y=c(o);if(Ti){Oa(!0);try{c(o)}finally{Oa(!1)}}}else y=o;return h.memoizedState=h.baseState=y,a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:a,lastRenderedState:y},h.queue=a,a=a.dispatch=bI.bind(null,Be,a),[h.memoizedState,a]},useRef:function(a){var o=bn();return a={current:a},o.memoizedState=a},useState:function(a){a=zm(a);var o=a.queue,c=jO.bind(null,Be,o);return o.dispatch=c,[a.memoizedState,c]},useDebugValue:Hm,useDeferredValue:function(a,o){var c=bn();return Fm(c,a,o)},useTransition:function(){var a=zm(!1);return a=gO.bind(null,Be,a.queue,!0,!1),bn().memoizedState=a,[!1,a]},useSyncExternalStore:function(a,o,c){var h=Be,y=bn();if(et){if(c===void 0)throw Error(r(407));c=c()}else{if(c=o(),yt===null)throw Error(r(349));(Xe&124)!==0||Yj(h,o,c)}y.memoizedState=c;var S={value:c,getSnapshot:o};return y.queue=S,cO(Xj.bind(null,h,S,a),[a]),h.flags|=2048,$o(9,hf(),Kj.bind(null,h,S,c,o),null),c},useId:function(){var a=bn(),o=yt.identifierPrefix;if(et){var c=zr,h=Br;c=(h&~(1<<32-_n(h)-1)).toString(32)+c,o="«"+o+"R"+c,c=uf++,0<c&&(o+="H"+c.toString(32)),o+="»"}else c=hI++,o="«"+o+"r"+c.toString(32)+"»";return a.memoizedState=o},useHostTransitionStatus:Vm,useFormState:aO,useActionState:aO,useOptimistic:function(a){var o=bn();o.memoizedState=o.baseState=a;var c={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return o.queue=c,o=Ym.bind(null,Be,!0,c),c.dispatch=o,[a,o]},useMemoCache:Im,useCacheRefresh:function(){return bn().memoizedState=gI.bind(null,Be)}},EO={readContext:an,use:ff,useCallback:mO,useContext:an,useEffect:uO,useImperativeHandle:pO,useInsertionEffect:fO,useLayoutEffect:dO,useMemo:vO,useReducer:df,useRef:sO,useState:function(){return df(Fr)},useDebugValue:Hm,useDeferredValue:function(a,o){var c=kt();return yO(c,lt.memoizedState,a,o)},useTransition:function(){var a=df(Fr)[0],o=kt().memoizedState;return[typeof a=="boolean"?a:Is(a),o]},useSyncExternalStore:Vj,useId:wO,useHostTransitionStatus:Vm,useFormState:iO,useActionState:iO,useOptimistic:function(a,o){var c=kt();return Qj(c,lt,a,o)},useMemoCache:Im,useCacheRefresh:SO},xI={readContext:an,use:ff,useCallback:mO,useContext:an,useEffect:uO,useImperativeHandle:pO,useInsertionEffect:fO,useLayoutEffect:dO,useMemo:vO,useReducer:Bm,useRef:sO,useState:function(){return Bm(Fr)},useDebugValue:Hm,useDeferredValue:function(a,o){var c=kt();return lt===null?Fm(c,a,o):yO(c,lt.memoizedState,a,o)},useTransition:function(){var a=Bm(Fr)[0],o=kt().memoizedState;return[typeof a=="boolean"?a:Is(a),o]},useSyncExternalStore:Vj,useId:wO,useHostTransitionStatus:Vm,useFormState:lO,useActionState:lO,useOptimistic:function(a,o){var c=kt();return lt!==null?Qj(c,lt,a,o):(c.baseState=a,[a,c.queue.dispatch])},useMemoCache:Im,useCacheRefresh:SO},Lo=null,zs=0;function yf(a){var o=zs;return zs+=1,Lo===null&&(Lo=[]),Ij(Lo,a,o)}function Us(a,o){o=o.props.ref,a.ref=o!==void 0?o:null}function gf(a,o){throw o.$$typeof===v?Error(r(525)):(a=Object.prototype.toString.call(o),Error(r(31,a==="[object Object]"?"object with keys {"+Object.keys(o).join(", ")+"}":a)))}function TO(a){var o=a._init;return o(a._payload)}function CO(a){function o(K,F){if(a){var W=K.deletions;W===null?(K.deletions=[F],K.flags|=16):W.push(F)}}function c(K,F){if(!a)return null;for(;F!==null;)o(K,F),F=F.sibling;return null}function h(K){for(var F=new Map;K!==null;)K.key!==null?F.set(K.key,K):F.set(K.index,K),K=K.sibling;return F}function y(K,F){return K=qr(K,F),K.index=0,K.sibling=null,K}function S(K,F,W){return K.index=W,a?(W=K.alternate,W!==null?(W=W.index,W<F?(K.flags|=67108866,F):W):(K.flags|=67108866,F)):(K.flags|=1048576,F)}function M(K){return a&&K.alternate===null&&(K.flags|=67108866),K}function R(K,F,W,le){return F===null||F.tag!==6?(F=pm(W,K.mode,le),F.return=K,F):(F=y(F,W),F.return=K,F)}function q(K,F,W,le){var be=W.type;return be===j?oe(K,F,W.props.children,le,W.key):F!==null&&(F.elementType===be||typeof be=="object"&&be!==null&&be.$$typeof===D&&TO(be)===F.type)?(F=y(F,W.props),Us(F,W),F.return=K,F):(F=Ju(W.type,W.key,W.props,null,K.mode,le),Us(F,W),F.return=K,F)}function Q(K,F,W,le){return F===null||F.tag!==4||F.stateNode.containerInfo!==W.containerInfo||F.stateNode.implementation!==W.implementation?(F=mm(W,K.mode,le),F.return=K,F):(F=y(F,W.children||[]),F.return=K,F)}function oe(K,F,W,le,be){return F===null||F.tag!==7?(F=xi(W,K.mode,le,be),F.return=K,F):(F=y(F,W),F.return=K,F)}function se(K,F,W){if(typeof F=="string"&&F!==""||typeof F=="number"||typeof F=="bigint")return F=pm(""+F,K.mode,W),F.return=K,F;if(typeof F=="object"&&F!==null){switch(F.$$typeof){case g:return W=Ju(F.type,F.key,F.props,null,K.mode,W),Us(W,F),W.return=K,W;case x:return F=mm(F,K.mode,W),F.return=K,F;case D:var le=F._init;return F=le(F._payload),se(K,F,W)}if(Y(F)||H(F))return F=xi(F,K.mode,W,null),F.return=K,F;if(typeof F.then=="function")return se(K,yf(F),W);if(F.$$typeof===E)return se(K,rf(K,F),W);gf(K,F)}return null}function J(K,F,W,le){var be=F!==null?F.key:null;if(typeof W=="string"&&W!==""||typeof W=="number"||typeof W=="bigint")return be!==null?null:R(K,F,""+W,le);if(typeof W=="object"&&W!==null){switch(W.$$typeof){case g:return W.key===be?q(K,F,W,le):null;case x:return W.key===be?Q(K,F,W,le):null;case D:return be=W._init,W=be(W._payload),J(K,F,W,le)}if(Y(W)||H(W))return be!==null?null:oe(K,F,W,le,null);if(typeof W.then=="function")return J(K,F,yf(W),le);if(W.$$typeof===E)return J(K,F,rf(K,W),le);gf(K,W)}return null}function ee(K,F,W,le,be){if(typeof le=="string"&&le!==""||typeof le=="number"||typeof le=="bigint")return K=K.get(W)||null,R(F,K,""+le,be);if(typeof le=="object"&&le!==null){switch(le.$$typeof){case g:return K=K.get(le.key===null?W:le.key)||null,q(F,K,le,be);case x:return K=K.get(le.key===null?W:le.key)||null,Q(F,K,le,be);case D:var Ue=le._init;return le=Ue(le._payload),ee(K,F,W,le,be)}if(Y(le)||H(le))return K=K.get(W)||null,oe(F,K,le,be,null);if(typeof le.then=="function")return ee(K,F,W,yf(le),be);if(le.$$typeof===E)return ee(K,F,W,rf(F,le),be);gf(F,le)}return null}function Ne(K,F,W,le){for(var be=null,Ue=null,Se=F,Ee=F=0,Yt=null;Se!==null&&Ee<W.length;Ee++){Se.index>Ee?(Yt=Se,Se=null):Yt=Se.sibling;var Ze=J(K,Se,W[Ee],le);if(Ze===null){Se===null&&(Se=Yt);break}a&&Se&&Ze.alternate===null&&o(K,Se),F=S(Ze,F,Ee),Ue===null?be=Ze:Ue.sibling=Ze,Ue=Ze,Se=Yt}if(Ee===W.length)return c(K,Se),et&&Si(K,Ee),be;if(Se===null){for(;Ee<W.length;Ee++)Se=se(K,W[Ee],le),Se!==null&&(F=S(Se,F,Ee),Ue===null?be=Se:Ue.sibling=Se,Ue=Se);return et&&Si(K,Ee),be}for(Se=h(Se);Ee<W.length;Ee++)Yt=ee(Se,K,Ee,W[Ee],le),Yt!==null&&(a&&Yt.alternate!==null&&Se.delete(Yt.key===null?Ee:Yt.key),F=S(Yt,F,Ee),Ue===null?be=Yt:Ue.sibling=Yt,Ue=Yt);return a&&Se.forEach(function(Ya){return o(K,Ya)}),et&&Si(K,Ee),be}function Ae(K,F,W,le){if(W==null)throw Error(r(151));for(var be=null,Ue=null,Se=F,Ee=F=0,Yt=null,Ze=W.next();Se!==null&&!Ze.done;Ee++,Ze=W.next()){Se.index>Ee?(Yt=Se,Se=null):Yt=Se.sibling;var Ya=J(K,Se,Ze.value,le);if(Ya===null){Se===null&&(Se=Yt);break}a&&Se&&Ya.alternate===null&&o(K,Se),F=S(Ya,F,Ee),Ue===null?be=Ya:Ue.sibling=Ya,Ue=Ya,Se=Yt}if(Ze.done)return c(K,Se),et&&Si(K,Ee),be;if(Se===null){for(;!Ze.done;Ee++,Ze=W.next())Ze=se(K,Ze.value,le),Ze!==null&&(F=S(Ze,F,Ee),Ue===null?be=Ze:Ue.sibling=Ze,Ue=Ze);return et&&Si(K,Ee),be}for(Se=h(Se);!Ze.done;Ee++,Ze=W.next())Ze=ee(Se,K,Ee,Ze.value,le),Ze!==null&&(a&&Ze.alternate!==null&&Se.delete(Ze.key===null?Ee:Ze.key),F=S(Ze,F,Ee),Ue===null?be=Ze:Ue.sibling=Ze,Ue=Ze);return a&&Se.forEach(function(wq){return o(K,wq)}),et&&Si(K,Ee),be}function ct(K,F,W,le){if(typeof W=="object"&&W!==null&&W.type===j&&W.key===null&&(W=W.props.children),typeof W=="object"&&W!==null){switch(W.$$typeof){case g:e:{for(var be=W.key;F!==null;){if(F.key===be){if(be=W.type,be===j){if(F.tag===7){c(K,F.sibling),le=y(F,W.props.children),le.return=K,K=le;break e}}else if(F.elementType===be||typeof be=="object"&&be!==null&&be.$$typeof===D&&TO(be)===F.type){c(K,F.sibling),le=y(F,W.props),Us(le,W),le.return=K,K=le;break e}c(K,F);break}else o(K,F);F=F.sibling}W.type===j?(le=xi(W.props.children,K.mode,le,W.key),le.return=K,K=le):(le=Ju(W.type,W.key,W.props,null,K.mode,le),Us(le,W),le.return=K,K=le)}return M(K);case x:e:{for(be=W.key;F!==null;){if(F.key===be)if(F.tag===4&&F.stateNode.containerInfo===W.containerInfo&&F.stateNode.implementation===W.implementation){c(K,F.sibling),le=y(F,W.children||[]),le.return=K,K=le;break e}else{c(K,F);break}else o(K,F);F=F.sibling}le=mm(W,K.mode,le),le.return=K,K=le}return M(K);case D:return be=W._init,W=be(W._payload),ct(K,F,W,le)}if(Y(W))return Ne(K,F,W,le);if(H(W)){if(be=H(W),typeof be!="function")throw Error(r(150));return W=be.call(W),Ae(K,F,W,le)}if(typeof W.then=="function")return ct(K,F,yf(W),le);if(W.$$typeof===E)return ct(K,F,rf(K,W),le);gf(K,W)}return typeof W=="string"&&W!==""||typeof W=="number"||typeof W=="bigint"?(W=""+W,F!==null&&F.tag===6?(c(K,F.sibling),le=y(F,W),le.return=K,K=le):(c(K,F),le=pm(W,K.mode,le),le.return=K,K=le),M(K)):c(K,F)}return function(K,F,W,le){try{zs=0;var be=ct(K,F,W,le);return Lo=null,be}catch(Se){if(Se===Ps||Se===of)throw Se;var Ue=En(29,Se,null,K.mode);return Ue.lanes=le,Ue.return=K,Ue}finally{}}}var Io=CO(!0),NO=CO(!1),Yn=X(null),xr=null;function Pa(a){var o=a.alternate;ne(qt,qt.current&1),ne(Yn,a),xr===null&&(o===null||Ro.current!==null||o.memoizedState!==null)&&(xr=a)}function MO(a){if(a.tag===22){if(ne(qt,qt.current),ne(Yn,a),xr===null){var o=a.alternate;o!==null&&o.memoizedState!==null&&(xr=a)}}else Ra()}function Ra(){ne(qt,qt.current),ne(Yn,Yn.current)}function Gr(a){te(Yn),xr===a&&(xr=null),te(qt)}var qt=X(0);function bf(a){for(var o=a;o!==null;){if(o.tag===13){var c=o.memoizedState;if(c!==null&&(c=c.dehydrated,c===null||c.data==="$?"||Lv(c)))return o}else if(o.tag===19&&o.memoizedProps.revealOrder!==void 0){if((o.flags&128)!==0)return o}else if(o.child!==null){o.child.return=o,o=o.child;continue}if(o===a)break;for(;o.sibling===null;){if(o.return===null||o.return===a)return null;o=o.return}o.sibling.return=o.return,o=o.sibling}return null}function Km(a,o,c,h){o=a.memoizedState,c=c(h,o),c=c==null?o:m({},o,c),a.memoizedState=c,a.lanes===0&&(a.updateQueue.baseState=c)}var Xm={enqueueSetState:function(a,o,c){a=a._reactInternals;var h=Mn(),y=Ca(h);y.payload=o,c!=null&&(y.callback=c),o=Na(a,y,h),o!==null&&(Pn(o,a,h),Ds(o,a,h))},enqueueReplaceState:function(a,o,c){a=a._reactInternals;var h=Mn(),y=Ca(h);y.tag=1,y.payload=o,c!=null&&(y.callback=c),o=Na(a,y,h),o!==null&&(Pn(o,a,h),Ds(o,a,h))},enqueueForceUpdate:function(a,o){a=a._reactInternals;var c=Mn(),h=Ca(c);h.tag=2,o!=null&&(h.callback=o),o=Na(a,h,c),o!==null&&(Pn(o,a,c),Ds(o,a,c))}};function PO(a,o,c,h,y,S,M){return a=a.stateNode,typeof a.shouldComponentUpdate=="function"?a.shouldComponentUpdate(h,S,M):o.prototype&&o.prototype.isPureReactComponent?!Os(c,h)||!Os(y,S):!0}function RO(a,o,c,h){a=o.state,typeof o.componentWillReceiveProps=="function"&&o.componentWillReceiveProps(c,h),typeof o.UNSAFE_componentWillReceiveProps=="function"&&o.UNSAFE_componentWillReceiveProps(c,h),o.state!==a&&Xm.enqueueReplaceState(o,o.state,null)}function Ci(a,o){var c=o;if("ref"in o){c={};for(var h in o)h!=="ref"&&(c[h]=o[h])}if(a=a.defaultProps){c===o&&(c=m({},c));for(var y in a)c[y]===void 0&&(c[y]=a[y])}return c}var xf=typeof reportError=="function"?reportError:function(a){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var o=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof a=="object"&&a!==null&&typeof a.message=="string"?String(a.message):String(a),error:a});if(!window.dispatchEvent(o))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",a);return}console.error(a)};function DO(a){xf(a)}function kO(a){console.error(a)}function $O(a){xf(a)}function wf(a,o){try{var c=a.onUncaughtError;c(o.value,{componentStack:o.stack})}catch(h){setTimeout(function(){throw h})}}function LO(a,o,c){try{var h=a.onCaughtError;h(c.value,{componentStack:c.stack,errorBoundary:o.tag===1?o.stateNode:null})}catch(y){setTimeout(function(){throw y})}}function Wm(a,o,c){return c=Ca(c),c.tag=3,c.payload={element:null},c.callback=function(){wf(a,o)},c}function IO(a){return a=Ca(a),a.tag=3,a}function qO(a,o,c,h){var y=c.type.getDerivedStateFromError;if(typeof y=="function"){var S=h.value;a.payload=function(){return y(S)},a.callback=function(){LO(o,c,h)}}var M=c.stateNode;M!==null&&typeof M.componentDidCatch=="function"&&(a.callback=function(){LO(o,c,h),typeof y!="function"&&(qa===null?qa=new Set([this]):qa.add(this));var R=h.stack;this.componentDidCatch(h.value,{componentStack:R!==null?R:""})})}function wI(a,o,c,h,y){if(c.flags|=32768,h!==null&&typeof h=="object"&&typeof h.then=="function"){if(o=c.alternate,o!==null&&Cs(o,c,y,!0),c=Yn.current,c!==null){switch(c.tag){case 13:return xr===null?xv():c.alternate===null&&Tt===0&&(Tt=3),c.flags&=-257,c.flags|=65536,c.lanes=y,h===_m?c.flags|=16384:(o=c.updateQueue,o===null?c.updateQueue=new Set([h]):o.add(h),Sv(a,h,y)),!1;case 22:return c.flags|=65536,h===_m?c.flags|=16384:(o=c.updateQueue,o===null?(o={transitions:null,markerInstances:null,retryQueue:new Set([h])},c.updateQueue=o):(c=o.retryQueue,c===null?o.retryQueue=new Set([h]):c.add(h)),Sv(a,h,y)),!1}throw Error(r(435,c.tag))}return Sv(a,h,y),xv(),!1}if(et)return o=Yn.current,o!==null?((o.flags&65536)===0&&(o.flags|=256),o.flags|=65536,o.lanes=y,h!==gm&&(a=Error(r(422),{cause:h}),Ts(Hn(a,c)))):(h!==gm&&(o=Error(r(423),{cause:h}),Ts(Hn(o,c))),a=a.current.alternate,a.flags|=65536,y&=-y,a.lanes|=y,h=Hn(h,c),y=Wm(a.stateNode,h,y),Tm(a,y),Tt!==4&&(Tt=2)),!1;var S=Error(r(520),{cause:h});if(S=Hn(S,c),Xs===null?Xs=[S]:Xs.push(S),Tt!==4&&(Tt=2),o===null)return!0;h=Hn(h,c),c=o;do{switch(c.tag){case 3:return c.flags|=65536,a=y&-y,c.lanes|=a,a=Wm(c.stateNode,h,a),Tm(c,a),!1;case 1:if(o=c.type,S=c.stateNode,(c.flags&128)===0&&(typeof o.getDerivedStateFromError=="function"||S!==null&&typeof S.componentDidCatch=="function"&&(qa===null||!qa.has(S))))return c.flags|=65536,y&=-y,c.lanes|=y,y=IO(y),qO(y,a,c,h),Tm(c,y),!1}c=c.return}while(c!==null);return!1}var BO=Error(r(461)),Gt=!1;function Qt(a,o,c,h){o.child=a===null?NO(o,null,c,h):Io(o,a.child,c,h)}function zO(a,o,c,h,y){c=c.render;var S=o.ref;if("ref"in h){var M={};for(var R in h)R!=="ref"&&(M[R]=h[R])}else M=h;return Ai(o),h=Rm(a,o,c,M,S,y),R=Dm(),a!==null&&!Gt?(km(a,o,y),Vr(a,o,y)):(et&&R&&vm(o),o.flags|=1,Qt(a,o,h,y),o.child)}function UO(a,o,c,h,y){if(a===null){var S=c.type;return typeof S=="function"&&!hm(S)&&S.defaultProps===void 0&&c.compare===null?(o.tag=15,o.type=S,HO(a,o,S,h,y)):(a=Ju(c.type,null,h,o,o.mode,y),a.ref=o.ref,a.return=o,o.child=a)}if(S=a.child,!av(a,y)){var M=S.memoizedProps;if(c=c.compare,c=c!==null?c:Os,c(M,h)&&a.ref===o.ref)return Vr(a,o,y)}return o.flags|=1,a=qr(S,h),a.ref=o.ref,a.return=o,o.child=a}function HO(a,o,c,h,y){if(a!==null){var S=a.memoizedProps;if(Os(S,h)&&a.ref===o.ref)if(Gt=!1,o.pendingProps=h=S,av(a,y))(a.flags&131072)!==0&&(Gt=!0);else return o.lanes=a.lanes,Vr(a,o,y)}return Zm(a,o,c,h,y)}function FO(a,o,c){var h=o.pendingProps,y=h.children,S=a!==null?a.memoizedState:null;if(h.mode==="hidden"){if((o.flags&128)!==0){if(h=S!==null?S.baseLanes|c:c,a!==null){for(y=o.child=a.child,S=0;y!==null;)S=S|y.lanes|y.childLanes,y=y.sibling;o.childLanes=S&~h}else o.childLanes=0,o.child=null;return GO(a,o,h,c)}if((c&536870912)!==0)o.memoizedState={baseLanes:0,cachePool:null},a!==null&&af(o,S!==null?S.cachePool:null),S!==null?Hj(o,S):Nm(),MO(o);else return o.lanes=o.childLanes=536870912,GO(a,o,S!==null?S.baseLanes|c:c,c)}else S!==null?(af(o,S.cachePool),Hj(o,S),Ra(),o.memoizedState=null):(a!==null&&af(o,null),Nm(),Ra());return Qt(a,o,y,c),o.child}function GO(a,o,c,h){var y=Om();return y=y===null?null:{parent:It._currentValue,pool:y},o.memoizedState={baseLanes:c,cachePool:y},a!==null&&af(o,null),Nm(),MO(o),a!==null&&Cs(a,o,h,!0),null}function Sf(a,o){var c=o.ref;if(c===null)a!==null&&a.ref!==null&&(o.flags|=4194816);else{if(typeof c!="function"&&typeof c!="object")throw Error(r(284));(a===null||a.ref!==c)&&(o.flags|=4194816)}}function Zm(a,o,c,h,y){return Ai(o),c=Rm(a,o,c,h,void 0,y),h=Dm(),a!==null&&!Gt?(km(a,o,y),Vr(a,o,y)):(et&&h&&vm(o),o.flags|=1,Qt(a,o,c,y),o.child)}function VO(a,o,c,h,y,S){return Ai(o),o.updateQueue=null,c=Gj(o,h,c,y),Fj(a),h=Dm(),a!==null&&!Gt?(km(a,o,S),Vr(a,o,S)):(et&&h&&vm(o),o.flags|=1,Qt(a,o,c,S),o.child)}function YO(a,o,c,h,y){if(Ai(o),o.stateNode===null){var S=To,M=c.contextType;typeof M=="object"&&M!==null&&(S=an(M)),S=new c(h,S),o.memoizedState=S.state!==null&&S.state!==void 0?S.state:null,S.updater=Xm,o.stateNode=S,S._reactInternals=o,S=o.stateNode,S.props=h,S.state=o.memoizedState,S.refs={},Am(o),M=c.contextType,S.context=typeof M=="object"&&M!==null?an(M):To,S.state=o.memoizedState,M=c.getDerivedStateFromProps,typeof M=="function"&&(Km(o,c,M,h),S.state=o.memoizedState),typeof c.getDerivedStateFromProps=="function"||typeof S.getSnapshotBeforeUpdate=="function"||typeof S.UNSAFE_componentWillMount!="function"&&typeof S.componentWillMount!="function"||(M=S.state,typeof S.componentWillMount=="function"&&S.componentWillMount(),typeof S.UNSAFE_componentWillMount=="function"&&S.UNSAFE_componentWillMount(),M!==S.state&&Xm.enqueueReplaceState(S,S.state,null),$s(o,h,S,y),ks(),S.state=o.memoizedState),typeof S.componentDidMount=="function"&&(o.flags|=4194308),h=!0}else if(a===null){S=o.stateNode;var R=o.memoizedProps,q=Ci(c,R);S.props=q;var Q=S.context,oe=c.contextType;M=To,typeof oe=="object"&&oe!==null&&(M=an(oe));var se=c.getDerivedStateFromProps;oe=typeof se=="function"||typeof S.getSnapshotBeforeUpdate=="function",R=o.pendingProps!==R,oe||typeof S.UNSAFE_componentWillReceiveProps!="function"&&typeof S.componentWillReceiveProps!="function"||(R||Q!==M)&&RO(o,S,h,M),Ta=!1;var J=o.memoizedState;S.state=J,$s(o,h,S,y),ks(),Q=o.memoizedState,R||J!==Q||Ta?(typeof se=="function"&&(Km(o,c,se,h),Q=o.memoizedState),(q=Ta||PO(o,c,q,h,J,Q,M))?(oe||typeof S.UNSAFE_componentWillMount!="function"&&typeof S.componentWillMount!="function"||(typeof S.componentWillMount=="function"&&S.componentWillMount(),typeof S.UNSAFE_componentWillMount=="function"&&S.UNSAFE_componentWillMount()),typeof S.componentDidMount=="function"&&(o.flags|=4194308)):(typeof S.componentDidMount=="function"&&(o.flags|=4194308),o.memoizedProps=h,o.memoizedState=Q),S.props=h,S.state=Q,S.context=M,h=q):(typeof S.componentDidMount=="function"&&(o.flags|=4194308),h=!1)}else{S=o.stateNode,Em(a,o),M=o.memoizedProps,oe=Ci(c,M),S.props=oe,se=o.pendingProps,J=S.context,Q=c.contextType,q=To,typeof Q=="object"&&Q!==null&&(q=an(Q)),R=c.getDerivedStateFromProps,(Q=typeof R=="function"||typeof S.getSnapshotBeforeUpdate=="function")||typeof S.UNSAFE_componentWillReceiveProps!="function"&&typeof S.componentWillReceiveProps!="function"||(M!==se||J!==q)&&RO(o,S,h,q),Ta=!1,J=o.memoizedState,S.state=J,$s(o,h,S,y),ks();var ee=o.memoizedState;M!==se||J!==ee||Ta||a!==null&&a.dependencies!==null&&nf(a.dependencies)?(typeof R=="function"&&(Km(o,c,R,h),ee=o.memoizedState),(oe=Ta||PO(o,c,oe,h,J,ee,q)||a!==null&&a.dependencies!==null&&nf(a.dependencies))?(Q||typeof S.UNSAFE_componentWillUpdate!="function"&&typeof S.componentWillUpdate!="function"||(typeof S.componentWillUpdate=="function"&&S.componentWillUpdate(h,ee,q),typeof S.UNSAFE_componentWillUpdate=="function"&&S.UNSAFE_componentWillUpdate(h,ee,q)),typeof S.componentDidUpdate=="function"&&(o.flags|=4),typeof S.getSnapshotBeforeUpdate=="function"&&(o.flags|=1024)):(typeof S.componentDidUpdate!="function"||M===a.memoizedProps&&J===a.memoizedState||(o.flags|=4),typeof S.getSnapshotBeforeUpdate!="function"||M===a.memoizedProps&&J===a.memoizedState||(o.flags|=1024),o.memoizedProps=h,o.memoizedState=ee),S.props=h,S.state=ee,S.context=q,h=oe):(typeof S.componentDidUpdate!="function"||M===a.memoizedProps&&J===a.memoizedState||(o.flags|=4),typeof S.getSnapshotBeforeUpdate!="function"||M===a.memoizedProps&&J===a.memoizedState||(o.flags|=1024),h=!1)}return S=h,Sf(a,o),h=(o.flags&128)!==0,S||h?(S=o.stateNode,c=h&&typeof c.getDerivedStateFromError!="function"?null:S.render(),o.flags|=1,a!==null&&h?(o.child=Io(o,a.child,null,y),o.child=Io(o,null,c,y)):Qt(a,o,c,y),o.memoizedState=S.state,a=o.child):a=Vr(a,o,y),a}function KO(a,o,c,h){return Es(),o.flags|=256,Qt(a,o,c,h),o.child}var Qm={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function Jm(a){return{baseLanes:a,cachePool:kj()}}function ev(a,o,c){return a=a!==null?a.childLanes&~c:0,o&&(a|=Kn),a}function XO(a,o,c){var h=o.pendingProps,y=!1,S=(o.flags&128)!==0,M;if((M=S)||(M=a!==null&&a.memoizedState===null?!1:(qt.current&2)!==0),M&&(y=!0,o.flags&=-129),M=(o.flags&32)!==0,o.flags&=-33,a===null){if(et){if(y?Pa(o):Ra(),et){var R=Et,q;if(q=R){e:{for(q=R,R=br;q.nodeType!==8;){if(!R){R=null;break e}if(q=or(q.nextSibling),q===null){R=null;break e}}R=q}R!==null?(o.memoizedState={dehydrated:R,treeContext:wi!==null?{id:Br,overflow:zr}:null,retryLane:536870912,hydrationErrors:null},q=En(18,null,null,0),q.stateNode=R,q.return=o,o.child=q,fn=o,Et=null,q=!0):q=!1}q||Oi(o)}if(R=o.memoizedState,R!==null&&(R=R.dehydrated,R!==null))return Lv(R)?o.lanes=32:o.lanes=536870912,null;Gr(o)}return R=h.children,h=h.fallback,y?(Ra(),y=o.mode,R=jf({mode:"hidden",children:R},y),h=xi(h,y,c,null),R.return=o,h.return=o,R.sibling=h,o.child=R,y=o.child,y.memoizedState=Jm(c),y.childLanes=ev(a,M,c),o.memoizedState=Qm,h):(Pa(o),tv(o,R))}if(q=a.memoizedState,q!==null&&(R=q.dehydrated,R!==null)){if(S)o.flags&256?(Pa(o),o.flags&=-257,o=nv(a,o,c)):o.memoizedState!==null?(Ra(),o.child=a.child,o.flags|=128,o=null):(Ra(),y=h.fallback,R=o.mode,h=jf({mode:"visible",children:h.children},R),y=xi(y,R,c,null),y.flags|=2,h.return=o,y.return=o,h.sibling=y,o.child=h,Io(o,a.child,null,c),h=o.child,h.memoizedState=Jm(c),h.childLanes=ev(a,M,c),o.memoizedState=Qm,o=y);else if(Pa(o),Lv(R)){if(M=R.nextSibling&&R.nextSibling.dataset,M)var Q=M.dgst;M=Q,h=Error(r(419)),h.stack="",h.digest=M,Ts({value:h,source:null,stack:null}),o=nv(a,o,c)}else if(Gt||Cs(a,o,c,!1),M=(c&a.childLanes)!==0,Gt||M){if(M=yt,M!==null&&(h=c&-c,h=(h&42)!==0?1:Ip(h),h=(h&(M.suspendedLanes|c))!==0?0:h,h!==0&&h!==q.retryLane))throw q.retryLane=h,Eo(a,h),Pn(M,a,h),BO;R.data==="$?"||xv(),o=nv(a,o,c)}else R.data==="$?"?(o.flags|=192,o.child=a.child,o=null):(a=q.treeContext,Et=or(R.nextSibling),fn=o,et=!0,ji=null,br=!1,a!==null&&(Gn[Vn++]=Br,Gn[Vn++]=zr,Gn[Vn++]=wi,Br=a.id,zr=a.overflow,wi=o),o=tv(o,h.children),o.flags|=4096);return o}return y?(Ra(),y=h.fallback,R=o.mode,q=a.child,Q=q.sibling,h=qr(q,{mode:"hidden",children:h.children}),h.subtreeFlags=q.subtreeFlags&65011712,Q!==null?y=qr(Q,y):(y=xi(y,R,c,null),y.flags|=2),y.return=o,h.return=o,h.sibling=y,o.child=h,h=y,y=o.child,R=a.child.memoizedState,R===null?R=Jm(c):(q=R.cachePool,q!==null?(Q=It._currentValue,q=q.parent!==Q?{parent:Q,pool:Q}:q):q=kj(),R={baseLanes:R.baseLanes|c,cachePool:q}),y.memoizedState=R,y.childLanes=ev(a,M,c),o.memoizedState=Qm,h):(Pa(o),c=a.child,a=c.sibling,c=qr(c,{mode:"visible",children:h.children}),c.return=o,c.sibling=null,a!==null&&(M=o.deletions,M===null?(o.deletions=[a],o.flags|=16):M.push(a)),o.child=c,o.memoizedState=null,c)}function tv(a,o){return o=jf({mode:"visible",children:o},a.mode),o.return=a,a.child=o}function jf(a,o){return a=En(22,a,null,o),a.lanes=0,a.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null},a}function nv(a,o,c){return Io(o,a.child,null,c),a=tv(o,o.pendingProps.children),a.flags|=2,o.memoizedState=null,a}function WO(a,o,c){a.lanes|=o;var h=a.alternate;h!==null&&(h.lanes|=o),xm(a.return,o,c)}function rv(a,o,c,h,y){var S=a.memoizedState;S===null?a.memoizedState={isBackwards:o,rendering:null,renderingStartTime:0,last:h,tail:c,tailMode:y}:(S.isBackwards=o,S.rendering=null,S.renderingStartTime=0,S.last=h,S.tail=c,S.tailMode=y)}function ZO(a,o,c){var h=o.pendingProps,y=h.revealOrder,S=h.tail;if(Qt(a,o,h.children,c),h=qt.current,(h&2)!==0)h=h&1|2,o.flags|=128;else{if(a!==null&&(a.flags&128)!==0)e:for(a=o.child;a!==null;){if(a.tag===13)a.memoizedState!==null&&WO(a,c,o);else if(a.tag===19)WO(a,c,o);else if(a.child!==null){a.child.return=a,a=a.child;continue}if(a===o)break e;for(;a.sibling===null;){if(a.return===null||a.return===o)break e;a=a.return}a.sibling.return=a.return,a=a.sibling}h&=1}switch(ne(qt,h),y){case"forwards":for(c=o.child,y=null;c!==null;)a=c.alternate,a!==null&&bf(a)===null&&(y=c),c=c.sibling;c=y,c===null?(y=o.child,o.child=null):(y=c.sibling,c.sibling=null),rv(o,!1,y,c,S);break;case"backwards":for(c=null,y=o.child,o.child=null;y!==null;){if(a=y.alternate,a!==null&&bf(a)===null){o.child=y;break}a=y.sibling,y.sibling=c,c=y,y=a}rv(o,!0,c,null,S);break;case"together":rv(o,!1,null,null,void 0);break;default:o.memoizedState=null}return o.child}function Vr(a,o,c){if(a!==null&&(o.dependencies=a.dependencies),Ia|=o.lanes,(c&o.childLanes)===0)if(a!==null){if(Cs(a,o,c,!1),(c&o.childLanes)===0)return null}else return null;if(a!==null&&o.child!==a.child)throw Error(r(153));if(o.child!==null){for(a=o.child,c=qr(a,a.pendingProps),o.child=c,c.return=o;a.sibling!==null;)a=a.sibling,c=c.sibling=qr(a,a.pendingProps),c.return=o;c.sibling=null}return o.child}function av(a,o){return(a.lanes&o)!==0?!0:(a=a.dependencies,!!(a!==null&&nf(a)))}function SI(a,o,c){switch(o.tag){case 3:ve(o,o.stateNode.containerInfo),Ea(o,It,a.memoizedState.cache),Es();break;case 27:case 5:he(o);break;case 4:ve(o,o.stateNode.containerInfo);break;case 10:Ea(o,o.type,o.memoizedProps.value);break;case 13:var h=o.memoizedState;if(h!==null)return h.dehydrated!==null?(Pa(o),o.flags|=128,null):(c&o.child.childLanes)!==0?XO(a,o,c):(Pa(o),a=Vr(a,o,c),a!==null?a.sibling:null);Pa(o);break;case 19:var y=(a.flags&128)!==0;if(h=(c&o.childLanes)!==0,h||(Cs(a,o,c,!1),h=(c&o.childLanes)!==0),y){if(h)return ZO(a,o,c);o.flags|=128}if(y=o.memoizedState,y!==null&&(y.rendering=null,y.tail=null,y.lastEffect=null),ne(qt,qt.current),h)break;return null;case 22:case 23:return o.lanes=0,FO(a,o,c);case 24:Ea(o,It,a.memoizedState.cache)}return Vr(a,o,c)}function QO(a,o,c){if(a!==null)if(a.memoizedProps!==o.pendingProps)Gt=!0;else{if(!av(a,c)&&(o.flags&128)===0)return Gt=!1,SI(a,o,c);Gt=(a.flags&131072)!==0}else Gt=!1,et&&(o.flags&1048576)!==0&&Tj(o,tf,o.index);switch(o.lanes=0,o.tag){case 16:e:{a=o.pendingProps;var h=o.elementType,y=h._init;if(h=y(h._payload),o.type=h,typeof h=="function")hm(h)?(a=Ci(h,a),o.tag=1,o=YO(null,o,h,a,c)):(o.tag=0,o=Zm(null,o,h,a,c));else{if(h!=null){if(y=h.$$typeof,y===C){o.tag=11,o=zO(null,o,h,a,c);break e}else if(y===P){o.tag=14,o=UO(null,o,h,a,c);break e}}throw o=Z(h)||h,Error(r(306,o,""))}}return o;case 0:return Zm(a,o,o.type,o.pendingProps,c);case 1:return h=o.type,y=Ci(h,o.pendingProps),YO(a,o,h,y,c);case 3:e:{if(ve(o,o.stateNode.containerInfo),a===null)throw Error(r(387));h=o.pendingProps;var S=o.memoizedState;y=S.element,Em(a,o),$s(o,h,null,c);var M=o.memoizedState;if(h=M.cache,Ea(o,It,h),h!==S.cache&&wm(o,[It],c,!0),ks(),h=M.element,S.isDehydrated)if(S={element:h,isDehydrated:!1,cache:M.cache},o.updateQueue.baseState=S,o.memoizedState=S,o.flags&256){o=KO(a,o,h,c);break e}else if(h!==y){y=Hn(Error(r(424)),o),Ts(y),o=KO(a,o,h,c);break e}else{switch(a=o.stateNode.containerInfo,a.nodeType){case 9:a=a.body;break;default:a=a.nodeName==="HTML"?a.ownerDocument.body:a}for(Et=or(a.firstChild),fn=o,et=!0,ji=null,br=!0,c=NO(o,null,h,c),o.child=c;c;)c.flags=c.flags&-3|4096,c=c.sibling}else{if(Es(),h===y){o=Vr(a,o,c);break e}Qt(a,o,h,c)}o=o.child}return o;case 26:return Sf(a,o),a===null?(c=nA(o.type,null,o.pendingProps,null))?o.memoizedState=c:et||(c=o.type,a=o.pendingProps,h=Lf(me.current).createElement(c),h[rn]=o,h[yn]=a,en(h,c,a),Ft(h),o.stateNode=h):o.memoizedState=nA(o.type,a.memoizedProps,o.pendingProps,a.memoizedState),null;case 27:return he(o),a===null&&et&&(h=o.stateNode=J_(o.type,o.pendingProps,me.current),fn=o,br=!0,y=Et,Ua(o.type)?(Iv=y,Et=or(h.firstChild)):Et=y),Qt(a,o,o.pendingProps.children,c),Sf(a,o),a===null&&(o.flags|=4194304),o.child;case 5:return a===null&&et&&((y=h=Et)&&(h=WI(h,o.type,o.pendingProps,br),h!==null?(o.stateNode=h,fn=o,Et=or(h.firstChild),br=!1,y=!0):y=!1),y||Oi(o)),he(o),y=o.type,S=o.pendingProps,M=a!==null?a.memoizedProps:null,h=S.children,Dv(y,S)?h=null:M!==null&&Dv(y,M)&&(o.flags|=32),o.memoizedState!==null&&(y=Rm(a,o,pI,null,null,c),ac._currentValue=y),Sf(a,o),Qt(a,o,h,c),o.child;case 6:return a===null&&et&&((a=c=Et)&&(c=ZI(c,o.pendingProps,br),c!==null?(o.stateNode=c,fn=o,Et=null,a=!0):a=!1),a||Oi(o)),null;case 13:return XO(a,o,c);case 4:return ve(o,o.stateNode.containerInfo),h=o.pendingProps,a===null?o.child=Io(o,null,h,c):Qt(a,o,h,c),o.child;case 11:return zO(a,o,o.type,o.pendingProps,c);case 7:return Qt(a,o,o.pendingProps,c),o.child;case 8:return Qt(a,o,o.pendingProps.children,c),o.child;case 12:return Qt(a,o,o.pendingProps.children,c),o.child;case 10:return h=o.pendingProps,Ea(o,o.type,h.value),Qt(a,o,h.children,c),o.child;case 9:return y=o.type._context,h=o.pendingProps.children,Ai(o),y=an(y),h=h(y),o.flags|=1,Qt(a,o,h,c),o.child;case 14:return UO(a,o,o.type,o.pendingProps,c);case 15:return HO(a,o,o.type,o.pendingProps,c);case 19:return ZO(a,o,c);case 31:return h=o.pendingProps,c=o.mode,h={mode:h.mode,children:h.children},a===null?(c=jf(h,c),c.ref=o.ref,o.child=c,c.return=o,o=c):(c=qr(a.child,h),c.ref=o.ref,o.child=c,c.return=o,o=c),o;case 22:return FO(a,o,c);case 24:return Ai(o),h=an(It),a===null?(y=Om(),y===null&&(y=yt,S=Sm(),y.pooledCache=S,S.refCount++,S!==null&&(y.pooledCacheLanes|=c),y=S),o.memoizedState={parent:h,cache:y},Am(o),Ea(o,It,y)):((a.lanes&c)!==0&&(Em(a,o),$s(o,null,null,c),ks()),y=a.memoizedState,S=o.memoizedState,y.parent!==h?(y={parent:h,cache:h},o.memoizedState=y,o.lanes===0&&(o.memoizedState=o.updateQueue.baseState=y),Ea(o,It,h)):(h=S.cache,Ea(o,It,h),h!==y.cache&&wm(o,[It],c,!0))),Qt(a,o,o.pendingProps.children,c),o.child;case 29:throw o.pendingProps}throw Error(r(156,o.tag))}function Yr(a){a.flags|=4}function JO(a,o){if(o.type!=="stylesheet"||(o.state.loading&4)!==0)a.flags&=-16777217;else if(a.flags|=16777216,!lA(o)){if(o=Yn.current,o!==null&&((Xe&4194048)===Xe?xr!==null:(Xe&62914560)!==Xe&&(Xe&536870912)===0||o!==xr))throw Rs=_m,$j;a.flags|=8192}}function Of(a,o){o!==null&&(a.flags|=4),a.flags&16384&&(o=a.tag!==22?MS():536870912,a.lanes|=o,Uo|=o)}function Hs(a,o){if(!et)switch(a.tailMode){case"hidden":o=a.tail;for(var c=null;o!==null;)o.alternate!==null&&(c=o),o=o.sibling;c===null?a.tail=null:c.sibling=null;break;case"collapsed":c=a.tail;for(var h=null;c!==null;)c.alternate!==null&&(h=c),c=c.sibling;h===null?o||a.tail===null?a.tail=null:a.tail.sibling=null:h.sibling=null}}function _t(a){var o=a.alternate!==null&&a.alternate.child===a.child,c=0,h=0;if(o)for(var y=a.child;y!==null;)c|=y.lanes|y.childLanes,h|=y.subtreeFlags&65011712,h|=y.flags&65011712,y.return=a,y=y.sibling;else for(y=a.child;y!==null;)c|=y.lanes|y.childLanes,h|=y.subtreeFlags,h|=y.flags,y.return=a,y=y.sibling;return a.subtreeFlags|=h,a.childLanes=c,o}function jI(a,o,c){var h=o.pendingProps;switch(ym(o),o.tag){case 31:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return _t(o),null;case 1:return _t(o),null;case 3:return c=o.stateNode,h=null,a!==null&&(h=a.memoizedState.cache),o.memoizedState.cache!==h&&(o.flags|=2048),Hr(It),ce(),c.pendingContext&&(c.context=c.pendingContext,c.pendingContext=null),(a===null||a.child===null)&&(As(o)?Yr(o):a===null||a.memoizedState.isDehydrated&&(o.flags&256)===0||(o.flags|=1024,Mj())),_t(o),null;case 26:return c=o.memoizedState,a===null?(Yr(o),c!==null?(_t(o),JO(o,c)):(_t(o),o.flags&=-16777217)):c?c!==a.memoizedState?(Yr(o),_t(o),JO(o,c)):(_t(o),o.flags&=-16777217):(a.memoizedProps!==h&&Yr(o),_t(o),o.flags&=-16777217),null;case 27:pe(o),c=me.current;var y=o.type;if(a!==null&&o.stateNode!=null)a.memoizedProps!==h&&Yr(o);else{if(!h){if(o.stateNode===null)throw Error(r(166));return _t(o),null}a=ue.current,As(o)?Cj(o):(a=J_(y,h,c),o.stateNode=a,Yr(o))}return _t(o),null;case 5:if(pe(o),c=o.type,a!==null&&o.stateNode!=null)a.memoizedProps!==h&&Yr(o);else{if(!h){if(o.stateNode===null)throw Error(r(166));return _t(o),null}if(a=ue.current,As(o))Cj(o);else{switch(y=Lf(me.current),a){case 1:a=y.createElementNS("http://www.w3.org/2000/svg",c);break;case 2:a=y.createElementNS("http://www.w3.org/1998/Math/MathML",c);break;default:switch(c){case"svg":a=y.createElementNS("http://www.w3.org/2000/svg",c);break;case"math":a=y.createElementNS("http://www.w3.org/1998/Math/MathML",c);break;case"script":a=y.createElement("div"),a.innerHTML="<script><\/script>",a=a.removeChild(a.firstChild);break;case"select":a=typeof h.is=="string"?y.createElement("select",{is:h.is}):y.createElement("select"),h.multiple?a.multiple=!0:h.size&&(a.size=h.size);break;default:a=typeof h.is=="string"?y.createElement(c,{is:h.is}):y.createElement(c)}}a[rn]=o,a[yn]=h;e:for(y=o.child;y!==null;){if(y.tag===5||y.tag===6)a.appendChild(y.stateNode);else if(y.tag!==4&&y.tag!==27&&y.child!==null){y.child.return=y,y=y.child;continue}if(y===o)break e;for(;y.sibling===null;){if(y.return===null||y.return===o)break e;y=y.return}y.sibling.return=y.return,y=y.sibling}o.stateNode=a;e:switch(en(a,c,h),c){case"button":case"input":case"select":case"textarea":a=!!h.autoFocus;break e;case"img":a=!0;break e;default:a=!1}a&&Yr(o)}}return _t(o),o.flags&=-16777217,null;case 6:if(a&&o.stateNode!=null)a.memoizedProps!==h&&Yr(o);else{if(typeof h!="string"&&o.stateNode===null)throw Error(r(166));if(a=me.current,As(o)){if(a=o.stateNode,c=o.memoizedProps,h=null,y=fn,y!==null)switch(y.tag){case 27:case 5:h=y.memoizedProps}a[rn]=o,a=!!(a.nodeValue===c||h!==null&&h.suppressHydrationWarning===!0||V_(a.nodeValue,c)),a||Oi(o)}else a=Lf(a).createTextNode(h),a[rn]=o,o.stateNode=a}return _t(o),null;case 13:if(h=o.memoizedState,a===null||a.memoizedState!==null&&a.memoizedState.dehydrated!==null){if(y=As(o),h!==null&&h.dehydrated!==null){if(a===null){if(!y)throw Error(r(318));if(y=o.memoizedState,y=y!==null?y.dehydrated:null,!y)throw Error(r(317));y[rn]=o}else Es(),(o.flags&128)===0&&(o.memoizedState=null),o.flags|=4;_t(o),y=!1}else y=Mj(),a!==null&&a.memoizedState!==null&&(a.memoizedState.hydrationErrors=y),y=!0;if(!y)return o.flags&256?(Gr(o),o):(Gr(o),null)}if(Gr(o),(o.flags&128)!==0)return o.lanes=c,o;if(c=h!==null,a=a!==null&&a.memoizedState!==null,c){h=o.child,y=null,h.alternate!==null&&h.alternate.memoizedState!==null&&h.alternate.memoizedState.cachePool!==null&&(y=h.alternate.memoizedState.cachePool.pool);var S=null;h.memoizedState!==null&&h.memoizedState.cachePool!==null&&(S=h.memoizedState.cachePool.pool),S!==y&&(h.flags|=2048)}return c!==a&&c&&(o.child.flags|=8192),Of(o,o.updateQueue),_t(o),null;case 4:return ce(),a===null&&Cv(o.stateNode.containerInfo),_t(o),null;case 10:return Hr(o.type),_t(o),null;case 19:if(te(qt),y=o.memoizedState,y===null)return _t(o),null;if(h=(o.flags&128)!==0,S=y.rendering,S===null)if(h)Hs(y,!1);else{if(Tt!==0||a!==null&&(a.flags&128)!==0)for(a=o.child;a!==null;){if(S=bf(a),S!==null){for(o.flags|=128,Hs(y,!1),a=S.updateQueue,o.updateQueue=a,Of(o,a),o.subtreeFlags=0,a=c,c=o.child;c!==null;)Ej(c,a),c=c.sibling;return ne(qt,qt.current&1|2),o.child}a=a.sibling}y.tail!==null&&Je()>Ef&&(o.flags|=128,h=!0,Hs(y,!1),o.lanes=4194304)}else{if(!h)if(a=bf(S),a!==null){if(o.flags|=128,h=!0,a=a.updateQueue,o.updateQueue=a,Of(o,a),Hs(y,!0),y.tail===null&&y.tailMode==="hidden"&&!S.alternate&&!et)return _t(o),null}else 2*Je()-y.renderingStartTime>Ef&&c!==536870912&&(o.flags|=128,h=!0,Hs(y,!1),o.lanes=4194304);y.isBackwards?(S.sibling=o.child,o.child=S):(a=y.last,a!==null?a.sibling=S:o.child=S,y.last=S)}return y.tail!==null?(o=y.tail,y.rendering=o,y.tail=o.sibling,y.renderingStartTime=Je(),o.sibling=null,a=qt.current,ne(qt,h?a&1|2:a&1),o):(_t(o),null);case 22:case 23:return Gr(o),Mm(),h=o.memoizedState!==null,a!==null?a.memoizedState!==null!==h&&(o.flags|=8192):h&&(o.flags|=8192),h?(c&536870912)!==0&&(o.flags&128)===0&&(_t(o),o.subtreeFlags&6&&(o.flags|=8192)):_t(o),c=o.updateQueue,c!==null&&Of(o,c.retryQueue),c=null,a!==null&&a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(c=a.memoizedState.cachePool.pool),h=null,o.memoizedState!==null&&o.memoizedState.cachePool!==null&&(h=o.memoizedState.cachePool.pool),h!==c&&(o.flags|=2048),a!==null&&te(Ei),null;case 24:return c=null,a!==null&&(c=a.memoizedState.cache),o.memoizedState.cache!==c&&(o.flags|=2048),Hr(It),_t(o),null;case 25:return null;case 30:return null}throw Error(r(156,o.tag))}function OI(a,o){switch(ym(o),o.tag){case 1:return a=o.flags,a&65536?(o.flags=a&-65537|128,o):null;case 3:return Hr(It),ce(),a=o.flags,(a&65536)!==0&&(a&128)===0?(o.flags=a&-65537|128,o):null;case 26:case 27:case 5:return pe(o),null;case 13:if(Gr(o),a=o.memoizedState,a!==null&&a.dehydrated!==null){if(o.alternate===null)throw Error(r(340));Es()}return a=o.flags,a&65536?(o.flags=a&-65537|128,o):null;case 19:return te(qt),null;case 4:return ce(),null;case 10:return Hr(o.type),null;case 22:case 23:return Gr(o),Mm(),a!==null&&te(Ei),a=o.flags,a&65536?(o.flags=a&-65537|128,o):null;case 24:return Hr(It),null;case 25:return null;default:return null}}function e_(a,o){switch(ym(o),o.tag){case 3:Hr(It),ce();break;case 26:case 27:case 5:pe(o);break;case 4:ce();break;case 13:Gr(o);break;case 19:te(qt);break;case 10:Hr(o.type);break;case 22:case 23:Gr(o),Mm(),a!==null&&te(Ei);break;case 24:Hr(It)}}function Fs(a,o){try{var c=o.updateQueue,h=c!==null?c.lastEffect:null;if(h!==null){var y=h.next;c=y;do{if((c.tag&a)===a){h=void 0;var S=c.create,M=c.inst;h=S(),M.destroy=h}c=c.next}while(c!==y)}}catch(R){ht(o,o.return,R)}}function Da(a,o,c){try{var h=o.updateQueue,y=h!==null?h.lastEffect:null;if(y!==null){var S=y.next;h=S;do{if((h.tag&a)===a){var M=h.inst,R=M.destroy;if(R!==void 0){M.destroy=void 0,y=o;var q=c,Q=R;try{Q()}catch(oe){ht(y,q,oe)}}}h=h.next}while(h!==S)}}catch(oe){ht(o,o.return,oe)}}function t_(a){var o=a.updateQueue;if(o!==null){var c=a.stateNode;try{Uj(o,c)}catch(h){ht(a,a.return,h)}}}function n_(a,o,c){c.props=Ci(a.type,a.memoizedProps),c.state=a.memoizedState;try{c.componentWillUnmount()}catch(h){ht(a,o,h)}}function Gs(a,o){try{var c=a.ref;if(c!==null){switch(a.tag){case 26:case 27:case 5:var h=a.stateNode;break;case 30:h=a.stateNode;break;default:h=a.stateNode}typeof c=="function"?a.refCleanup=c(h):c.current=h}}catch(y){ht(a,o,y)}}function wr(a,o){var c=a.ref,h=a.refCleanup;if(c!==null)if(typeof h=="function")try{h()}catch(y){ht(a,o,y)}finally{a.refCleanup=null,a=a.alternate,a!=null&&(a.refCleanup=null)}else if(typeof c=="function")try{c(null)}catch(y){ht(a,o,y)}else c.current=null}function r_(a){var o=a.type,c=a.memoizedProps,h=a.stateNode;try{e:switch(o){case"button":case"input":case"select":case"textarea":c.autoFocus&&h.focus();break e;case"img":c.src?h.src=c.src:c.srcSet&&(h.srcset=c.srcSet)}}catch(y){ht(a,a.return,y)}}function iv(a,o,c){try{var h=a.stateNode;GI(h,a.type,c,o),h[yn]=o}catch(y){ht(a,a.return,y)}}function a_(a){return a.tag===5||a.tag===3||a.tag===26||a.tag===27&&Ua(a.type)||a.tag===4}function ov(a){e:for(;;){for(;a.sibling===null;){if(a.return===null||a_(a.return))return null;a=a.return}for(a.sibling.return=a.return,a=a.sibling;a.tag!==5&&a.tag!==6&&a.tag!==18;){if(a.tag===27&&Ua(a.type)||a.flags&2||a.child===null||a.tag===4)continue e;a.child.return=a,a=a.child}if(!(a.flags&2))return a.stateNode}}function lv(a,o,c){var h=a.tag;if(h===5||h===6)a=a.stateNode,o?(c.nodeType===9?c.body:c.nodeName==="HTML"?c.ownerDocument.body:c).insertBefore(a,o):(o=c.nodeType===9?c.body:c.nodeName==="HTML"?c.ownerDocument.body:c,o.appendChild(a),c=c._reactRootContainer,c!=null||o.onclick!==null||(o.onclick=$f));else if(h!==4&&(h===27&&Ua(a.type)&&(c=a.stateNode,o=null),a=a.child,a!==null))for(lv(a,o,c),a=a.sibling;a!==null;)lv(a,o,c),a=a.sibling}function _f(a,o,c){var h=a.tag;if(h===5||h===6)a=a.stateNode,o?c.insertBefore(a,o):c.appendChild(a);else if(h!==4&&(h===27&&Ua(a.type)&&(c=a.stateNode),a=a.child,a!==null))for(_f(a,o,c),a=a.sibling;a!==null;)_f(a,o,c),a=a.sibling}function i_(a){var o=a.stateNode,c=a.memoizedProps;try{for(var h=a.type,y=o.attributes;y.length;)o.removeAttributeNode(y[0]);en(o,h,c),o[rn]=a,o[yn]=c}catch(S){ht(a,a.return,S)}}var Kr=!1,Rt=!1,sv=!1,o_=typeof WeakSet=="function"?WeakSet:Set,Vt=null;function _I(a,o){if(a=a.containerInfo,Pv=Hf,a=yj(a),om(a)){if("selectionStart"in a)var c={start:a.selectionStart,end:a.selectionEnd};else e:{c=(c=a.ownerDocument)&&c.defaultView||window;var h=c.getSelection&&c.getSelection();if(h&&h.rangeCount!==0){c=h.anchorNode;var y=h.anchorOffset,S=h.focusNode;h=h.focusOffset;try{c.nodeType,S.nodeType}catch{c=null;break e}var M=0,R=-1,q=-1,Q=0,oe=0,se=a,J=null;t:for(;;){for(var ee;se!==c||y!==0&&se.nodeType!==3||(R=M+y),se!==S||h!==0&&se.nodeType!==3||(q=M+h),se.nodeType===3&&(M+=se.nodeValue.length),(ee=se.firstChild)!==null;)J=se,se=ee;for(;;){if(se===a)break t;if(J===c&&++Q===y&&(R=M),J===S&&++oe===h&&(q=M),(ee=se.nextSibling)!==null)break;se=J,J=se.parentNode}se=ee}c=R===-1||q===-1?null:{start:R,end:q}}else c=null}c=c||{start:0,end:0}}else c=null;for(Rv={focusedElem:a,selectionRange:c},Hf=!1,Vt=o;Vt!==null;)if(o=Vt,a=o.child,(o.subtreeFlags&1024)!==0&&a!==null)a.return=o,Vt=a;else for(;Vt!==null;){switch(o=Vt,S=o.alternate,a=o.flags,o.tag){case 0:break;case 11:case 15:break;case 1:if((a&1024)!==0&&S!==null){a=void 0,c=o,y=S.memoizedProps,S=S.memoizedState,h=c.stateNode;try{var Ne=Ci(c.type,y,c.elementType===c.type);a=h.getSnapshotBeforeUpdate(Ne,S),h.__reactInternalSnapshotBeforeUpdate=a}catch(Ae){ht(c,c.return,Ae)}}break;case 3:if((a&1024)!==0){if(a=o.stateNode.containerInfo,c=a.nodeType,c===9)$v(a);else if(c===1)switch(a.nodeName){case"HEAD":case"HTML":case"BODY":$v(a);break;default:a.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((a&1024)!==0)throw Error(r(163))}if(a=o.sibling,a!==null){a.return=o.return,Vt=a;break}Vt=o.return}}function l_(a,o,c){var h=c.flags;switch(c.tag){case 0:case 11:case 15:ka(a,c),h&4&&Fs(5,c);break;case 1:if(ka(a,c),h&4)if(a=c.stateNode,o===null)try{a.componentDidMount()}catch(M){ht(c,c.return,M)}else{var y=Ci(c.type,o.memoizedProps);o=o.memoizedState;try{a.componentDidUpdate(y,o,a.__reactInternalSnapshotBeforeUpdate)}catch(M){ht(c,c.return,M)}}h&64&&t_(c),h&512&&Gs(c,c.return);break;case 3:if(ka(a,c),h&64&&(a=c.updateQueue,a!==null)){if(o=null,c.child!==null)switch(c.child.tag){case 27:case 5:o=c.child.stateNode;break;case 1:o=c.child.stateNode}try{Uj(a,o)}catch(M){ht(c,c.return,M)}}break;case 27:o===null&&h&4&&i_(c);case 26:case 5:ka(a,c),o===null&&h&4&&r_(c),h&512&&Gs(c,c.return);break;case 12:ka(a,c);break;case 13:ka(a,c),h&4&&u_(a,c),h&64&&(a=c.memoizedState,a!==null&&(a=a.dehydrated,a!==null&&(c=DI.bind(null,c),QI(a,c))));break;case 22:if(h=c.memoizedState!==null||Kr,!h){o=o!==null&&o.memoizedState!==null||Rt,y=Kr;var S=Rt;Kr=h,(Rt=o)&&!S?$a(a,c,(c.subtreeFlags&8772)!==0):ka(a,c),Kr=y,Rt=S}break;case 30:break;default:ka(a,c)}}function s_(a){var o=a.alternate;o!==null&&(a.alternate=null,s_(o)),a.child=null,a.deletions=null,a.sibling=null,a.tag===5&&(o=a.stateNode,o!==null&&zp(o)),a.stateNode=null,a.return=null,a.dependencies=null,a.memoizedProps=null,a.memoizedState=null,a.pendingProps=null,a.stateNode=null,a.updateQueue=null}var jt=null,xn=!1;function Xr(a,o,c){for(c=c.child;c!==null;)c_(a,o,c),c=c.sibling}function c_(a,o,c){if(On&&typeof On.onCommitFiberUnmount=="function")try{On.onCommitFiberUnmount(ds,c)}catch{}switch(c.tag){case 26:Rt||wr(c,o),Xr(a,o,c),c.memoizedState?c.memoizedState.count--:c.stateNode&&(c=c.stateNode,c.parentNode.removeChild(c));break;case 27:Rt||wr(c,o);var h=jt,y=xn;Ua(c.type)&&(jt=c.stateNode,xn=!1),Xr(a,o,c),ec(c.stateNode),jt=h,xn=y;break;case 5:Rt||wr(c,o);case 6:if(h=jt,y=xn,jt=null,Xr(a,o,c),jt=h,xn=y,jt!==null)if(xn)try{(jt.nodeType===9?jt.body:jt.nodeName==="HTML"?jt.ownerDocument.body:jt).removeChild(c.stateNode)}catch(S){ht(c,o,S)}else try{jt.removeChild(c.stateNode)}catch(S){ht(c,o,S)}break;case 18:jt!==null&&(xn?(a=jt,Z_(a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a,c.stateNode),sc(a)):Z_(jt,c.stateNode));break;case 4:h=jt,y=xn,jt=c.stateNode.containerInfo,xn=!0,Xr(a,o,c),jt=h,xn=y;break;case 0:case 11:case 14:case 15:Rt||Da(2,c,o),Rt||Da(4,c,o),Xr(a,o,c);break;case 1:Rt||(wr(c,o),h=c.stateNode,typeof h.componentWillUnmount=="function"&&n_(c,o,h)),Xr(a,o,c);break;case 21:Xr(a,o,c);break;case 22:Rt=(h=Rt)||c.memoizedState!==null,Xr(a,o,c),Rt=h;break;default:Xr(a,o,c)}}function u_(a,o){if(o.memoizedState===null&&(a=o.alternate,a!==null&&(a=a.memoizedState,a!==null&&(a=a.dehydrated,a!==null))))try{sc(a)}catch(c){ht(o,o.return,c)}}function AI(a){switch(a.tag){case 13:case 19:var o=a.stateNode;return o===null&&(o=a.stateNode=new o_),o;case 22:return a=a.stateNode,o=a._retryCache,o===null&&(o=a._retryCache=new o_),o;default:throw Error(r(435,a.tag))}}function cv(a,o){var c=AI(a);o.forEach(function(h){var y=kI.bind(null,a,h);c.has(h)||(c.add(h),h.then(y,y))})}function Tn(a,o){var c=o.deletions;if(c!==null)for(var h=0;h<c.length;h++){var y=c[h],S=a,M=o,R=M;e:for(;R!==null;){switch(R.tag){case 27:if(Ua(R.type)){jt=R.stateNode,xn=!1;break e}break;case 5:jt=R.stateNode,xn=!1;break e;case 3:case 4:jt=R.stateNode.containerInfo,xn=!0;break e}R=R.return}if(jt===null)throw Error(r(160));c_(S,M,y),jt=null,xn=!1,S=y.alternate,S!==null&&(S.return=null),y.return=null}if(o.subtreeFlags&13878)for(o=o.child;o!==null;)f_(o,a),o=o.sibling}var ir=null;function f_(a,o){var c=a.alternate,h=a.flags;switch(a.tag){case 0:case 11:case 14:case 15:Tn(o,a),Cn(a),h&4&&(Da(3,a,a.return),Fs(3,a),Da(5,a,a.return));break;case 1:Tn(o,a),Cn(a),h&512&&(Rt||c===null||wr(c,c.return)),h&64&&Kr&&(a=a.updateQueue,a!==null&&(h=a.callbacks,h!==null&&(c=a.shared.hiddenCallbacks,a.shared.hiddenCallbacks=c===null?h:c.concat(h))));break;case 26:var y=ir;if(Tn(o,a),Cn(a),h&512&&(Rt||c===null||wr(c,c.return)),h&4){var S=c!==null?c.memoizedState:null;if(h=a.memoizedState,c===null)if(h===null)if(a.stateNode===null){e:{h=a.type,c=a.memoizedProps,y=y.ownerDocument||y;t:switch(h){case"title":S=y.getElementsByTagName("title")[0],(!S||S[ms]||S[rn]||S.namespaceURI==="http://www.w3.org/2000/svg"||S.hasAttribute("itemprop"))&&(S=y.createElement(h),y.head.insertBefore(S,y.querySelector("head > title"))),en(S,h,c),S[rn]=a,Ft(S),h=S;break e;case"link":var M=iA("link","href",y).get(h+(c.href||""));if(M){for(var R=0;R<M.length;R++)if(S=M[R],S.getAttribute("href")===(c.href==null||c.href===""?null:c.href)&&S.getAttribute("rel")===(c.rel==null?null:c.rel)&&S.getAttribute("title")===(c.title==null?null:c.title)&&S.getAttribute("crossorigin")===(c.crossOrigin==null?null:c.crossOrigin)){M.splice(R,1);break t}}S=y.createElement(h),en(S,h,c),y.head.appendChild(S);break;case"meta":if(M=iA("meta","content",y).get(h+(c.content||""))){for(R=0;R<M.length;R++)if(S=M[R],S.getAttribute("content")===(c.content==null?null:""+c.content)&&S.getAttribute("name")===(c.name==null?null:c.name)&&S.getAttribute("property")===(c.property==null?null:c.property)&&S.getAttribute("http-equiv")===(c.httpEquiv==null?null:c.httpEquiv)&&S.getAttribute("charset")===(c.charSet==null?null:c.charSet)){M.splice(R,1);break t}}S=y.createElement(h),en(S,h,c),y.head.appendChild(S);break;default:throw Error(r(468,h))}S[rn]=a,Ft(S),h=S}a.stateNode=h}else oA(y,a.type,a.stateNode);else a.stateNode=aA(y,h,a.memoizedProps);else S!==h?(S===null?c.stateNode!==null&&(c=c.stateNode,c.parentNode.removeChild(c)):S.count--,h===null?oA(y,a.type,a.stateNode):aA(y,h,a.memoizedProps)):h===null&&a.stateNode!==null&&iv(a,a.memoizedProps,c.memoizedProps)}break;case 27:Tn(o,a),Cn(a),h&512&&(Rt||c===null||wr(c,c.return)),c!==null&&h&4&&iv(a,a.memoizedProps,c.memoizedProps);break;case 5:if(Tn(o,a),Cn(a),h&512&&(Rt||c===null||wr(c,c.return)),a.flags&32){y=a.stateNode;try{xo(y,"")}catch(ee){ht(a,a.return,ee)}}h&4&&a.stateNode!=null&&(y=a.memoizedProps,iv(a,y,c!==null?c.memoizedProps:y)),h&1024&&(sv=!0);break;case 6:if(Tn(o,a),Cn(a),h&4){if(a.stateNode===null)throw Error(r(162));h=a.memoizedProps,c=a.stateNode;try{c.nodeValue=h}catch(ee){ht(a,a.return,ee)}}break;case 3:if(Bf=null,y=ir,ir=If(o.containerInfo),Tn(o,a),ir=y,Cn(a),h&4&&c!==null&&c.memoizedState.isDehydrated)try{sc(o.containerInfo)}catch(ee){ht(a,a.return,ee)}sv&&(sv=!1,d_(a));break;case 4:h=ir,ir=If(a.stateNode.containerInfo),Tn(o,a),Cn(a),ir=h;break;case 12:Tn(o,a),Cn(a);break;case 13:Tn(o,a),Cn(a),a.child.flags&8192&&a.memoizedState!==null!=(c!==null&&c.memoizedState!==null)&&(mv=Je()),h&4&&(h=a.updateQueue,h!==null&&(a.updateQueue=null,cv(a,h)));break;case 22:y=a.memoizedState!==null;var q=c!==null&&c.memoizedState!==null,Q=Kr,oe=Rt;if(Kr=Q||y,Rt=oe||q,Tn(o,a),Rt=oe,Kr=Q,Cn(a),h&8192)e:for(o=a.stateNode,o._visibility=y?o._visibility&-2:o._visibility|1,y&&(c===null||q||Kr||Rt||Ni(a)),c=null,o=a;;){if(o.tag===5||o.tag===26){if(c===null){q=c=o;try{if(S=q.stateNode,y)M=S.style,typeof M.setProperty=="function"?M.setProperty("display","none","important"):M.display="none";else{R=q.stateNode;var se=q.memoizedProps.style,J=se!=null&&se.hasOwnProperty("display")?se.display:null;R.style.display=J==null||typeof J=="boolean"?"":(""+J).trim()}}catch(ee){ht(q,q.return,ee)}}}else if(o.tag===6){if(c===null){q=o;try{q.stateNode.nodeValue=y?"":q.memoizedProps}catch(ee){ht(q,q.return,ee)}}}else if((o.tag!==22&&o.tag!==23||o.memoizedState===null||o===a)&&o.child!==null){o.child.return=o,o=o.child;continue}if(o===a)break e;for(;o.sibling===null;){if(o.return===null||o.return===a)break e;c===o&&(c=null),o=o.return}c===o&&(c=null),o.sibling.return=o.return,o=o.sibling}h&4&&(h=a.updateQueue,h!==null&&(c=h.retryQueue,c!==null&&(h.retryQueue=null,cv(a,c))));break;case 19:Tn(o,a),Cn(a),h&4&&(h=a.updateQueue,h!==null&&(a.updateQueue=null,cv(a,h)));break;case 30:break;case 21:break;default:Tn(o,a),Cn(a)}}function Cn(a){var o=a.flags;if(o&2){try{for(var c,h=a.return;h!==null;){if(a_(h)){c=h;break}h=h.return}if(c==null)throw Error(r(160));switch(c.tag){case 27:var y=c.stateNode,S=ov(a);_f(a,S,y);break;case 5:var M=c.stateNode;c.flags&32&&(xo(M,""),c.flags&=-33);var R=ov(a);_f(a,R,M);break;case 3:case 4:var q=c.stateNode.containerInfo,Q=ov(a);lv(a,Q,q);break;default:throw Error(r(161))}}catch(oe){ht(a,a.return,oe)}a.flags&=-3}o&4096&&(a.flags&=-4097)}function d_(a){if(a.subtreeFlags&1024)for(a=a.child;a!==null;){var o=a;d_(o),o.tag===5&&o.flags&1024&&o.stateNode.reset(),a=a.sibling}}function ka(a,o){if(o.subtreeFlags&8772)for(o=o.child;o!==null;)l_(a,o.alternate,o),o=o.sibling}function Ni(a){for(a=a.child;a!==null;){var o=a;switch(o.tag){case 0:case 11:case 14:case 15:Da(4,o,o.return),Ni(o);break;case 1:wr(o,o.return);var c=o.stateNode;typeof c.componentWillUnmount=="function"&&n_(o,o.return,c),Ni(o);break;case 27:ec(o.stateNode);case 26:case 5:wr(o,o.return),Ni(o);break;case 22:o.memoizedState===null&&Ni(o);break;case 30:Ni(o);break;default:Ni(o)}a=a.sibling}}function $a(a,o,c){for(c=c&&(o.subtreeFlags&8772)!==0,o=o.child;o!==null;){var h=o.alternate,y=a,S=o,M=S.flags;switch(S.tag){case 0:case 11:case 15:$a(y,S,c),Fs(4,S);break;case 1:if($a(y,S,c),h=S,y=h.stateNode,typeof y.componentDidMount=="function")try{y.componentDidMount()}catch(Q){ht(h,h.return,Q)}if(h=S,y=h.updateQueue,y!==null){var R=h.stateNode;try{var q=y.shared.hiddenCallbacks;if(q!==null)for(y.shared.hiddenCallbacks=null,y=0;y<q.length;y++)zj(q[y],R)}catch(Q){ht(h,h.return,Q)}}c&&M&64&&t_(S),Gs(S,S.return);break;case 27:i_(S);case 26:case 5:$a(y,S,c),c&&h===null&&M&4&&r_(S),Gs(S,S.return);break;case 12:$a(y,S,c);break;case 13:$a(y,S,c),c&&M&4&&u_(y,S);break;case 22:S.memoizedState===null&&$a(y,S,c),Gs(S,S.return);break;case 30:break;default:$a(y,S,c)}o=o.sibling}}function uv(a,o){var c=null;a!==null&&a.memoizedState!==null&&a.memoizedState.cachePool!==null&&(c=a.memoizedState.cachePool.pool),a=null,o.memoizedState!==null&&o.memoizedState.cachePool!==null&&(a=o.memoizedState.cachePool.pool),a!==c&&(a!=null&&a.refCount++,c!=null&&Ns(c))}function fv(a,o){a=null,o.alternate!==null&&(a=o.alternate.memoizedState.cache),o=o.memoizedState.cache,o!==a&&(o.refCount++,a!=null&&Ns(a))}function Sr(a,o,c,h){if(o.subtreeFlags&10256)for(o=o.child;o!==null;)h_(a,o,c,h),o=o.sibling}function h_(a,o,c,h){var y=o.flags;switch(o.tag){case 0:case 11:case 15:Sr(a,o,c,h),y&2048&&Fs(9,o);break;case 1:Sr(a,o,c,h);break;case 3:Sr(a,o,c,h),y&2048&&(a=null,o.alternate!==null&&(a=o.alternate.memoizedState.cache),o=o.memoizedState.cache,o!==a&&(o.refCount++,a!=null&&Ns(a)));break;case 12:if(y&2048){Sr(a,o,c,h),a=o.stateNode;try{var S=o.memoizedProps,M=S.id,R=S.onPostCommit;typeof R=="function"&&R(M,o.alternate===null?"mount":"update",a.passiveEffectDuration,-0)}catch(q){ht(o,o.return,q)}}else Sr(a,o,c,h);break;case 13:Sr(a,o,c,h);break;case 23:break;case 22:S=o.stateNode,M=o.alternate,o.memoizedState!==null?S._visibility&2?Sr(a,o,c,h):Vs(a,o):S._visibility&2?Sr(a,o,c,h):(S._visibility|=2,qo(a,o,c,h,(o.subtreeFlags&10256)!==0)),y&2048&&uv(M,o);break;case 24:Sr(a,o,c,h),y&2048&&fv(o.alternate,o);break;default:Sr(a,o,c,h)}}function qo(a,o,c,h,y){for(y=y&&(o.subtreeFlags&10256)!==0,o=o.child;o!==null;){var S=a,M=o,R=c,q=h,Q=M.flags;switch(M.tag){case 0:case 11:case 15:qo(S,M,R,q,y),Fs(8,M);break;case 23:break;case 22:var oe=M.stateNode;M.memoizedState!==null?oe._visibility&2?qo(S,M,R,q,y):Vs(S,M):(oe._visibility|=2,qo(S,M,R,q,y)),y&&Q&2048&&uv(M.alternate,M);break;case 24:qo(S,M,R,q,y),y&&Q&2048&&fv(M.alternate,M);break;default:qo(S,M,R,q,y)}o=o.sibling}}function Vs(a,o){if(o.subtreeFlags&10256)for(o=o.child;o!==null;){var c=a,h=o,y=h.flags;switch(h.tag){case 22:Vs(c,h),y&2048&&uv(h.alternate,h);break;case 24:Vs(c,h),y&2048&&fv(h.alternate,h);break;default:Vs(c,h)}o=o.sibling}}var Ys=8192;function Bo(a){if(a.subtreeFlags&Ys)for(a=a.child;a!==null;)p_(a),a=a.sibling}function p_(a){switch(a.tag){case 26:Bo(a),a.flags&Ys&&a.memoizedState!==null&&fq(ir,a.memoizedState,a.memoizedProps);break;case 5:Bo(a);break;case 3:case 4:var o=ir;ir=If(a.stateNode.containerInfo),Bo(a),ir=o;break;case 22:a.memoizedState===null&&(o=a.alternate,o!==null&&o.memoizedState!==null?(o=Ys,Ys=16777216,Bo(a),Ys=o):Bo(a));break;default:Bo(a)}}function m_(a){var o=a.alternate;if(o!==null&&(a=o.child,a!==null)){o.child=null;do o=a.sibling,a.sibling=null,a=o;while(a!==null)}}function Ks(a){var o=a.deletions;if((a.flags&16)!==0){if(o!==null)for(var c=0;c<o.length;c++){var h=o[c];Vt=h,y_(h,a)}m_(a)}if(a.subtreeFlags&10256)for(a=a.child;a!==null;)v_(a),a=a.sibling}function v_(a){switch(a.tag){case 0:case 11:case 15:Ks(a),a.flags&2048&&Da(9,a,a.return);break;case 3:Ks(a);break;case 12:Ks(a);break;case 22:var o=a.stateNode;a.memoizedState!==null&&o._visibility&2&&(a.return===null||a.return.tag!==13)?(o._visibility&=-3,Af(a)):Ks(a);break;default:Ks(a)}}function Af(a){var o=a.deletions;if((a.flags&16)!==0){if(o!==null)for(var c=0;c<o.length;c++){var h=o[c];Vt=h,y_(h,a)}m_(a)}for(a=a.child;a!==null;){switch(o=a,o.tag){case 0:case 11:case 15:Da(8,o,o.return),Af(o);break;case 22:c=o.stateNode,c._visibility&2&&(c._visibility&=-3,Af(o));break;default:Af(o)}a=a.sibling}}function y_(a,o){for(;Vt!==null;){var c=Vt;switch(c.tag){case 0:case 11:case 15:Da(8,c,o);break;case 23:case 22:if(c.memoizedState!==null&&c.memoizedState.cachePool!==null){var h=c.memoizedState.cachePool.pool;h!=null&&h.refCount++}break;case 24:Ns(c.memoizedState.cache)}if(h=c.child,h!==null)h.return=c,Vt=h;else e:for(c=a;Vt!==null;){h=Vt;var y=h.sibling,S=h.return;if(s_(h),h===c){Vt=null;break e}if(y!==null){y.return=S,Vt=y;break e}Vt=S}}}var EI={getCacheForType:function(a){var o=an(It),c=o.data.get(a);return c===void 0&&(c=a(),o.data.set(a,c)),c}},TI=typeof WeakMap=="function"?WeakMap:Map,at=0,yt=null,Fe=null,Xe=0,it=0,Nn=null,La=!1,zo=!1,dv=!1,Wr=0,Tt=0,Ia=0,Mi=0,hv=0,Kn=0,Uo=0,Xs=null,wn=null,pv=!1,mv=0,Ef=1/0,Tf=null,qa=null,Jt=0,Ba=null,Ho=null,Fo=0,vv=0,yv=null,g_=null,Ws=0,gv=null;function Mn(){if((at&2)!==0&&Xe!==0)return Xe&-Xe;if($.T!==null){var a=Mo;return a!==0?a:_v()}return DS()}function b_(){Kn===0&&(Kn=(Xe&536870912)===0||et?NS():536870912);var a=Yn.current;return a!==null&&(a.flags|=32),Kn}function Pn(a,o,c){(a===yt&&(it===2||it===9)||a.cancelPendingCommit!==null)&&(Go(a,0),za(a,Xe,Kn,!1)),ps(a,c),((at&2)===0||a!==yt)&&(a===yt&&((at&2)===0&&(Mi|=c),Tt===4&&za(a,Xe,Kn,!1)),jr(a))}function x_(a,o,c){if((at&6)!==0)throw Error(r(327));var h=!c&&(o&124)===0&&(o&a.expiredLanes)===0||hs(a,o),y=h?MI(a,o):wv(a,o,!0),S=h;do{if(y===0){zo&&!h&&za(a,o,0,!1);break}else{if(c=a.current.alternate,S&&!CI(c)){y=wv(a,o,!1),S=!1;continue}if(y===2){if(S=o,a.errorRecoveryDisabledLanes&S)var M=0;else M=a.pendingLanes&-536870913,M=M!==0?M:M&536870912?536870912:0;if(M!==0){o=M;e:{var R=a;y=Xs;var q=R.current.memoizedState.isDehydrated;if(q&&(Go(R,M).flags|=256),M=wv(R,M,!1),M!==2){if(dv&&!q){R.errorRecoveryDisabledLanes|=S,Mi|=S,y=4;break e}S=wn,wn=y,S!==null&&(wn===null?wn=S:wn.push.apply(wn,S))}y=M}if(S=!1,y!==2)continue}}if(y===1){Go(a,0),za(a,o,0,!0);break}e:{switch(h=a,S=y,S){case 0:case 1:throw Error(r(345));case 4:if((o&4194048)!==o)break;case 6:za(h,o,Kn,!La);break e;case 2:wn=null;break;case 3:case 5:break;default:throw Error(r(329))}if((o&62914560)===o&&(y=mv+300-Je(),10<y)){if(za(h,o,Kn,!La),Iu(h,0,!0)!==0)break e;h.timeoutHandle=X_(w_.bind(null,h,c,wn,Tf,pv,o,Kn,Mi,Uo,La,S,2,-0,0),y);break e}w_(h,c,wn,Tf,pv,o,Kn,Mi,Uo,La,S,0,-0,0)}}break}while(!0);jr(a)}function w_(a,o,c,h,y,S,M,R,q,Q,oe,se,J,ee){if(a.timeoutHandle=-1,se=o.subtreeFlags,(se&8192||(se&16785408)===16785408)&&(rc={stylesheets:null,count:0,unsuspend:uq},p_(o),se=dq(),se!==null)){a.cancelPendingCommit=se(T_.bind(null,a,o,S,c,h,y,M,R,q,oe,1,J,ee)),za(a,S,M,!Q);return}T_(a,o,S,c,h,y,M,R,q)}function CI(a){for(var o=a;;){var c=o.tag;if((c===0||c===11||c===15)&&o.flags&16384&&(c=o.updateQueue,c!==null&&(c=c.stores,c!==null)))for(var h=0;h<c.length;h++){var y=c[h],S=y.getSnapshot;y=y.value;try{if(!An(S(),y))return!1}catch{return!1}}if(c=o.child,o.subtreeFlags&16384&&c!==null)c.return=o,o=c;else{if(o===a)break;for(;o.sibling===null;){if(o.return===null||o.return===a)return!0;o=o.return}o.sibling.return=o.return,o=o.sibling}}return!0}function za(a,o,c,h){o&=~hv,o&=~Mi,a.suspendedLanes|=o,a.pingedLanes&=~o,h&&(a.warmLanes|=o),h=a.expirationTimes;for(var y=o;0<y;){var S=31-_n(y),M=1<<S;h[S]=-1,y&=~M}c!==0&&PS(a,c,o)}function Cf(){return(at&6)===0?(Zs(0),!1):!0}function bv(){if(Fe!==null){if(it===0)var a=Fe.return;else a=Fe,Ur=_i=null,$m(a),Lo=null,zs=0,a=Fe;for(;a!==null;)e_(a.alternate,a),a=a.return;Fe=null}}function Go(a,o){var c=a.timeoutHandle;c!==-1&&(a.timeoutHandle=-1,YI(c)),c=a.cancelPendingCommit,c!==null&&(a.cancelPendingCommit=null,c()),bv(),yt=a,Fe=c=qr(a.current,null),Xe=o,it=0,Nn=null,La=!1,zo=hs(a,o),dv=!1,Uo=Kn=hv=Mi=Ia=Tt=0,wn=Xs=null,pv=!1,(o&8)!==0&&(o|=o&32);var h=a.entangledLanes;if(h!==0)for(a=a.entanglements,h&=o;0<h;){var y=31-_n(h),S=1<<y;o|=a[y],h&=~S}return Wr=o,Wu(),c}function S_(a,o){Be=null,$.H=vf,o===Ps||o===of?(o=qj(),it=3):o===$j?(o=qj(),it=4):it=o===BO?8:o!==null&&typeof o=="object"&&typeof o.then=="function"?6:1,Nn=o,Fe===null&&(Tt=1,wf(a,Hn(o,a.current)))}function j_(){var a=$.H;return $.H=vf,a===null?vf:a}function O_(){var a=$.A;return $.A=EI,a}function xv(){Tt=4,La||(Xe&4194048)!==Xe&&Yn.current!==null||(zo=!0),(Ia&134217727)===0&&(Mi&134217727)===0||yt===null||za(yt,Xe,Kn,!1)}function wv(a,o,c){var h=at;at|=2;var y=j_(),S=O_();(yt!==a||Xe!==o)&&(Tf=null,Go(a,o)),o=!1;var M=Tt;e:do try{if(it!==0&&Fe!==null){var R=Fe,q=Nn;switch(it){case 8:bv(),M=6;break e;case 3:case 2:case 9:case 6:Yn.current===null&&(o=!0);var Q=it;if(it=0,Nn=null,Vo(a,R,q,Q),c&&zo){M=0;break e}break;default:Q=it,it=0,Nn=null,Vo(a,R,q,Q)}}NI(),M=Tt;break}catch(oe){S_(a,oe)}while(!0);return o&&a.shellSuspendCounter++,Ur=_i=null,at=h,$.H=y,$.A=S,Fe===null&&(yt=null,Xe=0,Wu()),M}function NI(){for(;Fe!==null;)__(Fe)}function MI(a,o){var c=at;at|=2;var h=j_(),y=O_();yt!==a||Xe!==o?(Tf=null,Ef=Je()+500,Go(a,o)):zo=hs(a,o);e:do try{if(it!==0&&Fe!==null){o=Fe;var S=Nn;t:switch(it){case 1:it=0,Nn=null,Vo(a,o,S,1);break;case 2:case 9:if(Lj(S)){it=0,Nn=null,A_(o);break}o=function(){it!==2&&it!==9||yt!==a||(it=7),jr(a)},S.then(o,o);break e;case 3:it=7;break e;case 4:it=5;break e;case 7:Lj(S)?(it=0,Nn=null,A_(o)):(it=0,Nn=null,Vo(a,o,S,7));break;case 5:var M=null;switch(Fe.tag){case 26:M=Fe.memoizedState;case 5:case 27:var R=Fe;if(!M||lA(M)){it=0,Nn=null;var q=R.sibling;if(q!==null)Fe=q;else{var Q=R.return;Q!==null?(Fe=Q,Nf(Q)):Fe=null}break t}}it=0,Nn=null,Vo(a,o,S,5);break;case 6:it=0,Nn=null,Vo(a,o,S,6);break;case 8:bv(),Tt=6;break e;default:throw Error(r(462))}}PI();break}catch(oe){S_(a,oe)}while(!0);return Ur=_i=null,$.H=h,$.A=y,at=c,Fe!==null?0:(yt=null,Xe=0,Wu(),Tt)}function PI(){for(;Fe!==null&&!ft();)__(Fe)}function __(a){var o=QO(a.alternate,a,Wr);a.memoizedProps=a.pendingProps,o===null?Nf(a):Fe=o}function A_(a){var o=a,c=o.alternate;switch(o.tag){case 15:case 0:o=VO(c,o,o.pendingProps,o.type,void 0,Xe);break;case 11:o=VO(c,o,o.pendingProps,o.type.render,o.ref,Xe);break;case 5:$m(o);default:e_(c,o),o=Fe=Ej(o,Wr),o=QO(c,o,Wr)}a.memoizedProps=a.pendingProps,o===null?Nf(a):Fe=o}function Vo(a,o,c,h){Ur=_i=null,$m(o),Lo=null,zs=0;var y=o.return;try{if(wI(a,y,o,c,Xe)){Tt=1,wf(a,Hn(c,a.current)),Fe=null;return}}catch(S){if(y!==null)throw Fe=y,S;Tt=1,wf(a,Hn(c,a.current)),Fe=null;return}o.flags&32768?(et||h===1?a=!0:zo||(Xe&536870912)!==0?a=!1:(La=a=!0,(h===2||h===9||h===3||h===6)&&(h=Yn.current,h!==null&&h.tag===13&&(h.flags|=16384))),E_(o,a)):Nf(o)}function Nf(a){var o=a;do{if((o.flags&32768)!==0){E_(o,La);return}a=o.return;var c=jI(o.alternate,o,Wr);if(c!==null){Fe=c;return}if(o=o.sibling,o!==null){Fe=o;return}Fe=o=a}while(o!==null);Tt===0&&(Tt=5)}function E_(a,o){do{var c=OI(a.alternate,a);if(c!==null){c.flags&=32767,Fe=c;return}if(c=a.return,c!==null&&(c.flags|=32768,c.subtreeFlags=0,c.deletions=null),!o&&(a=a.sibling,a!==null)){Fe=a;return}Fe=a=c}while(a!==null);Tt=6,Fe=null}function T_(a,o,c,h,y,S,M,R,q){a.cancelPendingCommit=null;do Mf();while(Jt!==0);if((at&6)!==0)throw Error(r(327));if(o!==null){if(o===a.current)throw Error(r(177));if(S=o.lanes|o.childLanes,S|=fm,uL(a,c,S,M,R,q),a===yt&&(Fe=yt=null,Xe=0),Ho=o,Ba=a,Fo=c,vv=S,yv=y,g_=h,(o.subtreeFlags&10256)!==0||(o.flags&10256)!==0?(a.callbackNode=null,a.callbackPriority=0,$I(Bn,function(){return R_(),null})):(a.callbackNode=null,a.callbackPriority=0),h=(o.flags&13878)!==0,(o.subtreeFlags&13878)!==0||h){h=$.T,$.T=null,y=U.p,U.p=2,M=at,at|=4;try{_I(a,o,c)}finally{at=M,U.p=y,$.T=h}}Jt=1,C_(),N_(),M_()}}function C_(){if(Jt===1){Jt=0;var a=Ba,o=Ho,c=(o.flags&13878)!==0;if((o.subtreeFlags&13878)!==0||c){c=$.T,$.T=null;var h=U.p;U.p=2;var y=at;at|=4;try{f_(o,a);var S=Rv,M=yj(a.containerInfo),R=S.focusedElem,q=S.selectionRange;if(M!==R&&R&&R.ownerDocument&&vj(R.ownerDocument.documentElement,R)){if(q!==null&&om(R)){var Q=q.start,oe=q.end;if(oe===void 0&&(oe=Q),"selectionStart"in R)R.selectionStart=Q,R.selectionEnd=Math.min(oe,R.value.length);else{var se=R.ownerDocument||document,J=se&&se.defaultView||window;if(J.getSelection){var ee=J.getSelection(),Ne=R.textContent.length,Ae=Math.min(q.start,Ne),ct=q.end===void 0?Ae:Math.min(q.end,Ne);!ee.extend&&Ae>ct&&(M=ct,ct=Ae,Ae=M);var K=mj(R,Ae),F=mj(R,ct);if(K&&F&&(ee.rangeCount!==1||ee.anchorNode!==K.node||ee.anchorOffset!==K.offset||ee.focusNode!==F.node||ee.focusOffset!==F.offset)){var W=se.createRange();W.setStart(K.node,K.offset),ee.removeAllRanges(),Ae>ct?(ee.addRange(W),ee.extend(F.node,F.offset)):(W.setEnd(F.node,F.offset),ee.addRange(W))}}}}for(se=[],ee=R;ee=ee.parentNode;)ee.nodeType===1&&se.push({element:ee,left:ee.scrollLeft,top:ee.scrollTop});for(typeof R.focus=="function"&&R.focus(),R=0;R<se.length;R++){var le=se[R];le.element.scrollLeft=le.left,le.element.scrollTop=le.top}}Hf=!!Pv,Rv=Pv=null}finally{at=y,U.p=h,$.T=c}}a.current=o,Jt=2}}function N_(){if(Jt===2){Jt=0;var a=Ba,o=Ho,c=(o.flags&8772)!==0;if((o.subtreeFlags&8772)!==0||c){c=$.T,$.T=null;var h=U.p;U.p=2;var y=at;at|=4;try{l_(a,o.alternate,o)}finally{at=y,U.p=h,$.T=c}}Jt=3}}function M_(){if(Jt===4||Jt===3){Jt=0,dt();var a=Ba,o=Ho,c=Fo,h=g_;(o.subtreeFlags&10256)!==0||(o.flags&10256)!==0?Jt=5:(Jt=0,Ho=Ba=null,P_(a,a.pendingLanes));var y=a.pendingLanes;if(y===0&&(qa=null),qp(c),o=o.stateNode,On&&typeof On.onCommitFiberRoot=="function")try{On.onCommitFiberRoot(ds,o,void 0,(o.current.flags&128)===128)}catch{}if(h!==null){o=$.T,y=U.p,U.p=2,$.T=null;try{for(var S=a.onRecoverableError,M=0;M<h.length;M++){var R=h[M];S(R.value,{componentStack:R.stack})}}finally{$.T=o,U.p=y}}(Fo&3)!==0&&Mf(),jr(a),y=a.pendingLanes,(c&4194090)!==0&&(y&42)!==0?a===gv?Ws++:(Ws=0,gv=a):Ws=0,Zs(0)}}function P_(a,o){(a.pooledCacheLanes&=o)===0&&(o=a.pooledCache,o!=null&&(a.pooledCache=null,Ns(o)))}function Mf(a){return C_(),N_(),M_(),R_()}function R_(){if(Jt!==5)return!1;var a=Ba,o=vv;vv=0;var c=qp(Fo),h=$.T,y=U.p;try{U.p=32>c?32:c,$.T=null,c=yv,yv=null;var S=Ba,M=Fo;if(Jt=0,Ho=Ba=null,Fo=0,(at&6)!==0)throw Error(r(331));var R=at;if(at|=4,v_(S.current),h_(S,S.current,M,c),at=R,Zs(0,!1),On&&typeof On.onPostCommitFiberRoot=="function")try{On.onPostCommitFiberRoot(ds,S)}catch{}return!0}finally{U.p=y,$.T=h,P_(a,o)}}function D_(a,o,c){o=Hn(c,o),o=Wm(a.stateNode,o,2),a=Na(a,o,2),a!==null&&(ps(a,2),jr(a))}function ht(a,o,c){if(a.tag===3)D_(a,a,c);else for(;o!==null;){if(o.tag===3){D_(o,a,c);break}else if(o.tag===1){var h=o.stateNode;if(typeof o.type.getDerivedStateFromError=="function"||typeof h.componentDidCatch=="function"&&(qa===null||!qa.has(h))){a=Hn(c,a),c=IO(2),h=Na(o,c,2),h!==null&&(qO(c,h,o,a),ps(h,2),jr(h));break}}o=o.return}}function Sv(a,o,c){var h=a.pingCache;if(h===null){h=a.pingCache=new TI;var y=new Set;h.set(o,y)}else y=h.get(o),y===void 0&&(y=new Set,h.set(o,y));y.has(c)||(dv=!0,y.add(c),a=RI.bind(null,a,o,c),o.then(a,a))}function RI(a,o,c){var h=a.pingCache;h!==null&&h.delete(o),a.pingedLanes|=a.suspendedLanes&c,a.warmLanes&=~c,yt===a&&(Xe&c)===c&&(Tt===4||Tt===3&&(Xe&62914560)===Xe&&300>Je()-mv?(at&2)===0&&Go(a,0):hv|=c,Uo===Xe&&(Uo=0)),jr(a)}function k_(a,o){o===0&&(o=MS()),a=Eo(a,o),a!==null&&(ps(a,o),jr(a))}function DI(a){var o=a.memoizedState,c=0;o!==null&&(c=o.retryLane),k_(a,c)}function kI(a,o){var c=0;switch(a.tag){case 13:var h=a.stateNode,y=a.memoizedState;y!==null&&(c=y.retryLane);break;case 19:h=a.stateNode;break;case 22:h=a.stateNode._retryCache;break;default:throw Error(r(314))}h!==null&&h.delete(o),k_(a,c)}function $I(a,o){return Le(a,o)}var Pf=null,Yo=null,jv=!1,Rf=!1,Ov=!1,Pi=0;function jr(a){a!==Yo&&a.next===null&&(Yo===null?Pf=Yo=a:Yo=Yo.next=a),Rf=!0,jv||(jv=!0,II())}function Zs(a,o){if(!Ov&&Rf){Ov=!0;do for(var c=!1,h=Pf;h!==null;){if(a!==0){var y=h.pendingLanes;if(y===0)var S=0;else{var M=h.suspendedLanes,R=h.pingedLanes;S=(1<<31-_n(42|a)+1)-1,S&=y&~(M&~R),S=S&201326741?S&201326741|1:S?S|2:0}S!==0&&(c=!0,q_(h,S))}else S=Xe,S=Iu(h,h===yt?S:0,h.cancelPendingCommit!==null||h.timeoutHandle!==-1),(S&3)===0||hs(h,S)||(c=!0,q_(h,S));h=h.next}while(c);Ov=!1}}function LI(){$_()}function $_(){Rf=jv=!1;var a=0;Pi!==0&&(VI()&&(a=Pi),Pi=0);for(var o=Je(),c=null,h=Pf;h!==null;){var y=h.next,S=L_(h,o);S===0?(h.next=null,c===null?Pf=y:c.next=y,y===null&&(Yo=c)):(c=h,(a!==0||(S&3)!==0)&&(Rf=!0)),h=y}Zs(a)}function L_(a,o){for(var c=a.suspendedLanes,h=a.pingedLanes,y=a.expirationTimes,S=a.pendingLanes&-62914561;0<S;){var M=31-_n(S),R=1<<M,q=y[M];q===-1?((R&c)===0||(R&h)!==0)&&(y[M]=cL(R,o)):q<=o&&(a.expiredLanes|=R),S&=~R}if(o=yt,c=Xe,c=Iu(a,a===o?c:0,a.cancelPendingCommit!==null||a.timeoutHandle!==-1),h=a.callbackNode,c===0||a===o&&(it===2||it===9)||a.cancelPendingCommit!==null)return h!==null&&h!==null&&Ce(h),a.callbackNode=null,a.callbackPriority=0;if((c&3)===0||hs(a,c)){if(o=c&-c,o===a.callbackPriority)return o;switch(h!==null&&Ce(h),qp(c)){case 2:case 8:c=pi;break;case 32:c=Bn;break;case 268435456:c=fo;break;default:c=Bn}return h=I_.bind(null,a),c=Le(c,h),a.callbackPriority=o,a.callbackNode=c,o}return h!==null&&h!==null&&Ce(h),a.callbackPriority=2,a.callbackNode=null,2}function I_(a,o){if(Jt!==0&&Jt!==5)return a.callbackNode=null,a.callbackPriority=0,null;var c=a.callbackNode;if(Mf()&&a.callbackNode!==c)return null;var h=Xe;return h=Iu(a,a===yt?h:0,a.cancelPendingCommit!==null||a.timeoutHandle!==-1),h===0?null:(x_(a,h,o),L_(a,Je()),a.callbackNode!=null&&a.callbackNode===c?I_.bind(null,a):null)}function q_(a,o){if(Mf())return null;x_(a,o,!0)}function II(){KI(function(){(at&6)!==0?Le(vn,LI):$_()})}function _v(){return Pi===0&&(Pi=NS()),Pi}function B_(a){return a==null||typeof a=="symbol"||typeof a=="boolean"?null:typeof a=="function"?a:Hu(""+a)}function z_(a,o){var c=o.ownerDocument.createElement("input");return c.name=o.name,c.value=o.value,a.id&&c.setAttribute("form",a.id),o.parentNode.insertBefore(c,o),a=new FormData(a),c.parentNode.removeChild(c),a}function qI(a,o,c,h,y){if(o==="submit"&&c&&c.stateNode===y){var S=B_((y[yn]||null).action),M=h.submitter;M&&(o=(o=M[yn]||null)?B_(o.formAction):M.getAttribute("formAction"),o!==null&&(S=o,M=null));var R=new Yu("action","action",null,h,y);a.push({event:R,listeners:[{instance:null,listener:function(){if(h.defaultPrevented){if(Pi!==0){var q=M?z_(y,M):new FormData(y);Gm(c,{pending:!0,data:q,method:y.method,action:S},null,q)}}else typeof S=="function"&&(R.preventDefault(),q=M?z_(y,M):new FormData(y),Gm(c,{pending:!0,data:q,method:y.method,action:S},S,q))},currentTarget:y}]})}}for(var Av=0;Av<um.length;Av++){var Ev=um[Av],BI=Ev.toLowerCase(),zI=Ev[0].toUpperCase()+Ev.slice(1);ar(BI,"on"+zI)}ar(xj,"onAnimationEnd"),ar(wj,"onAnimationIteration"),ar(Sj,"onAnimationStart"),ar("dblclick","onDoubleClick"),ar("focusin","onFocus"),ar("focusout","onBlur"),ar(aI,"onTransitionRun"),ar(iI,"onTransitionStart"),ar(oI,"onTransitionCancel"),ar(jj,"onTransitionEnd"),yo("onMouseEnter",["mouseout","mouseover"]),yo("onMouseLeave",["mouseout","mouseover"]),yo("onPointerEnter",["pointerout","pointerover"]),yo("onPointerLeave",["pointerout","pointerover"]),vi("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),vi("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),vi("onBeforeInput",["compositionend","keypress","textInput","paste"]),vi("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),vi("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),vi("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Qs="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),UI=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(Qs));function U_(a,o){o=(o&4)!==0;for(var c=0;c<a.length;c++){var h=a[c],y=h.event;h=h.listeners;e:{var S=void 0;if(o)for(var M=h.length-1;0<=M;M--){var R=h[M],q=R.instance,Q=R.currentTarget;if(R=R.listener,q!==S&&y.isPropagationStopped())break e;S=R,y.currentTarget=Q;try{S(y)}catch(oe){xf(oe)}y.currentTarget=null,S=q}else for(M=0;M<h.length;M++){if(R=h[M],q=R.instance,Q=R.currentTarget,R=R.listener,q!==S&&y.isPropagationStopped())break e;S=R,y.currentTarget=Q;try{S(y)}catch(oe){xf(oe)}y.currentTarget=null,S=q}}}}function Ge(a,o){var c=o[Bp];c===void 0&&(c=o[Bp]=new Set);var h=a+"__bubble";c.has(h)||(H_(o,a,2,!1),c.add(h))}function Tv(a,o,c){var h=0;o&&(h|=4),H_(c,a,h,o)}var Df="_reactListening"+Math.random().toString(36).slice(2);function Cv(a){if(!a[Df]){a[Df]=!0,$S.forEach(function(c){c!=="selectionchange"&&(UI.has(c)||Tv(c,!1,a),Tv(c,!0,a))});var o=a.nodeType===9?a:a.ownerDocument;o===null||o[Df]||(o[Df]=!0,Tv("selectionchange",!1,o))}}function H_(a,o,c,h){switch(hA(o)){case 2:var y=mq;break;case 8:y=vq;break;default:y=Hv}c=y.bind(null,o,c,a),y=void 0,!Zp||o!=="touchstart"&&o!=="touchmove"&&o!=="wheel"||(y=!0),h?y!==void 0?a.addEventListener(o,c,{capture:!0,passive:y}):a.addEventListener(o,c,!0):y!==void 0?a.addEventListener(o,c,{passive:y}):a.addEventListener(o,c,!1)}function Nv(a,o,c,h,y){var S=h;if((o&1)===0&&(o&2)===0&&h!==null)e:for(;;){if(h===null)return;var M=h.tag;if(M===3||M===4){var R=h.stateNode.containerInfo;if(R===y)break;if(M===4)for(M=h.return;M!==null;){var q=M.tag;if((q===3||q===4)&&M.stateNode.containerInfo===y)return;M=M.return}for(;R!==null;){if(M=po(R),M===null)return;if(q=M.tag,q===5||q===6||q===26||q===27){h=S=M;continue e}R=R.parentNode}}h=h.return}WS(function(){var Q=S,oe=Xp(c),se=[];e:{var J=Oj.get(a);if(J!==void 0){var ee=Yu,Ne=a;switch(a){case"keypress":if(Gu(c)===0)break e;case"keydown":case"keyup":ee=$L;break;case"focusin":Ne="focus",ee=tm;break;case"focusout":Ne="blur",ee=tm;break;case"beforeblur":case"afterblur":ee=tm;break;case"click":if(c.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":ee=JS;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":ee=OL;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":ee=qL;break;case xj:case wj:case Sj:ee=EL;break;case jj:ee=zL;break;case"scroll":case"scrollend":ee=SL;break;case"wheel":ee=HL;break;case"copy":case"cut":case"paste":ee=CL;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":ee=tj;break;case"toggle":case"beforetoggle":ee=GL}var Ae=(o&4)!==0,ct=!Ae&&(a==="scroll"||a==="scrollend"),K=Ae?J!==null?J+"Capture":null:J;Ae=[];for(var F=Q,W;F!==null;){var le=F;if(W=le.stateNode,le=le.tag,le!==5&&le!==26&&le!==27||W===null||K===null||(le=ys(F,K),le!=null&&Ae.push(Js(F,le,W))),ct)break;F=F.return}0<Ae.length&&(J=new ee(J,Ne,null,c,oe),se.push({event:J,listeners:Ae}))}}if((o&7)===0){e:{if(J=a==="mouseover"||a==="pointerover",ee=a==="mouseout"||a==="pointerout",J&&c!==Kp&&(Ne=c.relatedTarget||c.fromElement)&&(po(Ne)||Ne[ho]))break e;if((ee||J)&&(J=oe.window===oe?oe:(J=oe.ownerDocument)?J.defaultView||J.parentWindow:window,ee?(Ne=c.relatedTarget||c.toElement,ee=Q,Ne=Ne?po(Ne):null,Ne!==null&&(ct=l(Ne),Ae=Ne.tag,Ne!==ct||Ae!==5&&Ae!==27&&Ae!==6)&&(Ne=null)):(ee=null,Ne=Q),ee!==Ne)){if(Ae=JS,le="onMouseLeave",K="onMouseEnter",F="mouse",(a==="pointerout"||a==="pointerover")&&(Ae=tj,le="onPointerLeave",K="onPointerEnter",F="pointer"),ct=ee==null?J:vs(ee),W=Ne==null?J:vs(Ne),J=new Ae(le,F+"leave",ee,c,oe),J.target=ct,J.relatedTarget=W,le=null,po(oe)===Q&&(Ae=new Ae(K,F+"enter",Ne,c,oe),Ae.target=W,Ae.relatedTarget=ct,le=Ae),ct=le,ee&&Ne)t:{for(Ae=ee,K=Ne,F=0,W=Ae;W;W=Ko(W))F++;for(W=0,le=K;le;le=Ko(le))W++;for(;0<F-W;)Ae=Ko(Ae),F--;for(;0<W-F;)K=Ko(K),W--;for(;F--;){if(Ae===K||K!==null&&Ae===K.alternate)break t;Ae=Ko(Ae),K=Ko(K)}Ae=null}else Ae=null;ee!==null&&F_(se,J,ee,Ae,!1),Ne!==null&&ct!==null&&F_(se,ct,Ne,Ae,!0)}}e:{if(J=Q?vs(Q):window,ee=J.nodeName&&J.nodeName.toLowerCase(),ee==="select"||ee==="input"&&J.type==="file")var be=cj;else if(lj(J))if(uj)be=tI;else{be=JL;var Ue=QL}else ee=J.nodeName,!ee||ee.toLowerCase()!=="input"||J.type!=="checkbox"&&J.type!=="radio"?Q&&Yp(Q.elementType)&&(be=cj):be=eI;if(be&&(be=be(a,Q))){sj(se,be,c,oe);break e}Ue&&Ue(a,J,Q),a==="focusout"&&Q&&J.type==="number"&&Q.memoizedProps.value!=null&&Vp(J,"number",J.value)}switch(Ue=Q?vs(Q):window,a){case"focusin":(lj(Ue)||Ue.contentEditable==="true")&&(Oo=Ue,lm=Q,_s=null);break;case"focusout":_s=lm=Oo=null;break;case"mousedown":sm=!0;break;case"contextmenu":case"mouseup":case"dragend":sm=!1,gj(se,c,oe);break;case"selectionchange":if(rI)break;case"keydown":case"keyup":gj(se,c,oe)}var Se;if(rm)e:{switch(a){case"compositionstart":var Ee="onCompositionStart";break e;case"compositionend":Ee="onCompositionEnd";break e;case"compositionupdate":Ee="onCompositionUpdate";break e}Ee=void 0}else jo?ij(a,c)&&(Ee="onCompositionEnd"):a==="keydown"&&c.keyCode===229&&(Ee="onCompositionStart");Ee&&(nj&&c.locale!=="ko"&&(jo||Ee!=="onCompositionStart"?Ee==="onCompositionEnd"&&jo&&(Se=ZS()):(Aa=oe,Qp="value"in Aa?Aa.value:Aa.textContent,jo=!0)),Ue=kf(Q,Ee),0<Ue.length&&(Ee=new ej(Ee,a,null,c,oe),se.push({event:Ee,listeners:Ue}),Se?Ee.data=Se:(Se=oj(c),Se!==null&&(Ee.data=Se)))),(Se=YL?KL(a,c):XL(a,c))&&(Ee=kf(Q,"onBeforeInput"),0<Ee.length&&(Ue=new ej("onBeforeInput","beforeinput",null,c,oe),se.push({event:Ue,listeners:Ee}),Ue.data=Se)),qI(se,a,Q,c,oe)}U_(se,o)})}function Js(a,o,c){return{instance:a,listener:o,currentTarget:c}}function kf(a,o){for(var c=o+"Capture",h=[];a!==null;){var y=a,S=y.stateNode;if(y=y.tag,y!==5&&y!==26&&y!==27||S===null||(y=ys(a,c),y!=null&&h.unshift(Js(a,y,S)),y=ys(a,o),y!=null&&h.push(Js(a,y,S))),a.tag===3)return h;a=a.return}return[]}function Ko(a){if(a===null)return null;do a=a.return;while(a&&a.tag!==5&&a.tag!==27);return a||null}function F_(a,o,c,h,y){for(var S=o._reactName,M=[];c!==null&&c!==h;){var R=c,q=R.alternate,Q=R.stateNode;if(R=R.tag,q!==null&&q===h)break;R!==5&&R!==26&&R!==27||Q===null||(q=Q,y?(Q=ys(c,S),Q!=null&&M.unshift(Js(c,Q,q))):y||(Q=ys(c,S),Q!=null&&M.push(Js(c,Q,q)))),c=c.return}M.length!==0&&a.push({event:o,listeners:M})}var HI=/\r\n?/g,FI=/\u0000|\uFFFD/g;function G_(a){return(typeof a=="string"?a:""+a).replace(HI,`
-`).replace(FI,"")}function V_(a,o){return o=G_(o),G_(a)===o}function $f(){}function st(a,o,c,h,y,S){switch(c){case"children":typeof h=="string"?o==="body"||o==="textarea"&&h===""||xo(a,h):(typeof h=="number"||typeof h=="bigint")&&o!=="body"&&xo(a,""+h);break;case"className":Bu(a,"class",h);break;case"tabIndex":Bu(a,"tabindex",h);break;case"dir":case"role":case"viewBox":case"width":case"height":Bu(a,c,h);break;case"style":KS(a,h,S);break;case"data":if(o!=="object"){Bu(a,"data",h);break}case"src":case"href":if(h===""&&(o!=="a"||c!=="href")){a.removeAttribute(c);break}if(h==null||typeof h=="function"||typeof h=="symbol"||typeof h=="boolean"){a.removeAttribute(c);break}h=Hu(""+h),a.setAttribute(c,h);break;case"action":case"formAction":if(typeof h=="function"){a.setAttribute(c,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof S=="function"&&(c==="formAction"?(o!=="input"&&st(a,o,"name",y.name,y,null),st(a,o,"formEncType",y.formEncType,y,null),st(a,o,"formMethod",y.formMethod,y,null),st(a,o,"formTarget",y.formTarget,y,null)):(st(a,o,"encType",y.encType,y,null),st(a,o,"method",y.method,y,null),st(a,o,"target",y.target,y,null)));if(h==null||typeof h=="symbol"||typeof h=="boolean"){a.removeAttribute(c);break}h=Hu(""+h),a.setAttribute(c,h);break;case"onClick":h!=null&&(a.onclick=$f);break;case"onScroll":h!=null&&Ge("scroll",a);break;case"onScrollEnd":h!=null&&Ge("scrollend",a);break;case"dangerouslySetInnerHTML":if(h!=null){if(typeof h!="object"||!("__html"in h))throw Error(r(61));if(c=h.__html,c!=null){if(y.children!=null)throw Error(r(60));a.innerHTML=c}}break;case"multiple":a.multiple=h&&typeof h!="function"&&typeof h!="symbol";break;case"muted":a.muted=h&&typeof h!="function"&&typeof h!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(h==null||typeof h=="function"||typeof h=="boolean"||typeof h=="symbol"){a.removeAttribute("xlink:href");break}c=Hu(""+h),a.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",c);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":h!=null&&typeof h!="function"&&typeof h!="symbol"?a.setAttribute(c,""+h):a.removeAttribute(c);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":h&&typeof h!="function"&&typeof h!="symbol"?a.setAttribute(c,""):a.removeAttribute(c);break;case"capture":case"download":h===!0?a.setAttribute(c,""):h!==!1&&h!=null&&typeof h!="function"&&typeof h!="symbol"?a.setAttribute(c,h):a.removeAttribute(c);break;case"cols":case"rows":case"size":case"span":h!=null&&typeof h!="function"&&typeof h!="symbol"&&!isNaN(h)&&1<=h?a.setAttribute(c,h):a.removeAttribute(c);break;case"rowSpan":case"start":h==null||typeof h=="function"||typeof h=="symbol"||isNaN(h)?a.removeAttribute(c):a.setAttribute(c,h);break;case"popover":Ge("beforetoggle",a),Ge("toggle",a),qu(a,"popover",h);break;case"xlinkActuate":Lr(a,"http://www.w3.org/1999/xlink","xlink:actuate",h);break;case"xlinkArcrole":Lr(a,"http://www.w3.org/1999/xlink","xlink:arcrole",h);break;case"xlinkRole":Lr(a,"http://www.w3.org/1999/xlink","xlink:role",h);break;case"xlinkShow":Lr(a,"http://www.w3.org/1999/xlink","xlink:show",h);break;case"xlinkTitle":Lr(a,"http://www.w3.org/1999/xlink","xlink:title",h);break;case"xlinkType":Lr(a,"http://www.w3.org/1999/xlink","xlink:type",h);break;case"xmlBase":Lr(a,"http://www.w3.org/XML/1998/namespace","xml:base",h);break;case"xmlLang":Lr(a,"http://www.w3.org/XML/1998/namespace","xml:lang",h);break;case"xmlSpace":Lr(a,"http://www.w3.org/XML/1998/namespace","xml:space",h);break;case"is":qu(a,"is",h);break;case"innerText":case"textContent":break;default:(!(2<c.length)||c[0]!=="o"&&c[0]!=="O"||c[1]!=="n"&&c[1]!=="N")&&(c=xL.get(c)||c,qu(a,c,h))}}function Mv(a,o,c,h,y,S){switch(c){case"style":KS(a,h,S);break;case"dangerouslySetInnerHTML":if(h!=null){if(typeof h!="object"||!("__html"in h))throw Error(r(61));if(c=h.__html,c!=null){if(y.children!=null)throw Error(r(60));a.innerHTML=c}}break;case"children":typeof h=="string"?xo(a,h):(typeof h=="number"||typeof h=="bigint")&&xo(a,""+h);break;case"onScroll":h!=null&&Ge("scroll",a);break;case"onScrollEnd":h!=null&&Ge("scrollend",a);break;case"onClick":h!=null&&(a.onclick=$f);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!LS.hasOwnProperty(c))e:{if(c[0]==="o"&&c[1]==="n"&&(y=c.endsWith("Capture"),o=c.slice(2,y?c.length-7:void 0),S=a[yn]||null,S=S!=null?S[c]:null,typeof S=="function"&&a.removeEventListener(o,S,y),typeof h=="function")){typeof S!="function"&&S!==null&&(c in a?a[c]=null:a.hasAttribute(c)&&a.removeAttribute(c)),a.addEventListener(o,h,y);break e}c in a?a[c]=h:h===!0?a.setAttribute(c,""):qu(a,c,h)}}}function en(a,o,c){switch(o){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":Ge("error",a),Ge("load",a);var h=!1,y=!1,S;for(S in c)if(c.hasOwnProperty(S)){var M=c[S];if(M!=null)switch(S){case"src":h=!0;break;case"srcSet":y=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(r(137,o));default:st(a,o,S,M,c,null)}}y&&st(a,o,"srcSet",c.srcSet,c,null),h&&st(a,o,"src",c.src,c,null);return;case"input":Ge("invalid",a);var R=S=M=y=null,q=null,Q=null;for(h in c)if(c.hasOwnProperty(h)){var oe=c[h];if(oe!=null)switch(h){case"name":y=oe;break;case"type":M=oe;break;case"checked":q=oe;break;case"defaultChecked":Q=oe;break;case"value":S=oe;break;case"defaultValue":R=oe;break;case"children":case"dangerouslySetInnerHTML":if(oe!=null)throw Error(r(137,o));break;default:st(a,o,h,oe,c,null)}}FS(a,S,R,q,Q,M,y,!1),zu(a);return;case"select":Ge("invalid",a),h=M=S=null;for(y in c)if(c.hasOwnProperty(y)&&(R=c[y],R!=null))switch(y){case"value":S=R;break;case"defaultValue":M=R;break;case"multiple":h=R;default:st(a,o,y,R,c,null)}o=S,c=M,a.multiple=!!h,o!=null?bo(a,!!h,o,!1):c!=null&&bo(a,!!h,c,!0);return;case"textarea":Ge("invalid",a),S=y=h=null;for(M in c)if(c.hasOwnProperty(M)&&(R=c[M],R!=null))switch(M){case"value":h=R;break;case"defaultValue":y=R;break;case"children":S=R;break;case"dangerouslySetInnerHTML":if(R!=null)throw Error(r(91));break;default:st(a,o,M,R,c,null)}VS(a,h,y,S),zu(a);return;case"option":for(q in c)if(c.hasOwnProperty(q)&&(h=c[q],h!=null))switch(q){case"selected":a.selected=h&&typeof h!="function"&&typeof h!="symbol";break;default:st(a,o,q,h,c,null)}return;case"dialog":Ge("beforetoggle",a),Ge("toggle",a),Ge("cancel",a),Ge("close",a);break;case"iframe":case"object":Ge("load",a);break;case"video":case"audio":for(h=0;h<Qs.length;h++)Ge(Qs[h],a);break;case"image":Ge("error",a),Ge("load",a);break;case"details":Ge("toggle",a);break;case"embed":case"source":case"link":Ge("error",a),Ge("load",a);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(Q in c)if(c.hasOwnProperty(Q)&&(h=c[Q],h!=null))switch(Q){case"children":case"dangerouslySetInnerHTML":throw Error(r(137,o));default:st(a,o,Q,h,c,null)}return;default:if(Yp(o)){for(oe in c)c.hasOwnProperty(oe)&&(h=c[oe],h!==void 0&&Mv(a,o,oe,h,c,void 0));return}}for(R in c)c.hasOwnProperty(R)&&(h=c[R],h!=null&&st(a,o,R,h,c,null))}function GI(a,o,c,h){switch(o){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var y=null,S=null,M=null,R=null,q=null,Q=null,oe=null;for(ee in c){var se=c[ee];if(c.hasOwnProperty(ee)&&se!=null)switch(ee){case"checked":break;case"value":break;case"defaultValue":q=se;default:h.hasOwnProperty(ee)||st(a,o,ee,null,h,se)}}for(var J in h){var ee=h[J];if(se=c[J],h.hasOwnProperty(J)&&(ee!=null||se!=null))switch(J){case"type":S=ee;break;case"name":y=ee;break;case"checked":Q=ee;break;case"defaultChecked":oe=ee;break;case"value":M=ee;break;case"defaultValue":R=ee;break;case"children":case"dangerouslySetInnerHTML":if(ee!=null)throw Error(r(137,o));break;default:ee!==se&&st(a,o,J,ee,h,se)}}Gp(a,M,R,q,Q,oe,S,y);return;case"select":ee=M=R=J=null;for(S in c)if(q=c[S],c.hasOwnProperty(S)&&q!=null)switch(S){case"value":break;case"multiple":ee=q;default:h.hasOwnProperty(S)||st(a,o,S,null,h,q)}for(y in h)if(S=h[y],q=c[y],h.hasOwnProperty(y)&&(S!=null||q!=null))switch(y){case"value":J=S;break;case"defaultValue":R=S;break;case"multiple":M=S;default:S!==q&&st(a,o,y,S,h,q)}o=R,c=M,h=ee,J!=null?bo(a,!!c,J,!1):!!h!=!!c&&(o!=null?bo(a,!!c,o,!0):bo(a,!!c,c?[]:"",!1));return;case"textarea":ee=J=null;for(R in c)if(y=c[R],c.hasOwnProperty(R)&&y!=null&&!h.hasOwnProperty(R))switch(R){case"value":break;case"children":break;default:st(a,o,R,null,h,y)}for(M in h)if(y=h[M],S=c[M],h.hasOwnProperty(M)&&(y!=null||S!=null))switch(M){case"value":J=y;break;case"defaultValue":ee=y;break;case"children":break;case"dangerouslySetInnerHTML":if(y!=null)throw Error(r(91));break;default:y!==S&&st(a,o,M,y,h,S)}GS(a,J,ee);return;case"option":for(var Ne in c)if(J=c[Ne],c.hasOwnProperty(Ne)&&J!=null&&!h.hasOwnProperty(Ne))switch(Ne){case"selected":a.selected=!1;break;default:st(a,o,Ne,null,h,J)}for(q in h)if(J=h[q],ee=c[q],h.hasOwnProperty(q)&&J!==ee&&(J!=null||ee!=null))switch(q){case"selected":a.selected=J&&typeof J!="function"&&typeof J!="symbol";break;default:st(a,o,q,J,h,ee)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var Ae in c)J=c[Ae],c.hasOwnProperty(Ae)&&J!=null&&!h.hasOwnProperty(Ae)&&st(a,o,Ae,null,h,J);for(Q in h)if(J=h[Q],ee=c[Q],h.hasOwnProperty(Q)&&J!==ee&&(J!=null||ee!=null))switch(Q){case"children":case"dangerouslySetInnerHTML":if(J!=null)throw Error(r(137,o));break;default:st(a,o,Q,J,h,ee)}return;default:if(Yp(o)){for(var ct in c)J=c[ct],c.hasOwnProperty(ct)&&J!==void 0&&!h.hasOwnProperty(ct)&&Mv(a,o,ct,void 0,h,J);for(oe in h)J=h[oe],ee=c[oe],!h.hasOwnProperty(oe)||J===ee||J===void 0&&ee===void 0||Mv(a,o,oe,J,h,ee);return}}for(var K in c)J=c[K],c.hasOwnProperty(K)&&J!=null&&!h.hasOwnProperty(K)&&st(a,o,K,null,h,J);for(se in h)J=h[se],ee=c[se],!h.hasOwnProperty(se)||J===ee||J==null&&ee==null||st(a,o,se,J,h,ee)}var Pv=null,Rv=null;function Lf(a){return a.nodeType===9?a:a.ownerDocument}function Y_(a){switch(a){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function K_(a,o){if(a===0)switch(o){case"svg":return 1;case"math":return 2;default:return 0}return a===1&&o==="foreignObject"?0:a}function Dv(a,o){return a==="textarea"||a==="noscript"||typeof o.children=="string"||typeof o.children=="number"||typeof o.children=="bigint"||typeof o.dangerouslySetInnerHTML=="object"&&o.dangerouslySetInnerHTML!==null&&o.dangerouslySetInnerHTML.__html!=null}var kv=null;function VI(){var a=window.event;return a&&a.type==="popstate"?a===kv?!1:(kv=a,!0):(kv=null,!1)}var X_=typeof setTimeout=="function"?setTimeout:void 0,YI=typeof clearTimeout=="function"?clearTimeout:void 0,W_=typeof Promise=="function"?Promise:void 0,KI=typeof queueMicrotask=="function"?queueMicrotask:typeof W_<"u"?function(a){return W_.resolve(null).then(a).catch(XI)}:X_;function XI(a){setTimeout(function(){throw a})}function Ua(a){return a==="head"}function Z_(a,o){var c=o,h=0,y=0;do{var S=c.nextSibling;if(a.removeChild(c),S&&S.nodeType===8)if(c=S.data,c==="/$"){if(0<h&&8>h){c=h;var M=a.ownerDocument;if(c&1&&ec(M.documentElement),c&2&&ec(M.body),c&4)for(c=M.head,ec(c),M=c.firstChild;M;){var R=M.nextSibling,q=M.nodeName;M[ms]||q==="SCRIPT"||q==="STYLE"||q==="LINK"&&M.rel.toLowerCase()==="stylesheet"||c.removeChild(M),M=R}}if(y===0){a.removeChild(S),sc(o);return}y--}else c==="$"||c==="$?"||c==="$!"?y++:h=c.charCodeAt(0)-48;else h=0;c=S}while(c);sc(o)}function $v(a){var o=a.firstChild;for(o&&o.nodeType===10&&(o=o.nextSibling);o;){var c=o;switch(o=o.nextSibling,c.nodeName){case"HTML":case"HEAD":case"BODY":$v(c),zp(c);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(c.rel.toLowerCase()==="stylesheet")continue}a.removeChild(c)}}function WI(a,o,c,h){for(;a.nodeType===1;){var y=c;if(a.nodeName.toLowerCase()!==o.toLowerCase()){if(!h&&(a.nodeName!=="INPUT"||a.type!=="hidden"))break}else if(h){if(!a[ms])switch(o){case"meta":if(!a.hasAttribute("itemprop"))break;return a;case"link":if(S=a.getAttribute("rel"),S==="stylesheet"&&a.hasAttribute("data-precedence"))break;if(S!==y.rel||a.getAttribute("href")!==(y.href==null||y.href===""?null:y.href)||a.getAttribute("crossorigin")!==(y.crossOrigin==null?null:y.crossOrigin)||a.getAttribute("title")!==(y.title==null?null:y.title))break;return a;case"style":if(a.hasAttribute("data-precedence"))break;return a;case"script":if(S=a.getAttribute("src"),(S!==(y.src==null?null:y.src)||a.getAttribute("type")!==(y.type==null?null:y.type)||a.getAttribute("crossorigin")!==(y.crossOrigin==null?null:y.crossOrigin))&&S&&a.hasAttribute("async")&&!a.hasAttribute("itemprop"))break;return a;default:return a}}else if(o==="input"&&a.type==="hidden"){var S=y.name==null?null:""+y.name;if(y.type==="hidden"&&a.getAttribute("name")===S)return a}else return a;if(a=or(a.nextSibling),a===null)break}return null}function ZI(a,o,c){if(o==="")return null;for(;a.nodeType!==3;)if((a.nodeType!==1||a.nodeName!=="INPUT"||a.type!=="hidden")&&!c||(a=or(a.nextSibling),a===null))return null;return a}function Lv(a){return a.data==="$!"||a.data==="$?"&&a.ownerDocument.readyState==="complete"}function QI(a,o){var c=a.ownerDocument;if(a.data!=="$?"||c.readyState==="complete")o();else{var h=function(){o(),c.removeEventListener("DOMContentLoaded",h)};c.addEventListener("DOMContentLoaded",h),a._reactRetry=h}}function or(a){for(;a!=null;a=a.nextSibling){var o=a.nodeType;if(o===1||o===3)break;if(o===8){if(o=a.data,o==="$"||o==="$!"||o==="$?"||o==="F!"||o==="F")break;if(o==="/$")return null}}return a}var Iv=null;function Q_(a){a=a.previousSibling;for(var o=0;a;){if(a.nodeType===8){var c=a.data;if(c==="$"||c==="$!"||c==="$?"){if(o===0)return a;o--}else c==="/$"&&o++}a=a.previousSibling}return null}function J_(a,o,c){switch(o=Lf(c),a){case"html":if(a=o.documentElement,!a)throw Error(r(452));return a;case"head":if(a=o.head,!a)throw Error(r(453));return a;case"body":if(a=o.body,!a)throw Error(r(454));return a;default:throw Error(r(451))}}function ec(a){for(var o=a.attributes;o.length;)a.removeAttributeNode(o[0]);zp(a)}var Xn=new Map,eA=new Set;function If(a){return typeof a.getRootNode=="function"?a.getRootNode():a.nodeType===9?a:a.ownerDocument}var Zr=U.d;U.d={f:JI,r:eq,D:tq,C:nq,L:rq,m:aq,X:oq,S:iq,M:lq};function JI(){var a=Zr.f(),o=Cf();return a||o}function eq(a){var o=mo(a);o!==null&&o.tag===5&&o.type==="form"?xO(o):Zr.r(a)}var Xo=typeof document>"u"?null:document;function tA(a,o,c){var h=Xo;if(h&&typeof o=="string"&&o){var y=Un(o);y='link[rel="'+a+'"][href="'+y+'"]',typeof c=="string"&&(y+='[crossorigin="'+c+'"]'),eA.has(y)||(eA.add(y),a={rel:a,crossOrigin:c,href:o},h.querySelector(y)===null&&(o=h.createElement("link"),en(o,"link",a),Ft(o),h.head.appendChild(o)))}}function tq(a){Zr.D(a),tA("dns-prefetch",a,null)}function nq(a,o){Zr.C(a,o),tA("preconnect",a,o)}function rq(a,o,c){Zr.L(a,o,c);var h=Xo;if(h&&a&&o){var y='link[rel="preload"][as="'+Un(o)+'"]';o==="image"&&c&&c.imageSrcSet?(y+='[imagesrcset="'+Un(c.imageSrcSet)+'"]',typeof c.imageSizes=="string"&&(y+='[imagesizes="'+Un(c.imageSizes)+'"]')):y+='[href="'+Un(a)+'"]';var S=y;switch(o){case"style":S=Wo(a);break;case"script":S=Zo(a)}Xn.has(S)||(a=m({rel:"preload",href:o==="image"&&c&&c.imageSrcSet?void 0:a,as:o},c),Xn.set(S,a),h.querySelector(y)!==null||o==="style"&&h.querySelector(tc(S))||o==="script"&&h.querySelector(nc(S))||(o=h.createElement("link"),en(o,"link",a),Ft(o),h.head.appendChild(o)))}}function aq(a,o){Zr.m(a,o);var c=Xo;if(c&&a){var h=o&&typeof o.as=="string"?o.as:"script",y='link[rel="modulepreload"][as="'+Un(h)+'"][href="'+Un(a)+'"]',S=y;switch(h){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":S=Zo(a)}if(!Xn.has(S)&&(a=m({rel:"modulepreload",href:a},o),Xn.set(S,a),c.querySelector(y)===null)){switch(h){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(c.querySelector(nc(S)))return}h=c.createElement("link"),en(h,"link",a),Ft(h),c.head.appendChild(h)}}}function iq(a,o,c){Zr.S(a,o,c);var h=Xo;if(h&&a){var y=vo(h).hoistableStyles,S=Wo(a);o=o||"default";var M=y.get(S);if(!M){var R={loading:0,preload:null};if(M=h.querySelector(tc(S)))R.loading=5;else{a=m({rel:"stylesheet",href:a,"data-precedence":o},c),(c=Xn.get(S))&&qv(a,c);var q=M=h.createElement("link");Ft(q),en(q,"link",a),q._p=new Promise(function(Q,oe){q.onload=Q,q.onerror=oe}),q.addEventListener("load",function(){R.loading|=1}),q.addEventListener("error",function(){R.loading|=2}),R.loading|=4,qf(M,o,h)}M={type:"stylesheet",instance:M,count:1,state:R},y.set(S,M)}}}function oq(a,o){Zr.X(a,o);var c=Xo;if(c&&a){var h=vo(c).hoistableScripts,y=Zo(a),S=h.get(y);S||(S=c.querySelector(nc(y)),S||(a=m({src:a,async:!0},o),(o=Xn.get(y))&&Bv(a,o),S=c.createElement("script"),Ft(S),en(S,"link",a),c.head.appendChild(S)),S={type:"script",instance:S,count:1,state:null},h.set(y,S))}}function lq(a,o){Zr.M(a,o);var c=Xo;if(c&&a){var h=vo(c).hoistableScripts,y=Zo(a),S=h.get(y);S||(S=c.querySelector(nc(y)),S||(a=m({src:a,async:!0,type:"module"},o),(o=Xn.get(y))&&Bv(a,o),S=c.createElement("script"),Ft(S),en(S,"link",a),c.head.appendChild(S)),S={type:"script",instance:S,count:1,state:null},h.set(y,S))}}function nA(a,o,c,h){var y=(y=me.current)?If(y):null;if(!y)throw Error(r(446));switch(a){case"meta":case"title":return null;case"style":return typeof c.precedence=="string"&&typeof c.href=="string"?(o=Wo(c.href),c=vo(y).hoistableStyles,h=c.get(o),h||(h={type:"style",instance:null,count:0,state:null},c.set(o,h)),h):{type:"void",instance:null,count:0,state:null};case"link":if(c.rel==="stylesheet"&&typeof c.href=="string"&&typeof c.precedence=="string"){a=Wo(c.href);var S=vo(y).hoistableStyles,M=S.get(a);if(M||(y=y.ownerDocument||y,M={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},S.set(a,M),(S=y.querySelector(tc(a)))&&!S._p&&(M.instance=S,M.state.loading=5),Xn.has(a)||(c={rel:"preload",as:"style",href:c.href,crossOrigin:c.crossOrigin,integrity:c.integrity,media:c.media,hrefLang:c.hrefLang,referrerPolicy:c.referrerPolicy},Xn.set(a,c),S||sq(y,a,c,M.state))),o&&h===null)throw Error(r(528,""));return M}if(o&&h!==null)throw Error(r(529,""));return null;case"script":return o=c.async,c=c.src,typeof c=="string"&&o&&typeof o!="function"&&typeof o!="symbol"?(o=Zo(c),c=vo(y).hoistableScripts,h=c.get(o),h||(h={type:"script",instance:null,count:0,state:null},c.set(o,h)),h):{type:"void",instance:null,count:0,state:null};default:throw Error(r(444,a))}}function Wo(a){return'href="'+Un(a)+'"'}function tc(a){return'link[rel="stylesheet"]['+a+"]"}function rA(a){return m({},a,{"data-precedence":a.precedence,precedence:null})}function sq(a,o,c,h){a.querySelector('link[rel="preload"][as="style"]['+o+"]")?h.loading=1:(o=a.createElement("link"),h.preload=o,o.addEventListener("load",function(){return h.loading|=1}),o.addEventListener("error",function(){return h.loading|=2}),en(o,"link",c),Ft(o),a.head.appendChild(o))}function Zo(a){return'[src="'+Un(a)+'"]'}function nc(a){return"script[async]"+a}function aA(a,o,c){if(o.count++,o.instance===null)switch(o.type){case"style":var h=a.querySelector('style[data-href~="'+Un(c.href)+'"]');if(h)return o.instance=h,Ft(h),h;var y=m({},c,{"data-href":c.href,"data-precedence":c.precedence,href:null,precedence:null});return h=(a.ownerDocument||a).createElement("style"),Ft(h),en(h,"style",y),qf(h,c.precedence,a),o.instance=h;case"stylesheet":y=Wo(c.href);var S=a.querySelector(tc(y));if(S)return o.state.loading|=4,o.instance=S,Ft(S),S;h=rA(c),(y=Xn.get(y))&&qv(h,y),S=(a.ownerDocument||a).createElement("link"),Ft(S);var M=S;return M._p=new Promise(function(R,q){M.onload=R,M.onerror=q}),en(S,"link",h),o.state.loading|=4,qf(S,c.precedence,a),o.instance=S;case"script":return S=Zo(c.src),(y=a.querySelector(nc(S)))?(o.instance=y,Ft(y),y):(h=c,(y=Xn.get(S))&&(h=m({},c),Bv(h,y)),a=a.ownerDocument||a,y=a.createElement("script"),Ft(y),en(y,"link",h),a.head.appendChild(y),o.instance=y);case"void":return null;default:throw Error(r(443,o.type))}else o.type==="stylesheet"&&(o.state.loading&4)===0&&(h=o.instance,o.state.loading|=4,qf(h,c.precedence,a));return o.instance}function qf(a,o,c){for(var h=c.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),y=h.length?h[h.length-1]:null,S=y,M=0;M<h.length;M++){var R=h[M];if(R.dataset.precedence===o)S=R;else if(S!==y)break}S?S.parentNode.insertBefore(a,S.nextSibling):(o=c.nodeType===9?c.head:c,o.insertBefore(a,o.firstChild))}function qv(a,o){a.crossOrigin==null&&(a.crossOrigin=o.crossOrigin),a.referrerPolicy==null&&(a.referrerPolicy=o.referrerPolicy),a.title==null&&(a.title=o.title)}function Bv(a,o){a.crossOrigin==null&&(a.crossOrigin=o.crossOrigin),a.referrerPolicy==null&&(a.referrerPolicy=o.referrerPolicy),a.integrity==null&&(a.integrity=o.integrity)}var Bf=null;function iA(a,o,c){if(Bf===null){var h=new Map,y=Bf=new Map;y.set(c,h)}else y=Bf,h=y.get(c),h||(h=new Map,y.set(c,h));if(h.has(a))return h;for(h.set(a,null),c=c.getElementsByTagName(a),y=0;y<c.length;y++){var S=c[y];if(!(S[ms]||S[rn]||a==="link"&&S.getAttribute("rel")==="stylesheet")&&S.namespaceURI!=="http://www.w3.org/2000/svg"){var M=S.getAttribute(o)||"";M=a+M;var R=h.get(M);R?R.push(S):h.set(M,[S])}}return h}function oA(a,o,c){a=a.ownerDocument||a,a.head.insertBefore(c,o==="title"?a.querySelector("head > title"):null)}function cq(a,o,c){if(c===1||o.itemProp!=null)return!1;switch(a){case"meta":case"title":return!0;case"style":if(typeof o.precedence!="string"||typeof o.href!="string"||o.href==="")break;return!0;case"link":if(typeof o.rel!="string"||typeof o.href!="string"||o.href===""||o.onLoad||o.onError)break;switch(o.rel){case"stylesheet":return a=o.disabled,typeof o.precedence=="string"&&a==null;default:return!0}case"script":if(o.async&&typeof o.async!="function"&&typeof o.async!="symbol"&&!o.onLoad&&!o.onError&&o.src&&typeof o.src=="string")return!0}return!1}function lA(a){return!(a.type==="stylesheet"&&(a.state.loading&3)===0)}var rc=null;function uq(){}function fq(a,o,c){if(rc===null)throw Error(r(475));var h=rc;if(o.type==="stylesheet"&&(typeof c.media!="string"||matchMedia(c.media).matches!==!1)&&(o.state.loading&4)===0){if(o.instance===null){var y=Wo(c.href),S=a.querySelector(tc(y));if(S){a=S._p,a!==null&&typeof a=="object"&&typeof a.then=="function"&&(h.count++,h=zf.bind(h),a.then(h,h)),o.state.loading|=4,o.instance=S,Ft(S);return}S=a.ownerDocument||a,c=rA(c),(y=Xn.get(y))&&qv(c,y),S=S.createElement("link"),Ft(S);var M=S;M._p=new Promise(function(R,q){M.onload=R,M.onerror=q}),en(S,"link",c),o.instance=S}h.stylesheets===null&&(h.stylesheets=new Map),h.stylesheets.set(o,a),(a=o.state.preload)&&(o.state.loading&3)===0&&(h.count++,o=zf.bind(h),a.addEventListener("load",o),a.addEventListener("error",o))}}function dq(){if(rc===null)throw Error(r(475));var a=rc;return a.stylesheets&&a.count===0&&zv(a,a.stylesheets),0<a.count?function(o){var c=setTimeout(function(){if(a.stylesheets&&zv(a,a.stylesheets),a.unsuspend){var h=a.unsuspend;a.unsuspend=null,h()}},6e4);return a.unsuspend=o,function(){a.unsuspend=null,clearTimeout(c)}}:null}function zf(){if(this.count--,this.count===0){if(this.stylesheets)zv(this,this.stylesheets);else if(this.unsuspend){var a=this.unsuspend;this.unsuspend=null,a()}}}var Uf=null;function zv(a,o){a.stylesheets=null,a.unsuspend!==null&&(a.count++,Uf=new Map,o.forEach(hq,a),Uf=null,zf.call(a))}function hq(a,o){if(!(o.state.loading&4)){var c=Uf.get(a);if(c)var h=c.get(null);else{c=new Map,Uf.set(a,c);for(var y=a.querySelectorAll("link[data-precedence],style[data-precedence]"),S=0;S<y.length;S++){var M=y[S];(M.nodeName==="LINK"||M.getAttribute("media")!=="not all")&&(c.set(M.dataset.precedence,M),h=M)}h&&c.set(null,h)}y=o.instance,M=y.getAttribute("data-precedence"),S=c.get(M)||h,S===h&&c.set(null,y),c.set(M,y),this.count++,h=zf.bind(this),y.addEventListener("load",h),y.addEventListener("error",h),S?S.parentNode.insertBefore(y,S.nextSibling):(a=a.nodeType===9?a.head:a,a.insertBefore(y,a.firstChild)),o.state.loading|=4}}var ac={$$typeof:E,Provider:null,Consumer:null,_currentValue:B,_currentValue2:B,_threadCount:0};function pq(a,o,c,h,y,S,M,R){this.tag=1,this.containerInfo=a,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=Lp(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Lp(0),this.hiddenUpdates=Lp(null),this.identifierPrefix=h,this.onUncaughtError=y,this.onCaughtError=S,this.onRecoverableError=M,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=R,this.incompleteTransitions=new Map}function sA(a,o,c,h,y,S,M,R,q,Q,oe,se){return a=new pq(a,o,c,M,R,q,Q,se),o=1,S===!0&&(o|=24),S=En(3,null,null,o),a.current=S,S.stateNode=a,o=Sm(),o.refCount++,a.pooledCache=o,o.refCount++,S.memoizedState={element:h,isDehydrated:c,cache:o},Am(S),a}function cA(a){return a?(a=To,a):To}function uA(a,o,c,h,y,S){y=cA(y),h.context===null?h.context=y:h.pendingContext=y,h=Ca(o),h.payload={element:c},S=S===void 0?null:S,S!==null&&(h.callback=S),c=Na(a,h,o),c!==null&&(Pn(c,a,o),Ds(c,a,o))}function fA(a,o){if(a=a.memoizedState,a!==null&&a.dehydrated!==null){var c=a.retryLane;a.retryLane=c!==0&&c<o?c:o}}function Uv(a,o){fA(a,o),(a=a.alternate)&&fA(a,o)}function dA(a){if(a.tag===13){var o=Eo(a,67108864);o!==null&&Pn(o,a,67108864),Uv(a,67108864)}}var Hf=!0;function mq(a,o,c,h){var y=$.T;$.T=null;var S=U.p;try{U.p=2,Hv(a,o,c,h)}finally{U.p=S,$.T=y}}function vq(a,o,c,h){var y=$.T;$.T=null;var S=U.p;try{U.p=8,Hv(a,o,c,h)}finally{U.p=S,$.T=y}}function Hv(a,o,c,h){if(Hf){var y=Fv(h);if(y===null)Nv(a,o,h,Ff,c),pA(a,h);else if(gq(y,a,o,c,h))h.stopPropagation();else if(pA(a,h),o&4&&-1<yq.indexOf(a)){for(;y!==null;){var S=mo(y);if(S!==null)switch(S.tag){case 3:if(S=S.stateNode,S.current.memoizedState.isDehydrated){var M=mi(S.pendingLanes);if(M!==0){var R=S;for(R.pendingLanes|=2,R.entangledLanes|=2;M;){var q=1<<31-_n(M);R.entanglements[1]|=q,M&=~q}jr(S),(at&6)===0&&(Ef=Je()+500,Zs(0))}}break;case 13:R=Eo(S,2),R!==null&&Pn(R,S,2),Cf(),Uv(S,2)}if(S=Fv(h),S===null&&Nv(a,o,h,Ff,c),S===y)break;y=S}y!==null&&h.stopPropagation()}else Nv(a,o,h,null,c)}}function Fv(a){return a=Xp(a),Gv(a)}var Ff=null;function Gv(a){if(Ff=null,a=po(a),a!==null){var o=l(a);if(o===null)a=null;else{var c=o.tag;if(c===13){if(a=s(o),a!==null)return a;a=null}else if(c===3){if(o.stateNode.current.memoizedState.isDehydrated)return o.tag===3?o.stateNode.containerInfo:null;a=null}else o!==a&&(a=null)}}return Ff=a,null}function hA(a){switch(a){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(qn()){case vn:return 2;case pi:return 8;case Bn:case $r:return 32;case fo:return 268435456;default:return 32}default:return 32}}var Vv=!1,Ha=null,Fa=null,Ga=null,ic=new Map,oc=new Map,Va=[],yq="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function pA(a,o){switch(a){case"focusin":case"focusout":Ha=null;break;case"dragenter":case"dragleave":Fa=null;break;case"mouseover":case"mouseout":Ga=null;break;case"pointerover":case"pointerout":ic.delete(o.pointerId);break;case"gotpointercapture":case"lostpointercapture":oc.delete(o.pointerId)}}function lc(a,o,c,h,y,S){return a===null||a.nativeEvent!==S?(a={blockedOn:o,domEventName:c,eventSystemFlags:h,nativeEvent:S,targetContainers:[y]},o!==null&&(o=mo(o),o!==null&&dA(o)),a):(a.eventSystemFlags|=h,o=a.targetContainers,y!==null&&o.indexOf(y)===-1&&o.push(y),a)}function gq(a,o,c,h,y){switch(o){case"focusin":return Ha=lc(Ha,a,o,c,h,y),!0;case"dragenter":return Fa=lc(Fa,a,o,c,h,y),!0;case"mouseover":return Ga=lc(Ga,a,o,c,h,y),!0;case"pointerover":var S=y.pointerId;return ic.set(S,lc(ic.get(S)||null,a,o,c,h,y)),!0;case"gotpointercapture":return S=y.pointerId,oc.set(S,lc(oc.get(S)||null,a,o,c,h,y)),!0}return!1}function mA(a){var o=po(a.target);if(o!==null){var c=l(o);if(c!==null){if(o=c.tag,o===13){if(o=s(c),o!==null){a.blockedOn=o,fL(a.priority,function(){if(c.tag===13){var h=Mn();h=Ip(h);var y=Eo(c,h);y!==null&&Pn(y,c,h),Uv(c,h)}});return}}else if(o===3&&c.stateNode.current.memoizedState.isDehydrated){a.blockedOn=c.tag===3?c.stateNode.containerInfo:null;return}}}a.blockedOn=null}function Gf(a){if(a.blockedOn!==null)return!1;for(var o=a.targetContainers;0<o.length;){var c=Fv(a.nativeEvent);if(c===null){c=a.nativeEvent;var h=new c.constructor(c.type,c);Kp=h,c.target.dispatchEvent(h),Kp=null}else return o=mo(c),o!==null&&dA(o),a.blockedOn=c,!1;o.shift()}return!0}function vA(a,o,c){Gf(a)&&c.delete(o)}function bq(){Vv=!1,Ha!==null&&Gf(Ha)&&(Ha=null),Fa!==null&&Gf(Fa)&&(Fa=null),Ga!==null&&Gf(Ga)&&(Ga=null),ic.forEach(vA),oc.forEach(vA)}function Vf(a,o){a.blockedOn===o&&(a.blockedOn=null,Vv||(Vv=!0,e.unstable_scheduleCallback(e.unstable_NormalPriority,bq)))}var Yf=null;function yA(a){Yf!==a&&(Yf=a,e.unstable_scheduleCallback(e.unstable_NormalPriority,function(){Yf===a&&(Yf=null);for(var o=0;o<a.length;o+=3){var c=a[o],h=a[o+1],y=a[o+2];if(typeof h!="function"){if(Gv(h||c)===null)continue;break}var S=mo(c);S!==null&&(a.splice(o,3),o-=3,Gm(S,{pending:!0,data:y,method:c.method,action:h},h,y))}}))}function sc(a){function o(q){return Vf(q,a)}Ha!==null&&Vf(Ha,a),Fa!==null&&Vf(Fa,a),Ga!==null&&Vf(Ga,a),ic.forEach(o),oc.forEach(o);for(var c=0;c<Va.length;c++){var h=Va[c];h.blockedOn===a&&(h.blockedOn=null)}for(;0<Va.length&&(c=Va[0],c.blockedOn===null);)mA(c),c.blockedOn===null&&Va.shift();if(c=(a.ownerDocument||a).$$reactFormReplay,c!=null)for(h=0;h<c.length;h+=3){var y=c[h],S=c[h+1],M=y[yn]||null;if(typeof S=="function")M||yA(c);else if(M){var R=null;if(S&&S.hasAttribute("formAction")){if(y=S,M=S[yn]||null)R=M.formAction;else if(Gv(y)!==null)continue}else R=M.action;typeof R=="function"?c[h+1]=R:(c.splice(h,3),h-=3),yA(c)}}}function Yv(a){this._internalRoot=a}Kf.prototype.render=Yv.prototype.render=function(a){var o=this._internalRoot;if(o===null)throw Error(r(409));var c=o.current,h=Mn();uA(c,h,a,o,null,null)},Kf.prototype.unmount=Yv.prototype.unmount=function(){var a=this._internalRoot;if(a!==null){this._internalRoot=null;var o=a.containerInfo;uA(a.current,2,null,a,null,null),Cf(),o[ho]=null}};function Kf(a){this._internalRoot=a}Kf.prototype.unstable_scheduleHydration=function(a){if(a){var o=DS();a={blockedOn:null,target:a,priority:o};for(var c=0;c<Va.length&&o!==0&&o<Va[c].priority;c++);Va.splice(c,0,a),c===0&&mA(a)}};var gA=t.version;if(gA!=="19.1.0")throw Error(r(527,gA,"19.1.0"));U.findDOMNode=function(a){var o=a._reactInternals;if(o===void 0)throw typeof a.render=="function"?Error(r(188)):(a=Object.keys(a).join(","),Error(r(268,a)));return a=f(o),a=a!==null?d(a):null,a=a===null?null:a.stateNode,a};var xq={bundleType:0,version:"19.1.0",rendererPackageName:"react-dom",currentDispatcherRef:$,reconcilerVersion:"19.1.0"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Xf=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Xf.isDisabled&&Xf.supportsFiber)try{ds=Xf.inject(xq),On=Xf}catch{}}return uc.createRoot=function(a,o){if(!i(a))throw Error(r(299));var c=!1,h="",y=DO,S=kO,M=$O,R=null;return o!=null&&(o.unstable_strictMode===!0&&(c=!0),o.identifierPrefix!==void 0&&(h=o.identifierPrefix),o.onUncaughtError!==void 0&&(y=o.onUncaughtError),o.onCaughtError!==void 0&&(S=o.onCaughtError),o.onRecoverableError!==void 0&&(M=o.onRecoverableError),o.unstable_transitionCallbacks!==void 0&&(R=o.unstable_transitionCallbacks)),o=sA(a,1,!1,null,null,c,h,y,S,M,R,null),a[ho]=o.current,Cv(a),new Yv(o)},uc.hydrateRoot=function(a,o,c){if(!i(a))throw Error(r(299));var h=!1,y="",S=DO,M=kO,R=$O,q=null,Q=null;return c!=null&&(c.unstable_strictMode===!0&&(h=!0),c.identifierPrefix!==void 0&&(y=c.identifierPrefix),c.onUncaughtError!==void 0&&(S=c.onUncaughtError),c.onCaughtError!==void 0&&(M=c.onCaughtError),c.onRecoverableError!==void 0&&(R=c.onRecoverableError),c.unstable_transitionCallbacks!==void 0&&(q=c.unstable_transitionCallbacks),c.formState!==void 0&&(Q=c.formState)),o=sA(a,1,!0,o,c??null,h,y,S,M,R,q,Q),o.context=cA(null),c=o.current,h=Mn(),h=Ip(h),y=Ca(h),y.callback=null,Na(c,y,h),c=h,o.current.lanes=c,ps(o,c),jr(o),a[ho]=o.current,Cv(a),new Kf(o)},uc.version="19.1.0",uc}var TA;function Nq(){if(TA)return Wv.exports;TA=1;function e(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}return e(),Wv.exports=Cq(),Wv.exports}var Mq=Nq(),fc={},CA;function Pq(){if(CA)return fc;CA=1,Object.defineProperty(fc,"__esModule",{value:!0}),fc.parse=s,fc.serialize=d;const e=/^[\u0021-\u003A\u003C\u003E-\u007E]+$/,t=/^[\u0021-\u003A\u003C-\u007E]*$/,n=/^([.]?[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)([.][a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)*$/i,r=/^[\u0020-\u003A\u003D-\u007E]*$/,i=Object.prototype.toString,l=(()=>{const g=function(){};return g.prototype=Object.create(null),g})();function s(g,x){const j=new l,w=g.length;if(w<2)return j;const b=(x==null?void 0:x.decode)||m;let _=0;do{const O=g.indexOf("=",_);if(O===-1)break;const E=g.indexOf(";",_),C=E===-1?w:E;if(O>C){_=g.lastIndexOf(";",O-1)+1;continue}const A=u(g,_,O),N=f(g,O,A),P=g.slice(A,N);if(j[P]===void 0){let D=u(g,O+1,C),L=f(g,C,D);const G=b(g.slice(D,L));j[P]=G}_=C+1}while(_<w);return j}function u(g,x,j){do{const w=g.charCodeAt(x);if(w!==32&&w!==9)return x}while(++x<j);return j}function f(g,x,j){for(;x>j;){const w=g.charCodeAt(--x);if(w!==32&&w!==9)return x+1}return j}function d(g,x,j){const w=(j==null?void 0:j.encode)||encodeURIComponent;if(!e.test(g))throw new TypeError(`argument name is invalid: ${g}`);const b=w(x);if(!t.test(b))throw new TypeError(`argument val is invalid: ${x}`);let _=g+"="+b;if(!j)return _;if(j.maxAge!==void 0){if(!Number.isInteger(j.maxAge))throw new TypeError(`option maxAge is invalid: ${j.maxAge}`);_+="; Max-Age="+j.maxAge}if(j.domain){if(!n.test(j.domain))throw new TypeError(`option domain is invalid: ${j.domain}`);_+="; Domain="+j.domain}if(j.path){if(!r.test(j.path))throw new TypeError(`option path is invalid: ${j.path}`);_+="; Path="+j.path}if(j.expires){if(!v(j.expires)||!Number.isFinite(j.expires.valueOf()))throw new TypeError(`option expires is invalid: ${j.expires}`);_+="; Expires="+j.expires.toUTCString()}if(j.httpOnly&&(_+="; HttpOnly"),j.secure&&(_+="; Secure"),j.partitioned&&(_+="; Partitioned"),j.priority)switch(typeof j.priority=="string"?j.priority.toLowerCase():void 0){case"low":_+="; Priority=Low";break;case"medium":_+="; Priority=Medium";break;case"high":_+="; Priority=High";break;default:throw new TypeError(`option priority is invalid: ${j.priority}`)}if(j.sameSite)switch(typeof j.sameSite=="string"?j.sameSite.toLowerCase():j.sameSite){case!0:case"strict":_+="; SameSite=Strict";break;case"lax":_+="; SameSite=Lax";break;case"none":_+="; SameSite=None";break;default:throw new TypeError(`option sameSite is invalid: ${j.sameSite}`)}return _}function m(g){if(g.indexOf("%")===-1)return g;try{return decodeURIComponent(g)}catch{return g}}function v(g){return i.call(g)==="[object Date]"}return fc}Pq();var NA="popstate";function Rq(e={}){function t(r,i){let{pathname:l,search:s,hash:u}=r.location;return vx("",{pathname:l,search:s,hash:u},i.state&&i.state.usr||null,i.state&&i.state.key||"default")}function n(r,i){return typeof i=="string"?i:Rc(i)}return kq(t,n,null,e)}function At(e,t){if(e===!1||e===null||typeof e>"u")throw new Error(t)}function Cr(e,t){if(!e){typeof console<"u"&&console.warn(t);try{throw new Error(t)}catch{}}}function Dq(){return Math.random().toString(36).substring(2,10)}function MA(e,t){return{usr:e.state,key:e.key,idx:t}}function vx(e,t,n=null,r){return{pathname:typeof e=="string"?e:e.pathname,search:"",hash:"",...typeof t=="string"?Zl(t):t,state:n,key:t&&t.key||r||Dq()}}function Rc({pathname:e="/",search:t="",hash:n=""}){return t&&t!=="?"&&(e+=t.charAt(0)==="?"?t:"?"+t),n&&n!=="#"&&(e+=n.charAt(0)==="#"?n:"#"+n),e}function Zl(e){let t={};if(e){let n=e.indexOf("#");n>=0&&(t.hash=e.substring(n),e=e.substring(0,n));let r=e.indexOf("?");r>=0&&(t.search=e.substring(r),e=e.substring(0,r)),e&&(t.pathname=e)}return t}function kq(e,t,n,r={}){let{window:i=document.defaultView,v5Compat:l=!1}=r,s=i.history,u="POP",f=null,d=m();d==null&&(d=0,s.replaceState({...s.state,idx:d},""));function m(){return(s.state||{idx:null}).idx}function v(){u="POP";let b=m(),_=b==null?null:b-d;d=b,f&&f({action:u,location:w.location,delta:_})}function g(b,_){u="PUSH";let O=vx(w.location,b,_);d=m()+1;let E=MA(O,d),C=w.createHref(O);try{s.pushState(E,"",C)}catch(A){if(A instanceof DOMException&&A.name==="DataCloneError")throw A;i.location.assign(C)}l&&f&&f({action:u,location:w.location,delta:1})}function x(b,_){u="REPLACE";let O=vx(w.location,b,_);d=m();let E=MA(O,d),C=w.createHref(O);s.replaceState(E,"",C),l&&f&&f({action:u,location:w.location,delta:0})}function j(b){return $q(b)}let w={get action(){return u},get location(){return e(i,s)},listen(b){if(f)throw new Error("A history only accepts one active listener");return i.addEventListener(NA,v),f=b,()=>{i.removeEventListener(NA,v),f=null}},createHref(b){return t(i,b)},createURL:j,encodeLocation(b){let _=j(b);return{pathname:_.pathname,search:_.search,hash:_.hash}},push:g,replace:x,go(b){return s.go(b)}};return w}function $q(e,t=!1){let n="http://localhost";typeof window<"u"&&(n=window.location.origin!=="null"?window.location.origin:window.location.href),At(n,"No window.location.(origin|href) available to create URL");let r=typeof e=="string"?e:Rc(e);return r=r.replace(/ $/,"%20"),!t&&r.startsWith("//")&&(r=n+r),new URL(r,n)}function fR(e,t,n="/"){return Lq(e,t,n,!1)}function Lq(e,t,n,r){let i=typeof t=="string"?Zl(t):t,l=da(i.pathname||"/",n);if(l==null)return null;let s=dR(e);Iq(s);let u=null;for(let f=0;u==null&&f<s.length;++f){let d=Xq(l);u=Yq(s[f],d,r)}return u}function dR(e,t=[],n=[],r=""){let i=(l,s,u)=>{let f={relativePath:u===void 0?l.path||"":u,caseSensitive:l.caseSensitive===!0,childrenIndex:s,route:l};f.relativePath.startsWith("/")&&(At(f.relativePath.startsWith(r),`Absolute route path "${f.relativePath}" nested under path "${r}" is not valid. An absolute child route path must start with the combined path of all its parent routes.`),f.relativePath=f.relativePath.slice(r.length));let d=ia([r,f.relativePath]),m=n.concat(f);l.children&&l.children.length>0&&(At(l.index!==!0,`Index routes must not have child routes. Please remove all child routes from route path "${d}".`),dR(l.children,t,m,d)),!(l.path==null&&!l.index)&&t.push({path:d,score:Gq(d,l.index),routesMeta:m})};return e.forEach((l,s)=>{var u;if(l.path===""||!((u=l.path)!=null&&u.includes("?")))i(l,s);else for(let f of hR(l.path))i(l,s,f)}),t}function hR(e){let t=e.split("/");if(t.length===0)return[];let[n,...r]=t,i=n.endsWith("?"),l=n.replace(/\?$/,"");if(r.length===0)return i?[l,""]:[l];let s=hR(r.join("/")),u=[];return u.push(...s.map(f=>f===""?l:[l,f].join("/"))),i&&u.push(...s),u.map(f=>e.startsWith("/")&&f===""?"/":f)}function Iq(e){e.sort((t,n)=>t.score!==n.score?n.score-t.score:Vq(t.routesMeta.map(r=>r.childrenIndex),n.routesMeta.map(r=>r.childrenIndex)))}var qq=/^:[\w-]+$/,Bq=3,zq=2,Uq=1,Hq=10,Fq=-2,PA=e=>e==="*";function Gq(e,t){let n=e.split("/"),r=n.length;return n.some(PA)&&(r+=Fq),t&&(r+=zq),n.filter(i=>!PA(i)).reduce((i,l)=>i+(qq.test(l)?Bq:l===""?Uq:Hq),r)}function Vq(e,t){return e.length===t.length&&e.slice(0,-1).every((r,i)=>r===t[i])?e[e.length-1]-t[t.length-1]:0}function Yq(e,t,n=!1){let{routesMeta:r}=e,i={},l="/",s=[];for(let u=0;u<r.length;++u){let f=r[u],d=u===r.length-1,m=l==="/"?t:t.slice(l.length)||"/",v=Ad({path:f.relativePath,caseSensitive:f.caseSensitive,end:d},m),g=f.route;if(!v&&d&&n&&!r[r.length-1].route.index&&(v=Ad({path:f.relativePath,caseSensitive:f.caseSensitive,end:!1},m)),!v)return null;Object.assign(i,v.params),s.push({params:i,pathname:ia([l,v.pathname]),pathnameBase:Jq(ia([l,v.pathnameBase])),route:g}),v.pathnameBase!=="/"&&(l=ia([l,v.pathnameBase]))}return s}function Ad(e,t){typeof e=="string"&&(e={path:e,caseSensitive:!1,end:!0});let[n,r]=Kq(e.path,e.caseSensitive,e.end),i=t.match(n);if(!i)return null;let l=i[0],s=l.replace(/(.)\/+$/,"$1"),u=i.slice(1);return{params:r.reduce((d,{paramName:m,isOptional:v},g)=>{if(m==="*"){let j=u[g]||"";s=l.slice(0,l.length-j.length).replace(/(.)\/+$/,"$1")}const x=u[g];return v&&!x?d[m]=void 0:d[m]=(x||"").replace(/%2F/g,"/"),d},{}),pathname:l,pathnameBase:s,pattern:e}}function Kq(e,t=!1,n=!0){Cr(e==="*"||!e.endsWith("*")||e.endsWith("/*"),`Route path "${e}" will be treated as if it were "${e.replace(/\*$/,"/*")}" because the \`*\` character must always follow a \`/\` in the pattern. To get rid of this warning, please change the route path to "${e.replace(/\*$/,"/*")}".`);let r=[],i="^"+e.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,(s,u,f)=>(r.push({paramName:u,isOptional:f!=null}),f?"/?([^\\/]+)?":"/([^\\/]+)"));return e.endsWith("*")?(r.push({paramName:"*"}),i+=e==="*"||e==="/*"?"(.*)$":"(?:\\/(.+)|\\/*)$"):n?i+="\\/*$":e!==""&&e!=="/"&&(i+="(?:(?=\\/|$))"),[new RegExp(i,t?void 0:"i"),r]}function Xq(e){try{return e.split("/").map(t=>decodeURIComponent(t).replace(/\//g,"%2F")).join("/")}catch(t){return Cr(!1,`The URL path "${e}" could not be decoded because it is a malformed URL segment. This is probably due to a bad percent encoding (${t}).`),e}}function da(e,t){if(t==="/")return e;if(!e.toLowerCase().startsWith(t.toLowerCase()))return null;let n=t.endsWith("/")?t.length-1:t.length,r=e.charAt(n);return r&&r!=="/"?null:e.slice(n)||"/"}function Wq(e,t="/"){let{pathname:n,search:r="",hash:i=""}=typeof e=="string"?Zl(e):e;return{pathname:n?n.startsWith("/")?n:Zq(n,t):t,search:eB(r),hash:tB(i)}}function Zq(e,t){let n=t.replace(/\/+$/,"").split("/");return e.split("/").forEach(i=>{i===".."?n.length>1&&n.pop():i!=="."&&n.push(i)}),n.length>1?n.join("/"):"/"}function ey(e,t,n,r){return`Cannot include a '${e}' character in a manually specified \`to.${t}\` field [${JSON.stringify(r)}].  Please separate it out to the \`to.${n}\` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.`}function Qq(e){return e.filter((t,n)=>n===0||t.route.path&&t.route.path.length>0)}function pR(e){let t=Qq(e);return t.map((n,r)=>r===t.length-1?n.pathname:n.pathnameBase)}function mR(e,t,n,r=!1){let i;typeof e=="string"?i=Zl(e):(i={...e},At(!i.pathname||!i.pathname.includes("?"),ey("?","pathname","search",i)),At(!i.pathname||!i.pathname.includes("#"),ey("#","pathname","hash",i)),At(!i.search||!i.search.includes("#"),ey("#","search","hash",i)));let l=e===""||i.pathname==="",s=l?"/":i.pathname,u;if(s==null)u=n;else{let v=t.length-1;if(!r&&s.startsWith("..")){let g=s.split("/");for(;g[0]==="..";)g.shift(),v-=1;i.pathname=g.join("/")}u=v>=0?t[v]:"/"}let f=Wq(i,u),d=s&&s!=="/"&&s.endsWith("/"),m=(l||s===".")&&n.endsWith("/");return!f.pathname.endsWith("/")&&(d||m)&&(f.pathname+="/"),f}var ia=e=>e.join("/").replace(/\/\/+/g,"/"),Jq=e=>e.replace(/\/+$/,"").replace(/^\/*/,"/"),eB=e=>!e||e==="?"?"":e.startsWith("?")?e:"?"+e,tB=e=>!e||e==="#"?"":e.startsWith("#")?e:"#"+e;function nB(e){return e!=null&&typeof e.status=="number"&&typeof e.statusText=="string"&&typeof e.internal=="boolean"&&"data"in e}var vR=["POST","PUT","PATCH","DELETE"];new Set(vR);var rB=["GET",...vR];new Set(rB);var Ql=T.createContext(null);Ql.displayName="DataRouter";var $h=T.createContext(null);$h.displayName="DataRouterState";var yR=T.createContext({isTransitioning:!1});yR.displayName="ViewTransition";var aB=T.createContext(new Map);aB.displayName="Fetchers";var iB=T.createContext(null);iB.displayName="Await";var Pr=T.createContext(null);Pr.displayName="Navigation";var bu=T.createContext(null);bu.displayName="Location";var ba=T.createContext({outlet:null,matches:[],isDataRoute:!1});ba.displayName="Route";var ew=T.createContext(null);ew.displayName="RouteError";function oB(e,{relative:t}={}){At(xu(),"useHref() may be used only in the context of a <Router> component.");let{basename:n,navigator:r}=T.useContext(Pr),{hash:i,pathname:l,search:s}=wu(e,{relative:t}),u=l;return n!=="/"&&(u=l==="/"?n:ia([n,l])),r.createHref({pathname:u,search:s,hash:i})}function xu(){return T.useContext(bu)!=null}function li(){return At(xu(),"useLocation() may be used only in the context of a <Router> component."),T.useContext(bu).location}var gR="You should call navigate() in a React.useEffect(), not when your component is first rendered.";function bR(e){T.useContext(Pr).static||T.useLayoutEffect(e)}function lB(){let{isDataRoute:e}=T.useContext(ba);return e?xB():sB()}function sB(){At(xu(),"useNavigate() may be used only in the context of a <Router> component.");let e=T.useContext(Ql),{basename:t,navigator:n}=T.useContext(Pr),{matches:r}=T.useContext(ba),{pathname:i}=li(),l=JSON.stringify(pR(r)),s=T.useRef(!1);return bR(()=>{s.current=!0}),T.useCallback((f,d={})=>{if(Cr(s.current,gR),!s.current)return;if(typeof f=="number"){n.go(f);return}let m=mR(f,JSON.parse(l),i,d.relative==="path");e==null&&t!=="/"&&(m.pathname=m.pathname==="/"?t:ia([t,m.pathname])),(d.replace?n.replace:n.push)(m,d.state,d)},[t,n,l,i,e])}T.createContext(null);function wu(e,{relative:t}={}){let{matches:n}=T.useContext(ba),{pathname:r}=li(),i=JSON.stringify(pR(n));return T.useMemo(()=>mR(e,JSON.parse(i),r,t==="path"),[e,i,r,t])}function cB(e,t){return xR(e,t)}function xR(e,t,n,r){var _;At(xu(),"useRoutes() may be used only in the context of a <Router> component.");let{navigator:i}=T.useContext(Pr),{matches:l}=T.useContext(ba),s=l[l.length-1],u=s?s.params:{},f=s?s.pathname:"/",d=s?s.pathnameBase:"/",m=s&&s.route;{let O=m&&m.path||"";wR(f,!m||O.endsWith("*")||O.endsWith("*?"),`You rendered descendant <Routes> (or called \`useRoutes()\`) at "${f}" (under <Route path="${O}">) but the parent route path has no trailing "*". This means if you navigate deeper, the parent won't match anymore and therefore the child routes will never render.
-
-Please change the parent <Route path="${O}"> to <Route path="${O==="/"?"*":`${O}/*`}">.`)}let v=li(),g;if(t){let O=typeof t=="string"?Zl(t):t;At(d==="/"||((_=O.pathname)==null?void 0:_.startsWith(d)),`When overriding the location using \`<Routes location>\` or \`useRoutes(routes, location)\`, the location pathname must begin with the portion of the URL pathname that was matched by all parent routes. The current pathname base is "${d}" but pathname "${O.pathname}" was given in the \`location\` prop.`),g=O}else g=v;let x=g.pathname||"/",j=x;if(d!=="/"){let O=d.replace(/^\//,"").split("/");j="/"+x.replace(/^\//,"").split("/").slice(O.length).join("/")}let w=fR(e,{pathname:j});Cr(m||w!=null,`No routes matched location "${g.pathname}${g.search}${g.hash}" `),Cr(w==null||w[w.length-1].route.element!==void 0||w[w.length-1].route.Component!==void 0||w[w.length-1].route.lazy!==void 0,`Matched leaf route at location "${g.pathname}${g.search}${g.hash}" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.`);let b=pB(w&&w.map(O=>Object.assign({},O,{params:Object.assign({},u,O.params),pathname:ia([d,i.encodeLocation?i.encodeLocation(O.pathname).pathname:O.pathname]),pathnameBase:O.pathnameBase==="/"?d:ia([d,i.encodeLocation?i.encodeLocation(O.pathnameBase).pathname:O.pathnameBase])})),l,n,r);return t&&b?T.createElement(bu.Provider,{value:{location:{pathname:"/",search:"",hash:"",state:null,key:"default",...g},navigationType:"POP"}},b):b}function uB(){let e=bB(),t=nB(e)?`${e.status} ${e.statusText}`:e instanceof Error?e.message:JSON.stringify(e),n=e instanceof Error?e.stack:null,r="rgba(200,200,200, 0.5)",i={padding:"0.5rem",backgroundColor:r},l={padding:"2px 4px",backgroundColor:r},s=null;return console.error("Error handled by React Router default ErrorBoundary:",e),s=T.createElement(T.Fragment,null,T.createElement("p",null,"💿 Hey developer 👋"),T.createElement("p",null,"You can provide a way better UX than this when your app throws errors by providing your own ",T.createElement("code",{style:l},"ErrorBoundary")," or"," ",T.createElement("code",{style:l},"errorElement")," prop on your route.")),T.createElement(T.Fragment,null,T.createElement("h2",null,"Unexpected Application Error!"),T.createElement("h3",{style:{fontStyle:"italic"}},t),n?T.createElement("pre",{style:i},n):null,s)}var fB=T.createElement(uB,null),dB=class extends T.Component{constructor(e){super(e),this.state={location:e.location,revalidation:e.revalidation,error:e.error}}static getDerivedStateFromError(e){return{error:e}}static getDerivedStateFromProps(e,t){return t.location!==e.location||t.revalidation!=="idle"&&e.revalidation==="idle"?{error:e.error,location:e.location,revalidation:e.revalidation}:{error:e.error!==void 0?e.error:t.error,location:t.location,revalidation:e.revalidation||t.revalidation}}componentDidCatch(e,t){console.error("React Router caught the following error during render",e,t)}render(){return this.state.error!==void 0?T.createElement(ba.Provider,{value:this.props.routeContext},T.createElement(ew.Provider,{value:this.state.error,children:this.props.component})):this.props.children}};function hB({routeContext:e,match:t,children:n}){let r=T.useContext(Ql);return r&&r.static&&r.staticContext&&(t.route.errorElement||t.route.ErrorBoundary)&&(r.staticContext._deepestRenderedBoundaryId=t.route.id),T.createElement(ba.Provider,{value:e},n)}function pB(e,t=[],n=null,r=null){if(e==null){if(!n)return null;if(n.errors)e=n.matches;else if(t.length===0&&!n.initialized&&n.matches.length>0)e=n.matches;else return null}let i=e,l=n==null?void 0:n.errors;if(l!=null){let f=i.findIndex(d=>d.route.id&&(l==null?void 0:l[d.route.id])!==void 0);At(f>=0,`Could not find a matching route for errors on route IDs: ${Object.keys(l).join(",")}`),i=i.slice(0,Math.min(i.length,f+1))}let s=!1,u=-1;if(n)for(let f=0;f<i.length;f++){let d=i[f];if((d.route.HydrateFallback||d.route.hydrateFallbackElement)&&(u=f),d.route.id){let{loaderData:m,errors:v}=n,g=d.route.loader&&!m.hasOwnProperty(d.route.id)&&(!v||v[d.route.id]===void 0);if(d.route.lazy||g){s=!0,u>=0?i=i.slice(0,u+1):i=[i[0]];break}}}return i.reduceRight((f,d,m)=>{let v,g=!1,x=null,j=null;n&&(v=l&&d.route.id?l[d.route.id]:void 0,x=d.route.errorElement||fB,s&&(u<0&&m===0?(wR("route-fallback",!1,"No `HydrateFallback` element provided to render during initial hydration"),g=!0,j=null):u===m&&(g=!0,j=d.route.hydrateFallbackElement||null)));let w=t.concat(i.slice(0,m+1)),b=()=>{let _;return v?_=x:g?_=j:d.route.Component?_=T.createElement(d.route.Component,null):d.route.element?_=d.route.element:_=f,T.createElement(hB,{match:d,routeContext:{outlet:f,matches:w,isDataRoute:n!=null},children:_})};return n&&(d.route.ErrorBoundary||d.route.errorElement||m===0)?T.createElement(dB,{location:n.location,revalidation:n.revalidation,component:x,error:v,children:b(),routeContext:{outlet:null,matches:w,isDataRoute:!0}}):b()},null)}function tw(e){return`${e} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function mB(e){let t=T.useContext(Ql);return At(t,tw(e)),t}function vB(e){let t=T.useContext($h);return At(t,tw(e)),t}function yB(e){let t=T.useContext(ba);return At(t,tw(e)),t}function nw(e){let t=yB(e),n=t.matches[t.matches.length-1];return At(n.route.id,`${e} can only be used on routes that contain a unique "id"`),n.route.id}function gB(){return nw("useRouteId")}function bB(){var r;let e=T.useContext(ew),t=vB("useRouteError"),n=nw("useRouteError");return e!==void 0?e:(r=t.errors)==null?void 0:r[n]}function xB(){let{router:e}=mB("useNavigate"),t=nw("useNavigate"),n=T.useRef(!1);return bR(()=>{n.current=!0}),T.useCallback(async(i,l={})=>{Cr(n.current,gR),n.current&&(typeof i=="number"?e.navigate(i):await e.navigate(i,{fromRouteId:t,...l}))},[e,t])}var RA={};function wR(e,t,n){!t&&!RA[e]&&(RA[e]=!0,Cr(!1,n))}T.memo(wB);function wB({routes:e,future:t,state:n}){return xR(e,void 0,n,t)}function ea(e){At(!1,"A <Route> is only ever to be used as the child of <Routes> element, never rendered directly. Please wrap your <Route> in a <Routes>.")}function SB({basename:e="/",children:t=null,location:n,navigationType:r="POP",navigator:i,static:l=!1}){At(!xu(),"You cannot render a <Router> inside another <Router>. You should never have more than one in your app.");let s=e.replace(/^\/*/,"/"),u=T.useMemo(()=>({basename:s,navigator:i,static:l,future:{}}),[s,i,l]);typeof n=="string"&&(n=Zl(n));let{pathname:f="/",search:d="",hash:m="",state:v=null,key:g="default"}=n,x=T.useMemo(()=>{let j=da(f,s);return j==null?null:{location:{pathname:j,search:d,hash:m,state:v,key:g},navigationType:r}},[s,f,d,m,v,g,r]);return Cr(x!=null,`<Router basename="${s}"> is not able to match the URL "${f}${d}${m}" because it does not start with the basename, so the <Router> won't render anything.`),x==null?null:T.createElement(Pr.Provider,{value:u},T.createElement(bu.Provider,{children:t,value:x}))}function jB({children:e,location:t}){return cB(yx(e),t)}function yx(e,t=[]){let n=[];return T.Children.forEach(e,(r,i)=>{if(!T.isValidElement(r))return;let l=[...t,i];if(r.type===T.Fragment){n.push.apply(n,yx(r.props.children,l));return}At(r.type===ea,`[${typeof r.type=="string"?r.type:r.type.name}] is not a <Route> component. All component children of <Routes> must be a <Route> or <React.Fragment>`),At(!r.props.index||!r.props.children,"An index route cannot have child routes.");let s={id:r.props.id||l.join("-"),caseSensitive:r.props.caseSensitive,element:r.props.element,Component:r.props.Component,index:r.props.index,path:r.props.path,loader:r.props.loader,action:r.props.action,hydrateFallbackElement:r.props.hydrateFallbackElement,HydrateFallback:r.props.HydrateFallback,errorElement:r.props.errorElement,ErrorBoundary:r.props.ErrorBoundary,hasErrorBoundary:r.props.hasErrorBoundary===!0||r.props.ErrorBoundary!=null||r.props.errorElement!=null,shouldRevalidate:r.props.shouldRevalidate,handle:r.props.handle,lazy:r.props.lazy};r.props.children&&(s.children=yx(r.props.children,l)),n.push(s)}),n}var bd="get",xd="application/x-www-form-urlencoded";function Lh(e){return e!=null&&typeof e.tagName=="string"}function OB(e){return Lh(e)&&e.tagName.toLowerCase()==="button"}function _B(e){return Lh(e)&&e.tagName.toLowerCase()==="form"}function AB(e){return Lh(e)&&e.tagName.toLowerCase()==="input"}function EB(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}function TB(e,t){return e.button===0&&(!t||t==="_self")&&!EB(e)}var Zf=null;function CB(){if(Zf===null)try{new FormData(document.createElement("form"),0),Zf=!1}catch{Zf=!0}return Zf}var NB=new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);function ty(e){return e!=null&&!NB.has(e)?(Cr(!1,`"${e}" is not a valid \`encType\` for \`<Form>\`/\`<fetcher.Form>\` and will default to "${xd}"`),null):e}function MB(e,t){let n,r,i,l,s;if(_B(e)){let u=e.getAttribute("action");r=u?da(u,t):null,n=e.getAttribute("method")||bd,i=ty(e.getAttribute("enctype"))||xd,l=new FormData(e)}else if(OB(e)||AB(e)&&(e.type==="submit"||e.type==="image")){let u=e.form;if(u==null)throw new Error('Cannot submit a <button> or <input type="submit"> without a <form>');let f=e.getAttribute("formaction")||u.getAttribute("action");if(r=f?da(f,t):null,n=e.getAttribute("formmethod")||u.getAttribute("method")||bd,i=ty(e.getAttribute("formenctype"))||ty(u.getAttribute("enctype"))||xd,l=new FormData(u,e),!CB()){let{name:d,type:m,value:v}=e;if(m==="image"){let g=d?`${d}.`:"";l.append(`${g}x`,"0"),l.append(`${g}y`,"0")}else d&&l.append(d,v)}}else{if(Lh(e))throw new Error('Cannot submit element that is not <form>, <button>, or <input type="submit|image">');n=bd,r=null,i=xd,s=e}return l&&i==="text/plain"&&(s=l,l=void 0),{action:r,method:n.toLowerCase(),encType:i,formData:l,body:s}}function rw(e,t){if(e===!1||e===null||typeof e>"u")throw new Error(t)}async function PB(e,t){if(e.id in t)return t[e.id];try{let n=await import(e.module);return t[e.id]=n,n}catch(n){return console.error(`Error loading route module \`${e.module}\`, reloading page...`),console.error(n),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise(()=>{})}}function RB(e){return e==null?!1:e.href==null?e.rel==="preload"&&typeof e.imageSrcSet=="string"&&typeof e.imageSizes=="string":typeof e.rel=="string"&&typeof e.href=="string"}async function DB(e,t,n){let r=await Promise.all(e.map(async i=>{let l=t.routes[i.route.id];if(l){let s=await PB(l,n);return s.links?s.links():[]}return[]}));return IB(r.flat(1).filter(RB).filter(i=>i.rel==="stylesheet"||i.rel==="preload").map(i=>i.rel==="stylesheet"?{...i,rel:"prefetch",as:"style"}:{...i,rel:"prefetch"}))}function DA(e,t,n,r,i,l){let s=(f,d)=>n[d]?f.route.id!==n[d].route.id:!0,u=(f,d)=>{var m;return n[d].pathname!==f.pathname||((m=n[d].route.path)==null?void 0:m.endsWith("*"))&&n[d].params["*"]!==f.params["*"]};return l==="assets"?t.filter((f,d)=>s(f,d)||u(f,d)):l==="data"?t.filter((f,d)=>{var v;let m=r.routes[f.route.id];if(!m||!m.hasLoader)return!1;if(s(f,d)||u(f,d))return!0;if(f.route.shouldRevalidate){let g=f.route.shouldRevalidate({currentUrl:new URL(i.pathname+i.search+i.hash,window.origin),currentParams:((v=n[0])==null?void 0:v.params)||{},nextUrl:new URL(e,window.origin),nextParams:f.params,defaultShouldRevalidate:!0});if(typeof g=="boolean")return g}return!0}):[]}function kB(e,t,{includeHydrateFallback:n}={}){return $B(e.map(r=>{let i=t.routes[r.route.id];if(!i)return[];let l=[i.module];return i.clientActionModule&&(l=l.concat(i.clientActionModule)),i.clientLoaderModule&&(l=l.concat(i.clientLoaderModule)),n&&i.hydrateFallbackModule&&(l=l.concat(i.hydrateFallbackModule)),i.imports&&(l=l.concat(i.imports)),l}).flat(1))}function $B(e){return[...new Set(e)]}function LB(e){let t={},n=Object.keys(e).sort();for(let r of n)t[r]=e[r];return t}function IB(e,t){let n=new Set;return new Set(t),e.reduce((r,i)=>{let l=JSON.stringify(LB(i));return n.has(l)||(n.add(l),r.push({key:l,link:i})),r},[])}Object.getOwnPropertyNames(Object.prototype).sort().join("\0");var qB=new Set([100,101,204,205]);function BB(e,t){let n=typeof e=="string"?new URL(e,typeof window>"u"?"server://singlefetch/":window.location.origin):e;return n.pathname==="/"?n.pathname="_root.data":t&&da(n.pathname,t)==="/"?n.pathname=`${t.replace(/\/$/,"")}/_root.data`:n.pathname=`${n.pathname.replace(/\/$/,"")}.data`,n}function SR(){let e=T.useContext(Ql);return rw(e,"You must render this element inside a <DataRouterContext.Provider> element"),e}function zB(){let e=T.useContext($h);return rw(e,"You must render this element inside a <DataRouterStateContext.Provider> element"),e}var aw=T.createContext(void 0);aw.displayName="FrameworkContext";function jR(){let e=T.useContext(aw);return rw(e,"You must render this element inside a <HydratedRouter> element"),e}function UB(e,t){let n=T.useContext(aw),[r,i]=T.useState(!1),[l,s]=T.useState(!1),{onFocus:u,onBlur:f,onMouseEnter:d,onMouseLeave:m,onTouchStart:v}=t,g=T.useRef(null);T.useEffect(()=>{if(e==="render"&&s(!0),e==="viewport"){let w=_=>{_.forEach(O=>{s(O.isIntersecting)})},b=new IntersectionObserver(w,{threshold:.5});return g.current&&b.observe(g.current),()=>{b.disconnect()}}},[e]),T.useEffect(()=>{if(r){let w=setTimeout(()=>{s(!0)},100);return()=>{clearTimeout(w)}}},[r]);let x=()=>{i(!0)},j=()=>{i(!1),s(!1)};return n?e!=="intent"?[l,g,{}]:[l,g,{onFocus:dc(u,x),onBlur:dc(f,j),onMouseEnter:dc(d,x),onMouseLeave:dc(m,j),onTouchStart:dc(v,x)}]:[!1,g,{}]}function dc(e,t){return n=>{e&&e(n),n.defaultPrevented||t(n)}}function HB({page:e,...t}){let{router:n}=SR(),r=T.useMemo(()=>fR(n.routes,e,n.basename),[n.routes,e,n.basename]);return r?T.createElement(GB,{page:e,matches:r,...t}):null}function FB(e){let{manifest:t,routeModules:n}=jR(),[r,i]=T.useState([]);return T.useEffect(()=>{let l=!1;return DB(e,t,n).then(s=>{l||i(s)}),()=>{l=!0}},[e,t,n]),r}function GB({page:e,matches:t,...n}){let r=li(),{manifest:i,routeModules:l}=jR(),{basename:s}=SR(),{loaderData:u,matches:f}=zB(),d=T.useMemo(()=>DA(e,t,f,i,r,"data"),[e,t,f,i,r]),m=T.useMemo(()=>DA(e,t,f,i,r,"assets"),[e,t,f,i,r]),v=T.useMemo(()=>{if(e===r.pathname+r.search+r.hash)return[];let j=new Set,w=!1;if(t.forEach(_=>{var E;let O=i.routes[_.route.id];!O||!O.hasLoader||(!d.some(C=>C.route.id===_.route.id)&&_.route.id in u&&((E=l[_.route.id])!=null&&E.shouldRevalidate)||O.hasClientLoader?w=!0:j.add(_.route.id))}),j.size===0)return[];let b=BB(e,s);return w&&j.size>0&&b.searchParams.set("_routes",t.filter(_=>j.has(_.route.id)).map(_=>_.route.id).join(",")),[b.pathname+b.search]},[s,u,r,i,d,t,e,l]),g=T.useMemo(()=>kB(m,i),[m,i]),x=FB(m);return T.createElement(T.Fragment,null,v.map(j=>T.createElement("link",{key:j,rel:"prefetch",as:"fetch",href:j,...n})),g.map(j=>T.createElement("link",{key:j,rel:"modulepreload",href:j,...n})),x.map(({key:j,link:w})=>T.createElement("link",{key:j,...w})))}function VB(...e){return t=>{e.forEach(n=>{typeof n=="function"?n(t):n!=null&&(n.current=t)})}}var OR=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u";try{OR&&(window.__reactRouterVersion="7.6.1")}catch{}function YB({basename:e,children:t,window:n}){let r=T.useRef();r.current==null&&(r.current=Rq({window:n,v5Compat:!0}));let i=r.current,[l,s]=T.useState({action:i.action,location:i.location}),u=T.useCallback(f=>{T.startTransition(()=>s(f))},[s]);return T.useLayoutEffect(()=>i.listen(u),[i,u]),T.createElement(SB,{basename:e,children:t,location:l.location,navigationType:l.action,navigator:i})}var _R=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,iw=T.forwardRef(function({onClick:t,discover:n="render",prefetch:r="none",relative:i,reloadDocument:l,replace:s,state:u,target:f,to:d,preventScrollReset:m,viewTransition:v,...g},x){let{basename:j}=T.useContext(Pr),w=typeof d=="string"&&_R.test(d),b,_=!1;if(typeof d=="string"&&w&&(b=d,OR))try{let L=new URL(window.location.href),G=d.startsWith("//")?new URL(L.protocol+d):new URL(d),I=da(G.pathname,j);G.origin===L.origin&&I!=null?d=I+G.search+G.hash:_=!0}catch{Cr(!1,`<Link to="${d}"> contains an invalid URL which will probably break when clicked - please update to a valid URL path.`)}let O=oB(d,{relative:i}),[E,C,A]=UB(r,g),N=ZB(d,{replace:s,state:u,target:f,preventScrollReset:m,relative:i,viewTransition:v});function P(L){t&&t(L),L.defaultPrevented||N(L)}let D=T.createElement("a",{...g,...A,href:b||O,onClick:_||l?t:P,ref:VB(x,C),target:f,"data-discover":!w&&n==="render"?"true":void 0});return E&&!w?T.createElement(T.Fragment,null,D,T.createElement(HB,{page:O})):D});iw.displayName="Link";var KB=T.forwardRef(function({"aria-current":t="page",caseSensitive:n=!1,className:r="",end:i=!1,style:l,to:s,viewTransition:u,children:f,...d},m){let v=wu(s,{relative:d.relative}),g=li(),x=T.useContext($h),{navigator:j,basename:w}=T.useContext(Pr),b=x!=null&&n6(v)&&u===!0,_=j.encodeLocation?j.encodeLocation(v).pathname:v.pathname,O=g.pathname,E=x&&x.navigation&&x.navigation.location?x.navigation.location.pathname:null;n||(O=O.toLowerCase(),E=E?E.toLowerCase():null,_=_.toLowerCase()),E&&w&&(E=da(E,w)||E);const C=_!=="/"&&_.endsWith("/")?_.length-1:_.length;let A=O===_||!i&&O.startsWith(_)&&O.charAt(C)==="/",N=E!=null&&(E===_||!i&&E.startsWith(_)&&E.charAt(_.length)==="/"),P={isActive:A,isPending:N,isTransitioning:b},D=A?t:void 0,L;typeof r=="function"?L=r(P):L=[r,A?"active":null,N?"pending":null,b?"transitioning":null].filter(Boolean).join(" ");let G=typeof l=="function"?l(P):l;return T.createElement(iw,{...d,"aria-current":D,className:L,ref:m,style:G,to:s,viewTransition:u},typeof f=="function"?f(P):f)});KB.displayName="NavLink";var XB=T.forwardRef(({discover:e="render",fetcherKey:t,navigate:n,reloadDocument:r,replace:i,state:l,method:s=bd,action:u,onSubmit:f,relative:d,preventScrollReset:m,viewTransition:v,...g},x)=>{let j=e6(),w=t6(u,{relative:d}),b=s.toLowerCase()==="get"?"get":"post",_=typeof u=="string"&&_R.test(u),O=E=>{if(f&&f(E),E.defaultPrevented)return;E.preventDefault();let C=E.nativeEvent.submitter,A=(C==null?void 0:C.getAttribute("formmethod"))||s;j(C||E.currentTarget,{fetcherKey:t,method:A,navigate:n,replace:i,state:l,relative:d,preventScrollReset:m,viewTransition:v})};return T.createElement("form",{ref:x,method:b,action:w,onSubmit:r?f:O,...g,"data-discover":!_&&e==="render"?"true":void 0})});XB.displayName="Form";function WB(e){return`${e} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function AR(e){let t=T.useContext(Ql);return At(t,WB(e)),t}function ZB(e,{target:t,replace:n,state:r,preventScrollReset:i,relative:l,viewTransition:s}={}){let u=lB(),f=li(),d=wu(e,{relative:l});return T.useCallback(m=>{if(TB(m,t)){m.preventDefault();let v=n!==void 0?n:Rc(f)===Rc(d);u(e,{replace:v,state:r,preventScrollReset:i,relative:l,viewTransition:s})}},[f,u,d,n,r,t,e,i,l,s])}var QB=0,JB=()=>`__${String(++QB)}__`;function e6(){let{router:e}=AR("useSubmit"),{basename:t}=T.useContext(Pr),n=gB();return T.useCallback(async(r,i={})=>{let{action:l,method:s,encType:u,formData:f,body:d}=MB(r,t);if(i.navigate===!1){let m=i.fetcherKey||JB();await e.fetch(m,n,i.action||l,{preventScrollReset:i.preventScrollReset,formData:f,body:d,formMethod:i.method||s,formEncType:i.encType||u,flushSync:i.flushSync})}else await e.navigate(i.action||l,{preventScrollReset:i.preventScrollReset,formData:f,body:d,formMethod:i.method||s,formEncType:i.encType||u,replace:i.replace,state:i.state,fromRouteId:n,flushSync:i.flushSync,viewTransition:i.viewTransition})},[e,t,n])}function t6(e,{relative:t}={}){let{basename:n}=T.useContext(Pr),r=T.useContext(ba);At(r,"useFormAction must be used inside a RouteContext");let[i]=r.matches.slice(-1),l={...wu(e||".",{relative:t})},s=li();if(e==null){l.search=s.search;let u=new URLSearchParams(l.search),f=u.getAll("index");if(f.some(m=>m==="")){u.delete("index"),f.filter(v=>v).forEach(v=>u.append("index",v));let m=u.toString();l.search=m?`?${m}`:""}}return(!e||e===".")&&i.route.index&&(l.search=l.search?l.search.replace(/^\?/,"?index&"):"?index"),n!=="/"&&(l.pathname=l.pathname==="/"?n:ia([n,l.pathname])),Rc(l)}function n6(e,t={}){let n=T.useContext(yR);At(n!=null,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:r}=AR("useViewTransitionState"),i=wu(e,{relative:t.relative});if(!n.isTransitioning)return!1;let l=da(n.currentLocation.pathname,r)||n.currentLocation.pathname,s=da(n.nextLocation.pathname,r)||n.nextLocation.pathname;return Ad(i.pathname,s)!=null||Ad(i.pathname,l)!=null}[...qB];var Su=uR();const r6=rt(Su);function kA(e,t){if(typeof e=="function")return e(t);e!=null&&(e.current=t)}function a6(...e){return t=>{let n=!1;const r=e.map(i=>{const l=kA(i,t);return!n&&typeof l=="function"&&(n=!0),l});if(n)return()=>{for(let i=0;i<r.length;i++){const l=r[i];typeof l=="function"?l():kA(e[i],null)}}}}function St(...e){return T.useCallback(a6(...e),e)}function Sl(e){const t=i6(e),n=T.forwardRef((r,i)=>{const{children:l,...s}=r,u=T.Children.toArray(l),f=u.find(l6);if(f){const d=f.props.children,m=u.map(v=>v===f?T.Children.count(d)>1?T.Children.only(null):T.isValidElement(d)?d.props.children:null:v);return p.jsx(t,{...s,ref:i,children:T.isValidElement(d)?T.cloneElement(d,void 0,m):null})}return p.jsx(t,{...s,ref:i,children:l})});return n.displayName=`${e}.Slot`,n}var ER=Sl("Slot");function i6(e){const t=T.forwardRef((n,r)=>{const{children:i,...l}=n,s=T.isValidElement(i)?c6(i):void 0,u=St(s,r);if(T.isValidElement(i)){const f=s6(l,i.props);return i.type!==T.Fragment&&(f.ref=u),T.cloneElement(i,f)}return T.Children.count(i)>1?T.Children.only(null):null});return t.displayName=`${e}.SlotClone`,t}var o6=Symbol("radix.slottable");function l6(e){return T.isValidElement(e)&&typeof e.type=="function"&&"__radixId"in e.type&&e.type.__radixId===o6}function s6(e,t){const n={...t};for(const r in t){const i=e[r],l=t[r];/^on[A-Z]/.test(r)?i&&l?n[r]=(...u)=>{const f=l(...u);return i(...u),f}:i&&(n[r]=i):r==="style"?n[r]={...i,...l}:r==="className"&&(n[r]=[i,l].filter(Boolean).join(" "))}return{...e,...n}}function c6(e){var r,i;let t=(r=Object.getOwnPropertyDescriptor(e.props,"ref"))==null?void 0:r.get,n=t&&"isReactWarning"in t&&t.isReactWarning;return n?e.ref:(t=(i=Object.getOwnPropertyDescriptor(e,"ref"))==null?void 0:i.get,n=t&&"isReactWarning"in t&&t.isReactWarning,n?e.props.ref:e.props.ref||e.ref)}function TR(e){var t,n,r="";if(typeof e=="string"||typeof e=="number")r+=e;else if(typeof e=="object")if(Array.isArray(e)){var i=e.length;for(t=0;t<i;t++)e[t]&&(n=TR(e[t]))&&(r&&(r+=" "),r+=n)}else for(n in e)e[n]&&(r&&(r+=" "),r+=n);return r}function qe(){for(var e,t,n=0,r="",i=arguments.length;n<i;n++)(e=arguments[n])&&(t=TR(e))&&(r&&(r+=" "),r+=t);return r}const $A=e=>typeof e=="boolean"?`${e}`:e===0?"0":e,LA=qe,CR=(e,t)=>n=>{var r;if((t==null?void 0:t.variants)==null)return LA(e,n==null?void 0:n.class,n==null?void 0:n.className);const{variants:i,defaultVariants:l}=t,s=Object.keys(i).map(d=>{const m=n==null?void 0:n[d],v=l==null?void 0:l[d];if(m===null)return null;const g=$A(m)||$A(v);return i[d][g]}),u=n&&Object.entries(n).reduce((d,m)=>{let[v,g]=m;return g===void 0||(d[v]=g),d},{}),f=t==null||(r=t.compoundVariants)===null||r===void 0?void 0:r.reduce((d,m)=>{let{class:v,className:g,...x}=m;return Object.entries(x).every(j=>{let[w,b]=j;return Array.isArray(b)?b.includes({...l,...u}[w]):{...l,...u}[w]===b})?[...d,v,g]:d},[]);return LA(e,s,f,n==null?void 0:n.class,n==null?void 0:n.className)},ow="-",u6=e=>{const t=d6(e),{conflictingClassGroups:n,conflictingClassGroupModifiers:r}=e;return{getClassGroupId:s=>{const u=s.split(ow);return u[0]===""&&u.length!==1&&u.shift(),NR(u,t)||f6(s)},getConflictingClassGroupIds:(s,u)=>{const f=n[s]||[];return u&&r[s]?[...f,...r[s]]:f}}},NR=(e,t)=>{var s;if(e.length===0)return t.classGroupId;const n=e[0],r=t.nextPart.get(n),i=r?NR(e.slice(1),r):void 0;if(i)return i;if(t.validators.length===0)return;const l=e.join(ow);return(s=t.validators.find(({validator:u})=>u(l)))==null?void 0:s.classGroupId},IA=/^\[(.+)\]$/,f6=e=>{if(IA.test(e)){const t=IA.exec(e)[1],n=t==null?void 0:t.substring(0,t.indexOf(":"));if(n)return"arbitrary.."+n}},d6=e=>{const{theme:t,classGroups:n}=e,r={nextPart:new Map,validators:[]};for(const i in n)gx(n[i],r,i,t);return r},gx=(e,t,n,r)=>{e.forEach(i=>{if(typeof i=="string"){const l=i===""?t:qA(t,i);l.classGroupId=n;return}if(typeof i=="function"){if(h6(i)){gx(i(r),t,n,r);return}t.validators.push({validator:i,classGroupId:n});return}Object.entries(i).forEach(([l,s])=>{gx(s,qA(t,l),n,r)})})},qA=(e,t)=>{let n=e;return t.split(ow).forEach(r=>{n.nextPart.has(r)||n.nextPart.set(r,{nextPart:new Map,validators:[]}),n=n.nextPart.get(r)}),n},h6=e=>e.isThemeGetter,p6=e=>{if(e<1)return{get:()=>{},set:()=>{}};let t=0,n=new Map,r=new Map;const i=(l,s)=>{n.set(l,s),t++,t>e&&(t=0,r=n,n=new Map)};return{get(l){let s=n.get(l);if(s!==void 0)return s;if((s=r.get(l))!==void 0)return i(l,s),s},set(l,s){n.has(l)?n.set(l,s):i(l,s)}}},bx="!",xx=":",m6=xx.length,v6=e=>{const{prefix:t,experimentalParseClassName:n}=e;let r=i=>{const l=[];let s=0,u=0,f=0,d;for(let j=0;j<i.length;j++){let w=i[j];if(s===0&&u===0){if(w===xx){l.push(i.slice(f,j)),f=j+m6;continue}if(w==="/"){d=j;continue}}w==="["?s++:w==="]"?s--:w==="("?u++:w===")"&&u--}const m=l.length===0?i:i.substring(f),v=y6(m),g=v!==m,x=d&&d>f?d-f:void 0;return{modifiers:l,hasImportantModifier:g,baseClassName:v,maybePostfixModifierPosition:x}};if(t){const i=t+xx,l=r;r=s=>s.startsWith(i)?l(s.substring(i.length)):{isExternal:!0,modifiers:[],hasImportantModifier:!1,baseClassName:s,maybePostfixModifierPosition:void 0}}if(n){const i=r;r=l=>n({className:l,parseClassName:i})}return r},y6=e=>e.endsWith(bx)?e.substring(0,e.length-1):e.startsWith(bx)?e.substring(1):e,g6=e=>{const t=Object.fromEntries(e.orderSensitiveModifiers.map(r=>[r,!0]));return r=>{if(r.length<=1)return r;const i=[];let l=[];return r.forEach(s=>{s[0]==="["||t[s]?(i.push(...l.sort(),s),l=[]):l.push(s)}),i.push(...l.sort()),i}},b6=e=>({cache:p6(e.cacheSize),parseClassName:v6(e),sortModifiers:g6(e),...u6(e)}),x6=/\s+/,w6=(e,t)=>{const{parseClassName:n,getClassGroupId:r,getConflictingClassGroupIds:i,sortModifiers:l}=t,s=[],u=e.trim().split(x6);let f="";for(let d=u.length-1;d>=0;d-=1){const m=u[d],{isExternal:v,modifiers:g,hasImportantModifier:x,baseClassName:j,maybePostfixModifierPosition:w}=n(m);if(v){f=m+(f.length>0?" "+f:f);continue}let b=!!w,_=r(b?j.substring(0,w):j);if(!_){if(!b){f=m+(f.length>0?" "+f:f);continue}if(_=r(j),!_){f=m+(f.length>0?" "+f:f);continue}b=!1}const O=l(g).join(":"),E=x?O+bx:O,C=E+_;if(s.includes(C))continue;s.push(C);const A=i(_,b);for(let N=0;N<A.length;++N){const P=A[N];s.push(E+P)}f=m+(f.length>0?" "+f:f)}return f};function S6(){let e=0,t,n,r="";for(;e<arguments.length;)(t=arguments[e++])&&(n=MR(t))&&(r&&(r+=" "),r+=n);return r}const MR=e=>{if(typeof e=="string")return e;let t,n="";for(let r=0;r<e.length;r++)e[r]&&(t=MR(e[r]))&&(n&&(n+=" "),n+=t);return n};function j6(e,...t){let n,r,i,l=s;function s(f){const d=t.reduce((m,v)=>v(m),e());return n=b6(d),r=n.cache.get,i=n.cache.set,l=u,u(f)}function u(f){const d=r(f);if(d)return d;const m=w6(f,n);return i(f,m),m}return function(){return l(S6.apply(null,arguments))}}const Bt=e=>{const t=n=>n[e]||[];return t.isThemeGetter=!0,t},PR=/^\[(?:(\w[\w-]*):)?(.+)\]$/i,RR=/^\((?:(\w[\w-]*):)?(.+)\)$/i,O6=/^\d+\/\d+$/,_6=/^(\d+(\.\d+)?)?(xs|sm|md|lg|xl)$/,A6=/\d+(%|px|r?em|[sdl]?v([hwib]|min|max)|pt|pc|in|cm|mm|cap|ch|ex|r?lh|cq(w|h|i|b|min|max))|\b(calc|min|max|clamp)\(.+\)|^0$/,E6=/^(rgba?|hsla?|hwb|(ok)?(lab|lch))\(.+\)$/,T6=/^(inset_)?-?((\d+)?\.?(\d+)[a-z]+|0)_-?((\d+)?\.?(\d+)[a-z]+|0)/,C6=/^(url|image|image-set|cross-fade|element|(repeating-)?(linear|radial|conic)-gradient)\(.+\)$/,Qo=e=>O6.test(e),ze=e=>!!e&&!Number.isNaN(Number(e)),Ka=e=>!!e&&Number.isInteger(Number(e)),ny=e=>e.endsWith("%")&&ze(e.slice(0,-1)),Qr=e=>_6.test(e),N6=()=>!0,M6=e=>A6.test(e)&&!E6.test(e),DR=()=>!1,P6=e=>T6.test(e),R6=e=>C6.test(e),D6=e=>!xe(e)&&!we(e),k6=e=>Jl(e,LR,DR),xe=e=>PR.test(e),Ri=e=>Jl(e,IR,M6),ry=e=>Jl(e,B6,ze),BA=e=>Jl(e,kR,DR),$6=e=>Jl(e,$R,R6),Qf=e=>Jl(e,qR,P6),we=e=>RR.test(e),hc=e=>es(e,IR),L6=e=>es(e,z6),zA=e=>es(e,kR),I6=e=>es(e,LR),q6=e=>es(e,$R),Jf=e=>es(e,qR,!0),Jl=(e,t,n)=>{const r=PR.exec(e);return r?r[1]?t(r[1]):n(r[2]):!1},es=(e,t,n=!1)=>{const r=RR.exec(e);return r?r[1]?t(r[1]):n:!1},kR=e=>e==="position"||e==="percentage",$R=e=>e==="image"||e==="url",LR=e=>e==="length"||e==="size"||e==="bg-size",IR=e=>e==="length",B6=e=>e==="number",z6=e=>e==="family-name",qR=e=>e==="shadow",U6=()=>{const e=Bt("color"),t=Bt("font"),n=Bt("text"),r=Bt("font-weight"),i=Bt("tracking"),l=Bt("leading"),s=Bt("breakpoint"),u=Bt("container"),f=Bt("spacing"),d=Bt("radius"),m=Bt("shadow"),v=Bt("inset-shadow"),g=Bt("text-shadow"),x=Bt("drop-shadow"),j=Bt("blur"),w=Bt("perspective"),b=Bt("aspect"),_=Bt("ease"),O=Bt("animate"),E=()=>["auto","avoid","all","avoid-page","page","left","right","column"],C=()=>["center","top","bottom","left","right","top-left","left-top","top-right","right-top","bottom-right","right-bottom","bottom-left","left-bottom"],A=()=>[...C(),we,xe],N=()=>["auto","hidden","clip","visible","scroll"],P=()=>["auto","contain","none"],D=()=>[we,xe,f],L=()=>[Qo,"full","auto",...D()],G=()=>[Ka,"none","subgrid",we,xe],I=()=>["auto",{span:["full",Ka,we,xe]},Ka,we,xe],H=()=>[Ka,"auto",we,xe],V=()=>["auto","min","max","fr",we,xe],Z=()=>["start","end","center","between","around","evenly","stretch","baseline","center-safe","end-safe"],Y=()=>["start","end","center","stretch","center-safe","end-safe"],$=()=>["auto",...D()],U=()=>[Qo,"auto","full","dvw","dvh","lvw","lvh","svw","svh","min","max","fit",...D()],B=()=>[e,we,xe],re=()=>[...C(),zA,BA,{position:[we,xe]}],k=()=>["no-repeat",{repeat:["","x","y","space","round"]}],X=()=>["auto","cover","contain",I6,k6,{size:[we,xe]}],te=()=>[ny,hc,Ri],ne=()=>["","none","full",d,we,xe],ue=()=>["",ze,hc,Ri],ge=()=>["solid","dashed","dotted","double"],me=()=>["normal","multiply","screen","overlay","darken","lighten","color-dodge","color-burn","hard-light","soft-light","difference","exclusion","hue","saturation","color","luminosity"],de=()=>[ze,ny,zA,BA],ve=()=>["","none",j,we,xe],ce=()=>["none",ze,we,xe],he=()=>["none",ze,we,xe],pe=()=>[ze,we,xe],ae=()=>[Qo,"full",...D()];return{cacheSize:500,theme:{animate:["spin","ping","pulse","bounce"],aspect:["video"],blur:[Qr],breakpoint:[Qr],color:[N6],container:[Qr],"drop-shadow":[Qr],ease:["in","out","in-out"],font:[D6],"font-weight":["thin","extralight","light","normal","medium","semibold","bold","extrabold","black"],"inset-shadow":[Qr],leading:["none","tight","snug","normal","relaxed","loose"],perspective:["dramatic","near","normal","midrange","distant","none"],radius:[Qr],shadow:[Qr],spacing:["px",ze],text:[Qr],"text-shadow":[Qr],tracking:["tighter","tight","normal","wide","wider","widest"]},classGroups:{aspect:[{aspect:["auto","square",Qo,xe,we,b]}],container:["container"],columns:[{columns:[ze,xe,we,u]}],"break-after":[{"break-after":E()}],"break-before":[{"break-before":E()}],"break-inside":[{"break-inside":["auto","avoid","avoid-page","avoid-column"]}],"box-decoration":[{"box-decoration":["slice","clone"]}],box:[{box:["border","content"]}],display:["block","inline-block","inline","flex","inline-flex","table","inline-table","table-caption","table-cell","table-column","table-column-group","table-footer-group","table-header-group","table-row-group","table-row","flow-root","grid","inline-grid","contents","list-item","hidden"],sr:["sr-only","not-sr-only"],float:[{float:["right","left","none","start","end"]}],clear:[{clear:["left","right","both","none","start","end"]}],isolation:["isolate","isolation-auto"],"object-fit":[{object:["contain","cover","fill","none","scale-down"]}],"object-position":[{object:A()}],overflow:[{overflow:N()}],"overflow-x":[{"overflow-x":N()}],"overflow-y":[{"overflow-y":N()}],overscroll:[{overscroll:P()}],"overscroll-x":[{"overscroll-x":P()}],"overscroll-y":[{"overscroll-y":P()}],position:["static","fixed","absolute","relative","sticky"],inset:[{inset:L()}],"inset-x":[{"inset-x":L()}],"inset-y":[{"inset-y":L()}],start:[{start:L()}],end:[{end:L()}],top:[{top:L()}],right:[{right:L()}],bottom:[{bottom:L()}],left:[{left:L()}],visibility:["visible","invisible","collapse"],z:[{z:[Ka,"auto",we,xe]}],basis:[{basis:[Qo,"full","auto",u,...D()]}],"flex-direction":[{flex:["row","row-reverse","col","col-reverse"]}],"flex-wrap":[{flex:["nowrap","wrap","wrap-reverse"]}],flex:[{flex:[ze,Qo,"auto","initial","none",xe]}],grow:[{grow:["",ze,we,xe]}],shrink:[{shrink:["",ze,we,xe]}],order:[{order:[Ka,"first","last","none",we,xe]}],"grid-cols":[{"grid-cols":G()}],"col-start-end":[{col:I()}],"col-start":[{"col-start":H()}],"col-end":[{"col-end":H()}],"grid-rows":[{"grid-rows":G()}],"row-start-end":[{row:I()}],"row-start":[{"row-start":H()}],"row-end":[{"row-end":H()}],"grid-flow":[{"grid-flow":["row","col","dense","row-dense","col-dense"]}],"auto-cols":[{"auto-cols":V()}],"auto-rows":[{"auto-rows":V()}],gap:[{gap:D()}],"gap-x":[{"gap-x":D()}],"gap-y":[{"gap-y":D()}],"justify-content":[{justify:[...Z(),"normal"]}],"justify-items":[{"justify-items":[...Y(),"normal"]}],"justify-self":[{"justify-self":["auto",...Y()]}],"align-content":[{content:["normal",...Z()]}],"align-items":[{items:[...Y(),{baseline:["","last"]}]}],"align-self":[{self:["auto",...Y(),{baseline:["","last"]}]}],"place-content":[{"place-content":Z()}],"place-items":[{"place-items":[...Y(),"baseline"]}],"place-self":[{"place-self":["auto",...Y()]}],p:[{p:D()}],px:[{px:D()}],py:[{py:D()}],ps:[{ps:D()}],pe:[{pe:D()}],pt:[{pt:D()}],pr:[{pr:D()}],pb:[{pb:D()}],pl:[{pl:D()}],m:[{m:$()}],mx:[{mx:$()}],my:[{my:$()}],ms:[{ms:$()}],me:[{me:$()}],mt:[{mt:$()}],mr:[{mr:$()}],mb:[{mb:$()}],ml:[{ml:$()}],"space-x":[{"space-x":D()}],"space-x-reverse":["space-x-reverse"],"space-y":[{"space-y":D()}],"space-y-reverse":["space-y-reverse"],size:[{size:U()}],w:[{w:[u,"screen",...U()]}],"min-w":[{"min-w":[u,"screen","none",...U()]}],"max-w":[{"max-w":[u,"screen","none","prose",{screen:[s]},...U()]}],h:[{h:["screen","lh",...U()]}],"min-h":[{"min-h":["screen","lh","none",...U()]}],"max-h":[{"max-h":["screen","lh",...U()]}],"font-size":[{text:["base",n,hc,Ri]}],"font-smoothing":["antialiased","subpixel-antialiased"],"font-style":["italic","not-italic"],"font-weight":[{font:[r,we,ry]}],"font-stretch":[{"font-stretch":["ultra-condensed","extra-condensed","condensed","semi-condensed","normal","semi-expanded","expanded","extra-expanded","ultra-expanded",ny,xe]}],"font-family":[{font:[L6,xe,t]}],"fvn-normal":["normal-nums"],"fvn-ordinal":["ordinal"],"fvn-slashed-zero":["slashed-zero"],"fvn-figure":["lining-nums","oldstyle-nums"],"fvn-spacing":["proportional-nums","tabular-nums"],"fvn-fraction":["diagonal-fractions","stacked-fractions"],tracking:[{tracking:[i,we,xe]}],"line-clamp":[{"line-clamp":[ze,"none",we,ry]}],leading:[{leading:[l,...D()]}],"list-image":[{"list-image":["none",we,xe]}],"list-style-position":[{list:["inside","outside"]}],"list-style-type":[{list:["disc","decimal","none",we,xe]}],"text-alignment":[{text:["left","center","right","justify","start","end"]}],"placeholder-color":[{placeholder:B()}],"text-color":[{text:B()}],"text-decoration":["underline","overline","line-through","no-underline"],"text-decoration-style":[{decoration:[...ge(),"wavy"]}],"text-decoration-thickness":[{decoration:[ze,"from-font","auto",we,Ri]}],"text-decoration-color":[{decoration:B()}],"underline-offset":[{"underline-offset":[ze,"auto",we,xe]}],"text-transform":["uppercase","lowercase","capitalize","normal-case"],"text-overflow":["truncate","text-ellipsis","text-clip"],"text-wrap":[{text:["wrap","nowrap","balance","pretty"]}],indent:[{indent:D()}],"vertical-align":[{align:["baseline","top","middle","bottom","text-top","text-bottom","sub","super",we,xe]}],whitespace:[{whitespace:["normal","nowrap","pre","pre-line","pre-wrap","break-spaces"]}],break:[{break:["normal","words","all","keep"]}],wrap:[{wrap:["break-word","anywhere","normal"]}],hyphens:[{hyphens:["none","manual","auto"]}],content:[{content:["none",we,xe]}],"bg-attachment":[{bg:["fixed","local","scroll"]}],"bg-clip":[{"bg-clip":["border","padding","content","text"]}],"bg-origin":[{"bg-origin":["border","padding","content"]}],"bg-position":[{bg:re()}],"bg-repeat":[{bg:k()}],"bg-size":[{bg:X()}],"bg-image":[{bg:["none",{linear:[{to:["t","tr","r","br","b","bl","l","tl"]},Ka,we,xe],radial:["",we,xe],conic:[Ka,we,xe]},q6,$6]}],"bg-color":[{bg:B()}],"gradient-from-pos":[{from:te()}],"gradient-via-pos":[{via:te()}],"gradient-to-pos":[{to:te()}],"gradient-from":[{from:B()}],"gradient-via":[{via:B()}],"gradient-to":[{to:B()}],rounded:[{rounded:ne()}],"rounded-s":[{"rounded-s":ne()}],"rounded-e":[{"rounded-e":ne()}],"rounded-t":[{"rounded-t":ne()}],"rounded-r":[{"rounded-r":ne()}],"rounded-b":[{"rounded-b":ne()}],"rounded-l":[{"rounded-l":ne()}],"rounded-ss":[{"rounded-ss":ne()}],"rounded-se":[{"rounded-se":ne()}],"rounded-ee":[{"rounded-ee":ne()}],"rounded-es":[{"rounded-es":ne()}],"rounded-tl":[{"rounded-tl":ne()}],"rounded-tr":[{"rounded-tr":ne()}],"rounded-br":[{"rounded-br":ne()}],"rounded-bl":[{"rounded-bl":ne()}],"border-w":[{border:ue()}],"border-w-x":[{"border-x":ue()}],"border-w-y":[{"border-y":ue()}],"border-w-s":[{"border-s":ue()}],"border-w-e":[{"border-e":ue()}],"border-w-t":[{"border-t":ue()}],"border-w-r":[{"border-r":ue()}],"border-w-b":[{"border-b":ue()}],"border-w-l":[{"border-l":ue()}],"divide-x":[{"divide-x":ue()}],"divide-x-reverse":["divide-x-reverse"],"divide-y":[{"divide-y":ue()}],"divide-y-reverse":["divide-y-reverse"],"border-style":[{border:[...ge(),"hidden","none"]}],"divide-style":[{divide:[...ge(),"hidden","none"]}],"border-color":[{border:B()}],"border-color-x":[{"border-x":B()}],"border-color-y":[{"border-y":B()}],"border-color-s":[{"border-s":B()}],"border-color-e":[{"border-e":B()}],"border-color-t":[{"border-t":B()}],"border-color-r":[{"border-r":B()}],"border-color-b":[{"border-b":B()}],"border-color-l":[{"border-l":B()}],"divide-color":[{divide:B()}],"outline-style":[{outline:[...ge(),"none","hidden"]}],"outline-offset":[{"outline-offset":[ze,we,xe]}],"outline-w":[{outline:["",ze,hc,Ri]}],"outline-color":[{outline:B()}],shadow:[{shadow:["","none",m,Jf,Qf]}],"shadow-color":[{shadow:B()}],"inset-shadow":[{"inset-shadow":["none",v,Jf,Qf]}],"inset-shadow-color":[{"inset-shadow":B()}],"ring-w":[{ring:ue()}],"ring-w-inset":["ring-inset"],"ring-color":[{ring:B()}],"ring-offset-w":[{"ring-offset":[ze,Ri]}],"ring-offset-color":[{"ring-offset":B()}],"inset-ring-w":[{"inset-ring":ue()}],"inset-ring-color":[{"inset-ring":B()}],"text-shadow":[{"text-shadow":["none",g,Jf,Qf]}],"text-shadow-color":[{"text-shadow":B()}],opacity:[{opacity:[ze,we,xe]}],"mix-blend":[{"mix-blend":[...me(),"plus-darker","plus-lighter"]}],"bg-blend":[{"bg-blend":me()}],"mask-clip":[{"mask-clip":["border","padding","content","fill","stroke","view"]},"mask-no-clip"],"mask-composite":[{mask:["add","subtract","intersect","exclude"]}],"mask-image-linear-pos":[{"mask-linear":[ze]}],"mask-image-linear-from-pos":[{"mask-linear-from":de()}],"mask-image-linear-to-pos":[{"mask-linear-to":de()}],"mask-image-linear-from-color":[{"mask-linear-from":B()}],"mask-image-linear-to-color":[{"mask-linear-to":B()}],"mask-image-t-from-pos":[{"mask-t-from":de()}],"mask-image-t-to-pos":[{"mask-t-to":de()}],"mask-image-t-from-color":[{"mask-t-from":B()}],"mask-image-t-to-color":[{"mask-t-to":B()}],"mask-image-r-from-pos":[{"mask-r-from":de()}],"mask-image-r-to-pos":[{"mask-r-to":de()}],"mask-image-r-from-color":[{"mask-r-from":B()}],"mask-image-r-to-color":[{"mask-r-to":B()}],"mask-image-b-from-pos":[{"mask-b-from":de()}],"mask-image-b-to-pos":[{"mask-b-to":de()}],"mask-image-b-from-color":[{"mask-b-from":B()}],"mask-image-b-to-color":[{"mask-b-to":B()}],"mask-image-l-from-pos":[{"mask-l-from":de()}],"mask-image-l-to-pos":[{"mask-l-to":de()}],"mask-image-l-from-color":[{"mask-l-from":B()}],"mask-image-l-to-color":[{"mask-l-to":B()}],"mask-image-x-from-pos":[{"mask-x-from":de()}],"mask-image-x-to-pos":[{"mask-x-to":de()}],"mask-image-x-from-color":[{"mask-x-from":B()}],"mask-image-x-to-color":[{"mask-x-to":B()}],"mask-image-y-from-pos":[{"mask-y-from":de()}],"mask-image-y-to-pos":[{"mask-y-to":de()}],"mask-image-y-from-color":[{"mask-y-from":B()}],"mask-image-y-to-color":[{"mask-y-to":B()}],"mask-image-radial":[{"mask-radial":[we,xe]}],"mask-image-radial-from-pos":[{"mask-radial-from":de()}],"mask-image-radial-to-pos":[{"mask-radial-to":de()}],"mask-image-radial-from-color":[{"mask-radial-from":B()}],"mask-image-radial-to-color":[{"mask-radial-to":B()}],"mask-image-radial-shape":[{"mask-radial":["circle","ellipse"]}],"mask-image-radial-size":[{"mask-radial":[{closest:["side","corner"],farthest:["side","corner"]}]}],"mask-image-radial-pos":[{"mask-radial-at":C()}],"mask-image-conic-pos":[{"mask-conic":[ze]}],"mask-image-conic-from-pos":[{"mask-conic-from":de()}],"mask-image-conic-to-pos":[{"mask-conic-to":de()}],"mask-image-conic-from-color":[{"mask-conic-from":B()}],"mask-image-conic-to-color":[{"mask-conic-to":B()}],"mask-mode":[{mask:["alpha","luminance","match"]}],"mask-origin":[{"mask-origin":["border","padding","content","fill","stroke","view"]}],"mask-position":[{mask:re()}],"mask-repeat":[{mask:k()}],"mask-size":[{mask:X()}],"mask-type":[{"mask-type":["alpha","luminance"]}],"mask-image":[{mask:["none",we,xe]}],filter:[{filter:["","none",we,xe]}],blur:[{blur:ve()}],brightness:[{brightness:[ze,we,xe]}],contrast:[{contrast:[ze,we,xe]}],"drop-shadow":[{"drop-shadow":["","none",x,Jf,Qf]}],"drop-shadow-color":[{"drop-shadow":B()}],grayscale:[{grayscale:["",ze,we,xe]}],"hue-rotate":[{"hue-rotate":[ze,we,xe]}],invert:[{invert:["",ze,we,xe]}],saturate:[{saturate:[ze,we,xe]}],sepia:[{sepia:["",ze,we,xe]}],"backdrop-filter":[{"backdrop-filter":["","none",we,xe]}],"backdrop-blur":[{"backdrop-blur":ve()}],"backdrop-brightness":[{"backdrop-brightness":[ze,we,xe]}],"backdrop-contrast":[{"backdrop-contrast":[ze,we,xe]}],"backdrop-grayscale":[{"backdrop-grayscale":["",ze,we,xe]}],"backdrop-hue-rotate":[{"backdrop-hue-rotate":[ze,we,xe]}],"backdrop-invert":[{"backdrop-invert":["",ze,we,xe]}],"backdrop-opacity":[{"backdrop-opacity":[ze,we,xe]}],"backdrop-saturate":[{"backdrop-saturate":[ze,we,xe]}],"backdrop-sepia":[{"backdrop-sepia":["",ze,we,xe]}],"border-collapse":[{border:["collapse","separate"]}],"border-spacing":[{"border-spacing":D()}],"border-spacing-x":[{"border-spacing-x":D()}],"border-spacing-y":[{"border-spacing-y":D()}],"table-layout":[{table:["auto","fixed"]}],caption:[{caption:["top","bottom"]}],transition:[{transition:["","all","colors","opacity","shadow","transform","none",we,xe]}],"transition-behavior":[{transition:["normal","discrete"]}],duration:[{duration:[ze,"initial",we,xe]}],ease:[{ease:["linear","initial",_,we,xe]}],delay:[{delay:[ze,we,xe]}],animate:[{animate:["none",O,we,xe]}],backface:[{backface:["hidden","visible"]}],perspective:[{perspective:[w,we,xe]}],"perspective-origin":[{"perspective-origin":A()}],rotate:[{rotate:ce()}],"rotate-x":[{"rotate-x":ce()}],"rotate-y":[{"rotate-y":ce()}],"rotate-z":[{"rotate-z":ce()}],scale:[{scale:he()}],"scale-x":[{"scale-x":he()}],"scale-y":[{"scale-y":he()}],"scale-z":[{"scale-z":he()}],"scale-3d":["scale-3d"],skew:[{skew:pe()}],"skew-x":[{"skew-x":pe()}],"skew-y":[{"skew-y":pe()}],transform:[{transform:[we,xe,"","none","gpu","cpu"]}],"transform-origin":[{origin:A()}],"transform-style":[{transform:["3d","flat"]}],translate:[{translate:ae()}],"translate-x":[{"translate-x":ae()}],"translate-y":[{"translate-y":ae()}],"translate-z":[{"translate-z":ae()}],"translate-none":["translate-none"],accent:[{accent:B()}],appearance:[{appearance:["none","auto"]}],"caret-color":[{caret:B()}],"color-scheme":[{scheme:["normal","dark","light","light-dark","only-dark","only-light"]}],cursor:[{cursor:["auto","default","pointer","wait","text","move","help","not-allowed","none","context-menu","progress","cell","crosshair","vertical-text","alias","copy","no-drop","grab","grabbing","all-scroll","col-resize","row-resize","n-resize","e-resize","s-resize","w-resize","ne-resize","nw-resize","se-resize","sw-resize","ew-resize","ns-resize","nesw-resize","nwse-resize","zoom-in","zoom-out",we,xe]}],"field-sizing":[{"field-sizing":["fixed","content"]}],"pointer-events":[{"pointer-events":["auto","none"]}],resize:[{resize:["none","","y","x"]}],"scroll-behavior":[{scroll:["auto","smooth"]}],"scroll-m":[{"scroll-m":D()}],"scroll-mx":[{"scroll-mx":D()}],"scroll-my":[{"scroll-my":D()}],"scroll-ms":[{"scroll-ms":D()}],"scroll-me":[{"scroll-me":D()}],"scroll-mt":[{"scroll-mt":D()}],"scroll-mr":[{"scroll-mr":D()}],"scroll-mb":[{"scroll-mb":D()}],"scroll-ml":[{"scroll-ml":D()}],"scroll-p":[{"scroll-p":D()}],"scroll-px":[{"scroll-px":D()}],"scroll-py":[{"scroll-py":D()}],"scroll-ps":[{"scroll-ps":D()}],"scroll-pe":[{"scroll-pe":D()}],"scroll-pt":[{"scroll-pt":D()}],"scroll-pr":[{"scroll-pr":D()}],"scroll-pb":[{"scroll-pb":D()}],"scroll-pl":[{"scroll-pl":D()}],"snap-align":[{snap:["start","end","center","align-none"]}],"snap-stop":[{snap:["normal","always"]}],"snap-type":[{snap:["none","x","y","both"]}],"snap-strictness":[{snap:["mandatory","proximity"]}],touch:[{touch:["auto","none","manipulation"]}],"touch-x":[{"touch-pan":["x","left","right"]}],"touch-y":[{"touch-pan":["y","up","down"]}],"touch-pz":["touch-pinch-zoom"],select:[{select:["none","text","all","auto"]}],"will-change":[{"will-change":["auto","scroll","contents","transform",we,xe]}],fill:[{fill:["none",...B()]}],"stroke-w":[{stroke:[ze,hc,Ri,ry]}],stroke:[{stroke:["none",...B()]}],"forced-color-adjust":[{"forced-color-adjust":["auto","none"]}]},conflictingClassGroups:{overflow:["overflow-x","overflow-y"],overscroll:["overscroll-x","overscroll-y"],inset:["inset-x","inset-y","start","end","top","right","bottom","left"],"inset-x":["right","left"],"inset-y":["top","bottom"],flex:["basis","grow","shrink"],gap:["gap-x","gap-y"],p:["px","py","ps","pe","pt","pr","pb","pl"],px:["pr","pl"],py:["pt","pb"],m:["mx","my","ms","me","mt","mr","mb","ml"],mx:["mr","ml"],my:["mt","mb"],size:["w","h"],"font-size":["leading"],"fvn-normal":["fvn-ordinal","fvn-slashed-zero","fvn-figure","fvn-spacing","fvn-fraction"],"fvn-ordinal":["fvn-normal"],"fvn-slashed-zero":["fvn-normal"],"fvn-figure":["fvn-normal"],"fvn-spacing":["fvn-normal"],"fvn-fraction":["fvn-normal"],"line-clamp":["display","overflow"],rounded:["rounded-s","rounded-e","rounded-t","rounded-r","rounded-b","rounded-l","rounded-ss","rounded-se","rounded-ee","rounded-es","rounded-tl","rounded-tr","rounded-br","rounded-bl"],"rounded-s":["rounded-ss","rounded-es"],"rounded-e":["rounded-se","rounded-ee"],"rounded-t":["rounded-tl","rounded-tr"],"rounded-r":["rounded-tr","rounded-br"],"rounded-b":["rounded-br","rounded-bl"],"rounded-l":["rounded-tl","rounded-bl"],"border-spacing":["border-spacing-x","border-spacing-y"],"border-w":["border-w-x","border-w-y","border-w-s","border-w-e","border-w-t","border-w-r","border-w-b","border-w-l"],"border-w-x":["border-w-r","border-w-l"],"border-w-y":["border-w-t","border-w-b"],"border-color":["border-color-x","border-color-y","border-color-s","border-color-e","border-color-t","border-color-r","border-color-b","border-color-l"],"border-color-x":["border-color-r","border-color-l"],"border-color-y":["border-color-t","border-color-b"],translate:["translate-x","translate-y","translate-none"],"translate-none":["translate","translate-x","translate-y","translate-z"],"scroll-m":["scroll-mx","scroll-my","scroll-ms","scroll-me","scroll-mt","scroll-mr","scroll-mb","scroll-ml"],"scroll-mx":["scroll-mr","scroll-ml"],"scroll-my":["scroll-mt","scroll-mb"],"scroll-p":["scroll-px","scroll-py","scroll-ps","scroll-pe","scroll-pt","scroll-pr","scroll-pb","scroll-pl"],"scroll-px":["scroll-pr","scroll-pl"],"scroll-py":["scroll-pt","scroll-pb"],touch:["touch-x","touch-y","touch-pz"],"touch-x":["touch"],"touch-y":["touch"],"touch-pz":["touch"]},conflictingClassGroupModifiers:{"font-size":["leading"]},orderSensitiveModifiers:["*","**","after","backdrop","before","details-content","file","first-letter","first-line","marker","placeholder","selection"]}},H6=j6(U6);function We(...e){return H6(qe(e))}const F6=CR("inline-flex items-center justify-center gap-2 whitespace-nowrap rounded-md text-sm font-medium transition-all disabled:pointer-events-none disabled:opacity-50 [&_svg]:pointer-events-none [&_svg:not([class*='size-'])]:size-4 shrink-0 [&_svg]:shrink-0 outline-none focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:ring-[3px] aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive",{variants:{variant:{default:"bg-primary text-primary-foreground shadow-xs hover:bg-primary/90",destructive:"bg-destructive text-white shadow-xs hover:bg-destructive/90 focus-visible:ring-destructive/20 dark:focus-visible:ring-destructive/40 dark:bg-destructive/60",outline:"border bg-background shadow-xs hover:bg-accent hover:text-accent-foreground dark:bg-input/30 dark:border-input dark:hover:bg-input/50",secondary:"bg-secondary text-secondary-foreground shadow-xs hover:bg-secondary/80",ghost:"hover:bg-accent hover:text-accent-foreground dark:hover:bg-accent/50",link:"text-primary underline-offset-4 hover:underline"},size:{default:"h-9 px-4 py-2 has-[>svg]:px-3",sm:"h-8 rounded-md gap-1.5 px-3 has-[>svg]:px-2.5",lg:"h-10 rounded-md px-6 has-[>svg]:px-4",icon:"size-9"}},defaultVariants:{variant:"default",size:"default"}});function Pe({className:e,variant:t,size:n,asChild:r=!1,...i}){const l=r?ER:"button";return p.jsx(l,{"data-slot":"button",className:We(F6({variant:t,size:n,className:e})),...i})}/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const G6=e=>e.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase(),V6=e=>e.replace(/^([A-Z])|[\s-_]+(\w)/g,(t,n,r)=>r?r.toUpperCase():n.toLowerCase()),UA=e=>{const t=V6(e);return t.charAt(0).toUpperCase()+t.slice(1)},BR=(...e)=>e.filter((t,n,r)=>!!t&&t.trim()!==""&&r.indexOf(t)===n).join(" ").trim(),Y6=e=>{for(const t in e)if(t.startsWith("aria-")||t==="role"||t==="title")return!0};/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */var K6={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const X6=T.forwardRef(({color:e="currentColor",size:t=24,strokeWidth:n=2,absoluteStrokeWidth:r,className:i="",children:l,iconNode:s,...u},f)=>T.createElement("svg",{ref:f,...K6,width:t,height:t,stroke:e,strokeWidth:r?Number(n)*24/Number(t):n,className:BR("lucide",i),...!l&&!Y6(u)&&{"aria-hidden":"true"},...u},[...s.map(([d,m])=>T.createElement(d,m)),...Array.isArray(l)?l:[l]]));/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const He=(e,t)=>{const n=T.forwardRef(({className:r,...i},l)=>T.createElement(X6,{ref:l,iconNode:t,className:BR(`lucide-${G6(UA(e))}`,`lucide-${e}`,r),...i}));return n.displayName=UA(e),n};/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const W6=[["rect",{width:"16",height:"20",x:"4",y:"2",rx:"2",ry:"2",key:"76otgf"}],["path",{d:"M9 22v-4h6v4",key:"r93iot"}],["path",{d:"M8 6h.01",key:"1dz90k"}],["path",{d:"M16 6h.01",key:"1x0f13"}],["path",{d:"M12 6h.01",key:"1vi96p"}],["path",{d:"M12 10h.01",key:"1nrarc"}],["path",{d:"M12 14h.01",key:"1etili"}],["path",{d:"M16 10h.01",key:"1m94wz"}],["path",{d:"M16 14h.01",key:"1gbofw"}],["path",{d:"M8 10h.01",key:"19clt8"}],["path",{d:"M8 14h.01",key:"6423bh"}]],HA=He("building",W6);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Z6=[["path",{d:"M8 2v4",key:"1cmpym"}],["path",{d:"M16 2v4",key:"4m81vk"}],["rect",{width:"18",height:"18",x:"3",y:"4",rx:"2",key:"1hopcy"}],["path",{d:"M3 10h18",key:"8toen8"}]],Jn=He("calendar",Z6);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Q6=[["path",{d:"M19 17h2c.6 0 1-.4 1-1v-3c0-.9-.7-1.7-1.5-1.9C18.7 10.6 16 10 16 10s-1.3-1.4-2.2-2.3c-.5-.4-1.1-.7-1.8-.7H5c-.6 0-1.1.4-1.4.9l-1.4 2.9A3.7 3.7 0 0 0 2 12v4c0 .6.4 1 1 1h2",key:"5owen"}],["circle",{cx:"7",cy:"17",r:"2",key:"u2ysq9"}],["path",{d:"M9 17h6",key:"r8uit2"}],["circle",{cx:"17",cy:"17",r:"2",key:"axvx0g"}]],Ih=He("car",Q6);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const J6=[["path",{d:"M20 6 9 17l-5-5",key:"1gmf2c"}]],ez=He("check",J6);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const tz=[["path",{d:"m6 9 6 6 6-6",key:"qrunsl"}]],zR=He("chevron-down",tz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const nz=[["path",{d:"m15 18-6-6 6-6",key:"1wnfg3"}]],rz=He("chevron-left",nz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const az=[["path",{d:"m18 15-6-6-6 6",key:"153udz"}]],iz=He("chevron-up",az);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const oz=[["path",{d:"M21.801 10A10 10 0 1 1 17 3.335",key:"yps3ct"}],["path",{d:"m9 11 3 3L22 4",key:"1pflzl"}]],jl=He("circle-check-big",oz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const lz=[["circle",{cx:"12",cy:"12",r:"10",key:"1mglay"}],["polyline",{points:"12 6 12 12 16 14",key:"68esgv"}]],hr=He("clock",lz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const sz=[["line",{x1:"12",x2:"12",y1:"2",y2:"22",key:"7eqyqh"}],["path",{d:"M17 5H9.5a3.5 3.5 0 0 0 0 7h5a3.5 3.5 0 0 1 0 7H6",key:"1b0p4s"}]],Yi=He("dollar-sign",sz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const cz=[["path",{d:"M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4",key:"ih7n3h"}],["polyline",{points:"7 10 12 15 17 10",key:"2ggqvy"}],["line",{x1:"12",x2:"12",y1:"15",y2:"3",key:"1vk2je"}]],FA=He("download",cz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const uz=[["path",{d:"M2.062 12.348a1 1 0 0 1 0-.696 10.75 10.75 0 0 1 19.876 0 1 1 0 0 1 0 .696 10.75 10.75 0 0 1-19.876 0",key:"1nclc0"}],["circle",{cx:"12",cy:"12",r:"3",key:"1v7zrd"}]],Ed=He("eye",uz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const fz=[["path",{d:"M15 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V7Z",key:"1rqfz7"}],["path",{d:"M14 2v4a2 2 0 0 0 2 2h4",key:"tnqrlb"}],["path",{d:"M10 9H8",key:"b1mrlr"}],["path",{d:"M16 13H8",key:"t4e002"}],["path",{d:"M16 17H8",key:"z1uh3a"}]],wd=He("file-text",fz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const dz=[["path",{d:"M3 12a9 9 0 1 0 9-9 9.75 9.75 0 0 0-6.74 2.74L3 8",key:"1357e3"}],["path",{d:"M3 3v5h5",key:"1xhq8a"}],["path",{d:"M12 7v5l4 2",key:"1fdv2h"}]],GA=He("history",dz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const hz=[["rect",{width:"7",height:"9",x:"3",y:"3",rx:"1",key:"10lvy0"}],["rect",{width:"7",height:"5",x:"14",y:"3",rx:"1",key:"16une8"}],["rect",{width:"7",height:"9",x:"14",y:"12",rx:"1",key:"1hutg5"}],["rect",{width:"7",height:"5",x:"3",y:"16",rx:"1",key:"ldoo1y"}]],pz=He("layout-dashboard",hz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const mz=[["path",{d:"M9 21H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h4",key:"1uf3rs"}],["polyline",{points:"16 17 21 12 16 7",key:"1gabdz"}],["line",{x1:"21",x2:"9",y1:"12",y2:"12",key:"1uyos4"}]],vz=He("log-out",mz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const yz=[["path",{d:"m22 7-8.991 5.727a2 2 0 0 1-2.009 0L2 7",key:"132q7q"}],["rect",{x:"2",y:"4",width:"20",height:"16",rx:"2",key:"izxlao"}]],ei=He("mail",yz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const gz=[["path",{d:"M20 10c0 4.993-5.539 10.193-7.399 11.799a1 1 0 0 1-1.202 0C9.539 20.193 4 14.993 4 10a8 8 0 0 1 16 0",key:"1r0f0z"}],["circle",{cx:"12",cy:"10",r:"3",key:"ilqhr7"}]],bz=He("map-pin",gz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const xz=[["path",{d:"M4 12h16",key:"1lakjw"}],["path",{d:"M4 18h16",key:"19g7jn"}],["path",{d:"M4 6h16",key:"1o0s65"}]],wz=He("menu",xz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Sz=[["path",{d:"M11 21.73a2 2 0 0 0 2 0l7-4A2 2 0 0 0 21 16V8a2 2 0 0 0-1-1.73l-7-4a2 2 0 0 0-2 0l-7 4A2 2 0 0 0 3 8v8a2 2 0 0 0 1 1.73z",key:"1a0edw"}],["path",{d:"M12 22V12",key:"d0xqtd"}],["polyline",{points:"3.29 7 12 12 20.71 7",key:"ousv84"}],["path",{d:"m7.5 4.27 9 5.15",key:"1c824w"}]],Td=He("package",Sz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const jz=[["path",{d:"M13.832 16.568a1 1 0 0 0 1.213-.303l.355-.465A2 2 0 0 1 17 15h3a2 2 0 0 1 2 2v3a2 2 0 0 1-2 2A18 18 0 0 1 2 4a2 2 0 0 1 2-2h3a2 2 0 0 1 2 2v3a2 2 0 0 1-.8 1.6l-.468.351a1 1 0 0 0-.292 1.233 14 14 0 0 0 6.392 6.384",key:"9njp5v"}]],Oz=He("phone",jz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const _z=[["path",{d:"M5 12h14",key:"1ays0h"}],["path",{d:"M12 5v14",key:"s699le"}]],Ol=He("plus",_z);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Az=[["path",{d:"M3 12a9 9 0 0 1 9-9 9.75 9.75 0 0 1 6.74 2.74L21 8",key:"v9h5vc"}],["path",{d:"M21 3v5h-5",key:"1q7to0"}],["path",{d:"M21 12a9 9 0 0 1-9 9 9.75 9.75 0 0 1-6.74-2.74L3 16",key:"3uifl3"}],["path",{d:"M8 16H3v5",key:"1cv678"}]],Ez=He("refresh-cw",Az);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Tz=[["path",{d:"M15.2 3a2 2 0 0 1 1.4.6l3.8 3.8a2 2 0 0 1 .6 1.4V19a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2z",key:"1c8476"}],["path",{d:"M17 21v-7a1 1 0 0 0-1-1H8a1 1 0 0 0-1 1v7",key:"1ydtos"}],["path",{d:"M7 3v4a1 1 0 0 0 1 1h7",key:"t51u73"}]],ay=He("save",Tz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Cz=[["path",{d:"m21 21-4.34-4.34",key:"14j7rj"}],["circle",{cx:"11",cy:"11",r:"8",key:"4ej97u"}]],qh=He("search",Cz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Nz=[["path",{d:"M12.22 2h-.44a2 2 0 0 0-2 2v.18a2 2 0 0 1-1 1.73l-.43.25a2 2 0 0 1-2 0l-.15-.08a2 2 0 0 0-2.73.73l-.22.38a2 2 0 0 0 .73 2.73l.15.1a2 2 0 0 1 1 1.72v.51a2 2 0 0 1-1 1.74l-.15.09a2 2 0 0 0-.73 2.73l.22.38a2 2 0 0 0 2.73.73l.15-.08a2 2 0 0 1 2 0l.43.25a2 2 0 0 1 1 1.73V20a2 2 0 0 0 2 2h.44a2 2 0 0 0 2-2v-.18a2 2 0 0 1 1-1.73l.43-.25a2 2 0 0 1 2 0l.15.08a2 2 0 0 0 2.73-.73l.22-.39a2 2 0 0 0-.73-2.73l-.15-.08a2 2 0 0 1-1-1.74v-.5a2 2 0 0 1 1-1.74l.15-.09a2 2 0 0 0 .73-2.73l-.22-.38a2 2 0 0 0-2.73-.73l-.15.08a2 2 0 0 1-2 0l-.43-.25a2 2 0 0 1-1-1.73V4a2 2 0 0 0-2-2z",key:"1qme2f"}],["circle",{cx:"12",cy:"12",r:"3",key:"1v7zrd"}]],Mz=He("settings",Nz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Pz=[["path",{d:"M20 13c0 5-3.5 7.5-7.66 8.95a1 1 0 0 1-.67-.01C7.5 20.5 4 18 4 13V6a1 1 0 0 1 1-1c2 0 4.5-1.2 6.24-2.72a1.17 1.17 0 0 1 1.52 0C14.51 3.81 17 5 19 5a1 1 0 0 1 1 1z",key:"oel41y"}]],Rz=He("shield",Pz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Dz=[["path",{d:"M12 3H5a2 2 0 0 0-2 2v14a2 2 0 0 0 2 2h14a2 2 0 0 0 2-2v-7",key:"1m0v6g"}],["path",{d:"M18.375 2.625a1 1 0 0 1 3 3l-9.013 9.014a2 2 0 0 1-.853.505l-2.873.84a.5.5 0 0 1-.62-.62l.84-2.873a2 2 0 0 1 .506-.852z",key:"ohrbg2"}]],Cd=He("square-pen",Dz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const kz=[["path",{d:"M11 2v2",key:"1539x4"}],["path",{d:"M5 2v2",key:"1yf1q8"}],["path",{d:"M5 3H4a2 2 0 0 0-2 2v4a6 6 0 0 0 12 0V5a2 2 0 0 0-2-2h-1",key:"rb5t3r"}],["path",{d:"M8 15a6 6 0 0 0 12 0v-3",key:"x18d4x"}],["circle",{cx:"20",cy:"10",r:"2",key:"ts1r5v"}]],UR=He("stethoscope",kz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const $z=[["path",{d:"M14.5 2v17.5c0 1.4-1.1 2.5-2.5 2.5c-1.4 0-2.5-1.1-2.5-2.5V2",key:"125lnx"}],["path",{d:"M8.5 2h7",key:"csnxdl"}],["path",{d:"M14.5 16h-5",key:"1ox875"}]],Lz=He("test-tube",$z);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Iz=[["path",{d:"M3 6h18",key:"d0wm0j"}],["path",{d:"M19 6v14c0 1-1 2-2 2H7c-1 0-2-1-2-2V6",key:"4alrt4"}],["path",{d:"M8 6V4c0-1 1-2 2-2h4c1 0 2 1 2 2v2",key:"v07s0e"}],["line",{x1:"10",x2:"10",y1:"11",y2:"17",key:"1uufr5"}],["line",{x1:"14",x2:"14",y1:"11",y2:"17",key:"xtxkd"}]],qz=He("trash-2",Iz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Bz=[["polyline",{points:"22 7 13.5 15.5 8.5 10.5 2 17",key:"126l90"}],["polyline",{points:"16 7 22 7 22 13",key:"kwv8wd"}]],zz=He("trending-up",Bz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Uz=[["path",{d:"m21.73 18-8-14a2 2 0 0 0-3.48 0l-8 14A2 2 0 0 0 4 21h16a2 2 0 0 0 1.73-3",key:"wmoenq"}],["path",{d:"M12 9v4",key:"juzpu7"}],["path",{d:"M12 17h.01",key:"p32p05"}]],Bh=He("triangle-alert",Uz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Hz=[["path",{d:"M14 18V6a2 2 0 0 0-2-2H4a2 2 0 0 0-2 2v11a1 1 0 0 0 1 1h2",key:"wrbu53"}],["path",{d:"M15 18H9",key:"1lyqi6"}],["path",{d:"M19 18h2a1 1 0 0 0 1-1v-3.65a1 1 0 0 0-.22-.624l-3.48-4.35A1 1 0 0 0 17.52 8H14",key:"lysw3i"}],["circle",{cx:"17",cy:"18",r:"2",key:"332jqn"}],["circle",{cx:"7",cy:"18",r:"2",key:"19iecd"}]],VA=He("truck",Hz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Fz=[["path",{d:"M19 21v-2a4 4 0 0 0-4-4H9a4 4 0 0 0-4 4v2",key:"975kel"}],["circle",{cx:"12",cy:"7",r:"4",key:"17ys0d"}]],Dc=He("user",Fz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Gz=[["path",{d:"M16 21v-2a4 4 0 0 0-4-4H6a4 4 0 0 0-4 4v2",key:"1yyitq"}],["path",{d:"M16 3.128a4 4 0 0 1 0 7.744",key:"16gr8j"}],["path",{d:"M22 21v-2a4 4 0 0 0-3-3.87",key:"kshegd"}],["circle",{cx:"9",cy:"7",r:"4",key:"nufk8"}]],kc=He("users",Gz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Vz=[["path",{d:"M14.7 6.3a1 1 0 0 0 0 1.4l1.6 1.6a1 1 0 0 0 1.4 0l3.77-3.77a6 6 0 0 1-7.94 7.94l-6.91 6.91a2.12 2.12 0 0 1-3-3l6.91-6.91a6 6 0 0 1 7.94-7.94l-3.76 3.76z",key:"cbrjhi"}]],Ki=He("wrench",Vz);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Yz=[["path",{d:"M18 6 6 18",key:"1bl5f8"}],["path",{d:"m6 6 12 12",key:"d8bk6v"}]],Kz=He("x",Yz),Xz=({isOpen:e,onToggle:t,userRole:n,onLogout:r})=>{const i=li(),s=[{path:"/dashboard",label:"Dashboard",icon:pz,roles:["admin","tecnico","recepcionista"]},{path:"/clientes",label:"Clientes y Vehículos",icon:kc,roles:["admin","recepcionista"]},{path:"/diagnosticos",label:"Diagnósticos",icon:UR,roles:["admin","tecnico"]},{path:"/repuestos",label:"Repuestos",icon:Td,roles:["admin","tecnico"]},{path:"/citas",label:"Citas",icon:Jn,roles:["admin","recepcionista","tecnico"]},{path:"/facturas",label:"Facturas",icon:wd,roles:["admin","recepcionista"]},{path:"/configuracion",label:"Configuración",icon:Mz,roles:["admin"]}].filter(u=>u.roles.includes(n));return p.jsxs("div",{className:`fixed left-0 top-0 h-full bg-white shadow-lg transition-all duration-300 z-50 ${e?"w-64":"w-16"}`,children:[p.jsxs("div",{className:"flex items-center justify-between p-4 border-b",children:[p.jsxs("div",{className:`flex items-center gap-3 ${!e&&"justify-center"}`,children:[p.jsx("div",{className:"w-8 h-8 bg-blue-600 rounded-lg flex items-center justify-center",children:p.jsx(Ki,{className:"w-5 h-5 text-white"})}),e&&p.jsxs("div",{children:[p.jsx("h2",{className:"font-bold text-gray-900",children:"AutoRepair Pro"}),p.jsx("p",{className:"text-xs text-gray-500 capitalize",children:n})]})]}),p.jsx(Pe,{variant:"ghost",size:"sm",onClick:t,className:"p-1",children:e?p.jsx(rz,{className:"w-4 h-4"}):p.jsx(wz,{className:"w-4 h-4"})})]}),p.jsx("nav",{className:"p-4 space-y-2",children:s.map(u=>{const f=u.icon,d=i.pathname===u.path;return p.jsx(iw,{to:u.path,children:p.jsxs(Pe,{variant:d?"default":"ghost",className:`w-full justify-start gap-3 ${!e&&"px-2"}`,children:[p.jsx(f,{className:"w-5 h-5"}),e&&p.jsx("span",{children:u.label})]})},u.path)})}),p.jsx("div",{className:"absolute bottom-4 left-4 right-4",children:p.jsxs(Pe,{variant:"ghost",onClick:r,className:`w-full justify-start gap-3 text-red-600 hover:text-red-700 hover:bg-red-50 ${!e&&"px-2"}`,children:[p.jsx(vz,{className:"w-5 h-5"}),e&&p.jsx("span",{children:"Cerrar Sesión"})]})})]})};function De({className:e,...t}){return p.jsx("div",{"data-slot":"card",className:We("bg-card text-card-foreground flex flex-col gap-6 rounded-xl border py-6 shadow-sm",e),...t})}function pt({className:e,...t}){return p.jsx("div",{"data-slot":"card-header",className:We("@container/card-header grid auto-rows-min grid-rows-[auto_auto] items-start gap-1.5 px-6 has-data-[slot=card-action]:grid-cols-[1fr_auto] [.border-b]:pb-6",e),...t})}function mt({className:e,...t}){return p.jsx("div",{"data-slot":"card-title",className:We("leading-none font-semibold",e),...t})}function nn({className:e,...t}){return p.jsx("div",{"data-slot":"card-description",className:We("text-muted-foreground text-sm",e),...t})}function ke({className:e,...t}){return p.jsx("div",{"data-slot":"card-content",className:We("px-6",e),...t})}const Wz=CR("inline-flex items-center justify-center rounded-md border px-2 py-0.5 text-xs font-medium w-fit whitespace-nowrap shrink-0 [&>svg]:size-3 gap-1 [&>svg]:pointer-events-none focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:ring-[3px] aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive transition-[color,box-shadow] overflow-hidden",{variants:{variant:{default:"border-transparent bg-primary text-primary-foreground [a&]:hover:bg-primary/90",secondary:"border-transparent bg-secondary text-secondary-foreground [a&]:hover:bg-secondary/90",destructive:"border-transparent bg-destructive text-white [a&]:hover:bg-destructive/90 focus-visible:ring-destructive/20 dark:focus-visible:ring-destructive/40 dark:bg-destructive/60",outline:"text-foreground [a&]:hover:bg-accent [a&]:hover:text-accent-foreground"}},defaultVariants:{variant:"default"}});function Mt({className:e,variant:t,asChild:n=!1,...r}){const i=n?ER:"span";return p.jsx(i,{"data-slot":"badge",className:We(Wz({variant:t}),e),...r})}var iy,YA;function jn(){if(YA)return iy;YA=1;var e=Array.isArray;return iy=e,iy}var oy,KA;function HR(){if(KA)return oy;KA=1;var e=typeof Wf=="object"&&Wf&&Wf.Object===Object&&Wf;return oy=e,oy}var ly,XA;function Rr(){if(XA)return ly;XA=1;var e=HR(),t=typeof self=="object"&&self&&self.Object===Object&&self,n=e||t||Function("return this")();return ly=n,ly}var sy,WA;function ju(){if(WA)return sy;WA=1;var e=Rr(),t=e.Symbol;return sy=t,sy}var cy,ZA;function Zz(){if(ZA)return cy;ZA=1;var e=ju(),t=Object.prototype,n=t.hasOwnProperty,r=t.toString,i=e?e.toStringTag:void 0;function l(s){var u=n.call(s,i),f=s[i];try{s[i]=void 0;var d=!0}catch{}var m=r.call(s);return d&&(u?s[i]=f:delete s[i]),m}return cy=l,cy}var uy,QA;function Qz(){if(QA)return uy;QA=1;var e=Object.prototype,t=e.toString;function n(r){return t.call(r)}return uy=n,uy}var fy,JA;function xa(){if(JA)return fy;JA=1;var e=ju(),t=Zz(),n=Qz(),r="[object Null]",i="[object Undefined]",l=e?e.toStringTag:void 0;function s(u){return u==null?u===void 0?i:r:l&&l in Object(u)?t(u):n(u)}return fy=s,fy}var dy,eE;function wa(){if(eE)return dy;eE=1;function e(t){return t!=null&&typeof t=="object"}return dy=e,dy}var hy,tE;function ts(){if(tE)return hy;tE=1;var e=xa(),t=wa(),n="[object Symbol]";function r(i){return typeof i=="symbol"||t(i)&&e(i)==n}return hy=r,hy}var py,nE;function lw(){if(nE)return py;nE=1;var e=jn(),t=ts(),n=/\.|\[(?:[^[\]]*|(["'])(?:(?!\1)[^\\]|\\.)*?\1)\]/,r=/^\w*$/;function i(l,s){if(e(l))return!1;var u=typeof l;return u=="number"||u=="symbol"||u=="boolean"||l==null||t(l)?!0:r.test(l)||!n.test(l)||s!=null&&l in Object(s)}return py=i,py}var my,rE;function si(){if(rE)return my;rE=1;function e(t){var n=typeof t;return t!=null&&(n=="object"||n=="function")}return my=e,my}var vy,aE;function sw(){if(aE)return vy;aE=1;var e=xa(),t=si(),n="[object AsyncFunction]",r="[object Function]",i="[object GeneratorFunction]",l="[object Proxy]";function s(u){if(!t(u))return!1;var f=e(u);return f==r||f==i||f==n||f==l}return vy=s,vy}var yy,iE;function Jz(){if(iE)return yy;iE=1;var e=Rr(),t=e["__core-js_shared__"];return yy=t,yy}var gy,oE;function e8(){if(oE)return gy;oE=1;var e=Jz(),t=function(){var r=/[^.]+$/.exec(e&&e.keys&&e.keys.IE_PROTO||"");return r?"Symbol(src)_1."+r:""}();function n(r){return!!t&&t in r}return gy=n,gy}var by,lE;function FR(){if(lE)return by;lE=1;var e=Function.prototype,t=e.toString;function n(r){if(r!=null){try{return t.call(r)}catch{}try{return r+""}catch{}}return""}return by=n,by}var xy,sE;function t8(){if(sE)return xy;sE=1;var e=sw(),t=e8(),n=si(),r=FR(),i=/[\\^$.*+?()[\]{}|]/g,l=/^\[object .+?Constructor\]$/,s=Function.prototype,u=Object.prototype,f=s.toString,d=u.hasOwnProperty,m=RegExp("^"+f.call(d).replace(i,"\\$&").replace(/hasOwnProperty|(function).*?(?=\\\()| for .+?(?=\\\])/g,"$1.*?")+"$");function v(g){if(!n(g)||t(g))return!1;var x=e(g)?m:l;return x.test(r(g))}return xy=v,xy}var wy,cE;function n8(){if(cE)return wy;cE=1;function e(t,n){return t==null?void 0:t[n]}return wy=e,wy}var Sy,uE;function io(){if(uE)return Sy;uE=1;var e=t8(),t=n8();function n(r,i){var l=t(r,i);return e(l)?l:void 0}return Sy=n,Sy}var jy,fE;function zh(){if(fE)return jy;fE=1;var e=io(),t=e(Object,"create");return jy=t,jy}var Oy,dE;function r8(){if(dE)return Oy;dE=1;var e=zh();function t(){this.__data__=e?e(null):{},this.size=0}return Oy=t,Oy}var _y,hE;function a8(){if(hE)return _y;hE=1;function e(t){var n=this.has(t)&&delete this.__data__[t];return this.size-=n?1:0,n}return _y=e,_y}var Ay,pE;function i8(){if(pE)return Ay;pE=1;var e=zh(),t="__lodash_hash_undefined__",n=Object.prototype,r=n.hasOwnProperty;function i(l){var s=this.__data__;if(e){var u=s[l];return u===t?void 0:u}return r.call(s,l)?s[l]:void 0}return Ay=i,Ay}var Ey,mE;function o8(){if(mE)return Ey;mE=1;var e=zh(),t=Object.prototype,n=t.hasOwnProperty;function r(i){var l=this.__data__;return e?l[i]!==void 0:n.call(l,i)}return Ey=r,Ey}var Ty,vE;function l8(){if(vE)return Ty;vE=1;var e=zh(),t="__lodash_hash_undefined__";function n(r,i){var l=this.__data__;return this.size+=this.has(r)?0:1,l[r]=e&&i===void 0?t:i,this}return Ty=n,Ty}var Cy,yE;function s8(){if(yE)return Cy;yE=1;var e=r8(),t=a8(),n=i8(),r=o8(),i=l8();function l(s){var u=-1,f=s==null?0:s.length;for(this.clear();++u<f;){var d=s[u];this.set(d[0],d[1])}}return l.prototype.clear=e,l.prototype.delete=t,l.prototype.get=n,l.prototype.has=r,l.prototype.set=i,Cy=l,Cy}var Ny,gE;function c8(){if(gE)return Ny;gE=1;function e(){this.__data__=[],this.size=0}return Ny=e,Ny}var My,bE;function cw(){if(bE)return My;bE=1;function e(t,n){return t===n||t!==t&&n!==n}return My=e,My}var Py,xE;function Uh(){if(xE)return Py;xE=1;var e=cw();function t(n,r){for(var i=n.length;i--;)if(e(n[i][0],r))return i;return-1}return Py=t,Py}var Ry,wE;function u8(){if(wE)return Ry;wE=1;var e=Uh(),t=Array.prototype,n=t.splice;function r(i){var l=this.__data__,s=e(l,i);if(s<0)return!1;var u=l.length-1;return s==u?l.pop():n.call(l,s,1),--this.size,!0}return Ry=r,Ry}var Dy,SE;function f8(){if(SE)return Dy;SE=1;var e=Uh();function t(n){var r=this.__data__,i=e(r,n);return i<0?void 0:r[i][1]}return Dy=t,Dy}var ky,jE;function d8(){if(jE)return ky;jE=1;var e=Uh();function t(n){return e(this.__data__,n)>-1}return ky=t,ky}var $y,OE;function h8(){if(OE)return $y;OE=1;var e=Uh();function t(n,r){var i=this.__data__,l=e(i,n);return l<0?(++this.size,i.push([n,r])):i[l][1]=r,this}return $y=t,$y}var Ly,_E;function Hh(){if(_E)return Ly;_E=1;var e=c8(),t=u8(),n=f8(),r=d8(),i=h8();function l(s){var u=-1,f=s==null?0:s.length;for(this.clear();++u<f;){var d=s[u];this.set(d[0],d[1])}}return l.prototype.clear=e,l.prototype.delete=t,l.prototype.get=n,l.prototype.has=r,l.prototype.set=i,Ly=l,Ly}var Iy,AE;function uw(){if(AE)return Iy;AE=1;var e=io(),t=Rr(),n=e(t,"Map");return Iy=n,Iy}var qy,EE;function p8(){if(EE)return qy;EE=1;var e=s8(),t=Hh(),n=uw();function r(){this.size=0,this.__data__={hash:new e,map:new(n||t),string:new e}}return qy=r,qy}var By,TE;function m8(){if(TE)return By;TE=1;function e(t){var n=typeof t;return n=="string"||n=="number"||n=="symbol"||n=="boolean"?t!=="__proto__":t===null}return By=e,By}var zy,CE;function Fh(){if(CE)return zy;CE=1;var e=m8();function t(n,r){var i=n.__data__;return e(r)?i[typeof r=="string"?"string":"hash"]:i.map}return zy=t,zy}var Uy,NE;function v8(){if(NE)return Uy;NE=1;var e=Fh();function t(n){var r=e(this,n).delete(n);return this.size-=r?1:0,r}return Uy=t,Uy}var Hy,ME;function y8(){if(ME)return Hy;ME=1;var e=Fh();function t(n){return e(this,n).get(n)}return Hy=t,Hy}var Fy,PE;function g8(){if(PE)return Fy;PE=1;var e=Fh();function t(n){return e(this,n).has(n)}return Fy=t,Fy}var Gy,RE;function b8(){if(RE)return Gy;RE=1;var e=Fh();function t(n,r){var i=e(this,n),l=i.size;return i.set(n,r),this.size+=i.size==l?0:1,this}return Gy=t,Gy}var Vy,DE;function fw(){if(DE)return Vy;DE=1;var e=p8(),t=v8(),n=y8(),r=g8(),i=b8();function l(s){var u=-1,f=s==null?0:s.length;for(this.clear();++u<f;){var d=s[u];this.set(d[0],d[1])}}return l.prototype.clear=e,l.prototype.delete=t,l.prototype.get=n,l.prototype.has=r,l.prototype.set=i,Vy=l,Vy}var Yy,kE;function GR(){if(kE)return Yy;kE=1;var e=fw(),t="Expected a function";function n(r,i){if(typeof r!="function"||i!=null&&typeof i!="function")throw new TypeError(t);var l=function(){var s=arguments,u=i?i.apply(this,s):s[0],f=l.cache;if(f.has(u))return f.get(u);var d=r.apply(this,s);return l.cache=f.set(u,d)||f,d};return l.cache=new(n.Cache||e),l}return n.Cache=e,Yy=n,Yy}var Ky,$E;function x8(){if($E)return Ky;$E=1;var e=GR(),t=500;function n(r){var i=e(r,function(s){return l.size===t&&l.clear(),s}),l=i.cache;return i}return Ky=n,Ky}var Xy,LE;function w8(){if(LE)return Xy;LE=1;var e=x8(),t=/[^.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|$))/g,n=/\\(\\)?/g,r=e(function(i){var l=[];return i.charCodeAt(0)===46&&l.push(""),i.replace(t,function(s,u,f,d){l.push(f?d.replace(n,"$1"):u||s)}),l});return Xy=r,Xy}var Wy,IE;function dw(){if(IE)return Wy;IE=1;function e(t,n){for(var r=-1,i=t==null?0:t.length,l=Array(i);++r<i;)l[r]=n(t[r],r,t);return l}return Wy=e,Wy}var Zy,qE;function S8(){if(qE)return Zy;qE=1;var e=ju(),t=dw(),n=jn(),r=ts(),i=e?e.prototype:void 0,l=i?i.toString:void 0;function s(u){if(typeof u=="string")return u;if(n(u))return t(u,s)+"";if(r(u))return l?l.call(u):"";var f=u+"";return f=="0"&&1/u==-1/0?"-0":f}return Zy=s,Zy}var Qy,BE;function VR(){if(BE)return Qy;BE=1;var e=S8();function t(n){return n==null?"":e(n)}return Qy=t,Qy}var Jy,zE;function YR(){if(zE)return Jy;zE=1;var e=jn(),t=lw(),n=w8(),r=VR();function i(l,s){return e(l)?l:t(l,s)?[l]:n(r(l))}return Jy=i,Jy}var eg,UE;function Gh(){if(UE)return eg;UE=1;var e=ts();function t(n){if(typeof n=="string"||e(n))return n;var r=n+"";return r=="0"&&1/n==-1/0?"-0":r}return eg=t,eg}var tg,HE;function hw(){if(HE)return tg;HE=1;var e=YR(),t=Gh();function n(r,i){i=e(i,r);for(var l=0,s=i.length;r!=null&&l<s;)r=r[t(i[l++])];return l&&l==s?r:void 0}return tg=n,tg}var ng,FE;function KR(){if(FE)return ng;FE=1;var e=hw();function t(n,r,i){var l=n==null?void 0:e(n,r);return l===void 0?i:l}return ng=t,ng}var j8=KR();const Ln=rt(j8);var rg,GE;function O8(){if(GE)return rg;GE=1;function e(t){return t==null}return rg=e,rg}var _8=O8();const Ve=rt(_8);var ag,VE;function A8(){if(VE)return ag;VE=1;var e=xa(),t=jn(),n=wa(),r="[object String]";function i(l){return typeof l=="string"||!t(l)&&n(l)&&e(l)==r}return ag=i,ag}var E8=A8();const Xi=rt(E8);var T8=sw();const Re=rt(T8);var C8=si();const ns=rt(C8);var ig={exports:{}},tt={};/**
- * @license React
- * react-is.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var YE;function N8(){if(YE)return tt;YE=1;var e=Symbol.for("react.element"),t=Symbol.for("react.portal"),n=Symbol.for("react.fragment"),r=Symbol.for("react.strict_mode"),i=Symbol.for("react.profiler"),l=Symbol.for("react.provider"),s=Symbol.for("react.context"),u=Symbol.for("react.server_context"),f=Symbol.for("react.forward_ref"),d=Symbol.for("react.suspense"),m=Symbol.for("react.suspense_list"),v=Symbol.for("react.memo"),g=Symbol.for("react.lazy"),x=Symbol.for("react.offscreen"),j;j=Symbol.for("react.module.reference");function w(b){if(typeof b=="object"&&b!==null){var _=b.$$typeof;switch(_){case e:switch(b=b.type,b){case n:case i:case r:case d:case m:return b;default:switch(b=b&&b.$$typeof,b){case u:case s:case f:case g:case v:case l:return b;default:return _}}case t:return _}}}return tt.ContextConsumer=s,tt.ContextProvider=l,tt.Element=e,tt.ForwardRef=f,tt.Fragment=n,tt.Lazy=g,tt.Memo=v,tt.Portal=t,tt.Profiler=i,tt.StrictMode=r,tt.Suspense=d,tt.SuspenseList=m,tt.isAsyncMode=function(){return!1},tt.isConcurrentMode=function(){return!1},tt.isContextConsumer=function(b){return w(b)===s},tt.isContextProvider=function(b){return w(b)===l},tt.isElement=function(b){return typeof b=="object"&&b!==null&&b.$$typeof===e},tt.isForwardRef=function(b){return w(b)===f},tt.isFragment=function(b){return w(b)===n},tt.isLazy=function(b){return w(b)===g},tt.isMemo=function(b){return w(b)===v},tt.isPortal=function(b){return w(b)===t},tt.isProfiler=function(b){return w(b)===i},tt.isStrictMode=function(b){return w(b)===r},tt.isSuspense=function(b){return w(b)===d},tt.isSuspenseList=function(b){return w(b)===m},tt.isValidElementType=function(b){return typeof b=="string"||typeof b=="function"||b===n||b===i||b===r||b===d||b===m||b===x||typeof b=="object"&&b!==null&&(b.$$typeof===g||b.$$typeof===v||b.$$typeof===l||b.$$typeof===s||b.$$typeof===f||b.$$typeof===j||b.getModuleId!==void 0)},tt.typeOf=w,tt}var KE;function M8(){return KE||(KE=1,ig.exports=N8()),ig.exports}var P8=M8(),og,XE;function XR(){if(XE)return og;XE=1;var e=xa(),t=wa(),n="[object Number]";function r(i){return typeof i=="number"||t(i)&&e(i)==n}return og=r,og}var lg,WE;function R8(){if(WE)return lg;WE=1;var e=XR();function t(n){return e(n)&&n!=+n}return lg=t,lg}var D8=R8();const Ou=rt(D8);var k8=XR();const $8=rt(k8);var hn=function(t){return t===0?0:t>0?1:-1},Bi=function(t){return Xi(t)&&t.indexOf("%")===t.length-1},fe=function(t){return $8(t)&&!Ou(t)},Ut=function(t){return fe(t)||Xi(t)},L8=0,_u=function(t){var n=++L8;return"".concat(t||"").concat(n)},pn=function(t,n){var r=arguments.length>2&&arguments[2]!==void 0?arguments[2]:0,i=arguments.length>3&&arguments[3]!==void 0?arguments[3]:!1;if(!fe(t)&&!Xi(t))return r;var l;if(Bi(t)){var s=t.indexOf("%");l=n*parseFloat(t.slice(0,s))/100}else l=+t;return Ou(l)&&(l=r),i&&l>n&&(l=n),l},Qa=function(t){if(!t)return null;var n=Object.keys(t);return n&&n.length?t[n[0]]:null},I8=function(t){if(!Array.isArray(t))return!1;for(var n=t.length,r={},i=0;i<n;i++)if(!r[t[i]])r[t[i]]=!0;else return!0;return!1},Wa=function(t,n){return fe(t)&&fe(n)?function(r){return t+r*(n-t)}:function(){return n}};function wx(e,t,n){return!e||!e.length?null:e.find(function(r){return r&&(typeof t=="function"?t(r):Ln(r,t))===n})}var q8=function(t,n){return fe(t)&&fe(n)?t-n:Xi(t)&&Xi(n)?t.localeCompare(n):t instanceof Date&&n instanceof Date?t.getTime()-n.getTime():String(t).localeCompare(String(n))};function dl(e,t){for(var n in e)if({}.hasOwnProperty.call(e,n)&&(!{}.hasOwnProperty.call(t,n)||e[n]!==t[n]))return!1;for(var r in t)if({}.hasOwnProperty.call(t,r)&&!{}.hasOwnProperty.call(e,r))return!1;return!0}function Sx(e){"@babel/helpers - typeof";return Sx=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Sx(e)}var B8=["viewBox","children"],z8=["aria-activedescendant","aria-atomic","aria-autocomplete","aria-busy","aria-checked","aria-colcount","aria-colindex","aria-colspan","aria-controls","aria-current","aria-describedby","aria-details","aria-disabled","aria-errormessage","aria-expanded","aria-flowto","aria-haspopup","aria-hidden","aria-invalid","aria-keyshortcuts","aria-label","aria-labelledby","aria-level","aria-live","aria-modal","aria-multiline","aria-multiselectable","aria-orientation","aria-owns","aria-placeholder","aria-posinset","aria-pressed","aria-readonly","aria-relevant","aria-required","aria-roledescription","aria-rowcount","aria-rowindex","aria-rowspan","aria-selected","aria-setsize","aria-sort","aria-valuemax","aria-valuemin","aria-valuenow","aria-valuetext","className","color","height","id","lang","max","media","method","min","name","style","target","width","role","tabIndex","accentHeight","accumulate","additive","alignmentBaseline","allowReorder","alphabetic","amplitude","arabicForm","ascent","attributeName","attributeType","autoReverse","azimuth","baseFrequency","baselineShift","baseProfile","bbox","begin","bias","by","calcMode","capHeight","clip","clipPath","clipPathUnits","clipRule","colorInterpolation","colorInterpolationFilters","colorProfile","colorRendering","contentScriptType","contentStyleType","cursor","cx","cy","d","decelerate","descent","diffuseConstant","direction","display","divisor","dominantBaseline","dur","dx","dy","edgeMode","elevation","enableBackground","end","exponent","externalResourcesRequired","fill","fillOpacity","fillRule","filter","filterRes","filterUnits","floodColor","floodOpacity","focusable","fontFamily","fontSize","fontSizeAdjust","fontStretch","fontStyle","fontVariant","fontWeight","format","from","fx","fy","g1","g2","glyphName","glyphOrientationHorizontal","glyphOrientationVertical","glyphRef","gradientTransform","gradientUnits","hanging","horizAdvX","horizOriginX","href","ideographic","imageRendering","in2","in","intercept","k1","k2","k3","k4","k","kernelMatrix","kernelUnitLength","kerning","keyPoints","keySplines","keyTimes","lengthAdjust","letterSpacing","lightingColor","limitingConeAngle","local","markerEnd","markerHeight","markerMid","markerStart","markerUnits","markerWidth","mask","maskContentUnits","maskUnits","mathematical","mode","numOctaves","offset","opacity","operator","order","orient","orientation","origin","overflow","overlinePosition","overlineThickness","paintOrder","panose1","pathLength","patternContentUnits","patternTransform","patternUnits","pointerEvents","pointsAtX","pointsAtY","pointsAtZ","preserveAlpha","preserveAspectRatio","primitiveUnits","r","radius","refX","refY","renderingIntent","repeatCount","repeatDur","requiredExtensions","requiredFeatures","restart","result","rotate","rx","ry","seed","shapeRendering","slope","spacing","specularConstant","specularExponent","speed","spreadMethod","startOffset","stdDeviation","stemh","stemv","stitchTiles","stopColor","stopOpacity","strikethroughPosition","strikethroughThickness","string","stroke","strokeDasharray","strokeDashoffset","strokeLinecap","strokeLinejoin","strokeMiterlimit","strokeOpacity","strokeWidth","surfaceScale","systemLanguage","tableValues","targetX","targetY","textAnchor","textDecoration","textLength","textRendering","to","transform","u1","u2","underlinePosition","underlineThickness","unicode","unicodeBidi","unicodeRange","unitsPerEm","vAlphabetic","values","vectorEffect","version","vertAdvY","vertOriginX","vertOriginY","vHanging","vIdeographic","viewTarget","visibility","vMathematical","widths","wordSpacing","writingMode","x1","x2","x","xChannelSelector","xHeight","xlinkActuate","xlinkArcrole","xlinkHref","xlinkRole","xlinkShow","xlinkTitle","xlinkType","xmlBase","xmlLang","xmlns","xmlnsXlink","xmlSpace","y1","y2","y","yChannelSelector","z","zoomAndPan","ref","key","angle"],ZE=["points","pathLength"],sg={svg:B8,polygon:ZE,polyline:ZE},pw=["dangerouslySetInnerHTML","onCopy","onCopyCapture","onCut","onCutCapture","onPaste","onPasteCapture","onCompositionEnd","onCompositionEndCapture","onCompositionStart","onCompositionStartCapture","onCompositionUpdate","onCompositionUpdateCapture","onFocus","onFocusCapture","onBlur","onBlurCapture","onChange","onChangeCapture","onBeforeInput","onBeforeInputCapture","onInput","onInputCapture","onReset","onResetCapture","onSubmit","onSubmitCapture","onInvalid","onInvalidCapture","onLoad","onLoadCapture","onError","onErrorCapture","onKeyDown","onKeyDownCapture","onKeyPress","onKeyPressCapture","onKeyUp","onKeyUpCapture","onAbort","onAbortCapture","onCanPlay","onCanPlayCapture","onCanPlayThrough","onCanPlayThroughCapture","onDurationChange","onDurationChangeCapture","onEmptied","onEmptiedCapture","onEncrypted","onEncryptedCapture","onEnded","onEndedCapture","onLoadedData","onLoadedDataCapture","onLoadedMetadata","onLoadedMetadataCapture","onLoadStart","onLoadStartCapture","onPause","onPauseCapture","onPlay","onPlayCapture","onPlaying","onPlayingCapture","onProgress","onProgressCapture","onRateChange","onRateChangeCapture","onSeeked","onSeekedCapture","onSeeking","onSeekingCapture","onStalled","onStalledCapture","onSuspend","onSuspendCapture","onTimeUpdate","onTimeUpdateCapture","onVolumeChange","onVolumeChangeCapture","onWaiting","onWaitingCapture","onAuxClick","onAuxClickCapture","onClick","onClickCapture","onContextMenu","onContextMenuCapture","onDoubleClick","onDoubleClickCapture","onDrag","onDragCapture","onDragEnd","onDragEndCapture","onDragEnter","onDragEnterCapture","onDragExit","onDragExitCapture","onDragLeave","onDragLeaveCapture","onDragOver","onDragOverCapture","onDragStart","onDragStartCapture","onDrop","onDropCapture","onMouseDown","onMouseDownCapture","onMouseEnter","onMouseLeave","onMouseMove","onMouseMoveCapture","onMouseOut","onMouseOutCapture","onMouseOver","onMouseOverCapture","onMouseUp","onMouseUpCapture","onSelect","onSelectCapture","onTouchCancel","onTouchCancelCapture","onTouchEnd","onTouchEndCapture","onTouchMove","onTouchMoveCapture","onTouchStart","onTouchStartCapture","onPointerDown","onPointerDownCapture","onPointerMove","onPointerMoveCapture","onPointerUp","onPointerUpCapture","onPointerCancel","onPointerCancelCapture","onPointerEnter","onPointerEnterCapture","onPointerLeave","onPointerLeaveCapture","onPointerOver","onPointerOverCapture","onPointerOut","onPointerOutCapture","onGotPointerCapture","onGotPointerCaptureCapture","onLostPointerCapture","onLostPointerCaptureCapture","onScroll","onScrollCapture","onWheel","onWheelCapture","onAnimationStart","onAnimationStartCapture","onAnimationEnd","onAnimationEndCapture","onAnimationIteration","onAnimationIterationCapture","onTransitionEnd","onTransitionEndCapture"],Nd=function(t,n){if(!t||typeof t=="function"||typeof t=="boolean")return null;var r=t;if(T.isValidElement(t)&&(r=t.props),!ns(r))return null;var i={};return Object.keys(r).forEach(function(l){pw.includes(l)&&(i[l]=n||function(s){return r[l](r,s)})}),i},U8=function(t,n,r){return function(i){return t(n,r,i),null}},Wi=function(t,n,r){if(!ns(t)||Sx(t)!=="object")return null;var i=null;return Object.keys(t).forEach(function(l){var s=t[l];pw.includes(l)&&typeof s=="function"&&(i||(i={}),i[l]=U8(s,n,r))}),i},H8=["children"],F8=["children"];function QE(e,t){if(e==null)return{};var n=G8(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function G8(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}var JE={click:"onClick",mousedown:"onMouseDown",mouseup:"onMouseUp",mouseover:"onMouseOver",mousemove:"onMouseMove",mouseout:"onMouseOut",mouseenter:"onMouseEnter",mouseleave:"onMouseLeave",touchcancel:"onTouchCancel",touchend:"onTouchEnd",touchmove:"onTouchMove",touchstart:"onTouchStart",contextmenu:"onContextMenu",dblclick:"onDoubleClick"},oa=function(t){return typeof t=="string"?t:t?t.displayName||t.name||"Component":""},e2=null,cg=null,mw=function e(t){if(t===e2&&Array.isArray(cg))return cg;var n=[];return T.Children.forEach(t,function(r){Ve(r)||(P8.isFragment(r)?n=n.concat(e(r.props.children)):n.push(r))}),cg=n,e2=t,n};function tr(e,t){var n=[],r=[];return Array.isArray(t)?r=t.map(function(i){return oa(i)}):r=[oa(t)],mw(e).forEach(function(i){var l=Ln(i,"type.displayName")||Ln(i,"type.name");r.indexOf(l)!==-1&&n.push(i)}),n}function Dn(e,t){var n=tr(e,t);return n&&n[0]}var t2=function(t){if(!t||!t.props)return!1;var n=t.props,r=n.width,i=n.height;return!(!fe(r)||r<=0||!fe(i)||i<=0)},V8=["a","altGlyph","altGlyphDef","altGlyphItem","animate","animateColor","animateMotion","animateTransform","circle","clipPath","color-profile","cursor","defs","desc","ellipse","feBlend","feColormatrix","feComponentTransfer","feComposite","feConvolveMatrix","feDiffuseLighting","feDisplacementMap","feDistantLight","feFlood","feFuncA","feFuncB","feFuncG","feFuncR","feGaussianBlur","feImage","feMerge","feMergeNode","feMorphology","feOffset","fePointLight","feSpecularLighting","feSpotLight","feTile","feTurbulence","filter","font","font-face","font-face-format","font-face-name","font-face-url","foreignObject","g","glyph","glyphRef","hkern","image","line","lineGradient","marker","mask","metadata","missing-glyph","mpath","path","pattern","polygon","polyline","radialGradient","rect","script","set","stop","style","svg","switch","symbol","text","textPath","title","tref","tspan","use","view","vkern"],Y8=function(t){return t&&t.type&&Xi(t.type)&&V8.indexOf(t.type)>=0},K8=function(t,n,r,i){var l,s=(l=sg==null?void 0:sg[i])!==null&&l!==void 0?l:[];return n.startsWith("data-")||!Re(t)&&(i&&s.includes(n)||z8.includes(n))||r&&pw.includes(n)},Me=function(t,n,r){if(!t||typeof t=="function"||typeof t=="boolean")return null;var i=t;if(T.isValidElement(t)&&(i=t.props),!ns(i))return null;var l={};return Object.keys(i).forEach(function(s){var u;K8((u=i)===null||u===void 0?void 0:u[s],s,n,r)&&(l[s]=i[s])}),l},jx=function e(t,n){if(t===n)return!0;var r=T.Children.count(t);if(r!==T.Children.count(n))return!1;if(r===0)return!0;if(r===1)return n2(Array.isArray(t)?t[0]:t,Array.isArray(n)?n[0]:n);for(var i=0;i<r;i++){var l=t[i],s=n[i];if(Array.isArray(l)||Array.isArray(s)){if(!e(l,s))return!1}else if(!n2(l,s))return!1}return!0},n2=function(t,n){if(Ve(t)&&Ve(n))return!0;if(!Ve(t)&&!Ve(n)){var r=t.props||{},i=r.children,l=QE(r,H8),s=n.props||{},u=s.children,f=QE(s,F8);return i&&u?dl(l,f)&&jx(i,u):!i&&!u?dl(l,f):!1}return!1},r2=function(t,n){var r=[],i={};return mw(t).forEach(function(l,s){if(Y8(l))r.push(l);else if(l){var u=oa(l.type),f=n[u]||{},d=f.handler,m=f.once;if(d&&(!m||!i[u])){var v=d(l,u,s);r.push(v),i[u]=!0}}}),r},X8=function(t){var n=t&&t.type;return n&&JE[n]?JE[n]:null},W8=function(t,n){return mw(n).indexOf(t)},Z8=["children","width","height","viewBox","className","style","title","desc"];function Ox(){return Ox=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Ox.apply(this,arguments)}function Q8(e,t){if(e==null)return{};var n=J8(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function J8(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}function _x(e){var t=e.children,n=e.width,r=e.height,i=e.viewBox,l=e.className,s=e.style,u=e.title,f=e.desc,d=Q8(e,Z8),m=i||{width:n,height:r,x:0,y:0},v=qe("recharts-surface",l);return z.createElement("svg",Ox({},Me(d,!0,"svg"),{className:v,width:n,height:r,style:s,viewBox:"".concat(m.x," ").concat(m.y," ").concat(m.width," ").concat(m.height)}),z.createElement("title",null,u),z.createElement("desc",null,f),t)}var e5=["children","className"];function Ax(){return Ax=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Ax.apply(this,arguments)}function t5(e,t){if(e==null)return{};var n=n5(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function n5(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}var ot=z.forwardRef(function(e,t){var n=e.children,r=e.className,i=t5(e,e5),l=qe("recharts-layer",r);return z.createElement("g",Ax({className:l},Me(i,!0),{ref:t}),n)}),pr=function(t,n){for(var r=arguments.length,i=new Array(r>2?r-2:0),l=2;l<r;l++)i[l-2]=arguments[l]},ug,a2;function r5(){if(a2)return ug;a2=1;function e(t,n,r){var i=-1,l=t.length;n<0&&(n=-n>l?0:l+n),r=r>l?l:r,r<0&&(r+=l),l=n>r?0:r-n>>>0,n>>>=0;for(var s=Array(l);++i<l;)s[i]=t[i+n];return s}return ug=e,ug}var fg,i2;function a5(){if(i2)return fg;i2=1;var e=r5();function t(n,r,i){var l=n.length;return i=i===void 0?l:i,!r&&i>=l?n:e(n,r,i)}return fg=t,fg}var dg,o2;function WR(){if(o2)return dg;o2=1;var e="\\ud800-\\udfff",t="\\u0300-\\u036f",n="\\ufe20-\\ufe2f",r="\\u20d0-\\u20ff",i=t+n+r,l="\\ufe0e\\ufe0f",s="\\u200d",u=RegExp("["+s+e+i+l+"]");function f(d){return u.test(d)}return dg=f,dg}var hg,l2;function i5(){if(l2)return hg;l2=1;function e(t){return t.split("")}return hg=e,hg}var pg,s2;function o5(){if(s2)return pg;s2=1;var e="\\ud800-\\udfff",t="\\u0300-\\u036f",n="\\ufe20-\\ufe2f",r="\\u20d0-\\u20ff",i=t+n+r,l="\\ufe0e\\ufe0f",s="["+e+"]",u="["+i+"]",f="\\ud83c[\\udffb-\\udfff]",d="(?:"+u+"|"+f+")",m="[^"+e+"]",v="(?:\\ud83c[\\udde6-\\uddff]){2}",g="[\\ud800-\\udbff][\\udc00-\\udfff]",x="\\u200d",j=d+"?",w="["+l+"]?",b="(?:"+x+"(?:"+[m,v,g].join("|")+")"+w+j+")*",_=w+j+b,O="(?:"+[m+u+"?",u,v,g,s].join("|")+")",E=RegExp(f+"(?="+f+")|"+O+_,"g");function C(A){return A.match(E)||[]}return pg=C,pg}var mg,c2;function l5(){if(c2)return mg;c2=1;var e=i5(),t=WR(),n=o5();function r(i){return t(i)?n(i):e(i)}return mg=r,mg}var vg,u2;function s5(){if(u2)return vg;u2=1;var e=a5(),t=WR(),n=l5(),r=VR();function i(l){return function(s){s=r(s);var u=t(s)?n(s):void 0,f=u?u[0]:s.charAt(0),d=u?e(u,1).join(""):s.slice(1);return f[l]()+d}}return vg=i,vg}var yg,f2;function c5(){if(f2)return yg;f2=1;var e=s5(),t=e("toUpperCase");return yg=t,yg}var u5=c5();const Vh=rt(u5);function bt(e){return function(){return e}}const ZR=Math.cos,Md=Math.sin,yr=Math.sqrt,Pd=Math.PI,Yh=2*Pd,Ex=Math.PI,Tx=2*Ex,Li=1e-6,f5=Tx-Li;function QR(e){this._+=e[0];for(let t=1,n=e.length;t<n;++t)this._+=arguments[t]+e[t]}function d5(e){let t=Math.floor(e);if(!(t>=0))throw new Error(`invalid digits: ${e}`);if(t>15)return QR;const n=10**t;return function(r){this._+=r[0];for(let i=1,l=r.length;i<l;++i)this._+=Math.round(arguments[i]*n)/n+r[i]}}class h5{constructor(t){this._x0=this._y0=this._x1=this._y1=null,this._="",this._append=t==null?QR:d5(t)}moveTo(t,n){this._append`M${this._x0=this._x1=+t},${this._y0=this._y1=+n}`}closePath(){this._x1!==null&&(this._x1=this._x0,this._y1=this._y0,this._append`Z`)}lineTo(t,n){this._append`L${this._x1=+t},${this._y1=+n}`}quadraticCurveTo(t,n,r,i){this._append`Q${+t},${+n},${this._x1=+r},${this._y1=+i}`}bezierCurveTo(t,n,r,i,l,s){this._append`C${+t},${+n},${+r},${+i},${this._x1=+l},${this._y1=+s}`}arcTo(t,n,r,i,l){if(t=+t,n=+n,r=+r,i=+i,l=+l,l<0)throw new Error(`negative radius: ${l}`);let s=this._x1,u=this._y1,f=r-t,d=i-n,m=s-t,v=u-n,g=m*m+v*v;if(this._x1===null)this._append`M${this._x1=t},${this._y1=n}`;else if(g>Li)if(!(Math.abs(v*f-d*m)>Li)||!l)this._append`L${this._x1=t},${this._y1=n}`;else{let x=r-s,j=i-u,w=f*f+d*d,b=x*x+j*j,_=Math.sqrt(w),O=Math.sqrt(g),E=l*Math.tan((Ex-Math.acos((w+g-b)/(2*_*O)))/2),C=E/O,A=E/_;Math.abs(C-1)>Li&&this._append`L${t+C*m},${n+C*v}`,this._append`A${l},${l},0,0,${+(v*x>m*j)},${this._x1=t+A*f},${this._y1=n+A*d}`}}arc(t,n,r,i,l,s){if(t=+t,n=+n,r=+r,s=!!s,r<0)throw new Error(`negative radius: ${r}`);let u=r*Math.cos(i),f=r*Math.sin(i),d=t+u,m=n+f,v=1^s,g=s?i-l:l-i;this._x1===null?this._append`M${d},${m}`:(Math.abs(this._x1-d)>Li||Math.abs(this._y1-m)>Li)&&this._append`L${d},${m}`,r&&(g<0&&(g=g%Tx+Tx),g>f5?this._append`A${r},${r},0,1,${v},${t-u},${n-f}A${r},${r},0,1,${v},${this._x1=d},${this._y1=m}`:g>Li&&this._append`A${r},${r},0,${+(g>=Ex)},${v},${this._x1=t+r*Math.cos(l)},${this._y1=n+r*Math.sin(l)}`)}rect(t,n,r,i){this._append`M${this._x0=this._x1=+t},${this._y0=this._y1=+n}h${r=+r}v${+i}h${-r}Z`}toString(){return this._}}function vw(e){let t=3;return e.digits=function(n){if(!arguments.length)return t;if(n==null)t=null;else{const r=Math.floor(n);if(!(r>=0))throw new RangeError(`invalid digits: ${n}`);t=r}return e},()=>new h5(t)}function yw(e){return typeof e=="object"&&"length"in e?e:Array.from(e)}function JR(e){this._context=e}JR.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._context.lineTo(e,t);break}}};function Kh(e){return new JR(e)}function eD(e){return e[0]}function tD(e){return e[1]}function nD(e,t){var n=bt(!0),r=null,i=Kh,l=null,s=vw(u);e=typeof e=="function"?e:e===void 0?eD:bt(e),t=typeof t=="function"?t:t===void 0?tD:bt(t);function u(f){var d,m=(f=yw(f)).length,v,g=!1,x;for(r==null&&(l=i(x=s())),d=0;d<=m;++d)!(d<m&&n(v=f[d],d,f))===g&&((g=!g)?l.lineStart():l.lineEnd()),g&&l.point(+e(v,d,f),+t(v,d,f));if(x)return l=null,x+""||null}return u.x=function(f){return arguments.length?(e=typeof f=="function"?f:bt(+f),u):e},u.y=function(f){return arguments.length?(t=typeof f=="function"?f:bt(+f),u):t},u.defined=function(f){return arguments.length?(n=typeof f=="function"?f:bt(!!f),u):n},u.curve=function(f){return arguments.length?(i=f,r!=null&&(l=i(r)),u):i},u.context=function(f){return arguments.length?(f==null?r=l=null:l=i(r=f),u):r},u}function ed(e,t,n){var r=null,i=bt(!0),l=null,s=Kh,u=null,f=vw(d);e=typeof e=="function"?e:e===void 0?eD:bt(+e),t=typeof t=="function"?t:bt(t===void 0?0:+t),n=typeof n=="function"?n:n===void 0?tD:bt(+n);function d(v){var g,x,j,w=(v=yw(v)).length,b,_=!1,O,E=new Array(w),C=new Array(w);for(l==null&&(u=s(O=f())),g=0;g<=w;++g){if(!(g<w&&i(b=v[g],g,v))===_)if(_=!_)x=g,u.areaStart(),u.lineStart();else{for(u.lineEnd(),u.lineStart(),j=g-1;j>=x;--j)u.point(E[j],C[j]);u.lineEnd(),u.areaEnd()}_&&(E[g]=+e(b,g,v),C[g]=+t(b,g,v),u.point(r?+r(b,g,v):E[g],n?+n(b,g,v):C[g]))}if(O)return u=null,O+""||null}function m(){return nD().defined(i).curve(s).context(l)}return d.x=function(v){return arguments.length?(e=typeof v=="function"?v:bt(+v),r=null,d):e},d.x0=function(v){return arguments.length?(e=typeof v=="function"?v:bt(+v),d):e},d.x1=function(v){return arguments.length?(r=v==null?null:typeof v=="function"?v:bt(+v),d):r},d.y=function(v){return arguments.length?(t=typeof v=="function"?v:bt(+v),n=null,d):t},d.y0=function(v){return arguments.length?(t=typeof v=="function"?v:bt(+v),d):t},d.y1=function(v){return arguments.length?(n=v==null?null:typeof v=="function"?v:bt(+v),d):n},d.lineX0=d.lineY0=function(){return m().x(e).y(t)},d.lineY1=function(){return m().x(e).y(n)},d.lineX1=function(){return m().x(r).y(t)},d.defined=function(v){return arguments.length?(i=typeof v=="function"?v:bt(!!v),d):i},d.curve=function(v){return arguments.length?(s=v,l!=null&&(u=s(l)),d):s},d.context=function(v){return arguments.length?(v==null?l=u=null:u=s(l=v),d):l},d}class rD{constructor(t,n){this._context=t,this._x=n}areaStart(){this._line=0}areaEnd(){this._line=NaN}lineStart(){this._point=0}lineEnd(){(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line}point(t,n){switch(t=+t,n=+n,this._point){case 0:{this._point=1,this._line?this._context.lineTo(t,n):this._context.moveTo(t,n);break}case 1:this._point=2;default:{this._x?this._context.bezierCurveTo(this._x0=(this._x0+t)/2,this._y0,this._x0,n,t,n):this._context.bezierCurveTo(this._x0,this._y0=(this._y0+n)/2,t,this._y0,t,n);break}}this._x0=t,this._y0=n}}function p5(e){return new rD(e,!0)}function m5(e){return new rD(e,!1)}const gw={draw(e,t){const n=yr(t/Pd);e.moveTo(n,0),e.arc(0,0,n,0,Yh)}},v5={draw(e,t){const n=yr(t/5)/2;e.moveTo(-3*n,-n),e.lineTo(-n,-n),e.lineTo(-n,-3*n),e.lineTo(n,-3*n),e.lineTo(n,-n),e.lineTo(3*n,-n),e.lineTo(3*n,n),e.lineTo(n,n),e.lineTo(n,3*n),e.lineTo(-n,3*n),e.lineTo(-n,n),e.lineTo(-3*n,n),e.closePath()}},aD=yr(1/3),y5=aD*2,g5={draw(e,t){const n=yr(t/y5),r=n*aD;e.moveTo(0,-n),e.lineTo(r,0),e.lineTo(0,n),e.lineTo(-r,0),e.closePath()}},b5={draw(e,t){const n=yr(t),r=-n/2;e.rect(r,r,n,n)}},x5=.8908130915292852,iD=Md(Pd/10)/Md(7*Pd/10),w5=Md(Yh/10)*iD,S5=-ZR(Yh/10)*iD,j5={draw(e,t){const n=yr(t*x5),r=w5*n,i=S5*n;e.moveTo(0,-n),e.lineTo(r,i);for(let l=1;l<5;++l){const s=Yh*l/5,u=ZR(s),f=Md(s);e.lineTo(f*n,-u*n),e.lineTo(u*r-f*i,f*r+u*i)}e.closePath()}},gg=yr(3),O5={draw(e,t){const n=-yr(t/(gg*3));e.moveTo(0,n*2),e.lineTo(-gg*n,-n),e.lineTo(gg*n,-n),e.closePath()}},Wn=-.5,Zn=yr(3)/2,Cx=1/yr(12),_5=(Cx/2+1)*3,A5={draw(e,t){const n=yr(t/_5),r=n/2,i=n*Cx,l=r,s=n*Cx+n,u=-l,f=s;e.moveTo(r,i),e.lineTo(l,s),e.lineTo(u,f),e.lineTo(Wn*r-Zn*i,Zn*r+Wn*i),e.lineTo(Wn*l-Zn*s,Zn*l+Wn*s),e.lineTo(Wn*u-Zn*f,Zn*u+Wn*f),e.lineTo(Wn*r+Zn*i,Wn*i-Zn*r),e.lineTo(Wn*l+Zn*s,Wn*s-Zn*l),e.lineTo(Wn*u+Zn*f,Wn*f-Zn*u),e.closePath()}};function E5(e,t){let n=null,r=vw(i);e=typeof e=="function"?e:bt(e||gw),t=typeof t=="function"?t:bt(t===void 0?64:+t);function i(){let l;if(n||(n=l=r()),e.apply(this,arguments).draw(n,+t.apply(this,arguments)),l)return n=null,l+""||null}return i.type=function(l){return arguments.length?(e=typeof l=="function"?l:bt(l),i):e},i.size=function(l){return arguments.length?(t=typeof l=="function"?l:bt(+l),i):t},i.context=function(l){return arguments.length?(n=l??null,i):n},i}function Rd(){}function Dd(e,t,n){e._context.bezierCurveTo((2*e._x0+e._x1)/3,(2*e._y0+e._y1)/3,(e._x0+2*e._x1)/3,(e._y0+2*e._y1)/3,(e._x0+4*e._x1+t)/6,(e._y0+4*e._y1+n)/6)}function oD(e){this._context=e}oD.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){switch(this._point){case 3:Dd(this,this._x1,this._y1);case 2:this._context.lineTo(this._x1,this._y1);break}(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,this._context.lineTo((5*this._x0+this._x1)/6,(5*this._y0+this._y1)/6);default:Dd(this,e,t);break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};function T5(e){return new oD(e)}function lD(e){this._context=e}lD.prototype={areaStart:Rd,areaEnd:Rd,lineStart:function(){this._x0=this._x1=this._x2=this._x3=this._x4=this._y0=this._y1=this._y2=this._y3=this._y4=NaN,this._point=0},lineEnd:function(){switch(this._point){case 1:{this._context.moveTo(this._x2,this._y2),this._context.closePath();break}case 2:{this._context.moveTo((this._x2+2*this._x3)/3,(this._y2+2*this._y3)/3),this._context.lineTo((this._x3+2*this._x2)/3,(this._y3+2*this._y2)/3),this._context.closePath();break}case 3:{this.point(this._x2,this._y2),this.point(this._x3,this._y3),this.point(this._x4,this._y4);break}}},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._x2=e,this._y2=t;break;case 1:this._point=2,this._x3=e,this._y3=t;break;case 2:this._point=3,this._x4=e,this._y4=t,this._context.moveTo((this._x0+4*this._x1+e)/6,(this._y0+4*this._y1+t)/6);break;default:Dd(this,e,t);break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};function C5(e){return new lD(e)}function sD(e){this._context=e}sD.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=NaN,this._point=0},lineEnd:function(){(this._line||this._line!==0&&this._point===3)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1;break;case 1:this._point=2;break;case 2:this._point=3;var n=(this._x0+4*this._x1+e)/6,r=(this._y0+4*this._y1+t)/6;this._line?this._context.lineTo(n,r):this._context.moveTo(n,r);break;case 3:this._point=4;default:Dd(this,e,t);break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t}};function N5(e){return new sD(e)}function cD(e){this._context=e}cD.prototype={areaStart:Rd,areaEnd:Rd,lineStart:function(){this._point=0},lineEnd:function(){this._point&&this._context.closePath()},point:function(e,t){e=+e,t=+t,this._point?this._context.lineTo(e,t):(this._point=1,this._context.moveTo(e,t))}};function M5(e){return new cD(e)}function d2(e){return e<0?-1:1}function h2(e,t,n){var r=e._x1-e._x0,i=t-e._x1,l=(e._y1-e._y0)/(r||i<0&&-0),s=(n-e._y1)/(i||r<0&&-0),u=(l*i+s*r)/(r+i);return(d2(l)+d2(s))*Math.min(Math.abs(l),Math.abs(s),.5*Math.abs(u))||0}function p2(e,t){var n=e._x1-e._x0;return n?(3*(e._y1-e._y0)/n-t)/2:t}function bg(e,t,n){var r=e._x0,i=e._y0,l=e._x1,s=e._y1,u=(l-r)/3;e._context.bezierCurveTo(r+u,i+u*t,l-u,s-u*n,l,s)}function kd(e){this._context=e}kd.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x0=this._x1=this._y0=this._y1=this._t0=NaN,this._point=0},lineEnd:function(){switch(this._point){case 2:this._context.lineTo(this._x1,this._y1);break;case 3:bg(this,this._t0,p2(this,this._t0));break}(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line=1-this._line},point:function(e,t){var n=NaN;if(e=+e,t=+t,!(e===this._x1&&t===this._y1)){switch(this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;break;case 2:this._point=3,bg(this,p2(this,n=h2(this,e,t)),n);break;default:bg(this,this._t0,n=h2(this,e,t));break}this._x0=this._x1,this._x1=e,this._y0=this._y1,this._y1=t,this._t0=n}}};function uD(e){this._context=new fD(e)}(uD.prototype=Object.create(kd.prototype)).point=function(e,t){kd.prototype.point.call(this,t,e)};function fD(e){this._context=e}fD.prototype={moveTo:function(e,t){this._context.moveTo(t,e)},closePath:function(){this._context.closePath()},lineTo:function(e,t){this._context.lineTo(t,e)},bezierCurveTo:function(e,t,n,r,i,l){this._context.bezierCurveTo(t,e,r,n,l,i)}};function P5(e){return new kd(e)}function R5(e){return new uD(e)}function dD(e){this._context=e}dD.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=[],this._y=[]},lineEnd:function(){var e=this._x,t=this._y,n=e.length;if(n)if(this._line?this._context.lineTo(e[0],t[0]):this._context.moveTo(e[0],t[0]),n===2)this._context.lineTo(e[1],t[1]);else for(var r=m2(e),i=m2(t),l=0,s=1;s<n;++l,++s)this._context.bezierCurveTo(r[0][l],i[0][l],r[1][l],i[1][l],e[s],t[s]);(this._line||this._line!==0&&n===1)&&this._context.closePath(),this._line=1-this._line,this._x=this._y=null},point:function(e,t){this._x.push(+e),this._y.push(+t)}};function m2(e){var t,n=e.length-1,r,i=new Array(n),l=new Array(n),s=new Array(n);for(i[0]=0,l[0]=2,s[0]=e[0]+2*e[1],t=1;t<n-1;++t)i[t]=1,l[t]=4,s[t]=4*e[t]+2*e[t+1];for(i[n-1]=2,l[n-1]=7,s[n-1]=8*e[n-1]+e[n],t=1;t<n;++t)r=i[t]/l[t-1],l[t]-=r,s[t]-=r*s[t-1];for(i[n-1]=s[n-1]/l[n-1],t=n-2;t>=0;--t)i[t]=(s[t]-i[t+1])/l[t];for(l[n-1]=(e[n]+i[n-1])/2,t=0;t<n-1;++t)l[t]=2*e[t+1]-i[t+1];return[i,l]}function D5(e){return new dD(e)}function Xh(e,t){this._context=e,this._t=t}Xh.prototype={areaStart:function(){this._line=0},areaEnd:function(){this._line=NaN},lineStart:function(){this._x=this._y=NaN,this._point=0},lineEnd:function(){0<this._t&&this._t<1&&this._point===2&&this._context.lineTo(this._x,this._y),(this._line||this._line!==0&&this._point===1)&&this._context.closePath(),this._line>=0&&(this._t=1-this._t,this._line=1-this._line)},point:function(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:{if(this._t<=0)this._context.lineTo(this._x,t),this._context.lineTo(e,t);else{var n=this._x*(1-this._t)+e*this._t;this._context.lineTo(n,this._y),this._context.lineTo(n,t)}break}}this._x=e,this._y=t}};function k5(e){return new Xh(e,.5)}function $5(e){return new Xh(e,0)}function L5(e){return new Xh(e,1)}function _l(e,t){if((s=e.length)>1)for(var n=1,r,i,l=e[t[0]],s,u=l.length;n<s;++n)for(i=l,l=e[t[n]],r=0;r<u;++r)l[r][1]+=l[r][0]=isNaN(i[r][1])?i[r][0]:i[r][1]}function Nx(e){for(var t=e.length,n=new Array(t);--t>=0;)n[t]=t;return n}function I5(e,t){return e[t]}function q5(e){const t=[];return t.key=e,t}function B5(){var e=bt([]),t=Nx,n=_l,r=I5;function i(l){var s=Array.from(e.apply(this,arguments),q5),u,f=s.length,d=-1,m;for(const v of l)for(u=0,++d;u<f;++u)(s[u][d]=[0,+r(v,s[u].key,d,l)]).data=v;for(u=0,m=yw(t(s));u<f;++u)s[m[u]].index=u;return n(s,m),s}return i.keys=function(l){return arguments.length?(e=typeof l=="function"?l:bt(Array.from(l)),i):e},i.value=function(l){return arguments.length?(r=typeof l=="function"?l:bt(+l),i):r},i.order=function(l){return arguments.length?(t=l==null?Nx:typeof l=="function"?l:bt(Array.from(l)),i):t},i.offset=function(l){return arguments.length?(n=l??_l,i):n},i}function z5(e,t){if((r=e.length)>0){for(var n,r,i=0,l=e[0].length,s;i<l;++i){for(s=n=0;n<r;++n)s+=e[n][i][1]||0;if(s)for(n=0;n<r;++n)e[n][i][1]/=s}_l(e,t)}}function U5(e,t){if((i=e.length)>0){for(var n=0,r=e[t[0]],i,l=r.length;n<l;++n){for(var s=0,u=0;s<i;++s)u+=e[s][n][1]||0;r[n][1]+=r[n][0]=-u/2}_l(e,t)}}function H5(e,t){if(!(!((s=e.length)>0)||!((l=(i=e[t[0]]).length)>0))){for(var n=0,r=1,i,l,s;r<l;++r){for(var u=0,f=0,d=0;u<s;++u){for(var m=e[t[u]],v=m[r][1]||0,g=m[r-1][1]||0,x=(v-g)/2,j=0;j<u;++j){var w=e[t[j]],b=w[r][1]||0,_=w[r-1][1]||0;x+=b-_}f+=v,d+=x*v}i[r-1][1]+=i[r-1][0]=n,f&&(n-=d/f)}i[r-1][1]+=i[r-1][0]=n,_l(e,t)}}function $c(e){"@babel/helpers - typeof";return $c=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},$c(e)}var F5=["type","size","sizeType"];function Mx(){return Mx=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Mx.apply(this,arguments)}function v2(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function y2(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?v2(Object(n),!0).forEach(function(r){G5(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):v2(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function G5(e,t,n){return t=V5(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function V5(e){var t=Y5(e,"string");return $c(t)=="symbol"?t:t+""}function Y5(e,t){if($c(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if($c(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function K5(e,t){if(e==null)return{};var n=X5(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function X5(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}var hD={symbolCircle:gw,symbolCross:v5,symbolDiamond:g5,symbolSquare:b5,symbolStar:j5,symbolTriangle:O5,symbolWye:A5},W5=Math.PI/180,Z5=function(t){var n="symbol".concat(Vh(t));return hD[n]||gw},Q5=function(t,n,r){if(n==="area")return t;switch(r){case"cross":return 5*t*t/9;case"diamond":return .5*t*t/Math.sqrt(3);case"square":return t*t;case"star":{var i=18*W5;return 1.25*t*t*(Math.tan(i)-Math.tan(i*2)*Math.pow(Math.tan(i),2))}case"triangle":return Math.sqrt(3)*t*t/4;case"wye":return(21-10*Math.sqrt(3))*t*t/8;default:return Math.PI*t*t/4}},J5=function(t,n){hD["symbol".concat(Vh(t))]=n},bw=function(t){var n=t.type,r=n===void 0?"circle":n,i=t.size,l=i===void 0?64:i,s=t.sizeType,u=s===void 0?"area":s,f=K5(t,F5),d=y2(y2({},f),{},{type:r,size:l,sizeType:u}),m=function(){var b=Z5(r),_=E5().type(b).size(Q5(l,u,r));return _()},v=d.className,g=d.cx,x=d.cy,j=Me(d,!0);return g===+g&&x===+x&&l===+l?z.createElement("path",Mx({},j,{className:qe("recharts-symbols",v),transform:"translate(".concat(g,", ").concat(x,")"),d:m()})):null};bw.registerSymbol=J5;function Al(e){"@babel/helpers - typeof";return Al=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Al(e)}function Px(){return Px=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Px.apply(this,arguments)}function g2(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function eU(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?g2(Object(n),!0).forEach(function(r){Lc(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):g2(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function tU(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function nU(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,mD(r.key),r)}}function rU(e,t,n){return t&&nU(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e}function aU(e,t,n){return t=$d(t),iU(e,pD()?Reflect.construct(t,n||[],$d(e).constructor):t.apply(e,n))}function iU(e,t){if(t&&(Al(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return oU(e)}function oU(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function pD(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(pD=function(){return!!e})()}function $d(e){return $d=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},$d(e)}function lU(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&Rx(e,t)}function Rx(e,t){return Rx=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},Rx(e,t)}function Lc(e,t,n){return t=mD(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function mD(e){var t=sU(e,"string");return Al(t)=="symbol"?t:t+""}function sU(e,t){if(Al(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Al(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}var lr=32,xw=function(e){function t(){return tU(this,t),aU(this,t,arguments)}return lU(t,e),rU(t,[{key:"renderIcon",value:function(r){var i=this.props.inactiveColor,l=lr/2,s=lr/6,u=lr/3,f=r.inactive?i:r.color;if(r.type==="plainline")return z.createElement("line",{strokeWidth:4,fill:"none",stroke:f,strokeDasharray:r.payload.strokeDasharray,x1:0,y1:l,x2:lr,y2:l,className:"recharts-legend-icon"});if(r.type==="line")return z.createElement("path",{strokeWidth:4,fill:"none",stroke:f,d:"M0,".concat(l,"h").concat(u,`
-            A`).concat(s,",").concat(s,",0,1,1,").concat(2*u,",").concat(l,`
-            H`).concat(lr,"M").concat(2*u,",").concat(l,`
-            A`).concat(s,",").concat(s,",0,1,1,").concat(u,",").concat(l),className:"recharts-legend-icon"});if(r.type==="rect")return z.createElement("path",{stroke:"none",fill:f,d:"M0,".concat(lr/8,"h").concat(lr,"v").concat(lr*3/4,"h").concat(-32,"z"),className:"recharts-legend-icon"});if(z.isValidElement(r.legendIcon)){var d=eU({},r);return delete d.legendIcon,z.cloneElement(r.legendIcon,d)}return z.createElement(bw,{fill:f,cx:l,cy:l,size:lr,sizeType:"diameter",type:r.type})}},{key:"renderItems",value:function(){var r=this,i=this.props,l=i.payload,s=i.iconSize,u=i.layout,f=i.formatter,d=i.inactiveColor,m={x:0,y:0,width:lr,height:lr},v={display:u==="horizontal"?"inline-block":"block",marginRight:10},g={display:"inline-block",verticalAlign:"middle",marginRight:4};return l.map(function(x,j){var w=x.formatter||f,b=qe(Lc(Lc({"recharts-legend-item":!0},"legend-item-".concat(j),!0),"inactive",x.inactive));if(x.type==="none")return null;var _=Re(x.value)?null:x.value;pr(!Re(x.value),`The name property is also required when using a function for the dataKey of a chart's cartesian components. Ex: <Bar name="Name of my Data"/>`);var O=x.inactive?d:x.color;return z.createElement("li",Px({className:b,style:v,key:"legend-item-".concat(j)},Wi(r.props,x,j)),z.createElement(_x,{width:s,height:s,viewBox:m,style:g},r.renderIcon(x)),z.createElement("span",{className:"recharts-legend-item-text",style:{color:O}},w?w(_,x,j):_))})}},{key:"render",value:function(){var r=this.props,i=r.payload,l=r.layout,s=r.align;if(!i||!i.length)return null;var u={padding:0,margin:0,textAlign:l==="horizontal"?s:"left"};return z.createElement("ul",{className:"recharts-default-legend",style:u},this.renderItems())}}])}(T.PureComponent);Lc(xw,"displayName","Legend");Lc(xw,"defaultProps",{iconSize:14,layout:"horizontal",align:"center",verticalAlign:"middle",inactiveColor:"#ccc"});var xg,b2;function cU(){if(b2)return xg;b2=1;var e=Hh();function t(){this.__data__=new e,this.size=0}return xg=t,xg}var wg,x2;function uU(){if(x2)return wg;x2=1;function e(t){var n=this.__data__,r=n.delete(t);return this.size=n.size,r}return wg=e,wg}var Sg,w2;function fU(){if(w2)return Sg;w2=1;function e(t){return this.__data__.get(t)}return Sg=e,Sg}var jg,S2;function dU(){if(S2)return jg;S2=1;function e(t){return this.__data__.has(t)}return jg=e,jg}var Og,j2;function hU(){if(j2)return Og;j2=1;var e=Hh(),t=uw(),n=fw(),r=200;function i(l,s){var u=this.__data__;if(u instanceof e){var f=u.__data__;if(!t||f.length<r-1)return f.push([l,s]),this.size=++u.size,this;u=this.__data__=new n(f)}return u.set(l,s),this.size=u.size,this}return Og=i,Og}var _g,O2;function vD(){if(O2)return _g;O2=1;var e=Hh(),t=cU(),n=uU(),r=fU(),i=dU(),l=hU();function s(u){var f=this.__data__=new e(u);this.size=f.size}return s.prototype.clear=t,s.prototype.delete=n,s.prototype.get=r,s.prototype.has=i,s.prototype.set=l,_g=s,_g}var Ag,_2;function pU(){if(_2)return Ag;_2=1;var e="__lodash_hash_undefined__";function t(n){return this.__data__.set(n,e),this}return Ag=t,Ag}var Eg,A2;function mU(){if(A2)return Eg;A2=1;function e(t){return this.__data__.has(t)}return Eg=e,Eg}var Tg,E2;function yD(){if(E2)return Tg;E2=1;var e=fw(),t=pU(),n=mU();function r(i){var l=-1,s=i==null?0:i.length;for(this.__data__=new e;++l<s;)this.add(i[l])}return r.prototype.add=r.prototype.push=t,r.prototype.has=n,Tg=r,Tg}var Cg,T2;function gD(){if(T2)return Cg;T2=1;function e(t,n){for(var r=-1,i=t==null?0:t.length;++r<i;)if(n(t[r],r,t))return!0;return!1}return Cg=e,Cg}var Ng,C2;function bD(){if(C2)return Ng;C2=1;function e(t,n){return t.has(n)}return Ng=e,Ng}var Mg,N2;function xD(){if(N2)return Mg;N2=1;var e=yD(),t=gD(),n=bD(),r=1,i=2;function l(s,u,f,d,m,v){var g=f&r,x=s.length,j=u.length;if(x!=j&&!(g&&j>x))return!1;var w=v.get(s),b=v.get(u);if(w&&b)return w==u&&b==s;var _=-1,O=!0,E=f&i?new e:void 0;for(v.set(s,u),v.set(u,s);++_<x;){var C=s[_],A=u[_];if(d)var N=g?d(A,C,_,u,s,v):d(C,A,_,s,u,v);if(N!==void 0){if(N)continue;O=!1;break}if(E){if(!t(u,function(P,D){if(!n(E,D)&&(C===P||m(C,P,f,d,v)))return E.push(D)})){O=!1;break}}else if(!(C===A||m(C,A,f,d,v))){O=!1;break}}return v.delete(s),v.delete(u),O}return Mg=l,Mg}var Pg,M2;function vU(){if(M2)return Pg;M2=1;var e=Rr(),t=e.Uint8Array;return Pg=t,Pg}var Rg,P2;function yU(){if(P2)return Rg;P2=1;function e(t){var n=-1,r=Array(t.size);return t.forEach(function(i,l){r[++n]=[l,i]}),r}return Rg=e,Rg}var Dg,R2;function ww(){if(R2)return Dg;R2=1;function e(t){var n=-1,r=Array(t.size);return t.forEach(function(i){r[++n]=i}),r}return Dg=e,Dg}var kg,D2;function gU(){if(D2)return kg;D2=1;var e=ju(),t=vU(),n=cw(),r=xD(),i=yU(),l=ww(),s=1,u=2,f="[object Boolean]",d="[object Date]",m="[object Error]",v="[object Map]",g="[object Number]",x="[object RegExp]",j="[object Set]",w="[object String]",b="[object Symbol]",_="[object ArrayBuffer]",O="[object DataView]",E=e?e.prototype:void 0,C=E?E.valueOf:void 0;function A(N,P,D,L,G,I,H){switch(D){case O:if(N.byteLength!=P.byteLength||N.byteOffset!=P.byteOffset)return!1;N=N.buffer,P=P.buffer;case _:return!(N.byteLength!=P.byteLength||!I(new t(N),new t(P)));case f:case d:case g:return n(+N,+P);case m:return N.name==P.name&&N.message==P.message;case x:case w:return N==P+"";case v:var V=i;case j:var Z=L&s;if(V||(V=l),N.size!=P.size&&!Z)return!1;var Y=H.get(N);if(Y)return Y==P;L|=u,H.set(N,P);var $=r(V(N),V(P),L,G,I,H);return H.delete(N),$;case b:if(C)return C.call(N)==C.call(P)}return!1}return kg=A,kg}var $g,k2;function wD(){if(k2)return $g;k2=1;function e(t,n){for(var r=-1,i=n.length,l=t.length;++r<i;)t[l+r]=n[r];return t}return $g=e,$g}var Lg,$2;function bU(){if($2)return Lg;$2=1;var e=wD(),t=jn();function n(r,i,l){var s=i(r);return t(r)?s:e(s,l(r))}return Lg=n,Lg}var Ig,L2;function xU(){if(L2)return Ig;L2=1;function e(t,n){for(var r=-1,i=t==null?0:t.length,l=0,s=[];++r<i;){var u=t[r];n(u,r,t)&&(s[l++]=u)}return s}return Ig=e,Ig}var qg,I2;function wU(){if(I2)return qg;I2=1;function e(){return[]}return qg=e,qg}var Bg,q2;function SU(){if(q2)return Bg;q2=1;var e=xU(),t=wU(),n=Object.prototype,r=n.propertyIsEnumerable,i=Object.getOwnPropertySymbols,l=i?function(s){return s==null?[]:(s=Object(s),e(i(s),function(u){return r.call(s,u)}))}:t;return Bg=l,Bg}var zg,B2;function jU(){if(B2)return zg;B2=1;function e(t,n){for(var r=-1,i=Array(t);++r<t;)i[r]=n(r);return i}return zg=e,zg}var Ug,z2;function OU(){if(z2)return Ug;z2=1;var e=xa(),t=wa(),n="[object Arguments]";function r(i){return t(i)&&e(i)==n}return Ug=r,Ug}var Hg,U2;function Sw(){if(U2)return Hg;U2=1;var e=OU(),t=wa(),n=Object.prototype,r=n.hasOwnProperty,i=n.propertyIsEnumerable,l=e(function(){return arguments}())?e:function(s){return t(s)&&r.call(s,"callee")&&!i.call(s,"callee")};return Hg=l,Hg}var jc={exports:{}},Fg,H2;function _U(){if(H2)return Fg;H2=1;function e(){return!1}return Fg=e,Fg}jc.exports;var F2;function SD(){return F2||(F2=1,function(e,t){var n=Rr(),r=_U(),i=t&&!t.nodeType&&t,l=i&&!0&&e&&!e.nodeType&&e,s=l&&l.exports===i,u=s?n.Buffer:void 0,f=u?u.isBuffer:void 0,d=f||r;e.exports=d}(jc,jc.exports)),jc.exports}var Gg,G2;function jw(){if(G2)return Gg;G2=1;var e=9007199254740991,t=/^(?:0|[1-9]\d*)$/;function n(r,i){var l=typeof r;return i=i??e,!!i&&(l=="number"||l!="symbol"&&t.test(r))&&r>-1&&r%1==0&&r<i}return Gg=n,Gg}var Vg,V2;function Ow(){if(V2)return Vg;V2=1;var e=9007199254740991;function t(n){return typeof n=="number"&&n>-1&&n%1==0&&n<=e}return Vg=t,Vg}var Yg,Y2;function AU(){if(Y2)return Yg;Y2=1;var e=xa(),t=Ow(),n=wa(),r="[object Arguments]",i="[object Array]",l="[object Boolean]",s="[object Date]",u="[object Error]",f="[object Function]",d="[object Map]",m="[object Number]",v="[object Object]",g="[object RegExp]",x="[object Set]",j="[object String]",w="[object WeakMap]",b="[object ArrayBuffer]",_="[object DataView]",O="[object Float32Array]",E="[object Float64Array]",C="[object Int8Array]",A="[object Int16Array]",N="[object Int32Array]",P="[object Uint8Array]",D="[object Uint8ClampedArray]",L="[object Uint16Array]",G="[object Uint32Array]",I={};I[O]=I[E]=I[C]=I[A]=I[N]=I[P]=I[D]=I[L]=I[G]=!0,I[r]=I[i]=I[b]=I[l]=I[_]=I[s]=I[u]=I[f]=I[d]=I[m]=I[v]=I[g]=I[x]=I[j]=I[w]=!1;function H(V){return n(V)&&t(V.length)&&!!I[e(V)]}return Yg=H,Yg}var Kg,K2;function jD(){if(K2)return Kg;K2=1;function e(t){return function(n){return t(n)}}return Kg=e,Kg}var Oc={exports:{}};Oc.exports;var X2;function EU(){return X2||(X2=1,function(e,t){var n=HR(),r=t&&!t.nodeType&&t,i=r&&!0&&e&&!e.nodeType&&e,l=i&&i.exports===r,s=l&&n.process,u=function(){try{var f=i&&i.require&&i.require("util").types;return f||s&&s.binding&&s.binding("util")}catch{}}();e.exports=u}(Oc,Oc.exports)),Oc.exports}var Xg,W2;function OD(){if(W2)return Xg;W2=1;var e=AU(),t=jD(),n=EU(),r=n&&n.isTypedArray,i=r?t(r):e;return Xg=i,Xg}var Wg,Z2;function TU(){if(Z2)return Wg;Z2=1;var e=jU(),t=Sw(),n=jn(),r=SD(),i=jw(),l=OD(),s=Object.prototype,u=s.hasOwnProperty;function f(d,m){var v=n(d),g=!v&&t(d),x=!v&&!g&&r(d),j=!v&&!g&&!x&&l(d),w=v||g||x||j,b=w?e(d.length,String):[],_=b.length;for(var O in d)(m||u.call(d,O))&&!(w&&(O=="length"||x&&(O=="offset"||O=="parent")||j&&(O=="buffer"||O=="byteLength"||O=="byteOffset")||i(O,_)))&&b.push(O);return b}return Wg=f,Wg}var Zg,Q2;function CU(){if(Q2)return Zg;Q2=1;var e=Object.prototype;function t(n){var r=n&&n.constructor,i=typeof r=="function"&&r.prototype||e;return n===i}return Zg=t,Zg}var Qg,J2;function _D(){if(J2)return Qg;J2=1;function e(t,n){return function(r){return t(n(r))}}return Qg=e,Qg}var Jg,eT;function NU(){if(eT)return Jg;eT=1;var e=_D(),t=e(Object.keys,Object);return Jg=t,Jg}var eb,tT;function MU(){if(tT)return eb;tT=1;var e=CU(),t=NU(),n=Object.prototype,r=n.hasOwnProperty;function i(l){if(!e(l))return t(l);var s=[];for(var u in Object(l))r.call(l,u)&&u!="constructor"&&s.push(u);return s}return eb=i,eb}var tb,nT;function Au(){if(nT)return tb;nT=1;var e=sw(),t=Ow();function n(r){return r!=null&&t(r.length)&&!e(r)}return tb=n,tb}var nb,rT;function Wh(){if(rT)return nb;rT=1;var e=TU(),t=MU(),n=Au();function r(i){return n(i)?e(i):t(i)}return nb=r,nb}var rb,aT;function PU(){if(aT)return rb;aT=1;var e=bU(),t=SU(),n=Wh();function r(i){return e(i,n,t)}return rb=r,rb}var ab,iT;function RU(){if(iT)return ab;iT=1;var e=PU(),t=1,n=Object.prototype,r=n.hasOwnProperty;function i(l,s,u,f,d,m){var v=u&t,g=e(l),x=g.length,j=e(s),w=j.length;if(x!=w&&!v)return!1;for(var b=x;b--;){var _=g[b];if(!(v?_ in s:r.call(s,_)))return!1}var O=m.get(l),E=m.get(s);if(O&&E)return O==s&&E==l;var C=!0;m.set(l,s),m.set(s,l);for(var A=v;++b<x;){_=g[b];var N=l[_],P=s[_];if(f)var D=v?f(P,N,_,s,l,m):f(N,P,_,l,s,m);if(!(D===void 0?N===P||d(N,P,u,f,m):D)){C=!1;break}A||(A=_=="constructor")}if(C&&!A){var L=l.constructor,G=s.constructor;L!=G&&"constructor"in l&&"constructor"in s&&!(typeof L=="function"&&L instanceof L&&typeof G=="function"&&G instanceof G)&&(C=!1)}return m.delete(l),m.delete(s),C}return ab=i,ab}var ib,oT;function DU(){if(oT)return ib;oT=1;var e=io(),t=Rr(),n=e(t,"DataView");return ib=n,ib}var ob,lT;function kU(){if(lT)return ob;lT=1;var e=io(),t=Rr(),n=e(t,"Promise");return ob=n,ob}var lb,sT;function AD(){if(sT)return lb;sT=1;var e=io(),t=Rr(),n=e(t,"Set");return lb=n,lb}var sb,cT;function $U(){if(cT)return sb;cT=1;var e=io(),t=Rr(),n=e(t,"WeakMap");return sb=n,sb}var cb,uT;function LU(){if(uT)return cb;uT=1;var e=DU(),t=uw(),n=kU(),r=AD(),i=$U(),l=xa(),s=FR(),u="[object Map]",f="[object Object]",d="[object Promise]",m="[object Set]",v="[object WeakMap]",g="[object DataView]",x=s(e),j=s(t),w=s(n),b=s(r),_=s(i),O=l;return(e&&O(new e(new ArrayBuffer(1)))!=g||t&&O(new t)!=u||n&&O(n.resolve())!=d||r&&O(new r)!=m||i&&O(new i)!=v)&&(O=function(E){var C=l(E),A=C==f?E.constructor:void 0,N=A?s(A):"";if(N)switch(N){case x:return g;case j:return u;case w:return d;case b:return m;case _:return v}return C}),cb=O,cb}var ub,fT;function IU(){if(fT)return ub;fT=1;var e=vD(),t=xD(),n=gU(),r=RU(),i=LU(),l=jn(),s=SD(),u=OD(),f=1,d="[object Arguments]",m="[object Array]",v="[object Object]",g=Object.prototype,x=g.hasOwnProperty;function j(w,b,_,O,E,C){var A=l(w),N=l(b),P=A?m:i(w),D=N?m:i(b);P=P==d?v:P,D=D==d?v:D;var L=P==v,G=D==v,I=P==D;if(I&&s(w)){if(!s(b))return!1;A=!0,L=!1}if(I&&!L)return C||(C=new e),A||u(w)?t(w,b,_,O,E,C):n(w,b,P,_,O,E,C);if(!(_&f)){var H=L&&x.call(w,"__wrapped__"),V=G&&x.call(b,"__wrapped__");if(H||V){var Z=H?w.value():w,Y=V?b.value():b;return C||(C=new e),E(Z,Y,_,O,C)}}return I?(C||(C=new e),r(w,b,_,O,E,C)):!1}return ub=j,ub}var fb,dT;function _w(){if(dT)return fb;dT=1;var e=IU(),t=wa();function n(r,i,l,s,u){return r===i?!0:r==null||i==null||!t(r)&&!t(i)?r!==r&&i!==i:e(r,i,l,s,n,u)}return fb=n,fb}var db,hT;function qU(){if(hT)return db;hT=1;var e=vD(),t=_w(),n=1,r=2;function i(l,s,u,f){var d=u.length,m=d,v=!f;if(l==null)return!m;for(l=Object(l);d--;){var g=u[d];if(v&&g[2]?g[1]!==l[g[0]]:!(g[0]in l))return!1}for(;++d<m;){g=u[d];var x=g[0],j=l[x],w=g[1];if(v&&g[2]){if(j===void 0&&!(x in l))return!1}else{var b=new e;if(f)var _=f(j,w,x,l,s,b);if(!(_===void 0?t(w,j,n|r,f,b):_))return!1}}return!0}return db=i,db}var hb,pT;function ED(){if(pT)return hb;pT=1;var e=si();function t(n){return n===n&&!e(n)}return hb=t,hb}var pb,mT;function BU(){if(mT)return pb;mT=1;var e=ED(),t=Wh();function n(r){for(var i=t(r),l=i.length;l--;){var s=i[l],u=r[s];i[l]=[s,u,e(u)]}return i}return pb=n,pb}var mb,vT;function TD(){if(vT)return mb;vT=1;function e(t,n){return function(r){return r==null?!1:r[t]===n&&(n!==void 0||t in Object(r))}}return mb=e,mb}var vb,yT;function zU(){if(yT)return vb;yT=1;var e=qU(),t=BU(),n=TD();function r(i){var l=t(i);return l.length==1&&l[0][2]?n(l[0][0],l[0][1]):function(s){return s===i||e(s,i,l)}}return vb=r,vb}var yb,gT;function UU(){if(gT)return yb;gT=1;function e(t,n){return t!=null&&n in Object(t)}return yb=e,yb}var gb,bT;function HU(){if(bT)return gb;bT=1;var e=YR(),t=Sw(),n=jn(),r=jw(),i=Ow(),l=Gh();function s(u,f,d){f=e(f,u);for(var m=-1,v=f.length,g=!1;++m<v;){var x=l(f[m]);if(!(g=u!=null&&d(u,x)))break;u=u[x]}return g||++m!=v?g:(v=u==null?0:u.length,!!v&&i(v)&&r(x,v)&&(n(u)||t(u)))}return gb=s,gb}var bb,xT;function FU(){if(xT)return bb;xT=1;var e=UU(),t=HU();function n(r,i){return r!=null&&t(r,i,e)}return bb=n,bb}var xb,wT;function GU(){if(wT)return xb;wT=1;var e=_w(),t=KR(),n=FU(),r=lw(),i=ED(),l=TD(),s=Gh(),u=1,f=2;function d(m,v){return r(m)&&i(v)?l(s(m),v):function(g){var x=t(g,m);return x===void 0&&x===v?n(g,m):e(v,x,u|f)}}return xb=d,xb}var wb,ST;function rs(){if(ST)return wb;ST=1;function e(t){return t}return wb=e,wb}var Sb,jT;function VU(){if(jT)return Sb;jT=1;function e(t){return function(n){return n==null?void 0:n[t]}}return Sb=e,Sb}var jb,OT;function YU(){if(OT)return jb;OT=1;var e=hw();function t(n){return function(r){return e(r,n)}}return jb=t,jb}var Ob,_T;function KU(){if(_T)return Ob;_T=1;var e=VU(),t=YU(),n=lw(),r=Gh();function i(l){return n(l)?e(r(l)):t(l)}return Ob=i,Ob}var _b,AT;function Dr(){if(AT)return _b;AT=1;var e=zU(),t=GU(),n=rs(),r=jn(),i=KU();function l(s){return typeof s=="function"?s:s==null?n:typeof s=="object"?r(s)?t(s[0],s[1]):e(s):i(s)}return _b=l,_b}var Ab,ET;function CD(){if(ET)return Ab;ET=1;function e(t,n,r,i){for(var l=t.length,s=r+(i?1:-1);i?s--:++s<l;)if(n(t[s],s,t))return s;return-1}return Ab=e,Ab}var Eb,TT;function XU(){if(TT)return Eb;TT=1;function e(t){return t!==t}return Eb=e,Eb}var Tb,CT;function WU(){if(CT)return Tb;CT=1;function e(t,n,r){for(var i=r-1,l=t.length;++i<l;)if(t[i]===n)return i;return-1}return Tb=e,Tb}var Cb,NT;function ZU(){if(NT)return Cb;NT=1;var e=CD(),t=XU(),n=WU();function r(i,l,s){return l===l?n(i,l,s):e(i,t,s)}return Cb=r,Cb}var Nb,MT;function QU(){if(MT)return Nb;MT=1;var e=ZU();function t(n,r){var i=n==null?0:n.length;return!!i&&e(n,r,0)>-1}return Nb=t,Nb}var Mb,PT;function JU(){if(PT)return Mb;PT=1;function e(t,n,r){for(var i=-1,l=t==null?0:t.length;++i<l;)if(r(n,t[i]))return!0;return!1}return Mb=e,Mb}var Pb,RT;function eH(){if(RT)return Pb;RT=1;function e(){}return Pb=e,Pb}var Rb,DT;function tH(){if(DT)return Rb;DT=1;var e=AD(),t=eH(),n=ww(),r=1/0,i=e&&1/n(new e([,-0]))[1]==r?function(l){return new e(l)}:t;return Rb=i,Rb}var Db,kT;function nH(){if(kT)return Db;kT=1;var e=yD(),t=QU(),n=JU(),r=bD(),i=tH(),l=ww(),s=200;function u(f,d,m){var v=-1,g=t,x=f.length,j=!0,w=[],b=w;if(m)j=!1,g=n;else if(x>=s){var _=d?null:i(f);if(_)return l(_);j=!1,g=r,b=new e}else b=d?[]:w;e:for(;++v<x;){var O=f[v],E=d?d(O):O;if(O=m||O!==0?O:0,j&&E===E){for(var C=b.length;C--;)if(b[C]===E)continue e;d&&b.push(E),w.push(O)}else g(b,E,m)||(b!==w&&b.push(E),w.push(O))}return w}return Db=u,Db}var kb,$T;function rH(){if($T)return kb;$T=1;var e=Dr(),t=nH();function n(r,i){return r&&r.length?t(r,e(i,2)):[]}return kb=n,kb}var aH=rH();const LT=rt(aH);function ND(e,t,n){return t===!0?LT(e,n):Re(t)?LT(e,t):e}function El(e){"@babel/helpers - typeof";return El=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},El(e)}var iH=["ref"];function IT(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function Jr(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?IT(Object(n),!0).forEach(function(r){Zh(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):IT(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function oH(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function qT(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,PD(r.key),r)}}function lH(e,t,n){return t&&qT(e.prototype,t),n&&qT(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e}function sH(e,t,n){return t=Ld(t),cH(e,MD()?Reflect.construct(t,n||[],Ld(e).constructor):t.apply(e,n))}function cH(e,t){if(t&&(El(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return uH(e)}function uH(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function MD(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(MD=function(){return!!e})()}function Ld(e){return Ld=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},Ld(e)}function fH(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&Dx(e,t)}function Dx(e,t){return Dx=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},Dx(e,t)}function Zh(e,t,n){return t=PD(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function PD(e){var t=dH(e,"string");return El(t)=="symbol"?t:t+""}function dH(e,t){if(El(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(El(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}function hH(e,t){if(e==null)return{};var n=pH(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function pH(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}function mH(e){return e.value}function vH(e,t){if(z.isValidElement(e))return z.cloneElement(e,t);if(typeof e=="function")return z.createElement(e,t);t.ref;var n=hH(t,iH);return z.createElement(xw,n)}var BT=1,hl=function(e){function t(){var n;oH(this,t);for(var r=arguments.length,i=new Array(r),l=0;l<r;l++)i[l]=arguments[l];return n=sH(this,t,[].concat(i)),Zh(n,"lastBoundingBox",{width:-1,height:-1}),n}return fH(t,e),lH(t,[{key:"componentDidMount",value:function(){this.updateBBox()}},{key:"componentDidUpdate",value:function(){this.updateBBox()}},{key:"getBBox",value:function(){if(this.wrapperNode&&this.wrapperNode.getBoundingClientRect){var r=this.wrapperNode.getBoundingClientRect();return r.height=this.wrapperNode.offsetHeight,r.width=this.wrapperNode.offsetWidth,r}return null}},{key:"updateBBox",value:function(){var r=this.props.onBBoxUpdate,i=this.getBBox();i?(Math.abs(i.width-this.lastBoundingBox.width)>BT||Math.abs(i.height-this.lastBoundingBox.height)>BT)&&(this.lastBoundingBox.width=i.width,this.lastBoundingBox.height=i.height,r&&r(i)):(this.lastBoundingBox.width!==-1||this.lastBoundingBox.height!==-1)&&(this.lastBoundingBox.width=-1,this.lastBoundingBox.height=-1,r&&r(null))}},{key:"getBBoxSnapshot",value:function(){return this.lastBoundingBox.width>=0&&this.lastBoundingBox.height>=0?Jr({},this.lastBoundingBox):{width:0,height:0}}},{key:"getDefaultPosition",value:function(r){var i=this.props,l=i.layout,s=i.align,u=i.verticalAlign,f=i.margin,d=i.chartWidth,m=i.chartHeight,v,g;if(!r||(r.left===void 0||r.left===null)&&(r.right===void 0||r.right===null))if(s==="center"&&l==="vertical"){var x=this.getBBoxSnapshot();v={left:((d||0)-x.width)/2}}else v=s==="right"?{right:f&&f.right||0}:{left:f&&f.left||0};if(!r||(r.top===void 0||r.top===null)&&(r.bottom===void 0||r.bottom===null))if(u==="middle"){var j=this.getBBoxSnapshot();g={top:((m||0)-j.height)/2}}else g=u==="bottom"?{bottom:f&&f.bottom||0}:{top:f&&f.top||0};return Jr(Jr({},v),g)}},{key:"render",value:function(){var r=this,i=this.props,l=i.content,s=i.width,u=i.height,f=i.wrapperStyle,d=i.payloadUniqBy,m=i.payload,v=Jr(Jr({position:"absolute",width:s||"auto",height:u||"auto"},this.getDefaultPosition(f)),f);return z.createElement("div",{className:"recharts-legend-wrapper",style:v,ref:function(x){r.wrapperNode=x}},vH(l,Jr(Jr({},this.props),{},{payload:ND(m,d,mH)})))}}],[{key:"getWithHeight",value:function(r,i){var l=Jr(Jr({},this.defaultProps),r.props),s=l.layout;return s==="vertical"&&fe(r.props.height)?{height:r.props.height}:s==="horizontal"?{width:r.props.width||i}:null}}])}(T.PureComponent);Zh(hl,"displayName","Legend");Zh(hl,"defaultProps",{iconSize:14,layout:"horizontal",align:"center",verticalAlign:"bottom"});var $b,zT;function yH(){if(zT)return $b;zT=1;var e=ju(),t=Sw(),n=jn(),r=e?e.isConcatSpreadable:void 0;function i(l){return n(l)||t(l)||!!(r&&l&&l[r])}return $b=i,$b}var Lb,UT;function RD(){if(UT)return Lb;UT=1;var e=wD(),t=yH();function n(r,i,l,s,u){var f=-1,d=r.length;for(l||(l=t),u||(u=[]);++f<d;){var m=r[f];i>0&&l(m)?i>1?n(m,i-1,l,s,u):e(u,m):s||(u[u.length]=m)}return u}return Lb=n,Lb}var Ib,HT;function gH(){if(HT)return Ib;HT=1;function e(t){return function(n,r,i){for(var l=-1,s=Object(n),u=i(n),f=u.length;f--;){var d=u[t?f:++l];if(r(s[d],d,s)===!1)break}return n}}return Ib=e,Ib}var qb,FT;function bH(){if(FT)return qb;FT=1;var e=gH(),t=e();return qb=t,qb}var Bb,GT;function DD(){if(GT)return Bb;GT=1;var e=bH(),t=Wh();function n(r,i){return r&&e(r,i,t)}return Bb=n,Bb}var zb,VT;function xH(){if(VT)return zb;VT=1;var e=Au();function t(n,r){return function(i,l){if(i==null)return i;if(!e(i))return n(i,l);for(var s=i.length,u=r?s:-1,f=Object(i);(r?u--:++u<s)&&l(f[u],u,f)!==!1;);return i}}return zb=t,zb}var Ub,YT;function Aw(){if(YT)return Ub;YT=1;var e=DD(),t=xH(),n=t(e);return Ub=n,Ub}var Hb,KT;function kD(){if(KT)return Hb;KT=1;var e=Aw(),t=Au();function n(r,i){var l=-1,s=t(r)?Array(r.length):[];return e(r,function(u,f,d){s[++l]=i(u,f,d)}),s}return Hb=n,Hb}var Fb,XT;function wH(){if(XT)return Fb;XT=1;function e(t,n){var r=t.length;for(t.sort(n);r--;)t[r]=t[r].value;return t}return Fb=e,Fb}var Gb,WT;function SH(){if(WT)return Gb;WT=1;var e=ts();function t(n,r){if(n!==r){var i=n!==void 0,l=n===null,s=n===n,u=e(n),f=r!==void 0,d=r===null,m=r===r,v=e(r);if(!d&&!v&&!u&&n>r||u&&f&&m&&!d&&!v||l&&f&&m||!i&&m||!s)return 1;if(!l&&!u&&!v&&n<r||v&&i&&s&&!l&&!u||d&&i&&s||!f&&s||!m)return-1}return 0}return Gb=t,Gb}var Vb,ZT;function jH(){if(ZT)return Vb;ZT=1;var e=SH();function t(n,r,i){for(var l=-1,s=n.criteria,u=r.criteria,f=s.length,d=i.length;++l<f;){var m=e(s[l],u[l]);if(m){if(l>=d)return m;var v=i[l];return m*(v=="desc"?-1:1)}}return n.index-r.index}return Vb=t,Vb}var Yb,QT;function OH(){if(QT)return Yb;QT=1;var e=dw(),t=hw(),n=Dr(),r=kD(),i=wH(),l=jD(),s=jH(),u=rs(),f=jn();function d(m,v,g){v.length?v=e(v,function(w){return f(w)?function(b){return t(b,w.length===1?w[0]:w)}:w}):v=[u];var x=-1;v=e(v,l(n));var j=r(m,function(w,b,_){var O=e(v,function(E){return E(w)});return{criteria:O,index:++x,value:w}});return i(j,function(w,b){return s(w,b,g)})}return Yb=d,Yb}var Kb,JT;function _H(){if(JT)return Kb;JT=1;function e(t,n,r){switch(r.length){case 0:return t.call(n);case 1:return t.call(n,r[0]);case 2:return t.call(n,r[0],r[1]);case 3:return t.call(n,r[0],r[1],r[2])}return t.apply(n,r)}return Kb=e,Kb}var Xb,eC;function AH(){if(eC)return Xb;eC=1;var e=_H(),t=Math.max;function n(r,i,l){return i=t(i===void 0?r.length-1:i,0),function(){for(var s=arguments,u=-1,f=t(s.length-i,0),d=Array(f);++u<f;)d[u]=s[i+u];u=-1;for(var m=Array(i+1);++u<i;)m[u]=s[u];return m[i]=l(d),e(r,this,m)}}return Xb=n,Xb}var Wb,tC;function EH(){if(tC)return Wb;tC=1;function e(t){return function(){return t}}return Wb=e,Wb}var Zb,nC;function $D(){if(nC)return Zb;nC=1;var e=io(),t=function(){try{var n=e(Object,"defineProperty");return n({},"",{}),n}catch{}}();return Zb=t,Zb}var Qb,rC;function TH(){if(rC)return Qb;rC=1;var e=EH(),t=$D(),n=rs(),r=t?function(i,l){return t(i,"toString",{configurable:!0,enumerable:!1,value:e(l),writable:!0})}:n;return Qb=r,Qb}var Jb,aC;function CH(){if(aC)return Jb;aC=1;var e=800,t=16,n=Date.now;function r(i){var l=0,s=0;return function(){var u=n(),f=t-(u-s);if(s=u,f>0){if(++l>=e)return arguments[0]}else l=0;return i.apply(void 0,arguments)}}return Jb=r,Jb}var e0,iC;function NH(){if(iC)return e0;iC=1;var e=TH(),t=CH(),n=t(e);return e0=n,e0}var t0,oC;function MH(){if(oC)return t0;oC=1;var e=rs(),t=AH(),n=NH();function r(i,l){return n(t(i,l,e),i+"")}return t0=r,t0}var n0,lC;function Qh(){if(lC)return n0;lC=1;var e=cw(),t=Au(),n=jw(),r=si();function i(l,s,u){if(!r(u))return!1;var f=typeof s;return(f=="number"?t(u)&&n(s,u.length):f=="string"&&s in u)?e(u[s],l):!1}return n0=i,n0}var r0,sC;function PH(){if(sC)return r0;sC=1;var e=RD(),t=OH(),n=MH(),r=Qh(),i=n(function(l,s){if(l==null)return[];var u=s.length;return u>1&&r(l,s[0],s[1])?s=[]:u>2&&r(s[0],s[1],s[2])&&(s=[s[0]]),t(l,e(s,1),[])});return r0=i,r0}var RH=PH();const Ew=rt(RH);function Ic(e){"@babel/helpers - typeof";return Ic=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ic(e)}function kx(){return kx=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},kx.apply(this,arguments)}function DH(e,t){return IH(e)||LH(e,t)||$H(e,t)||kH()}function kH(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function $H(e,t){if(e){if(typeof e=="string")return cC(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return cC(e,t)}}function cC(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function LH(e,t){var n=e==null?null:typeof Symbol<"u"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var r,i,l,s,u=[],f=!0,d=!1;try{if(l=(n=n.call(e)).next,t!==0)for(;!(f=(r=l.call(n)).done)&&(u.push(r.value),u.length!==t);f=!0);}catch(m){d=!0,i=m}finally{try{if(!f&&n.return!=null&&(s=n.return(),Object(s)!==s))return}finally{if(d)throw i}}return u}}function IH(e){if(Array.isArray(e))return e}function uC(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function a0(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?uC(Object(n),!0).forEach(function(r){qH(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):uC(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function qH(e,t,n){return t=BH(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function BH(e){var t=zH(e,"string");return Ic(t)=="symbol"?t:t+""}function zH(e,t){if(Ic(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Ic(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function UH(e){return Array.isArray(e)&&Ut(e[0])&&Ut(e[1])?e.join(" ~ "):e}var HH=function(t){var n=t.separator,r=n===void 0?" : ":n,i=t.contentStyle,l=i===void 0?{}:i,s=t.itemStyle,u=s===void 0?{}:s,f=t.labelStyle,d=f===void 0?{}:f,m=t.payload,v=t.formatter,g=t.itemSorter,x=t.wrapperClassName,j=t.labelClassName,w=t.label,b=t.labelFormatter,_=t.accessibilityLayer,O=_===void 0?!1:_,E=function(){if(m&&m.length){var H={padding:0,margin:0},V=(g?Ew(m,g):m).map(function(Z,Y){if(Z.type==="none")return null;var $=a0({display:"block",paddingTop:4,paddingBottom:4,color:Z.color||"#000"},u),U=Z.formatter||v||UH,B=Z.value,re=Z.name,k=B,X=re;if(U&&k!=null&&X!=null){var te=U(B,re,Z,Y,m);if(Array.isArray(te)){var ne=DH(te,2);k=ne[0],X=ne[1]}else k=te}return z.createElement("li",{className:"recharts-tooltip-item",key:"tooltip-item-".concat(Y),style:$},Ut(X)?z.createElement("span",{className:"recharts-tooltip-item-name"},X):null,Ut(X)?z.createElement("span",{className:"recharts-tooltip-item-separator"},r):null,z.createElement("span",{className:"recharts-tooltip-item-value"},k),z.createElement("span",{className:"recharts-tooltip-item-unit"},Z.unit||""))});return z.createElement("ul",{className:"recharts-tooltip-item-list",style:H},V)}return null},C=a0({margin:0,padding:10,backgroundColor:"#fff",border:"1px solid #ccc",whiteSpace:"nowrap"},l),A=a0({margin:0},d),N=!Ve(w),P=N?w:"",D=qe("recharts-default-tooltip",x),L=qe("recharts-tooltip-label",j);N&&b&&m!==void 0&&m!==null&&(P=b(w,m));var G=O?{role:"status","aria-live":"assertive"}:{};return z.createElement("div",kx({className:D,style:C},G),z.createElement("p",{className:L,style:A},z.isValidElement(P)?P:"".concat(P)),E())};function qc(e){"@babel/helpers - typeof";return qc=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},qc(e)}function td(e,t,n){return t=FH(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function FH(e){var t=GH(e,"string");return qc(t)=="symbol"?t:t+""}function GH(e,t){if(qc(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(qc(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var pc="recharts-tooltip-wrapper",VH={visibility:"hidden"};function YH(e){var t=e.coordinate,n=e.translateX,r=e.translateY;return qe(pc,td(td(td(td({},"".concat(pc,"-right"),fe(n)&&t&&fe(t.x)&&n>=t.x),"".concat(pc,"-left"),fe(n)&&t&&fe(t.x)&&n<t.x),"".concat(pc,"-bottom"),fe(r)&&t&&fe(t.y)&&r>=t.y),"".concat(pc,"-top"),fe(r)&&t&&fe(t.y)&&r<t.y))}function fC(e){var t=e.allowEscapeViewBox,n=e.coordinate,r=e.key,i=e.offsetTopLeft,l=e.position,s=e.reverseDirection,u=e.tooltipDimension,f=e.viewBox,d=e.viewBoxDimension;if(l&&fe(l[r]))return l[r];var m=n[r]-u-i,v=n[r]+i;if(t[r])return s[r]?m:v;if(s[r]){var g=m,x=f[r];return g<x?Math.max(v,f[r]):Math.max(m,f[r])}var j=v+u,w=f[r]+d;return j>w?Math.max(m,f[r]):Math.max(v,f[r])}function KH(e){var t=e.translateX,n=e.translateY,r=e.useTranslate3d;return{transform:r?"translate3d(".concat(t,"px, ").concat(n,"px, 0)"):"translate(".concat(t,"px, ").concat(n,"px)")}}function XH(e){var t=e.allowEscapeViewBox,n=e.coordinate,r=e.offsetTopLeft,i=e.position,l=e.reverseDirection,s=e.tooltipBox,u=e.useTranslate3d,f=e.viewBox,d,m,v;return s.height>0&&s.width>0&&n?(m=fC({allowEscapeViewBox:t,coordinate:n,key:"x",offsetTopLeft:r,position:i,reverseDirection:l,tooltipDimension:s.width,viewBox:f,viewBoxDimension:f.width}),v=fC({allowEscapeViewBox:t,coordinate:n,key:"y",offsetTopLeft:r,position:i,reverseDirection:l,tooltipDimension:s.height,viewBox:f,viewBoxDimension:f.height}),d=KH({translateX:m,translateY:v,useTranslate3d:u})):d=VH,{cssProperties:d,cssClasses:YH({translateX:m,translateY:v,coordinate:n})}}function Tl(e){"@babel/helpers - typeof";return Tl=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Tl(e)}function dC(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function hC(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?dC(Object(n),!0).forEach(function(r){Lx(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):dC(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function WH(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function ZH(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,ID(r.key),r)}}function QH(e,t,n){return t&&ZH(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e}function JH(e,t,n){return t=Id(t),e7(e,LD()?Reflect.construct(t,n||[],Id(e).constructor):t.apply(e,n))}function e7(e,t){if(t&&(Tl(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return t7(e)}function t7(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function LD(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(LD=function(){return!!e})()}function Id(e){return Id=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},Id(e)}function n7(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&$x(e,t)}function $x(e,t){return $x=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},$x(e,t)}function Lx(e,t,n){return t=ID(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ID(e){var t=r7(e,"string");return Tl(t)=="symbol"?t:t+""}function r7(e,t){if(Tl(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Tl(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}var pC=1,a7=function(e){function t(){var n;WH(this,t);for(var r=arguments.length,i=new Array(r),l=0;l<r;l++)i[l]=arguments[l];return n=JH(this,t,[].concat(i)),Lx(n,"state",{dismissed:!1,dismissedAtCoordinate:{x:0,y:0},lastBoundingBox:{width:-1,height:-1}}),Lx(n,"handleKeyDown",function(s){if(s.key==="Escape"){var u,f,d,m;n.setState({dismissed:!0,dismissedAtCoordinate:{x:(u=(f=n.props.coordinate)===null||f===void 0?void 0:f.x)!==null&&u!==void 0?u:0,y:(d=(m=n.props.coordinate)===null||m===void 0?void 0:m.y)!==null&&d!==void 0?d:0}})}}),n}return n7(t,e),QH(t,[{key:"updateBBox",value:function(){if(this.wrapperNode&&this.wrapperNode.getBoundingClientRect){var r=this.wrapperNode.getBoundingClientRect();(Math.abs(r.width-this.state.lastBoundingBox.width)>pC||Math.abs(r.height-this.state.lastBoundingBox.height)>pC)&&this.setState({lastBoundingBox:{width:r.width,height:r.height}})}else(this.state.lastBoundingBox.width!==-1||this.state.lastBoundingBox.height!==-1)&&this.setState({lastBoundingBox:{width:-1,height:-1}})}},{key:"componentDidMount",value:function(){document.addEventListener("keydown",this.handleKeyDown),this.updateBBox()}},{key:"componentWillUnmount",value:function(){document.removeEventListener("keydown",this.handleKeyDown)}},{key:"componentDidUpdate",value:function(){var r,i;this.props.active&&this.updateBBox(),this.state.dismissed&&(((r=this.props.coordinate)===null||r===void 0?void 0:r.x)!==this.state.dismissedAtCoordinate.x||((i=this.props.coordinate)===null||i===void 0?void 0:i.y)!==this.state.dismissedAtCoordinate.y)&&(this.state.dismissed=!1)}},{key:"render",value:function(){var r=this,i=this.props,l=i.active,s=i.allowEscapeViewBox,u=i.animationDuration,f=i.animationEasing,d=i.children,m=i.coordinate,v=i.hasPayload,g=i.isAnimationActive,x=i.offset,j=i.position,w=i.reverseDirection,b=i.useTranslate3d,_=i.viewBox,O=i.wrapperStyle,E=XH({allowEscapeViewBox:s,coordinate:m,offsetTopLeft:x,position:j,reverseDirection:w,tooltipBox:this.state.lastBoundingBox,useTranslate3d:b,viewBox:_}),C=E.cssClasses,A=E.cssProperties,N=hC(hC({transition:g&&l?"transform ".concat(u,"ms ").concat(f):void 0},A),{},{pointerEvents:"none",visibility:!this.state.dismissed&&l&&v?"visible":"hidden",position:"absolute",top:0,left:0},O);return z.createElement("div",{tabIndex:-1,className:C,style:N,ref:function(D){r.wrapperNode=D}},d)}}])}(T.PureComponent),i7=function(){return!(typeof window<"u"&&window.document&&window.document.createElement&&window.setTimeout)},as={isSsr:i7()};function Cl(e){"@babel/helpers - typeof";return Cl=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Cl(e)}function mC(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function vC(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?mC(Object(n),!0).forEach(function(r){Tw(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):mC(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function o7(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function l7(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,BD(r.key),r)}}function s7(e,t,n){return t&&l7(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e}function c7(e,t,n){return t=qd(t),u7(e,qD()?Reflect.construct(t,n||[],qd(e).constructor):t.apply(e,n))}function u7(e,t){if(t&&(Cl(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return f7(e)}function f7(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function qD(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(qD=function(){return!!e})()}function qd(e){return qd=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},qd(e)}function d7(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&Ix(e,t)}function Ix(e,t){return Ix=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},Ix(e,t)}function Tw(e,t,n){return t=BD(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function BD(e){var t=h7(e,"string");return Cl(t)=="symbol"?t:t+""}function h7(e,t){if(Cl(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Cl(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}function p7(e){return e.dataKey}function m7(e,t){return z.isValidElement(e)?z.cloneElement(e,t):typeof e=="function"?z.createElement(e,t):z.createElement(HH,t)}var ur=function(e){function t(){return o7(this,t),c7(this,t,arguments)}return d7(t,e),s7(t,[{key:"render",value:function(){var r=this,i=this.props,l=i.active,s=i.allowEscapeViewBox,u=i.animationDuration,f=i.animationEasing,d=i.content,m=i.coordinate,v=i.filterNull,g=i.isAnimationActive,x=i.offset,j=i.payload,w=i.payloadUniqBy,b=i.position,_=i.reverseDirection,O=i.useTranslate3d,E=i.viewBox,C=i.wrapperStyle,A=j??[];v&&A.length&&(A=ND(j.filter(function(P){return P.value!=null&&(P.hide!==!0||r.props.includeHidden)}),w,p7));var N=A.length>0;return z.createElement(a7,{allowEscapeViewBox:s,animationDuration:u,animationEasing:f,isAnimationActive:g,active:l,coordinate:m,hasPayload:N,offset:x,position:b,reverseDirection:_,useTranslate3d:O,viewBox:E,wrapperStyle:C},m7(d,vC(vC({},this.props),{},{payload:A})))}}])}(T.PureComponent);Tw(ur,"displayName","Tooltip");Tw(ur,"defaultProps",{accessibilityLayer:!1,allowEscapeViewBox:{x:!1,y:!1},animationDuration:400,animationEasing:"ease",contentStyle:{},coordinate:{x:0,y:0},cursor:!0,cursorStyle:{},filterNull:!0,isAnimationActive:!as.isSsr,itemStyle:{},labelStyle:{},offset:10,reverseDirection:{x:!1,y:!1},separator:" : ",trigger:"hover",useTranslate3d:!1,viewBox:{x:0,y:0,height:0,width:0},wrapperStyle:{}});var i0,yC;function v7(){if(yC)return i0;yC=1;var e=Rr(),t=function(){return e.Date.now()};return i0=t,i0}var o0,gC;function y7(){if(gC)return o0;gC=1;var e=/\s/;function t(n){for(var r=n.length;r--&&e.test(n.charAt(r)););return r}return o0=t,o0}var l0,bC;function g7(){if(bC)return l0;bC=1;var e=y7(),t=/^\s+/;function n(r){return r&&r.slice(0,e(r)+1).replace(t,"")}return l0=n,l0}var s0,xC;function zD(){if(xC)return s0;xC=1;var e=g7(),t=si(),n=ts(),r=NaN,i=/^[-+]0x[0-9a-f]+$/i,l=/^0b[01]+$/i,s=/^0o[0-7]+$/i,u=parseInt;function f(d){if(typeof d=="number")return d;if(n(d))return r;if(t(d)){var m=typeof d.valueOf=="function"?d.valueOf():d;d=t(m)?m+"":m}if(typeof d!="string")return d===0?d:+d;d=e(d);var v=l.test(d);return v||s.test(d)?u(d.slice(2),v?2:8):i.test(d)?r:+d}return s0=f,s0}var c0,wC;function b7(){if(wC)return c0;wC=1;var e=si(),t=v7(),n=zD(),r="Expected a function",i=Math.max,l=Math.min;function s(u,f,d){var m,v,g,x,j,w,b=0,_=!1,O=!1,E=!0;if(typeof u!="function")throw new TypeError(r);f=n(f)||0,e(d)&&(_=!!d.leading,O="maxWait"in d,g=O?i(n(d.maxWait)||0,f):g,E="trailing"in d?!!d.trailing:E);function C(V){var Z=m,Y=v;return m=v=void 0,b=V,x=u.apply(Y,Z),x}function A(V){return b=V,j=setTimeout(D,f),_?C(V):x}function N(V){var Z=V-w,Y=V-b,$=f-Z;return O?l($,g-Y):$}function P(V){var Z=V-w,Y=V-b;return w===void 0||Z>=f||Z<0||O&&Y>=g}function D(){var V=t();if(P(V))return L(V);j=setTimeout(D,N(V))}function L(V){return j=void 0,E&&m?C(V):(m=v=void 0,x)}function G(){j!==void 0&&clearTimeout(j),b=0,m=w=v=j=void 0}function I(){return j===void 0?x:L(t())}function H(){var V=t(),Z=P(V);if(m=arguments,v=this,w=V,Z){if(j===void 0)return A(w);if(O)return clearTimeout(j),j=setTimeout(D,f),C(w)}return j===void 0&&(j=setTimeout(D,f)),x}return H.cancel=G,H.flush=I,H}return c0=s,c0}var u0,SC;function x7(){if(SC)return u0;SC=1;var e=b7(),t=si(),n="Expected a function";function r(i,l,s){var u=!0,f=!0;if(typeof i!="function")throw new TypeError(n);return t(s)&&(u="leading"in s?!!s.leading:u,f="trailing"in s?!!s.trailing:f),e(i,l,{leading:u,maxWait:l,trailing:f})}return u0=r,u0}var w7=x7();const UD=rt(w7);function Bc(e){"@babel/helpers - typeof";return Bc=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Bc(e)}function jC(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function nd(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?jC(Object(n),!0).forEach(function(r){S7(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):jC(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function S7(e,t,n){return t=j7(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function j7(e){var t=O7(e,"string");return Bc(t)=="symbol"?t:t+""}function O7(e,t){if(Bc(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Bc(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function _7(e,t){return C7(e)||T7(e,t)||E7(e,t)||A7()}function A7(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function E7(e,t){if(e){if(typeof e=="string")return OC(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return OC(e,t)}}function OC(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function T7(e,t){var n=e==null?null:typeof Symbol<"u"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var r,i,l,s,u=[],f=!0,d=!1;try{if(l=(n=n.call(e)).next,t!==0)for(;!(f=(r=l.call(n)).done)&&(u.push(r.value),u.length!==t);f=!0);}catch(m){d=!0,i=m}finally{try{if(!f&&n.return!=null&&(s=n.return(),Object(s)!==s))return}finally{if(d)throw i}}return u}}function C7(e){if(Array.isArray(e))return e}var _C=T.forwardRef(function(e,t){var n=e.aspect,r=e.initialDimension,i=r===void 0?{width:-1,height:-1}:r,l=e.width,s=l===void 0?"100%":l,u=e.height,f=u===void 0?"100%":u,d=e.minWidth,m=d===void 0?0:d,v=e.minHeight,g=e.maxHeight,x=e.children,j=e.debounce,w=j===void 0?0:j,b=e.id,_=e.className,O=e.onResize,E=e.style,C=E===void 0?{}:E,A=T.useRef(null),N=T.useRef();N.current=O,T.useImperativeHandle(t,function(){return Object.defineProperty(A.current,"current",{get:function(){return console.warn("The usage of ref.current.current is deprecated and will no longer be supported."),A.current},configurable:!0})});var P=T.useState({containerWidth:i.width,containerHeight:i.height}),D=_7(P,2),L=D[0],G=D[1],I=T.useCallback(function(V,Z){G(function(Y){var $=Math.round(V),U=Math.round(Z);return Y.containerWidth===$&&Y.containerHeight===U?Y:{containerWidth:$,containerHeight:U}})},[]);T.useEffect(function(){var V=function(re){var k,X=re[0].contentRect,te=X.width,ne=X.height;I(te,ne),(k=N.current)===null||k===void 0||k.call(N,te,ne)};w>0&&(V=UD(V,w,{trailing:!0,leading:!1}));var Z=new ResizeObserver(V),Y=A.current.getBoundingClientRect(),$=Y.width,U=Y.height;return I($,U),Z.observe(A.current),function(){Z.disconnect()}},[I,w]);var H=T.useMemo(function(){var V=L.containerWidth,Z=L.containerHeight;if(V<0||Z<0)return null;pr(Bi(s)||Bi(f),`The width(%s) and height(%s) are both fixed numbers,
-       maybe you don't need to use a ResponsiveContainer.`,s,f),pr(!n||n>0,"The aspect(%s) must be greater than zero.",n);var Y=Bi(s)?V:s,$=Bi(f)?Z:f;n&&n>0&&(Y?$=Y/n:$&&(Y=$*n),g&&$>g&&($=g)),pr(Y>0||$>0,`The width(%s) and height(%s) of chart should be greater than 0,
-       please check the style of container, or the props width(%s) and height(%s),
-       or add a minWidth(%s) or minHeight(%s) or use aspect(%s) to control the
-       height and width.`,Y,$,s,f,m,v,n);var U=!Array.isArray(x)&&oa(x.type).endsWith("Chart");return z.Children.map(x,function(B){return z.isValidElement(B)?T.cloneElement(B,nd({width:Y,height:$},U?{style:nd({height:"100%",width:"100%",maxHeight:$,maxWidth:Y},B.props.style)}:{})):B})},[n,x,f,g,v,m,L,s]);return z.createElement("div",{id:b?"".concat(b):void 0,className:qe("recharts-responsive-container",_),style:nd(nd({},C),{},{width:s,height:f,minWidth:m,minHeight:v,maxHeight:g}),ref:A},H)}),Jh=function(t){return null};Jh.displayName="Cell";function zc(e){"@babel/helpers - typeof";return zc=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},zc(e)}function AC(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function qx(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?AC(Object(n),!0).forEach(function(r){N7(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):AC(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function N7(e,t,n){return t=M7(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function M7(e){var t=P7(e,"string");return zc(t)=="symbol"?t:t+""}function P7(e,t){if(zc(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(zc(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Jo={widthCache:{},cacheCount:0},R7=2e3,D7={position:"absolute",top:"-20000px",left:0,padding:0,margin:0,border:"none",whiteSpace:"pre"},EC="recharts_measurement_span";function k7(e){var t=qx({},e);return Object.keys(t).forEach(function(n){t[n]||delete t[n]}),t}var Ec=function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{};if(t==null||as.isSsr)return{width:0,height:0};var r=k7(n),i=JSON.stringify({text:t,copyStyle:r});if(Jo.widthCache[i])return Jo.widthCache[i];try{var l=document.getElementById(EC);l||(l=document.createElement("span"),l.setAttribute("id",EC),l.setAttribute("aria-hidden","true"),document.body.appendChild(l));var s=qx(qx({},D7),r);Object.assign(l.style,s),l.textContent="".concat(t);var u=l.getBoundingClientRect(),f={width:u.width,height:u.height};return Jo.widthCache[i]=f,++Jo.cacheCount>R7&&(Jo.cacheCount=0,Jo.widthCache={}),f}catch{return{width:0,height:0}}},$7=function(t){return{top:t.top+window.scrollY-document.documentElement.clientTop,left:t.left+window.scrollX-document.documentElement.clientLeft}};function Uc(e){"@babel/helpers - typeof";return Uc=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Uc(e)}function Bd(e,t){return B7(e)||q7(e,t)||I7(e,t)||L7()}function L7(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function I7(e,t){if(e){if(typeof e=="string")return TC(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return TC(e,t)}}function TC(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function q7(e,t){var n=e==null?null:typeof Symbol<"u"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var r,i,l,s,u=[],f=!0,d=!1;try{if(l=(n=n.call(e)).next,t===0){if(Object(n)!==n)return;f=!1}else for(;!(f=(r=l.call(n)).done)&&(u.push(r.value),u.length!==t);f=!0);}catch(m){d=!0,i=m}finally{try{if(!f&&n.return!=null&&(s=n.return(),Object(s)!==s))return}finally{if(d)throw i}}return u}}function B7(e){if(Array.isArray(e))return e}function z7(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function CC(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,H7(r.key),r)}}function U7(e,t,n){return t&&CC(e.prototype,t),n&&CC(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e}function H7(e){var t=F7(e,"string");return Uc(t)=="symbol"?t:t+""}function F7(e,t){if(Uc(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Uc(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}var NC=/(-?\d+(?:\.\d+)?[a-zA-Z%]*)([*/])(-?\d+(?:\.\d+)?[a-zA-Z%]*)/,MC=/(-?\d+(?:\.\d+)?[a-zA-Z%]*)([+-])(-?\d+(?:\.\d+)?[a-zA-Z%]*)/,G7=/^px|cm|vh|vw|em|rem|%|mm|in|pt|pc|ex|ch|vmin|vmax|Q$/,V7=/(-?\d+(?:\.\d+)?)([a-zA-Z%]+)?/,HD={cm:96/2.54,mm:96/25.4,pt:96/72,pc:96/6,in:96,Q:96/(2.54*40),px:1},Y7=Object.keys(HD),il="NaN";function K7(e,t){return e*HD[t]}var rd=function(){function e(t,n){z7(this,e),this.num=t,this.unit=n,this.num=t,this.unit=n,Number.isNaN(t)&&(this.unit=""),n!==""&&!G7.test(n)&&(this.num=NaN,this.unit=""),Y7.includes(n)&&(this.num=K7(t,n),this.unit="px")}return U7(e,[{key:"add",value:function(n){return this.unit!==n.unit?new e(NaN,""):new e(this.num+n.num,this.unit)}},{key:"subtract",value:function(n){return this.unit!==n.unit?new e(NaN,""):new e(this.num-n.num,this.unit)}},{key:"multiply",value:function(n){return this.unit!==""&&n.unit!==""&&this.unit!==n.unit?new e(NaN,""):new e(this.num*n.num,this.unit||n.unit)}},{key:"divide",value:function(n){return this.unit!==""&&n.unit!==""&&this.unit!==n.unit?new e(NaN,""):new e(this.num/n.num,this.unit||n.unit)}},{key:"toString",value:function(){return"".concat(this.num).concat(this.unit)}},{key:"isNaN",value:function(){return Number.isNaN(this.num)}}],[{key:"parse",value:function(n){var r,i=(r=V7.exec(n))!==null&&r!==void 0?r:[],l=Bd(i,3),s=l[1],u=l[2];return new e(parseFloat(s),u??"")}}])}();function FD(e){if(e.includes(il))return il;for(var t=e;t.includes("*")||t.includes("/");){var n,r=(n=NC.exec(t))!==null&&n!==void 0?n:[],i=Bd(r,4),l=i[1],s=i[2],u=i[3],f=rd.parse(l??""),d=rd.parse(u??""),m=s==="*"?f.multiply(d):f.divide(d);if(m.isNaN())return il;t=t.replace(NC,m.toString())}for(;t.includes("+")||/.-\d+(?:\.\d+)?/.test(t);){var v,g=(v=MC.exec(t))!==null&&v!==void 0?v:[],x=Bd(g,4),j=x[1],w=x[2],b=x[3],_=rd.parse(j??""),O=rd.parse(b??""),E=w==="+"?_.add(O):_.subtract(O);if(E.isNaN())return il;t=t.replace(MC,E.toString())}return t}var PC=/\(([^()]*)\)/;function X7(e){for(var t=e;t.includes("(");){var n=PC.exec(t),r=Bd(n,2),i=r[1];t=t.replace(PC,FD(i))}return t}function W7(e){var t=e.replace(/\s+/g,"");return t=X7(t),t=FD(t),t}function Z7(e){try{return W7(e)}catch{return il}}function f0(e){var t=Z7(e.slice(5,-1));return t===il?"":t}var Q7=["x","y","lineHeight","capHeight","scaleToFit","textAnchor","verticalAnchor","fill"],J7=["dx","dy","angle","className","breakAll"];function Bx(){return Bx=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Bx.apply(this,arguments)}function RC(e,t){if(e==null)return{};var n=e9(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function e9(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}function DC(e,t){return a9(e)||r9(e,t)||n9(e,t)||t9()}function t9(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function n9(e,t){if(e){if(typeof e=="string")return kC(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return kC(e,t)}}function kC(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function r9(e,t){var n=e==null?null:typeof Symbol<"u"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var r,i,l,s,u=[],f=!0,d=!1;try{if(l=(n=n.call(e)).next,t===0){if(Object(n)!==n)return;f=!1}else for(;!(f=(r=l.call(n)).done)&&(u.push(r.value),u.length!==t);f=!0);}catch(m){d=!0,i=m}finally{try{if(!f&&n.return!=null&&(s=n.return(),Object(s)!==s))return}finally{if(d)throw i}}return u}}function a9(e){if(Array.isArray(e))return e}var GD=/[ \f\n\r\t\v\u2028\u2029]+/,VD=function(t){var n=t.children,r=t.breakAll,i=t.style;try{var l=[];Ve(n)||(r?l=n.toString().split(""):l=n.toString().split(GD));var s=l.map(function(f){return{word:f,width:Ec(f,i).width}}),u=r?0:Ec(" ",i).width;return{wordsWithComputedWidth:s,spaceWidth:u}}catch{return null}},i9=function(t,n,r,i,l){var s=t.maxLines,u=t.children,f=t.style,d=t.breakAll,m=fe(s),v=u,g=function(){var Y=arguments.length>0&&arguments[0]!==void 0?arguments[0]:[];return Y.reduce(function($,U){var B=U.word,re=U.width,k=$[$.length-1];if(k&&(i==null||l||k.width+re+r<Number(i)))k.words.push(B),k.width+=re+r;else{var X={words:[B],width:re};$.push(X)}return $},[])},x=g(n),j=function(Y){return Y.reduce(function($,U){return $.width>U.width?$:U})};if(!m)return x;for(var w="…",b=function(Y){var $=v.slice(0,Y),U=VD({breakAll:d,style:f,children:$+w}).wordsWithComputedWidth,B=g(U),re=B.length>s||j(B).width>Number(i);return[re,B]},_=0,O=v.length-1,E=0,C;_<=O&&E<=v.length-1;){var A=Math.floor((_+O)/2),N=A-1,P=b(N),D=DC(P,2),L=D[0],G=D[1],I=b(A),H=DC(I,1),V=H[0];if(!L&&!V&&(_=A+1),L&&V&&(O=A-1),!L&&V){C=G;break}E++}return C||x},$C=function(t){var n=Ve(t)?[]:t.toString().split(GD);return[{words:n}]},o9=function(t){var n=t.width,r=t.scaleToFit,i=t.children,l=t.style,s=t.breakAll,u=t.maxLines;if((n||r)&&!as.isSsr){var f,d,m=VD({breakAll:s,children:i,style:l});if(m){var v=m.wordsWithComputedWidth,g=m.spaceWidth;f=v,d=g}else return $C(i);return i9({breakAll:s,children:i,maxLines:u,style:l},f,d,n,r)}return $C(i)},LC="#808080",Zi=function(t){var n=t.x,r=n===void 0?0:n,i=t.y,l=i===void 0?0:i,s=t.lineHeight,u=s===void 0?"1em":s,f=t.capHeight,d=f===void 0?"0.71em":f,m=t.scaleToFit,v=m===void 0?!1:m,g=t.textAnchor,x=g===void 0?"start":g,j=t.verticalAnchor,w=j===void 0?"end":j,b=t.fill,_=b===void 0?LC:b,O=RC(t,Q7),E=T.useMemo(function(){return o9({breakAll:O.breakAll,children:O.children,maxLines:O.maxLines,scaleToFit:v,style:O.style,width:O.width})},[O.breakAll,O.children,O.maxLines,v,O.style,O.width]),C=O.dx,A=O.dy,N=O.angle,P=O.className,D=O.breakAll,L=RC(O,J7);if(!Ut(r)||!Ut(l))return null;var G=r+(fe(C)?C:0),I=l+(fe(A)?A:0),H;switch(w){case"start":H=f0("calc(".concat(d,")"));break;case"middle":H=f0("calc(".concat((E.length-1)/2," * -").concat(u," + (").concat(d," / 2))"));break;default:H=f0("calc(".concat(E.length-1," * -").concat(u,")"));break}var V=[];if(v){var Z=E[0].width,Y=O.width;V.push("scale(".concat((fe(Y)?Y/Z:1)/Z,")"))}return N&&V.push("rotate(".concat(N,", ").concat(G,", ").concat(I,")")),V.length&&(L.transform=V.join(" ")),z.createElement("text",Bx({},Me(L,!0),{x:G,y:I,className:qe("recharts-text",P),textAnchor:x,fill:_.includes("url")?LC:_}),E.map(function($,U){var B=$.words.join(D?"":" ");return z.createElement("tspan",{x:G,dy:U===0?H:u,key:"".concat(B,"-").concat(U)},B)}))};function ti(e,t){return e==null||t==null?NaN:e<t?-1:e>t?1:e>=t?0:NaN}function l9(e,t){return e==null||t==null?NaN:t<e?-1:t>e?1:t>=e?0:NaN}function Cw(e){let t,n,r;e.length!==2?(t=ti,n=(u,f)=>ti(e(u),f),r=(u,f)=>e(u)-f):(t=e===ti||e===l9?e:s9,n=e,r=e);function i(u,f,d=0,m=u.length){if(d<m){if(t(f,f)!==0)return m;do{const v=d+m>>>1;n(u[v],f)<0?d=v+1:m=v}while(d<m)}return d}function l(u,f,d=0,m=u.length){if(d<m){if(t(f,f)!==0)return m;do{const v=d+m>>>1;n(u[v],f)<=0?d=v+1:m=v}while(d<m)}return d}function s(u,f,d=0,m=u.length){const v=i(u,f,d,m-1);return v>d&&r(u[v-1],f)>-r(u[v],f)?v-1:v}return{left:i,center:s,right:l}}function s9(){return 0}function YD(e){return e===null?NaN:+e}function*c9(e,t){for(let n of e)n!=null&&(n=+n)>=n&&(yield n)}const u9=Cw(ti),Eu=u9.right;Cw(YD).center;class IC extends Map{constructor(t,n=h9){if(super(),Object.defineProperties(this,{_intern:{value:new Map},_key:{value:n}}),t!=null)for(const[r,i]of t)this.set(r,i)}get(t){return super.get(qC(this,t))}has(t){return super.has(qC(this,t))}set(t,n){return super.set(f9(this,t),n)}delete(t){return super.delete(d9(this,t))}}function qC({_intern:e,_key:t},n){const r=t(n);return e.has(r)?e.get(r):n}function f9({_intern:e,_key:t},n){const r=t(n);return e.has(r)?e.get(r):(e.set(r,n),n)}function d9({_intern:e,_key:t},n){const r=t(n);return e.has(r)&&(n=e.get(r),e.delete(r)),n}function h9(e){return e!==null&&typeof e=="object"?e.valueOf():e}function p9(e=ti){if(e===ti)return KD;if(typeof e!="function")throw new TypeError("compare is not a function");return(t,n)=>{const r=e(t,n);return r||r===0?r:(e(n,n)===0)-(e(t,t)===0)}}function KD(e,t){return(e==null||!(e>=e))-(t==null||!(t>=t))||(e<t?-1:e>t?1:0)}const m9=Math.sqrt(50),v9=Math.sqrt(10),y9=Math.sqrt(2);function zd(e,t,n){const r=(t-e)/Math.max(0,n),i=Math.floor(Math.log10(r)),l=r/Math.pow(10,i),s=l>=m9?10:l>=v9?5:l>=y9?2:1;let u,f,d;return i<0?(d=Math.pow(10,-i)/s,u=Math.round(e*d),f=Math.round(t*d),u/d<e&&++u,f/d>t&&--f,d=-d):(d=Math.pow(10,i)*s,u=Math.round(e/d),f=Math.round(t/d),u*d<e&&++u,f*d>t&&--f),f<u&&.5<=n&&n<2?zd(e,t,n*2):[u,f,d]}function zx(e,t,n){if(t=+t,e=+e,n=+n,!(n>0))return[];if(e===t)return[e];const r=t<e,[i,l,s]=r?zd(t,e,n):zd(e,t,n);if(!(l>=i))return[];const u=l-i+1,f=new Array(u);if(r)if(s<0)for(let d=0;d<u;++d)f[d]=(l-d)/-s;else for(let d=0;d<u;++d)f[d]=(l-d)*s;else if(s<0)for(let d=0;d<u;++d)f[d]=(i+d)/-s;else for(let d=0;d<u;++d)f[d]=(i+d)*s;return f}function Ux(e,t,n){return t=+t,e=+e,n=+n,zd(e,t,n)[2]}function Hx(e,t,n){t=+t,e=+e,n=+n;const r=t<e,i=r?Ux(t,e,n):Ux(e,t,n);return(r?-1:1)*(i<0?1/-i:i)}function BC(e,t){let n;for(const r of e)r!=null&&(n<r||n===void 0&&r>=r)&&(n=r);return n}function zC(e,t){let n;for(const r of e)r!=null&&(n>r||n===void 0&&r>=r)&&(n=r);return n}function XD(e,t,n=0,r=1/0,i){if(t=Math.floor(t),n=Math.floor(Math.max(0,n)),r=Math.floor(Math.min(e.length-1,r)),!(n<=t&&t<=r))return e;for(i=i===void 0?KD:p9(i);r>n;){if(r-n>600){const f=r-n+1,d=t-n+1,m=Math.log(f),v=.5*Math.exp(2*m/3),g=.5*Math.sqrt(m*v*(f-v)/f)*(d-f/2<0?-1:1),x=Math.max(n,Math.floor(t-d*v/f+g)),j=Math.min(r,Math.floor(t+(f-d)*v/f+g));XD(e,t,x,j,i)}const l=e[t];let s=n,u=r;for(mc(e,n,t),i(e[r],l)>0&&mc(e,n,r);s<u;){for(mc(e,s,u),++s,--u;i(e[s],l)<0;)++s;for(;i(e[u],l)>0;)--u}i(e[n],l)===0?mc(e,n,u):(++u,mc(e,u,r)),u<=t&&(n=u+1),t<=u&&(r=u-1)}return e}function mc(e,t,n){const r=e[t];e[t]=e[n],e[n]=r}function g9(e,t,n){if(e=Float64Array.from(c9(e)),!(!(r=e.length)||isNaN(t=+t))){if(t<=0||r<2)return zC(e);if(t>=1)return BC(e);var r,i=(r-1)*t,l=Math.floor(i),s=BC(XD(e,l).subarray(0,l+1)),u=zC(e.subarray(l+1));return s+(u-s)*(i-l)}}function b9(e,t,n=YD){if(!(!(r=e.length)||isNaN(t=+t))){if(t<=0||r<2)return+n(e[0],0,e);if(t>=1)return+n(e[r-1],r-1,e);var r,i=(r-1)*t,l=Math.floor(i),s=+n(e[l],l,e),u=+n(e[l+1],l+1,e);return s+(u-s)*(i-l)}}function x9(e,t,n){e=+e,t=+t,n=(i=arguments.length)<2?(t=e,e=0,1):i<3?1:+n;for(var r=-1,i=Math.max(0,Math.ceil((t-e)/n))|0,l=new Array(i);++r<i;)l[r]=e+r*n;return l}function rr(e,t){switch(arguments.length){case 0:break;case 1:this.range(e);break;default:this.range(t).domain(e);break}return this}function Sa(e,t){switch(arguments.length){case 0:break;case 1:{typeof e=="function"?this.interpolator(e):this.range(e);break}default:{this.domain(e),typeof t=="function"?this.interpolator(t):this.range(t);break}}return this}const Fx=Symbol("implicit");function Nw(){var e=new IC,t=[],n=[],r=Fx;function i(l){let s=e.get(l);if(s===void 0){if(r!==Fx)return r;e.set(l,s=t.push(l)-1)}return n[s%n.length]}return i.domain=function(l){if(!arguments.length)return t.slice();t=[],e=new IC;for(const s of l)e.has(s)||e.set(s,t.push(s)-1);return i},i.range=function(l){return arguments.length?(n=Array.from(l),i):n.slice()},i.unknown=function(l){return arguments.length?(r=l,i):r},i.copy=function(){return Nw(t,n).unknown(r)},rr.apply(i,arguments),i}function Hc(){var e=Nw().unknown(void 0),t=e.domain,n=e.range,r=0,i=1,l,s,u=!1,f=0,d=0,m=.5;delete e.unknown;function v(){var g=t().length,x=i<r,j=x?i:r,w=x?r:i;l=(w-j)/Math.max(1,g-f+d*2),u&&(l=Math.floor(l)),j+=(w-j-l*(g-f))*m,s=l*(1-f),u&&(j=Math.round(j),s=Math.round(s));var b=x9(g).map(function(_){return j+l*_});return n(x?b.reverse():b)}return e.domain=function(g){return arguments.length?(t(g),v()):t()},e.range=function(g){return arguments.length?([r,i]=g,r=+r,i=+i,v()):[r,i]},e.rangeRound=function(g){return[r,i]=g,r=+r,i=+i,u=!0,v()},e.bandwidth=function(){return s},e.step=function(){return l},e.round=function(g){return arguments.length?(u=!!g,v()):u},e.padding=function(g){return arguments.length?(f=Math.min(1,d=+g),v()):f},e.paddingInner=function(g){return arguments.length?(f=Math.min(1,g),v()):f},e.paddingOuter=function(g){return arguments.length?(d=+g,v()):d},e.align=function(g){return arguments.length?(m=Math.max(0,Math.min(1,g)),v()):m},e.copy=function(){return Hc(t(),[r,i]).round(u).paddingInner(f).paddingOuter(d).align(m)},rr.apply(v(),arguments)}function WD(e){var t=e.copy;return e.padding=e.paddingOuter,delete e.paddingInner,delete e.paddingOuter,e.copy=function(){return WD(t())},e}function Tc(){return WD(Hc.apply(null,arguments).paddingInner(1))}function Mw(e,t,n){e.prototype=t.prototype=n,n.constructor=e}function ZD(e,t){var n=Object.create(e.prototype);for(var r in t)n[r]=t[r];return n}function Tu(){}var Fc=.7,Ud=1/Fc,pl="\\s*([+-]?\\d+)\\s*",Gc="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",Ar="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",w9=/^#([0-9a-f]{3,8})$/,S9=new RegExp(`^rgb\\(${pl},${pl},${pl}\\)$`),j9=new RegExp(`^rgb\\(${Ar},${Ar},${Ar}\\)$`),O9=new RegExp(`^rgba\\(${pl},${pl},${pl},${Gc}\\)$`),_9=new RegExp(`^rgba\\(${Ar},${Ar},${Ar},${Gc}\\)$`),A9=new RegExp(`^hsl\\(${Gc},${Ar},${Ar}\\)$`),E9=new RegExp(`^hsla\\(${Gc},${Ar},${Ar},${Gc}\\)$`),UC={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};Mw(Tu,Vc,{copy(e){return Object.assign(new this.constructor,this,e)},displayable(){return this.rgb().displayable()},hex:HC,formatHex:HC,formatHex8:T9,formatHsl:C9,formatRgb:FC,toString:FC});function HC(){return this.rgb().formatHex()}function T9(){return this.rgb().formatHex8()}function C9(){return QD(this).formatHsl()}function FC(){return this.rgb().formatRgb()}function Vc(e){var t,n;return e=(e+"").trim().toLowerCase(),(t=w9.exec(e))?(n=t[1].length,t=parseInt(t[1],16),n===6?GC(t):n===3?new Sn(t>>8&15|t>>4&240,t>>4&15|t&240,(t&15)<<4|t&15,1):n===8?ad(t>>24&255,t>>16&255,t>>8&255,(t&255)/255):n===4?ad(t>>12&15|t>>8&240,t>>8&15|t>>4&240,t>>4&15|t&240,((t&15)<<4|t&15)/255):null):(t=S9.exec(e))?new Sn(t[1],t[2],t[3],1):(t=j9.exec(e))?new Sn(t[1]*255/100,t[2]*255/100,t[3]*255/100,1):(t=O9.exec(e))?ad(t[1],t[2],t[3],t[4]):(t=_9.exec(e))?ad(t[1]*255/100,t[2]*255/100,t[3]*255/100,t[4]):(t=A9.exec(e))?KC(t[1],t[2]/100,t[3]/100,1):(t=E9.exec(e))?KC(t[1],t[2]/100,t[3]/100,t[4]):UC.hasOwnProperty(e)?GC(UC[e]):e==="transparent"?new Sn(NaN,NaN,NaN,0):null}function GC(e){return new Sn(e>>16&255,e>>8&255,e&255,1)}function ad(e,t,n,r){return r<=0&&(e=t=n=NaN),new Sn(e,t,n,r)}function N9(e){return e instanceof Tu||(e=Vc(e)),e?(e=e.rgb(),new Sn(e.r,e.g,e.b,e.opacity)):new Sn}function Gx(e,t,n,r){return arguments.length===1?N9(e):new Sn(e,t,n,r??1)}function Sn(e,t,n,r){this.r=+e,this.g=+t,this.b=+n,this.opacity=+r}Mw(Sn,Gx,ZD(Tu,{brighter(e){return e=e==null?Ud:Math.pow(Ud,e),new Sn(this.r*e,this.g*e,this.b*e,this.opacity)},darker(e){return e=e==null?Fc:Math.pow(Fc,e),new Sn(this.r*e,this.g*e,this.b*e,this.opacity)},rgb(){return this},clamp(){return new Sn(Fi(this.r),Fi(this.g),Fi(this.b),Hd(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:VC,formatHex:VC,formatHex8:M9,formatRgb:YC,toString:YC}));function VC(){return`#${zi(this.r)}${zi(this.g)}${zi(this.b)}`}function M9(){return`#${zi(this.r)}${zi(this.g)}${zi(this.b)}${zi((isNaN(this.opacity)?1:this.opacity)*255)}`}function YC(){const e=Hd(this.opacity);return`${e===1?"rgb(":"rgba("}${Fi(this.r)}, ${Fi(this.g)}, ${Fi(this.b)}${e===1?")":`, ${e})`}`}function Hd(e){return isNaN(e)?1:Math.max(0,Math.min(1,e))}function Fi(e){return Math.max(0,Math.min(255,Math.round(e)||0))}function zi(e){return e=Fi(e),(e<16?"0":"")+e.toString(16)}function KC(e,t,n,r){return r<=0?e=t=n=NaN:n<=0||n>=1?e=t=NaN:t<=0&&(e=NaN),new dr(e,t,n,r)}function QD(e){if(e instanceof dr)return new dr(e.h,e.s,e.l,e.opacity);if(e instanceof Tu||(e=Vc(e)),!e)return new dr;if(e instanceof dr)return e;e=e.rgb();var t=e.r/255,n=e.g/255,r=e.b/255,i=Math.min(t,n,r),l=Math.max(t,n,r),s=NaN,u=l-i,f=(l+i)/2;return u?(t===l?s=(n-r)/u+(n<r)*6:n===l?s=(r-t)/u+2:s=(t-n)/u+4,u/=f<.5?l+i:2-l-i,s*=60):u=f>0&&f<1?0:s,new dr(s,u,f,e.opacity)}function P9(e,t,n,r){return arguments.length===1?QD(e):new dr(e,t,n,r??1)}function dr(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}Mw(dr,P9,ZD(Tu,{brighter(e){return e=e==null?Ud:Math.pow(Ud,e),new dr(this.h,this.s,this.l*e,this.opacity)},darker(e){return e=e==null?Fc:Math.pow(Fc,e),new dr(this.h,this.s,this.l*e,this.opacity)},rgb(){var e=this.h%360+(this.h<0)*360,t=isNaN(e)||isNaN(this.s)?0:this.s,n=this.l,r=n+(n<.5?n:1-n)*t,i=2*n-r;return new Sn(d0(e>=240?e-240:e+120,i,r),d0(e,i,r),d0(e<120?e+240:e-120,i,r),this.opacity)},clamp(){return new dr(XC(this.h),id(this.s),id(this.l),Hd(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){const e=Hd(this.opacity);return`${e===1?"hsl(":"hsla("}${XC(this.h)}, ${id(this.s)*100}%, ${id(this.l)*100}%${e===1?")":`, ${e})`}`}}));function XC(e){return e=(e||0)%360,e<0?e+360:e}function id(e){return Math.max(0,Math.min(1,e||0))}function d0(e,t,n){return(e<60?t+(n-t)*e/60:e<180?n:e<240?t+(n-t)*(240-e)/60:t)*255}const Pw=e=>()=>e;function R9(e,t){return function(n){return e+n*t}}function D9(e,t,n){return e=Math.pow(e,n),t=Math.pow(t,n)-e,n=1/n,function(r){return Math.pow(e+r*t,n)}}function k9(e){return(e=+e)==1?JD:function(t,n){return n-t?D9(t,n,e):Pw(isNaN(t)?n:t)}}function JD(e,t){var n=t-e;return n?R9(e,n):Pw(isNaN(e)?t:e)}const WC=function e(t){var n=k9(t);function r(i,l){var s=n((i=Gx(i)).r,(l=Gx(l)).r),u=n(i.g,l.g),f=n(i.b,l.b),d=JD(i.opacity,l.opacity);return function(m){return i.r=s(m),i.g=u(m),i.b=f(m),i.opacity=d(m),i+""}}return r.gamma=e,r}(1);function $9(e,t){t||(t=[]);var n=e?Math.min(t.length,e.length):0,r=t.slice(),i;return function(l){for(i=0;i<n;++i)r[i]=e[i]*(1-l)+t[i]*l;return r}}function L9(e){return ArrayBuffer.isView(e)&&!(e instanceof DataView)}function I9(e,t){var n=t?t.length:0,r=e?Math.min(n,e.length):0,i=new Array(r),l=new Array(n),s;for(s=0;s<r;++s)i[s]=is(e[s],t[s]);for(;s<n;++s)l[s]=t[s];return function(u){for(s=0;s<r;++s)l[s]=i[s](u);return l}}function q9(e,t){var n=new Date;return e=+e,t=+t,function(r){return n.setTime(e*(1-r)+t*r),n}}function Fd(e,t){return e=+e,t=+t,function(n){return e*(1-n)+t*n}}function B9(e,t){var n={},r={},i;(e===null||typeof e!="object")&&(e={}),(t===null||typeof t!="object")&&(t={});for(i in t)i in e?n[i]=is(e[i],t[i]):r[i]=t[i];return function(l){for(i in n)r[i]=n[i](l);return r}}var Vx=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,h0=new RegExp(Vx.source,"g");function z9(e){return function(){return e}}function U9(e){return function(t){return e(t)+""}}function H9(e,t){var n=Vx.lastIndex=h0.lastIndex=0,r,i,l,s=-1,u=[],f=[];for(e=e+"",t=t+"";(r=Vx.exec(e))&&(i=h0.exec(t));)(l=i.index)>n&&(l=t.slice(n,l),u[s]?u[s]+=l:u[++s]=l),(r=r[0])===(i=i[0])?u[s]?u[s]+=i:u[++s]=i:(u[++s]=null,f.push({i:s,x:Fd(r,i)})),n=h0.lastIndex;return n<t.length&&(l=t.slice(n),u[s]?u[s]+=l:u[++s]=l),u.length<2?f[0]?U9(f[0].x):z9(t):(t=f.length,function(d){for(var m=0,v;m<t;++m)u[(v=f[m]).i]=v.x(d);return u.join("")})}function is(e,t){var n=typeof t,r;return t==null||n==="boolean"?Pw(t):(n==="number"?Fd:n==="string"?(r=Vc(t))?(t=r,WC):H9:t instanceof Vc?WC:t instanceof Date?q9:L9(t)?$9:Array.isArray(t)?I9:typeof t.valueOf!="function"&&typeof t.toString!="function"||isNaN(t)?B9:Fd)(e,t)}function Rw(e,t){return e=+e,t=+t,function(n){return Math.round(e*(1-n)+t*n)}}function F9(e,t){t===void 0&&(t=e,e=is);for(var n=0,r=t.length-1,i=t[0],l=new Array(r<0?0:r);n<r;)l[n]=e(i,i=t[++n]);return function(s){var u=Math.max(0,Math.min(r-1,Math.floor(s*=r)));return l[u](s-u)}}function G9(e){return function(){return e}}function Gd(e){return+e}var ZC=[0,1];function mn(e){return e}function Yx(e,t){return(t-=e=+e)?function(n){return(n-e)/t}:G9(isNaN(t)?NaN:.5)}function V9(e,t){var n;return e>t&&(n=e,e=t,t=n),function(r){return Math.max(e,Math.min(t,r))}}function Y9(e,t,n){var r=e[0],i=e[1],l=t[0],s=t[1];return i<r?(r=Yx(i,r),l=n(s,l)):(r=Yx(r,i),l=n(l,s)),function(u){return l(r(u))}}function K9(e,t,n){var r=Math.min(e.length,t.length)-1,i=new Array(r),l=new Array(r),s=-1;for(e[r]<e[0]&&(e=e.slice().reverse(),t=t.slice().reverse());++s<r;)i[s]=Yx(e[s],e[s+1]),l[s]=n(t[s],t[s+1]);return function(u){var f=Eu(e,u,1,r)-1;return l[f](i[f](u))}}function Cu(e,t){return t.domain(e.domain()).range(e.range()).interpolate(e.interpolate()).clamp(e.clamp()).unknown(e.unknown())}function ep(){var e=ZC,t=ZC,n=is,r,i,l,s=mn,u,f,d;function m(){var g=Math.min(e.length,t.length);return s!==mn&&(s=V9(e[0],e[g-1])),u=g>2?K9:Y9,f=d=null,v}function v(g){return g==null||isNaN(g=+g)?l:(f||(f=u(e.map(r),t,n)))(r(s(g)))}return v.invert=function(g){return s(i((d||(d=u(t,e.map(r),Fd)))(g)))},v.domain=function(g){return arguments.length?(e=Array.from(g,Gd),m()):e.slice()},v.range=function(g){return arguments.length?(t=Array.from(g),m()):t.slice()},v.rangeRound=function(g){return t=Array.from(g),n=Rw,m()},v.clamp=function(g){return arguments.length?(s=g?!0:mn,m()):s!==mn},v.interpolate=function(g){return arguments.length?(n=g,m()):n},v.unknown=function(g){return arguments.length?(l=g,v):l},function(g,x){return r=g,i=x,m()}}function Dw(){return ep()(mn,mn)}function X9(e){return Math.abs(e=Math.round(e))>=1e21?e.toLocaleString("en").replace(/,/g,""):e.toString(10)}function Vd(e,t){if((n=(e=t?e.toExponential(t-1):e.toExponential()).indexOf("e"))<0)return null;var n,r=e.slice(0,n);return[r.length>1?r[0]+r.slice(2):r,+e.slice(n+1)]}function Nl(e){return e=Vd(Math.abs(e)),e?e[1]:NaN}function W9(e,t){return function(n,r){for(var i=n.length,l=[],s=0,u=e[0],f=0;i>0&&u>0&&(f+u+1>r&&(u=Math.max(1,r-f)),l.push(n.substring(i-=u,i+u)),!((f+=u+1)>r));)u=e[s=(s+1)%e.length];return l.reverse().join(t)}}function Z9(e){return function(t){return t.replace(/[0-9]/g,function(n){return e[+n]})}}var Q9=/^(?:(.)?([<>=^]))?([+\-( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?(~)?([a-z%])?$/i;function Yc(e){if(!(t=Q9.exec(e)))throw new Error("invalid format: "+e);var t;return new kw({fill:t[1],align:t[2],sign:t[3],symbol:t[4],zero:t[5],width:t[6],comma:t[7],precision:t[8]&&t[8].slice(1),trim:t[9],type:t[10]})}Yc.prototype=kw.prototype;function kw(e){this.fill=e.fill===void 0?" ":e.fill+"",this.align=e.align===void 0?">":e.align+"",this.sign=e.sign===void 0?"-":e.sign+"",this.symbol=e.symbol===void 0?"":e.symbol+"",this.zero=!!e.zero,this.width=e.width===void 0?void 0:+e.width,this.comma=!!e.comma,this.precision=e.precision===void 0?void 0:+e.precision,this.trim=!!e.trim,this.type=e.type===void 0?"":e.type+""}kw.prototype.toString=function(){return this.fill+this.align+this.sign+this.symbol+(this.zero?"0":"")+(this.width===void 0?"":Math.max(1,this.width|0))+(this.comma?",":"")+(this.precision===void 0?"":"."+Math.max(0,this.precision|0))+(this.trim?"~":"")+this.type};function J9(e){e:for(var t=e.length,n=1,r=-1,i;n<t;++n)switch(e[n]){case".":r=i=n;break;case"0":r===0&&(r=n),i=n;break;default:if(!+e[n])break e;r>0&&(r=0);break}return r>0?e.slice(0,r)+e.slice(i+1):e}var ek;function eF(e,t){var n=Vd(e,t);if(!n)return e+"";var r=n[0],i=n[1],l=i-(ek=Math.max(-8,Math.min(8,Math.floor(i/3)))*3)+1,s=r.length;return l===s?r:l>s?r+new Array(l-s+1).join("0"):l>0?r.slice(0,l)+"."+r.slice(l):"0."+new Array(1-l).join("0")+Vd(e,Math.max(0,t+l-1))[0]}function QC(e,t){var n=Vd(e,t);if(!n)return e+"";var r=n[0],i=n[1];return i<0?"0."+new Array(-i).join("0")+r:r.length>i+1?r.slice(0,i+1)+"."+r.slice(i+1):r+new Array(i-r.length+2).join("0")}const JC={"%":(e,t)=>(e*100).toFixed(t),b:e=>Math.round(e).toString(2),c:e=>e+"",d:X9,e:(e,t)=>e.toExponential(t),f:(e,t)=>e.toFixed(t),g:(e,t)=>e.toPrecision(t),o:e=>Math.round(e).toString(8),p:(e,t)=>QC(e*100,t),r:QC,s:eF,X:e=>Math.round(e).toString(16).toUpperCase(),x:e=>Math.round(e).toString(16)};function eN(e){return e}var tN=Array.prototype.map,nN=["y","z","a","f","p","n","µ","m","","k","M","G","T","P","E","Z","Y"];function tF(e){var t=e.grouping===void 0||e.thousands===void 0?eN:W9(tN.call(e.grouping,Number),e.thousands+""),n=e.currency===void 0?"":e.currency[0]+"",r=e.currency===void 0?"":e.currency[1]+"",i=e.decimal===void 0?".":e.decimal+"",l=e.numerals===void 0?eN:Z9(tN.call(e.numerals,String)),s=e.percent===void 0?"%":e.percent+"",u=e.minus===void 0?"−":e.minus+"",f=e.nan===void 0?"NaN":e.nan+"";function d(v){v=Yc(v);var g=v.fill,x=v.align,j=v.sign,w=v.symbol,b=v.zero,_=v.width,O=v.comma,E=v.precision,C=v.trim,A=v.type;A==="n"?(O=!0,A="g"):JC[A]||(E===void 0&&(E=12),C=!0,A="g"),(b||g==="0"&&x==="=")&&(b=!0,g="0",x="=");var N=w==="$"?n:w==="#"&&/[boxX]/.test(A)?"0"+A.toLowerCase():"",P=w==="$"?r:/[%p]/.test(A)?s:"",D=JC[A],L=/[defgprs%]/.test(A);E=E===void 0?6:/[gprs]/.test(A)?Math.max(1,Math.min(21,E)):Math.max(0,Math.min(20,E));function G(I){var H=N,V=P,Z,Y,$;if(A==="c")V=D(I)+V,I="";else{I=+I;var U=I<0||1/I<0;if(I=isNaN(I)?f:D(Math.abs(I),E),C&&(I=J9(I)),U&&+I==0&&j!=="+"&&(U=!1),H=(U?j==="("?j:u:j==="-"||j==="("?"":j)+H,V=(A==="s"?nN[8+ek/3]:"")+V+(U&&j==="("?")":""),L){for(Z=-1,Y=I.length;++Z<Y;)if($=I.charCodeAt(Z),48>$||$>57){V=($===46?i+I.slice(Z+1):I.slice(Z))+V,I=I.slice(0,Z);break}}}O&&!b&&(I=t(I,1/0));var B=H.length+I.length+V.length,re=B<_?new Array(_-B+1).join(g):"";switch(O&&b&&(I=t(re+I,re.length?_-V.length:1/0),re=""),x){case"<":I=H+I+V+re;break;case"=":I=H+re+I+V;break;case"^":I=re.slice(0,B=re.length>>1)+H+I+V+re.slice(B);break;default:I=re+H+I+V;break}return l(I)}return G.toString=function(){return v+""},G}function m(v,g){var x=d((v=Yc(v),v.type="f",v)),j=Math.max(-8,Math.min(8,Math.floor(Nl(g)/3)))*3,w=Math.pow(10,-j),b=nN[8+j/3];return function(_){return x(w*_)+b}}return{format:d,formatPrefix:m}}var od,$w,tk;nF({thousands:",",grouping:[3],currency:["$",""]});function nF(e){return od=tF(e),$w=od.format,tk=od.formatPrefix,od}function rF(e){return Math.max(0,-Nl(Math.abs(e)))}function aF(e,t){return Math.max(0,Math.max(-8,Math.min(8,Math.floor(Nl(t)/3)))*3-Nl(Math.abs(e)))}function iF(e,t){return e=Math.abs(e),t=Math.abs(t)-e,Math.max(0,Nl(t)-Nl(e))+1}function nk(e,t,n,r){var i=Hx(e,t,n),l;switch(r=Yc(r??",f"),r.type){case"s":{var s=Math.max(Math.abs(e),Math.abs(t));return r.precision==null&&!isNaN(l=aF(i,s))&&(r.precision=l),tk(r,s)}case"":case"e":case"g":case"p":case"r":{r.precision==null&&!isNaN(l=iF(i,Math.max(Math.abs(e),Math.abs(t))))&&(r.precision=l-(r.type==="e"));break}case"f":case"%":{r.precision==null&&!isNaN(l=rF(i))&&(r.precision=l-(r.type==="%")*2);break}}return $w(r)}function ci(e){var t=e.domain;return e.ticks=function(n){var r=t();return zx(r[0],r[r.length-1],n??10)},e.tickFormat=function(n,r){var i=t();return nk(i[0],i[i.length-1],n??10,r)},e.nice=function(n){n==null&&(n=10);var r=t(),i=0,l=r.length-1,s=r[i],u=r[l],f,d,m=10;for(u<s&&(d=s,s=u,u=d,d=i,i=l,l=d);m-- >0;){if(d=Ux(s,u,n),d===f)return r[i]=s,r[l]=u,t(r);if(d>0)s=Math.floor(s/d)*d,u=Math.ceil(u/d)*d;else if(d<0)s=Math.ceil(s*d)/d,u=Math.floor(u*d)/d;else break;f=d}return e},e}function Yd(){var e=Dw();return e.copy=function(){return Cu(e,Yd())},rr.apply(e,arguments),ci(e)}function rk(e){var t;function n(r){return r==null||isNaN(r=+r)?t:r}return n.invert=n,n.domain=n.range=function(r){return arguments.length?(e=Array.from(r,Gd),n):e.slice()},n.unknown=function(r){return arguments.length?(t=r,n):t},n.copy=function(){return rk(e).unknown(t)},e=arguments.length?Array.from(e,Gd):[0,1],ci(n)}function ak(e,t){e=e.slice();var n=0,r=e.length-1,i=e[n],l=e[r],s;return l<i&&(s=n,n=r,r=s,s=i,i=l,l=s),e[n]=t.floor(i),e[r]=t.ceil(l),e}function rN(e){return Math.log(e)}function aN(e){return Math.exp(e)}function oF(e){return-Math.log(-e)}function lF(e){return-Math.exp(-e)}function sF(e){return isFinite(e)?+("1e"+e):e<0?0:e}function cF(e){return e===10?sF:e===Math.E?Math.exp:t=>Math.pow(e,t)}function uF(e){return e===Math.E?Math.log:e===10&&Math.log10||e===2&&Math.log2||(e=Math.log(e),t=>Math.log(t)/e)}function iN(e){return(t,n)=>-e(-t,n)}function Lw(e){const t=e(rN,aN),n=t.domain;let r=10,i,l;function s(){return i=uF(r),l=cF(r),n()[0]<0?(i=iN(i),l=iN(l),e(oF,lF)):e(rN,aN),t}return t.base=function(u){return arguments.length?(r=+u,s()):r},t.domain=function(u){return arguments.length?(n(u),s()):n()},t.ticks=u=>{const f=n();let d=f[0],m=f[f.length-1];const v=m<d;v&&([d,m]=[m,d]);let g=i(d),x=i(m),j,w;const b=u==null?10:+u;let _=[];if(!(r%1)&&x-g<b){if(g=Math.floor(g),x=Math.ceil(x),d>0){for(;g<=x;++g)for(j=1;j<r;++j)if(w=g<0?j/l(-g):j*l(g),!(w<d)){if(w>m)break;_.push(w)}}else for(;g<=x;++g)for(j=r-1;j>=1;--j)if(w=g>0?j/l(-g):j*l(g),!(w<d)){if(w>m)break;_.push(w)}_.length*2<b&&(_=zx(d,m,b))}else _=zx(g,x,Math.min(x-g,b)).map(l);return v?_.reverse():_},t.tickFormat=(u,f)=>{if(u==null&&(u=10),f==null&&(f=r===10?"s":","),typeof f!="function"&&(!(r%1)&&(f=Yc(f)).precision==null&&(f.trim=!0),f=$w(f)),u===1/0)return f;const d=Math.max(1,r*u/t.ticks().length);return m=>{let v=m/l(Math.round(i(m)));return v*r<r-.5&&(v*=r),v<=d?f(m):""}},t.nice=()=>n(ak(n(),{floor:u=>l(Math.floor(i(u))),ceil:u=>l(Math.ceil(i(u)))})),t}function ik(){const e=Lw(ep()).domain([1,10]);return e.copy=()=>Cu(e,ik()).base(e.base()),rr.apply(e,arguments),e}function oN(e){return function(t){return Math.sign(t)*Math.log1p(Math.abs(t/e))}}function lN(e){return function(t){return Math.sign(t)*Math.expm1(Math.abs(t))*e}}function Iw(e){var t=1,n=e(oN(t),lN(t));return n.constant=function(r){return arguments.length?e(oN(t=+r),lN(t)):t},ci(n)}function ok(){var e=Iw(ep());return e.copy=function(){return Cu(e,ok()).constant(e.constant())},rr.apply(e,arguments)}function sN(e){return function(t){return t<0?-Math.pow(-t,e):Math.pow(t,e)}}function fF(e){return e<0?-Math.sqrt(-e):Math.sqrt(e)}function dF(e){return e<0?-e*e:e*e}function qw(e){var t=e(mn,mn),n=1;function r(){return n===1?e(mn,mn):n===.5?e(fF,dF):e(sN(n),sN(1/n))}return t.exponent=function(i){return arguments.length?(n=+i,r()):n},ci(t)}function Bw(){var e=qw(ep());return e.copy=function(){return Cu(e,Bw()).exponent(e.exponent())},rr.apply(e,arguments),e}function hF(){return Bw.apply(null,arguments).exponent(.5)}function cN(e){return Math.sign(e)*e*e}function pF(e){return Math.sign(e)*Math.sqrt(Math.abs(e))}function lk(){var e=Dw(),t=[0,1],n=!1,r;function i(l){var s=pF(e(l));return isNaN(s)?r:n?Math.round(s):s}return i.invert=function(l){return e.invert(cN(l))},i.domain=function(l){return arguments.length?(e.domain(l),i):e.domain()},i.range=function(l){return arguments.length?(e.range((t=Array.from(l,Gd)).map(cN)),i):t.slice()},i.rangeRound=function(l){return i.range(l).round(!0)},i.round=function(l){return arguments.length?(n=!!l,i):n},i.clamp=function(l){return arguments.length?(e.clamp(l),i):e.clamp()},i.unknown=function(l){return arguments.length?(r=l,i):r},i.copy=function(){return lk(e.domain(),t).round(n).clamp(e.clamp()).unknown(r)},rr.apply(i,arguments),ci(i)}function sk(){var e=[],t=[],n=[],r;function i(){var s=0,u=Math.max(1,t.length);for(n=new Array(u-1);++s<u;)n[s-1]=b9(e,s/u);return l}function l(s){return s==null||isNaN(s=+s)?r:t[Eu(n,s)]}return l.invertExtent=function(s){var u=t.indexOf(s);return u<0?[NaN,NaN]:[u>0?n[u-1]:e[0],u<n.length?n[u]:e[e.length-1]]},l.domain=function(s){if(!arguments.length)return e.slice();e=[];for(let u of s)u!=null&&!isNaN(u=+u)&&e.push(u);return e.sort(ti),i()},l.range=function(s){return arguments.length?(t=Array.from(s),i()):t.slice()},l.unknown=function(s){return arguments.length?(r=s,l):r},l.quantiles=function(){return n.slice()},l.copy=function(){return sk().domain(e).range(t).unknown(r)},rr.apply(l,arguments)}function ck(){var e=0,t=1,n=1,r=[.5],i=[0,1],l;function s(f){return f!=null&&f<=f?i[Eu(r,f,0,n)]:l}function u(){var f=-1;for(r=new Array(n);++f<n;)r[f]=((f+1)*t-(f-n)*e)/(n+1);return s}return s.domain=function(f){return arguments.length?([e,t]=f,e=+e,t=+t,u()):[e,t]},s.range=function(f){return arguments.length?(n=(i=Array.from(f)).length-1,u()):i.slice()},s.invertExtent=function(f){var d=i.indexOf(f);return d<0?[NaN,NaN]:d<1?[e,r[0]]:d>=n?[r[n-1],t]:[r[d-1],r[d]]},s.unknown=function(f){return arguments.length&&(l=f),s},s.thresholds=function(){return r.slice()},s.copy=function(){return ck().domain([e,t]).range(i).unknown(l)},rr.apply(ci(s),arguments)}function uk(){var e=[.5],t=[0,1],n,r=1;function i(l){return l!=null&&l<=l?t[Eu(e,l,0,r)]:n}return i.domain=function(l){return arguments.length?(e=Array.from(l),r=Math.min(e.length,t.length-1),i):e.slice()},i.range=function(l){return arguments.length?(t=Array.from(l),r=Math.min(e.length,t.length-1),i):t.slice()},i.invertExtent=function(l){var s=t.indexOf(l);return[e[s-1],e[s]]},i.unknown=function(l){return arguments.length?(n=l,i):n},i.copy=function(){return uk().domain(e).range(t).unknown(n)},rr.apply(i,arguments)}const p0=new Date,m0=new Date;function Ht(e,t,n,r){function i(l){return e(l=arguments.length===0?new Date:new Date(+l)),l}return i.floor=l=>(e(l=new Date(+l)),l),i.ceil=l=>(e(l=new Date(l-1)),t(l,1),e(l),l),i.round=l=>{const s=i(l),u=i.ceil(l);return l-s<u-l?s:u},i.offset=(l,s)=>(t(l=new Date(+l),s==null?1:Math.floor(s)),l),i.range=(l,s,u)=>{const f=[];if(l=i.ceil(l),u=u==null?1:Math.floor(u),!(l<s)||!(u>0))return f;let d;do f.push(d=new Date(+l)),t(l,u),e(l);while(d<l&&l<s);return f},i.filter=l=>Ht(s=>{if(s>=s)for(;e(s),!l(s);)s.setTime(s-1)},(s,u)=>{if(s>=s)if(u<0)for(;++u<=0;)for(;t(s,-1),!l(s););else for(;--u>=0;)for(;t(s,1),!l(s););}),n&&(i.count=(l,s)=>(p0.setTime(+l),m0.setTime(+s),e(p0),e(m0),Math.floor(n(p0,m0))),i.every=l=>(l=Math.floor(l),!isFinite(l)||!(l>0)?null:l>1?i.filter(r?s=>r(s)%l===0:s=>i.count(0,s)%l===0):i)),i}const Kd=Ht(()=>{},(e,t)=>{e.setTime(+e+t)},(e,t)=>t-e);Kd.every=e=>(e=Math.floor(e),!isFinite(e)||!(e>0)?null:e>1?Ht(t=>{t.setTime(Math.floor(t/e)*e)},(t,n)=>{t.setTime(+t+n*e)},(t,n)=>(n-t)/e):Kd);Kd.range;const na=1e3,er=na*60,ra=er*60,ha=ra*24,zw=ha*7,uN=ha*30,v0=ha*365,Ui=Ht(e=>{e.setTime(e-e.getMilliseconds())},(e,t)=>{e.setTime(+e+t*na)},(e,t)=>(t-e)/na,e=>e.getUTCSeconds());Ui.range;const Uw=Ht(e=>{e.setTime(e-e.getMilliseconds()-e.getSeconds()*na)},(e,t)=>{e.setTime(+e+t*er)},(e,t)=>(t-e)/er,e=>e.getMinutes());Uw.range;const Hw=Ht(e=>{e.setUTCSeconds(0,0)},(e,t)=>{e.setTime(+e+t*er)},(e,t)=>(t-e)/er,e=>e.getUTCMinutes());Hw.range;const Fw=Ht(e=>{e.setTime(e-e.getMilliseconds()-e.getSeconds()*na-e.getMinutes()*er)},(e,t)=>{e.setTime(+e+t*ra)},(e,t)=>(t-e)/ra,e=>e.getHours());Fw.range;const Gw=Ht(e=>{e.setUTCMinutes(0,0,0)},(e,t)=>{e.setTime(+e+t*ra)},(e,t)=>(t-e)/ra,e=>e.getUTCHours());Gw.range;const Nu=Ht(e=>e.setHours(0,0,0,0),(e,t)=>e.setDate(e.getDate()+t),(e,t)=>(t-e-(t.getTimezoneOffset()-e.getTimezoneOffset())*er)/ha,e=>e.getDate()-1);Nu.range;const tp=Ht(e=>{e.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCDate(e.getUTCDate()+t)},(e,t)=>(t-e)/ha,e=>e.getUTCDate()-1);tp.range;const fk=Ht(e=>{e.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCDate(e.getUTCDate()+t)},(e,t)=>(t-e)/ha,e=>Math.floor(e/ha));fk.range;function oo(e){return Ht(t=>{t.setDate(t.getDate()-(t.getDay()+7-e)%7),t.setHours(0,0,0,0)},(t,n)=>{t.setDate(t.getDate()+n*7)},(t,n)=>(n-t-(n.getTimezoneOffset()-t.getTimezoneOffset())*er)/zw)}const np=oo(0),Xd=oo(1),mF=oo(2),vF=oo(3),Ml=oo(4),yF=oo(5),gF=oo(6);np.range;Xd.range;mF.range;vF.range;Ml.range;yF.range;gF.range;function lo(e){return Ht(t=>{t.setUTCDate(t.getUTCDate()-(t.getUTCDay()+7-e)%7),t.setUTCHours(0,0,0,0)},(t,n)=>{t.setUTCDate(t.getUTCDate()+n*7)},(t,n)=>(n-t)/zw)}const rp=lo(0),Wd=lo(1),bF=lo(2),xF=lo(3),Pl=lo(4),wF=lo(5),SF=lo(6);rp.range;Wd.range;bF.range;xF.range;Pl.range;wF.range;SF.range;const Vw=Ht(e=>{e.setDate(1),e.setHours(0,0,0,0)},(e,t)=>{e.setMonth(e.getMonth()+t)},(e,t)=>t.getMonth()-e.getMonth()+(t.getFullYear()-e.getFullYear())*12,e=>e.getMonth());Vw.range;const Yw=Ht(e=>{e.setUTCDate(1),e.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCMonth(e.getUTCMonth()+t)},(e,t)=>t.getUTCMonth()-e.getUTCMonth()+(t.getUTCFullYear()-e.getUTCFullYear())*12,e=>e.getUTCMonth());Yw.range;const pa=Ht(e=>{e.setMonth(0,1),e.setHours(0,0,0,0)},(e,t)=>{e.setFullYear(e.getFullYear()+t)},(e,t)=>t.getFullYear()-e.getFullYear(),e=>e.getFullYear());pa.every=e=>!isFinite(e=Math.floor(e))||!(e>0)?null:Ht(t=>{t.setFullYear(Math.floor(t.getFullYear()/e)*e),t.setMonth(0,1),t.setHours(0,0,0,0)},(t,n)=>{t.setFullYear(t.getFullYear()+n*e)});pa.range;const ma=Ht(e=>{e.setUTCMonth(0,1),e.setUTCHours(0,0,0,0)},(e,t)=>{e.setUTCFullYear(e.getUTCFullYear()+t)},(e,t)=>t.getUTCFullYear()-e.getUTCFullYear(),e=>e.getUTCFullYear());ma.every=e=>!isFinite(e=Math.floor(e))||!(e>0)?null:Ht(t=>{t.setUTCFullYear(Math.floor(t.getUTCFullYear()/e)*e),t.setUTCMonth(0,1),t.setUTCHours(0,0,0,0)},(t,n)=>{t.setUTCFullYear(t.getUTCFullYear()+n*e)});ma.range;function dk(e,t,n,r,i,l){const s=[[Ui,1,na],[Ui,5,5*na],[Ui,15,15*na],[Ui,30,30*na],[l,1,er],[l,5,5*er],[l,15,15*er],[l,30,30*er],[i,1,ra],[i,3,3*ra],[i,6,6*ra],[i,12,12*ra],[r,1,ha],[r,2,2*ha],[n,1,zw],[t,1,uN],[t,3,3*uN],[e,1,v0]];function u(d,m,v){const g=m<d;g&&([d,m]=[m,d]);const x=v&&typeof v.range=="function"?v:f(d,m,v),j=x?x.range(d,+m+1):[];return g?j.reverse():j}function f(d,m,v){const g=Math.abs(m-d)/v,x=Cw(([,,b])=>b).right(s,g);if(x===s.length)return e.every(Hx(d/v0,m/v0,v));if(x===0)return Kd.every(Math.max(Hx(d,m,v),1));const[j,w]=s[g/s[x-1][2]<s[x][2]/g?x-1:x];return j.every(w)}return[u,f]}const[jF,OF]=dk(ma,Yw,rp,fk,Gw,Hw),[_F,AF]=dk(pa,Vw,np,Nu,Fw,Uw);function y0(e){if(0<=e.y&&e.y<100){var t=new Date(-1,e.m,e.d,e.H,e.M,e.S,e.L);return t.setFullYear(e.y),t}return new Date(e.y,e.m,e.d,e.H,e.M,e.S,e.L)}function g0(e){if(0<=e.y&&e.y<100){var t=new Date(Date.UTC(-1,e.m,e.d,e.H,e.M,e.S,e.L));return t.setUTCFullYear(e.y),t}return new Date(Date.UTC(e.y,e.m,e.d,e.H,e.M,e.S,e.L))}function vc(e,t,n){return{y:e,m:t,d:n,H:0,M:0,S:0,L:0}}function EF(e){var t=e.dateTime,n=e.date,r=e.time,i=e.periods,l=e.days,s=e.shortDays,u=e.months,f=e.shortMonths,d=yc(i),m=gc(i),v=yc(l),g=gc(l),x=yc(s),j=gc(s),w=yc(u),b=gc(u),_=yc(f),O=gc(f),E={a:U,A:B,b:re,B:k,c:null,d:vN,e:vN,f:WF,g:oG,G:sG,H:YF,I:KF,j:XF,L:hk,m:ZF,M:QF,p:X,q:te,Q:bN,s:xN,S:JF,u:eG,U:tG,V:nG,w:rG,W:aG,x:null,X:null,y:iG,Y:lG,Z:cG,"%":gN},C={a:ne,A:ue,b:ge,B:me,c:null,d:yN,e:yN,f:hG,g:jG,G:_G,H:uG,I:fG,j:dG,L:mk,m:pG,M:mG,p:de,q:ve,Q:bN,s:xN,S:vG,u:yG,U:gG,V:bG,w:xG,W:wG,x:null,X:null,y:SG,Y:OG,Z:AG,"%":gN},A={a:G,A:I,b:H,B:V,c:Z,d:pN,e:pN,f:HF,g:hN,G:dN,H:mN,I:mN,j:qF,L:UF,m:IF,M:BF,p:L,q:LF,Q:GF,s:VF,S:zF,u:PF,U:RF,V:DF,w:MF,W:kF,x:Y,X:$,y:hN,Y:dN,Z:$F,"%":FF};E.x=N(n,E),E.X=N(r,E),E.c=N(t,E),C.x=N(n,C),C.X=N(r,C),C.c=N(t,C);function N(ce,he){return function(pe){var ae=[],Le=-1,Ce=0,ft=ce.length,dt,Je,qn;for(pe instanceof Date||(pe=new Date(+pe));++Le<ft;)ce.charCodeAt(Le)===37&&(ae.push(ce.slice(Ce,Le)),(Je=fN[dt=ce.charAt(++Le)])!=null?dt=ce.charAt(++Le):Je=dt==="e"?" ":"0",(qn=he[dt])&&(dt=qn(pe,Je)),ae.push(dt),Ce=Le+1);return ae.push(ce.slice(Ce,Le)),ae.join("")}}function P(ce,he){return function(pe){var ae=vc(1900,void 0,1),Le=D(ae,ce,pe+="",0),Ce,ft;if(Le!=pe.length)return null;if("Q"in ae)return new Date(ae.Q);if("s"in ae)return new Date(ae.s*1e3+("L"in ae?ae.L:0));if(he&&!("Z"in ae)&&(ae.Z=0),"p"in ae&&(ae.H=ae.H%12+ae.p*12),ae.m===void 0&&(ae.m="q"in ae?ae.q:0),"V"in ae){if(ae.V<1||ae.V>53)return null;"w"in ae||(ae.w=1),"Z"in ae?(Ce=g0(vc(ae.y,0,1)),ft=Ce.getUTCDay(),Ce=ft>4||ft===0?Wd.ceil(Ce):Wd(Ce),Ce=tp.offset(Ce,(ae.V-1)*7),ae.y=Ce.getUTCFullYear(),ae.m=Ce.getUTCMonth(),ae.d=Ce.getUTCDate()+(ae.w+6)%7):(Ce=y0(vc(ae.y,0,1)),ft=Ce.getDay(),Ce=ft>4||ft===0?Xd.ceil(Ce):Xd(Ce),Ce=Nu.offset(Ce,(ae.V-1)*7),ae.y=Ce.getFullYear(),ae.m=Ce.getMonth(),ae.d=Ce.getDate()+(ae.w+6)%7)}else("W"in ae||"U"in ae)&&("w"in ae||(ae.w="u"in ae?ae.u%7:"W"in ae?1:0),ft="Z"in ae?g0(vc(ae.y,0,1)).getUTCDay():y0(vc(ae.y,0,1)).getDay(),ae.m=0,ae.d="W"in ae?(ae.w+6)%7+ae.W*7-(ft+5)%7:ae.w+ae.U*7-(ft+6)%7);return"Z"in ae?(ae.H+=ae.Z/100|0,ae.M+=ae.Z%100,g0(ae)):y0(ae)}}function D(ce,he,pe,ae){for(var Le=0,Ce=he.length,ft=pe.length,dt,Je;Le<Ce;){if(ae>=ft)return-1;if(dt=he.charCodeAt(Le++),dt===37){if(dt=he.charAt(Le++),Je=A[dt in fN?he.charAt(Le++):dt],!Je||(ae=Je(ce,pe,ae))<0)return-1}else if(dt!=pe.charCodeAt(ae++))return-1}return ae}function L(ce,he,pe){var ae=d.exec(he.slice(pe));return ae?(ce.p=m.get(ae[0].toLowerCase()),pe+ae[0].length):-1}function G(ce,he,pe){var ae=x.exec(he.slice(pe));return ae?(ce.w=j.get(ae[0].toLowerCase()),pe+ae[0].length):-1}function I(ce,he,pe){var ae=v.exec(he.slice(pe));return ae?(ce.w=g.get(ae[0].toLowerCase()),pe+ae[0].length):-1}function H(ce,he,pe){var ae=_.exec(he.slice(pe));return ae?(ce.m=O.get(ae[0].toLowerCase()),pe+ae[0].length):-1}function V(ce,he,pe){var ae=w.exec(he.slice(pe));return ae?(ce.m=b.get(ae[0].toLowerCase()),pe+ae[0].length):-1}function Z(ce,he,pe){return D(ce,t,he,pe)}function Y(ce,he,pe){return D(ce,n,he,pe)}function $(ce,he,pe){return D(ce,r,he,pe)}function U(ce){return s[ce.getDay()]}function B(ce){return l[ce.getDay()]}function re(ce){return f[ce.getMonth()]}function k(ce){return u[ce.getMonth()]}function X(ce){return i[+(ce.getHours()>=12)]}function te(ce){return 1+~~(ce.getMonth()/3)}function ne(ce){return s[ce.getUTCDay()]}function ue(ce){return l[ce.getUTCDay()]}function ge(ce){return f[ce.getUTCMonth()]}function me(ce){return u[ce.getUTCMonth()]}function de(ce){return i[+(ce.getUTCHours()>=12)]}function ve(ce){return 1+~~(ce.getUTCMonth()/3)}return{format:function(ce){var he=N(ce+="",E);return he.toString=function(){return ce},he},parse:function(ce){var he=P(ce+="",!1);return he.toString=function(){return ce},he},utcFormat:function(ce){var he=N(ce+="",C);return he.toString=function(){return ce},he},utcParse:function(ce){var he=P(ce+="",!0);return he.toString=function(){return ce},he}}}var fN={"-":"",_:" ",0:"0"},Zt=/^\s*\d+/,TF=/^%/,CF=/[\\^$*+?|[\]().{}]/g;function Qe(e,t,n){var r=e<0?"-":"",i=(r?-e:e)+"",l=i.length;return r+(l<n?new Array(n-l+1).join(t)+i:i)}function NF(e){return e.replace(CF,"\\$&")}function yc(e){return new RegExp("^(?:"+e.map(NF).join("|")+")","i")}function gc(e){return new Map(e.map((t,n)=>[t.toLowerCase(),n]))}function MF(e,t,n){var r=Zt.exec(t.slice(n,n+1));return r?(e.w=+r[0],n+r[0].length):-1}function PF(e,t,n){var r=Zt.exec(t.slice(n,n+1));return r?(e.u=+r[0],n+r[0].length):-1}function RF(e,t,n){var r=Zt.exec(t.slice(n,n+2));return r?(e.U=+r[0],n+r[0].length):-1}function DF(e,t,n){var r=Zt.exec(t.slice(n,n+2));return r?(e.V=+r[0],n+r[0].length):-1}function kF(e,t,n){var r=Zt.exec(t.slice(n,n+2));return r?(e.W=+r[0],n+r[0].length):-1}function dN(e,t,n){var r=Zt.exec(t.slice(n,n+4));return r?(e.y=+r[0],n+r[0].length):-1}function hN(e,t,n){var r=Zt.exec(t.slice(n,n+2));return r?(e.y=+r[0]+(+r[0]>68?1900:2e3),n+r[0].length):-1}function $F(e,t,n){var r=/^(Z)|([+-]\d\d)(?::?(\d\d))?/.exec(t.slice(n,n+6));return r?(e.Z=r[1]?0:-(r[2]+(r[3]||"00")),n+r[0].length):-1}function LF(e,t,n){var r=Zt.exec(t.slice(n,n+1));return r?(e.q=r[0]*3-3,n+r[0].length):-1}function IF(e,t,n){var r=Zt.exec(t.slice(n,n+2));return r?(e.m=r[0]-1,n+r[0].length):-1}function pN(e,t,n){var r=Zt.exec(t.slice(n,n+2));return r?(e.d=+r[0],n+r[0].length):-1}function qF(e,t,n){var r=Zt.exec(t.slice(n,n+3));return r?(e.m=0,e.d=+r[0],n+r[0].length):-1}function mN(e,t,n){var r=Zt.exec(t.slice(n,n+2));return r?(e.H=+r[0],n+r[0].length):-1}function BF(e,t,n){var r=Zt.exec(t.slice(n,n+2));return r?(e.M=+r[0],n+r[0].length):-1}function zF(e,t,n){var r=Zt.exec(t.slice(n,n+2));return r?(e.S=+r[0],n+r[0].length):-1}function UF(e,t,n){var r=Zt.exec(t.slice(n,n+3));return r?(e.L=+r[0],n+r[0].length):-1}function HF(e,t,n){var r=Zt.exec(t.slice(n,n+6));return r?(e.L=Math.floor(r[0]/1e3),n+r[0].length):-1}function FF(e,t,n){var r=TF.exec(t.slice(n,n+1));return r?n+r[0].length:-1}function GF(e,t,n){var r=Zt.exec(t.slice(n));return r?(e.Q=+r[0],n+r[0].length):-1}function VF(e,t,n){var r=Zt.exec(t.slice(n));return r?(e.s=+r[0],n+r[0].length):-1}function vN(e,t){return Qe(e.getDate(),t,2)}function YF(e,t){return Qe(e.getHours(),t,2)}function KF(e,t){return Qe(e.getHours()%12||12,t,2)}function XF(e,t){return Qe(1+Nu.count(pa(e),e),t,3)}function hk(e,t){return Qe(e.getMilliseconds(),t,3)}function WF(e,t){return hk(e,t)+"000"}function ZF(e,t){return Qe(e.getMonth()+1,t,2)}function QF(e,t){return Qe(e.getMinutes(),t,2)}function JF(e,t){return Qe(e.getSeconds(),t,2)}function eG(e){var t=e.getDay();return t===0?7:t}function tG(e,t){return Qe(np.count(pa(e)-1,e),t,2)}function pk(e){var t=e.getDay();return t>=4||t===0?Ml(e):Ml.ceil(e)}function nG(e,t){return e=pk(e),Qe(Ml.count(pa(e),e)+(pa(e).getDay()===4),t,2)}function rG(e){return e.getDay()}function aG(e,t){return Qe(Xd.count(pa(e)-1,e),t,2)}function iG(e,t){return Qe(e.getFullYear()%100,t,2)}function oG(e,t){return e=pk(e),Qe(e.getFullYear()%100,t,2)}function lG(e,t){return Qe(e.getFullYear()%1e4,t,4)}function sG(e,t){var n=e.getDay();return e=n>=4||n===0?Ml(e):Ml.ceil(e),Qe(e.getFullYear()%1e4,t,4)}function cG(e){var t=e.getTimezoneOffset();return(t>0?"-":(t*=-1,"+"))+Qe(t/60|0,"0",2)+Qe(t%60,"0",2)}function yN(e,t){return Qe(e.getUTCDate(),t,2)}function uG(e,t){return Qe(e.getUTCHours(),t,2)}function fG(e,t){return Qe(e.getUTCHours()%12||12,t,2)}function dG(e,t){return Qe(1+tp.count(ma(e),e),t,3)}function mk(e,t){return Qe(e.getUTCMilliseconds(),t,3)}function hG(e,t){return mk(e,t)+"000"}function pG(e,t){return Qe(e.getUTCMonth()+1,t,2)}function mG(e,t){return Qe(e.getUTCMinutes(),t,2)}function vG(e,t){return Qe(e.getUTCSeconds(),t,2)}function yG(e){var t=e.getUTCDay();return t===0?7:t}function gG(e,t){return Qe(rp.count(ma(e)-1,e),t,2)}function vk(e){var t=e.getUTCDay();return t>=4||t===0?Pl(e):Pl.ceil(e)}function bG(e,t){return e=vk(e),Qe(Pl.count(ma(e),e)+(ma(e).getUTCDay()===4),t,2)}function xG(e){return e.getUTCDay()}function wG(e,t){return Qe(Wd.count(ma(e)-1,e),t,2)}function SG(e,t){return Qe(e.getUTCFullYear()%100,t,2)}function jG(e,t){return e=vk(e),Qe(e.getUTCFullYear()%100,t,2)}function OG(e,t){return Qe(e.getUTCFullYear()%1e4,t,4)}function _G(e,t){var n=e.getUTCDay();return e=n>=4||n===0?Pl(e):Pl.ceil(e),Qe(e.getUTCFullYear()%1e4,t,4)}function AG(){return"+0000"}function gN(){return"%"}function bN(e){return+e}function xN(e){return Math.floor(+e/1e3)}var el,yk,gk;EG({dateTime:"%x, %X",date:"%-m/%-d/%Y",time:"%-I:%M:%S %p",periods:["AM","PM"],days:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],shortDays:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],months:["January","February","March","April","May","June","July","August","September","October","November","December"],shortMonths:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]});function EG(e){return el=EF(e),yk=el.format,el.parse,gk=el.utcFormat,el.utcParse,el}function TG(e){return new Date(e)}function CG(e){return e instanceof Date?+e:+new Date(+e)}function Kw(e,t,n,r,i,l,s,u,f,d){var m=Dw(),v=m.invert,g=m.domain,x=d(".%L"),j=d(":%S"),w=d("%I:%M"),b=d("%I %p"),_=d("%a %d"),O=d("%b %d"),E=d("%B"),C=d("%Y");function A(N){return(f(N)<N?x:u(N)<N?j:s(N)<N?w:l(N)<N?b:r(N)<N?i(N)<N?_:O:n(N)<N?E:C)(N)}return m.invert=function(N){return new Date(v(N))},m.domain=function(N){return arguments.length?g(Array.from(N,CG)):g().map(TG)},m.ticks=function(N){var P=g();return e(P[0],P[P.length-1],N??10)},m.tickFormat=function(N,P){return P==null?A:d(P)},m.nice=function(N){var P=g();return(!N||typeof N.range!="function")&&(N=t(P[0],P[P.length-1],N??10)),N?g(ak(P,N)):m},m.copy=function(){return Cu(m,Kw(e,t,n,r,i,l,s,u,f,d))},m}function NG(){return rr.apply(Kw(_F,AF,pa,Vw,np,Nu,Fw,Uw,Ui,yk).domain([new Date(2e3,0,1),new Date(2e3,0,2)]),arguments)}function MG(){return rr.apply(Kw(jF,OF,ma,Yw,rp,tp,Gw,Hw,Ui,gk).domain([Date.UTC(2e3,0,1),Date.UTC(2e3,0,2)]),arguments)}function ap(){var e=0,t=1,n,r,i,l,s=mn,u=!1,f;function d(v){return v==null||isNaN(v=+v)?f:s(i===0?.5:(v=(l(v)-n)*i,u?Math.max(0,Math.min(1,v)):v))}d.domain=function(v){return arguments.length?([e,t]=v,n=l(e=+e),r=l(t=+t),i=n===r?0:1/(r-n),d):[e,t]},d.clamp=function(v){return arguments.length?(u=!!v,d):u},d.interpolator=function(v){return arguments.length?(s=v,d):s};function m(v){return function(g){var x,j;return arguments.length?([x,j]=g,s=v(x,j),d):[s(0),s(1)]}}return d.range=m(is),d.rangeRound=m(Rw),d.unknown=function(v){return arguments.length?(f=v,d):f},function(v){return l=v,n=v(e),r=v(t),i=n===r?0:1/(r-n),d}}function ui(e,t){return t.domain(e.domain()).interpolator(e.interpolator()).clamp(e.clamp()).unknown(e.unknown())}function bk(){var e=ci(ap()(mn));return e.copy=function(){return ui(e,bk())},Sa.apply(e,arguments)}function xk(){var e=Lw(ap()).domain([1,10]);return e.copy=function(){return ui(e,xk()).base(e.base())},Sa.apply(e,arguments)}function wk(){var e=Iw(ap());return e.copy=function(){return ui(e,wk()).constant(e.constant())},Sa.apply(e,arguments)}function Xw(){var e=qw(ap());return e.copy=function(){return ui(e,Xw()).exponent(e.exponent())},Sa.apply(e,arguments)}function PG(){return Xw.apply(null,arguments).exponent(.5)}function Sk(){var e=[],t=mn;function n(r){if(r!=null&&!isNaN(r=+r))return t((Eu(e,r,1)-1)/(e.length-1))}return n.domain=function(r){if(!arguments.length)return e.slice();e=[];for(let i of r)i!=null&&!isNaN(i=+i)&&e.push(i);return e.sort(ti),n},n.interpolator=function(r){return arguments.length?(t=r,n):t},n.range=function(){return e.map((r,i)=>t(i/(e.length-1)))},n.quantiles=function(r){return Array.from({length:r+1},(i,l)=>g9(e,l/r))},n.copy=function(){return Sk(t).domain(e)},Sa.apply(n,arguments)}function ip(){var e=0,t=.5,n=1,r=1,i,l,s,u,f,d=mn,m,v=!1,g;function x(w){return isNaN(w=+w)?g:(w=.5+((w=+m(w))-l)*(r*w<r*l?u:f),d(v?Math.max(0,Math.min(1,w)):w))}x.domain=function(w){return arguments.length?([e,t,n]=w,i=m(e=+e),l=m(t=+t),s=m(n=+n),u=i===l?0:.5/(l-i),f=l===s?0:.5/(s-l),r=l<i?-1:1,x):[e,t,n]},x.clamp=function(w){return arguments.length?(v=!!w,x):v},x.interpolator=function(w){return arguments.length?(d=w,x):d};function j(w){return function(b){var _,O,E;return arguments.length?([_,O,E]=b,d=F9(w,[_,O,E]),x):[d(0),d(.5),d(1)]}}return x.range=j(is),x.rangeRound=j(Rw),x.unknown=function(w){return arguments.length?(g=w,x):g},function(w){return m=w,i=w(e),l=w(t),s=w(n),u=i===l?0:.5/(l-i),f=l===s?0:.5/(s-l),r=l<i?-1:1,x}}function jk(){var e=ci(ip()(mn));return e.copy=function(){return ui(e,jk())},Sa.apply(e,arguments)}function Ok(){var e=Lw(ip()).domain([.1,1,10]);return e.copy=function(){return ui(e,Ok()).base(e.base())},Sa.apply(e,arguments)}function _k(){var e=Iw(ip());return e.copy=function(){return ui(e,_k()).constant(e.constant())},Sa.apply(e,arguments)}function Ww(){var e=qw(ip());return e.copy=function(){return ui(e,Ww()).exponent(e.exponent())},Sa.apply(e,arguments)}function RG(){return Ww.apply(null,arguments).exponent(.5)}const wN=Object.freeze(Object.defineProperty({__proto__:null,scaleBand:Hc,scaleDiverging:jk,scaleDivergingLog:Ok,scaleDivergingPow:Ww,scaleDivergingSqrt:RG,scaleDivergingSymlog:_k,scaleIdentity:rk,scaleImplicit:Fx,scaleLinear:Yd,scaleLog:ik,scaleOrdinal:Nw,scalePoint:Tc,scalePow:Bw,scaleQuantile:sk,scaleQuantize:ck,scaleRadial:lk,scaleSequential:bk,scaleSequentialLog:xk,scaleSequentialPow:Xw,scaleSequentialQuantile:Sk,scaleSequentialSqrt:PG,scaleSequentialSymlog:wk,scaleSqrt:hF,scaleSymlog:ok,scaleThreshold:uk,scaleTime:NG,scaleUtc:MG,tickFormat:nk},Symbol.toStringTag,{value:"Module"}));var b0,SN;function op(){if(SN)return b0;SN=1;var e=ts();function t(n,r,i){for(var l=-1,s=n.length;++l<s;){var u=n[l],f=r(u);if(f!=null&&(d===void 0?f===f&&!e(f):i(f,d)))var d=f,m=u}return m}return b0=t,b0}var x0,jN;function Ak(){if(jN)return x0;jN=1;function e(t,n){return t>n}return x0=e,x0}var w0,ON;function DG(){if(ON)return w0;ON=1;var e=op(),t=Ak(),n=rs();function r(i){return i&&i.length?e(i,n,t):void 0}return w0=r,w0}var kG=DG();const lp=rt(kG);var S0,_N;function Ek(){if(_N)return S0;_N=1;function e(t,n){return t<n}return S0=e,S0}var j0,AN;function $G(){if(AN)return j0;AN=1;var e=op(),t=Ek(),n=rs();function r(i){return i&&i.length?e(i,n,t):void 0}return j0=r,j0}var LG=$G();const sp=rt(LG);var O0,EN;function IG(){if(EN)return O0;EN=1;var e=dw(),t=Dr(),n=kD(),r=jn();function i(l,s){var u=r(l)?e:n;return u(l,t(s,3))}return O0=i,O0}var _0,TN;function qG(){if(TN)return _0;TN=1;var e=RD(),t=IG();function n(r,i){return e(t(r,i),1)}return _0=n,_0}var BG=qG();const zG=rt(BG);var A0,CN;function UG(){if(CN)return A0;CN=1;var e=_w();function t(n,r){return e(n,r)}return A0=t,A0}var HG=UG();const cp=rt(HG);var os=1e9,FG={precision:20,rounding:4,toExpNeg:-7,toExpPos:21,LN10:"2.302585092994045684017991454684364207601101488628772976033327900967572609677352480235997205089598298341967784042286"},Qw,Ot=!0,nr="[DecimalError] ",Gi=nr+"Invalid argument: ",Zw=nr+"Exponent out of range: ",ls=Math.floor,Ii=Math.pow,GG=/^(\d+(\.\d*)?|\.\d+)(e[+-]?\d+)?$/i,$n,Kt=1e7,wt=7,Tk=9007199254740991,Zd=ls(Tk/wt),ye={};ye.absoluteValue=ye.abs=function(){var e=new this.constructor(this);return e.s&&(e.s=1),e};ye.comparedTo=ye.cmp=function(e){var t,n,r,i,l=this;if(e=new l.constructor(e),l.s!==e.s)return l.s||-e.s;if(l.e!==e.e)return l.e>e.e^l.s<0?1:-1;for(r=l.d.length,i=e.d.length,t=0,n=r<i?r:i;t<n;++t)if(l.d[t]!==e.d[t])return l.d[t]>e.d[t]^l.s<0?1:-1;return r===i?0:r>i^l.s<0?1:-1};ye.decimalPlaces=ye.dp=function(){var e=this,t=e.d.length-1,n=(t-e.e)*wt;if(t=e.d[t],t)for(;t%10==0;t/=10)n--;return n<0?0:n};ye.dividedBy=ye.div=function(e){return la(this,new this.constructor(e))};ye.dividedToIntegerBy=ye.idiv=function(e){var t=this,n=t.constructor;return vt(la(t,new n(e),0,1),n.precision)};ye.equals=ye.eq=function(e){return!this.cmp(e)};ye.exponent=function(){return Lt(this)};ye.greaterThan=ye.gt=function(e){return this.cmp(e)>0};ye.greaterThanOrEqualTo=ye.gte=function(e){return this.cmp(e)>=0};ye.isInteger=ye.isint=function(){return this.e>this.d.length-2};ye.isNegative=ye.isneg=function(){return this.s<0};ye.isPositive=ye.ispos=function(){return this.s>0};ye.isZero=function(){return this.s===0};ye.lessThan=ye.lt=function(e){return this.cmp(e)<0};ye.lessThanOrEqualTo=ye.lte=function(e){return this.cmp(e)<1};ye.logarithm=ye.log=function(e){var t,n=this,r=n.constructor,i=r.precision,l=i+5;if(e===void 0)e=new r(10);else if(e=new r(e),e.s<1||e.eq($n))throw Error(nr+"NaN");if(n.s<1)throw Error(nr+(n.s?"NaN":"-Infinity"));return n.eq($n)?new r(0):(Ot=!1,t=la(Kc(n,l),Kc(e,l),l),Ot=!0,vt(t,i))};ye.minus=ye.sub=function(e){var t=this;return e=new t.constructor(e),t.s==e.s?Mk(t,e):Ck(t,(e.s=-e.s,e))};ye.modulo=ye.mod=function(e){var t,n=this,r=n.constructor,i=r.precision;if(e=new r(e),!e.s)throw Error(nr+"NaN");return n.s?(Ot=!1,t=la(n,e,0,1).times(e),Ot=!0,n.minus(t)):vt(new r(n),i)};ye.naturalExponential=ye.exp=function(){return Nk(this)};ye.naturalLogarithm=ye.ln=function(){return Kc(this)};ye.negated=ye.neg=function(){var e=new this.constructor(this);return e.s=-e.s||0,e};ye.plus=ye.add=function(e){var t=this;return e=new t.constructor(e),t.s==e.s?Ck(t,e):Mk(t,(e.s=-e.s,e))};ye.precision=ye.sd=function(e){var t,n,r,i=this;if(e!==void 0&&e!==!!e&&e!==1&&e!==0)throw Error(Gi+e);if(t=Lt(i)+1,r=i.d.length-1,n=r*wt+1,r=i.d[r],r){for(;r%10==0;r/=10)n--;for(r=i.d[0];r>=10;r/=10)n++}return e&&t>n?t:n};ye.squareRoot=ye.sqrt=function(){var e,t,n,r,i,l,s,u=this,f=u.constructor;if(u.s<1){if(!u.s)return new f(0);throw Error(nr+"NaN")}for(e=Lt(u),Ot=!1,i=Math.sqrt(+u),i==0||i==1/0?(t=_r(u.d),(t.length+e)%2==0&&(t+="0"),i=Math.sqrt(t),e=ls((e+1)/2)-(e<0||e%2),i==1/0?t="5e"+e:(t=i.toExponential(),t=t.slice(0,t.indexOf("e")+1)+e),r=new f(t)):r=new f(i.toString()),n=f.precision,i=s=n+3;;)if(l=r,r=l.plus(la(u,l,s+2)).times(.5),_r(l.d).slice(0,s)===(t=_r(r.d)).slice(0,s)){if(t=t.slice(s-3,s+1),i==s&&t=="4999"){if(vt(l,n+1,0),l.times(l).eq(u)){r=l;break}}else if(t!="9999")break;s+=4}return Ot=!0,vt(r,n)};ye.times=ye.mul=function(e){var t,n,r,i,l,s,u,f,d,m=this,v=m.constructor,g=m.d,x=(e=new v(e)).d;if(!m.s||!e.s)return new v(0);for(e.s*=m.s,n=m.e+e.e,f=g.length,d=x.length,f<d&&(l=g,g=x,x=l,s=f,f=d,d=s),l=[],s=f+d,r=s;r--;)l.push(0);for(r=d;--r>=0;){for(t=0,i=f+r;i>r;)u=l[i]+x[r]*g[i-r-1]+t,l[i--]=u%Kt|0,t=u/Kt|0;l[i]=(l[i]+t)%Kt|0}for(;!l[--s];)l.pop();return t?++n:l.shift(),e.d=l,e.e=n,Ot?vt(e,v.precision):e};ye.toDecimalPlaces=ye.todp=function(e,t){var n=this,r=n.constructor;return n=new r(n),e===void 0?n:(Nr(e,0,os),t===void 0?t=r.rounding:Nr(t,0,8),vt(n,e+Lt(n)+1,t))};ye.toExponential=function(e,t){var n,r=this,i=r.constructor;return e===void 0?n=Qi(r,!0):(Nr(e,0,os),t===void 0?t=i.rounding:Nr(t,0,8),r=vt(new i(r),e+1,t),n=Qi(r,!0,e+1)),n};ye.toFixed=function(e,t){var n,r,i=this,l=i.constructor;return e===void 0?Qi(i):(Nr(e,0,os),t===void 0?t=l.rounding:Nr(t,0,8),r=vt(new l(i),e+Lt(i)+1,t),n=Qi(r.abs(),!1,e+Lt(r)+1),i.isneg()&&!i.isZero()?"-"+n:n)};ye.toInteger=ye.toint=function(){var e=this,t=e.constructor;return vt(new t(e),Lt(e)+1,t.rounding)};ye.toNumber=function(){return+this};ye.toPower=ye.pow=function(e){var t,n,r,i,l,s,u=this,f=u.constructor,d=12,m=+(e=new f(e));if(!e.s)return new f($n);if(u=new f(u),!u.s){if(e.s<1)throw Error(nr+"Infinity");return u}if(u.eq($n))return u;if(r=f.precision,e.eq($n))return vt(u,r);if(t=e.e,n=e.d.length-1,s=t>=n,l=u.s,s){if((n=m<0?-m:m)<=Tk){for(i=new f($n),t=Math.ceil(r/wt+4),Ot=!1;n%2&&(i=i.times(u),MN(i.d,t)),n=ls(n/2),n!==0;)u=u.times(u),MN(u.d,t);return Ot=!0,e.s<0?new f($n).div(i):vt(i,r)}}else if(l<0)throw Error(nr+"NaN");return l=l<0&&e.d[Math.max(t,n)]&1?-1:1,u.s=1,Ot=!1,i=e.times(Kc(u,r+d)),Ot=!0,i=Nk(i),i.s=l,i};ye.toPrecision=function(e,t){var n,r,i=this,l=i.constructor;return e===void 0?(n=Lt(i),r=Qi(i,n<=l.toExpNeg||n>=l.toExpPos)):(Nr(e,1,os),t===void 0?t=l.rounding:Nr(t,0,8),i=vt(new l(i),e,t),n=Lt(i),r=Qi(i,e<=n||n<=l.toExpNeg,e)),r};ye.toSignificantDigits=ye.tosd=function(e,t){var n=this,r=n.constructor;return e===void 0?(e=r.precision,t=r.rounding):(Nr(e,1,os),t===void 0?t=r.rounding:Nr(t,0,8)),vt(new r(n),e,t)};ye.toString=ye.valueOf=ye.val=ye.toJSON=ye[Symbol.for("nodejs.util.inspect.custom")]=function(){var e=this,t=Lt(e),n=e.constructor;return Qi(e,t<=n.toExpNeg||t>=n.toExpPos)};function Ck(e,t){var n,r,i,l,s,u,f,d,m=e.constructor,v=m.precision;if(!e.s||!t.s)return t.s||(t=new m(e)),Ot?vt(t,v):t;if(f=e.d,d=t.d,s=e.e,i=t.e,f=f.slice(),l=s-i,l){for(l<0?(r=f,l=-l,u=d.length):(r=d,i=s,u=f.length),s=Math.ceil(v/wt),u=s>u?s+1:u+1,l>u&&(l=u,r.length=1),r.reverse();l--;)r.push(0);r.reverse()}for(u=f.length,l=d.length,u-l<0&&(l=u,r=d,d=f,f=r),n=0;l;)n=(f[--l]=f[l]+d[l]+n)/Kt|0,f[l]%=Kt;for(n&&(f.unshift(n),++i),u=f.length;f[--u]==0;)f.pop();return t.d=f,t.e=i,Ot?vt(t,v):t}function Nr(e,t,n){if(e!==~~e||e<t||e>n)throw Error(Gi+e)}function _r(e){var t,n,r,i=e.length-1,l="",s=e[0];if(i>0){for(l+=s,t=1;t<i;t++)r=e[t]+"",n=wt-r.length,n&&(l+=Za(n)),l+=r;s=e[t],r=s+"",n=wt-r.length,n&&(l+=Za(n))}else if(s===0)return"0";for(;s%10===0;)s/=10;return l+s}var la=function(){function e(r,i){var l,s=0,u=r.length;for(r=r.slice();u--;)l=r[u]*i+s,r[u]=l%Kt|0,s=l/Kt|0;return s&&r.unshift(s),r}function t(r,i,l,s){var u,f;if(l!=s)f=l>s?1:-1;else for(u=f=0;u<l;u++)if(r[u]!=i[u]){f=r[u]>i[u]?1:-1;break}return f}function n(r,i,l){for(var s=0;l--;)r[l]-=s,s=r[l]<i[l]?1:0,r[l]=s*Kt+r[l]-i[l];for(;!r[0]&&r.length>1;)r.shift()}return function(r,i,l,s){var u,f,d,m,v,g,x,j,w,b,_,O,E,C,A,N,P,D,L=r.constructor,G=r.s==i.s?1:-1,I=r.d,H=i.d;if(!r.s)return new L(r);if(!i.s)throw Error(nr+"Division by zero");for(f=r.e-i.e,P=H.length,A=I.length,x=new L(G),j=x.d=[],d=0;H[d]==(I[d]||0);)++d;if(H[d]>(I[d]||0)&&--f,l==null?O=l=L.precision:s?O=l+(Lt(r)-Lt(i))+1:O=l,O<0)return new L(0);if(O=O/wt+2|0,d=0,P==1)for(m=0,H=H[0],O++;(d<A||m)&&O--;d++)E=m*Kt+(I[d]||0),j[d]=E/H|0,m=E%H|0;else{for(m=Kt/(H[0]+1)|0,m>1&&(H=e(H,m),I=e(I,m),P=H.length,A=I.length),C=P,w=I.slice(0,P),b=w.length;b<P;)w[b++]=0;D=H.slice(),D.unshift(0),N=H[0],H[1]>=Kt/2&&++N;do m=0,u=t(H,w,P,b),u<0?(_=w[0],P!=b&&(_=_*Kt+(w[1]||0)),m=_/N|0,m>1?(m>=Kt&&(m=Kt-1),v=e(H,m),g=v.length,b=w.length,u=t(v,w,g,b),u==1&&(m--,n(v,P<g?D:H,g))):(m==0&&(u=m=1),v=H.slice()),g=v.length,g<b&&v.unshift(0),n(w,v,b),u==-1&&(b=w.length,u=t(H,w,P,b),u<1&&(m++,n(w,P<b?D:H,b))),b=w.length):u===0&&(m++,w=[0]),j[d++]=m,u&&w[0]?w[b++]=I[C]||0:(w=[I[C]],b=1);while((C++<A||w[0]!==void 0)&&O--)}return j[0]||j.shift(),x.e=f,vt(x,s?l+Lt(x)+1:l)}}();function Nk(e,t){var n,r,i,l,s,u,f=0,d=0,m=e.constructor,v=m.precision;if(Lt(e)>16)throw Error(Zw+Lt(e));if(!e.s)return new m($n);for(Ot=!1,u=v,s=new m(.03125);e.abs().gte(.1);)e=e.times(s),d+=5;for(r=Math.log(Ii(2,d))/Math.LN10*2+5|0,u+=r,n=i=l=new m($n),m.precision=u;;){if(i=vt(i.times(e),u),n=n.times(++f),s=l.plus(la(i,n,u)),_r(s.d).slice(0,u)===_r(l.d).slice(0,u)){for(;d--;)l=vt(l.times(l),u);return m.precision=v,t==null?(Ot=!0,vt(l,v)):l}l=s}}function Lt(e){for(var t=e.e*wt,n=e.d[0];n>=10;n/=10)t++;return t}function E0(e,t,n){if(t>e.LN10.sd())throw Ot=!0,n&&(e.precision=n),Error(nr+"LN10 precision limit exceeded");return vt(new e(e.LN10),t)}function Za(e){for(var t="";e--;)t+="0";return t}function Kc(e,t){var n,r,i,l,s,u,f,d,m,v=1,g=10,x=e,j=x.d,w=x.constructor,b=w.precision;if(x.s<1)throw Error(nr+(x.s?"NaN":"-Infinity"));if(x.eq($n))return new w(0);if(t==null?(Ot=!1,d=b):d=t,x.eq(10))return t==null&&(Ot=!0),E0(w,d);if(d+=g,w.precision=d,n=_r(j),r=n.charAt(0),l=Lt(x),Math.abs(l)<15e14){for(;r<7&&r!=1||r==1&&n.charAt(1)>3;)x=x.times(e),n=_r(x.d),r=n.charAt(0),v++;l=Lt(x),r>1?(x=new w("0."+n),l++):x=new w(r+"."+n.slice(1))}else return f=E0(w,d+2,b).times(l+""),x=Kc(new w(r+"."+n.slice(1)),d-g).plus(f),w.precision=b,t==null?(Ot=!0,vt(x,b)):x;for(u=s=x=la(x.minus($n),x.plus($n),d),m=vt(x.times(x),d),i=3;;){if(s=vt(s.times(m),d),f=u.plus(la(s,new w(i),d)),_r(f.d).slice(0,d)===_r(u.d).slice(0,d))return u=u.times(2),l!==0&&(u=u.plus(E0(w,d+2,b).times(l+""))),u=la(u,new w(v),d),w.precision=b,t==null?(Ot=!0,vt(u,b)):u;u=f,i+=2}}function NN(e,t){var n,r,i;for((n=t.indexOf("."))>-1&&(t=t.replace(".","")),(r=t.search(/e/i))>0?(n<0&&(n=r),n+=+t.slice(r+1),t=t.substring(0,r)):n<0&&(n=t.length),r=0;t.charCodeAt(r)===48;)++r;for(i=t.length;t.charCodeAt(i-1)===48;)--i;if(t=t.slice(r,i),t){if(i-=r,n=n-r-1,e.e=ls(n/wt),e.d=[],r=(n+1)%wt,n<0&&(r+=wt),r<i){for(r&&e.d.push(+t.slice(0,r)),i-=wt;r<i;)e.d.push(+t.slice(r,r+=wt));t=t.slice(r),r=wt-t.length}else r-=i;for(;r--;)t+="0";if(e.d.push(+t),Ot&&(e.e>Zd||e.e<-Zd))throw Error(Zw+n)}else e.s=0,e.e=0,e.d=[0];return e}function vt(e,t,n){var r,i,l,s,u,f,d,m,v=e.d;for(s=1,l=v[0];l>=10;l/=10)s++;if(r=t-s,r<0)r+=wt,i=t,d=v[m=0];else{if(m=Math.ceil((r+1)/wt),l=v.length,m>=l)return e;for(d=l=v[m],s=1;l>=10;l/=10)s++;r%=wt,i=r-wt+s}if(n!==void 0&&(l=Ii(10,s-i-1),u=d/l%10|0,f=t<0||v[m+1]!==void 0||d%l,f=n<4?(u||f)&&(n==0||n==(e.s<0?3:2)):u>5||u==5&&(n==4||f||n==6&&(r>0?i>0?d/Ii(10,s-i):0:v[m-1])%10&1||n==(e.s<0?8:7))),t<1||!v[0])return f?(l=Lt(e),v.length=1,t=t-l-1,v[0]=Ii(10,(wt-t%wt)%wt),e.e=ls(-t/wt)||0):(v.length=1,v[0]=e.e=e.s=0),e;if(r==0?(v.length=m,l=1,m--):(v.length=m+1,l=Ii(10,wt-r),v[m]=i>0?(d/Ii(10,s-i)%Ii(10,i)|0)*l:0),f)for(;;)if(m==0){(v[0]+=l)==Kt&&(v[0]=1,++e.e);break}else{if(v[m]+=l,v[m]!=Kt)break;v[m--]=0,l=1}for(r=v.length;v[--r]===0;)v.pop();if(Ot&&(e.e>Zd||e.e<-Zd))throw Error(Zw+Lt(e));return e}function Mk(e,t){var n,r,i,l,s,u,f,d,m,v,g=e.constructor,x=g.precision;if(!e.s||!t.s)return t.s?t.s=-t.s:t=new g(e),Ot?vt(t,x):t;if(f=e.d,v=t.d,r=t.e,d=e.e,f=f.slice(),s=d-r,s){for(m=s<0,m?(n=f,s=-s,u=v.length):(n=v,r=d,u=f.length),i=Math.max(Math.ceil(x/wt),u)+2,s>i&&(s=i,n.length=1),n.reverse(),i=s;i--;)n.push(0);n.reverse()}else{for(i=f.length,u=v.length,m=i<u,m&&(u=i),i=0;i<u;i++)if(f[i]!=v[i]){m=f[i]<v[i];break}s=0}for(m&&(n=f,f=v,v=n,t.s=-t.s),u=f.length,i=v.length-u;i>0;--i)f[u++]=0;for(i=v.length;i>s;){if(f[--i]<v[i]){for(l=i;l&&f[--l]===0;)f[l]=Kt-1;--f[l],f[i]+=Kt}f[i]-=v[i]}for(;f[--u]===0;)f.pop();for(;f[0]===0;f.shift())--r;return f[0]?(t.d=f,t.e=r,Ot?vt(t,x):t):new g(0)}function Qi(e,t,n){var r,i=Lt(e),l=_r(e.d),s=l.length;return t?(n&&(r=n-s)>0?l=l.charAt(0)+"."+l.slice(1)+Za(r):s>1&&(l=l.charAt(0)+"."+l.slice(1)),l=l+(i<0?"e":"e+")+i):i<0?(l="0."+Za(-i-1)+l,n&&(r=n-s)>0&&(l+=Za(r))):i>=s?(l+=Za(i+1-s),n&&(r=n-i-1)>0&&(l=l+"."+Za(r))):((r=i+1)<s&&(l=l.slice(0,r)+"."+l.slice(r)),n&&(r=n-s)>0&&(i+1===s&&(l+="."),l+=Za(r))),e.s<0?"-"+l:l}function MN(e,t){if(e.length>t)return e.length=t,!0}function Pk(e){var t,n,r;function i(l){var s=this;if(!(s instanceof i))return new i(l);if(s.constructor=i,l instanceof i){s.s=l.s,s.e=l.e,s.d=(l=l.d)?l.slice():l;return}if(typeof l=="number"){if(l*0!==0)throw Error(Gi+l);if(l>0)s.s=1;else if(l<0)l=-l,s.s=-1;else{s.s=0,s.e=0,s.d=[0];return}if(l===~~l&&l<1e7){s.e=0,s.d=[l];return}return NN(s,l.toString())}else if(typeof l!="string")throw Error(Gi+l);if(l.charCodeAt(0)===45?(l=l.slice(1),s.s=-1):s.s=1,GG.test(l))NN(s,l);else throw Error(Gi+l)}if(i.prototype=ye,i.ROUND_UP=0,i.ROUND_DOWN=1,i.ROUND_CEIL=2,i.ROUND_FLOOR=3,i.ROUND_HALF_UP=4,i.ROUND_HALF_DOWN=5,i.ROUND_HALF_EVEN=6,i.ROUND_HALF_CEIL=7,i.ROUND_HALF_FLOOR=8,i.clone=Pk,i.config=i.set=VG,e===void 0&&(e={}),e)for(r=["precision","rounding","toExpNeg","toExpPos","LN10"],t=0;t<r.length;)e.hasOwnProperty(n=r[t++])||(e[n]=this[n]);return i.config(e),i}function VG(e){if(!e||typeof e!="object")throw Error(nr+"Object expected");var t,n,r,i=["precision",1,os,"rounding",0,8,"toExpNeg",-1/0,0,"toExpPos",0,1/0];for(t=0;t<i.length;t+=3)if((r=e[n=i[t]])!==void 0)if(ls(r)===r&&r>=i[t+1]&&r<=i[t+2])this[n]=r;else throw Error(Gi+n+": "+r);if((r=e[n="LN10"])!==void 0)if(r==Math.LN10)this[n]=new this(r);else throw Error(Gi+n+": "+r);return this}var Qw=Pk(FG);$n=new Qw(1);const ut=Qw;function YG(e){return ZG(e)||WG(e)||XG(e)||KG()}function KG(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function XG(e,t){if(e){if(typeof e=="string")return Kx(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Kx(e,t)}}function WG(e){if(typeof Symbol<"u"&&Symbol.iterator in Object(e))return Array.from(e)}function ZG(e){if(Array.isArray(e))return Kx(e)}function Kx(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var QG=function(t){return t},Rk={},Dk=function(t){return t===Rk},PN=function(t){return function n(){return arguments.length===0||arguments.length===1&&Dk(arguments.length<=0?void 0:arguments[0])?n:t.apply(void 0,arguments)}},JG=function e(t,n){return t===1?n:PN(function(){for(var r=arguments.length,i=new Array(r),l=0;l<r;l++)i[l]=arguments[l];var s=i.filter(function(u){return u!==Rk}).length;return s>=t?n.apply(void 0,i):e(t-s,PN(function(){for(var u=arguments.length,f=new Array(u),d=0;d<u;d++)f[d]=arguments[d];var m=i.map(function(v){return Dk(v)?f.shift():v});return n.apply(void 0,YG(m).concat(f))}))})},up=function(t){return JG(t.length,t)},Xx=function(t,n){for(var r=[],i=t;i<n;++i)r[i-t]=i;return r},eV=up(function(e,t){return Array.isArray(t)?t.map(e):Object.keys(t).map(function(n){return t[n]}).map(e)}),tV=function(){for(var t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];if(!n.length)return QG;var i=n.reverse(),l=i[0],s=i.slice(1);return function(){return s.reduce(function(u,f){return f(u)},l.apply(void 0,arguments))}},Wx=function(t){return Array.isArray(t)?t.reverse():t.split("").reverse.join("")},kk=function(t){var n=null,r=null;return function(){for(var i=arguments.length,l=new Array(i),s=0;s<i;s++)l[s]=arguments[s];return n&&l.every(function(u,f){return u===n[f]})||(n=l,r=t.apply(void 0,l)),r}};function nV(e){var t;return e===0?t=1:t=Math.floor(new ut(e).abs().log(10).toNumber())+1,t}function rV(e,t,n){for(var r=new ut(e),i=0,l=[];r.lt(t)&&i<1e5;)l.push(r.toNumber()),r=r.add(n),i++;return l}var aV=up(function(e,t,n){var r=+e,i=+t;return r+n*(i-r)}),iV=up(function(e,t,n){var r=t-+e;return r=r||1/0,(n-e)/r}),oV=up(function(e,t,n){var r=t-+e;return r=r||1/0,Math.max(0,Math.min(1,(n-e)/r))});const fp={rangeStep:rV,getDigitCount:nV,interpolateNumber:aV,uninterpolateNumber:iV,uninterpolateTruncation:oV};function Zx(e){return cV(e)||sV(e)||$k(e)||lV()}function lV(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function sV(e){if(typeof Symbol<"u"&&Symbol.iterator in Object(e))return Array.from(e)}function cV(e){if(Array.isArray(e))return Qx(e)}function Xc(e,t){return dV(e)||fV(e,t)||$k(e,t)||uV()}function uV(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function $k(e,t){if(e){if(typeof e=="string")return Qx(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return Qx(e,t)}}function Qx(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function fV(e,t){if(!(typeof Symbol>"u"||!(Symbol.iterator in Object(e)))){var n=[],r=!0,i=!1,l=void 0;try{for(var s=e[Symbol.iterator](),u;!(r=(u=s.next()).done)&&(n.push(u.value),!(t&&n.length===t));r=!0);}catch(f){i=!0,l=f}finally{try{!r&&s.return!=null&&s.return()}finally{if(i)throw l}}return n}}function dV(e){if(Array.isArray(e))return e}function Lk(e){var t=Xc(e,2),n=t[0],r=t[1],i=n,l=r;return n>r&&(i=r,l=n),[i,l]}function Ik(e,t,n){if(e.lte(0))return new ut(0);var r=fp.getDigitCount(e.toNumber()),i=new ut(10).pow(r),l=e.div(i),s=r!==1?.05:.1,u=new ut(Math.ceil(l.div(s).toNumber())).add(n).mul(s),f=u.mul(i);return t?f:new ut(Math.ceil(f))}function hV(e,t,n){var r=1,i=new ut(e);if(!i.isint()&&n){var l=Math.abs(e);l<1?(r=new ut(10).pow(fp.getDigitCount(e)-1),i=new ut(Math.floor(i.div(r).toNumber())).mul(r)):l>1&&(i=new ut(Math.floor(e)))}else e===0?i=new ut(Math.floor((t-1)/2)):n||(i=new ut(Math.floor(e)));var s=Math.floor((t-1)/2),u=tV(eV(function(f){return i.add(new ut(f-s).mul(r)).toNumber()}),Xx);return u(0,t)}function qk(e,t,n,r){var i=arguments.length>4&&arguments[4]!==void 0?arguments[4]:0;if(!Number.isFinite((t-e)/(n-1)))return{step:new ut(0),tickMin:new ut(0),tickMax:new ut(0)};var l=Ik(new ut(t).sub(e).div(n-1),r,i),s;e<=0&&t>=0?s=new ut(0):(s=new ut(e).add(t).div(2),s=s.sub(new ut(s).mod(l)));var u=Math.ceil(s.sub(e).div(l).toNumber()),f=Math.ceil(new ut(t).sub(s).div(l).toNumber()),d=u+f+1;return d>n?qk(e,t,n,r,i+1):(d<n&&(f=t>0?f+(n-d):f,u=t>0?u:u+(n-d)),{step:l,tickMin:s.sub(new ut(u).mul(l)),tickMax:s.add(new ut(f).mul(l))})}function pV(e){var t=Xc(e,2),n=t[0],r=t[1],i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:6,l=arguments.length>2&&arguments[2]!==void 0?arguments[2]:!0,s=Math.max(i,2),u=Lk([n,r]),f=Xc(u,2),d=f[0],m=f[1];if(d===-1/0||m===1/0){var v=m===1/0?[d].concat(Zx(Xx(0,i-1).map(function(){return 1/0}))):[].concat(Zx(Xx(0,i-1).map(function(){return-1/0})),[m]);return n>r?Wx(v):v}if(d===m)return hV(d,i,l);var g=qk(d,m,s,l),x=g.step,j=g.tickMin,w=g.tickMax,b=fp.rangeStep(j,w.add(new ut(.1).mul(x)),x);return n>r?Wx(b):b}function mV(e,t){var n=Xc(e,2),r=n[0],i=n[1],l=arguments.length>2&&arguments[2]!==void 0?arguments[2]:!0,s=Lk([r,i]),u=Xc(s,2),f=u[0],d=u[1];if(f===-1/0||d===1/0)return[r,i];if(f===d)return[f];var m=Math.max(t,2),v=Ik(new ut(d).sub(f).div(m-1),l,0),g=[].concat(Zx(fp.rangeStep(new ut(f),new ut(d).sub(new ut(.99).mul(v)),v)),[d]);return r>i?Wx(g):g}var vV=kk(pV),yV=kk(mV),gV="Invariant failed";function Ji(e,t){throw new Error(gV)}var bV=["offset","layout","width","dataKey","data","dataPointFormatter","xAxis","yAxis"];function Rl(e){"@babel/helpers - typeof";return Rl=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Rl(e)}function Qd(){return Qd=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Qd.apply(this,arguments)}function xV(e,t){return OV(e)||jV(e,t)||SV(e,t)||wV()}function wV(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function SV(e,t){if(e){if(typeof e=="string")return RN(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return RN(e,t)}}function RN(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function jV(e,t){var n=e==null?null:typeof Symbol<"u"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var r,i,l,s,u=[],f=!0,d=!1;try{if(l=(n=n.call(e)).next,t!==0)for(;!(f=(r=l.call(n)).done)&&(u.push(r.value),u.length!==t);f=!0);}catch(m){d=!0,i=m}finally{try{if(!f&&n.return!=null&&(s=n.return(),Object(s)!==s))return}finally{if(d)throw i}}return u}}function OV(e){if(Array.isArray(e))return e}function _V(e,t){if(e==null)return{};var n=AV(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function AV(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}function EV(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function TV(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,Uk(r.key),r)}}function CV(e,t,n){return t&&TV(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e}function NV(e,t,n){return t=Jd(t),MV(e,Bk()?Reflect.construct(t,n||[],Jd(e).constructor):t.apply(e,n))}function MV(e,t){if(t&&(Rl(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return PV(e)}function PV(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Bk(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(Bk=function(){return!!e})()}function Jd(e){return Jd=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},Jd(e)}function RV(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&Jx(e,t)}function Jx(e,t){return Jx=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},Jx(e,t)}function zk(e,t,n){return t=Uk(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Uk(e){var t=DV(e,"string");return Rl(t)=="symbol"?t:t+""}function DV(e,t){if(Rl(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Rl(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}var dp=function(e){function t(){return EV(this,t),NV(this,t,arguments)}return RV(t,e),CV(t,[{key:"render",value:function(){var r=this.props,i=r.offset,l=r.layout,s=r.width,u=r.dataKey,f=r.data,d=r.dataPointFormatter,m=r.xAxis,v=r.yAxis,g=_V(r,bV),x=Me(g,!1);this.props.direction==="x"&&m.type!=="number"&&Ji();var j=f.map(function(w){var b=d(w,u),_=b.x,O=b.y,E=b.value,C=b.errorVal;if(!C)return null;var A=[],N,P;if(Array.isArray(C)){var D=xV(C,2);N=D[0],P=D[1]}else N=P=C;if(l==="vertical"){var L=m.scale,G=O+i,I=G+s,H=G-s,V=L(E-N),Z=L(E+P);A.push({x1:Z,y1:I,x2:Z,y2:H}),A.push({x1:V,y1:G,x2:Z,y2:G}),A.push({x1:V,y1:I,x2:V,y2:H})}else if(l==="horizontal"){var Y=v.scale,$=_+i,U=$-s,B=$+s,re=Y(E-N),k=Y(E+P);A.push({x1:U,y1:k,x2:B,y2:k}),A.push({x1:$,y1:re,x2:$,y2:k}),A.push({x1:U,y1:re,x2:B,y2:re})}return z.createElement(ot,Qd({className:"recharts-errorBar",key:"bar-".concat(A.map(function(X){return"".concat(X.x1,"-").concat(X.x2,"-").concat(X.y1,"-").concat(X.y2)}))},x),A.map(function(X){return z.createElement("line",Qd({},X,{key:"line-".concat(X.x1,"-").concat(X.x2,"-").concat(X.y1,"-").concat(X.y2)}))}))});return z.createElement(ot,{className:"recharts-errorBars"},j)}}])}(z.Component);zk(dp,"defaultProps",{stroke:"black",strokeWidth:1.5,width:5,offset:0,layout:"horizontal"});zk(dp,"displayName","ErrorBar");function Wc(e){"@babel/helpers - typeof";return Wc=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Wc(e)}function DN(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function Di(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?DN(Object(n),!0).forEach(function(r){kV(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):DN(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function kV(e,t,n){return t=$V(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function $V(e){var t=LV(e,"string");return Wc(t)=="symbol"?t:t+""}function LV(e,t){if(Wc(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Wc(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var Hk=function(t){var n=t.children,r=t.formattedGraphicalItems,i=t.legendWidth,l=t.legendContent,s=Dn(n,hl);if(!s)return null;var u=hl.defaultProps,f=u!==void 0?Di(Di({},u),s.props):{},d;return s.props&&s.props.payload?d=s.props&&s.props.payload:l==="children"?d=(r||[]).reduce(function(m,v){var g=v.item,x=v.props,j=x.sectors||x.data||[];return m.concat(j.map(function(w){return{type:s.props.iconType||g.props.legendType,value:w.name,color:w.fill,payload:w}}))},[]):d=(r||[]).map(function(m){var v=m.item,g=v.type.defaultProps,x=g!==void 0?Di(Di({},g),v.props):{},j=x.dataKey,w=x.name,b=x.legendType,_=x.hide;return{inactive:_,dataKey:j,type:f.iconType||b||"square",color:Jw(v),value:w||j,payload:x}}),Di(Di(Di({},f),hl.getWithHeight(s,i)),{},{payload:d,item:s})};function Zc(e){"@babel/helpers - typeof";return Zc=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Zc(e)}function kN(e){return zV(e)||BV(e)||qV(e)||IV()}function IV(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function qV(e,t){if(e){if(typeof e=="string")return e1(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return e1(e,t)}}function BV(e){if(typeof Symbol<"u"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function zV(e){if(Array.isArray(e))return e1(e)}function e1(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function $N(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function Nt(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?$N(Object(n),!0).forEach(function(r){ml(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):$N(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function ml(e,t,n){return t=UV(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function UV(e){var t=HV(e,"string");return Zc(t)=="symbol"?t:t+""}function HV(e,t){if(Zc(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Zc(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function cn(e,t,n){return Ve(e)||Ve(t)?n:Ut(t)?Ln(e,t,n):Re(t)?t(e):n}function Cc(e,t,n,r){var i=zG(e,function(u){return cn(u,t)});if(n==="number"){var l=i.filter(function(u){return fe(u)||parseFloat(u)});return l.length?[sp(l),lp(l)]:[1/0,-1/0]}var s=r?i.filter(function(u){return!Ve(u)}):i;return s.map(function(u){return Ut(u)||u instanceof Date?u:""})}var FV=function(t){var n,r=arguments.length>1&&arguments[1]!==void 0?arguments[1]:[],i=arguments.length>2?arguments[2]:void 0,l=arguments.length>3?arguments[3]:void 0,s=-1,u=(n=r==null?void 0:r.length)!==null&&n!==void 0?n:0;if(u<=1)return 0;if(l&&l.axisType==="angleAxis"&&Math.abs(Math.abs(l.range[1]-l.range[0])-360)<=1e-6)for(var f=l.range,d=0;d<u;d++){var m=d>0?i[d-1].coordinate:i[u-1].coordinate,v=i[d].coordinate,g=d>=u-1?i[0].coordinate:i[d+1].coordinate,x=void 0;if(hn(v-m)!==hn(g-v)){var j=[];if(hn(g-v)===hn(f[1]-f[0])){x=g;var w=v+f[1]-f[0];j[0]=Math.min(w,(w+m)/2),j[1]=Math.max(w,(w+m)/2)}else{x=m;var b=g+f[1]-f[0];j[0]=Math.min(v,(b+v)/2),j[1]=Math.max(v,(b+v)/2)}var _=[Math.min(v,(x+v)/2),Math.max(v,(x+v)/2)];if(t>_[0]&&t<=_[1]||t>=j[0]&&t<=j[1]){s=i[d].index;break}}else{var O=Math.min(m,g),E=Math.max(m,g);if(t>(O+v)/2&&t<=(E+v)/2){s=i[d].index;break}}}else for(var C=0;C<u;C++)if(C===0&&t<=(r[C].coordinate+r[C+1].coordinate)/2||C>0&&C<u-1&&t>(r[C].coordinate+r[C-1].coordinate)/2&&t<=(r[C].coordinate+r[C+1].coordinate)/2||C===u-1&&t>(r[C].coordinate+r[C-1].coordinate)/2){s=r[C].index;break}return s},Jw=function(t){var n,r=t,i=r.type.displayName,l=(n=t.type)!==null&&n!==void 0&&n.defaultProps?Nt(Nt({},t.type.defaultProps),t.props):t.props,s=l.stroke,u=l.fill,f;switch(i){case"Line":f=s;break;case"Area":case"Radar":f=s&&s!=="none"?s:u;break;default:f=u;break}return f},GV=function(t){var n=t.barSize,r=t.totalSize,i=t.stackGroups,l=i===void 0?{}:i;if(!l)return{};for(var s={},u=Object.keys(l),f=0,d=u.length;f<d;f++)for(var m=l[u[f]].stackGroups,v=Object.keys(m),g=0,x=v.length;g<x;g++){var j=m[v[g]],w=j.items,b=j.cateAxisId,_=w.filter(function(P){return oa(P.type).indexOf("Bar")>=0});if(_&&_.length){var O=_[0].type.defaultProps,E=O!==void 0?Nt(Nt({},O),_[0].props):_[0].props,C=E.barSize,A=E[b];s[A]||(s[A]=[]);var N=Ve(C)?n:C;s[A].push({item:_[0],stackList:_.slice(1),barSize:Ve(N)?void 0:pn(N,r,0)})}}return s},VV=function(t){var n=t.barGap,r=t.barCategoryGap,i=t.bandSize,l=t.sizeList,s=l===void 0?[]:l,u=t.maxBarSize,f=s.length;if(f<1)return null;var d=pn(n,i,0,!0),m,v=[];if(s[0].barSize===+s[0].barSize){var g=!1,x=i/f,j=s.reduce(function(C,A){return C+A.barSize||0},0);j+=(f-1)*d,j>=i&&(j-=(f-1)*d,d=0),j>=i&&x>0&&(g=!0,x*=.9,j=f*x);var w=(i-j)/2>>0,b={offset:w-d,size:0};m=s.reduce(function(C,A){var N={item:A.item,position:{offset:b.offset+b.size+d,size:g?x:A.barSize}},P=[].concat(kN(C),[N]);return b=P[P.length-1].position,A.stackList&&A.stackList.length&&A.stackList.forEach(function(D){P.push({item:D,position:b})}),P},v)}else{var _=pn(r,i,0,!0);i-2*_-(f-1)*d<=0&&(d=0);var O=(i-2*_-(f-1)*d)/f;O>1&&(O>>=0);var E=u===+u?Math.min(O,u):O;m=s.reduce(function(C,A,N){var P=[].concat(kN(C),[{item:A.item,position:{offset:_+(O+d)*N+(O-E)/2,size:E}}]);return A.stackList&&A.stackList.length&&A.stackList.forEach(function(D){P.push({item:D,position:P[P.length-1].position})}),P},v)}return m},YV=function(t,n,r,i){var l=r.children,s=r.width,u=r.margin,f=s-(u.left||0)-(u.right||0),d=Hk({children:l,legendWidth:f});if(d){var m=i||{},v=m.width,g=m.height,x=d.align,j=d.verticalAlign,w=d.layout;if((w==="vertical"||w==="horizontal"&&j==="middle")&&x!=="center"&&fe(t[x]))return Nt(Nt({},t),{},ml({},x,t[x]+(v||0)));if((w==="horizontal"||w==="vertical"&&x==="center")&&j!=="middle"&&fe(t[j]))return Nt(Nt({},t),{},ml({},j,t[j]+(g||0)))}return t},KV=function(t,n,r){return Ve(n)?!0:t==="horizontal"?n==="yAxis":t==="vertical"||r==="x"?n==="xAxis":r==="y"?n==="yAxis":!0},Fk=function(t,n,r,i,l){var s=n.props.children,u=tr(s,dp).filter(function(d){return KV(i,l,d.props.direction)});if(u&&u.length){var f=u.map(function(d){return d.props.dataKey});return t.reduce(function(d,m){var v=cn(m,r);if(Ve(v))return d;var g=Array.isArray(v)?[sp(v),lp(v)]:[v,v],x=f.reduce(function(j,w){var b=cn(m,w,0),_=g[0]-Math.abs(Array.isArray(b)?b[0]:b),O=g[1]+Math.abs(Array.isArray(b)?b[1]:b);return[Math.min(_,j[0]),Math.max(O,j[1])]},[1/0,-1/0]);return[Math.min(x[0],d[0]),Math.max(x[1],d[1])]},[1/0,-1/0])}return null},XV=function(t,n,r,i,l){var s=n.map(function(u){return Fk(t,u,r,l,i)}).filter(function(u){return!Ve(u)});return s&&s.length?s.reduce(function(u,f){return[Math.min(u[0],f[0]),Math.max(u[1],f[1])]},[1/0,-1/0]):null},Gk=function(t,n,r,i,l){var s=n.map(function(f){var d=f.props.dataKey;return r==="number"&&d&&Fk(t,f,d,i)||Cc(t,d,r,l)});if(r==="number")return s.reduce(function(f,d){return[Math.min(f[0],d[0]),Math.max(f[1],d[1])]},[1/0,-1/0]);var u={};return s.reduce(function(f,d){for(var m=0,v=d.length;m<v;m++)u[d[m]]||(u[d[m]]=!0,f.push(d[m]));return f},[])},Vk=function(t,n){return t==="horizontal"&&n==="xAxis"||t==="vertical"&&n==="yAxis"||t==="centric"&&n==="angleAxis"||t==="radial"&&n==="radiusAxis"},Yk=function(t,n,r,i){if(i)return t.map(function(f){return f.coordinate});var l,s,u=t.map(function(f){return f.coordinate===n&&(l=!0),f.coordinate===r&&(s=!0),f.coordinate});return l||u.push(n),s||u.push(r),u},aa=function(t,n,r){if(!t)return null;var i=t.scale,l=t.duplicateDomain,s=t.type,u=t.range,f=t.realScaleType==="scaleBand"?i.bandwidth()/2:2,d=(n||r)&&s==="category"&&i.bandwidth?i.bandwidth()/f:0;if(d=t.axisType==="angleAxis"&&(u==null?void 0:u.length)>=2?hn(u[0]-u[1])*2*d:d,n&&(t.ticks||t.niceTicks)){var m=(t.ticks||t.niceTicks).map(function(v){var g=l?l.indexOf(v):v;return{coordinate:i(g)+d,value:v,offset:d}});return m.filter(function(v){return!Ou(v.coordinate)})}return t.isCategorical&&t.categoricalDomain?t.categoricalDomain.map(function(v,g){return{coordinate:i(v)+d,value:v,index:g,offset:d}}):i.ticks&&!r?i.ticks(t.tickCount).map(function(v){return{coordinate:i(v)+d,value:v,offset:d}}):i.domain().map(function(v,g){return{coordinate:i(v)+d,value:l?l[v]:v,index:g,offset:d}})},T0=new WeakMap,ld=function(t,n){if(typeof n!="function")return t;T0.has(t)||T0.set(t,new WeakMap);var r=T0.get(t);if(r.has(n))return r.get(n);var i=function(){t.apply(void 0,arguments),n.apply(void 0,arguments)};return r.set(n,i),i},Kk=function(t,n,r){var i=t.scale,l=t.type,s=t.layout,u=t.axisType;if(i==="auto")return s==="radial"&&u==="radiusAxis"?{scale:Hc(),realScaleType:"band"}:s==="radial"&&u==="angleAxis"?{scale:Yd(),realScaleType:"linear"}:l==="category"&&n&&(n.indexOf("LineChart")>=0||n.indexOf("AreaChart")>=0||n.indexOf("ComposedChart")>=0&&!r)?{scale:Tc(),realScaleType:"point"}:l==="category"?{scale:Hc(),realScaleType:"band"}:{scale:Yd(),realScaleType:"linear"};if(Xi(i)){var f="scale".concat(Vh(i));return{scale:(wN[f]||Tc)(),realScaleType:wN[f]?f:"point"}}return Re(i)?{scale:i}:{scale:Tc(),realScaleType:"point"}},LN=1e-4,Xk=function(t){var n=t.domain();if(!(!n||n.length<=2)){var r=n.length,i=t.range(),l=Math.min(i[0],i[1])-LN,s=Math.max(i[0],i[1])+LN,u=t(n[0]),f=t(n[r-1]);(u<l||u>s||f<l||f>s)&&t.domain([n[0],n[r-1]])}},WV=function(t,n){if(!t)return null;for(var r=0,i=t.length;r<i;r++)if(t[r].item===n)return t[r].position;return null},ZV=function(t,n){if(!n||n.length!==2||!fe(n[0])||!fe(n[1]))return t;var r=Math.min(n[0],n[1]),i=Math.max(n[0],n[1]),l=[t[0],t[1]];return(!fe(t[0])||t[0]<r)&&(l[0]=r),(!fe(t[1])||t[1]>i)&&(l[1]=i),l[0]>i&&(l[0]=i),l[1]<r&&(l[1]=r),l},QV=function(t){var n=t.length;if(!(n<=0))for(var r=0,i=t[0].length;r<i;++r)for(var l=0,s=0,u=0;u<n;++u){var f=Ou(t[u][r][1])?t[u][r][0]:t[u][r][1];f>=0?(t[u][r][0]=l,t[u][r][1]=l+f,l=t[u][r][1]):(t[u][r][0]=s,t[u][r][1]=s+f,s=t[u][r][1])}},JV=function(t){var n=t.length;if(!(n<=0))for(var r=0,i=t[0].length;r<i;++r)for(var l=0,s=0;s<n;++s){var u=Ou(t[s][r][1])?t[s][r][0]:t[s][r][1];u>=0?(t[s][r][0]=l,t[s][r][1]=l+u,l=t[s][r][1]):(t[s][r][0]=0,t[s][r][1]=0)}},eY={sign:QV,expand:z5,none:_l,silhouette:U5,wiggle:H5,positive:JV},tY=function(t,n,r){var i=n.map(function(u){return u.props.dataKey}),l=eY[r],s=B5().keys(i).value(function(u,f){return+cn(u,f,0)}).order(Nx).offset(l);return s(t)},nY=function(t,n,r,i,l,s){if(!t)return null;var u=s?n.reverse():n,f={},d=u.reduce(function(v,g){var x,j=(x=g.type)!==null&&x!==void 0&&x.defaultProps?Nt(Nt({},g.type.defaultProps),g.props):g.props,w=j.stackId,b=j.hide;if(b)return v;var _=j[r],O=v[_]||{hasStack:!1,stackGroups:{}};if(Ut(w)){var E=O.stackGroups[w]||{numericAxisId:r,cateAxisId:i,items:[]};E.items.push(g),O.hasStack=!0,O.stackGroups[w]=E}else O.stackGroups[_u("_stackId_")]={numericAxisId:r,cateAxisId:i,items:[g]};return Nt(Nt({},v),{},ml({},_,O))},f),m={};return Object.keys(d).reduce(function(v,g){var x=d[g];if(x.hasStack){var j={};x.stackGroups=Object.keys(x.stackGroups).reduce(function(w,b){var _=x.stackGroups[b];return Nt(Nt({},w),{},ml({},b,{numericAxisId:r,cateAxisId:i,items:_.items,stackedData:tY(t,_.items,l)}))},j)}return Nt(Nt({},v),{},ml({},g,x))},m)},Wk=function(t,n){var r=n.realScaleType,i=n.type,l=n.tickCount,s=n.originalDomain,u=n.allowDecimals,f=r||n.scale;if(f!=="auto"&&f!=="linear")return null;if(l&&i==="number"&&s&&(s[0]==="auto"||s[1]==="auto")){var d=t.domain();if(!d.length)return null;var m=vV(d,l,u);return t.domain([sp(m),lp(m)]),{niceTicks:m}}if(l&&i==="number"){var v=t.domain(),g=yV(v,l,u);return{niceTicks:g}}return null},IN=function(t){var n=t.axis,r=t.ticks,i=t.offset,l=t.bandSize,s=t.entry,u=t.index;if(n.type==="category")return r[u]?r[u].coordinate+i:null;var f=cn(s,n.dataKey,n.domain[u]);return Ve(f)?null:n.scale(f)-l/2+i},rY=function(t){var n=t.numericAxis,r=n.scale.domain();if(n.type==="number"){var i=Math.min(r[0],r[1]),l=Math.max(r[0],r[1]);return i<=0&&l>=0?0:l<0?l:i}return r[0]},aY=function(t,n){var r,i=(r=t.type)!==null&&r!==void 0&&r.defaultProps?Nt(Nt({},t.type.defaultProps),t.props):t.props,l=i.stackId;if(Ut(l)){var s=n[l];if(s){var u=s.items.indexOf(t);return u>=0?s.stackedData[u]:null}}return null},iY=function(t){return t.reduce(function(n,r){return[sp(r.concat([n[0]]).filter(fe)),lp(r.concat([n[1]]).filter(fe))]},[1/0,-1/0])},Zk=function(t,n,r){return Object.keys(t).reduce(function(i,l){var s=t[l],u=s.stackedData,f=u.reduce(function(d,m){var v=iY(m.slice(n,r+1));return[Math.min(d[0],v[0]),Math.max(d[1],v[1])]},[1/0,-1/0]);return[Math.min(f[0],i[0]),Math.max(f[1],i[1])]},[1/0,-1/0]).map(function(i){return i===1/0||i===-1/0?0:i})},qN=/^dataMin[\s]*-[\s]*([0-9]+([.]{1}[0-9]+){0,1})$/,BN=/^dataMax[\s]*\+[\s]*([0-9]+([.]{1}[0-9]+){0,1})$/,t1=function(t,n,r){if(Re(t))return t(n,r);if(!Array.isArray(t))return n;var i=[];if(fe(t[0]))i[0]=r?t[0]:Math.min(t[0],n[0]);else if(qN.test(t[0])){var l=+qN.exec(t[0])[1];i[0]=n[0]-l}else Re(t[0])?i[0]=t[0](n[0]):i[0]=n[0];if(fe(t[1]))i[1]=r?t[1]:Math.max(t[1],n[1]);else if(BN.test(t[1])){var s=+BN.exec(t[1])[1];i[1]=n[1]+s}else Re(t[1])?i[1]=t[1](n[1]):i[1]=n[1];return i},eh=function(t,n,r){if(t&&t.scale&&t.scale.bandwidth){var i=t.scale.bandwidth();if(!r||i>0)return i}if(t&&n&&n.length>=2){for(var l=Ew(n,function(v){return v.coordinate}),s=1/0,u=1,f=l.length;u<f;u++){var d=l[u],m=l[u-1];s=Math.min((d.coordinate||0)-(m.coordinate||0),s)}return s===1/0?0:s}return r?void 0:0},zN=function(t,n,r){return!t||!t.length||cp(t,Ln(r,"type.defaultProps.domain"))?n:t},Qk=function(t,n){var r=t.type.defaultProps?Nt(Nt({},t.type.defaultProps),t.props):t.props,i=r.dataKey,l=r.name,s=r.unit,u=r.formatter,f=r.tooltipType,d=r.chartType,m=r.hide;return Nt(Nt({},Me(t,!1)),{},{dataKey:i,unit:s,formatter:u,name:l||i,color:Jw(t),value:cn(n,i),type:f,payload:n,chartType:d,hide:m})};function Qc(e){"@babel/helpers - typeof";return Qc=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Qc(e)}function UN(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function ta(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?UN(Object(n),!0).forEach(function(r){Jk(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):UN(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function Jk(e,t,n){return t=oY(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function oY(e){var t=lY(e,"string");return Qc(t)=="symbol"?t:t+""}function lY(e,t){if(Qc(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Qc(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function sY(e,t){return dY(e)||fY(e,t)||uY(e,t)||cY()}function cY(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function uY(e,t){if(e){if(typeof e=="string")return HN(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return HN(e,t)}}function HN(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function fY(e,t){var n=e==null?null:typeof Symbol<"u"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var r,i,l,s,u=[],f=!0,d=!1;try{if(l=(n=n.call(e)).next,t!==0)for(;!(f=(r=l.call(n)).done)&&(u.push(r.value),u.length!==t);f=!0);}catch(m){d=!0,i=m}finally{try{if(!f&&n.return!=null&&(s=n.return(),Object(s)!==s))return}finally{if(d)throw i}}return u}}function dY(e){if(Array.isArray(e))return e}var th=Math.PI/180,hY=function(t){return t*180/Math.PI},xt=function(t,n,r,i){return{x:t+Math.cos(-th*i)*r,y:n+Math.sin(-th*i)*r}},e4=function(t,n){var r=arguments.length>2&&arguments[2]!==void 0?arguments[2]:{top:0,right:0,bottom:0,left:0};return Math.min(Math.abs(t-(r.left||0)-(r.right||0)),Math.abs(n-(r.top||0)-(r.bottom||0)))/2},pY=function(t,n,r,i,l){var s=t.width,u=t.height,f=t.startAngle,d=t.endAngle,m=pn(t.cx,s,s/2),v=pn(t.cy,u,u/2),g=e4(s,u,r),x=pn(t.innerRadius,g,0),j=pn(t.outerRadius,g,g*.8),w=Object.keys(n);return w.reduce(function(b,_){var O=n[_],E=O.domain,C=O.reversed,A;if(Ve(O.range))i==="angleAxis"?A=[f,d]:i==="radiusAxis"&&(A=[x,j]),C&&(A=[A[1],A[0]]);else{A=O.range;var N=A,P=sY(N,2);f=P[0],d=P[1]}var D=Kk(O,l),L=D.realScaleType,G=D.scale;G.domain(E).range(A),Xk(G);var I=Wk(G,ta(ta({},O),{},{realScaleType:L})),H=ta(ta(ta({},O),I),{},{range:A,radius:j,realScaleType:L,scale:G,cx:m,cy:v,innerRadius:x,outerRadius:j,startAngle:f,endAngle:d});return ta(ta({},b),{},Jk({},_,H))},{})},mY=function(t,n){var r=t.x,i=t.y,l=n.x,s=n.y;return Math.sqrt(Math.pow(r-l,2)+Math.pow(i-s,2))},vY=function(t,n){var r=t.x,i=t.y,l=n.cx,s=n.cy,u=mY({x:r,y:i},{x:l,y:s});if(u<=0)return{radius:u};var f=(r-l)/u,d=Math.acos(f);return i>s&&(d=2*Math.PI-d),{radius:u,angle:hY(d),angleInRadian:d}},yY=function(t){var n=t.startAngle,r=t.endAngle,i=Math.floor(n/360),l=Math.floor(r/360),s=Math.min(i,l);return{startAngle:n-s*360,endAngle:r-s*360}},gY=function(t,n){var r=n.startAngle,i=n.endAngle,l=Math.floor(r/360),s=Math.floor(i/360),u=Math.min(l,s);return t+u*360},FN=function(t,n){var r=t.x,i=t.y,l=vY({x:r,y:i},n),s=l.radius,u=l.angle,f=n.innerRadius,d=n.outerRadius;if(s<f||s>d)return!1;if(s===0)return!0;var m=yY(n),v=m.startAngle,g=m.endAngle,x=u,j;if(v<=g){for(;x>g;)x-=360;for(;x<v;)x+=360;j=x>=v&&x<=g}else{for(;x>v;)x-=360;for(;x<g;)x+=360;j=x>=g&&x<=v}return j?ta(ta({},n),{},{radius:s,angle:gY(x,n)}):null},t4=function(t){return!T.isValidElement(t)&&!Re(t)&&typeof t!="boolean"?t.className:""};function Jc(e){"@babel/helpers - typeof";return Jc=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Jc(e)}var bY=["offset"];function xY(e){return OY(e)||jY(e)||SY(e)||wY()}function wY(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function SY(e,t){if(e){if(typeof e=="string")return n1(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return n1(e,t)}}function jY(e){if(typeof Symbol<"u"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function OY(e){if(Array.isArray(e))return n1(e)}function n1(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function _Y(e,t){if(e==null)return{};var n=AY(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function AY(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}function GN(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function zt(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?GN(Object(n),!0).forEach(function(r){EY(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):GN(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function EY(e,t,n){return t=TY(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function TY(e){var t=CY(e,"string");return Jc(t)=="symbol"?t:t+""}function CY(e,t){if(Jc(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Jc(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function eu(){return eu=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},eu.apply(this,arguments)}var NY=function(t){var n=t.value,r=t.formatter,i=Ve(t.children)?n:t.children;return Re(r)?r(i):i},MY=function(t,n){var r=hn(n-t),i=Math.min(Math.abs(n-t),360);return r*i},PY=function(t,n,r){var i=t.position,l=t.viewBox,s=t.offset,u=t.className,f=l,d=f.cx,m=f.cy,v=f.innerRadius,g=f.outerRadius,x=f.startAngle,j=f.endAngle,w=f.clockWise,b=(v+g)/2,_=MY(x,j),O=_>=0?1:-1,E,C;i==="insideStart"?(E=x+O*s,C=w):i==="insideEnd"?(E=j-O*s,C=!w):i==="end"&&(E=j+O*s,C=w),C=_<=0?C:!C;var A=xt(d,m,b,E),N=xt(d,m,b,E+(C?1:-1)*359),P="M".concat(A.x,",").concat(A.y,`
-    A`).concat(b,",").concat(b,",0,1,").concat(C?0:1,`,
-    `).concat(N.x,",").concat(N.y),D=Ve(t.id)?_u("recharts-radial-line-"):t.id;return z.createElement("text",eu({},r,{dominantBaseline:"central",className:qe("recharts-radial-bar-label",u)}),z.createElement("defs",null,z.createElement("path",{id:D,d:P})),z.createElement("textPath",{xlinkHref:"#".concat(D)},n))},RY=function(t){var n=t.viewBox,r=t.offset,i=t.position,l=n,s=l.cx,u=l.cy,f=l.innerRadius,d=l.outerRadius,m=l.startAngle,v=l.endAngle,g=(m+v)/2;if(i==="outside"){var x=xt(s,u,d+r,g),j=x.x,w=x.y;return{x:j,y:w,textAnchor:j>=s?"start":"end",verticalAnchor:"middle"}}if(i==="center")return{x:s,y:u,textAnchor:"middle",verticalAnchor:"middle"};if(i==="centerTop")return{x:s,y:u,textAnchor:"middle",verticalAnchor:"start"};if(i==="centerBottom")return{x:s,y:u,textAnchor:"middle",verticalAnchor:"end"};var b=(f+d)/2,_=xt(s,u,b,g),O=_.x,E=_.y;return{x:O,y:E,textAnchor:"middle",verticalAnchor:"middle"}},DY=function(t){var n=t.viewBox,r=t.parentViewBox,i=t.offset,l=t.position,s=n,u=s.x,f=s.y,d=s.width,m=s.height,v=m>=0?1:-1,g=v*i,x=v>0?"end":"start",j=v>0?"start":"end",w=d>=0?1:-1,b=w*i,_=w>0?"end":"start",O=w>0?"start":"end";if(l==="top"){var E={x:u+d/2,y:f-v*i,textAnchor:"middle",verticalAnchor:x};return zt(zt({},E),r?{height:Math.max(f-r.y,0),width:d}:{})}if(l==="bottom"){var C={x:u+d/2,y:f+m+g,textAnchor:"middle",verticalAnchor:j};return zt(zt({},C),r?{height:Math.max(r.y+r.height-(f+m),0),width:d}:{})}if(l==="left"){var A={x:u-b,y:f+m/2,textAnchor:_,verticalAnchor:"middle"};return zt(zt({},A),r?{width:Math.max(A.x-r.x,0),height:m}:{})}if(l==="right"){var N={x:u+d+b,y:f+m/2,textAnchor:O,verticalAnchor:"middle"};return zt(zt({},N),r?{width:Math.max(r.x+r.width-N.x,0),height:m}:{})}var P=r?{width:d,height:m}:{};return l==="insideLeft"?zt({x:u+b,y:f+m/2,textAnchor:O,verticalAnchor:"middle"},P):l==="insideRight"?zt({x:u+d-b,y:f+m/2,textAnchor:_,verticalAnchor:"middle"},P):l==="insideTop"?zt({x:u+d/2,y:f+g,textAnchor:"middle",verticalAnchor:j},P):l==="insideBottom"?zt({x:u+d/2,y:f+m-g,textAnchor:"middle",verticalAnchor:x},P):l==="insideTopLeft"?zt({x:u+b,y:f+g,textAnchor:O,verticalAnchor:j},P):l==="insideTopRight"?zt({x:u+d-b,y:f+g,textAnchor:_,verticalAnchor:j},P):l==="insideBottomLeft"?zt({x:u+b,y:f+m-g,textAnchor:O,verticalAnchor:x},P):l==="insideBottomRight"?zt({x:u+d-b,y:f+m-g,textAnchor:_,verticalAnchor:x},P):ns(l)&&(fe(l.x)||Bi(l.x))&&(fe(l.y)||Bi(l.y))?zt({x:u+pn(l.x,d),y:f+pn(l.y,m),textAnchor:"end",verticalAnchor:"end"},P):zt({x:u+d/2,y:f+m/2,textAnchor:"middle",verticalAnchor:"middle"},P)},kY=function(t){return"cx"in t&&fe(t.cx)};function Xt(e){var t=e.offset,n=t===void 0?5:t,r=_Y(e,bY),i=zt({offset:n},r),l=i.viewBox,s=i.position,u=i.value,f=i.children,d=i.content,m=i.className,v=m===void 0?"":m,g=i.textBreakAll;if(!l||Ve(u)&&Ve(f)&&!T.isValidElement(d)&&!Re(d))return null;if(T.isValidElement(d))return T.cloneElement(d,i);var x;if(Re(d)){if(x=T.createElement(d,i),T.isValidElement(x))return x}else x=NY(i);var j=kY(l),w=Me(i,!0);if(j&&(s==="insideStart"||s==="insideEnd"||s==="end"))return PY(i,x,w);var b=j?RY(i):DY(i);return z.createElement(Zi,eu({className:qe("recharts-label",v)},w,b,{breakAll:g}),x)}Xt.displayName="Label";var n4=function(t){var n=t.cx,r=t.cy,i=t.angle,l=t.startAngle,s=t.endAngle,u=t.r,f=t.radius,d=t.innerRadius,m=t.outerRadius,v=t.x,g=t.y,x=t.top,j=t.left,w=t.width,b=t.height,_=t.clockWise,O=t.labelViewBox;if(O)return O;if(fe(w)&&fe(b)){if(fe(v)&&fe(g))return{x:v,y:g,width:w,height:b};if(fe(x)&&fe(j))return{x,y:j,width:w,height:b}}return fe(v)&&fe(g)?{x:v,y:g,width:0,height:0}:fe(n)&&fe(r)?{cx:n,cy:r,startAngle:l||i||0,endAngle:s||i||0,innerRadius:d||0,outerRadius:m||f||u||0,clockWise:_}:t.viewBox?t.viewBox:{}},$Y=function(t,n){return t?t===!0?z.createElement(Xt,{key:"label-implicit",viewBox:n}):Ut(t)?z.createElement(Xt,{key:"label-implicit",viewBox:n,value:t}):T.isValidElement(t)?t.type===Xt?T.cloneElement(t,{key:"label-implicit",viewBox:n}):z.createElement(Xt,{key:"label-implicit",content:t,viewBox:n}):Re(t)?z.createElement(Xt,{key:"label-implicit",content:t,viewBox:n}):ns(t)?z.createElement(Xt,eu({viewBox:n},t,{key:"label-implicit"})):null:null},LY=function(t,n){var r=arguments.length>2&&arguments[2]!==void 0?arguments[2]:!0;if(!t||!t.children&&r&&!t.label)return null;var i=t.children,l=n4(t),s=tr(i,Xt).map(function(f,d){return T.cloneElement(f,{viewBox:n||l,key:"label-".concat(d)})});if(!r)return s;var u=$Y(t.label,n||l);return[u].concat(xY(s))};Xt.parseViewBox=n4;Xt.renderCallByParent=LY;var C0,VN;function IY(){if(VN)return C0;VN=1;function e(t){var n=t==null?0:t.length;return n?t[n-1]:void 0}return C0=e,C0}var qY=IY();const BY=rt(qY);function tu(e){"@babel/helpers - typeof";return tu=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},tu(e)}var zY=["valueAccessor"],UY=["data","dataKey","clockWise","id","textBreakAll"];function HY(e){return YY(e)||VY(e)||GY(e)||FY()}function FY(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function GY(e,t){if(e){if(typeof e=="string")return r1(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return r1(e,t)}}function VY(e){if(typeof Symbol<"u"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function YY(e){if(Array.isArray(e))return r1(e)}function r1(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function nh(){return nh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},nh.apply(this,arguments)}function YN(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function KN(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?YN(Object(n),!0).forEach(function(r){KY(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):YN(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function KY(e,t,n){return t=XY(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function XY(e){var t=WY(e,"string");return tu(t)=="symbol"?t:t+""}function WY(e,t){if(tu(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(tu(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function XN(e,t){if(e==null)return{};var n=ZY(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function ZY(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}var QY=function(t){return Array.isArray(t.value)?BY(t.value):t.value};function ni(e){var t=e.valueAccessor,n=t===void 0?QY:t,r=XN(e,zY),i=r.data,l=r.dataKey,s=r.clockWise,u=r.id,f=r.textBreakAll,d=XN(r,UY);return!i||!i.length?null:z.createElement(ot,{className:"recharts-label-list"},i.map(function(m,v){var g=Ve(l)?n(m,v):cn(m&&m.payload,l),x=Ve(u)?{}:{id:"".concat(u,"-").concat(v)};return z.createElement(Xt,nh({},Me(m,!0),d,x,{parentViewBox:m.parentViewBox,value:g,textBreakAll:f,viewBox:Xt.parseViewBox(Ve(s)?m:KN(KN({},m),{},{clockWise:s})),key:"label-".concat(v),index:v}))}))}ni.displayName="LabelList";function JY(e,t){return e?e===!0?z.createElement(ni,{key:"labelList-implicit",data:t}):z.isValidElement(e)||Re(e)?z.createElement(ni,{key:"labelList-implicit",data:t,content:e}):ns(e)?z.createElement(ni,nh({data:t},e,{key:"labelList-implicit"})):null:null}function eK(e,t){var n=arguments.length>2&&arguments[2]!==void 0?arguments[2]:!0;if(!e||!e.children&&n&&!e.label)return null;var r=e.children,i=tr(r,ni).map(function(s,u){return T.cloneElement(s,{data:t,key:"labelList-".concat(u)})});if(!n)return i;var l=JY(e.label,t);return[l].concat(HY(i))}ni.renderCallByParent=eK;function nu(e){"@babel/helpers - typeof";return nu=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},nu(e)}function a1(){return a1=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},a1.apply(this,arguments)}function WN(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function ZN(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?WN(Object(n),!0).forEach(function(r){tK(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):WN(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function tK(e,t,n){return t=nK(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function nK(e){var t=rK(e,"string");return nu(t)=="symbol"?t:t+""}function rK(e,t){if(nu(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(nu(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var aK=function(t,n){var r=hn(n-t),i=Math.min(Math.abs(n-t),359.999);return r*i},sd=function(t){var n=t.cx,r=t.cy,i=t.radius,l=t.angle,s=t.sign,u=t.isExternal,f=t.cornerRadius,d=t.cornerIsExternal,m=f*(u?1:-1)+i,v=Math.asin(f/m)/th,g=d?l:l+s*v,x=xt(n,r,m,g),j=xt(n,r,i,g),w=d?l-s*v:l,b=xt(n,r,m*Math.cos(v*th),w);return{center:x,circleTangency:j,lineTangency:b,theta:v}},r4=function(t){var n=t.cx,r=t.cy,i=t.innerRadius,l=t.outerRadius,s=t.startAngle,u=t.endAngle,f=aK(s,u),d=s+f,m=xt(n,r,l,s),v=xt(n,r,l,d),g="M ".concat(m.x,",").concat(m.y,`
-    A `).concat(l,",").concat(l,`,0,
-    `).concat(+(Math.abs(f)>180),",").concat(+(s>d),`,
-    `).concat(v.x,",").concat(v.y,`
-  `);if(i>0){var x=xt(n,r,i,s),j=xt(n,r,i,d);g+="L ".concat(j.x,",").concat(j.y,`
-            A `).concat(i,",").concat(i,`,0,
-            `).concat(+(Math.abs(f)>180),",").concat(+(s<=d),`,
-            `).concat(x.x,",").concat(x.y," Z")}else g+="L ".concat(n,",").concat(r," Z");return g},iK=function(t){var n=t.cx,r=t.cy,i=t.innerRadius,l=t.outerRadius,s=t.cornerRadius,u=t.forceCornerRadius,f=t.cornerIsExternal,d=t.startAngle,m=t.endAngle,v=hn(m-d),g=sd({cx:n,cy:r,radius:l,angle:d,sign:v,cornerRadius:s,cornerIsExternal:f}),x=g.circleTangency,j=g.lineTangency,w=g.theta,b=sd({cx:n,cy:r,radius:l,angle:m,sign:-v,cornerRadius:s,cornerIsExternal:f}),_=b.circleTangency,O=b.lineTangency,E=b.theta,C=f?Math.abs(d-m):Math.abs(d-m)-w-E;if(C<0)return u?"M ".concat(j.x,",").concat(j.y,`
-        a`).concat(s,",").concat(s,",0,0,1,").concat(s*2,`,0
-        a`).concat(s,",").concat(s,",0,0,1,").concat(-s*2,`,0
-      `):r4({cx:n,cy:r,innerRadius:i,outerRadius:l,startAngle:d,endAngle:m});var A="M ".concat(j.x,",").concat(j.y,`
-    A`).concat(s,",").concat(s,",0,0,").concat(+(v<0),",").concat(x.x,",").concat(x.y,`
-    A`).concat(l,",").concat(l,",0,").concat(+(C>180),",").concat(+(v<0),",").concat(_.x,",").concat(_.y,`
-    A`).concat(s,",").concat(s,",0,0,").concat(+(v<0),",").concat(O.x,",").concat(O.y,`
-  `);if(i>0){var N=sd({cx:n,cy:r,radius:i,angle:d,sign:v,isExternal:!0,cornerRadius:s,cornerIsExternal:f}),P=N.circleTangency,D=N.lineTangency,L=N.theta,G=sd({cx:n,cy:r,radius:i,angle:m,sign:-v,isExternal:!0,cornerRadius:s,cornerIsExternal:f}),I=G.circleTangency,H=G.lineTangency,V=G.theta,Z=f?Math.abs(d-m):Math.abs(d-m)-L-V;if(Z<0&&s===0)return"".concat(A,"L").concat(n,",").concat(r,"Z");A+="L".concat(H.x,",").concat(H.y,`
-      A`).concat(s,",").concat(s,",0,0,").concat(+(v<0),",").concat(I.x,",").concat(I.y,`
-      A`).concat(i,",").concat(i,",0,").concat(+(Z>180),",").concat(+(v>0),",").concat(P.x,",").concat(P.y,`
-      A`).concat(s,",").concat(s,",0,0,").concat(+(v<0),",").concat(D.x,",").concat(D.y,"Z")}else A+="L".concat(n,",").concat(r,"Z");return A},oK={cx:0,cy:0,innerRadius:0,outerRadius:0,startAngle:0,endAngle:0,cornerRadius:0,forceCornerRadius:!1,cornerIsExternal:!1},a4=function(t){var n=ZN(ZN({},oK),t),r=n.cx,i=n.cy,l=n.innerRadius,s=n.outerRadius,u=n.cornerRadius,f=n.forceCornerRadius,d=n.cornerIsExternal,m=n.startAngle,v=n.endAngle,g=n.className;if(s<l||m===v)return null;var x=qe("recharts-sector",g),j=s-l,w=pn(u,j,0,!0),b;return w>0&&Math.abs(m-v)<360?b=iK({cx:r,cy:i,innerRadius:l,outerRadius:s,cornerRadius:Math.min(w,j/2),forceCornerRadius:f,cornerIsExternal:d,startAngle:m,endAngle:v}):b=r4({cx:r,cy:i,innerRadius:l,outerRadius:s,startAngle:m,endAngle:v}),z.createElement("path",a1({},Me(n,!0),{className:x,d:b,role:"img"}))};function ru(e){"@babel/helpers - typeof";return ru=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},ru(e)}function i1(){return i1=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},i1.apply(this,arguments)}function QN(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function JN(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?QN(Object(n),!0).forEach(function(r){lK(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):QN(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function lK(e,t,n){return t=sK(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function sK(e){var t=cK(e,"string");return ru(t)=="symbol"?t:t+""}function cK(e,t){if(ru(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(ru(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var eM={curveBasisClosed:C5,curveBasisOpen:N5,curveBasis:T5,curveBumpX:p5,curveBumpY:m5,curveLinearClosed:M5,curveLinear:Kh,curveMonotoneX:P5,curveMonotoneY:R5,curveNatural:D5,curveStep:k5,curveStepAfter:L5,curveStepBefore:$5},cd=function(t){return t.x===+t.x&&t.y===+t.y},bc=function(t){return t.x},xc=function(t){return t.y},uK=function(t,n){if(Re(t))return t;var r="curve".concat(Vh(t));return(r==="curveMonotone"||r==="curveBump")&&n?eM["".concat(r).concat(n==="vertical"?"Y":"X")]:eM[r]||Kh},fK=function(t){var n=t.type,r=n===void 0?"linear":n,i=t.points,l=i===void 0?[]:i,s=t.baseLine,u=t.layout,f=t.connectNulls,d=f===void 0?!1:f,m=uK(r,u),v=d?l.filter(function(w){return cd(w)}):l,g;if(Array.isArray(s)){var x=d?s.filter(function(w){return cd(w)}):s,j=v.map(function(w,b){return JN(JN({},w),{},{base:x[b]})});return u==="vertical"?g=ed().y(xc).x1(bc).x0(function(w){return w.base.x}):g=ed().x(bc).y1(xc).y0(function(w){return w.base.y}),g.defined(cd).curve(m),g(j)}return u==="vertical"&&fe(s)?g=ed().y(xc).x1(bc).x0(s):fe(s)?g=ed().x(bc).y1(xc).y0(s):g=nD().x(bc).y(xc),g.defined(cd).curve(m),g(v)},o1=function(t){var n=t.className,r=t.points,i=t.path,l=t.pathRef;if((!r||!r.length)&&!i)return null;var s=r&&r.length?fK(t):i;return z.createElement("path",i1({},Me(t,!1),Nd(t),{className:qe("recharts-curve",n),d:s,ref:l}))},N0={exports:{}},M0,tM;function dK(){if(tM)return M0;tM=1;var e="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED";return M0=e,M0}var P0,nM;function hK(){if(nM)return P0;nM=1;var e=dK();function t(){}function n(){}return n.resetWarningCache=t,P0=function(){function r(s,u,f,d,m,v){if(v!==e){var g=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw g.name="Invariant Violation",g}}r.isRequired=r;function i(){return r}var l={array:r,bigint:r,bool:r,func:r,number:r,object:r,string:r,symbol:r,any:r,arrayOf:i,element:r,elementType:r,instanceOf:i,node:r,objectOf:i,oneOf:i,oneOfType:i,shape:i,exact:i,checkPropTypes:n,resetWarningCache:t};return l.PropTypes=l,l},P0}var rM;function pK(){return rM||(rM=1,N0.exports=hK()()),N0.exports}var mK=pK();const nt=rt(mK);var vK=Object.getOwnPropertyNames,yK=Object.getOwnPropertySymbols,gK=Object.prototype.hasOwnProperty;function aM(e,t){return function(r,i,l){return e(r,i,l)&&t(r,i,l)}}function ud(e){return function(n,r,i){if(!n||!r||typeof n!="object"||typeof r!="object")return e(n,r,i);var l=i.cache,s=l.get(n),u=l.get(r);if(s&&u)return s===r&&u===n;l.set(n,r),l.set(r,n);var f=e(n,r,i);return l.delete(n),l.delete(r),f}}function iM(e){return vK(e).concat(yK(e))}var bK=Object.hasOwn||function(e,t){return gK.call(e,t)};function so(e,t){return e===t||!e&&!t&&e!==e&&t!==t}var xK="__v",wK="__o",SK="_owner",oM=Object.getOwnPropertyDescriptor,lM=Object.keys;function jK(e,t,n){var r=e.length;if(t.length!==r)return!1;for(;r-- >0;)if(!n.equals(e[r],t[r],r,r,e,t,n))return!1;return!0}function OK(e,t){return so(e.getTime(),t.getTime())}function _K(e,t){return e.name===t.name&&e.message===t.message&&e.cause===t.cause&&e.stack===t.stack}function AK(e,t){return e===t}function sM(e,t,n){var r=e.size;if(r!==t.size)return!1;if(!r)return!0;for(var i=new Array(r),l=e.entries(),s,u,f=0;(s=l.next())&&!s.done;){for(var d=t.entries(),m=!1,v=0;(u=d.next())&&!u.done;){if(i[v]){v++;continue}var g=s.value,x=u.value;if(n.equals(g[0],x[0],f,v,e,t,n)&&n.equals(g[1],x[1],g[0],x[0],e,t,n)){m=i[v]=!0;break}v++}if(!m)return!1;f++}return!0}var EK=so;function TK(e,t,n){var r=lM(e),i=r.length;if(lM(t).length!==i)return!1;for(;i-- >0;)if(!i4(e,t,n,r[i]))return!1;return!0}function wc(e,t,n){var r=iM(e),i=r.length;if(iM(t).length!==i)return!1;for(var l,s,u;i-- >0;)if(l=r[i],!i4(e,t,n,l)||(s=oM(e,l),u=oM(t,l),(s||u)&&(!s||!u||s.configurable!==u.configurable||s.enumerable!==u.enumerable||s.writable!==u.writable)))return!1;return!0}function CK(e,t){return so(e.valueOf(),t.valueOf())}function NK(e,t){return e.source===t.source&&e.flags===t.flags}function cM(e,t,n){var r=e.size;if(r!==t.size)return!1;if(!r)return!0;for(var i=new Array(r),l=e.values(),s,u;(s=l.next())&&!s.done;){for(var f=t.values(),d=!1,m=0;(u=f.next())&&!u.done;){if(!i[m]&&n.equals(s.value,u.value,s.value,u.value,e,t,n)){d=i[m]=!0;break}m++}if(!d)return!1}return!0}function MK(e,t){var n=e.length;if(t.length!==n)return!1;for(;n-- >0;)if(e[n]!==t[n])return!1;return!0}function PK(e,t){return e.hostname===t.hostname&&e.pathname===t.pathname&&e.protocol===t.protocol&&e.port===t.port&&e.hash===t.hash&&e.username===t.username&&e.password===t.password}function i4(e,t,n,r){return(r===SK||r===wK||r===xK)&&(e.$$typeof||t.$$typeof)?!0:bK(t,r)&&n.equals(e[r],t[r],r,r,e,t,n)}var RK="[object Arguments]",DK="[object Boolean]",kK="[object Date]",$K="[object Error]",LK="[object Map]",IK="[object Number]",qK="[object Object]",BK="[object RegExp]",zK="[object Set]",UK="[object String]",HK="[object URL]",FK=Array.isArray,uM=typeof ArrayBuffer=="function"&&ArrayBuffer.isView?ArrayBuffer.isView:null,fM=Object.assign,GK=Object.prototype.toString.call.bind(Object.prototype.toString);function VK(e){var t=e.areArraysEqual,n=e.areDatesEqual,r=e.areErrorsEqual,i=e.areFunctionsEqual,l=e.areMapsEqual,s=e.areNumbersEqual,u=e.areObjectsEqual,f=e.arePrimitiveWrappersEqual,d=e.areRegExpsEqual,m=e.areSetsEqual,v=e.areTypedArraysEqual,g=e.areUrlsEqual;return function(j,w,b){if(j===w)return!0;if(j==null||w==null)return!1;var _=typeof j;if(_!==typeof w)return!1;if(_!=="object")return _==="number"?s(j,w,b):_==="function"?i(j,w,b):!1;var O=j.constructor;if(O!==w.constructor)return!1;if(O===Object)return u(j,w,b);if(FK(j))return t(j,w,b);if(uM!=null&&uM(j))return v(j,w,b);if(O===Date)return n(j,w,b);if(O===RegExp)return d(j,w,b);if(O===Map)return l(j,w,b);if(O===Set)return m(j,w,b);var E=GK(j);return E===kK?n(j,w,b):E===BK?d(j,w,b):E===LK?l(j,w,b):E===zK?m(j,w,b):E===qK?typeof j.then!="function"&&typeof w.then!="function"&&u(j,w,b):E===HK?g(j,w,b):E===$K?r(j,w,b):E===RK?u(j,w,b):E===DK||E===IK||E===UK?f(j,w,b):!1}}function YK(e){var t=e.circular,n=e.createCustomConfig,r=e.strict,i={areArraysEqual:r?wc:jK,areDatesEqual:OK,areErrorsEqual:_K,areFunctionsEqual:AK,areMapsEqual:r?aM(sM,wc):sM,areNumbersEqual:EK,areObjectsEqual:r?wc:TK,arePrimitiveWrappersEqual:CK,areRegExpsEqual:NK,areSetsEqual:r?aM(cM,wc):cM,areTypedArraysEqual:r?wc:MK,areUrlsEqual:PK};if(n&&(i=fM({},i,n(i))),t){var l=ud(i.areArraysEqual),s=ud(i.areMapsEqual),u=ud(i.areObjectsEqual),f=ud(i.areSetsEqual);i=fM({},i,{areArraysEqual:l,areMapsEqual:s,areObjectsEqual:u,areSetsEqual:f})}return i}function KK(e){return function(t,n,r,i,l,s,u){return e(t,n,u)}}function XK(e){var t=e.circular,n=e.comparator,r=e.createState,i=e.equals,l=e.strict;if(r)return function(f,d){var m=r(),v=m.cache,g=v===void 0?t?new WeakMap:void 0:v,x=m.meta;return n(f,d,{cache:g,equals:i,meta:x,strict:l})};if(t)return function(f,d){return n(f,d,{cache:new WeakMap,equals:i,meta:void 0,strict:l})};var s={cache:void 0,equals:i,meta:void 0,strict:l};return function(f,d){return n(f,d,s)}}var WK=fi();fi({strict:!0});fi({circular:!0});fi({circular:!0,strict:!0});fi({createInternalComparator:function(){return so}});fi({strict:!0,createInternalComparator:function(){return so}});fi({circular:!0,createInternalComparator:function(){return so}});fi({circular:!0,createInternalComparator:function(){return so},strict:!0});function fi(e){e===void 0&&(e={});var t=e.circular,n=t===void 0?!1:t,r=e.createInternalComparator,i=e.createState,l=e.strict,s=l===void 0?!1:l,u=YK(e),f=VK(u),d=r?r(f):KK(f);return XK({circular:n,comparator:f,createState:i,equals:d,strict:s})}function ZK(e){typeof requestAnimationFrame<"u"&&requestAnimationFrame(e)}function dM(e){var t=arguments.length>1&&arguments[1]!==void 0?arguments[1]:0,n=-1,r=function i(l){n<0&&(n=l),l-n>t?(e(l),n=-1):ZK(i)};requestAnimationFrame(r)}function l1(e){"@babel/helpers - typeof";return l1=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},l1(e)}function QK(e){return nX(e)||tX(e)||eX(e)||JK()}function JK(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function eX(e,t){if(e){if(typeof e=="string")return hM(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return hM(e,t)}}function hM(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function tX(e){if(typeof Symbol<"u"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function nX(e){if(Array.isArray(e))return e}function rX(){var e={},t=function(){return null},n=!1,r=function i(l){if(!n){if(Array.isArray(l)){if(!l.length)return;var s=l,u=QK(s),f=u[0],d=u.slice(1);if(typeof f=="number"){dM(i.bind(null,d),f);return}i(f),dM(i.bind(null,d));return}l1(l)==="object"&&(e=l,t(e)),typeof l=="function"&&l()}};return{stop:function(){n=!0},start:function(l){n=!1,r(l)},subscribe:function(l){return t=l,function(){t=function(){return null}}}}}function au(e){"@babel/helpers - typeof";return au=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},au(e)}function pM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function mM(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?pM(Object(n),!0).forEach(function(r){o4(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):pM(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function o4(e,t,n){return t=aX(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function aX(e){var t=iX(e,"string");return au(t)==="symbol"?t:String(t)}function iX(e,t){if(au(e)!=="object"||e===null)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(au(r)!=="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var oX=function(t,n){return[Object.keys(t),Object.keys(n)].reduce(function(r,i){return r.filter(function(l){return i.includes(l)})})},lX=function(t){return t},sX=function(t){return t.replace(/([A-Z])/g,function(n){return"-".concat(n.toLowerCase())})},Nc=function(t,n){return Object.keys(n).reduce(function(r,i){return mM(mM({},r),{},o4({},i,t(i,n[i])))},{})},vM=function(t,n,r){return t.map(function(i){return"".concat(sX(i)," ").concat(n,"ms ").concat(r)}).join(",")};function cX(e,t){return dX(e)||fX(e,t)||l4(e,t)||uX()}function uX(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function fX(e,t){var n=e==null?null:typeof Symbol<"u"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var r,i,l,s,u=[],f=!0,d=!1;try{if(l=(n=n.call(e)).next,t!==0)for(;!(f=(r=l.call(n)).done)&&(u.push(r.value),u.length!==t);f=!0);}catch(m){d=!0,i=m}finally{try{if(!f&&n.return!=null&&(s=n.return(),Object(s)!==s))return}finally{if(d)throw i}}return u}}function dX(e){if(Array.isArray(e))return e}function hX(e){return vX(e)||mX(e)||l4(e)||pX()}function pX(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function l4(e,t){if(e){if(typeof e=="string")return s1(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return s1(e,t)}}function mX(e){if(typeof Symbol<"u"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function vX(e){if(Array.isArray(e))return s1(e)}function s1(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var rh=1e-4,s4=function(t,n){return[0,3*t,3*n-6*t,3*t-3*n+1]},c4=function(t,n){return t.map(function(r,i){return r*Math.pow(n,i)}).reduce(function(r,i){return r+i})},yM=function(t,n){return function(r){var i=s4(t,n);return c4(i,r)}},yX=function(t,n){return function(r){var i=s4(t,n),l=[].concat(hX(i.map(function(s,u){return s*u}).slice(1)),[0]);return c4(l,r)}},gM=function(){for(var t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];var i=n[0],l=n[1],s=n[2],u=n[3];if(n.length===1)switch(n[0]){case"linear":i=0,l=0,s=1,u=1;break;case"ease":i=.25,l=.1,s=.25,u=1;break;case"ease-in":i=.42,l=0,s=1,u=1;break;case"ease-out":i=.42,l=0,s=.58,u=1;break;case"ease-in-out":i=0,l=0,s=.58,u=1;break;default:{var f=n[0].split("(");if(f[0]==="cubic-bezier"&&f[1].split(")")[0].split(",").length===4){var d=f[1].split(")")[0].split(",").map(function(b){return parseFloat(b)}),m=cX(d,4);i=m[0],l=m[1],s=m[2],u=m[3]}}}var v=yM(i,s),g=yM(l,u),x=yX(i,s),j=function(_){return _>1?1:_<0?0:_},w=function(_){for(var O=_>1?1:_,E=O,C=0;C<8;++C){var A=v(E)-O,N=x(E);if(Math.abs(A-O)<rh||N<rh)return g(E);E=j(E-A/N)}return g(E)};return w.isStepper=!1,w},gX=function(){var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:{},n=t.stiff,r=n===void 0?100:n,i=t.damping,l=i===void 0?8:i,s=t.dt,u=s===void 0?17:s,f=function(m,v,g){var x=-(m-v)*r,j=g*l,w=g+(x-j)*u/1e3,b=g*u/1e3+m;return Math.abs(b-v)<rh&&Math.abs(w)<rh?[v,0]:[b,w]};return f.isStepper=!0,f.dt=u,f},bX=function(){for(var t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];var i=n[0];if(typeof i=="string")switch(i){case"ease":case"ease-in-out":case"ease-out":case"ease-in":case"linear":return gM(i);case"spring":return gX();default:if(i.split("(")[0]==="cubic-bezier")return gM(i)}return typeof i=="function"?i:null};function iu(e){"@babel/helpers - typeof";return iu=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},iu(e)}function bM(e){return SX(e)||wX(e)||u4(e)||xX()}function xX(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function wX(e){if(typeof Symbol<"u"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function SX(e){if(Array.isArray(e))return u1(e)}function xM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function tn(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?xM(Object(n),!0).forEach(function(r){c1(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):xM(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function c1(e,t,n){return t=jX(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function jX(e){var t=OX(e,"string");return iu(t)==="symbol"?t:String(t)}function OX(e,t){if(iu(e)!=="object"||e===null)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(iu(r)!=="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function _X(e,t){return TX(e)||EX(e,t)||u4(e,t)||AX()}function AX(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function u4(e,t){if(e){if(typeof e=="string")return u1(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return u1(e,t)}}function u1(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function EX(e,t){var n=e==null?null:typeof Symbol<"u"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var r,i,l,s,u=[],f=!0,d=!1;try{if(l=(n=n.call(e)).next,t!==0)for(;!(f=(r=l.call(n)).done)&&(u.push(r.value),u.length!==t);f=!0);}catch(m){d=!0,i=m}finally{try{if(!f&&n.return!=null&&(s=n.return(),Object(s)!==s))return}finally{if(d)throw i}}return u}}function TX(e){if(Array.isArray(e))return e}var ah=function(t,n,r){return t+(n-t)*r},f1=function(t){var n=t.from,r=t.to;return n!==r},CX=function e(t,n,r){var i=Nc(function(l,s){if(f1(s)){var u=t(s.from,s.to,s.velocity),f=_X(u,2),d=f[0],m=f[1];return tn(tn({},s),{},{from:d,velocity:m})}return s},n);return r<1?Nc(function(l,s){return f1(s)?tn(tn({},s),{},{velocity:ah(s.velocity,i[l].velocity,r),from:ah(s.from,i[l].from,r)}):s},n):e(t,i,r-1)};const NX=function(e,t,n,r,i){var l=oX(e,t),s=l.reduce(function(b,_){return tn(tn({},b),{},c1({},_,[e[_],t[_]]))},{}),u=l.reduce(function(b,_){return tn(tn({},b),{},c1({},_,{from:e[_],velocity:0,to:t[_]}))},{}),f=-1,d,m,v=function(){return null},g=function(){return Nc(function(_,O){return O.from},u)},x=function(){return!Object.values(u).filter(f1).length},j=function(_){d||(d=_);var O=_-d,E=O/n.dt;u=CX(n,u,E),i(tn(tn(tn({},e),t),g())),d=_,x()||(f=requestAnimationFrame(v))},w=function(_){m||(m=_);var O=(_-m)/r,E=Nc(function(A,N){return ah.apply(void 0,bM(N).concat([n(O)]))},s);if(i(tn(tn(tn({},e),t),E)),O<1)f=requestAnimationFrame(v);else{var C=Nc(function(A,N){return ah.apply(void 0,bM(N).concat([n(1)]))},s);i(tn(tn(tn({},e),t),C))}};return v=n.isStepper?j:w,function(){return requestAnimationFrame(v),function(){cancelAnimationFrame(f)}}};function Dl(e){"@babel/helpers - typeof";return Dl=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Dl(e)}var MX=["children","begin","duration","attributeName","easing","isActive","steps","from","to","canBegin","onAnimationEnd","shouldReAnimate","onAnimationReStart"];function PX(e,t){if(e==null)return{};var n=RX(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function RX(e,t){if(e==null)return{};var n={},r=Object.keys(e),i,l;for(l=0;l<r.length;l++)i=r[l],!(t.indexOf(i)>=0)&&(n[i]=e[i]);return n}function R0(e){return LX(e)||$X(e)||kX(e)||DX()}function DX(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function kX(e,t){if(e){if(typeof e=="string")return d1(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return d1(e,t)}}function $X(e){if(typeof Symbol<"u"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function LX(e){if(Array.isArray(e))return d1(e)}function d1(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function wM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function sr(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?wM(Object(n),!0).forEach(function(r){_c(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):wM(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function _c(e,t,n){return t=f4(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function IX(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function qX(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,f4(r.key),r)}}function BX(e,t,n){return t&&qX(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e}function f4(e){var t=zX(e,"string");return Dl(t)==="symbol"?t:String(t)}function zX(e,t){if(Dl(e)!=="object"||e===null)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Dl(r)!=="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function UX(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&h1(e,t)}function h1(e,t){return h1=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},h1(e,t)}function HX(e){var t=FX();return function(){var r=ih(e),i;if(t){var l=ih(this).constructor;i=Reflect.construct(r,arguments,l)}else i=r.apply(this,arguments);return p1(this,i)}}function p1(e,t){if(t&&(Dl(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return m1(e)}function m1(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function FX(){if(typeof Reflect>"u"||!Reflect.construct||Reflect.construct.sham)return!1;if(typeof Proxy=="function")return!0;try{return Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){})),!0}catch{return!1}}function ih(e){return ih=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},ih(e)}var va=function(e){UX(n,e);var t=HX(n);function n(r,i){var l;IX(this,n),l=t.call(this,r,i);var s=l.props,u=s.isActive,f=s.attributeName,d=s.from,m=s.to,v=s.steps,g=s.children,x=s.duration;if(l.handleStyleChange=l.handleStyleChange.bind(m1(l)),l.changeStyle=l.changeStyle.bind(m1(l)),!u||x<=0)return l.state={style:{}},typeof g=="function"&&(l.state={style:m}),p1(l);if(v&&v.length)l.state={style:v[0].style};else if(d){if(typeof g=="function")return l.state={style:d},p1(l);l.state={style:f?_c({},f,d):d}}else l.state={style:{}};return l}return BX(n,[{key:"componentDidMount",value:function(){var i=this.props,l=i.isActive,s=i.canBegin;this.mounted=!0,!(!l||!s)&&this.runAnimation(this.props)}},{key:"componentDidUpdate",value:function(i){var l=this.props,s=l.isActive,u=l.canBegin,f=l.attributeName,d=l.shouldReAnimate,m=l.to,v=l.from,g=this.state.style;if(u){if(!s){var x={style:f?_c({},f,m):m};this.state&&g&&(f&&g[f]!==m||!f&&g!==m)&&this.setState(x);return}if(!(WK(i.to,m)&&i.canBegin&&i.isActive)){var j=!i.canBegin||!i.isActive;this.manager&&this.manager.stop(),this.stopJSAnimation&&this.stopJSAnimation();var w=j||d?v:i.to;if(this.state&&g){var b={style:f?_c({},f,w):w};(f&&g[f]!==w||!f&&g!==w)&&this.setState(b)}this.runAnimation(sr(sr({},this.props),{},{from:w,begin:0}))}}}},{key:"componentWillUnmount",value:function(){this.mounted=!1;var i=this.props.onAnimationEnd;this.unSubscribe&&this.unSubscribe(),this.manager&&(this.manager.stop(),this.manager=null),this.stopJSAnimation&&this.stopJSAnimation(),i&&i()}},{key:"handleStyleChange",value:function(i){this.changeStyle(i)}},{key:"changeStyle",value:function(i){this.mounted&&this.setState({style:i})}},{key:"runJSAnimation",value:function(i){var l=this,s=i.from,u=i.to,f=i.duration,d=i.easing,m=i.begin,v=i.onAnimationEnd,g=i.onAnimationStart,x=NX(s,u,bX(d),f,this.changeStyle),j=function(){l.stopJSAnimation=x()};this.manager.start([g,m,j,f,v])}},{key:"runStepAnimation",value:function(i){var l=this,s=i.steps,u=i.begin,f=i.onAnimationStart,d=s[0],m=d.style,v=d.duration,g=v===void 0?0:v,x=function(w,b,_){if(_===0)return w;var O=b.duration,E=b.easing,C=E===void 0?"ease":E,A=b.style,N=b.properties,P=b.onAnimationEnd,D=_>0?s[_-1]:b,L=N||Object.keys(A);if(typeof C=="function"||C==="spring")return[].concat(R0(w),[l.runJSAnimation.bind(l,{from:D.style,to:A,duration:O,easing:C}),O]);var G=vM(L,O,C),I=sr(sr(sr({},D.style),A),{},{transition:G});return[].concat(R0(w),[I,O,P]).filter(lX)};return this.manager.start([f].concat(R0(s.reduce(x,[m,Math.max(g,u)])),[i.onAnimationEnd]))}},{key:"runAnimation",value:function(i){this.manager||(this.manager=rX());var l=i.begin,s=i.duration,u=i.attributeName,f=i.to,d=i.easing,m=i.onAnimationStart,v=i.onAnimationEnd,g=i.steps,x=i.children,j=this.manager;if(this.unSubscribe=j.subscribe(this.handleStyleChange),typeof d=="function"||typeof x=="function"||d==="spring"){this.runJSAnimation(i);return}if(g.length>1){this.runStepAnimation(i);return}var w=u?_c({},u,f):f,b=vM(Object.keys(w),s,d);j.start([m,l,sr(sr({},w),{},{transition:b}),s,v])}},{key:"render",value:function(){var i=this.props,l=i.children;i.begin;var s=i.duration;i.attributeName,i.easing;var u=i.isActive;i.steps,i.from,i.to,i.canBegin,i.onAnimationEnd,i.shouldReAnimate,i.onAnimationReStart;var f=PX(i,MX),d=T.Children.count(l),m=this.state.style;if(typeof l=="function")return l(m);if(!u||d===0||s<=0)return l;var v=function(x){var j=x.props,w=j.style,b=w===void 0?{}:w,_=j.className,O=T.cloneElement(x,sr(sr({},f),{},{style:sr(sr({},b),m),className:_}));return O};return d===1?v(T.Children.only(l)):z.createElement("div",null,T.Children.map(l,function(g){return v(g)}))}}]),n}(T.PureComponent);va.displayName="Animate";va.defaultProps={begin:0,duration:1e3,from:"",to:"",attributeName:"",easing:"ease",isActive:!0,canBegin:!0,steps:[],onAnimationEnd:function(){},onAnimationStart:function(){}};va.propTypes={from:nt.oneOfType([nt.object,nt.string]),to:nt.oneOfType([nt.object,nt.string]),attributeName:nt.string,duration:nt.number,begin:nt.number,easing:nt.oneOfType([nt.string,nt.func]),steps:nt.arrayOf(nt.shape({duration:nt.number.isRequired,style:nt.object.isRequired,easing:nt.oneOfType([nt.oneOf(["ease","ease-in","ease-out","ease-in-out","linear"]),nt.func]),properties:nt.arrayOf("string"),onAnimationEnd:nt.func})),children:nt.oneOfType([nt.node,nt.func]),isActive:nt.bool,canBegin:nt.bool,onAnimationEnd:nt.func,shouldReAnimate:nt.bool,onAnimationStart:nt.func,onAnimationReStart:nt.func};function ou(e){"@babel/helpers - typeof";return ou=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},ou(e)}function oh(){return oh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},oh.apply(this,arguments)}function GX(e,t){return XX(e)||KX(e,t)||YX(e,t)||VX()}function VX(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function YX(e,t){if(e){if(typeof e=="string")return SM(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return SM(e,t)}}function SM(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function KX(e,t){var n=e==null?null:typeof Symbol<"u"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var r,i,l,s,u=[],f=!0,d=!1;try{if(l=(n=n.call(e)).next,t!==0)for(;!(f=(r=l.call(n)).done)&&(u.push(r.value),u.length!==t);f=!0);}catch(m){d=!0,i=m}finally{try{if(!f&&n.return!=null&&(s=n.return(),Object(s)!==s))return}finally{if(d)throw i}}return u}}function XX(e){if(Array.isArray(e))return e}function jM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function OM(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?jM(Object(n),!0).forEach(function(r){WX(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):jM(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function WX(e,t,n){return t=ZX(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function ZX(e){var t=QX(e,"string");return ou(t)=="symbol"?t:t+""}function QX(e,t){if(ou(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(ou(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var _M=function(t,n,r,i,l){var s=Math.min(Math.abs(r)/2,Math.abs(i)/2),u=i>=0?1:-1,f=r>=0?1:-1,d=i>=0&&r>=0||i<0&&r<0?1:0,m;if(s>0&&l instanceof Array){for(var v=[0,0,0,0],g=0,x=4;g<x;g++)v[g]=l[g]>s?s:l[g];m="M".concat(t,",").concat(n+u*v[0]),v[0]>0&&(m+="A ".concat(v[0],",").concat(v[0],",0,0,").concat(d,",").concat(t+f*v[0],",").concat(n)),m+="L ".concat(t+r-f*v[1],",").concat(n),v[1]>0&&(m+="A ".concat(v[1],",").concat(v[1],",0,0,").concat(d,`,
-        `).concat(t+r,",").concat(n+u*v[1])),m+="L ".concat(t+r,",").concat(n+i-u*v[2]),v[2]>0&&(m+="A ".concat(v[2],",").concat(v[2],",0,0,").concat(d,`,
-        `).concat(t+r-f*v[2],",").concat(n+i)),m+="L ".concat(t+f*v[3],",").concat(n+i),v[3]>0&&(m+="A ".concat(v[3],",").concat(v[3],",0,0,").concat(d,`,
-        `).concat(t,",").concat(n+i-u*v[3])),m+="Z"}else if(s>0&&l===+l&&l>0){var j=Math.min(s,l);m="M ".concat(t,",").concat(n+u*j,`
-            A `).concat(j,",").concat(j,",0,0,").concat(d,",").concat(t+f*j,",").concat(n,`
-            L `).concat(t+r-f*j,",").concat(n,`
-            A `).concat(j,",").concat(j,",0,0,").concat(d,",").concat(t+r,",").concat(n+u*j,`
-            L `).concat(t+r,",").concat(n+i-u*j,`
-            A `).concat(j,",").concat(j,",0,0,").concat(d,",").concat(t+r-f*j,",").concat(n+i,`
-            L `).concat(t+f*j,",").concat(n+i,`
-            A `).concat(j,",").concat(j,",0,0,").concat(d,",").concat(t,",").concat(n+i-u*j," Z")}else m="M ".concat(t,",").concat(n," h ").concat(r," v ").concat(i," h ").concat(-r," Z");return m},JX=function(t,n){if(!t||!n)return!1;var r=t.x,i=t.y,l=n.x,s=n.y,u=n.width,f=n.height;if(Math.abs(u)>0&&Math.abs(f)>0){var d=Math.min(l,l+u),m=Math.max(l,l+u),v=Math.min(s,s+f),g=Math.max(s,s+f);return r>=d&&r<=m&&i>=v&&i<=g}return!1},eW={x:0,y:0,width:0,height:0,radius:0,isAnimationActive:!1,isUpdateAnimationActive:!1,animationBegin:0,animationDuration:1500,animationEasing:"ease"},eS=function(t){var n=OM(OM({},eW),t),r=T.useRef(),i=T.useState(-1),l=GX(i,2),s=l[0],u=l[1];T.useEffect(function(){if(r.current&&r.current.getTotalLength)try{var C=r.current.getTotalLength();C&&u(C)}catch{}},[]);var f=n.x,d=n.y,m=n.width,v=n.height,g=n.radius,x=n.className,j=n.animationEasing,w=n.animationDuration,b=n.animationBegin,_=n.isAnimationActive,O=n.isUpdateAnimationActive;if(f!==+f||d!==+d||m!==+m||v!==+v||m===0||v===0)return null;var E=qe("recharts-rectangle",x);return O?z.createElement(va,{canBegin:s>0,from:{width:m,height:v,x:f,y:d},to:{width:m,height:v,x:f,y:d},duration:w,animationEasing:j,isActive:O},function(C){var A=C.width,N=C.height,P=C.x,D=C.y;return z.createElement(va,{canBegin:s>0,from:"0px ".concat(s===-1?1:s,"px"),to:"".concat(s,"px 0px"),attributeName:"strokeDasharray",begin:b,duration:w,isActive:_,easing:j},z.createElement("path",oh({},Me(n,!0),{className:E,d:_M(P,D,A,N,g),ref:r})))}):z.createElement("path",oh({},Me(n,!0),{className:E,d:_M(f,d,m,v,g)}))},tW=["points","className","baseLinePoints","connectNulls"];function ol(){return ol=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},ol.apply(this,arguments)}function nW(e,t){if(e==null)return{};var n=rW(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function rW(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}function AM(e){return lW(e)||oW(e)||iW(e)||aW()}function aW(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function iW(e,t){if(e){if(typeof e=="string")return v1(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return v1(e,t)}}function oW(e){if(typeof Symbol<"u"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function lW(e){if(Array.isArray(e))return v1(e)}function v1(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var EM=function(t){return t&&t.x===+t.x&&t.y===+t.y},sW=function(){var t=arguments.length>0&&arguments[0]!==void 0?arguments[0]:[],n=[[]];return t.forEach(function(r){EM(r)?n[n.length-1].push(r):n[n.length-1].length>0&&n.push([])}),EM(t[0])&&n[n.length-1].push(t[0]),n[n.length-1].length<=0&&(n=n.slice(0,-1)),n},Mc=function(t,n){var r=sW(t);n&&(r=[r.reduce(function(l,s){return[].concat(AM(l),AM(s))},[])]);var i=r.map(function(l){return l.reduce(function(s,u,f){return"".concat(s).concat(f===0?"M":"L").concat(u.x,",").concat(u.y)},"")}).join("");return r.length===1?"".concat(i,"Z"):i},cW=function(t,n,r){var i=Mc(t,r);return"".concat(i.slice(-1)==="Z"?i.slice(0,-1):i,"L").concat(Mc(n.reverse(),r).slice(1))},uW=function(t){var n=t.points,r=t.className,i=t.baseLinePoints,l=t.connectNulls,s=nW(t,tW);if(!n||!n.length)return null;var u=qe("recharts-polygon",r);if(i&&i.length){var f=s.stroke&&s.stroke!=="none",d=cW(n,i,l);return z.createElement("g",{className:u},z.createElement("path",ol({},Me(s,!0),{fill:d.slice(-1)==="Z"?s.fill:"none",stroke:"none",d})),f?z.createElement("path",ol({},Me(s,!0),{fill:"none",d:Mc(n,l)})):null,f?z.createElement("path",ol({},Me(s,!0),{fill:"none",d:Mc(i,l)})):null)}var m=Mc(n,l);return z.createElement("path",ol({},Me(s,!0),{fill:m.slice(-1)==="Z"?s.fill:"none",className:u,d:m}))};function y1(){return y1=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},y1.apply(this,arguments)}var tS=function(t){var n=t.cx,r=t.cy,i=t.r,l=t.className,s=qe("recharts-dot",l);return n===+n&&r===+r&&i===+i?z.createElement("circle",y1({},Me(t,!1),Nd(t),{className:s,cx:n,cy:r,r:i})):null};function lu(e){"@babel/helpers - typeof";return lu=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},lu(e)}var fW=["x","y","top","left","width","height","className"];function g1(){return g1=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},g1.apply(this,arguments)}function TM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function dW(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?TM(Object(n),!0).forEach(function(r){hW(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):TM(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function hW(e,t,n){return t=pW(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function pW(e){var t=mW(e,"string");return lu(t)=="symbol"?t:t+""}function mW(e,t){if(lu(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(lu(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function vW(e,t){if(e==null)return{};var n=yW(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function yW(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}var gW=function(t,n,r,i,l,s){return"M".concat(t,",").concat(l,"v").concat(i,"M").concat(s,",").concat(n,"h").concat(r)},bW=function(t){var n=t.x,r=n===void 0?0:n,i=t.y,l=i===void 0?0:i,s=t.top,u=s===void 0?0:s,f=t.left,d=f===void 0?0:f,m=t.width,v=m===void 0?0:m,g=t.height,x=g===void 0?0:g,j=t.className,w=vW(t,fW),b=dW({x:r,y:l,top:u,left:d,width:v,height:x},w);return!fe(r)||!fe(l)||!fe(v)||!fe(x)||!fe(u)||!fe(d)?null:z.createElement("path",g1({},Me(b,!0),{className:qe("recharts-cross",j),d:gW(r,l,v,x,u,d)}))},D0,CM;function xW(){if(CM)return D0;CM=1;var e=op(),t=Ak(),n=Dr();function r(i,l){return i&&i.length?e(i,n(l,2),t):void 0}return D0=r,D0}var wW=xW();const SW=rt(wW);var k0,NM;function jW(){if(NM)return k0;NM=1;var e=op(),t=Dr(),n=Ek();function r(i,l){return i&&i.length?e(i,t(l,2),n):void 0}return k0=r,k0}var OW=jW();const _W=rt(OW);var AW=["cx","cy","angle","ticks","axisLine"],EW=["ticks","tick","angle","tickFormatter","stroke"];function kl(e){"@babel/helpers - typeof";return kl=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},kl(e)}function Pc(){return Pc=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Pc.apply(this,arguments)}function MM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function ki(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?MM(Object(n),!0).forEach(function(r){hp(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):MM(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function PM(e,t){if(e==null)return{};var n=TW(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function TW(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}function CW(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function RM(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,h4(r.key),r)}}function NW(e,t,n){return t&&RM(e.prototype,t),n&&RM(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e}function MW(e,t,n){return t=lh(t),PW(e,d4()?Reflect.construct(t,n||[],lh(e).constructor):t.apply(e,n))}function PW(e,t){if(t&&(kl(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return RW(e)}function RW(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function d4(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(d4=function(){return!!e})()}function lh(e){return lh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},lh(e)}function DW(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&b1(e,t)}function b1(e,t){return b1=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},b1(e,t)}function hp(e,t,n){return t=h4(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function h4(e){var t=kW(e,"string");return kl(t)=="symbol"?t:t+""}function kW(e,t){if(kl(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(kl(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}var pp=function(e){function t(){return CW(this,t),MW(this,t,arguments)}return DW(t,e),NW(t,[{key:"getTickValueCoord",value:function(r){var i=r.coordinate,l=this.props,s=l.angle,u=l.cx,f=l.cy;return xt(u,f,i,s)}},{key:"getTickTextAnchor",value:function(){var r=this.props.orientation,i;switch(r){case"left":i="end";break;case"right":i="start";break;default:i="middle";break}return i}},{key:"getViewBox",value:function(){var r=this.props,i=r.cx,l=r.cy,s=r.angle,u=r.ticks,f=SW(u,function(m){return m.coordinate||0}),d=_W(u,function(m){return m.coordinate||0});return{cx:i,cy:l,startAngle:s,endAngle:s,innerRadius:d.coordinate||0,outerRadius:f.coordinate||0}}},{key:"renderAxisLine",value:function(){var r=this.props,i=r.cx,l=r.cy,s=r.angle,u=r.ticks,f=r.axisLine,d=PM(r,AW),m=u.reduce(function(j,w){return[Math.min(j[0],w.coordinate),Math.max(j[1],w.coordinate)]},[1/0,-1/0]),v=xt(i,l,m[0],s),g=xt(i,l,m[1],s),x=ki(ki(ki({},Me(d,!1)),{},{fill:"none"},Me(f,!1)),{},{x1:v.x,y1:v.y,x2:g.x,y2:g.y});return z.createElement("line",Pc({className:"recharts-polar-radius-axis-line"},x))}},{key:"renderTicks",value:function(){var r=this,i=this.props,l=i.ticks,s=i.tick,u=i.angle,f=i.tickFormatter,d=i.stroke,m=PM(i,EW),v=this.getTickTextAnchor(),g=Me(m,!1),x=Me(s,!1),j=l.map(function(w,b){var _=r.getTickValueCoord(w),O=ki(ki(ki(ki({textAnchor:v,transform:"rotate(".concat(90-u,", ").concat(_.x,", ").concat(_.y,")")},g),{},{stroke:"none",fill:d},x),{},{index:b},_),{},{payload:w});return z.createElement(ot,Pc({className:qe("recharts-polar-radius-axis-tick",t4(s)),key:"tick-".concat(w.coordinate)},Wi(r.props,w,b)),t.renderTickItem(s,O,f?f(w.value,b):w.value))});return z.createElement(ot,{className:"recharts-polar-radius-axis-ticks"},j)}},{key:"render",value:function(){var r=this.props,i=r.ticks,l=r.axisLine,s=r.tick;return!i||!i.length?null:z.createElement(ot,{className:qe("recharts-polar-radius-axis",this.props.className)},l&&this.renderAxisLine(),s&&this.renderTicks(),Xt.renderCallByParent(this.props,this.getViewBox()))}}],[{key:"renderTickItem",value:function(r,i,l){var s;return z.isValidElement(r)?s=z.cloneElement(r,i):Re(r)?s=r(i):s=z.createElement(Zi,Pc({},i,{className:"recharts-polar-radius-axis-tick-value"}),l),s}}])}(T.PureComponent);hp(pp,"displayName","PolarRadiusAxis");hp(pp,"axisType","radiusAxis");hp(pp,"defaultProps",{type:"number",radiusAxisId:0,cx:0,cy:0,angle:0,orientation:"right",stroke:"#ccc",axisLine:!0,tick:!0,tickCount:5,allowDataOverflow:!1,scale:"auto",allowDuplicatedCategory:!0});function $l(e){"@babel/helpers - typeof";return $l=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},$l(e)}function qi(){return qi=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},qi.apply(this,arguments)}function DM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function $i(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?DM(Object(n),!0).forEach(function(r){mp(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):DM(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function $W(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function kM(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,m4(r.key),r)}}function LW(e,t,n){return t&&kM(e.prototype,t),n&&kM(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e}function IW(e,t,n){return t=sh(t),qW(e,p4()?Reflect.construct(t,n||[],sh(e).constructor):t.apply(e,n))}function qW(e,t){if(t&&($l(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return BW(e)}function BW(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function p4(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(p4=function(){return!!e})()}function sh(e){return sh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},sh(e)}function zW(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&x1(e,t)}function x1(e,t){return x1=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},x1(e,t)}function mp(e,t,n){return t=m4(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function m4(e){var t=UW(e,"string");return $l(t)=="symbol"?t:t+""}function UW(e,t){if($l(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if($l(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}var HW=Math.PI/180,FW=1e-5,vp=function(e){function t(){return $W(this,t),IW(this,t,arguments)}return zW(t,e),LW(t,[{key:"getTickLineCoord",value:function(r){var i=this.props,l=i.cx,s=i.cy,u=i.radius,f=i.orientation,d=i.tickSize,m=d||8,v=xt(l,s,u,r.coordinate),g=xt(l,s,u+(f==="inner"?-1:1)*m,r.coordinate);return{x1:v.x,y1:v.y,x2:g.x,y2:g.y}}},{key:"getTickTextAnchor",value:function(r){var i=this.props.orientation,l=Math.cos(-r.coordinate*HW),s;return l>FW?s=i==="outer"?"start":"end":l<-1e-5?s=i==="outer"?"end":"start":s="middle",s}},{key:"renderAxisLine",value:function(){var r=this.props,i=r.cx,l=r.cy,s=r.radius,u=r.axisLine,f=r.axisLineType,d=$i($i({},Me(this.props,!1)),{},{fill:"none"},Me(u,!1));if(f==="circle")return z.createElement(tS,qi({className:"recharts-polar-angle-axis-line"},d,{cx:i,cy:l,r:s}));var m=this.props.ticks,v=m.map(function(g){return xt(i,l,s,g.coordinate)});return z.createElement(uW,qi({className:"recharts-polar-angle-axis-line"},d,{points:v}))}},{key:"renderTicks",value:function(){var r=this,i=this.props,l=i.ticks,s=i.tick,u=i.tickLine,f=i.tickFormatter,d=i.stroke,m=Me(this.props,!1),v=Me(s,!1),g=$i($i({},m),{},{fill:"none"},Me(u,!1)),x=l.map(function(j,w){var b=r.getTickLineCoord(j),_=r.getTickTextAnchor(j),O=$i($i($i({textAnchor:_},m),{},{stroke:"none",fill:d},v),{},{index:w,payload:j,x:b.x2,y:b.y2});return z.createElement(ot,qi({className:qe("recharts-polar-angle-axis-tick",t4(s)),key:"tick-".concat(j.coordinate)},Wi(r.props,j,w)),u&&z.createElement("line",qi({className:"recharts-polar-angle-axis-tick-line"},g,b)),s&&t.renderTickItem(s,O,f?f(j.value,w):j.value))});return z.createElement(ot,{className:"recharts-polar-angle-axis-ticks"},x)}},{key:"render",value:function(){var r=this.props,i=r.ticks,l=r.radius,s=r.axisLine;return l<=0||!i||!i.length?null:z.createElement(ot,{className:qe("recharts-polar-angle-axis",this.props.className)},s&&this.renderAxisLine(),this.renderTicks())}}],[{key:"renderTickItem",value:function(r,i,l){var s;return z.isValidElement(r)?s=z.cloneElement(r,i):Re(r)?s=r(i):s=z.createElement(Zi,qi({},i,{className:"recharts-polar-angle-axis-tick-value"}),l),s}}])}(T.PureComponent);mp(vp,"displayName","PolarAngleAxis");mp(vp,"axisType","angleAxis");mp(vp,"defaultProps",{type:"category",angleAxisId:0,scale:"auto",cx:0,cy:0,orientation:"outer",axisLine:!0,tickLine:!0,tickSize:8,tick:!0,hide:!1,allowDuplicatedCategory:!0});var $0,$M;function GW(){if($M)return $0;$M=1;var e=_D(),t=e(Object.getPrototypeOf,Object);return $0=t,$0}var L0,LM;function VW(){if(LM)return L0;LM=1;var e=xa(),t=GW(),n=wa(),r="[object Object]",i=Function.prototype,l=Object.prototype,s=i.toString,u=l.hasOwnProperty,f=s.call(Object);function d(m){if(!n(m)||e(m)!=r)return!1;var v=t(m);if(v===null)return!0;var g=u.call(v,"constructor")&&v.constructor;return typeof g=="function"&&g instanceof g&&s.call(g)==f}return L0=d,L0}var YW=VW();const KW=rt(YW);var I0,IM;function XW(){if(IM)return I0;IM=1;var e=xa(),t=wa(),n="[object Boolean]";function r(i){return i===!0||i===!1||t(i)&&e(i)==n}return I0=r,I0}var WW=XW();const ZW=rt(WW);function su(e){"@babel/helpers - typeof";return su=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},su(e)}function ch(){return ch=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},ch.apply(this,arguments)}function QW(e,t){return nZ(e)||tZ(e,t)||eZ(e,t)||JW()}function JW(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function eZ(e,t){if(e){if(typeof e=="string")return qM(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return qM(e,t)}}function qM(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function tZ(e,t){var n=e==null?null:typeof Symbol<"u"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var r,i,l,s,u=[],f=!0,d=!1;try{if(l=(n=n.call(e)).next,t!==0)for(;!(f=(r=l.call(n)).done)&&(u.push(r.value),u.length!==t);f=!0);}catch(m){d=!0,i=m}finally{try{if(!f&&n.return!=null&&(s=n.return(),Object(s)!==s))return}finally{if(d)throw i}}return u}}function nZ(e){if(Array.isArray(e))return e}function BM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function zM(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?BM(Object(n),!0).forEach(function(r){rZ(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):BM(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function rZ(e,t,n){return t=aZ(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function aZ(e){var t=iZ(e,"string");return su(t)=="symbol"?t:t+""}function iZ(e,t){if(su(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(su(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var UM=function(t,n,r,i,l){var s=r-i,u;return u="M ".concat(t,",").concat(n),u+="L ".concat(t+r,",").concat(n),u+="L ".concat(t+r-s/2,",").concat(n+l),u+="L ".concat(t+r-s/2-i,",").concat(n+l),u+="L ".concat(t,",").concat(n," Z"),u},oZ={x:0,y:0,upperWidth:0,lowerWidth:0,height:0,isUpdateAnimationActive:!1,animationBegin:0,animationDuration:1500,animationEasing:"ease"},lZ=function(t){var n=zM(zM({},oZ),t),r=T.useRef(),i=T.useState(-1),l=QW(i,2),s=l[0],u=l[1];T.useEffect(function(){if(r.current&&r.current.getTotalLength)try{var E=r.current.getTotalLength();E&&u(E)}catch{}},[]);var f=n.x,d=n.y,m=n.upperWidth,v=n.lowerWidth,g=n.height,x=n.className,j=n.animationEasing,w=n.animationDuration,b=n.animationBegin,_=n.isUpdateAnimationActive;if(f!==+f||d!==+d||m!==+m||v!==+v||g!==+g||m===0&&v===0||g===0)return null;var O=qe("recharts-trapezoid",x);return _?z.createElement(va,{canBegin:s>0,from:{upperWidth:0,lowerWidth:0,height:g,x:f,y:d},to:{upperWidth:m,lowerWidth:v,height:g,x:f,y:d},duration:w,animationEasing:j,isActive:_},function(E){var C=E.upperWidth,A=E.lowerWidth,N=E.height,P=E.x,D=E.y;return z.createElement(va,{canBegin:s>0,from:"0px ".concat(s===-1?1:s,"px"),to:"".concat(s,"px 0px"),attributeName:"strokeDasharray",begin:b,duration:w,easing:j},z.createElement("path",ch({},Me(n,!0),{className:O,d:UM(P,D,C,A,N),ref:r})))}):z.createElement("g",null,z.createElement("path",ch({},Me(n,!0),{className:O,d:UM(f,d,m,v,g)})))},sZ=["option","shapeType","propTransformer","activeClassName","isActive"];function cu(e){"@babel/helpers - typeof";return cu=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},cu(e)}function cZ(e,t){if(e==null)return{};var n=uZ(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function uZ(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}function HM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function uh(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?HM(Object(n),!0).forEach(function(r){fZ(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):HM(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function fZ(e,t,n){return t=dZ(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function dZ(e){var t=hZ(e,"string");return cu(t)=="symbol"?t:t+""}function hZ(e,t){if(cu(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(cu(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function pZ(e,t){return uh(uh({},t),e)}function mZ(e,t){return e==="symbols"}function FM(e){var t=e.shapeType,n=e.elementProps;switch(t){case"rectangle":return z.createElement(eS,n);case"trapezoid":return z.createElement(lZ,n);case"sector":return z.createElement(a4,n);case"symbols":if(mZ(t))return z.createElement(bw,n);break;default:return null}}function vZ(e){return T.isValidElement(e)?e.props:e}function v4(e){var t=e.option,n=e.shapeType,r=e.propTransformer,i=r===void 0?pZ:r,l=e.activeClassName,s=l===void 0?"recharts-active-shape":l,u=e.isActive,f=cZ(e,sZ),d;if(T.isValidElement(t))d=T.cloneElement(t,uh(uh({},f),vZ(t)));else if(Re(t))d=t(f);else if(KW(t)&&!ZW(t)){var m=i(t,f);d=z.createElement(FM,{shapeType:n,elementProps:m})}else{var v=f;d=z.createElement(FM,{shapeType:n,elementProps:v})}return u?z.createElement(ot,{className:s},d):d}function yp(e,t){return t!=null&&"trapezoids"in e.props}function gp(e,t){return t!=null&&"sectors"in e.props}function uu(e,t){return t!=null&&"points"in e.props}function yZ(e,t){var n,r,i=e.x===(t==null||(n=t.labelViewBox)===null||n===void 0?void 0:n.x)||e.x===t.x,l=e.y===(t==null||(r=t.labelViewBox)===null||r===void 0?void 0:r.y)||e.y===t.y;return i&&l}function gZ(e,t){var n=e.endAngle===t.endAngle,r=e.startAngle===t.startAngle;return n&&r}function bZ(e,t){var n=e.x===t.x,r=e.y===t.y,i=e.z===t.z;return n&&r&&i}function xZ(e,t){var n;return yp(e,t)?n=yZ:gp(e,t)?n=gZ:uu(e,t)&&(n=bZ),n}function wZ(e,t){var n;return yp(e,t)?n="trapezoids":gp(e,t)?n="sectors":uu(e,t)&&(n="points"),n}function SZ(e,t){if(yp(e,t)){var n;return(n=t.tooltipPayload)===null||n===void 0||(n=n[0])===null||n===void 0||(n=n.payload)===null||n===void 0?void 0:n.payload}if(gp(e,t)){var r;return(r=t.tooltipPayload)===null||r===void 0||(r=r[0])===null||r===void 0||(r=r.payload)===null||r===void 0?void 0:r.payload}return uu(e,t)?t.payload:{}}function jZ(e){var t=e.activeTooltipItem,n=e.graphicalItem,r=e.itemData,i=wZ(n,t),l=SZ(n,t),s=r.filter(function(f,d){var m=cp(l,f),v=n.props[i].filter(function(j){var w=xZ(n,t);return w(j,t)}),g=n.props[i].indexOf(v[v.length-1]),x=d===g;return m&&x}),u=r.indexOf(s[s.length-1]);return u}var Sd;function Ll(e){"@babel/helpers - typeof";return Ll=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ll(e)}function ll(){return ll=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},ll.apply(this,arguments)}function GM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function gt(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?GM(Object(n),!0).forEach(function(r){Qn(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):GM(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function OZ(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function VM(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,g4(r.key),r)}}function _Z(e,t,n){return t&&VM(e.prototype,t),n&&VM(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e}function AZ(e,t,n){return t=fh(t),EZ(e,y4()?Reflect.construct(t,n||[],fh(e).constructor):t.apply(e,n))}function EZ(e,t){if(t&&(Ll(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return TZ(e)}function TZ(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function y4(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(y4=function(){return!!e})()}function fh(e){return fh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},fh(e)}function CZ(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&w1(e,t)}function w1(e,t){return w1=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},w1(e,t)}function Qn(e,t,n){return t=g4(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function g4(e){var t=NZ(e,"string");return Ll(t)=="symbol"?t:t+""}function NZ(e,t){if(Ll(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Ll(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}var ja=function(e){function t(n){var r;return OZ(this,t),r=AZ(this,t,[n]),Qn(r,"pieRef",null),Qn(r,"sectorRefs",[]),Qn(r,"id",_u("recharts-pie-")),Qn(r,"handleAnimationEnd",function(){var i=r.props.onAnimationEnd;r.setState({isAnimationFinished:!0}),Re(i)&&i()}),Qn(r,"handleAnimationStart",function(){var i=r.props.onAnimationStart;r.setState({isAnimationFinished:!1}),Re(i)&&i()}),r.state={isAnimationFinished:!n.isAnimationActive,prevIsAnimationActive:n.isAnimationActive,prevAnimationId:n.animationId,sectorToFocus:0},r}return CZ(t,e),_Z(t,[{key:"isActiveIndex",value:function(r){var i=this.props.activeIndex;return Array.isArray(i)?i.indexOf(r)!==-1:r===i}},{key:"hasActiveIndex",value:function(){var r=this.props.activeIndex;return Array.isArray(r)?r.length!==0:r||r===0}},{key:"renderLabels",value:function(r){var i=this.props.isAnimationActive;if(i&&!this.state.isAnimationFinished)return null;var l=this.props,s=l.label,u=l.labelLine,f=l.dataKey,d=l.valueKey,m=Me(this.props,!1),v=Me(s,!1),g=Me(u,!1),x=s&&s.offsetRadius||20,j=r.map(function(w,b){var _=(w.startAngle+w.endAngle)/2,O=xt(w.cx,w.cy,w.outerRadius+x,_),E=gt(gt(gt(gt({},m),w),{},{stroke:"none"},v),{},{index:b,textAnchor:t.getTextAnchor(O.x,w.cx)},O),C=gt(gt(gt(gt({},m),w),{},{fill:"none",stroke:w.fill},g),{},{index:b,points:[xt(w.cx,w.cy,w.outerRadius,_),O]}),A=f;return Ve(f)&&Ve(d)?A="value":Ve(f)&&(A=d),z.createElement(ot,{key:"label-".concat(w.startAngle,"-").concat(w.endAngle,"-").concat(w.midAngle,"-").concat(b)},u&&t.renderLabelLineItem(u,C,"line"),t.renderLabelItem(s,E,cn(w,A)))});return z.createElement(ot,{className:"recharts-pie-labels"},j)}},{key:"renderSectorsStatically",value:function(r){var i=this,l=this.props,s=l.activeShape,u=l.blendStroke,f=l.inactiveShape;return r.map(function(d,m){if((d==null?void 0:d.startAngle)===0&&(d==null?void 0:d.endAngle)===0&&r.length!==1)return null;var v=i.isActiveIndex(m),g=f&&i.hasActiveIndex()?f:null,x=v?s:g,j=gt(gt({},d),{},{stroke:u?d.fill:d.stroke,tabIndex:-1});return z.createElement(ot,ll({ref:function(b){b&&!i.sectorRefs.includes(b)&&i.sectorRefs.push(b)},tabIndex:-1,className:"recharts-pie-sector"},Wi(i.props,d,m),{key:"sector-".concat(d==null?void 0:d.startAngle,"-").concat(d==null?void 0:d.endAngle,"-").concat(d.midAngle,"-").concat(m)}),z.createElement(v4,ll({option:x,isActive:v,shapeType:"sector"},j)))})}},{key:"renderSectorsWithAnimation",value:function(){var r=this,i=this.props,l=i.sectors,s=i.isAnimationActive,u=i.animationBegin,f=i.animationDuration,d=i.animationEasing,m=i.animationId,v=this.state,g=v.prevSectors,x=v.prevIsAnimationActive;return z.createElement(va,{begin:u,duration:f,isActive:s,easing:d,from:{t:0},to:{t:1},key:"pie-".concat(m,"-").concat(x),onAnimationStart:this.handleAnimationStart,onAnimationEnd:this.handleAnimationEnd},function(j){var w=j.t,b=[],_=l&&l[0],O=_.startAngle;return l.forEach(function(E,C){var A=g&&g[C],N=C>0?Ln(E,"paddingAngle",0):0;if(A){var P=Wa(A.endAngle-A.startAngle,E.endAngle-E.startAngle),D=gt(gt({},E),{},{startAngle:O+N,endAngle:O+P(w)+N});b.push(D),O=D.endAngle}else{var L=E.endAngle,G=E.startAngle,I=Wa(0,L-G),H=I(w),V=gt(gt({},E),{},{startAngle:O+N,endAngle:O+H+N});b.push(V),O=V.endAngle}}),z.createElement(ot,null,r.renderSectorsStatically(b))})}},{key:"attachKeyboardHandlers",value:function(r){var i=this;r.onkeydown=function(l){if(!l.altKey)switch(l.key){case"ArrowLeft":{var s=++i.state.sectorToFocus%i.sectorRefs.length;i.sectorRefs[s].focus(),i.setState({sectorToFocus:s});break}case"ArrowRight":{var u=--i.state.sectorToFocus<0?i.sectorRefs.length-1:i.state.sectorToFocus%i.sectorRefs.length;i.sectorRefs[u].focus(),i.setState({sectorToFocus:u});break}case"Escape":{i.sectorRefs[i.state.sectorToFocus].blur(),i.setState({sectorToFocus:0});break}}}}},{key:"renderSectors",value:function(){var r=this.props,i=r.sectors,l=r.isAnimationActive,s=this.state.prevSectors;return l&&i&&i.length&&(!s||!cp(s,i))?this.renderSectorsWithAnimation():this.renderSectorsStatically(i)}},{key:"componentDidMount",value:function(){this.pieRef&&this.attachKeyboardHandlers(this.pieRef)}},{key:"render",value:function(){var r=this,i=this.props,l=i.hide,s=i.sectors,u=i.className,f=i.label,d=i.cx,m=i.cy,v=i.innerRadius,g=i.outerRadius,x=i.isAnimationActive,j=this.state.isAnimationFinished;if(l||!s||!s.length||!fe(d)||!fe(m)||!fe(v)||!fe(g))return null;var w=qe("recharts-pie",u);return z.createElement(ot,{tabIndex:this.props.rootTabIndex,className:w,ref:function(_){r.pieRef=_}},this.renderSectors(),f&&this.renderLabels(s),Xt.renderCallByParent(this.props,null,!1),(!x||j)&&ni.renderCallByParent(this.props,s,!1))}}],[{key:"getDerivedStateFromProps",value:function(r,i){return i.prevIsAnimationActive!==r.isAnimationActive?{prevIsAnimationActive:r.isAnimationActive,prevAnimationId:r.animationId,curSectors:r.sectors,prevSectors:[],isAnimationFinished:!0}:r.isAnimationActive&&r.animationId!==i.prevAnimationId?{prevAnimationId:r.animationId,curSectors:r.sectors,prevSectors:i.curSectors,isAnimationFinished:!0}:r.sectors!==i.curSectors?{curSectors:r.sectors,isAnimationFinished:!0}:null}},{key:"getTextAnchor",value:function(r,i){return r>i?"start":r<i?"end":"middle"}},{key:"renderLabelLineItem",value:function(r,i,l){if(z.isValidElement(r))return z.cloneElement(r,i);if(Re(r))return r(i);var s=qe("recharts-pie-label-line",typeof r!="boolean"?r.className:"");return z.createElement(o1,ll({},i,{key:l,type:"linear",className:s}))}},{key:"renderLabelItem",value:function(r,i,l){if(z.isValidElement(r))return z.cloneElement(r,i);var s=l;if(Re(r)&&(s=r(i),z.isValidElement(s)))return s;var u=qe("recharts-pie-label-text",typeof r!="boolean"&&!Re(r)?r.className:"");return z.createElement(Zi,ll({},i,{alignmentBaseline:"middle",className:u}),s)}}])}(T.PureComponent);Sd=ja;Qn(ja,"displayName","Pie");Qn(ja,"defaultProps",{stroke:"#fff",fill:"#808080",legendType:"rect",cx:"50%",cy:"50%",startAngle:0,endAngle:360,innerRadius:0,outerRadius:"80%",paddingAngle:0,labelLine:!0,hide:!1,minAngle:0,isAnimationActive:!as.isSsr,animationBegin:400,animationDuration:1500,animationEasing:"ease",nameKey:"name",blendStroke:!1,rootTabIndex:0});Qn(ja,"parseDeltaAngle",function(e,t){var n=hn(t-e),r=Math.min(Math.abs(t-e),360);return n*r});Qn(ja,"getRealPieData",function(e){var t=e.data,n=e.children,r=Me(e,!1),i=tr(n,Jh);return t&&t.length?t.map(function(l,s){return gt(gt(gt({payload:l},r),l),i&&i[s]&&i[s].props)}):i&&i.length?i.map(function(l){return gt(gt({},r),l.props)}):[]});Qn(ja,"parseCoordinateOfPie",function(e,t){var n=t.top,r=t.left,i=t.width,l=t.height,s=e4(i,l),u=r+pn(e.cx,i,i/2),f=n+pn(e.cy,l,l/2),d=pn(e.innerRadius,s,0),m=pn(e.outerRadius,s,s*.8),v=e.maxRadius||Math.sqrt(i*i+l*l)/2;return{cx:u,cy:f,innerRadius:d,outerRadius:m,maxRadius:v}});Qn(ja,"getComposedData",function(e){var t=e.item,n=e.offset,r=t.type.defaultProps!==void 0?gt(gt({},t.type.defaultProps),t.props):t.props,i=Sd.getRealPieData(r);if(!i||!i.length)return null;var l=r.cornerRadius,s=r.startAngle,u=r.endAngle,f=r.paddingAngle,d=r.dataKey,m=r.nameKey,v=r.valueKey,g=r.tooltipType,x=Math.abs(r.minAngle),j=Sd.parseCoordinateOfPie(r,n),w=Sd.parseDeltaAngle(s,u),b=Math.abs(w),_=d;Ve(d)&&Ve(v)?(pr(!1,`Use "dataKey" to specify the value of pie,
-      the props "valueKey" will be deprecated in 1.1.0`),_="value"):Ve(d)&&(pr(!1,`Use "dataKey" to specify the value of pie,
-      the props "valueKey" will be deprecated in 1.1.0`),_=v);var O=i.filter(function(D){return cn(D,_,0)!==0}).length,E=(b>=360?O:O-1)*f,C=b-O*x-E,A=i.reduce(function(D,L){var G=cn(L,_,0);return D+(fe(G)?G:0)},0),N;if(A>0){var P;N=i.map(function(D,L){var G=cn(D,_,0),I=cn(D,m,L),H=(fe(G)?G:0)/A,V;L?V=P.endAngle+hn(w)*f*(G!==0?1:0):V=s;var Z=V+hn(w)*((G!==0?x:0)+H*C),Y=(V+Z)/2,$=(j.innerRadius+j.outerRadius)/2,U=[{name:I,value:G,payload:D,dataKey:_,type:g}],B=xt(j.cx,j.cy,$,Y);return P=gt(gt(gt({percent:H,cornerRadius:l,name:I,tooltipPayload:U,midAngle:Y,middleRadius:$,tooltipPosition:B},D),j),{},{value:cn(D,_),startAngle:V,endAngle:Z,payload:D,paddingAngle:hn(w)*f}),P})}return gt(gt({},j),{},{sectors:N,data:i})});var q0,YM;function MZ(){if(YM)return q0;YM=1;var e=Math.ceil,t=Math.max;function n(r,i,l,s){for(var u=-1,f=t(e((i-r)/(l||1)),0),d=Array(f);f--;)d[s?f:++u]=r,r+=l;return d}return q0=n,q0}var B0,KM;function b4(){if(KM)return B0;KM=1;var e=zD(),t=1/0,n=17976931348623157e292;function r(i){if(!i)return i===0?i:0;if(i=e(i),i===t||i===-1/0){var l=i<0?-1:1;return l*n}return i===i?i:0}return B0=r,B0}var z0,XM;function PZ(){if(XM)return z0;XM=1;var e=MZ(),t=Qh(),n=b4();function r(i){return function(l,s,u){return u&&typeof u!="number"&&t(l,s,u)&&(s=u=void 0),l=n(l),s===void 0?(s=l,l=0):s=n(s),u=u===void 0?l<s?1:-1:n(u),e(l,s,u,i)}}return z0=r,z0}var U0,WM;function RZ(){if(WM)return U0;WM=1;var e=PZ(),t=e();return U0=t,U0}var DZ=RZ();const dh=rt(DZ);function fu(e){"@babel/helpers - typeof";return fu=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},fu(e)}function ZM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function QM(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?ZM(Object(n),!0).forEach(function(r){x4(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):ZM(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function x4(e,t,n){return t=kZ(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function kZ(e){var t=$Z(e,"string");return fu(t)=="symbol"?t:t+""}function $Z(e,t){if(fu(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(fu(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var LZ=["Webkit","Moz","O","ms"],IZ=function(t,n){var r=t.replace(/(\w)/,function(l){return l.toUpperCase()}),i=LZ.reduce(function(l,s){return QM(QM({},l),{},x4({},s+r,n))},{});return i[t]=n,i};function Il(e){"@babel/helpers - typeof";return Il=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Il(e)}function hh(){return hh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},hh.apply(this,arguments)}function JM(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function H0(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?JM(Object(n),!0).forEach(function(r){Rn(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):JM(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function qZ(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function eP(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,S4(r.key),r)}}function BZ(e,t,n){return t&&eP(e.prototype,t),n&&eP(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e}function zZ(e,t,n){return t=ph(t),UZ(e,w4()?Reflect.construct(t,n||[],ph(e).constructor):t.apply(e,n))}function UZ(e,t){if(t&&(Il(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return HZ(e)}function HZ(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function w4(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(w4=function(){return!!e})()}function ph(e){return ph=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},ph(e)}function FZ(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&S1(e,t)}function S1(e,t){return S1=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},S1(e,t)}function Rn(e,t,n){return t=S4(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function S4(e){var t=GZ(e,"string");return Il(t)=="symbol"?t:t+""}function GZ(e,t){if(Il(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Il(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}var VZ=function(t){var n=t.data,r=t.startIndex,i=t.endIndex,l=t.x,s=t.width,u=t.travellerWidth;if(!n||!n.length)return{};var f=n.length,d=Tc().domain(dh(0,f)).range([l,l+s-u]),m=d.domain().map(function(v){return d(v)});return{isTextActive:!1,isSlideMoving:!1,isTravellerMoving:!1,isTravellerFocused:!1,startX:d(r),endX:d(i),scale:d,scaleValues:m}},tP=function(t){return t.changedTouches&&!!t.changedTouches.length},ql=function(e){function t(n){var r;return qZ(this,t),r=zZ(this,t,[n]),Rn(r,"handleDrag",function(i){r.leaveTimer&&(clearTimeout(r.leaveTimer),r.leaveTimer=null),r.state.isTravellerMoving?r.handleTravellerMove(i):r.state.isSlideMoving&&r.handleSlideDrag(i)}),Rn(r,"handleTouchMove",function(i){i.changedTouches!=null&&i.changedTouches.length>0&&r.handleDrag(i.changedTouches[0])}),Rn(r,"handleDragEnd",function(){r.setState({isTravellerMoving:!1,isSlideMoving:!1},function(){var i=r.props,l=i.endIndex,s=i.onDragEnd,u=i.startIndex;s==null||s({endIndex:l,startIndex:u})}),r.detachDragEndListener()}),Rn(r,"handleLeaveWrapper",function(){(r.state.isTravellerMoving||r.state.isSlideMoving)&&(r.leaveTimer=window.setTimeout(r.handleDragEnd,r.props.leaveTimeOut))}),Rn(r,"handleEnterSlideOrTraveller",function(){r.setState({isTextActive:!0})}),Rn(r,"handleLeaveSlideOrTraveller",function(){r.setState({isTextActive:!1})}),Rn(r,"handleSlideDragStart",function(i){var l=tP(i)?i.changedTouches[0]:i;r.setState({isTravellerMoving:!1,isSlideMoving:!0,slideMoveStartX:l.pageX}),r.attachDragEndListener()}),r.travellerDragStartHandlers={startX:r.handleTravellerDragStart.bind(r,"startX"),endX:r.handleTravellerDragStart.bind(r,"endX")},r.state={},r}return FZ(t,e),BZ(t,[{key:"componentWillUnmount",value:function(){this.leaveTimer&&(clearTimeout(this.leaveTimer),this.leaveTimer=null),this.detachDragEndListener()}},{key:"getIndex",value:function(r){var i=r.startX,l=r.endX,s=this.state.scaleValues,u=this.props,f=u.gap,d=u.data,m=d.length-1,v=Math.min(i,l),g=Math.max(i,l),x=t.getIndexInRange(s,v),j=t.getIndexInRange(s,g);return{startIndex:x-x%f,endIndex:j===m?m:j-j%f}}},{key:"getTextOfTick",value:function(r){var i=this.props,l=i.data,s=i.tickFormatter,u=i.dataKey,f=cn(l[r],u,r);return Re(s)?s(f,r):f}},{key:"attachDragEndListener",value:function(){window.addEventListener("mouseup",this.handleDragEnd,!0),window.addEventListener("touchend",this.handleDragEnd,!0),window.addEventListener("mousemove",this.handleDrag,!0)}},{key:"detachDragEndListener",value:function(){window.removeEventListener("mouseup",this.handleDragEnd,!0),window.removeEventListener("touchend",this.handleDragEnd,!0),window.removeEventListener("mousemove",this.handleDrag,!0)}},{key:"handleSlideDrag",value:function(r){var i=this.state,l=i.slideMoveStartX,s=i.startX,u=i.endX,f=this.props,d=f.x,m=f.width,v=f.travellerWidth,g=f.startIndex,x=f.endIndex,j=f.onChange,w=r.pageX-l;w>0?w=Math.min(w,d+m-v-u,d+m-v-s):w<0&&(w=Math.max(w,d-s,d-u));var b=this.getIndex({startX:s+w,endX:u+w});(b.startIndex!==g||b.endIndex!==x)&&j&&j(b),this.setState({startX:s+w,endX:u+w,slideMoveStartX:r.pageX})}},{key:"handleTravellerDragStart",value:function(r,i){var l=tP(i)?i.changedTouches[0]:i;this.setState({isSlideMoving:!1,isTravellerMoving:!0,movingTravellerId:r,brushMoveStartX:l.pageX}),this.attachDragEndListener()}},{key:"handleTravellerMove",value:function(r){var i=this.state,l=i.brushMoveStartX,s=i.movingTravellerId,u=i.endX,f=i.startX,d=this.state[s],m=this.props,v=m.x,g=m.width,x=m.travellerWidth,j=m.onChange,w=m.gap,b=m.data,_={startX:this.state.startX,endX:this.state.endX},O=r.pageX-l;O>0?O=Math.min(O,v+g-x-d):O<0&&(O=Math.max(O,v-d)),_[s]=d+O;var E=this.getIndex(_),C=E.startIndex,A=E.endIndex,N=function(){var D=b.length-1;return s==="startX"&&(u>f?C%w===0:A%w===0)||u<f&&A===D||s==="endX"&&(u>f?A%w===0:C%w===0)||u>f&&A===D};this.setState(Rn(Rn({},s,d+O),"brushMoveStartX",r.pageX),function(){j&&N()&&j(E)})}},{key:"handleTravellerMoveKeyboard",value:function(r,i){var l=this,s=this.state,u=s.scaleValues,f=s.startX,d=s.endX,m=this.state[i],v=u.indexOf(m);if(v!==-1){var g=v+r;if(!(g===-1||g>=u.length)){var x=u[g];i==="startX"&&x>=d||i==="endX"&&x<=f||this.setState(Rn({},i,x),function(){l.props.onChange(l.getIndex({startX:l.state.startX,endX:l.state.endX}))})}}}},{key:"renderBackground",value:function(){var r=this.props,i=r.x,l=r.y,s=r.width,u=r.height,f=r.fill,d=r.stroke;return z.createElement("rect",{stroke:d,fill:f,x:i,y:l,width:s,height:u})}},{key:"renderPanorama",value:function(){var r=this.props,i=r.x,l=r.y,s=r.width,u=r.height,f=r.data,d=r.children,m=r.padding,v=T.Children.only(d);return v?z.cloneElement(v,{x:i,y:l,width:s,height:u,margin:m,compact:!0,data:f}):null}},{key:"renderTravellerLayer",value:function(r,i){var l,s,u=this,f=this.props,d=f.y,m=f.travellerWidth,v=f.height,g=f.traveller,x=f.ariaLabel,j=f.data,w=f.startIndex,b=f.endIndex,_=Math.max(r,this.props.x),O=H0(H0({},Me(this.props,!1)),{},{x:_,y:d,width:m,height:v}),E=x||"Min value: ".concat((l=j[w])===null||l===void 0?void 0:l.name,", Max value: ").concat((s=j[b])===null||s===void 0?void 0:s.name);return z.createElement(ot,{tabIndex:0,role:"slider","aria-label":E,"aria-valuenow":r,className:"recharts-brush-traveller",onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.travellerDragStartHandlers[i],onTouchStart:this.travellerDragStartHandlers[i],onKeyDown:function(A){["ArrowLeft","ArrowRight"].includes(A.key)&&(A.preventDefault(),A.stopPropagation(),u.handleTravellerMoveKeyboard(A.key==="ArrowRight"?1:-1,i))},onFocus:function(){u.setState({isTravellerFocused:!0})},onBlur:function(){u.setState({isTravellerFocused:!1})},style:{cursor:"col-resize"}},t.renderTraveller(g,O))}},{key:"renderSlide",value:function(r,i){var l=this.props,s=l.y,u=l.height,f=l.stroke,d=l.travellerWidth,m=Math.min(r,i)+d,v=Math.max(Math.abs(i-r)-d,0);return z.createElement("rect",{className:"recharts-brush-slide",onMouseEnter:this.handleEnterSlideOrTraveller,onMouseLeave:this.handleLeaveSlideOrTraveller,onMouseDown:this.handleSlideDragStart,onTouchStart:this.handleSlideDragStart,style:{cursor:"move"},stroke:"none",fill:f,fillOpacity:.2,x:m,y:s,width:v,height:u})}},{key:"renderText",value:function(){var r=this.props,i=r.startIndex,l=r.endIndex,s=r.y,u=r.height,f=r.travellerWidth,d=r.stroke,m=this.state,v=m.startX,g=m.endX,x=5,j={pointerEvents:"none",fill:d};return z.createElement(ot,{className:"recharts-brush-texts"},z.createElement(Zi,hh({textAnchor:"end",verticalAnchor:"middle",x:Math.min(v,g)-x,y:s+u/2},j),this.getTextOfTick(i)),z.createElement(Zi,hh({textAnchor:"start",verticalAnchor:"middle",x:Math.max(v,g)+f+x,y:s+u/2},j),this.getTextOfTick(l)))}},{key:"render",value:function(){var r=this.props,i=r.data,l=r.className,s=r.children,u=r.x,f=r.y,d=r.width,m=r.height,v=r.alwaysShowText,g=this.state,x=g.startX,j=g.endX,w=g.isTextActive,b=g.isSlideMoving,_=g.isTravellerMoving,O=g.isTravellerFocused;if(!i||!i.length||!fe(u)||!fe(f)||!fe(d)||!fe(m)||d<=0||m<=0)return null;var E=qe("recharts-brush",l),C=z.Children.count(s)===1,A=IZ("userSelect","none");return z.createElement(ot,{className:E,onMouseLeave:this.handleLeaveWrapper,onTouchMove:this.handleTouchMove,style:A},this.renderBackground(),C&&this.renderPanorama(),this.renderSlide(x,j),this.renderTravellerLayer(x,"startX"),this.renderTravellerLayer(j,"endX"),(w||b||_||O||v)&&this.renderText())}}],[{key:"renderDefaultTraveller",value:function(r){var i=r.x,l=r.y,s=r.width,u=r.height,f=r.stroke,d=Math.floor(l+u/2)-1;return z.createElement(z.Fragment,null,z.createElement("rect",{x:i,y:l,width:s,height:u,fill:f,stroke:"none"}),z.createElement("line",{x1:i+1,y1:d,x2:i+s-1,y2:d,fill:"none",stroke:"#fff"}),z.createElement("line",{x1:i+1,y1:d+2,x2:i+s-1,y2:d+2,fill:"none",stroke:"#fff"}))}},{key:"renderTraveller",value:function(r,i){var l;return z.isValidElement(r)?l=z.cloneElement(r,i):Re(r)?l=r(i):l=t.renderDefaultTraveller(i),l}},{key:"getDerivedStateFromProps",value:function(r,i){var l=r.data,s=r.width,u=r.x,f=r.travellerWidth,d=r.updateId,m=r.startIndex,v=r.endIndex;if(l!==i.prevData||d!==i.prevUpdateId)return H0({prevData:l,prevTravellerWidth:f,prevUpdateId:d,prevX:u,prevWidth:s},l&&l.length?VZ({data:l,width:s,x:u,travellerWidth:f,startIndex:m,endIndex:v}):{scale:null,scaleValues:null});if(i.scale&&(s!==i.prevWidth||u!==i.prevX||f!==i.prevTravellerWidth)){i.scale.range([u,u+s-f]);var g=i.scale.domain().map(function(x){return i.scale(x)});return{prevData:l,prevTravellerWidth:f,prevUpdateId:d,prevX:u,prevWidth:s,startX:i.scale(r.startIndex),endX:i.scale(r.endIndex),scaleValues:g}}return null}},{key:"getIndexInRange",value:function(r,i){for(var l=r.length,s=0,u=l-1;u-s>1;){var f=Math.floor((s+u)/2);r[f]>i?u=f:s=f}return i>=r[u]?u:s}}])}(T.PureComponent);Rn(ql,"displayName","Brush");Rn(ql,"defaultProps",{height:40,travellerWidth:5,gap:1,fill:"#fff",stroke:"#666",padding:{top:1,right:1,bottom:1,left:1},leaveTimeOut:1e3,alwaysShowText:!1});var F0,nP;function YZ(){if(nP)return F0;nP=1;var e=Aw();function t(n,r){var i;return e(n,function(l,s,u){return i=r(l,s,u),!i}),!!i}return F0=t,F0}var G0,rP;function KZ(){if(rP)return G0;rP=1;var e=gD(),t=Dr(),n=YZ(),r=jn(),i=Qh();function l(s,u,f){var d=r(s)?e:n;return f&&i(s,u,f)&&(u=void 0),d(s,t(u,3))}return G0=l,G0}var XZ=KZ();const WZ=rt(XZ);var Er=function(t,n){var r=t.alwaysShow,i=t.ifOverflow;return r&&(i="extendDomain"),i===n},V0,aP;function ZZ(){if(aP)return V0;aP=1;var e=$D();function t(n,r,i){r=="__proto__"&&e?e(n,r,{configurable:!0,enumerable:!0,value:i,writable:!0}):n[r]=i}return V0=t,V0}var Y0,iP;function QZ(){if(iP)return Y0;iP=1;var e=ZZ(),t=DD(),n=Dr();function r(i,l){var s={};return l=n(l,3),t(i,function(u,f,d){e(s,f,l(u,f,d))}),s}return Y0=r,Y0}var JZ=QZ();const eQ=rt(JZ);var K0,oP;function tQ(){if(oP)return K0;oP=1;function e(t,n){for(var r=-1,i=t==null?0:t.length;++r<i;)if(!n(t[r],r,t))return!1;return!0}return K0=e,K0}var X0,lP;function nQ(){if(lP)return X0;lP=1;var e=Aw();function t(n,r){var i=!0;return e(n,function(l,s,u){return i=!!r(l,s,u),i}),i}return X0=t,X0}var W0,sP;function rQ(){if(sP)return W0;sP=1;var e=tQ(),t=nQ(),n=Dr(),r=jn(),i=Qh();function l(s,u,f){var d=r(s)?e:t;return f&&i(s,u,f)&&(u=void 0),d(s,n(u,3))}return W0=l,W0}var aQ=rQ();const j4=rt(aQ);var iQ=["x","y"];function du(e){"@babel/helpers - typeof";return du=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},du(e)}function j1(){return j1=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},j1.apply(this,arguments)}function cP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function Sc(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?cP(Object(n),!0).forEach(function(r){oQ(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):cP(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function oQ(e,t,n){return t=lQ(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function lQ(e){var t=sQ(e,"string");return du(t)=="symbol"?t:t+""}function sQ(e,t){if(du(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(du(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function cQ(e,t){if(e==null)return{};var n=uQ(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function uQ(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}function fQ(e,t){var n=e.x,r=e.y,i=cQ(e,iQ),l="".concat(n),s=parseInt(l,10),u="".concat(r),f=parseInt(u,10),d="".concat(t.height||i.height),m=parseInt(d,10),v="".concat(t.width||i.width),g=parseInt(v,10);return Sc(Sc(Sc(Sc(Sc({},t),i),s?{x:s}:{}),f?{y:f}:{}),{},{height:m,width:g,name:t.name,radius:t.radius})}function uP(e){return z.createElement(v4,j1({shapeType:"rectangle",propTransformer:fQ,activeClassName:"recharts-active-bar"},e))}var dQ=function(t){var n=arguments.length>1&&arguments[1]!==void 0?arguments[1]:0;return function(r,i){if(typeof t=="number")return t;var l=typeof r=="number";return l?t(r,i):(l||Ji(),n)}},hQ=["value","background"],O4;function Bl(e){"@babel/helpers - typeof";return Bl=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Bl(e)}function pQ(e,t){if(e==null)return{};var n=mQ(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function mQ(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}function mh(){return mh=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},mh.apply(this,arguments)}function fP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function $t(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?fP(Object(n),!0).forEach(function(r){Ja(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):fP(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function vQ(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function dP(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,A4(r.key),r)}}function yQ(e,t,n){return t&&dP(e.prototype,t),n&&dP(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e}function gQ(e,t,n){return t=vh(t),bQ(e,_4()?Reflect.construct(t,n||[],vh(e).constructor):t.apply(e,n))}function bQ(e,t){if(t&&(Bl(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return xQ(e)}function xQ(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function _4(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(_4=function(){return!!e})()}function vh(e){return vh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},vh(e)}function wQ(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&O1(e,t)}function O1(e,t){return O1=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},O1(e,t)}function Ja(e,t,n){return t=A4(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function A4(e){var t=SQ(e,"string");return Bl(t)=="symbol"?t:t+""}function SQ(e,t){if(Bl(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Bl(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}var co=function(e){function t(){var n;vQ(this,t);for(var r=arguments.length,i=new Array(r),l=0;l<r;l++)i[l]=arguments[l];return n=gQ(this,t,[].concat(i)),Ja(n,"state",{isAnimationFinished:!1}),Ja(n,"id",_u("recharts-bar-")),Ja(n,"handleAnimationEnd",function(){var s=n.props.onAnimationEnd;n.setState({isAnimationFinished:!0}),s&&s()}),Ja(n,"handleAnimationStart",function(){var s=n.props.onAnimationStart;n.setState({isAnimationFinished:!1}),s&&s()}),n}return wQ(t,e),yQ(t,[{key:"renderRectanglesStatically",value:function(r){var i=this,l=this.props,s=l.shape,u=l.dataKey,f=l.activeIndex,d=l.activeBar,m=Me(this.props,!1);return r&&r.map(function(v,g){var x=g===f,j=x?d:s,w=$t($t($t({},m),v),{},{isActive:x,option:j,index:g,dataKey:u,onAnimationStart:i.handleAnimationStart,onAnimationEnd:i.handleAnimationEnd});return z.createElement(ot,mh({className:"recharts-bar-rectangle"},Wi(i.props,v,g),{key:"rectangle-".concat(v==null?void 0:v.x,"-").concat(v==null?void 0:v.y,"-").concat(v==null?void 0:v.value,"-").concat(g)}),z.createElement(uP,w))})}},{key:"renderRectanglesWithAnimation",value:function(){var r=this,i=this.props,l=i.data,s=i.layout,u=i.isAnimationActive,f=i.animationBegin,d=i.animationDuration,m=i.animationEasing,v=i.animationId,g=this.state.prevData;return z.createElement(va,{begin:f,duration:d,isActive:u,easing:m,from:{t:0},to:{t:1},key:"bar-".concat(v),onAnimationEnd:this.handleAnimationEnd,onAnimationStart:this.handleAnimationStart},function(x){var j=x.t,w=l.map(function(b,_){var O=g&&g[_];if(O){var E=Wa(O.x,b.x),C=Wa(O.y,b.y),A=Wa(O.width,b.width),N=Wa(O.height,b.height);return $t($t({},b),{},{x:E(j),y:C(j),width:A(j),height:N(j)})}if(s==="horizontal"){var P=Wa(0,b.height),D=P(j);return $t($t({},b),{},{y:b.y+b.height-D,height:D})}var L=Wa(0,b.width),G=L(j);return $t($t({},b),{},{width:G})});return z.createElement(ot,null,r.renderRectanglesStatically(w))})}},{key:"renderRectangles",value:function(){var r=this.props,i=r.data,l=r.isAnimationActive,s=this.state.prevData;return l&&i&&i.length&&(!s||!cp(s,i))?this.renderRectanglesWithAnimation():this.renderRectanglesStatically(i)}},{key:"renderBackground",value:function(){var r=this,i=this.props,l=i.data,s=i.dataKey,u=i.activeIndex,f=Me(this.props.background,!1);return l.map(function(d,m){d.value;var v=d.background,g=pQ(d,hQ);if(!v)return null;var x=$t($t($t($t($t({},g),{},{fill:"#eee"},v),f),Wi(r.props,d,m)),{},{onAnimationStart:r.handleAnimationStart,onAnimationEnd:r.handleAnimationEnd,dataKey:s,index:m,className:"recharts-bar-background-rectangle"});return z.createElement(uP,mh({key:"background-bar-".concat(m),option:r.props.background,isActive:m===u},x))})}},{key:"renderErrorBar",value:function(r,i){if(this.props.isAnimationActive&&!this.state.isAnimationFinished)return null;var l=this.props,s=l.data,u=l.xAxis,f=l.yAxis,d=l.layout,m=l.children,v=tr(m,dp);if(!v)return null;var g=d==="vertical"?s[0].height/2:s[0].width/2,x=function(b,_){var O=Array.isArray(b.value)?b.value[1]:b.value;return{x:b.x,y:b.y,value:O,errorVal:cn(b,_)}},j={clipPath:r?"url(#clipPath-".concat(i,")"):null};return z.createElement(ot,j,v.map(function(w){return z.cloneElement(w,{key:"error-bar-".concat(i,"-").concat(w.props.dataKey),data:s,xAxis:u,yAxis:f,layout:d,offset:g,dataPointFormatter:x})}))}},{key:"render",value:function(){var r=this.props,i=r.hide,l=r.data,s=r.className,u=r.xAxis,f=r.yAxis,d=r.left,m=r.top,v=r.width,g=r.height,x=r.isAnimationActive,j=r.background,w=r.id;if(i||!l||!l.length)return null;var b=this.state.isAnimationFinished,_=qe("recharts-bar",s),O=u&&u.allowDataOverflow,E=f&&f.allowDataOverflow,C=O||E,A=Ve(w)?this.id:w;return z.createElement(ot,{className:_},O||E?z.createElement("defs",null,z.createElement("clipPath",{id:"clipPath-".concat(A)},z.createElement("rect",{x:O?d:d-v/2,y:E?m:m-g/2,width:O?v:v*2,height:E?g:g*2}))):null,z.createElement(ot,{className:"recharts-bar-rectangles",clipPath:C?"url(#clipPath-".concat(A,")"):null},j?this.renderBackground():null,this.renderRectangles()),this.renderErrorBar(C,A),(!x||b)&&ni.renderCallByParent(this.props,l))}}],[{key:"getDerivedStateFromProps",value:function(r,i){return r.animationId!==i.prevAnimationId?{prevAnimationId:r.animationId,curData:r.data,prevData:i.curData}:r.data!==i.curData?{curData:r.data}:null}}])}(T.PureComponent);O4=co;Ja(co,"displayName","Bar");Ja(co,"defaultProps",{xAxisId:0,yAxisId:0,legendType:"rect",minPointSize:0,hide:!1,data:[],layout:"vertical",activeBar:!1,isAnimationActive:!as.isSsr,animationBegin:0,animationDuration:400,animationEasing:"ease"});Ja(co,"getComposedData",function(e){var t=e.props,n=e.item,r=e.barPosition,i=e.bandSize,l=e.xAxis,s=e.yAxis,u=e.xAxisTicks,f=e.yAxisTicks,d=e.stackedData,m=e.dataStartIndex,v=e.displayedData,g=e.offset,x=WV(r,n);if(!x)return null;var j=t.layout,w=n.type.defaultProps,b=w!==void 0?$t($t({},w),n.props):n.props,_=b.dataKey,O=b.children,E=b.minPointSize,C=j==="horizontal"?s:l,A=d?C.scale.domain():null,N=rY({numericAxis:C}),P=tr(O,Jh),D=v.map(function(L,G){var I,H,V,Z,Y,$;d?I=ZV(d[m+G],A):(I=cn(L,_),Array.isArray(I)||(I=[N,I]));var U=dQ(E,O4.defaultProps.minPointSize)(I[1],G);if(j==="horizontal"){var B,re=[s.scale(I[0]),s.scale(I[1])],k=re[0],X=re[1];H=IN({axis:l,ticks:u,bandSize:i,offset:x.offset,entry:L,index:G}),V=(B=X??k)!==null&&B!==void 0?B:void 0,Z=x.size;var te=k-X;if(Y=Number.isNaN(te)?0:te,$={x:H,y:s.y,width:Z,height:s.height},Math.abs(U)>0&&Math.abs(Y)<Math.abs(U)){var ne=hn(Y||U)*(Math.abs(U)-Math.abs(Y));V-=ne,Y+=ne}}else{var ue=[l.scale(I[0]),l.scale(I[1])],ge=ue[0],me=ue[1];if(H=ge,V=IN({axis:s,ticks:f,bandSize:i,offset:x.offset,entry:L,index:G}),Z=me-ge,Y=x.size,$={x:l.x,y:V,width:l.width,height:Y},Math.abs(U)>0&&Math.abs(Z)<Math.abs(U)){var de=hn(Z||U)*(Math.abs(U)-Math.abs(Z));Z+=de}}return $t($t($t({},L),{},{x:H,y:V,width:Z,height:Y,value:d?I:I[1],payload:L,background:$},P&&P[G]&&P[G].props),{},{tooltipPayload:[Qk(n,L)],tooltipPosition:{x:H+Z/2,y:V+Y/2}})});return $t({data:D,layout:j},g)});function hu(e){"@babel/helpers - typeof";return hu=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},hu(e)}function jQ(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function hP(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,E4(r.key),r)}}function OQ(e,t,n){return t&&hP(e.prototype,t),n&&hP(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e}function pP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function fr(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?pP(Object(n),!0).forEach(function(r){bp(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):pP(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function bp(e,t,n){return t=E4(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function E4(e){var t=_Q(e,"string");return hu(t)=="symbol"?t:t+""}function _Q(e,t){if(hu(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(hu(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var AQ=function(t,n,r,i,l){var s=t.width,u=t.height,f=t.layout,d=t.children,m=Object.keys(n),v={left:r.left,leftMirror:r.left,right:s-r.right,rightMirror:s-r.right,top:r.top,topMirror:r.top,bottom:u-r.bottom,bottomMirror:u-r.bottom},g=!!Dn(d,co);return m.reduce(function(x,j){var w=n[j],b=w.orientation,_=w.domain,O=w.padding,E=O===void 0?{}:O,C=w.mirror,A=w.reversed,N="".concat(b).concat(C?"Mirror":""),P,D,L,G,I;if(w.type==="number"&&(w.padding==="gap"||w.padding==="no-gap")){var H=_[1]-_[0],V=1/0,Z=w.categoricalDomain.sort(q8);if(Z.forEach(function(ue,ge){ge>0&&(V=Math.min((ue||0)-(Z[ge-1]||0),V))}),Number.isFinite(V)){var Y=V/H,$=w.layout==="vertical"?r.height:r.width;if(w.padding==="gap"&&(P=Y*$/2),w.padding==="no-gap"){var U=pn(t.barCategoryGap,Y*$),B=Y*$/2;P=B-U-(B-U)/$*U}}}i==="xAxis"?D=[r.left+(E.left||0)+(P||0),r.left+r.width-(E.right||0)-(P||0)]:i==="yAxis"?D=f==="horizontal"?[r.top+r.height-(E.bottom||0),r.top+(E.top||0)]:[r.top+(E.top||0)+(P||0),r.top+r.height-(E.bottom||0)-(P||0)]:D=w.range,A&&(D=[D[1],D[0]]);var re=Kk(w,l,g),k=re.scale,X=re.realScaleType;k.domain(_).range(D),Xk(k);var te=Wk(k,fr(fr({},w),{},{realScaleType:X}));i==="xAxis"?(I=b==="top"&&!C||b==="bottom"&&C,L=r.left,G=v[N]-I*w.height):i==="yAxis"&&(I=b==="left"&&!C||b==="right"&&C,L=v[N]-I*w.width,G=r.top);var ne=fr(fr(fr({},w),te),{},{realScaleType:X,x:L,y:G,scale:k,width:i==="xAxis"?r.width:w.width,height:i==="yAxis"?r.height:w.height});return ne.bandSize=eh(ne,te),!w.hide&&i==="xAxis"?v[N]+=(I?-1:1)*ne.height:w.hide||(v[N]+=(I?-1:1)*ne.width),fr(fr({},x),{},bp({},j,ne))},{})},T4=function(t,n){var r=t.x,i=t.y,l=n.x,s=n.y;return{x:Math.min(r,l),y:Math.min(i,s),width:Math.abs(l-r),height:Math.abs(s-i)}},EQ=function(t){var n=t.x1,r=t.y1,i=t.x2,l=t.y2;return T4({x:n,y:r},{x:i,y:l})},C4=function(){function e(t){jQ(this,e),this.scale=t}return OQ(e,[{key:"domain",get:function(){return this.scale.domain}},{key:"range",get:function(){return this.scale.range}},{key:"rangeMin",get:function(){return this.range()[0]}},{key:"rangeMax",get:function(){return this.range()[1]}},{key:"bandwidth",get:function(){return this.scale.bandwidth}},{key:"apply",value:function(n){var r=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{},i=r.bandAware,l=r.position;if(n!==void 0){if(l)switch(l){case"start":return this.scale(n);case"middle":{var s=this.bandwidth?this.bandwidth()/2:0;return this.scale(n)+s}case"end":{var u=this.bandwidth?this.bandwidth():0;return this.scale(n)+u}default:return this.scale(n)}if(i){var f=this.bandwidth?this.bandwidth()/2:0;return this.scale(n)+f}return this.scale(n)}}},{key:"isInRange",value:function(n){var r=this.range(),i=r[0],l=r[r.length-1];return i<=l?n>=i&&n<=l:n>=l&&n<=i}}],[{key:"create",value:function(n){return new e(n)}}])}();bp(C4,"EPS",1e-4);var nS=function(t){var n=Object.keys(t).reduce(function(r,i){return fr(fr({},r),{},bp({},i,C4.create(t[i])))},{});return fr(fr({},n),{},{apply:function(i){var l=arguments.length>1&&arguments[1]!==void 0?arguments[1]:{},s=l.bandAware,u=l.position;return eQ(i,function(f,d){return n[d].apply(f,{bandAware:s,position:u})})},isInRange:function(i){return j4(i,function(l,s){return n[s].isInRange(l)})}})};function TQ(e){return(e%180+180)%180}var CQ=function(t){var n=t.width,r=t.height,i=arguments.length>1&&arguments[1]!==void 0?arguments[1]:0,l=TQ(i),s=l*Math.PI/180,u=Math.atan(r/n),f=s>u&&s<Math.PI-u?r/Math.sin(s):n/Math.cos(s);return Math.abs(f)},Z0,mP;function NQ(){if(mP)return Z0;mP=1;var e=Dr(),t=Au(),n=Wh();function r(i){return function(l,s,u){var f=Object(l);if(!t(l)){var d=e(s,3);l=n(l),s=function(v){return d(f[v],v,f)}}var m=i(l,s,u);return m>-1?f[d?l[m]:m]:void 0}}return Z0=r,Z0}var Q0,vP;function MQ(){if(vP)return Q0;vP=1;var e=b4();function t(n){var r=e(n),i=r%1;return r===r?i?r-i:r:0}return Q0=t,Q0}var J0,yP;function PQ(){if(yP)return J0;yP=1;var e=CD(),t=Dr(),n=MQ(),r=Math.max;function i(l,s,u){var f=l==null?0:l.length;if(!f)return-1;var d=u==null?0:n(u);return d<0&&(d=r(f+d,0)),e(l,t(s,3),d)}return J0=i,J0}var ex,gP;function RQ(){if(gP)return ex;gP=1;var e=NQ(),t=PQ(),n=e(t);return ex=n,ex}var DQ=RQ();const kQ=rt(DQ);var $Q=GR();const LQ=rt($Q);var IQ=LQ(function(e){return{x:e.left,y:e.top,width:e.width,height:e.height}},function(e){return["l",e.left,"t",e.top,"w",e.width,"h",e.height].join("")}),rS=T.createContext(void 0),aS=T.createContext(void 0),N4=T.createContext(void 0),M4=T.createContext({}),P4=T.createContext(void 0),R4=T.createContext(0),D4=T.createContext(0),bP=function(t){var n=t.state,r=n.xAxisMap,i=n.yAxisMap,l=n.offset,s=t.clipPathId,u=t.children,f=t.width,d=t.height,m=IQ(l);return z.createElement(rS.Provider,{value:r},z.createElement(aS.Provider,{value:i},z.createElement(M4.Provider,{value:l},z.createElement(N4.Provider,{value:m},z.createElement(P4.Provider,{value:s},z.createElement(R4.Provider,{value:d},z.createElement(D4.Provider,{value:f},u)))))))},qQ=function(){return T.useContext(P4)},k4=function(t){var n=T.useContext(rS);n==null&&Ji();var r=n[t];return r==null&&Ji(),r},BQ=function(){var t=T.useContext(rS);return Qa(t)},zQ=function(){var t=T.useContext(aS),n=kQ(t,function(r){return j4(r.domain,Number.isFinite)});return n||Qa(t)},$4=function(t){var n=T.useContext(aS);n==null&&Ji();var r=n[t];return r==null&&Ji(),r},UQ=function(){var t=T.useContext(N4);return t},HQ=function(){return T.useContext(M4)},iS=function(){return T.useContext(D4)},oS=function(){return T.useContext(R4)};function zl(e){"@babel/helpers - typeof";return zl=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},zl(e)}function FQ(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function GQ(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,I4(r.key),r)}}function VQ(e,t,n){return t&&GQ(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e}function YQ(e,t,n){return t=yh(t),KQ(e,L4()?Reflect.construct(t,n||[],yh(e).constructor):t.apply(e,n))}function KQ(e,t){if(t&&(zl(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return XQ(e)}function XQ(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function L4(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(L4=function(){return!!e})()}function yh(e){return yh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},yh(e)}function WQ(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&_1(e,t)}function _1(e,t){return _1=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},_1(e,t)}function xP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function wP(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?xP(Object(n),!0).forEach(function(r){lS(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):xP(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function lS(e,t,n){return t=I4(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function I4(e){var t=ZQ(e,"string");return zl(t)=="symbol"?t:t+""}function ZQ(e,t){if(zl(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(zl(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}function QQ(e,t){return nJ(e)||tJ(e,t)||eJ(e,t)||JQ()}function JQ(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function eJ(e,t){if(e){if(typeof e=="string")return SP(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return SP(e,t)}}function SP(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function tJ(e,t){var n=e==null?null:typeof Symbol<"u"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var r,i,l,s,u=[],f=!0,d=!1;try{if(l=(n=n.call(e)).next,t!==0)for(;!(f=(r=l.call(n)).done)&&(u.push(r.value),u.length!==t);f=!0);}catch(m){d=!0,i=m}finally{try{if(!f&&n.return!=null&&(s=n.return(),Object(s)!==s))return}finally{if(d)throw i}}return u}}function nJ(e){if(Array.isArray(e))return e}function A1(){return A1=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},A1.apply(this,arguments)}var rJ=function(t,n){var r;return z.isValidElement(t)?r=z.cloneElement(t,n):Re(t)?r=t(n):r=z.createElement("line",A1({},n,{className:"recharts-reference-line-line"})),r},aJ=function(t,n,r,i,l,s,u,f,d){var m=l.x,v=l.y,g=l.width,x=l.height;if(r){var j=d.y,w=t.y.apply(j,{position:s});if(Er(d,"discard")&&!t.y.isInRange(w))return null;var b=[{x:m+g,y:w},{x:m,y:w}];return f==="left"?b.reverse():b}if(n){var _=d.x,O=t.x.apply(_,{position:s});if(Er(d,"discard")&&!t.x.isInRange(O))return null;var E=[{x:O,y:v+x},{x:O,y:v}];return u==="top"?E.reverse():E}if(i){var C=d.segment,A=C.map(function(N){return t.apply(N,{position:s})});return Er(d,"discard")&&WZ(A,function(N){return!t.isInRange(N)})?null:A}return null};function iJ(e){var t=e.x,n=e.y,r=e.segment,i=e.xAxisId,l=e.yAxisId,s=e.shape,u=e.className,f=e.alwaysShow,d=qQ(),m=k4(i),v=$4(l),g=UQ();if(!d||!g)return null;pr(f===void 0,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.');var x=nS({x:m.scale,y:v.scale}),j=Ut(t),w=Ut(n),b=r&&r.length===2,_=aJ(x,j,w,b,g,e.position,m.orientation,v.orientation,e);if(!_)return null;var O=QQ(_,2),E=O[0],C=E.x,A=E.y,N=O[1],P=N.x,D=N.y,L=Er(e,"hidden")?"url(#".concat(d,")"):void 0,G=wP(wP({clipPath:L},Me(e,!0)),{},{x1:C,y1:A,x2:P,y2:D});return z.createElement(ot,{className:qe("recharts-reference-line",u)},rJ(s,G),Xt.renderCallByParent(e,EQ({x1:C,y1:A,x2:P,y2:D})))}var sS=function(e){function t(){return FQ(this,t),YQ(this,t,arguments)}return WQ(t,e),VQ(t,[{key:"render",value:function(){return z.createElement(iJ,this.props)}}])}(z.Component);lS(sS,"displayName","ReferenceLine");lS(sS,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,fill:"none",stroke:"#ccc",fillOpacity:1,strokeWidth:1,position:"middle"});function E1(){return E1=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},E1.apply(this,arguments)}function Ul(e){"@babel/helpers - typeof";return Ul=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Ul(e)}function jP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function OP(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?jP(Object(n),!0).forEach(function(r){xp(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):jP(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function oJ(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function lJ(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,B4(r.key),r)}}function sJ(e,t,n){return t&&lJ(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e}function cJ(e,t,n){return t=gh(t),uJ(e,q4()?Reflect.construct(t,n||[],gh(e).constructor):t.apply(e,n))}function uJ(e,t){if(t&&(Ul(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return fJ(e)}function fJ(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function q4(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(q4=function(){return!!e})()}function gh(e){return gh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},gh(e)}function dJ(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&T1(e,t)}function T1(e,t){return T1=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},T1(e,t)}function xp(e,t,n){return t=B4(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function B4(e){var t=hJ(e,"string");return Ul(t)=="symbol"?t:t+""}function hJ(e,t){if(Ul(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Ul(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}var pJ=function(t){var n=t.x,r=t.y,i=t.xAxis,l=t.yAxis,s=nS({x:i.scale,y:l.scale}),u=s.apply({x:n,y:r},{bandAware:!0});return Er(t,"discard")&&!s.isInRange(u)?null:u},wp=function(e){function t(){return oJ(this,t),cJ(this,t,arguments)}return dJ(t,e),sJ(t,[{key:"render",value:function(){var r=this.props,i=r.x,l=r.y,s=r.r,u=r.alwaysShow,f=r.clipPathId,d=Ut(i),m=Ut(l);if(pr(u===void 0,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.'),!d||!m)return null;var v=pJ(this.props);if(!v)return null;var g=v.x,x=v.y,j=this.props,w=j.shape,b=j.className,_=Er(this.props,"hidden")?"url(#".concat(f,")"):void 0,O=OP(OP({clipPath:_},Me(this.props,!0)),{},{cx:g,cy:x});return z.createElement(ot,{className:qe("recharts-reference-dot",b)},t.renderDot(w,O),Xt.renderCallByParent(this.props,{x:g-s,y:x-s,width:2*s,height:2*s}))}}])}(z.Component);xp(wp,"displayName","ReferenceDot");xp(wp,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,r:10,fill:"#fff",stroke:"#ccc",fillOpacity:1,strokeWidth:1});xp(wp,"renderDot",function(e,t){var n;return z.isValidElement(e)?n=z.cloneElement(e,t):Re(e)?n=e(t):n=z.createElement(tS,E1({},t,{cx:t.cx,cy:t.cy,className:"recharts-reference-dot-dot"})),n});function C1(){return C1=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},C1.apply(this,arguments)}function Hl(e){"@babel/helpers - typeof";return Hl=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Hl(e)}function _P(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function AP(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?_P(Object(n),!0).forEach(function(r){Sp(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):_P(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function mJ(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function vJ(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,U4(r.key),r)}}function yJ(e,t,n){return t&&vJ(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e}function gJ(e,t,n){return t=bh(t),bJ(e,z4()?Reflect.construct(t,n||[],bh(e).constructor):t.apply(e,n))}function bJ(e,t){if(t&&(Hl(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return xJ(e)}function xJ(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function z4(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(z4=function(){return!!e})()}function bh(e){return bh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},bh(e)}function wJ(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&N1(e,t)}function N1(e,t){return N1=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},N1(e,t)}function Sp(e,t,n){return t=U4(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function U4(e){var t=SJ(e,"string");return Hl(t)=="symbol"?t:t+""}function SJ(e,t){if(Hl(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Hl(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}var jJ=function(t,n,r,i,l){var s=l.x1,u=l.x2,f=l.y1,d=l.y2,m=l.xAxis,v=l.yAxis;if(!m||!v)return null;var g=nS({x:m.scale,y:v.scale}),x={x:t?g.x.apply(s,{position:"start"}):g.x.rangeMin,y:r?g.y.apply(f,{position:"start"}):g.y.rangeMin},j={x:n?g.x.apply(u,{position:"end"}):g.x.rangeMax,y:i?g.y.apply(d,{position:"end"}):g.y.rangeMax};return Er(l,"discard")&&(!g.isInRange(x)||!g.isInRange(j))?null:T4(x,j)},jp=function(e){function t(){return mJ(this,t),gJ(this,t,arguments)}return wJ(t,e),yJ(t,[{key:"render",value:function(){var r=this.props,i=r.x1,l=r.x2,s=r.y1,u=r.y2,f=r.className,d=r.alwaysShow,m=r.clipPathId;pr(d===void 0,'The alwaysShow prop is deprecated. Please use ifOverflow="extendDomain" instead.');var v=Ut(i),g=Ut(l),x=Ut(s),j=Ut(u),w=this.props.shape;if(!v&&!g&&!x&&!j&&!w)return null;var b=jJ(v,g,x,j,this.props);if(!b&&!w)return null;var _=Er(this.props,"hidden")?"url(#".concat(m,")"):void 0;return z.createElement(ot,{className:qe("recharts-reference-area",f)},t.renderRect(w,AP(AP({clipPath:_},Me(this.props,!0)),b)),Xt.renderCallByParent(this.props,b))}}])}(z.Component);Sp(jp,"displayName","ReferenceArea");Sp(jp,"defaultProps",{isFront:!1,ifOverflow:"discard",xAxisId:0,yAxisId:0,r:10,fill:"#ccc",fillOpacity:.5,stroke:"none",strokeWidth:1});Sp(jp,"renderRect",function(e,t){var n;return z.isValidElement(e)?n=z.cloneElement(e,t):Re(e)?n=e(t):n=z.createElement(eS,C1({},t,{className:"recharts-reference-area-rect"})),n});function H4(e,t,n){if(t<1)return[];if(t===1&&n===void 0)return e;for(var r=[],i=0;i<e.length;i+=t)r.push(e[i]);return r}function OJ(e,t,n){var r={width:e.width+t.width,height:e.height+t.height};return CQ(r,n)}function _J(e,t,n){var r=n==="width",i=e.x,l=e.y,s=e.width,u=e.height;return t===1?{start:r?i:l,end:r?i+s:l+u}:{start:r?i+s:l+u,end:r?i:l}}function xh(e,t,n,r,i){if(e*t<e*r||e*t>e*i)return!1;var l=n();return e*(t-e*l/2-r)>=0&&e*(t+e*l/2-i)<=0}function AJ(e,t){return H4(e,t+1)}function EJ(e,t,n,r,i){for(var l=(r||[]).slice(),s=t.start,u=t.end,f=0,d=1,m=s,v=function(){var j=r==null?void 0:r[f];if(j===void 0)return{v:H4(r,d)};var w=f,b,_=function(){return b===void 0&&(b=n(j,w)),b},O=j.coordinate,E=f===0||xh(e,O,_,m,u);E||(f=0,m=s,d+=1),E&&(m=O+e*(_()/2+i),f+=d)},g;d<=l.length;)if(g=v(),g)return g.v;return[]}function pu(e){"@babel/helpers - typeof";return pu=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},pu(e)}function EP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function ln(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?EP(Object(n),!0).forEach(function(r){TJ(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):EP(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function TJ(e,t,n){return t=CJ(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function CJ(e){var t=NJ(e,"string");return pu(t)=="symbol"?t:t+""}function NJ(e,t){if(pu(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(pu(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function MJ(e,t,n,r,i){for(var l=(r||[]).slice(),s=l.length,u=t.start,f=t.end,d=function(g){var x=l[g],j,w=function(){return j===void 0&&(j=n(x,g)),j};if(g===s-1){var b=e*(x.coordinate+e*w()/2-f);l[g]=x=ln(ln({},x),{},{tickCoord:b>0?x.coordinate-b*e:x.coordinate})}else l[g]=x=ln(ln({},x),{},{tickCoord:x.coordinate});var _=xh(e,x.tickCoord,w,u,f);_&&(f=x.tickCoord-e*(w()/2+i),l[g]=ln(ln({},x),{},{isShow:!0}))},m=s-1;m>=0;m--)d(m);return l}function PJ(e,t,n,r,i,l){var s=(r||[]).slice(),u=s.length,f=t.start,d=t.end;if(l){var m=r[u-1],v=n(m,u-1),g=e*(m.coordinate+e*v/2-d);s[u-1]=m=ln(ln({},m),{},{tickCoord:g>0?m.coordinate-g*e:m.coordinate});var x=xh(e,m.tickCoord,function(){return v},f,d);x&&(d=m.tickCoord-e*(v/2+i),s[u-1]=ln(ln({},m),{},{isShow:!0}))}for(var j=l?u-1:u,w=function(O){var E=s[O],C,A=function(){return C===void 0&&(C=n(E,O)),C};if(O===0){var N=e*(E.coordinate-e*A()/2-f);s[O]=E=ln(ln({},E),{},{tickCoord:N<0?E.coordinate-N*e:E.coordinate})}else s[O]=E=ln(ln({},E),{},{tickCoord:E.coordinate});var P=xh(e,E.tickCoord,A,f,d);P&&(f=E.tickCoord+e*(A()/2+i),s[O]=ln(ln({},E),{},{isShow:!0}))},b=0;b<j;b++)w(b);return s}function cS(e,t,n){var r=e.tick,i=e.ticks,l=e.viewBox,s=e.minTickGap,u=e.orientation,f=e.interval,d=e.tickFormatter,m=e.unit,v=e.angle;if(!i||!i.length||!r)return[];if(fe(f)||as.isSsr)return AJ(i,typeof f=="number"&&fe(f)?f:0);var g=[],x=u==="top"||u==="bottom"?"width":"height",j=m&&x==="width"?Ec(m,{fontSize:t,letterSpacing:n}):{width:0,height:0},w=function(E,C){var A=Re(d)?d(E.value,C):E.value;return x==="width"?OJ(Ec(A,{fontSize:t,letterSpacing:n}),j,v):Ec(A,{fontSize:t,letterSpacing:n})[x]},b=i.length>=2?hn(i[1].coordinate-i[0].coordinate):1,_=_J(l,b,x);return f==="equidistantPreserveStart"?EJ(b,_,w,i,s):(f==="preserveStart"||f==="preserveStartEnd"?g=PJ(b,_,w,i,s,f==="preserveStartEnd"):g=MJ(b,_,w,i,s),g.filter(function(O){return O.isShow}))}var RJ=["viewBox"],DJ=["viewBox"],kJ=["ticks"];function Fl(e){"@babel/helpers - typeof";return Fl=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Fl(e)}function sl(){return sl=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},sl.apply(this,arguments)}function TP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function dn(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?TP(Object(n),!0).forEach(function(r){uS(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):TP(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function tx(e,t){if(e==null)return{};var n=$J(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function $J(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}function LJ(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function CP(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,G4(r.key),r)}}function IJ(e,t,n){return t&&CP(e.prototype,t),n&&CP(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e}function qJ(e,t,n){return t=wh(t),BJ(e,F4()?Reflect.construct(t,n||[],wh(e).constructor):t.apply(e,n))}function BJ(e,t){if(t&&(Fl(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return zJ(e)}function zJ(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function F4(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(F4=function(){return!!e})()}function wh(e){return wh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},wh(e)}function UJ(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&M1(e,t)}function M1(e,t){return M1=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},M1(e,t)}function uS(e,t,n){return t=G4(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function G4(e){var t=HJ(e,"string");return Fl(t)=="symbol"?t:t+""}function HJ(e,t){if(Fl(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Fl(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}var ss=function(e){function t(n){var r;return LJ(this,t),r=qJ(this,t,[n]),r.state={fontSize:"",letterSpacing:""},r}return UJ(t,e),IJ(t,[{key:"shouldComponentUpdate",value:function(r,i){var l=r.viewBox,s=tx(r,RJ),u=this.props,f=u.viewBox,d=tx(u,DJ);return!dl(l,f)||!dl(s,d)||!dl(i,this.state)}},{key:"componentDidMount",value:function(){var r=this.layerReference;if(r){var i=r.getElementsByClassName("recharts-cartesian-axis-tick-value")[0];i&&this.setState({fontSize:window.getComputedStyle(i).fontSize,letterSpacing:window.getComputedStyle(i).letterSpacing})}}},{key:"getTickLineCoord",value:function(r){var i=this.props,l=i.x,s=i.y,u=i.width,f=i.height,d=i.orientation,m=i.tickSize,v=i.mirror,g=i.tickMargin,x,j,w,b,_,O,E=v?-1:1,C=r.tickSize||m,A=fe(r.tickCoord)?r.tickCoord:r.coordinate;switch(d){case"top":x=j=r.coordinate,b=s+ +!v*f,w=b-E*C,O=w-E*g,_=A;break;case"left":w=b=r.coordinate,j=l+ +!v*u,x=j-E*C,_=x-E*g,O=A;break;case"right":w=b=r.coordinate,j=l+ +v*u,x=j+E*C,_=x+E*g,O=A;break;default:x=j=r.coordinate,b=s+ +v*f,w=b+E*C,O=w+E*g,_=A;break}return{line:{x1:x,y1:w,x2:j,y2:b},tick:{x:_,y:O}}}},{key:"getTickTextAnchor",value:function(){var r=this.props,i=r.orientation,l=r.mirror,s;switch(i){case"left":s=l?"start":"end";break;case"right":s=l?"end":"start";break;default:s="middle";break}return s}},{key:"getTickVerticalAnchor",value:function(){var r=this.props,i=r.orientation,l=r.mirror,s="end";switch(i){case"left":case"right":s="middle";break;case"top":s=l?"start":"end";break;default:s=l?"end":"start";break}return s}},{key:"renderAxisLine",value:function(){var r=this.props,i=r.x,l=r.y,s=r.width,u=r.height,f=r.orientation,d=r.mirror,m=r.axisLine,v=dn(dn(dn({},Me(this.props,!1)),Me(m,!1)),{},{fill:"none"});if(f==="top"||f==="bottom"){var g=+(f==="top"&&!d||f==="bottom"&&d);v=dn(dn({},v),{},{x1:i,y1:l+g*u,x2:i+s,y2:l+g*u})}else{var x=+(f==="left"&&!d||f==="right"&&d);v=dn(dn({},v),{},{x1:i+x*s,y1:l,x2:i+x*s,y2:l+u})}return z.createElement("line",sl({},v,{className:qe("recharts-cartesian-axis-line",Ln(m,"className"))}))}},{key:"renderTicks",value:function(r,i,l){var s=this,u=this.props,f=u.tickLine,d=u.stroke,m=u.tick,v=u.tickFormatter,g=u.unit,x=cS(dn(dn({},this.props),{},{ticks:r}),i,l),j=this.getTickTextAnchor(),w=this.getTickVerticalAnchor(),b=Me(this.props,!1),_=Me(m,!1),O=dn(dn({},b),{},{fill:"none"},Me(f,!1)),E=x.map(function(C,A){var N=s.getTickLineCoord(C),P=N.line,D=N.tick,L=dn(dn(dn(dn({textAnchor:j,verticalAnchor:w},b),{},{stroke:"none",fill:d},_),D),{},{index:A,payload:C,visibleTicksCount:x.length,tickFormatter:v});return z.createElement(ot,sl({className:"recharts-cartesian-axis-tick",key:"tick-".concat(C.value,"-").concat(C.coordinate,"-").concat(C.tickCoord)},Wi(s.props,C,A)),f&&z.createElement("line",sl({},O,P,{className:qe("recharts-cartesian-axis-tick-line",Ln(f,"className"))})),m&&t.renderTickItem(m,L,"".concat(Re(v)?v(C.value,A):C.value).concat(g||"")))});return z.createElement("g",{className:"recharts-cartesian-axis-ticks"},E)}},{key:"render",value:function(){var r=this,i=this.props,l=i.axisLine,s=i.width,u=i.height,f=i.ticksGenerator,d=i.className,m=i.hide;if(m)return null;var v=this.props,g=v.ticks,x=tx(v,kJ),j=g;return Re(f)&&(j=g&&g.length>0?f(this.props):f(x)),s<=0||u<=0||!j||!j.length?null:z.createElement(ot,{className:qe("recharts-cartesian-axis",d),ref:function(b){r.layerReference=b}},l&&this.renderAxisLine(),this.renderTicks(j,this.state.fontSize,this.state.letterSpacing),Xt.renderCallByParent(this.props))}}],[{key:"renderTickItem",value:function(r,i,l){var s;return z.isValidElement(r)?s=z.cloneElement(r,i):Re(r)?s=r(i):s=z.createElement(Zi,sl({},i,{className:"recharts-cartesian-axis-tick-value"}),l),s}}])}(T.Component);uS(ss,"displayName","CartesianAxis");uS(ss,"defaultProps",{x:0,y:0,width:0,height:0,viewBox:{x:0,y:0,width:0,height:0},orientation:"bottom",ticks:[],stroke:"#666",tickLine:!0,axisLine:!0,tick:!0,mirror:!1,minTickGap:5,tickSize:6,tickMargin:2,interval:"preserveEnd"});var FJ=["x1","y1","x2","y2","key"],GJ=["offset"];function eo(e){"@babel/helpers - typeof";return eo=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},eo(e)}function NP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function sn(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?NP(Object(n),!0).forEach(function(r){VJ(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):NP(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function VJ(e,t,n){return t=YJ(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function YJ(e){var t=KJ(e,"string");return eo(t)=="symbol"?t:t+""}function KJ(e,t){if(eo(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(eo(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function Hi(){return Hi=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},Hi.apply(this,arguments)}function MP(e,t){if(e==null)return{};var n=XJ(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function XJ(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}var WJ=function(t){var n=t.fill;if(!n||n==="none")return null;var r=t.fillOpacity,i=t.x,l=t.y,s=t.width,u=t.height,f=t.ry;return z.createElement("rect",{x:i,y:l,ry:f,width:s,height:u,stroke:"none",fill:n,fillOpacity:r,className:"recharts-cartesian-grid-bg"})};function V4(e,t){var n;if(z.isValidElement(e))n=z.cloneElement(e,t);else if(Re(e))n=e(t);else{var r=t.x1,i=t.y1,l=t.x2,s=t.y2,u=t.key,f=MP(t,FJ),d=Me(f,!1);d.offset;var m=MP(d,GJ);n=z.createElement("line",Hi({},m,{x1:r,y1:i,x2:l,y2:s,fill:"none",key:u}))}return n}function ZJ(e){var t=e.x,n=e.width,r=e.horizontal,i=r===void 0?!0:r,l=e.horizontalPoints;if(!i||!l||!l.length)return null;var s=l.map(function(u,f){var d=sn(sn({},e),{},{x1:t,y1:u,x2:t+n,y2:u,key:"line-".concat(f),index:f});return V4(i,d)});return z.createElement("g",{className:"recharts-cartesian-grid-horizontal"},s)}function QJ(e){var t=e.y,n=e.height,r=e.vertical,i=r===void 0?!0:r,l=e.verticalPoints;if(!i||!l||!l.length)return null;var s=l.map(function(u,f){var d=sn(sn({},e),{},{x1:u,y1:t,x2:u,y2:t+n,key:"line-".concat(f),index:f});return V4(i,d)});return z.createElement("g",{className:"recharts-cartesian-grid-vertical"},s)}function JJ(e){var t=e.horizontalFill,n=e.fillOpacity,r=e.x,i=e.y,l=e.width,s=e.height,u=e.horizontalPoints,f=e.horizontal,d=f===void 0?!0:f;if(!d||!t||!t.length)return null;var m=u.map(function(g){return Math.round(g+i-i)}).sort(function(g,x){return g-x});i!==m[0]&&m.unshift(0);var v=m.map(function(g,x){var j=!m[x+1],w=j?i+s-g:m[x+1]-g;if(w<=0)return null;var b=x%t.length;return z.createElement("rect",{key:"react-".concat(x),y:g,x:r,height:w,width:l,stroke:"none",fill:t[b],fillOpacity:n,className:"recharts-cartesian-grid-bg"})});return z.createElement("g",{className:"recharts-cartesian-gridstripes-horizontal"},v)}function eee(e){var t=e.vertical,n=t===void 0?!0:t,r=e.verticalFill,i=e.fillOpacity,l=e.x,s=e.y,u=e.width,f=e.height,d=e.verticalPoints;if(!n||!r||!r.length)return null;var m=d.map(function(g){return Math.round(g+l-l)}).sort(function(g,x){return g-x});l!==m[0]&&m.unshift(0);var v=m.map(function(g,x){var j=!m[x+1],w=j?l+u-g:m[x+1]-g;if(w<=0)return null;var b=x%r.length;return z.createElement("rect",{key:"react-".concat(x),x:g,y:s,width:w,height:f,stroke:"none",fill:r[b],fillOpacity:i,className:"recharts-cartesian-grid-bg"})});return z.createElement("g",{className:"recharts-cartesian-gridstripes-vertical"},v)}var tee=function(t,n){var r=t.xAxis,i=t.width,l=t.height,s=t.offset;return Yk(cS(sn(sn(sn({},ss.defaultProps),r),{},{ticks:aa(r,!0),viewBox:{x:0,y:0,width:i,height:l}})),s.left,s.left+s.width,n)},nee=function(t,n){var r=t.yAxis,i=t.width,l=t.height,s=t.offset;return Yk(cS(sn(sn(sn({},ss.defaultProps),r),{},{ticks:aa(r,!0),viewBox:{x:0,y:0,width:i,height:l}})),s.top,s.top+s.height,n)},tl={horizontal:!0,vertical:!0,stroke:"#ccc",fill:"none",verticalFill:[],horizontalFill:[]};function Y4(e){var t,n,r,i,l,s,u=iS(),f=oS(),d=HQ(),m=sn(sn({},e),{},{stroke:(t=e.stroke)!==null&&t!==void 0?t:tl.stroke,fill:(n=e.fill)!==null&&n!==void 0?n:tl.fill,horizontal:(r=e.horizontal)!==null&&r!==void 0?r:tl.horizontal,horizontalFill:(i=e.horizontalFill)!==null&&i!==void 0?i:tl.horizontalFill,vertical:(l=e.vertical)!==null&&l!==void 0?l:tl.vertical,verticalFill:(s=e.verticalFill)!==null&&s!==void 0?s:tl.verticalFill,x:fe(e.x)?e.x:d.left,y:fe(e.y)?e.y:d.top,width:fe(e.width)?e.width:d.width,height:fe(e.height)?e.height:d.height}),v=m.x,g=m.y,x=m.width,j=m.height,w=m.syncWithTicks,b=m.horizontalValues,_=m.verticalValues,O=BQ(),E=zQ();if(!fe(x)||x<=0||!fe(j)||j<=0||!fe(v)||v!==+v||!fe(g)||g!==+g)return null;var C=m.verticalCoordinatesGenerator||tee,A=m.horizontalCoordinatesGenerator||nee,N=m.horizontalPoints,P=m.verticalPoints;if((!N||!N.length)&&Re(A)){var D=b&&b.length,L=A({yAxis:E?sn(sn({},E),{},{ticks:D?b:E.ticks}):void 0,width:u,height:f,offset:d},D?!0:w);pr(Array.isArray(L),"horizontalCoordinatesGenerator should return Array but instead it returned [".concat(eo(L),"]")),Array.isArray(L)&&(N=L)}if((!P||!P.length)&&Re(C)){var G=_&&_.length,I=C({xAxis:O?sn(sn({},O),{},{ticks:G?_:O.ticks}):void 0,width:u,height:f,offset:d},G?!0:w);pr(Array.isArray(I),"verticalCoordinatesGenerator should return Array but instead it returned [".concat(eo(I),"]")),Array.isArray(I)&&(P=I)}return z.createElement("g",{className:"recharts-cartesian-grid"},z.createElement(WJ,{fill:m.fill,fillOpacity:m.fillOpacity,x:m.x,y:m.y,width:m.width,height:m.height,ry:m.ry}),z.createElement(ZJ,Hi({},m,{offset:d,horizontalPoints:N,xAxis:O,yAxis:E})),z.createElement(QJ,Hi({},m,{offset:d,verticalPoints:P,xAxis:O,yAxis:E})),z.createElement(JJ,Hi({},m,{horizontalPoints:N})),z.createElement(eee,Hi({},m,{verticalPoints:P})))}Y4.displayName="CartesianGrid";function Gl(e){"@babel/helpers - typeof";return Gl=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Gl(e)}function ree(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function aee(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,W4(r.key),r)}}function iee(e,t,n){return t&&aee(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e}function oee(e,t,n){return t=Sh(t),lee(e,K4()?Reflect.construct(t,n||[],Sh(e).constructor):t.apply(e,n))}function lee(e,t){if(t&&(Gl(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return see(e)}function see(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function K4(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(K4=function(){return!!e})()}function Sh(e){return Sh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},Sh(e)}function cee(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&P1(e,t)}function P1(e,t){return P1=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},P1(e,t)}function X4(e,t,n){return t=W4(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function W4(e){var t=uee(e,"string");return Gl(t)=="symbol"?t:t+""}function uee(e,t){if(Gl(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Gl(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}function R1(){return R1=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},R1.apply(this,arguments)}function fee(e){var t=e.xAxisId,n=iS(),r=oS(),i=k4(t);return i==null?null:z.createElement(ss,R1({},i,{className:qe("recharts-".concat(i.axisType," ").concat(i.axisType),i.className),viewBox:{x:0,y:0,width:n,height:r},ticksGenerator:function(s){return aa(s,!0)}}))}var Op=function(e){function t(){return ree(this,t),oee(this,t,arguments)}return cee(t,e),iee(t,[{key:"render",value:function(){return z.createElement(fee,this.props)}}])}(z.Component);X4(Op,"displayName","XAxis");X4(Op,"defaultProps",{allowDecimals:!0,hide:!1,orientation:"bottom",width:0,height:30,mirror:!1,xAxisId:0,tickCount:5,type:"category",padding:{left:0,right:0},allowDataOverflow:!1,scale:"auto",reversed:!1,allowDuplicatedCategory:!0});function Vl(e){"@babel/helpers - typeof";return Vl=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Vl(e)}function dee(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function hee(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,J4(r.key),r)}}function pee(e,t,n){return t&&hee(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e}function mee(e,t,n){return t=jh(t),vee(e,Z4()?Reflect.construct(t,n||[],jh(e).constructor):t.apply(e,n))}function vee(e,t){if(t&&(Vl(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return yee(e)}function yee(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function Z4(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(Z4=function(){return!!e})()}function jh(e){return jh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},jh(e)}function gee(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&D1(e,t)}function D1(e,t){return D1=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},D1(e,t)}function Q4(e,t,n){return t=J4(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function J4(e){var t=bee(e,"string");return Vl(t)=="symbol"?t:t+""}function bee(e,t){if(Vl(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Vl(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}function k1(){return k1=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},k1.apply(this,arguments)}var xee=function(t){var n=t.yAxisId,r=iS(),i=oS(),l=$4(n);return l==null?null:z.createElement(ss,k1({},l,{className:qe("recharts-".concat(l.axisType," ").concat(l.axisType),l.className),viewBox:{x:0,y:0,width:r,height:i},ticksGenerator:function(u){return aa(u,!0)}}))},_p=function(e){function t(){return dee(this,t),mee(this,t,arguments)}return gee(t,e),pee(t,[{key:"render",value:function(){return z.createElement(xee,this.props)}}])}(z.Component);Q4(_p,"displayName","YAxis");Q4(_p,"defaultProps",{allowDuplicatedCategory:!0,allowDecimals:!0,hide:!1,orientation:"left",width:60,height:0,mirror:!1,yAxisId:0,tickCount:5,type:"number",padding:{top:0,bottom:0},allowDataOverflow:!1,scale:"auto",reversed:!1});function PP(e){return Oee(e)||jee(e)||See(e)||wee()}function wee(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function See(e,t){if(e){if(typeof e=="string")return $1(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return $1(e,t)}}function jee(e){if(typeof Symbol<"u"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function Oee(e){if(Array.isArray(e))return $1(e)}function $1(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}var L1=function(t,n,r,i,l){var s=tr(t,sS),u=tr(t,wp),f=[].concat(PP(s),PP(u)),d=tr(t,jp),m="".concat(i,"Id"),v=i[0],g=n;if(f.length&&(g=f.reduce(function(w,b){if(b.props[m]===r&&Er(b.props,"extendDomain")&&fe(b.props[v])){var _=b.props[v];return[Math.min(w[0],_),Math.max(w[1],_)]}return w},g)),d.length){var x="".concat(v,"1"),j="".concat(v,"2");g=d.reduce(function(w,b){if(b.props[m]===r&&Er(b.props,"extendDomain")&&fe(b.props[x])&&fe(b.props[j])){var _=b.props[x],O=b.props[j];return[Math.min(w[0],_,O),Math.max(w[1],_,O)]}return w},g)}return l&&l.length&&(g=l.reduce(function(w,b){return fe(b)?[Math.min(w[0],b),Math.max(w[1],b)]:w},g)),g},nx={exports:{}},RP;function _ee(){return RP||(RP=1,function(e){var t=Object.prototype.hasOwnProperty,n="~";function r(){}Object.create&&(r.prototype=Object.create(null),new r().__proto__||(n=!1));function i(f,d,m){this.fn=f,this.context=d,this.once=m||!1}function l(f,d,m,v,g){if(typeof m!="function")throw new TypeError("The listener must be a function");var x=new i(m,v||f,g),j=n?n+d:d;return f._events[j]?f._events[j].fn?f._events[j]=[f._events[j],x]:f._events[j].push(x):(f._events[j]=x,f._eventsCount++),f}function s(f,d){--f._eventsCount===0?f._events=new r:delete f._events[d]}function u(){this._events=new r,this._eventsCount=0}u.prototype.eventNames=function(){var d=[],m,v;if(this._eventsCount===0)return d;for(v in m=this._events)t.call(m,v)&&d.push(n?v.slice(1):v);return Object.getOwnPropertySymbols?d.concat(Object.getOwnPropertySymbols(m)):d},u.prototype.listeners=function(d){var m=n?n+d:d,v=this._events[m];if(!v)return[];if(v.fn)return[v.fn];for(var g=0,x=v.length,j=new Array(x);g<x;g++)j[g]=v[g].fn;return j},u.prototype.listenerCount=function(d){var m=n?n+d:d,v=this._events[m];return v?v.fn?1:v.length:0},u.prototype.emit=function(d,m,v,g,x,j){var w=n?n+d:d;if(!this._events[w])return!1;var b=this._events[w],_=arguments.length,O,E;if(b.fn){switch(b.once&&this.removeListener(d,b.fn,void 0,!0),_){case 1:return b.fn.call(b.context),!0;case 2:return b.fn.call(b.context,m),!0;case 3:return b.fn.call(b.context,m,v),!0;case 4:return b.fn.call(b.context,m,v,g),!0;case 5:return b.fn.call(b.context,m,v,g,x),!0;case 6:return b.fn.call(b.context,m,v,g,x,j),!0}for(E=1,O=new Array(_-1);E<_;E++)O[E-1]=arguments[E];b.fn.apply(b.context,O)}else{var C=b.length,A;for(E=0;E<C;E++)switch(b[E].once&&this.removeListener(d,b[E].fn,void 0,!0),_){case 1:b[E].fn.call(b[E].context);break;case 2:b[E].fn.call(b[E].context,m);break;case 3:b[E].fn.call(b[E].context,m,v);break;case 4:b[E].fn.call(b[E].context,m,v,g);break;default:if(!O)for(A=1,O=new Array(_-1);A<_;A++)O[A-1]=arguments[A];b[E].fn.apply(b[E].context,O)}}return!0},u.prototype.on=function(d,m,v){return l(this,d,m,v,!1)},u.prototype.once=function(d,m,v){return l(this,d,m,v,!0)},u.prototype.removeListener=function(d,m,v,g){var x=n?n+d:d;if(!this._events[x])return this;if(!m)return s(this,x),this;var j=this._events[x];if(j.fn)j.fn===m&&(!g||j.once)&&(!v||j.context===v)&&s(this,x);else{for(var w=0,b=[],_=j.length;w<_;w++)(j[w].fn!==m||g&&!j[w].once||v&&j[w].context!==v)&&b.push(j[w]);b.length?this._events[x]=b.length===1?b[0]:b:s(this,x)}return this},u.prototype.removeAllListeners=function(d){var m;return d?(m=n?n+d:d,this._events[m]&&s(this,m)):(this._events=new r,this._eventsCount=0),this},u.prototype.off=u.prototype.removeListener,u.prototype.addListener=u.prototype.on,u.prefixed=n,u.EventEmitter=u,e.exports=u}(nx)),nx.exports}var Aee=_ee();const Eee=rt(Aee);var rx=new Eee,ax="recharts.syncMouseEvents";function mu(e){"@babel/helpers - typeof";return mu=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},mu(e)}function Tee(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function Cee(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,e3(r.key),r)}}function Nee(e,t,n){return t&&Cee(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e}function ix(e,t,n){return t=e3(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function e3(e){var t=Mee(e,"string");return mu(t)=="symbol"?t:t+""}function Mee(e,t){if(mu(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(mu(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}var Pee=function(){function e(){Tee(this,e),ix(this,"activeIndex",0),ix(this,"coordinateList",[]),ix(this,"layout","horizontal")}return Nee(e,[{key:"setDetails",value:function(n){var r,i=n.coordinateList,l=i===void 0?null:i,s=n.container,u=s===void 0?null:s,f=n.layout,d=f===void 0?null:f,m=n.offset,v=m===void 0?null:m,g=n.mouseHandlerCallback,x=g===void 0?null:g;this.coordinateList=(r=l??this.coordinateList)!==null&&r!==void 0?r:[],this.container=u??this.container,this.layout=d??this.layout,this.offset=v??this.offset,this.mouseHandlerCallback=x??this.mouseHandlerCallback,this.activeIndex=Math.min(Math.max(this.activeIndex,0),this.coordinateList.length-1)}},{key:"focus",value:function(){this.spoofMouse()}},{key:"keyboardEvent",value:function(n){if(this.coordinateList.length!==0)switch(n.key){case"ArrowRight":{if(this.layout!=="horizontal")return;this.activeIndex=Math.min(this.activeIndex+1,this.coordinateList.length-1),this.spoofMouse();break}case"ArrowLeft":{if(this.layout!=="horizontal")return;this.activeIndex=Math.max(this.activeIndex-1,0),this.spoofMouse();break}}}},{key:"setIndex",value:function(n){this.activeIndex=n}},{key:"spoofMouse",value:function(){var n,r;if(this.layout==="horizontal"&&this.coordinateList.length!==0){var i=this.container.getBoundingClientRect(),l=i.x,s=i.y,u=i.height,f=this.coordinateList[this.activeIndex].coordinate,d=((n=window)===null||n===void 0?void 0:n.scrollX)||0,m=((r=window)===null||r===void 0?void 0:r.scrollY)||0,v=l+f+d,g=s+this.offset.top+u/2+m;this.mouseHandlerCallback({pageX:v,pageY:g})}}}])}();function Ree(e,t,n){if(n==="number"&&t===!0&&Array.isArray(e)){var r=e==null?void 0:e[0],i=e==null?void 0:e[1];if(r&&i&&fe(r)&&fe(i))return!0}return!1}function Dee(e,t,n,r){var i=r/2;return{stroke:"none",fill:"#ccc",x:e==="horizontal"?t.x-i:n.left+.5,y:e==="horizontal"?n.top+.5:t.y-i,width:e==="horizontal"?r:n.width-1,height:e==="horizontal"?n.height-1:r}}function t3(e){var t=e.cx,n=e.cy,r=e.radius,i=e.startAngle,l=e.endAngle,s=xt(t,n,r,i),u=xt(t,n,r,l);return{points:[s,u],cx:t,cy:n,radius:r,startAngle:i,endAngle:l}}function kee(e,t,n){var r,i,l,s;if(e==="horizontal")r=t.x,l=r,i=n.top,s=n.top+n.height;else if(e==="vertical")i=t.y,s=i,r=n.left,l=n.left+n.width;else if(t.cx!=null&&t.cy!=null)if(e==="centric"){var u=t.cx,f=t.cy,d=t.innerRadius,m=t.outerRadius,v=t.angle,g=xt(u,f,d,v),x=xt(u,f,m,v);r=g.x,i=g.y,l=x.x,s=x.y}else return t3(t);return[{x:r,y:i},{x:l,y:s}]}function vu(e){"@babel/helpers - typeof";return vu=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},vu(e)}function DP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function fd(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?DP(Object(n),!0).forEach(function(r){$ee(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):DP(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function $ee(e,t,n){return t=Lee(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Lee(e){var t=Iee(e,"string");return vu(t)=="symbol"?t:t+""}function Iee(e,t){if(vu(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(vu(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}function qee(e){var t,n,r=e.element,i=e.tooltipEventType,l=e.isActive,s=e.activeCoordinate,u=e.activePayload,f=e.offset,d=e.activeTooltipIndex,m=e.tooltipAxisBandSize,v=e.layout,g=e.chartName,x=(t=r.props.cursor)!==null&&t!==void 0?t:(n=r.type.defaultProps)===null||n===void 0?void 0:n.cursor;if(!r||!x||!l||!s||g!=="ScatterChart"&&i!=="axis")return null;var j,w=o1;if(g==="ScatterChart")j=s,w=bW;else if(g==="BarChart")j=Dee(v,s,f,m),w=eS;else if(v==="radial"){var b=t3(s),_=b.cx,O=b.cy,E=b.radius,C=b.startAngle,A=b.endAngle;j={cx:_,cy:O,startAngle:C,endAngle:A,innerRadius:E,outerRadius:E},w=a4}else j={points:kee(v,s,f)},w=o1;var N=fd(fd(fd(fd({stroke:"#ccc",pointerEvents:"none"},f),j),Me(x,!1)),{},{payload:u,payloadIndex:d,className:qe("recharts-tooltip-cursor",x.className)});return T.isValidElement(x)?T.cloneElement(x,N):T.createElement(w,N)}var Bee=["item"],zee=["children","className","width","height","style","compact","title","desc"];function Yl(e){"@babel/helpers - typeof";return Yl=typeof Symbol=="function"&&typeof Symbol.iterator=="symbol"?function(t){return typeof t}:function(t){return t&&typeof Symbol=="function"&&t.constructor===Symbol&&t!==Symbol.prototype?"symbol":typeof t},Yl(e)}function cl(){return cl=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},cl.apply(this,arguments)}function kP(e,t){return Fee(e)||Hee(e,t)||r3(e,t)||Uee()}function Uee(){throw new TypeError(`Invalid attempt to destructure non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function Hee(e,t){var n=e==null?null:typeof Symbol<"u"&&e[Symbol.iterator]||e["@@iterator"];if(n!=null){var r,i,l,s,u=[],f=!0,d=!1;try{if(l=(n=n.call(e)).next,t!==0)for(;!(f=(r=l.call(n)).done)&&(u.push(r.value),u.length!==t);f=!0);}catch(m){d=!0,i=m}finally{try{if(!f&&n.return!=null&&(s=n.return(),Object(s)!==s))return}finally{if(d)throw i}}return u}}function Fee(e){if(Array.isArray(e))return e}function $P(e,t){if(e==null)return{};var n=Gee(e,t),r,i;if(Object.getOwnPropertySymbols){var l=Object.getOwnPropertySymbols(e);for(i=0;i<l.length;i++)r=l[i],!(t.indexOf(r)>=0)&&Object.prototype.propertyIsEnumerable.call(e,r)&&(n[r]=e[r])}return n}function Gee(e,t){if(e==null)return{};var n={};for(var r in e)if(Object.prototype.hasOwnProperty.call(e,r)){if(t.indexOf(r)>=0)continue;n[r]=e[r]}return n}function Vee(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}function Yee(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,a3(r.key),r)}}function Kee(e,t,n){return t&&Yee(e.prototype,t),Object.defineProperty(e,"prototype",{writable:!1}),e}function Xee(e,t,n){return t=Oh(t),Wee(e,n3()?Reflect.construct(t,n||[],Oh(e).constructor):t.apply(e,n))}function Wee(e,t){if(t&&(Yl(t)==="object"||typeof t=="function"))return t;if(t!==void 0)throw new TypeError("Derived constructors may only return object or undefined");return Zee(e)}function Zee(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function n3(){try{var e=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}))}catch{}return(n3=function(){return!!e})()}function Oh(e){return Oh=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(n){return n.__proto__||Object.getPrototypeOf(n)},Oh(e)}function Qee(e,t){if(typeof t!="function"&&t!==null)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),Object.defineProperty(e,"prototype",{writable:!1}),t&&I1(e,t)}function I1(e,t){return I1=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,i){return r.__proto__=i,r},I1(e,t)}function Kl(e){return tte(e)||ete(e)||r3(e)||Jee()}function Jee(){throw new TypeError(`Invalid attempt to spread non-iterable instance.
-In order to be iterable, non-array objects must have a [Symbol.iterator]() method.`)}function r3(e,t){if(e){if(typeof e=="string")return q1(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);if(n==="Object"&&e.constructor&&(n=e.constructor.name),n==="Map"||n==="Set")return Array.from(e);if(n==="Arguments"||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n))return q1(e,t)}}function ete(e){if(typeof Symbol<"u"&&e[Symbol.iterator]!=null||e["@@iterator"]!=null)return Array.from(e)}function tte(e){if(Array.isArray(e))return q1(e)}function q1(e,t){(t==null||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function LP(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter(function(i){return Object.getOwnPropertyDescriptor(e,i).enumerable})),n.push.apply(n,r)}return n}function ie(e){for(var t=1;t<arguments.length;t++){var n=arguments[t]!=null?arguments[t]:{};t%2?LP(Object(n),!0).forEach(function(r){Te(e,r,n[r])}):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):LP(Object(n)).forEach(function(r){Object.defineProperty(e,r,Object.getOwnPropertyDescriptor(n,r))})}return e}function Te(e,t,n){return t=a3(t),t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function a3(e){var t=nte(e,"string");return Yl(t)=="symbol"?t:t+""}function nte(e,t){if(Yl(e)!="object"||!e)return e;var n=e[Symbol.toPrimitive];if(n!==void 0){var r=n.call(e,t);if(Yl(r)!="object")return r;throw new TypeError("@@toPrimitive must return a primitive value.")}return(t==="string"?String:Number)(e)}var rte={xAxis:["bottom","top"],yAxis:["left","right"]},ate={width:"100%",height:"100%"},i3={x:0,y:0};function dd(e){return e}var ite=function(t,n){return n==="horizontal"?t.x:n==="vertical"?t.y:n==="centric"?t.angle:t.radius},ote=function(t,n,r,i){var l=n.find(function(m){return m&&m.index===r});if(l){if(t==="horizontal")return{x:l.coordinate,y:i.y};if(t==="vertical")return{x:i.x,y:l.coordinate};if(t==="centric"){var s=l.coordinate,u=i.radius;return ie(ie(ie({},i),xt(i.cx,i.cy,u,s)),{},{angle:s,radius:u})}var f=l.coordinate,d=i.angle;return ie(ie(ie({},i),xt(i.cx,i.cy,f,d)),{},{angle:d,radius:f})}return i3},Ap=function(t,n){var r=n.graphicalItems,i=n.dataStartIndex,l=n.dataEndIndex,s=(r??[]).reduce(function(u,f){var d=f.props.data;return d&&d.length?[].concat(Kl(u),Kl(d)):u},[]);return s.length>0?s:t&&t.length&&fe(i)&&fe(l)?t.slice(i,l+1):[]};function o3(e){return e==="number"?[0,"auto"]:void 0}var B1=function(t,n,r,i){var l=t.graphicalItems,s=t.tooltipAxis,u=Ap(n,t);return r<0||!l||!l.length||r>=u.length?null:l.reduce(function(f,d){var m,v=(m=d.props.data)!==null&&m!==void 0?m:n;v&&t.dataStartIndex+t.dataEndIndex!==0&&t.dataEndIndex-t.dataStartIndex>=r&&(v=v.slice(t.dataStartIndex,t.dataEndIndex+1));var g;if(s.dataKey&&!s.allowDuplicatedCategory){var x=v===void 0?u:v;g=wx(x,s.dataKey,i)}else g=v&&v[r]||u[r];return g?[].concat(Kl(f),[Qk(d,g)]):f},[])},IP=function(t,n,r,i){var l=i||{x:t.chartX,y:t.chartY},s=ite(l,r),u=t.orderedTooltipTicks,f=t.tooltipAxis,d=t.tooltipTicks,m=FV(s,u,d,f);if(m>=0&&d){var v=d[m]&&d[m].value,g=B1(t,n,m,v),x=ote(r,u,m,l);return{activeTooltipIndex:m,activeLabel:v,activePayload:g,activeCoordinate:x}}return null},lte=function(t,n){var r=n.axes,i=n.graphicalItems,l=n.axisType,s=n.axisIdKey,u=n.stackGroups,f=n.dataStartIndex,d=n.dataEndIndex,m=t.layout,v=t.children,g=t.stackOffset,x=Vk(m,l);return r.reduce(function(j,w){var b,_=w.type.defaultProps!==void 0?ie(ie({},w.type.defaultProps),w.props):w.props,O=_.type,E=_.dataKey,C=_.allowDataOverflow,A=_.allowDuplicatedCategory,N=_.scale,P=_.ticks,D=_.includeHidden,L=_[s];if(j[L])return j;var G=Ap(t.data,{graphicalItems:i.filter(function(te){var ne,ue=s in te.props?te.props[s]:(ne=te.type.defaultProps)===null||ne===void 0?void 0:ne[s];return ue===L}),dataStartIndex:f,dataEndIndex:d}),I=G.length,H,V,Z;Ree(_.domain,C,O)&&(H=t1(_.domain,null,C),x&&(O==="number"||N!=="auto")&&(Z=Cc(G,E,"category")));var Y=o3(O);if(!H||H.length===0){var $,U=($=_.domain)!==null&&$!==void 0?$:Y;if(E){if(H=Cc(G,E,O),O==="category"&&x){var B=I8(H);A&&B?(V=H,H=dh(0,I)):A||(H=zN(U,H,w).reduce(function(te,ne){return te.indexOf(ne)>=0?te:[].concat(Kl(te),[ne])},[]))}else if(O==="category")A?H=H.filter(function(te){return te!==""&&!Ve(te)}):H=zN(U,H,w).reduce(function(te,ne){return te.indexOf(ne)>=0||ne===""||Ve(ne)?te:[].concat(Kl(te),[ne])},[]);else if(O==="number"){var re=XV(G,i.filter(function(te){var ne,ue,ge=s in te.props?te.props[s]:(ne=te.type.defaultProps)===null||ne===void 0?void 0:ne[s],me="hide"in te.props?te.props.hide:(ue=te.type.defaultProps)===null||ue===void 0?void 0:ue.hide;return ge===L&&(D||!me)}),E,l,m);re&&(H=re)}x&&(O==="number"||N!=="auto")&&(Z=Cc(G,E,"category"))}else x?H=dh(0,I):u&&u[L]&&u[L].hasStack&&O==="number"?H=g==="expand"?[0,1]:Zk(u[L].stackGroups,f,d):H=Gk(G,i.filter(function(te){var ne=s in te.props?te.props[s]:te.type.defaultProps[s],ue="hide"in te.props?te.props.hide:te.type.defaultProps.hide;return ne===L&&(D||!ue)}),O,m,!0);if(O==="number")H=L1(v,H,L,l,P),U&&(H=t1(U,H,C));else if(O==="category"&&U){var k=U,X=H.every(function(te){return k.indexOf(te)>=0});X&&(H=k)}}return ie(ie({},j),{},Te({},L,ie(ie({},_),{},{axisType:l,domain:H,categoricalDomain:Z,duplicateDomain:V,originalDomain:(b=_.domain)!==null&&b!==void 0?b:Y,isCategorical:x,layout:m})))},{})},ste=function(t,n){var r=n.graphicalItems,i=n.Axis,l=n.axisType,s=n.axisIdKey,u=n.stackGroups,f=n.dataStartIndex,d=n.dataEndIndex,m=t.layout,v=t.children,g=Ap(t.data,{graphicalItems:r,dataStartIndex:f,dataEndIndex:d}),x=g.length,j=Vk(m,l),w=-1;return r.reduce(function(b,_){var O=_.type.defaultProps!==void 0?ie(ie({},_.type.defaultProps),_.props):_.props,E=O[s],C=o3("number");if(!b[E]){w++;var A;return j?A=dh(0,x):u&&u[E]&&u[E].hasStack?(A=Zk(u[E].stackGroups,f,d),A=L1(v,A,E,l)):(A=t1(C,Gk(g,r.filter(function(N){var P,D,L=s in N.props?N.props[s]:(P=N.type.defaultProps)===null||P===void 0?void 0:P[s],G="hide"in N.props?N.props.hide:(D=N.type.defaultProps)===null||D===void 0?void 0:D.hide;return L===E&&!G}),"number",m),i.defaultProps.allowDataOverflow),A=L1(v,A,E,l)),ie(ie({},b),{},Te({},E,ie(ie({axisType:l},i.defaultProps),{},{hide:!0,orientation:Ln(rte,"".concat(l,".").concat(w%2),null),domain:A,originalDomain:C,isCategorical:j,layout:m})))}return b},{})},cte=function(t,n){var r=n.axisType,i=r===void 0?"xAxis":r,l=n.AxisComp,s=n.graphicalItems,u=n.stackGroups,f=n.dataStartIndex,d=n.dataEndIndex,m=t.children,v="".concat(i,"Id"),g=tr(m,l),x={};return g&&g.length?x=lte(t,{axes:g,graphicalItems:s,axisType:i,axisIdKey:v,stackGroups:u,dataStartIndex:f,dataEndIndex:d}):s&&s.length&&(x=ste(t,{Axis:l,graphicalItems:s,axisType:i,axisIdKey:v,stackGroups:u,dataStartIndex:f,dataEndIndex:d})),x},ute=function(t){var n=Qa(t),r=aa(n,!1,!0);return{tooltipTicks:r,orderedTooltipTicks:Ew(r,function(i){return i.coordinate}),tooltipAxis:n,tooltipAxisBandSize:eh(n,r)}},qP=function(t){var n=t.children,r=t.defaultShowTooltip,i=Dn(n,ql),l=0,s=0;return t.data&&t.data.length!==0&&(s=t.data.length-1),i&&i.props&&(i.props.startIndex>=0&&(l=i.props.startIndex),i.props.endIndex>=0&&(s=i.props.endIndex)),{chartX:0,chartY:0,dataStartIndex:l,dataEndIndex:s,activeTooltipIndex:-1,isTooltipActive:!!r}},fte=function(t){return!t||!t.length?!1:t.some(function(n){var r=oa(n&&n.type);return r&&r.indexOf("Bar")>=0})},BP=function(t){return t==="horizontal"?{numericAxisName:"yAxis",cateAxisName:"xAxis"}:t==="vertical"?{numericAxisName:"xAxis",cateAxisName:"yAxis"}:t==="centric"?{numericAxisName:"radiusAxis",cateAxisName:"angleAxis"}:{numericAxisName:"angleAxis",cateAxisName:"radiusAxis"}},dte=function(t,n){var r=t.props,i=t.graphicalItems,l=t.xAxisMap,s=l===void 0?{}:l,u=t.yAxisMap,f=u===void 0?{}:u,d=r.width,m=r.height,v=r.children,g=r.margin||{},x=Dn(v,ql),j=Dn(v,hl),w=Object.keys(f).reduce(function(A,N){var P=f[N],D=P.orientation;return!P.mirror&&!P.hide?ie(ie({},A),{},Te({},D,A[D]+P.width)):A},{left:g.left||0,right:g.right||0}),b=Object.keys(s).reduce(function(A,N){var P=s[N],D=P.orientation;return!P.mirror&&!P.hide?ie(ie({},A),{},Te({},D,Ln(A,"".concat(D))+P.height)):A},{top:g.top||0,bottom:g.bottom||0}),_=ie(ie({},b),w),O=_.bottom;x&&(_.bottom+=x.props.height||ql.defaultProps.height),j&&n&&(_=YV(_,i,r,n));var E=d-_.left-_.right,C=m-_.top-_.bottom;return ie(ie({brushBottom:O},_),{},{width:Math.max(E,0),height:Math.max(C,0)})},hte=function(t,n){if(n==="xAxis")return t[n].width;if(n==="yAxis")return t[n].height},l3=function(t){var n=t.chartName,r=t.GraphicalChild,i=t.defaultTooltipEventType,l=i===void 0?"axis":i,s=t.validateTooltipEventTypes,u=s===void 0?["axis"]:s,f=t.axisComponents,d=t.legendContent,m=t.formatAxisMap,v=t.defaultProps,g=function(_,O){var E=O.graphicalItems,C=O.stackGroups,A=O.offset,N=O.updateId,P=O.dataStartIndex,D=O.dataEndIndex,L=_.barSize,G=_.layout,I=_.barGap,H=_.barCategoryGap,V=_.maxBarSize,Z=BP(G),Y=Z.numericAxisName,$=Z.cateAxisName,U=fte(E),B=[];return E.forEach(function(re,k){var X=Ap(_.data,{graphicalItems:[re],dataStartIndex:P,dataEndIndex:D}),te=re.type.defaultProps!==void 0?ie(ie({},re.type.defaultProps),re.props):re.props,ne=te.dataKey,ue=te.maxBarSize,ge=te["".concat(Y,"Id")],me=te["".concat($,"Id")],de={},ve=f.reduce(function(Bn,$r){var fo=O["".concat($r.axisType,"Map")],Du=te["".concat($r.axisType,"Id")];fo&&fo[Du]||$r.axisType==="zAxis"||Ji();var ku=fo[Du];return ie(ie({},Bn),{},Te(Te({},$r.axisType,ku),"".concat($r.axisType,"Ticks"),aa(ku)))},de),ce=ve[$],he=ve["".concat($,"Ticks")],pe=C&&C[ge]&&C[ge].hasStack&&aY(re,C[ge].stackGroups),ae=oa(re.type).indexOf("Bar")>=0,Le=eh(ce,he),Ce=[],ft=U&&GV({barSize:L,stackGroups:C,totalSize:hte(ve,$)});if(ae){var dt,Je,qn=Ve(ue)?V:ue,vn=(dt=(Je=eh(ce,he,!0))!==null&&Je!==void 0?Je:qn)!==null&&dt!==void 0?dt:0;Ce=VV({barGap:I,barCategoryGap:H,bandSize:vn!==Le?vn:Le,sizeList:ft[me],maxBarSize:qn}),vn!==Le&&(Ce=Ce.map(function(Bn){return ie(ie({},Bn),{},{position:ie(ie({},Bn.position),{},{offset:Bn.position.offset-vn/2})})}))}var pi=re&&re.type&&re.type.getComposedData;pi&&B.push({props:ie(ie({},pi(ie(ie({},ve),{},{displayedData:X,props:_,dataKey:ne,item:re,bandSize:Le,barPosition:Ce,offset:A,stackedData:pe,layout:G,dataStartIndex:P,dataEndIndex:D}))),{},Te(Te(Te({key:re.key||"item-".concat(k)},Y,ve[Y]),$,ve[$]),"animationId",N)),childIndex:W8(re,_.children),item:re})}),B},x=function(_,O){var E=_.props,C=_.dataStartIndex,A=_.dataEndIndex,N=_.updateId;if(!t2({props:E}))return null;var P=E.children,D=E.layout,L=E.stackOffset,G=E.data,I=E.reverseStackOrder,H=BP(D),V=H.numericAxisName,Z=H.cateAxisName,Y=tr(P,r),$=nY(G,Y,"".concat(V,"Id"),"".concat(Z,"Id"),L,I),U=f.reduce(function(te,ne){var ue="".concat(ne.axisType,"Map");return ie(ie({},te),{},Te({},ue,cte(E,ie(ie({},ne),{},{graphicalItems:Y,stackGroups:ne.axisType===V&&$,dataStartIndex:C,dataEndIndex:A}))))},{}),B=dte(ie(ie({},U),{},{props:E,graphicalItems:Y}),O==null?void 0:O.legendBBox);Object.keys(U).forEach(function(te){U[te]=m(E,U[te],B,te.replace("Map",""),n)});var re=U["".concat(Z,"Map")],k=ute(re),X=g(E,ie(ie({},U),{},{dataStartIndex:C,dataEndIndex:A,updateId:N,graphicalItems:Y,stackGroups:$,offset:B}));return ie(ie({formattedGraphicalItems:X,graphicalItems:Y,offset:B,stackGroups:$},k),U)},j=function(b){function _(O){var E,C,A;return Vee(this,_),A=Xee(this,_,[O]),Te(A,"eventEmitterSymbol",Symbol("rechartsEventEmitter")),Te(A,"accessibilityManager",new Pee),Te(A,"handleLegendBBoxUpdate",function(N){if(N){var P=A.state,D=P.dataStartIndex,L=P.dataEndIndex,G=P.updateId;A.setState(ie({legendBBox:N},x({props:A.props,dataStartIndex:D,dataEndIndex:L,updateId:G},ie(ie({},A.state),{},{legendBBox:N}))))}}),Te(A,"handleReceiveSyncEvent",function(N,P,D){if(A.props.syncId===N){if(D===A.eventEmitterSymbol&&typeof A.props.syncMethod!="function")return;A.applySyncEvent(P)}}),Te(A,"handleBrushChange",function(N){var P=N.startIndex,D=N.endIndex;if(P!==A.state.dataStartIndex||D!==A.state.dataEndIndex){var L=A.state.updateId;A.setState(function(){return ie({dataStartIndex:P,dataEndIndex:D},x({props:A.props,dataStartIndex:P,dataEndIndex:D,updateId:L},A.state))}),A.triggerSyncEvent({dataStartIndex:P,dataEndIndex:D})}}),Te(A,"handleMouseEnter",function(N){var P=A.getMouseInfo(N);if(P){var D=ie(ie({},P),{},{isTooltipActive:!0});A.setState(D),A.triggerSyncEvent(D);var L=A.props.onMouseEnter;Re(L)&&L(D,N)}}),Te(A,"triggeredAfterMouseMove",function(N){var P=A.getMouseInfo(N),D=P?ie(ie({},P),{},{isTooltipActive:!0}):{isTooltipActive:!1};A.setState(D),A.triggerSyncEvent(D);var L=A.props.onMouseMove;Re(L)&&L(D,N)}),Te(A,"handleItemMouseEnter",function(N){A.setState(function(){return{isTooltipActive:!0,activeItem:N,activePayload:N.tooltipPayload,activeCoordinate:N.tooltipPosition||{x:N.cx,y:N.cy}}})}),Te(A,"handleItemMouseLeave",function(){A.setState(function(){return{isTooltipActive:!1}})}),Te(A,"handleMouseMove",function(N){N.persist(),A.throttleTriggeredAfterMouseMove(N)}),Te(A,"handleMouseLeave",function(N){A.throttleTriggeredAfterMouseMove.cancel();var P={isTooltipActive:!1};A.setState(P),A.triggerSyncEvent(P);var D=A.props.onMouseLeave;Re(D)&&D(P,N)}),Te(A,"handleOuterEvent",function(N){var P=X8(N),D=Ln(A.props,"".concat(P));if(P&&Re(D)){var L,G;/.*touch.*/i.test(P)?G=A.getMouseInfo(N.changedTouches[0]):G=A.getMouseInfo(N),D((L=G)!==null&&L!==void 0?L:{},N)}}),Te(A,"handleClick",function(N){var P=A.getMouseInfo(N);if(P){var D=ie(ie({},P),{},{isTooltipActive:!0});A.setState(D),A.triggerSyncEvent(D);var L=A.props.onClick;Re(L)&&L(D,N)}}),Te(A,"handleMouseDown",function(N){var P=A.props.onMouseDown;if(Re(P)){var D=A.getMouseInfo(N);P(D,N)}}),Te(A,"handleMouseUp",function(N){var P=A.props.onMouseUp;if(Re(P)){var D=A.getMouseInfo(N);P(D,N)}}),Te(A,"handleTouchMove",function(N){N.changedTouches!=null&&N.changedTouches.length>0&&A.throttleTriggeredAfterMouseMove(N.changedTouches[0])}),Te(A,"handleTouchStart",function(N){N.changedTouches!=null&&N.changedTouches.length>0&&A.handleMouseDown(N.changedTouches[0])}),Te(A,"handleTouchEnd",function(N){N.changedTouches!=null&&N.changedTouches.length>0&&A.handleMouseUp(N.changedTouches[0])}),Te(A,"handleDoubleClick",function(N){var P=A.props.onDoubleClick;if(Re(P)){var D=A.getMouseInfo(N);P(D,N)}}),Te(A,"handleContextMenu",function(N){var P=A.props.onContextMenu;if(Re(P)){var D=A.getMouseInfo(N);P(D,N)}}),Te(A,"triggerSyncEvent",function(N){A.props.syncId!==void 0&&rx.emit(ax,A.props.syncId,N,A.eventEmitterSymbol)}),Te(A,"applySyncEvent",function(N){var P=A.props,D=P.layout,L=P.syncMethod,G=A.state.updateId,I=N.dataStartIndex,H=N.dataEndIndex;if(N.dataStartIndex!==void 0||N.dataEndIndex!==void 0)A.setState(ie({dataStartIndex:I,dataEndIndex:H},x({props:A.props,dataStartIndex:I,dataEndIndex:H,updateId:G},A.state)));else if(N.activeTooltipIndex!==void 0){var V=N.chartX,Z=N.chartY,Y=N.activeTooltipIndex,$=A.state,U=$.offset,B=$.tooltipTicks;if(!U)return;if(typeof L=="function")Y=L(B,N);else if(L==="value"){Y=-1;for(var re=0;re<B.length;re++)if(B[re].value===N.activeLabel){Y=re;break}}var k=ie(ie({},U),{},{x:U.left,y:U.top}),X=Math.min(V,k.x+k.width),te=Math.min(Z,k.y+k.height),ne=B[Y]&&B[Y].value,ue=B1(A.state,A.props.data,Y),ge=B[Y]?{x:D==="horizontal"?B[Y].coordinate:X,y:D==="horizontal"?te:B[Y].coordinate}:i3;A.setState(ie(ie({},N),{},{activeLabel:ne,activeCoordinate:ge,activePayload:ue,activeTooltipIndex:Y}))}else A.setState(N)}),Te(A,"renderCursor",function(N){var P,D=A.state,L=D.isTooltipActive,G=D.activeCoordinate,I=D.activePayload,H=D.offset,V=D.activeTooltipIndex,Z=D.tooltipAxisBandSize,Y=A.getTooltipEventType(),$=(P=N.props.active)!==null&&P!==void 0?P:L,U=A.props.layout,B=N.key||"_recharts-cursor";return z.createElement(qee,{key:B,activeCoordinate:G,activePayload:I,activeTooltipIndex:V,chartName:n,element:N,isActive:$,layout:U,offset:H,tooltipAxisBandSize:Z,tooltipEventType:Y})}),Te(A,"renderPolarAxis",function(N,P,D){var L=Ln(N,"type.axisType"),G=Ln(A.state,"".concat(L,"Map")),I=N.type.defaultProps,H=I!==void 0?ie(ie({},I),N.props):N.props,V=G&&G[H["".concat(L,"Id")]];return T.cloneElement(N,ie(ie({},V),{},{className:qe(L,V.className),key:N.key||"".concat(P,"-").concat(D),ticks:aa(V,!0)}))}),Te(A,"renderPolarGrid",function(N){var P=N.props,D=P.radialLines,L=P.polarAngles,G=P.polarRadius,I=A.state,H=I.radiusAxisMap,V=I.angleAxisMap,Z=Qa(H),Y=Qa(V),$=Y.cx,U=Y.cy,B=Y.innerRadius,re=Y.outerRadius;return T.cloneElement(N,{polarAngles:Array.isArray(L)?L:aa(Y,!0).map(function(k){return k.coordinate}),polarRadius:Array.isArray(G)?G:aa(Z,!0).map(function(k){return k.coordinate}),cx:$,cy:U,innerRadius:B,outerRadius:re,key:N.key||"polar-grid",radialLines:D})}),Te(A,"renderLegend",function(){var N=A.state.formattedGraphicalItems,P=A.props,D=P.children,L=P.width,G=P.height,I=A.props.margin||{},H=L-(I.left||0)-(I.right||0),V=Hk({children:D,formattedGraphicalItems:N,legendWidth:H,legendContent:d});if(!V)return null;var Z=V.item,Y=$P(V,Bee);return T.cloneElement(Z,ie(ie({},Y),{},{chartWidth:L,chartHeight:G,margin:I,onBBoxUpdate:A.handleLegendBBoxUpdate}))}),Te(A,"renderTooltip",function(){var N,P=A.props,D=P.children,L=P.accessibilityLayer,G=Dn(D,ur);if(!G)return null;var I=A.state,H=I.isTooltipActive,V=I.activeCoordinate,Z=I.activePayload,Y=I.activeLabel,$=I.offset,U=(N=G.props.active)!==null&&N!==void 0?N:H;return T.cloneElement(G,{viewBox:ie(ie({},$),{},{x:$.left,y:$.top}),active:U,label:Y,payload:U?Z:[],coordinate:V,accessibilityLayer:L})}),Te(A,"renderBrush",function(N){var P=A.props,D=P.margin,L=P.data,G=A.state,I=G.offset,H=G.dataStartIndex,V=G.dataEndIndex,Z=G.updateId;return T.cloneElement(N,{key:N.key||"_recharts-brush",onChange:ld(A.handleBrushChange,N.props.onChange),data:L,x:fe(N.props.x)?N.props.x:I.left,y:fe(N.props.y)?N.props.y:I.top+I.height+I.brushBottom-(D.bottom||0),width:fe(N.props.width)?N.props.width:I.width,startIndex:H,endIndex:V,updateId:"brush-".concat(Z)})}),Te(A,"renderReferenceElement",function(N,P,D){if(!N)return null;var L=A,G=L.clipPathId,I=A.state,H=I.xAxisMap,V=I.yAxisMap,Z=I.offset,Y=N.type.defaultProps||{},$=N.props,U=$.xAxisId,B=U===void 0?Y.xAxisId:U,re=$.yAxisId,k=re===void 0?Y.yAxisId:re;return T.cloneElement(N,{key:N.key||"".concat(P,"-").concat(D),xAxis:H[B],yAxis:V[k],viewBox:{x:Z.left,y:Z.top,width:Z.width,height:Z.height},clipPathId:G})}),Te(A,"renderActivePoints",function(N){var P=N.item,D=N.activePoint,L=N.basePoint,G=N.childIndex,I=N.isRange,H=[],V=P.props.key,Z=P.item.type.defaultProps!==void 0?ie(ie({},P.item.type.defaultProps),P.item.props):P.item.props,Y=Z.activeDot,$=Z.dataKey,U=ie(ie({index:G,dataKey:$,cx:D.x,cy:D.y,r:4,fill:Jw(P.item),strokeWidth:2,stroke:"#fff",payload:D.payload,value:D.value},Me(Y,!1)),Nd(Y));return H.push(_.renderActiveDot(Y,U,"".concat(V,"-activePoint-").concat(G))),L?H.push(_.renderActiveDot(Y,ie(ie({},U),{},{cx:L.x,cy:L.y}),"".concat(V,"-basePoint-").concat(G))):I&&H.push(null),H}),Te(A,"renderGraphicChild",function(N,P,D){var L=A.filterFormatItem(N,P,D);if(!L)return null;var G=A.getTooltipEventType(),I=A.state,H=I.isTooltipActive,V=I.tooltipAxis,Z=I.activeTooltipIndex,Y=I.activeLabel,$=A.props.children,U=Dn($,ur),B=L.props,re=B.points,k=B.isRange,X=B.baseLine,te=L.item.type.defaultProps!==void 0?ie(ie({},L.item.type.defaultProps),L.item.props):L.item.props,ne=te.activeDot,ue=te.hide,ge=te.activeBar,me=te.activeShape,de=!!(!ue&&H&&U&&(ne||ge||me)),ve={};G!=="axis"&&U&&U.props.trigger==="click"?ve={onClick:ld(A.handleItemMouseEnter,N.props.onClick)}:G!=="axis"&&(ve={onMouseLeave:ld(A.handleItemMouseLeave,N.props.onMouseLeave),onMouseEnter:ld(A.handleItemMouseEnter,N.props.onMouseEnter)});var ce=T.cloneElement(N,ie(ie({},L.props),ve));function he($r){return typeof V.dataKey=="function"?V.dataKey($r.payload):null}if(de)if(Z>=0){var pe,ae;if(V.dataKey&&!V.allowDuplicatedCategory){var Le=typeof V.dataKey=="function"?he:"payload.".concat(V.dataKey.toString());pe=wx(re,Le,Y),ae=k&&X&&wx(X,Le,Y)}else pe=re==null?void 0:re[Z],ae=k&&X&&X[Z];if(me||ge){var Ce=N.props.activeIndex!==void 0?N.props.activeIndex:Z;return[T.cloneElement(N,ie(ie(ie({},L.props),ve),{},{activeIndex:Ce})),null,null]}if(!Ve(pe))return[ce].concat(Kl(A.renderActivePoints({item:L,activePoint:pe,basePoint:ae,childIndex:Z,isRange:k})))}else{var ft,dt=(ft=A.getItemByXY(A.state.activeCoordinate))!==null&&ft!==void 0?ft:{graphicalItem:ce},Je=dt.graphicalItem,qn=Je.item,vn=qn===void 0?N:qn,pi=Je.childIndex,Bn=ie(ie(ie({},L.props),ve),{},{activeIndex:pi});return[T.cloneElement(vn,Bn),null,null]}return k?[ce,null,null]:[ce,null]}),Te(A,"renderCustomized",function(N,P,D){return T.cloneElement(N,ie(ie({key:"recharts-customized-".concat(D)},A.props),A.state))}),Te(A,"renderMap",{CartesianGrid:{handler:dd,once:!0},ReferenceArea:{handler:A.renderReferenceElement},ReferenceLine:{handler:dd},ReferenceDot:{handler:A.renderReferenceElement},XAxis:{handler:dd},YAxis:{handler:dd},Brush:{handler:A.renderBrush,once:!0},Bar:{handler:A.renderGraphicChild},Line:{handler:A.renderGraphicChild},Area:{handler:A.renderGraphicChild},Radar:{handler:A.renderGraphicChild},RadialBar:{handler:A.renderGraphicChild},Scatter:{handler:A.renderGraphicChild},Pie:{handler:A.renderGraphicChild},Funnel:{handler:A.renderGraphicChild},Tooltip:{handler:A.renderCursor,once:!0},PolarGrid:{handler:A.renderPolarGrid,once:!0},PolarAngleAxis:{handler:A.renderPolarAxis},PolarRadiusAxis:{handler:A.renderPolarAxis},Customized:{handler:A.renderCustomized}}),A.clipPathId="".concat((E=O.id)!==null&&E!==void 0?E:_u("recharts"),"-clip"),A.throttleTriggeredAfterMouseMove=UD(A.triggeredAfterMouseMove,(C=O.throttleDelay)!==null&&C!==void 0?C:1e3/60),A.state={},A}return Qee(_,b),Kee(_,[{key:"componentDidMount",value:function(){var E,C;this.addListener(),this.accessibilityManager.setDetails({container:this.container,offset:{left:(E=this.props.margin.left)!==null&&E!==void 0?E:0,top:(C=this.props.margin.top)!==null&&C!==void 0?C:0},coordinateList:this.state.tooltipTicks,mouseHandlerCallback:this.triggeredAfterMouseMove,layout:this.props.layout}),this.displayDefaultTooltip()}},{key:"displayDefaultTooltip",value:function(){var E=this.props,C=E.children,A=E.data,N=E.height,P=E.layout,D=Dn(C,ur);if(D){var L=D.props.defaultIndex;if(!(typeof L!="number"||L<0||L>this.state.tooltipTicks.length-1)){var G=this.state.tooltipTicks[L]&&this.state.tooltipTicks[L].value,I=B1(this.state,A,L,G),H=this.state.tooltipTicks[L].coordinate,V=(this.state.offset.top+N)/2,Z=P==="horizontal",Y=Z?{x:H,y:V}:{y:H,x:V},$=this.state.formattedGraphicalItems.find(function(B){var re=B.item;return re.type.name==="Scatter"});$&&(Y=ie(ie({},Y),$.props.points[L].tooltipPosition),I=$.props.points[L].tooltipPayload);var U={activeTooltipIndex:L,isTooltipActive:!0,activeLabel:G,activePayload:I,activeCoordinate:Y};this.setState(U),this.renderCursor(D),this.accessibilityManager.setIndex(L)}}}},{key:"getSnapshotBeforeUpdate",value:function(E,C){if(!this.props.accessibilityLayer)return null;if(this.state.tooltipTicks!==C.tooltipTicks&&this.accessibilityManager.setDetails({coordinateList:this.state.tooltipTicks}),this.props.layout!==E.layout&&this.accessibilityManager.setDetails({layout:this.props.layout}),this.props.margin!==E.margin){var A,N;this.accessibilityManager.setDetails({offset:{left:(A=this.props.margin.left)!==null&&A!==void 0?A:0,top:(N=this.props.margin.top)!==null&&N!==void 0?N:0}})}return null}},{key:"componentDidUpdate",value:function(E){jx([Dn(E.children,ur)],[Dn(this.props.children,ur)])||this.displayDefaultTooltip()}},{key:"componentWillUnmount",value:function(){this.removeListener(),this.throttleTriggeredAfterMouseMove.cancel()}},{key:"getTooltipEventType",value:function(){var E=Dn(this.props.children,ur);if(E&&typeof E.props.shared=="boolean"){var C=E.props.shared?"axis":"item";return u.indexOf(C)>=0?C:l}return l}},{key:"getMouseInfo",value:function(E){if(!this.container)return null;var C=this.container,A=C.getBoundingClientRect(),N=$7(A),P={chartX:Math.round(E.pageX-N.left),chartY:Math.round(E.pageY-N.top)},D=A.width/C.offsetWidth||1,L=this.inRange(P.chartX,P.chartY,D);if(!L)return null;var G=this.state,I=G.xAxisMap,H=G.yAxisMap,V=this.getTooltipEventType(),Z=IP(this.state,this.props.data,this.props.layout,L);if(V!=="axis"&&I&&H){var Y=Qa(I).scale,$=Qa(H).scale,U=Y&&Y.invert?Y.invert(P.chartX):null,B=$&&$.invert?$.invert(P.chartY):null;return ie(ie({},P),{},{xValue:U,yValue:B},Z)}return Z?ie(ie({},P),Z):null}},{key:"inRange",value:function(E,C){var A=arguments.length>2&&arguments[2]!==void 0?arguments[2]:1,N=this.props.layout,P=E/A,D=C/A;if(N==="horizontal"||N==="vertical"){var L=this.state.offset,G=P>=L.left&&P<=L.left+L.width&&D>=L.top&&D<=L.top+L.height;return G?{x:P,y:D}:null}var I=this.state,H=I.angleAxisMap,V=I.radiusAxisMap;if(H&&V){var Z=Qa(H);return FN({x:P,y:D},Z)}return null}},{key:"parseEventsOfWrapper",value:function(){var E=this.props.children,C=this.getTooltipEventType(),A=Dn(E,ur),N={};A&&C==="axis"&&(A.props.trigger==="click"?N={onClick:this.handleClick}:N={onMouseEnter:this.handleMouseEnter,onDoubleClick:this.handleDoubleClick,onMouseMove:this.handleMouseMove,onMouseLeave:this.handleMouseLeave,onTouchMove:this.handleTouchMove,onTouchStart:this.handleTouchStart,onTouchEnd:this.handleTouchEnd,onContextMenu:this.handleContextMenu});var P=Nd(this.props,this.handleOuterEvent);return ie(ie({},P),N)}},{key:"addListener",value:function(){rx.on(ax,this.handleReceiveSyncEvent)}},{key:"removeListener",value:function(){rx.removeListener(ax,this.handleReceiveSyncEvent)}},{key:"filterFormatItem",value:function(E,C,A){for(var N=this.state.formattedGraphicalItems,P=0,D=N.length;P<D;P++){var L=N[P];if(L.item===E||L.props.key===E.key||C===oa(L.item.type)&&A===L.childIndex)return L}return null}},{key:"renderClipPath",value:function(){var E=this.clipPathId,C=this.state.offset,A=C.left,N=C.top,P=C.height,D=C.width;return z.createElement("defs",null,z.createElement("clipPath",{id:E},z.createElement("rect",{x:A,y:N,height:P,width:D})))}},{key:"getXScales",value:function(){var E=this.state.xAxisMap;return E?Object.entries(E).reduce(function(C,A){var N=kP(A,2),P=N[0],D=N[1];return ie(ie({},C),{},Te({},P,D.scale))},{}):null}},{key:"getYScales",value:function(){var E=this.state.yAxisMap;return E?Object.entries(E).reduce(function(C,A){var N=kP(A,2),P=N[0],D=N[1];return ie(ie({},C),{},Te({},P,D.scale))},{}):null}},{key:"getXScaleByAxisId",value:function(E){var C;return(C=this.state.xAxisMap)===null||C===void 0||(C=C[E])===null||C===void 0?void 0:C.scale}},{key:"getYScaleByAxisId",value:function(E){var C;return(C=this.state.yAxisMap)===null||C===void 0||(C=C[E])===null||C===void 0?void 0:C.scale}},{key:"getItemByXY",value:function(E){var C=this.state,A=C.formattedGraphicalItems,N=C.activeItem;if(A&&A.length)for(var P=0,D=A.length;P<D;P++){var L=A[P],G=L.props,I=L.item,H=I.type.defaultProps!==void 0?ie(ie({},I.type.defaultProps),I.props):I.props,V=oa(I.type);if(V==="Bar"){var Z=(G.data||[]).find(function(B){return JX(E,B)});if(Z)return{graphicalItem:L,payload:Z}}else if(V==="RadialBar"){var Y=(G.data||[]).find(function(B){return FN(E,B)});if(Y)return{graphicalItem:L,payload:Y}}else if(yp(L,N)||gp(L,N)||uu(L,N)){var $=jZ({graphicalItem:L,activeTooltipItem:N,itemData:H.data}),U=H.activeIndex===void 0?$:H.activeIndex;return{graphicalItem:ie(ie({},L),{},{childIndex:U}),payload:uu(L,N)?H.data[$]:L.props.data[$]}}}return null}},{key:"render",value:function(){var E=this;if(!t2(this))return null;var C=this.props,A=C.children,N=C.className,P=C.width,D=C.height,L=C.style,G=C.compact,I=C.title,H=C.desc,V=$P(C,zee),Z=Me(V,!1);if(G)return z.createElement(bP,{state:this.state,width:this.props.width,height:this.props.height,clipPathId:this.clipPathId},z.createElement(_x,cl({},Z,{width:P,height:D,title:I,desc:H}),this.renderClipPath(),r2(A,this.renderMap)));if(this.props.accessibilityLayer){var Y,$;Z.tabIndex=(Y=this.props.tabIndex)!==null&&Y!==void 0?Y:0,Z.role=($=this.props.role)!==null&&$!==void 0?$:"application",Z.onKeyDown=function(B){E.accessibilityManager.keyboardEvent(B)},Z.onFocus=function(){E.accessibilityManager.focus()}}var U=this.parseEventsOfWrapper();return z.createElement(bP,{state:this.state,width:this.props.width,height:this.props.height,clipPathId:this.clipPathId},z.createElement("div",cl({className:qe("recharts-wrapper",N),style:ie({position:"relative",cursor:"default",width:P,height:D},L)},U,{ref:function(re){E.container=re}}),z.createElement(_x,cl({},Z,{width:P,height:D,title:I,desc:H,style:ate}),this.renderClipPath(),r2(A,this.renderMap)),this.renderLegend(),this.renderTooltip()))}}])}(T.Component);Te(j,"displayName",n),Te(j,"defaultProps",ie({layout:"horizontal",stackOffset:"none",barCategoryGap:"10%",barGap:4,margin:{top:5,right:5,bottom:5,left:5},reverseStackOrder:!1,syncMethod:"index"},v)),Te(j,"getDerivedStateFromProps",function(b,_){var O=b.dataKey,E=b.data,C=b.children,A=b.width,N=b.height,P=b.layout,D=b.stackOffset,L=b.margin,G=_.dataStartIndex,I=_.dataEndIndex;if(_.updateId===void 0){var H=qP(b);return ie(ie(ie({},H),{},{updateId:0},x(ie(ie({props:b},H),{},{updateId:0}),_)),{},{prevDataKey:O,prevData:E,prevWidth:A,prevHeight:N,prevLayout:P,prevStackOffset:D,prevMargin:L,prevChildren:C})}if(O!==_.prevDataKey||E!==_.prevData||A!==_.prevWidth||N!==_.prevHeight||P!==_.prevLayout||D!==_.prevStackOffset||!dl(L,_.prevMargin)){var V=qP(b),Z={chartX:_.chartX,chartY:_.chartY,isTooltipActive:_.isTooltipActive},Y=ie(ie({},IP(_,E,P)),{},{updateId:_.updateId+1}),$=ie(ie(ie({},V),Z),Y);return ie(ie(ie({},$),x(ie({props:b},$),_)),{},{prevDataKey:O,prevData:E,prevWidth:A,prevHeight:N,prevLayout:P,prevStackOffset:D,prevMargin:L,prevChildren:C})}if(!jx(C,_.prevChildren)){var U,B,re,k,X=Dn(C,ql),te=X&&(U=(B=X.props)===null||B===void 0?void 0:B.startIndex)!==null&&U!==void 0?U:G,ne=X&&(re=(k=X.props)===null||k===void 0?void 0:k.endIndex)!==null&&re!==void 0?re:I,ue=te!==G||ne!==I,ge=!Ve(E),me=ge&&!ue?_.updateId:_.updateId+1;return ie(ie({updateId:me},x(ie(ie({props:b},_),{},{updateId:me,dataStartIndex:te,dataEndIndex:ne}),_)),{},{prevChildren:C,dataStartIndex:te,dataEndIndex:ne})}return null}),Te(j,"renderActiveDot",function(b,_,O){var E;return T.isValidElement(b)?E=T.cloneElement(b,_):Re(b)?E=b(_):E=z.createElement(tS,_),z.createElement(ot,{className:"recharts-active-dot",key:O},E)});var w=T.forwardRef(function(_,O){return z.createElement(j,cl({},_,{ref:O}))});return w.displayName=j.displayName,w},pte=l3({chartName:"BarChart",GraphicalChild:co,defaultTooltipEventType:"axis",validateTooltipEventTypes:["axis","item"],axisComponents:[{axisType:"xAxis",AxisComp:Op},{axisType:"yAxis",AxisComp:_p}],formatAxisMap:AQ}),mte=l3({chartName:"PieChart",GraphicalChild:ja,validateTooltipEventTypes:["item"],defaultTooltipEventType:"item",legendContent:"children",axisComponents:[{axisType:"angleAxis",AxisComp:vp},{axisType:"radiusAxis",AxisComp:pp}],formatAxisMap:pY,defaultProps:{layout:"centric",startAngle:0,endAngle:360,cx:"50%",cy:"50%",innerRadius:0,outerRadius:"80%"}});const zP=({userRole:e})=>{const[t,n]=T.useState({vehiculos_en_taller:0,citas_hoy:0,facturas_pendientes:0,ingresos_mes:0,clientes_activos:0,repuestos_pendientes:0}),[r,i]=T.useState([]),[l,s]=T.useState([]),[u,f]=T.useState([]),[d,m]=T.useState(!0);T.useEffect(()=>{v()},[]);const v=async()=>{try{m(!0);const x=await(await fetch("/api/dashboard/stats")).json();x.success&&n(x.data);const w=await(await fetch("/api/dashboard/revenue-chart")).json();w.success&&i(w.data);const _=await(await fetch("/api/dashboard/repair-types")).json();_.success&&s(_.data);const E=await(await fetch("/api/dashboard/recent-activity")).json();E.success&&f(E.data)}catch(g){console.error("Error fetching dashboard data:",g)}finally{m(!1)}};return d?p.jsx("div",{className:"flex items-center justify-center h-64",children:p.jsx("div",{className:"text-lg",children:"Cargando datos del dashboard..."})}):p.jsxs("div",{className:"space-y-6",children:[p.jsxs("div",{className:"flex justify-between items-center",children:[p.jsxs("div",{children:[p.jsx("h1",{className:"text-3xl font-bold text-gray-900",children:"Dashboard"}),p.jsx("p",{className:"text-gray-600",children:"Resumen general del taller"})]}),p.jsxs("div",{className:"flex items-center gap-4",children:[p.jsx(Pe,{onClick:v,variant:"outline",size:"sm",children:"Actualizar"}),p.jsxs("div",{className:"text-sm text-gray-500",children:["Última actualización: ",new Date().toLocaleString("es-ES")]})]})]}),p.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6",children:[p.jsxs(De,{children:[p.jsxs(pt,{className:"flex flex-row items-center justify-between space-y-0 pb-2",children:[p.jsx(mt,{className:"text-sm font-medium",children:"Vehículos en Taller"}),p.jsx(Ih,{className:"h-4 w-4 text-blue-600"})]}),p.jsxs(ke,{children:[p.jsx("div",{className:"text-2xl font-bold text-blue-600",children:t.vehiculos_en_taller}),p.jsx("p",{className:"text-xs text-gray-600",children:"Vehículos actualmente en reparación"})]})]}),p.jsxs(De,{children:[p.jsxs(pt,{className:"flex flex-row items-center justify-between space-y-0 pb-2",children:[p.jsx(mt,{className:"text-sm font-medium",children:"Citas Hoy"}),p.jsx(Jn,{className:"h-4 w-4 text-green-600"})]}),p.jsxs(ke,{children:[p.jsx("div",{className:"text-2xl font-bold text-green-600",children:t.citas_hoy}),p.jsx("p",{className:"text-xs text-gray-600",children:"Citas programadas para hoy"})]})]}),p.jsxs(De,{children:[p.jsxs(pt,{className:"flex flex-row items-center justify-between space-y-0 pb-2",children:[p.jsx(mt,{className:"text-sm font-medium",children:"Facturas Pendientes"}),p.jsx(Bh,{className:"h-4 w-4 text-orange-600"})]}),p.jsxs(ke,{children:[p.jsx("div",{className:"text-2xl font-bold text-orange-600",children:t.facturas_pendientes}),p.jsx("p",{className:"text-xs text-gray-600",children:"Facturas por cobrar"})]})]}),p.jsxs(De,{children:[p.jsxs(pt,{className:"flex flex-row items-center justify-between space-y-0 pb-2",children:[p.jsx(mt,{className:"text-sm font-medium",children:"Ingresos del Mes"}),p.jsx(Yi,{className:"h-4 w-4 text-purple-600"})]}),p.jsxs(ke,{children:[p.jsxs("div",{className:"text-2xl font-bold text-purple-600",children:["€",t.ingresos_mes.toFixed(2)]}),p.jsx("p",{className:"text-xs text-gray-600",children:"Ingresos del mes actual"})]})]}),p.jsxs(De,{children:[p.jsxs(pt,{className:"flex flex-row items-center justify-between space-y-0 pb-2",children:[p.jsx(mt,{className:"text-sm font-medium",children:"Clientes Activos"}),p.jsx(kc,{className:"h-4 w-4 text-indigo-600"})]}),p.jsxs(ke,{children:[p.jsx("div",{className:"text-2xl font-bold text-indigo-600",children:t.clientes_activos}),p.jsx("p",{className:"text-xs text-gray-600",children:"Clientes registrados activos"})]})]}),p.jsxs(De,{children:[p.jsxs(pt,{className:"flex flex-row items-center justify-between space-y-0 pb-2",children:[p.jsx(mt,{className:"text-sm font-medium",children:"Repuestos Pendientes"}),p.jsx(Td,{className:"h-4 w-4 text-red-600"})]}),p.jsxs(ke,{children:[p.jsx("div",{className:"text-2xl font-bold text-red-600",children:t.repuestos_pendientes}),p.jsx("p",{className:"text-xs text-gray-600",children:"Repuestos en proceso de pedido"})]})]})]}),p.jsxs("div",{className:"grid grid-cols-1 lg:grid-cols-2 gap-6",children:[p.jsxs(De,{children:[p.jsxs(pt,{children:[p.jsxs(mt,{className:"flex items-center gap-2",children:[p.jsx(zz,{className:"w-5 h-5"}),"Ingresos Mensuales"]}),p.jsx(nn,{children:"Evolución de ingresos en los últimos 6 meses"})]}),p.jsx(ke,{children:p.jsx(_C,{width:"100%",height:300,children:p.jsxs(pte,{data:r,children:[p.jsx(Y4,{strokeDasharray:"3 3"}),p.jsx(Op,{dataKey:"month"}),p.jsx(_p,{}),p.jsx(ur,{formatter:g=>[`€${g}`,"Ingresos"]}),p.jsx(co,{dataKey:"revenue",fill:"#3b82f6"})]})})})]}),p.jsxs(De,{children:[p.jsxs(pt,{children:[p.jsxs(mt,{className:"flex items-center gap-2",children:[p.jsx(Ki,{className:"w-5 h-5"}),"Tipos de Reparación"]}),p.jsx(nn,{children:"Distribución de reparaciones por categoría"})]}),p.jsx(ke,{children:p.jsx(_C,{width:"100%",height:300,children:p.jsxs(mte,{children:[p.jsx(ja,{data:l,cx:"50%",cy:"50%",labelLine:!1,label:({name:g,value:x})=>`${g}: ${x}%`,outerRadius:80,fill:"#8884d8",dataKey:"value",children:l.map((g,x)=>p.jsx(Jh,{fill:g.color},`cell-${x}`))}),p.jsx(ur,{})]})})})]})]}),p.jsxs(De,{children:[p.jsxs(pt,{children:[p.jsxs(mt,{className:"flex items-center gap-2",children:[p.jsx(hr,{className:"w-5 h-5"}),"Actividad Reciente"]}),p.jsx(nn,{children:"Últimas actividades del taller"})]}),p.jsx(ke,{children:p.jsx("div",{className:"space-y-4",children:u.length>0?u.map((g,x)=>p.jsxs("div",{className:"flex items-start gap-3 p-3 rounded-lg bg-gray-50",children:[p.jsxs("div",{className:"flex-shrink-0",children:[g.type==="diagnostico"&&p.jsx(Ki,{className:"w-4 h-4 text-blue-600 mt-1"}),g.type==="cita"&&p.jsx(Jn,{className:"w-4 h-4 text-green-600 mt-1"}),g.type==="factura"&&p.jsx(Yi,{className:"w-4 h-4 text-purple-600 mt-1"}),g.type==="repuesto"&&p.jsx(Td,{className:"w-4 h-4 text-orange-600 mt-1"})]}),p.jsxs("div",{className:"flex-1",children:[p.jsx("p",{className:"text-sm font-medium",children:g.description}),p.jsxs("div",{className:"flex items-center gap-2 mt-1",children:[p.jsx(Mt,{variant:"outline",className:"text-xs",children:g.type}),p.jsx("span",{className:"text-xs text-gray-500",children:g.time})]})]}),p.jsx(Mt,{className:`text-xs ${g.status==="completada"?"bg-green-100 text-green-800":g.status==="programada"?"bg-blue-100 text-blue-800":g.status==="nuevo"?"bg-yellow-100 text-yellow-800":"bg-gray-100 text-gray-800"}`,children:g.status})]},g.id)):p.jsx("p",{className:"text-gray-500 text-center py-4",children:"No hay actividad reciente"})})})]})]})};function Ie({className:e,type:t,...n}){return p.jsx("input",{type:t,"data-slot":"input",className:We("file:text-foreground placeholder:text-muted-foreground selection:bg-primary selection:text-primary-foreground dark:bg-input/30 border-input flex h-9 w-full min-w-0 rounded-md border bg-transparent px-3 py-1 text-base shadow-xs transition-[color,box-shadow] outline-none file:inline-flex file:h-7 file:border-0 file:bg-transparent file:text-sm file:font-medium disabled:pointer-events-none disabled:cursor-not-allowed disabled:opacity-50 md:text-sm","focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:ring-[3px]","aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive",e),...n})}var vte=["a","button","div","form","h2","h3","img","input","label","li","nav","ol","p","select","span","svg","ul"],Ke=vte.reduce((e,t)=>{const n=Sl(`Primitive.${t}`),r=T.forwardRef((i,l)=>{const{asChild:s,...u}=i,f=s?n:t;return typeof window<"u"&&(window[Symbol.for("radix-ui")]=!0),p.jsx(f,{...u,ref:l})});return r.displayName=`Primitive.${t}`,{...e,[t]:r}},{});function yte(e,t){e&&Su.flushSync(()=>e.dispatchEvent(t))}var gte="Label",s3=T.forwardRef((e,t)=>p.jsx(Ke.label,{...e,ref:t,onMouseDown:n=>{var i;n.target.closest("button, input, select, textarea")||((i=e.onMouseDown)==null||i.call(e,n),!n.defaultPrevented&&n.detail>1&&n.preventDefault())}}));s3.displayName=gte;var bte=s3;function je({className:e,...t}){return p.jsx(bte,{"data-slot":"label",className:We("flex items-center gap-2 text-sm leading-none font-medium select-none group-data-[disabled=true]:pointer-events-none group-data-[disabled=true]:opacity-50 peer-disabled:cursor-not-allowed peer-disabled:opacity-50",e),...t})}function Ye(e,t,{checkForDefaultPrevented:n=!0}={}){return function(i){if(e==null||e(i),n===!1||!i.defaultPrevented)return t==null?void 0:t(i)}}function xte(e,t){const n=T.createContext(t),r=l=>{const{children:s,...u}=l,f=T.useMemo(()=>u,Object.values(u));return p.jsx(n.Provider,{value:f,children:s})};r.displayName=e+"Provider";function i(l){const s=T.useContext(n);if(s)return s;if(t!==void 0)return t;throw new Error(`\`${l}\` must be used within \`${e}\``)}return[r,i]}function uo(e,t=[]){let n=[];function r(l,s){const u=T.createContext(s),f=n.length;n=[...n,s];const d=v=>{var _;const{scope:g,children:x,...j}=v,w=((_=g==null?void 0:g[e])==null?void 0:_[f])||u,b=T.useMemo(()=>j,Object.values(j));return p.jsx(w.Provider,{value:b,children:x})};d.displayName=l+"Provider";function m(v,g){var w;const x=((w=g==null?void 0:g[e])==null?void 0:w[f])||u,j=T.useContext(x);if(j)return j;if(s!==void 0)return s;throw new Error(`\`${v}\` must be used within \`${l}\``)}return[d,m]}const i=()=>{const l=n.map(s=>T.createContext(s));return function(u){const f=(u==null?void 0:u[e])||l;return T.useMemo(()=>({[`__scope${e}`]:{...u,[e]:f}}),[u,f])}};return i.scopeName=e,[r,wte(i,...t)]}function wte(...e){const t=e[0];if(e.length===1)return t;const n=()=>{const r=e.map(i=>({useScope:i(),scopeName:i.scopeName}));return function(l){const s=r.reduce((u,{useScope:f,scopeName:d})=>{const v=f(l)[`__scope${d}`];return{...u,...v}},{});return T.useMemo(()=>({[`__scope${t.scopeName}`]:s}),[s])}};return n.scopeName=t.scopeName,n}function c3(e){const t=e+"CollectionProvider",[n,r]=uo(t),[i,l]=n(t,{collectionRef:{current:null},itemMap:new Map}),s=w=>{const{scope:b,children:_}=w,O=z.useRef(null),E=z.useRef(new Map).current;return p.jsx(i,{scope:b,itemMap:E,collectionRef:O,children:_})};s.displayName=t;const u=e+"CollectionSlot",f=Sl(u),d=z.forwardRef((w,b)=>{const{scope:_,children:O}=w,E=l(u,_),C=St(b,E.collectionRef);return p.jsx(f,{ref:C,children:O})});d.displayName=u;const m=e+"CollectionItemSlot",v="data-radix-collection-item",g=Sl(m),x=z.forwardRef((w,b)=>{const{scope:_,children:O,...E}=w,C=z.useRef(null),A=St(b,C),N=l(m,_);return z.useEffect(()=>(N.itemMap.set(C,{ref:C,...E}),()=>void N.itemMap.delete(C))),p.jsx(g,{[v]:"",ref:A,children:O})});x.displayName=m;function j(w){const b=l(e+"CollectionConsumer",w);return z.useCallback(()=>{const O=b.collectionRef.current;if(!O)return[];const E=Array.from(O.querySelectorAll(`[${v}]`));return Array.from(b.itemMap.values()).sort((N,P)=>E.indexOf(N.ref.current)-E.indexOf(P.ref.current))},[b.collectionRef,b.itemMap])}return[{Provider:s,Slot:d,ItemSlot:x},j,r]}var un=globalThis!=null&&globalThis.document?T.useLayoutEffect:()=>{},Ste=cR[" useId ".trim().toString()]||(()=>{}),jte=0;function ri(e){const[t,n]=T.useState(Ste());return un(()=>{n(r=>r??String(jte++))},[e]),e||(t?`radix-${t}`:"")}function ai(e){const t=T.useRef(e);return T.useEffect(()=>{t.current=e}),T.useMemo(()=>(...n)=>{var r;return(r=t.current)==null?void 0:r.call(t,...n)},[])}var Ote=cR[" useInsertionEffect ".trim().toString()]||un;function Xl({prop:e,defaultProp:t,onChange:n=()=>{},caller:r}){const[i,l,s]=_te({defaultProp:t,onChange:n}),u=e!==void 0,f=u?e:i;{const m=T.useRef(e!==void 0);T.useEffect(()=>{const v=m.current;v!==u&&console.warn(`${r} is changing from ${v?"controlled":"uncontrolled"} to ${u?"controlled":"uncontrolled"}. Components should not switch from controlled to uncontrolled (or vice versa). Decide between using a controlled or uncontrolled value for the lifetime of the component.`),m.current=u},[u,r])}const d=T.useCallback(m=>{var v;if(u){const g=Ate(m)?m(e):m;g!==e&&((v=s.current)==null||v.call(s,g))}else l(m)},[u,e,l,s]);return[f,d]}function _te({defaultProp:e,onChange:t}){const[n,r]=T.useState(e),i=T.useRef(n),l=T.useRef(t);return Ote(()=>{l.current=t},[t]),T.useEffect(()=>{var s;i.current!==n&&((s=l.current)==null||s.call(l,n),i.current=n)},[n,i]),[n,r,l]}function Ate(e){return typeof e=="function"}var Ete=T.createContext(void 0);function fS(e){const t=T.useContext(Ete);return e||t||"ltr"}var ox="rovingFocusGroup.onEntryFocus",Tte={bubbles:!1,cancelable:!0},Mu="RovingFocusGroup",[z1,u3,Cte]=c3(Mu),[Nte,f3]=uo(Mu,[Cte]),[Mte,Pte]=Nte(Mu),d3=T.forwardRef((e,t)=>p.jsx(z1.Provider,{scope:e.__scopeRovingFocusGroup,children:p.jsx(z1.Slot,{scope:e.__scopeRovingFocusGroup,children:p.jsx(Rte,{...e,ref:t})})}));d3.displayName=Mu;var Rte=T.forwardRef((e,t)=>{const{__scopeRovingFocusGroup:n,orientation:r,loop:i=!1,dir:l,currentTabStopId:s,defaultCurrentTabStopId:u,onCurrentTabStopIdChange:f,onEntryFocus:d,preventScrollOnEntryFocus:m=!1,...v}=e,g=T.useRef(null),x=St(t,g),j=fS(l),[w,b]=Xl({prop:s,defaultProp:u??null,onChange:f,caller:Mu}),[_,O]=T.useState(!1),E=ai(d),C=u3(n),A=T.useRef(!1),[N,P]=T.useState(0);return T.useEffect(()=>{const D=g.current;if(D)return D.addEventListener(ox,E),()=>D.removeEventListener(ox,E)},[E]),p.jsx(Mte,{scope:n,orientation:r,dir:j,loop:i,currentTabStopId:w,onItemFocus:T.useCallback(D=>b(D),[b]),onItemShiftTab:T.useCallback(()=>O(!0),[]),onFocusableItemAdd:T.useCallback(()=>P(D=>D+1),[]),onFocusableItemRemove:T.useCallback(()=>P(D=>D-1),[]),children:p.jsx(Ke.div,{tabIndex:_||N===0?-1:0,"data-orientation":r,...v,ref:x,style:{outline:"none",...e.style},onMouseDown:Ye(e.onMouseDown,()=>{A.current=!0}),onFocus:Ye(e.onFocus,D=>{const L=!A.current;if(D.target===D.currentTarget&&L&&!_){const G=new CustomEvent(ox,Tte);if(D.currentTarget.dispatchEvent(G),!G.defaultPrevented){const I=C().filter($=>$.focusable),H=I.find($=>$.active),V=I.find($=>$.id===w),Y=[H,V,...I].filter(Boolean).map($=>$.ref.current);m3(Y,m)}}A.current=!1}),onBlur:Ye(e.onBlur,()=>O(!1))})})}),h3="RovingFocusGroupItem",p3=T.forwardRef((e,t)=>{const{__scopeRovingFocusGroup:n,focusable:r=!0,active:i=!1,tabStopId:l,children:s,...u}=e,f=ri(),d=l||f,m=Pte(h3,n),v=m.currentTabStopId===d,g=u3(n),{onFocusableItemAdd:x,onFocusableItemRemove:j,currentTabStopId:w}=m;return T.useEffect(()=>{if(r)return x(),()=>j()},[r,x,j]),p.jsx(z1.ItemSlot,{scope:n,id:d,focusable:r,active:i,children:p.jsx(Ke.span,{tabIndex:v?0:-1,"data-orientation":m.orientation,...u,ref:t,onMouseDown:Ye(e.onMouseDown,b=>{r?m.onItemFocus(d):b.preventDefault()}),onFocus:Ye(e.onFocus,()=>m.onItemFocus(d)),onKeyDown:Ye(e.onKeyDown,b=>{if(b.key==="Tab"&&b.shiftKey){m.onItemShiftTab();return}if(b.target!==b.currentTarget)return;const _=$te(b,m.orientation,m.dir);if(_!==void 0){if(b.metaKey||b.ctrlKey||b.altKey||b.shiftKey)return;b.preventDefault();let E=g().filter(C=>C.focusable).map(C=>C.ref.current);if(_==="last")E.reverse();else if(_==="prev"||_==="next"){_==="prev"&&E.reverse();const C=E.indexOf(b.currentTarget);E=m.loop?Lte(E,C+1):E.slice(C+1)}setTimeout(()=>m3(E))}}),children:typeof s=="function"?s({isCurrentTabStop:v,hasTabStop:w!=null}):s})})});p3.displayName=h3;var Dte={ArrowLeft:"prev",ArrowUp:"prev",ArrowRight:"next",ArrowDown:"next",PageUp:"first",Home:"first",PageDown:"last",End:"last"};function kte(e,t){return t!=="rtl"?e:e==="ArrowLeft"?"ArrowRight":e==="ArrowRight"?"ArrowLeft":e}function $te(e,t,n){const r=kte(e.key,n);if(!(t==="vertical"&&["ArrowLeft","ArrowRight"].includes(r))&&!(t==="horizontal"&&["ArrowUp","ArrowDown"].includes(r)))return Dte[r]}function m3(e,t=!1){const n=document.activeElement;for(const r of e)if(r===n||(r.focus({preventScroll:t}),document.activeElement!==n))return}function Lte(e,t){return e.map((n,r)=>e[(t+r)%e.length])}var Ite=d3,qte=p3;function Bte(e,t){return T.useReducer((n,r)=>t[n][r]??n,e)}var Pu=e=>{const{present:t,children:n}=e,r=zte(t),i=typeof n=="function"?n({present:r.isPresent}):T.Children.only(n),l=St(r.ref,Ute(i));return typeof n=="function"||r.isPresent?T.cloneElement(i,{ref:l}):null};Pu.displayName="Presence";function zte(e){const[t,n]=T.useState(),r=T.useRef(null),i=T.useRef(e),l=T.useRef("none"),s=e?"mounted":"unmounted",[u,f]=Bte(s,{mounted:{UNMOUNT:"unmounted",ANIMATION_OUT:"unmountSuspended"},unmountSuspended:{MOUNT:"mounted",ANIMATION_END:"unmounted"},unmounted:{MOUNT:"mounted"}});return T.useEffect(()=>{const d=hd(r.current);l.current=u==="mounted"?d:"none"},[u]),un(()=>{const d=r.current,m=i.current;if(m!==e){const g=l.current,x=hd(d);e?f("MOUNT"):x==="none"||(d==null?void 0:d.display)==="none"?f("UNMOUNT"):f(m&&g!==x?"ANIMATION_OUT":"UNMOUNT"),i.current=e}},[e,f]),un(()=>{if(t){let d;const m=t.ownerDocument.defaultView??window,v=x=>{const w=hd(r.current).includes(x.animationName);if(x.target===t&&w&&(f("ANIMATION_END"),!i.current)){const b=t.style.animationFillMode;t.style.animationFillMode="forwards",d=m.setTimeout(()=>{t.style.animationFillMode==="forwards"&&(t.style.animationFillMode=b)})}},g=x=>{x.target===t&&(l.current=hd(r.current))};return t.addEventListener("animationstart",g),t.addEventListener("animationcancel",v),t.addEventListener("animationend",v),()=>{m.clearTimeout(d),t.removeEventListener("animationstart",g),t.removeEventListener("animationcancel",v),t.removeEventListener("animationend",v)}}else f("ANIMATION_END")},[t,f]),{isPresent:["mounted","unmountSuspended"].includes(u),ref:T.useCallback(d=>{r.current=d?getComputedStyle(d):null,n(d)},[])}}function hd(e){return(e==null?void 0:e.animationName)||"none"}function Ute(e){var r,i;let t=(r=Object.getOwnPropertyDescriptor(e.props,"ref"))==null?void 0:r.get,n=t&&"isReactWarning"in t&&t.isReactWarning;return n?e.ref:(t=(i=Object.getOwnPropertyDescriptor(e,"ref"))==null?void 0:i.get,n=t&&"isReactWarning"in t&&t.isReactWarning,n?e.props.ref:e.props.ref||e.ref)}var Ep="Tabs",[Hte,Sie]=uo(Ep,[f3]),v3=f3(),[Fte,dS]=Hte(Ep),y3=T.forwardRef((e,t)=>{const{__scopeTabs:n,value:r,onValueChange:i,defaultValue:l,orientation:s="horizontal",dir:u,activationMode:f="automatic",...d}=e,m=fS(u),[v,g]=Xl({prop:r,onChange:i,defaultProp:l??"",caller:Ep});return p.jsx(Fte,{scope:n,baseId:ri(),value:v,onValueChange:g,orientation:s,dir:m,activationMode:f,children:p.jsx(Ke.div,{dir:m,"data-orientation":s,...d,ref:t})})});y3.displayName=Ep;var g3="TabsList",b3=T.forwardRef((e,t)=>{const{__scopeTabs:n,loop:r=!0,...i}=e,l=dS(g3,n),s=v3(n);return p.jsx(Ite,{asChild:!0,...s,orientation:l.orientation,dir:l.dir,loop:r,children:p.jsx(Ke.div,{role:"tablist","aria-orientation":l.orientation,...i,ref:t})})});b3.displayName=g3;var x3="TabsTrigger",w3=T.forwardRef((e,t)=>{const{__scopeTabs:n,value:r,disabled:i=!1,...l}=e,s=dS(x3,n),u=v3(n),f=O3(s.baseId,r),d=_3(s.baseId,r),m=r===s.value;return p.jsx(qte,{asChild:!0,...u,focusable:!i,active:m,children:p.jsx(Ke.button,{type:"button",role:"tab","aria-selected":m,"aria-controls":d,"data-state":m?"active":"inactive","data-disabled":i?"":void 0,disabled:i,id:f,...l,ref:t,onMouseDown:Ye(e.onMouseDown,v=>{!i&&v.button===0&&v.ctrlKey===!1?s.onValueChange(r):v.preventDefault()}),onKeyDown:Ye(e.onKeyDown,v=>{[" ","Enter"].includes(v.key)&&s.onValueChange(r)}),onFocus:Ye(e.onFocus,()=>{const v=s.activationMode!=="manual";!m&&!i&&v&&s.onValueChange(r)})})})});w3.displayName=x3;var S3="TabsContent",j3=T.forwardRef((e,t)=>{const{__scopeTabs:n,value:r,forceMount:i,children:l,...s}=e,u=dS(S3,n),f=O3(u.baseId,r),d=_3(u.baseId,r),m=r===u.value,v=T.useRef(m);return T.useEffect(()=>{const g=requestAnimationFrame(()=>v.current=!1);return()=>cancelAnimationFrame(g)},[]),p.jsx(Pu,{present:i||m,children:({present:g})=>p.jsx(Ke.div,{"data-state":m?"active":"inactive","data-orientation":u.orientation,role:"tabpanel","aria-labelledby":f,hidden:!g,id:d,tabIndex:0,...s,ref:t,style:{...e.style,animationDuration:v.current?"0s":void 0},children:g&&l})})});j3.displayName=S3;function O3(e,t){return`${e}-trigger-${t}`}function _3(e,t){return`${e}-content-${t}`}var Gte=y3,Vte=b3,Yte=w3,Kte=j3;function A3({className:e,...t}){return p.jsx(Gte,{"data-slot":"tabs",className:We("flex flex-col gap-2",e),...t})}function E3({className:e,...t}){return p.jsx(Vte,{"data-slot":"tabs-list",className:We("bg-muted text-muted-foreground inline-flex h-9 w-fit items-center justify-center rounded-lg p-[3px]",e),...t})}function ul({className:e,...t}){return p.jsx(Yte,{"data-slot":"tabs-trigger",className:We("data-[state=active]:bg-background dark:data-[state=active]:text-foreground focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:outline-ring dark:data-[state=active]:border-input dark:data-[state=active]:bg-input/30 text-foreground dark:text-muted-foreground inline-flex h-[calc(100%-1px)] flex-1 items-center justify-center gap-1.5 rounded-md border border-transparent px-2 py-1 text-sm font-medium whitespace-nowrap transition-[color,box-shadow] focus-visible:ring-[3px] focus-visible:outline-1 disabled:pointer-events-none disabled:opacity-50 data-[state=active]:shadow-sm [&_svg]:pointer-events-none [&_svg]:shrink-0 [&_svg:not([class*='size-'])]:size-4",e),...t})}function fl({className:e,...t}){return p.jsx(Kte,{"data-slot":"tabs-content",className:We("flex-1 outline-none",e),...t})}function Xte(e,t=globalThis==null?void 0:globalThis.document){const n=ai(e);T.useEffect(()=>{const r=i=>{i.key==="Escape"&&n(i)};return t.addEventListener("keydown",r,{capture:!0}),()=>t.removeEventListener("keydown",r,{capture:!0})},[n,t])}var Wte="DismissableLayer",U1="dismissableLayer.update",Zte="dismissableLayer.pointerDownOutside",Qte="dismissableLayer.focusOutside",UP,T3=T.createContext({layers:new Set,layersWithOutsidePointerEventsDisabled:new Set,branches:new Set}),hS=T.forwardRef((e,t)=>{const{disableOutsidePointerEvents:n=!1,onEscapeKeyDown:r,onPointerDownOutside:i,onFocusOutside:l,onInteractOutside:s,onDismiss:u,...f}=e,d=T.useContext(T3),[m,v]=T.useState(null),g=(m==null?void 0:m.ownerDocument)??(globalThis==null?void 0:globalThis.document),[,x]=T.useState({}),j=St(t,P=>v(P)),w=Array.from(d.layers),[b]=[...d.layersWithOutsidePointerEventsDisabled].slice(-1),_=w.indexOf(b),O=m?w.indexOf(m):-1,E=d.layersWithOutsidePointerEventsDisabled.size>0,C=O>=_,A=tne(P=>{const D=P.target,L=[...d.branches].some(G=>G.contains(D));!C||L||(i==null||i(P),s==null||s(P),P.defaultPrevented||u==null||u())},g),N=nne(P=>{const D=P.target;[...d.branches].some(G=>G.contains(D))||(l==null||l(P),s==null||s(P),P.defaultPrevented||u==null||u())},g);return Xte(P=>{O===d.layers.size-1&&(r==null||r(P),!P.defaultPrevented&&u&&(P.preventDefault(),u()))},g),T.useEffect(()=>{if(m)return n&&(d.layersWithOutsidePointerEventsDisabled.size===0&&(UP=g.body.style.pointerEvents,g.body.style.pointerEvents="none"),d.layersWithOutsidePointerEventsDisabled.add(m)),d.layers.add(m),HP(),()=>{n&&d.layersWithOutsidePointerEventsDisabled.size===1&&(g.body.style.pointerEvents=UP)}},[m,g,n,d]),T.useEffect(()=>()=>{m&&(d.layers.delete(m),d.layersWithOutsidePointerEventsDisabled.delete(m),HP())},[m,d]),T.useEffect(()=>{const P=()=>x({});return document.addEventListener(U1,P),()=>document.removeEventListener(U1,P)},[]),p.jsx(Ke.div,{...f,ref:j,style:{pointerEvents:E?C?"auto":"none":void 0,...e.style},onFocusCapture:Ye(e.onFocusCapture,N.onFocusCapture),onBlurCapture:Ye(e.onBlurCapture,N.onBlurCapture),onPointerDownCapture:Ye(e.onPointerDownCapture,A.onPointerDownCapture)})});hS.displayName=Wte;var Jte="DismissableLayerBranch",ene=T.forwardRef((e,t)=>{const n=T.useContext(T3),r=T.useRef(null),i=St(t,r);return T.useEffect(()=>{const l=r.current;if(l)return n.branches.add(l),()=>{n.branches.delete(l)}},[n.branches]),p.jsx(Ke.div,{...e,ref:i})});ene.displayName=Jte;function tne(e,t=globalThis==null?void 0:globalThis.document){const n=ai(e),r=T.useRef(!1),i=T.useRef(()=>{});return T.useEffect(()=>{const l=u=>{if(u.target&&!r.current){let f=function(){C3(Zte,n,d,{discrete:!0})};const d={originalEvent:u};u.pointerType==="touch"?(t.removeEventListener("click",i.current),i.current=f,t.addEventListener("click",i.current,{once:!0})):f()}else t.removeEventListener("click",i.current);r.current=!1},s=window.setTimeout(()=>{t.addEventListener("pointerdown",l)},0);return()=>{window.clearTimeout(s),t.removeEventListener("pointerdown",l),t.removeEventListener("click",i.current)}},[t,n]),{onPointerDownCapture:()=>r.current=!0}}function nne(e,t=globalThis==null?void 0:globalThis.document){const n=ai(e),r=T.useRef(!1);return T.useEffect(()=>{const i=l=>{l.target&&!r.current&&C3(Qte,n,{originalEvent:l},{discrete:!1})};return t.addEventListener("focusin",i),()=>t.removeEventListener("focusin",i)},[t,n]),{onFocusCapture:()=>r.current=!0,onBlurCapture:()=>r.current=!1}}function HP(){const e=new CustomEvent(U1);document.dispatchEvent(e)}function C3(e,t,n,{discrete:r}){const i=n.originalEvent.target,l=new CustomEvent(e,{bubbles:!1,cancelable:!0,detail:n});t&&i.addEventListener(e,t,{once:!0}),r?yte(i,l):i.dispatchEvent(l)}var lx="focusScope.autoFocusOnMount",sx="focusScope.autoFocusOnUnmount",FP={bubbles:!1,cancelable:!0},rne="FocusScope",pS=T.forwardRef((e,t)=>{const{loop:n=!1,trapped:r=!1,onMountAutoFocus:i,onUnmountAutoFocus:l,...s}=e,[u,f]=T.useState(null),d=ai(i),m=ai(l),v=T.useRef(null),g=St(t,w=>f(w)),x=T.useRef({paused:!1,pause(){this.paused=!0},resume(){this.paused=!1}}).current;T.useEffect(()=>{if(r){let w=function(E){if(x.paused||!u)return;const C=E.target;u.contains(C)?v.current=C:Xa(v.current,{select:!0})},b=function(E){if(x.paused||!u)return;const C=E.relatedTarget;C!==null&&(u.contains(C)||Xa(v.current,{select:!0}))},_=function(E){if(document.activeElement===document.body)for(const A of E)A.removedNodes.length>0&&Xa(u)};document.addEventListener("focusin",w),document.addEventListener("focusout",b);const O=new MutationObserver(_);return u&&O.observe(u,{childList:!0,subtree:!0}),()=>{document.removeEventListener("focusin",w),document.removeEventListener("focusout",b),O.disconnect()}}},[r,u,x.paused]),T.useEffect(()=>{if(u){VP.add(x);const w=document.activeElement;if(!u.contains(w)){const _=new CustomEvent(lx,FP);u.addEventListener(lx,d),u.dispatchEvent(_),_.defaultPrevented||(ane(cne(N3(u)),{select:!0}),document.activeElement===w&&Xa(u))}return()=>{u.removeEventListener(lx,d),setTimeout(()=>{const _=new CustomEvent(sx,FP);u.addEventListener(sx,m),u.dispatchEvent(_),_.defaultPrevented||Xa(w??document.body,{select:!0}),u.removeEventListener(sx,m),VP.remove(x)},0)}}},[u,d,m,x]);const j=T.useCallback(w=>{if(!n&&!r||x.paused)return;const b=w.key==="Tab"&&!w.altKey&&!w.ctrlKey&&!w.metaKey,_=document.activeElement;if(b&&_){const O=w.currentTarget,[E,C]=ine(O);E&&C?!w.shiftKey&&_===C?(w.preventDefault(),n&&Xa(E,{select:!0})):w.shiftKey&&_===E&&(w.preventDefault(),n&&Xa(C,{select:!0})):_===O&&w.preventDefault()}},[n,r,x.paused]);return p.jsx(Ke.div,{tabIndex:-1,...s,ref:g,onKeyDown:j})});pS.displayName=rne;function ane(e,{select:t=!1}={}){const n=document.activeElement;for(const r of e)if(Xa(r,{select:t}),document.activeElement!==n)return}function ine(e){const t=N3(e),n=GP(t,e),r=GP(t.reverse(),e);return[n,r]}function N3(e){const t=[],n=document.createTreeWalker(e,NodeFilter.SHOW_ELEMENT,{acceptNode:r=>{const i=r.tagName==="INPUT"&&r.type==="hidden";return r.disabled||r.hidden||i?NodeFilter.FILTER_SKIP:r.tabIndex>=0?NodeFilter.FILTER_ACCEPT:NodeFilter.FILTER_SKIP}});for(;n.nextNode();)t.push(n.currentNode);return t}function GP(e,t){for(const n of e)if(!one(n,{upTo:t}))return n}function one(e,{upTo:t}){if(getComputedStyle(e).visibility==="hidden")return!0;for(;e;){if(t!==void 0&&e===t)return!1;if(getComputedStyle(e).display==="none")return!0;e=e.parentElement}return!1}function lne(e){return e instanceof HTMLInputElement&&"select"in e}function Xa(e,{select:t=!1}={}){if(e&&e.focus){const n=document.activeElement;e.focus({preventScroll:!0}),e!==n&&lne(e)&&t&&e.select()}}var VP=sne();function sne(){let e=[];return{add(t){const n=e[0];t!==n&&(n==null||n.pause()),e=YP(e,t),e.unshift(t)},remove(t){var n;e=YP(e,t),(n=e[0])==null||n.resume()}}}function YP(e,t){const n=[...e],r=n.indexOf(t);return r!==-1&&n.splice(r,1),n}function cne(e){return e.filter(t=>t.tagName!=="A")}var une="Portal",mS=T.forwardRef((e,t)=>{var u;const{container:n,...r}=e,[i,l]=T.useState(!1);un(()=>l(!0),[]);const s=n||i&&((u=globalThis==null?void 0:globalThis.document)==null?void 0:u.body);return s?r6.createPortal(p.jsx(Ke.div,{...r,ref:t}),s):null});mS.displayName=une;var cx=0;function M3(){T.useEffect(()=>{const e=document.querySelectorAll("[data-radix-focus-guard]");return document.body.insertAdjacentElement("afterbegin",e[0]??KP()),document.body.insertAdjacentElement("beforeend",e[1]??KP()),cx++,()=>{cx===1&&document.querySelectorAll("[data-radix-focus-guard]").forEach(t=>t.remove()),cx--}},[])}function KP(){const e=document.createElement("span");return e.setAttribute("data-radix-focus-guard",""),e.tabIndex=0,e.style.outline="none",e.style.opacity="0",e.style.position="fixed",e.style.pointerEvents="none",e}var Or=function(){return Or=Object.assign||function(t){for(var n,r=1,i=arguments.length;r<i;r++){n=arguments[r];for(var l in n)Object.prototype.hasOwnProperty.call(n,l)&&(t[l]=n[l])}return t},Or.apply(this,arguments)};function P3(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(e!=null&&typeof Object.getOwnPropertySymbols=="function")for(var i=0,r=Object.getOwnPropertySymbols(e);i<r.length;i++)t.indexOf(r[i])<0&&Object.prototype.propertyIsEnumerable.call(e,r[i])&&(n[r[i]]=e[r[i]]);return n}function fne(e,t,n){if(n||arguments.length===2)for(var r=0,i=t.length,l;r<i;r++)(l||!(r in t))&&(l||(l=Array.prototype.slice.call(t,0,r)),l[r]=t[r]);return e.concat(l||Array.prototype.slice.call(t))}var jd="right-scroll-bar-position",Od="width-before-scroll-bar",dne="with-scroll-bars-hidden",hne="--removed-body-scroll-bar-size";function ux(e,t){return typeof e=="function"?e(t):e&&(e.current=t),e}function pne(e,t){var n=T.useState(function(){return{value:e,callback:t,facade:{get current(){return n.value},set current(r){var i=n.value;i!==r&&(n.value=r,n.callback(r,i))}}}})[0];return n.callback=t,n.facade}var mne=typeof window<"u"?T.useLayoutEffect:T.useEffect,XP=new WeakMap;function vne(e,t){var n=pne(null,function(r){return e.forEach(function(i){return ux(i,r)})});return mne(function(){var r=XP.get(n);if(r){var i=new Set(r),l=new Set(e),s=n.current;i.forEach(function(u){l.has(u)||ux(u,null)}),l.forEach(function(u){i.has(u)||ux(u,s)})}XP.set(n,e)},[e]),n}function yne(e){return e}function gne(e,t){t===void 0&&(t=yne);var n=[],r=!1,i={read:function(){if(r)throw new Error("Sidecar: could not `read` from an `assigned` medium. `read` could be used only with `useMedium`.");return n.length?n[n.length-1]:e},useMedium:function(l){var s=t(l,r);return n.push(s),function(){n=n.filter(function(u){return u!==s})}},assignSyncMedium:function(l){for(r=!0;n.length;){var s=n;n=[],s.forEach(l)}n={push:function(u){return l(u)},filter:function(){return n}}},assignMedium:function(l){r=!0;var s=[];if(n.length){var u=n;n=[],u.forEach(l),s=n}var f=function(){var m=s;s=[],m.forEach(l)},d=function(){return Promise.resolve().then(f)};d(),n={push:function(m){s.push(m),d()},filter:function(m){return s=s.filter(m),n}}}};return i}function bne(e){e===void 0&&(e={});var t=gne(null);return t.options=Or({async:!0,ssr:!1},e),t}var R3=function(e){var t=e.sideCar,n=P3(e,["sideCar"]);if(!t)throw new Error("Sidecar: please provide `sideCar` property to import the right car");var r=t.read();if(!r)throw new Error("Sidecar medium not found");return T.createElement(r,Or({},n))};R3.isSideCarExport=!0;function xne(e,t){return e.useMedium(t),R3}var D3=bne(),fx=function(){},Tp=T.forwardRef(function(e,t){var n=T.useRef(null),r=T.useState({onScrollCapture:fx,onWheelCapture:fx,onTouchMoveCapture:fx}),i=r[0],l=r[1],s=e.forwardProps,u=e.children,f=e.className,d=e.removeScrollBar,m=e.enabled,v=e.shards,g=e.sideCar,x=e.noIsolation,j=e.inert,w=e.allowPinchZoom,b=e.as,_=b===void 0?"div":b,O=e.gapMode,E=P3(e,["forwardProps","children","className","removeScrollBar","enabled","shards","sideCar","noIsolation","inert","allowPinchZoom","as","gapMode"]),C=g,A=vne([n,t]),N=Or(Or({},E),i);return T.createElement(T.Fragment,null,m&&T.createElement(C,{sideCar:D3,removeScrollBar:d,shards:v,noIsolation:x,inert:j,setCallbacks:l,allowPinchZoom:!!w,lockRef:n,gapMode:O}),s?T.cloneElement(T.Children.only(u),Or(Or({},N),{ref:A})):T.createElement(_,Or({},N,{className:f,ref:A}),u))});Tp.defaultProps={enabled:!0,removeScrollBar:!0,inert:!1};Tp.classNames={fullWidth:Od,zeroRight:jd};var wne=function(){if(typeof __webpack_nonce__<"u")return __webpack_nonce__};function Sne(){if(!document)return null;var e=document.createElement("style");e.type="text/css";var t=wne();return t&&e.setAttribute("nonce",t),e}function jne(e,t){e.styleSheet?e.styleSheet.cssText=t:e.appendChild(document.createTextNode(t))}function One(e){var t=document.head||document.getElementsByTagName("head")[0];t.appendChild(e)}var _ne=function(){var e=0,t=null;return{add:function(n){e==0&&(t=Sne())&&(jne(t,n),One(t)),e++},remove:function(){e--,!e&&t&&(t.parentNode&&t.parentNode.removeChild(t),t=null)}}},Ane=function(){var e=_ne();return function(t,n){T.useEffect(function(){return e.add(t),function(){e.remove()}},[t&&n])}},k3=function(){var e=Ane(),t=function(n){var r=n.styles,i=n.dynamic;return e(r,i),null};return t},Ene={left:0,top:0,right:0,gap:0},dx=function(e){return parseInt(e||"",10)||0},Tne=function(e){var t=window.getComputedStyle(document.body),n=t[e==="padding"?"paddingLeft":"marginLeft"],r=t[e==="padding"?"paddingTop":"marginTop"],i=t[e==="padding"?"paddingRight":"marginRight"];return[dx(n),dx(r),dx(i)]},Cne=function(e){if(e===void 0&&(e="margin"),typeof window>"u")return Ene;var t=Tne(e),n=document.documentElement.clientWidth,r=window.innerWidth;return{left:t[0],top:t[1],right:t[2],gap:Math.max(0,r-n+t[2]-t[0])}},Nne=k3(),vl="data-scroll-locked",Mne=function(e,t,n,r){var i=e.left,l=e.top,s=e.right,u=e.gap;return n===void 0&&(n="margin"),`
-  .`.concat(dne,` {
-   overflow: hidden `).concat(r,`;
-   padding-right: `).concat(u,"px ").concat(r,`;
-  }
-  body[`).concat(vl,`] {
-    overflow: hidden `).concat(r,`;
-    overscroll-behavior: contain;
-    `).concat([t&&"position: relative ".concat(r,";"),n==="margin"&&`
-    padding-left: `.concat(i,`px;
-    padding-top: `).concat(l,`px;
-    padding-right: `).concat(s,`px;
-    margin-left:0;
-    margin-top:0;
-    margin-right: `).concat(u,"px ").concat(r,`;
-    `),n==="padding"&&"padding-right: ".concat(u,"px ").concat(r,";")].filter(Boolean).join(""),`
-  }
-  
-  .`).concat(jd,` {
-    right: `).concat(u,"px ").concat(r,`;
-  }
-  
-  .`).concat(Od,` {
-    margin-right: `).concat(u,"px ").concat(r,`;
-  }
-  
-  .`).concat(jd," .").concat(jd,` {
-    right: 0 `).concat(r,`;
-  }
-  
-  .`).concat(Od," .").concat(Od,` {
-    margin-right: 0 `).concat(r,`;
-  }
-  
-  body[`).concat(vl,`] {
-    `).concat(hne,": ").concat(u,`px;
-  }
-`)},WP=function(){var e=parseInt(document.body.getAttribute(vl)||"0",10);return isFinite(e)?e:0},Pne=function(){T.useEffect(function(){return document.body.setAttribute(vl,(WP()+1).toString()),function(){var e=WP()-1;e<=0?document.body.removeAttribute(vl):document.body.setAttribute(vl,e.toString())}},[])},Rne=function(e){var t=e.noRelative,n=e.noImportant,r=e.gapMode,i=r===void 0?"margin":r;Pne();var l=T.useMemo(function(){return Cne(i)},[i]);return T.createElement(Nne,{styles:Mne(l,!t,i,n?"":"!important")})},H1=!1;if(typeof window<"u")try{var pd=Object.defineProperty({},"passive",{get:function(){return H1=!0,!0}});window.addEventListener("test",pd,pd),window.removeEventListener("test",pd,pd)}catch{H1=!1}var nl=H1?{passive:!1}:!1,Dne=function(e){return e.tagName==="TEXTAREA"},$3=function(e,t){if(!(e instanceof Element))return!1;var n=window.getComputedStyle(e);return n[t]!=="hidden"&&!(n.overflowY===n.overflowX&&!Dne(e)&&n[t]==="visible")},kne=function(e){return $3(e,"overflowY")},$ne=function(e){return $3(e,"overflowX")},ZP=function(e,t){var n=t.ownerDocument,r=t;do{typeof ShadowRoot<"u"&&r instanceof ShadowRoot&&(r=r.host);var i=L3(e,r);if(i){var l=I3(e,r),s=l[1],u=l[2];if(s>u)return!0}r=r.parentNode}while(r&&r!==n.body);return!1},Lne=function(e){var t=e.scrollTop,n=e.scrollHeight,r=e.clientHeight;return[t,n,r]},Ine=function(e){var t=e.scrollLeft,n=e.scrollWidth,r=e.clientWidth;return[t,n,r]},L3=function(e,t){return e==="v"?kne(t):$ne(t)},I3=function(e,t){return e==="v"?Lne(t):Ine(t)},qne=function(e,t){return e==="h"&&t==="rtl"?-1:1},Bne=function(e,t,n,r,i){var l=qne(e,window.getComputedStyle(t).direction),s=l*r,u=n.target,f=t.contains(u),d=!1,m=s>0,v=0,g=0;do{var x=I3(e,u),j=x[0],w=x[1],b=x[2],_=w-b-l*j;(j||_)&&L3(e,u)&&(v+=_,g+=j),u instanceof ShadowRoot?u=u.host:u=u.parentNode}while(!f&&u!==document.body||f&&(t.contains(u)||t===u));return(m&&Math.abs(v)<1||!m&&Math.abs(g)<1)&&(d=!0),d},md=function(e){return"changedTouches"in e?[e.changedTouches[0].clientX,e.changedTouches[0].clientY]:[0,0]},QP=function(e){return[e.deltaX,e.deltaY]},JP=function(e){return e&&"current"in e?e.current:e},zne=function(e,t){return e[0]===t[0]&&e[1]===t[1]},Une=function(e){return`
-  .block-interactivity-`.concat(e,` {pointer-events: none;}
-  .allow-interactivity-`).concat(e,` {pointer-events: all;}
-`)},Hne=0,rl=[];function Fne(e){var t=T.useRef([]),n=T.useRef([0,0]),r=T.useRef(),i=T.useState(Hne++)[0],l=T.useState(k3)[0],s=T.useRef(e);T.useEffect(function(){s.current=e},[e]),T.useEffect(function(){if(e.inert){document.body.classList.add("block-interactivity-".concat(i));var w=fne([e.lockRef.current],(e.shards||[]).map(JP),!0).filter(Boolean);return w.forEach(function(b){return b.classList.add("allow-interactivity-".concat(i))}),function(){document.body.classList.remove("block-interactivity-".concat(i)),w.forEach(function(b){return b.classList.remove("allow-interactivity-".concat(i))})}}},[e.inert,e.lockRef.current,e.shards]);var u=T.useCallback(function(w,b){if("touches"in w&&w.touches.length===2||w.type==="wheel"&&w.ctrlKey)return!s.current.allowPinchZoom;var _=md(w),O=n.current,E="deltaX"in w?w.deltaX:O[0]-_[0],C="deltaY"in w?w.deltaY:O[1]-_[1],A,N=w.target,P=Math.abs(E)>Math.abs(C)?"h":"v";if("touches"in w&&P==="h"&&N.type==="range")return!1;var D=ZP(P,N);if(!D)return!0;if(D?A=P:(A=P==="v"?"h":"v",D=ZP(P,N)),!D)return!1;if(!r.current&&"changedTouches"in w&&(E||C)&&(r.current=A),!A)return!0;var L=r.current||A;return Bne(L,b,w,L==="h"?E:C)},[]),f=T.useCallback(function(w){var b=w;if(!(!rl.length||rl[rl.length-1]!==l)){var _="deltaY"in b?QP(b):md(b),O=t.current.filter(function(A){return A.name===b.type&&(A.target===b.target||b.target===A.shadowParent)&&zne(A.delta,_)})[0];if(O&&O.should){b.cancelable&&b.preventDefault();return}if(!O){var E=(s.current.shards||[]).map(JP).filter(Boolean).filter(function(A){return A.contains(b.target)}),C=E.length>0?u(b,E[0]):!s.current.noIsolation;C&&b.cancelable&&b.preventDefault()}}},[]),d=T.useCallback(function(w,b,_,O){var E={name:w,delta:b,target:_,should:O,shadowParent:Gne(_)};t.current.push(E),setTimeout(function(){t.current=t.current.filter(function(C){return C!==E})},1)},[]),m=T.useCallback(function(w){n.current=md(w),r.current=void 0},[]),v=T.useCallback(function(w){d(w.type,QP(w),w.target,u(w,e.lockRef.current))},[]),g=T.useCallback(function(w){d(w.type,md(w),w.target,u(w,e.lockRef.current))},[]);T.useEffect(function(){return rl.push(l),e.setCallbacks({onScrollCapture:v,onWheelCapture:v,onTouchMoveCapture:g}),document.addEventListener("wheel",f,nl),document.addEventListener("touchmove",f,nl),document.addEventListener("touchstart",m,nl),function(){rl=rl.filter(function(w){return w!==l}),document.removeEventListener("wheel",f,nl),document.removeEventListener("touchmove",f,nl),document.removeEventListener("touchstart",m,nl)}},[]);var x=e.removeScrollBar,j=e.inert;return T.createElement(T.Fragment,null,j?T.createElement(l,{styles:Une(i)}):null,x?T.createElement(Rne,{gapMode:e.gapMode}):null)}function Gne(e){for(var t=null;e!==null;)e instanceof ShadowRoot&&(t=e.host,e=e.host),e=e.parentNode;return t}const Vne=xne(D3,Fne);var vS=T.forwardRef(function(e,t){return T.createElement(Tp,Or({},e,{ref:t,sideCar:Vne}))});vS.classNames=Tp.classNames;var Yne=function(e){if(typeof document>"u")return null;var t=Array.isArray(e)?e[0]:e;return t.ownerDocument.body},al=new WeakMap,vd=new WeakMap,yd={},hx=0,q3=function(e){return e&&(e.host||q3(e.parentNode))},Kne=function(e,t){return t.map(function(n){if(e.contains(n))return n;var r=q3(n);return r&&e.contains(r)?r:(console.error("aria-hidden",n,"in not contained inside",e,". Doing nothing"),null)}).filter(function(n){return!!n})},Xne=function(e,t,n,r){var i=Kne(t,Array.isArray(e)?e:[e]);yd[n]||(yd[n]=new WeakMap);var l=yd[n],s=[],u=new Set,f=new Set(i),d=function(v){!v||u.has(v)||(u.add(v),d(v.parentNode))};i.forEach(d);var m=function(v){!v||f.has(v)||Array.prototype.forEach.call(v.children,function(g){if(u.has(g))m(g);else try{var x=g.getAttribute(r),j=x!==null&&x!=="false",w=(al.get(g)||0)+1,b=(l.get(g)||0)+1;al.set(g,w),l.set(g,b),s.push(g),w===1&&j&&vd.set(g,!0),b===1&&g.setAttribute(n,"true"),j||g.setAttribute(r,"true")}catch(_){console.error("aria-hidden: cannot operate on ",g,_)}})};return m(t),u.clear(),hx++,function(){s.forEach(function(v){var g=al.get(v)-1,x=l.get(v)-1;al.set(v,g),l.set(v,x),g||(vd.has(v)||v.removeAttribute(r),vd.delete(v)),x||v.removeAttribute(n)}),hx--,hx||(al=new WeakMap,al=new WeakMap,vd=new WeakMap,yd={})}},B3=function(e,t,n){n===void 0&&(n="data-aria-hidden");var r=Array.from(Array.isArray(e)?e:[e]),i=Yne(e);return i?(r.push.apply(r,Array.from(i.querySelectorAll("[aria-live]"))),Xne(r,i,n,"aria-hidden")):function(){return null}},Cp="Dialog",[z3,jie]=uo(Cp),[Wne,gr]=z3(Cp),U3=e=>{const{__scopeDialog:t,children:n,open:r,defaultOpen:i,onOpenChange:l,modal:s=!0}=e,u=T.useRef(null),f=T.useRef(null),[d,m]=Xl({prop:r,defaultProp:i??!1,onChange:l,caller:Cp});return p.jsx(Wne,{scope:t,triggerRef:u,contentRef:f,contentId:ri(),titleId:ri(),descriptionId:ri(),open:d,onOpenChange:m,onOpenToggle:T.useCallback(()=>m(v=>!v),[m]),modal:s,children:n})};U3.displayName=Cp;var H3="DialogTrigger",F3=T.forwardRef((e,t)=>{const{__scopeDialog:n,...r}=e,i=gr(H3,n),l=St(t,i.triggerRef);return p.jsx(Ke.button,{type:"button","aria-haspopup":"dialog","aria-expanded":i.open,"aria-controls":i.contentId,"data-state":bS(i.open),...r,ref:l,onClick:Ye(e.onClick,i.onOpenToggle)})});F3.displayName=H3;var yS="DialogPortal",[Zne,G3]=z3(yS,{forceMount:void 0}),V3=e=>{const{__scopeDialog:t,forceMount:n,children:r,container:i}=e,l=gr(yS,t);return p.jsx(Zne,{scope:t,forceMount:n,children:T.Children.map(r,s=>p.jsx(Pu,{present:n||l.open,children:p.jsx(mS,{asChild:!0,container:i,children:s})}))})};V3.displayName=yS;var _h="DialogOverlay",Y3=T.forwardRef((e,t)=>{const n=G3(_h,e.__scopeDialog),{forceMount:r=n.forceMount,...i}=e,l=gr(_h,e.__scopeDialog);return l.modal?p.jsx(Pu,{present:r||l.open,children:p.jsx(Jne,{...i,ref:t})}):null});Y3.displayName=_h;var Qne=Sl("DialogOverlay.RemoveScroll"),Jne=T.forwardRef((e,t)=>{const{__scopeDialog:n,...r}=e,i=gr(_h,n);return p.jsx(vS,{as:Qne,allowPinchZoom:!0,shards:[i.contentRef],children:p.jsx(Ke.div,{"data-state":bS(i.open),...r,ref:t,style:{pointerEvents:"auto",...r.style}})})}),to="DialogContent",K3=T.forwardRef((e,t)=>{const n=G3(to,e.__scopeDialog),{forceMount:r=n.forceMount,...i}=e,l=gr(to,e.__scopeDialog);return p.jsx(Pu,{present:r||l.open,children:l.modal?p.jsx(ere,{...i,ref:t}):p.jsx(tre,{...i,ref:t})})});K3.displayName=to;var ere=T.forwardRef((e,t)=>{const n=gr(to,e.__scopeDialog),r=T.useRef(null),i=St(t,n.contentRef,r);return T.useEffect(()=>{const l=r.current;if(l)return B3(l)},[]),p.jsx(X3,{...e,ref:i,trapFocus:n.open,disableOutsidePointerEvents:!0,onCloseAutoFocus:Ye(e.onCloseAutoFocus,l=>{var s;l.preventDefault(),(s=n.triggerRef.current)==null||s.focus()}),onPointerDownOutside:Ye(e.onPointerDownOutside,l=>{const s=l.detail.originalEvent,u=s.button===0&&s.ctrlKey===!0;(s.button===2||u)&&l.preventDefault()}),onFocusOutside:Ye(e.onFocusOutside,l=>l.preventDefault())})}),tre=T.forwardRef((e,t)=>{const n=gr(to,e.__scopeDialog),r=T.useRef(!1),i=T.useRef(!1);return p.jsx(X3,{...e,ref:t,trapFocus:!1,disableOutsidePointerEvents:!1,onCloseAutoFocus:l=>{var s,u;(s=e.onCloseAutoFocus)==null||s.call(e,l),l.defaultPrevented||(r.current||(u=n.triggerRef.current)==null||u.focus(),l.preventDefault()),r.current=!1,i.current=!1},onInteractOutside:l=>{var f,d;(f=e.onInteractOutside)==null||f.call(e,l),l.defaultPrevented||(r.current=!0,l.detail.originalEvent.type==="pointerdown"&&(i.current=!0));const s=l.target;((d=n.triggerRef.current)==null?void 0:d.contains(s))&&l.preventDefault(),l.detail.originalEvent.type==="focusin"&&i.current&&l.preventDefault()}})}),X3=T.forwardRef((e,t)=>{const{__scopeDialog:n,trapFocus:r,onOpenAutoFocus:i,onCloseAutoFocus:l,...s}=e,u=gr(to,n),f=T.useRef(null),d=St(t,f);return M3(),p.jsxs(p.Fragment,{children:[p.jsx(pS,{asChild:!0,loop:!0,trapped:r,onMountAutoFocus:i,onUnmountAutoFocus:l,children:p.jsx(hS,{role:"dialog",id:u.contentId,"aria-describedby":u.descriptionId,"aria-labelledby":u.titleId,"data-state":bS(u.open),...s,ref:d,onDismiss:()=>u.onOpenChange(!1)})}),p.jsxs(p.Fragment,{children:[p.jsx(nre,{titleId:u.titleId}),p.jsx(are,{contentRef:f,descriptionId:u.descriptionId})]})]})}),gS="DialogTitle",W3=T.forwardRef((e,t)=>{const{__scopeDialog:n,...r}=e,i=gr(gS,n);return p.jsx(Ke.h2,{id:i.titleId,...r,ref:t})});W3.displayName=gS;var Z3="DialogDescription",Q3=T.forwardRef((e,t)=>{const{__scopeDialog:n,...r}=e,i=gr(Z3,n);return p.jsx(Ke.p,{id:i.descriptionId,...r,ref:t})});Q3.displayName=Z3;var J3="DialogClose",e$=T.forwardRef((e,t)=>{const{__scopeDialog:n,...r}=e,i=gr(J3,n);return p.jsx(Ke.button,{type:"button",...r,ref:t,onClick:Ye(e.onClick,()=>i.onOpenChange(!1))})});e$.displayName=J3;function bS(e){return e?"open":"closed"}var t$="DialogTitleWarning",[Oie,n$]=xte(t$,{contentName:to,titleName:gS,docsSlug:"dialog"}),nre=({titleId:e})=>{const t=n$(t$),n=`\`${t.contentName}\` requires a \`${t.titleName}\` for the component to be accessible for screen reader users.
-
-If you want to hide the \`${t.titleName}\`, you can wrap it with our VisuallyHidden component.
-
-For more information, see https://radix-ui.com/primitives/docs/components/${t.docsSlug}`;return T.useEffect(()=>{e&&(document.getElementById(e)||console.error(n))},[n,e]),null},rre="DialogDescriptionWarning",are=({contentRef:e,descriptionId:t})=>{const r=`Warning: Missing \`Description\` or \`aria-describedby={undefined}\` for {${n$(rre).contentName}}.`;return T.useEffect(()=>{var l;const i=(l=e.current)==null?void 0:l.getAttribute("aria-describedby");t&&i&&(document.getElementById(t)||console.warn(r))},[r,e,t]),null},ire=U3,ore=F3,lre=V3,sre=Y3,cre=K3,ure=W3,fre=Q3,dre=e$;function Ah({...e}){return p.jsx(ire,{"data-slot":"dialog",...e})}function Eh({...e}){return p.jsx(ore,{"data-slot":"dialog-trigger",...e})}function hre({...e}){return p.jsx(lre,{"data-slot":"dialog-portal",...e})}function pre({className:e,...t}){return p.jsx(sre,{"data-slot":"dialog-overlay",className:We("data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 fixed inset-0 z-50 bg-black/50",e),...t})}function Th({className:e,children:t,...n}){return p.jsxs(hre,{"data-slot":"dialog-portal",children:[p.jsx(pre,{}),p.jsxs(cre,{"data-slot":"dialog-content",className:We("bg-background data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 data-[state=closed]:zoom-out-95 data-[state=open]:zoom-in-95 fixed top-[50%] left-[50%] z-50 grid w-full max-w-[calc(100%-2rem)] translate-x-[-50%] translate-y-[-50%] gap-4 rounded-lg border p-6 shadow-lg duration-200 sm:max-w-lg",e),...n,children:[t,p.jsxs(dre,{className:"ring-offset-background focus:ring-ring data-[state=open]:bg-accent data-[state=open]:text-muted-foreground absolute top-4 right-4 rounded-xs opacity-70 transition-opacity hover:opacity-100 focus:ring-2 focus:ring-offset-2 focus:outline-hidden disabled:pointer-events-none [&_svg]:pointer-events-none [&_svg]:shrink-0 [&_svg:not([class*='size-'])]:size-4",children:[p.jsx(Kz,{}),p.jsx("span",{className:"sr-only",children:"Close"})]})]})]})}function Ch({className:e,...t}){return p.jsx("div",{"data-slot":"dialog-header",className:We("flex flex-col gap-2 text-center sm:text-left",e),...t})}function Nh({className:e,...t}){return p.jsx(ure,{"data-slot":"dialog-title",className:We("text-lg leading-none font-semibold",e),...t})}function F1({className:e,...t}){return p.jsx(fre,{"data-slot":"dialog-description",className:We("text-muted-foreground text-sm",e),...t})}function sa({className:e,...t}){return p.jsx("div",{"data-slot":"table-container",className:"relative w-full overflow-x-auto",children:p.jsx("table",{"data-slot":"table",className:We("w-full caption-bottom text-sm",e),...t})})}function ca({className:e,...t}){return p.jsx("thead",{"data-slot":"table-header",className:We("[&_tr]:border-b",e),...t})}function ua({className:e,...t}){return p.jsx("tbody",{"data-slot":"table-body",className:We("[&_tr:last-child]:border-0",e),...t})}function Wt({className:e,...t}){return p.jsx("tr",{"data-slot":"table-row",className:We("hover:bg-muted/50 data-[state=selected]:bg-muted border-b transition-colors",e),...t})}function Oe({className:e,...t}){return p.jsx("th",{"data-slot":"table-head",className:We("text-foreground h-10 px-2 text-left align-middle font-medium whitespace-nowrap [&:has([role=checkbox])]:pr-0 [&>[role=checkbox]]:translate-y-[2px]",e),...t})}function _e({className:e,...t}){return p.jsx("td",{"data-slot":"table-cell",className:We("p-2 align-middle whitespace-nowrap [&:has([role=checkbox])]:pr-0 [&>[role=checkbox]]:translate-y-[2px]",e),...t})}const mre=({userRole:e})=>{const[t,n]=T.useState("clientes"),[r,i]=T.useState(""),[l,s]=T.useState(null),[u,f]=T.useState(!1),[d,m]=T.useState(!1),[v]=T.useState([{id:1,nombre:"Pedro Martínez",dni:"12345678A",telefono:"600123456",email:"mov.sinbarreras@gmail.com",direccion:"Calle Sol, 12",personaContacto:"Pedro",fechaRegistro:"2024-01-15",vehiculos:2,ultimaVisita:"2024-12-20"},{id:2,nombre:"Laura Gómez",dni:"98765432B",telefono:"699765432",email:"sorin.villamatica@gmail.com",direccion:"Av. Montaña, 33",personaContacto:"Laura",fechaRegistro:"2024-02-10",vehiculos:1,ultimaVisita:"2024-12-18"},{id:3,nombre:"Carlos Ruiz",dni:"45678912C",telefono:"655789123",email:"carlos.ruiz@email.com",direccion:"Plaza Mayor, 8",personaContacto:"Carlos",fechaRegistro:"2024-03-05",vehiculos:3,ultimaVisita:"2024-12-22"}]),[g]=T.useState([{id:1,clienteId:1,clienteNombre:"Pedro Martínez",marca:"BMW",modelo:"X3",año:2020,matricula:"1234ABC",bastidor:"WBAXG71020CD12345",kilometraje:45e3,fechaRegistro:"2024-01-15",ultimoServicio:"2024-12-20",estado:"activo"},{id:2,clienteId:1,clienteNombre:"Pedro Martínez",marca:"Mercedes",modelo:"C200",año:2019,matricula:"5678DEF",bastidor:"WDD2050461A123456",kilometraje:62e3,fechaRegistro:"2024-01-15",ultimoServicio:"2024-11-15",estado:"activo"},{id:3,clienteId:2,clienteNombre:"Laura Gómez",marca:"Audi",modelo:"A4",año:2021,matricula:"9012GHI",bastidor:"WAUZZZ8K2DA123456",kilometraje:28e3,fechaRegistro:"2024-02-10",ultimoServicio:"2024-12-18",estado:"en_taller"}]),x=v.filter(O=>O.nombre.toLowerCase().includes(r.toLowerCase())||O.dni.toLowerCase().includes(r.toLowerCase())||O.telefono.includes(r)),j=g.filter(O=>O.matricula.toLowerCase().includes(r.toLowerCase())||O.marca.toLowerCase().includes(r.toLowerCase())||O.modelo.toLowerCase().includes(r.toLowerCase())||O.clienteNombre.toLowerCase().includes(r.toLowerCase())),w=O=>{switch(O){case"activo":return"bg-green-100 text-green-800";case"en_taller":return"bg-blue-100 text-blue-800";case"inactivo":return"bg-gray-100 text-gray-800";default:return"bg-gray-100 text-gray-800"}},b=({client:O=null,onClose:E})=>{const[C,A]=T.useState({nombre:(O==null?void 0:O.nombre)||"",dni:(O==null?void 0:O.dni)||"",telefono:(O==null?void 0:O.telefono)||"",email:(O==null?void 0:O.email)||"",direccion:(O==null?void 0:O.direccion)||"",personaContacto:(O==null?void 0:O.personaContacto)||""}),N=P=>{P.preventDefault(),console.log("Guardando cliente:",C),E()};return p.jsxs("form",{onSubmit:N,className:"space-y-4",children:[p.jsxs("div",{className:"grid grid-cols-2 gap-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"nombre",children:"Nombre Completo"}),p.jsx(Ie,{id:"nombre",value:C.nombre,onChange:P=>A({...C,nombre:P.target.value}),required:!0})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"dni",children:"DNI"}),p.jsx(Ie,{id:"dni",value:C.dni,onChange:P=>A({...C,dni:P.target.value}),required:!0})]})]}),p.jsxs("div",{className:"grid grid-cols-2 gap-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"telefono",children:"Teléfono"}),p.jsx(Ie,{id:"telefono",value:C.telefono,onChange:P=>A({...C,telefono:P.target.value}),required:!0})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"email",children:"Email"}),p.jsx(Ie,{id:"email",type:"email",value:C.email,onChange:P=>A({...C,email:P.target.value}),required:!0})]})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"direccion",children:"Dirección"}),p.jsx(Ie,{id:"direccion",value:C.direccion,onChange:P=>A({...C,direccion:P.target.value}),required:!0})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"personaContacto",children:"Persona de Contacto"}),p.jsx(Ie,{id:"personaContacto",value:C.personaContacto,onChange:P=>A({...C,personaContacto:P.target.value}),required:!0})]}),p.jsxs("div",{className:"flex justify-end gap-2",children:[p.jsx(Pe,{type:"button",variant:"outline",onClick:E,children:"Cancelar"}),p.jsxs(Pe,{type:"submit",children:[O?"Actualizar":"Crear"," Cliente"]})]})]})},_=({vehicle:O=null,onClose:E})=>{const[C,A]=T.useState({clienteId:(O==null?void 0:O.clienteId)||"",marca:(O==null?void 0:O.marca)||"",modelo:(O==null?void 0:O.modelo)||"",año:(O==null?void 0:O.año)||"",matricula:(O==null?void 0:O.matricula)||"",bastidor:(O==null?void 0:O.bastidor)||"",kilometraje:(O==null?void 0:O.kilometraje)||""}),N=P=>{P.preventDefault(),console.log("Guardando vehículo:",C),E()};return p.jsxs("form",{onSubmit:N,className:"space-y-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"clienteId",children:"Cliente"}),p.jsxs("select",{id:"clienteId",className:"w-full p-2 border rounded-md",value:C.clienteId,onChange:P=>A({...C,clienteId:P.target.value}),required:!0,children:[p.jsx("option",{value:"",children:"Seleccionar cliente"}),v.map(P=>p.jsxs("option",{value:P.id,children:[P.nombre," - ",P.dni]},P.id))]})]}),p.jsxs("div",{className:"grid grid-cols-2 gap-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"marca",children:"Marca"}),p.jsx(Ie,{id:"marca",value:C.marca,onChange:P=>A({...C,marca:P.target.value}),required:!0})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"modelo",children:"Modelo"}),p.jsx(Ie,{id:"modelo",value:C.modelo,onChange:P=>A({...C,modelo:P.target.value}),required:!0})]})]}),p.jsxs("div",{className:"grid grid-cols-2 gap-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"año",children:"Año"}),p.jsx(Ie,{id:"año",type:"number",value:C.año,onChange:P=>A({...C,año:P.target.value}),required:!0})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"matricula",children:"Matrícula"}),p.jsx(Ie,{id:"matricula",value:C.matricula,onChange:P=>A({...C,matricula:P.target.value}),required:!0})]})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"bastidor",children:"Número de Bastidor"}),p.jsx(Ie,{id:"bastidor",value:C.bastidor,onChange:P=>A({...C,bastidor:P.target.value}),required:!0})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"kilometraje",children:"Kilometraje"}),p.jsx(Ie,{id:"kilometraje",type:"number",value:C.kilometraje,onChange:P=>A({...C,kilometraje:P.target.value}),required:!0})]}),p.jsxs("div",{className:"flex justify-end gap-2",children:[p.jsx(Pe,{type:"button",variant:"outline",onClick:E,children:"Cancelar"}),p.jsxs(Pe,{type:"submit",children:[O?"Actualizar":"Crear"," Vehículo"]})]})]})};return p.jsxs("div",{className:"space-y-6",children:[p.jsx("div",{className:"flex justify-between items-center",children:p.jsxs("div",{children:[p.jsx("h1",{className:"text-3xl font-bold text-gray-900",children:"Clientes y Vehículos"}),p.jsx("p",{className:"text-gray-600",children:"Gestión de clientes y sus vehículos"})]})}),p.jsxs("div",{className:"flex justify-between items-center gap-4",children:[p.jsxs("div",{className:"relative flex-1 max-w-md",children:[p.jsx(qh,{className:"absolute left-3 top-1/2 transform -translate-y-1/2 text-gray-400 w-4 h-4"}),p.jsx(Ie,{placeholder:"Buscar clientes o vehículos...",value:r,onChange:O=>i(O.target.value),className:"pl-10"})]}),p.jsxs("div",{className:"flex gap-2",children:[p.jsxs(Ah,{open:u,onOpenChange:f,children:[p.jsx(Eh,{asChild:!0,children:p.jsxs(Pe,{className:"flex items-center gap-2",children:[p.jsx(Ol,{className:"w-4 h-4"}),"Nuevo Cliente"]})}),p.jsxs(Th,{className:"max-w-2xl",children:[p.jsxs(Ch,{children:[p.jsx(Nh,{children:"Nuevo Cliente"}),p.jsx(F1,{children:"Registra un nuevo cliente en el sistema"})]}),p.jsx(b,{onClose:()=>f(!1)})]})]}),p.jsxs(Ah,{open:d,onOpenChange:m,children:[p.jsx(Eh,{asChild:!0,children:p.jsxs(Pe,{variant:"outline",className:"flex items-center gap-2",children:[p.jsx(Ol,{className:"w-4 h-4"}),"Nuevo Vehículo"]})}),p.jsxs(Th,{className:"max-w-2xl",children:[p.jsxs(Ch,{children:[p.jsx(Nh,{children:"Nuevo Vehículo"}),p.jsx(F1,{children:"Registra un nuevo vehículo en el sistema"})]}),p.jsx(_,{onClose:()=>m(!1)})]})]})]})]}),p.jsxs(A3,{value:t,onValueChange:n,children:[p.jsxs(E3,{children:[p.jsxs(ul,{value:"clientes",className:"flex items-center gap-2",children:[p.jsx(kc,{className:"w-4 h-4"}),"Clientes"]}),p.jsxs(ul,{value:"vehiculos",className:"flex items-center gap-2",children:[p.jsx(Ih,{className:"w-4 h-4"}),"Vehículos"]})]}),p.jsx(fl,{value:"clientes",className:"space-y-4",children:p.jsxs(De,{children:[p.jsxs(pt,{children:[p.jsx(mt,{children:"Lista de Clientes"}),p.jsxs(nn,{children:[x.length," clientes encontrados"]})]}),p.jsx(ke,{children:p.jsxs(sa,{children:[p.jsx(ca,{children:p.jsxs(Wt,{children:[p.jsx(Oe,{children:"Cliente"}),p.jsx(Oe,{children:"Contacto"}),p.jsx(Oe,{children:"Vehículos"}),p.jsx(Oe,{children:"Última Visita"}),p.jsx(Oe,{children:"Acciones"})]})}),p.jsx(ua,{children:x.map(O=>p.jsxs(Wt,{children:[p.jsx(_e,{children:p.jsxs("div",{children:[p.jsx("p",{className:"font-medium",children:O.nombre}),p.jsx("p",{className:"text-sm text-gray-500",children:O.dni})]})}),p.jsx(_e,{children:p.jsxs("div",{className:"space-y-1",children:[p.jsxs("div",{className:"flex items-center gap-1 text-sm",children:[p.jsx(Oz,{className:"w-3 h-3"}),O.telefono]}),p.jsxs("div",{className:"flex items-center gap-1 text-sm",children:[p.jsx(ei,{className:"w-3 h-3"}),O.email]}),p.jsxs("div",{className:"flex items-center gap-1 text-sm",children:[p.jsx(bz,{className:"w-3 h-3"}),O.direccion]})]})}),p.jsx(_e,{children:p.jsxs(Mt,{variant:"outline",children:[O.vehiculos," vehículo",O.vehiculos!==1?"s":""]})}),p.jsx(_e,{children:p.jsxs("div",{className:"flex items-center gap-1 text-sm",children:[p.jsx(Jn,{className:"w-3 h-3"}),new Date(O.ultimaVisita).toLocaleDateString("es-ES")]})}),p.jsx(_e,{children:p.jsxs("div",{className:"flex gap-2",children:[p.jsx(Pe,{size:"sm",variant:"outline",children:p.jsx(Ed,{className:"w-4 h-4"})}),p.jsx(Pe,{size:"sm",variant:"outline",children:p.jsx(Cd,{className:"w-4 h-4"})}),p.jsx(Pe,{size:"sm",variant:"outline",children:p.jsx(GA,{className:"w-4 h-4"})})]})})]},O.id))})]})})]})}),p.jsx(fl,{value:"vehiculos",className:"space-y-4",children:p.jsxs(De,{children:[p.jsxs(pt,{children:[p.jsx(mt,{children:"Lista de Vehículos"}),p.jsxs(nn,{children:[j.length," vehículos encontrados"]})]}),p.jsx(ke,{children:p.jsxs(sa,{children:[p.jsx(ca,{children:p.jsxs(Wt,{children:[p.jsx(Oe,{children:"Vehículo"}),p.jsx(Oe,{children:"Cliente"}),p.jsx(Oe,{children:"Kilometraje"}),p.jsx(Oe,{children:"Estado"}),p.jsx(Oe,{children:"Último Servicio"}),p.jsx(Oe,{children:"Acciones"})]})}),p.jsx(ua,{children:j.map(O=>p.jsxs(Wt,{children:[p.jsx(_e,{children:p.jsxs("div",{children:[p.jsxs("p",{className:"font-medium",children:[O.marca," ",O.modelo]}),p.jsxs("p",{className:"text-sm text-gray-500",children:[O.matricula," • ",O.año]})]})}),p.jsx(_e,{children:p.jsx("p",{className:"font-medium",children:O.clienteNombre})}),p.jsx(_e,{children:p.jsxs("p",{children:[O.kilometraje.toLocaleString()," km"]})}),p.jsx(_e,{children:p.jsx(Mt,{className:w(O.estado),children:O.estado.replace("_"," ")})}),p.jsx(_e,{children:p.jsxs("div",{className:"flex items-center gap-1 text-sm",children:[p.jsx(Jn,{className:"w-3 h-3"}),new Date(O.ultimoServicio).toLocaleDateString("es-ES")]})}),p.jsx(_e,{children:p.jsxs("div",{className:"flex gap-2",children:[p.jsx(Pe,{size:"sm",variant:"outline",children:p.jsx(Ed,{className:"w-4 h-4"})}),p.jsx(Pe,{size:"sm",variant:"outline",children:p.jsx(Cd,{className:"w-4 h-4"})}),p.jsx(Pe,{size:"sm",variant:"outline",children:p.jsx(GA,{className:"w-4 h-4"})})]})})]},O.id))})]})})]})})]})]})},Vi=T.forwardRef(({className:e,...t},n)=>p.jsx("textarea",{className:We("flex min-h-[80px] w-full rounded-md border border-input bg-background px-3 py-2 text-sm ring-offset-background placeholder:text-muted-foreground focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring focus-visible:ring-offset-2 disabled:cursor-not-allowed disabled:opacity-50",e),ref:n,...t}));Vi.displayName="Textarea";function eR(e,[t,n]){return Math.min(n,Math.max(t,e))}const vre=["top","right","bottom","left"],ii=Math.min,kn=Math.max,Mh=Math.round,gd=Math.floor,Tr=e=>({x:e,y:e}),yre={left:"right",right:"left",bottom:"top",top:"bottom"},gre={start:"end",end:"start"};function G1(e,t,n){return kn(e,ii(t,n))}function ya(e,t){return typeof e=="function"?e(t):e}function ga(e){return e.split("-")[0]}function cs(e){return e.split("-")[1]}function xS(e){return e==="x"?"y":"x"}function wS(e){return e==="y"?"height":"width"}function fa(e){return["top","bottom"].includes(ga(e))?"y":"x"}function SS(e){return xS(fa(e))}function bre(e,t,n){n===void 0&&(n=!1);const r=cs(e),i=SS(e),l=wS(i);let s=i==="x"?r===(n?"end":"start")?"right":"left":r==="start"?"bottom":"top";return t.reference[l]>t.floating[l]&&(s=Ph(s)),[s,Ph(s)]}function xre(e){const t=Ph(e);return[V1(e),t,V1(t)]}function V1(e){return e.replace(/start|end/g,t=>gre[t])}function wre(e,t,n){const r=["left","right"],i=["right","left"],l=["top","bottom"],s=["bottom","top"];switch(e){case"top":case"bottom":return n?t?i:r:t?r:i;case"left":case"right":return t?l:s;default:return[]}}function Sre(e,t,n,r){const i=cs(e);let l=wre(ga(e),n==="start",r);return i&&(l=l.map(s=>s+"-"+i),t&&(l=l.concat(l.map(V1)))),l}function Ph(e){return e.replace(/left|right|bottom|top/g,t=>yre[t])}function jre(e){return{top:0,right:0,bottom:0,left:0,...e}}function r$(e){return typeof e!="number"?jre(e):{top:e,right:e,bottom:e,left:e}}function Rh(e){const{x:t,y:n,width:r,height:i}=e;return{width:r,height:i,top:n,left:t,right:t+r,bottom:n+i,x:t,y:n}}function tR(e,t,n){let{reference:r,floating:i}=e;const l=fa(t),s=SS(t),u=wS(s),f=ga(t),d=l==="y",m=r.x+r.width/2-i.width/2,v=r.y+r.height/2-i.height/2,g=r[u]/2-i[u]/2;let x;switch(f){case"top":x={x:m,y:r.y-i.height};break;case"bottom":x={x:m,y:r.y+r.height};break;case"right":x={x:r.x+r.width,y:v};break;case"left":x={x:r.x-i.width,y:v};break;default:x={x:r.x,y:r.y}}switch(cs(t)){case"start":x[s]-=g*(n&&d?-1:1);break;case"end":x[s]+=g*(n&&d?-1:1);break}return x}const Ore=async(e,t,n)=>{const{placement:r="bottom",strategy:i="absolute",middleware:l=[],platform:s}=n,u=l.filter(Boolean),f=await(s.isRTL==null?void 0:s.isRTL(t));let d=await s.getElementRects({reference:e,floating:t,strategy:i}),{x:m,y:v}=tR(d,r,f),g=r,x={},j=0;for(let w=0;w<u.length;w++){const{name:b,fn:_}=u[w],{x:O,y:E,data:C,reset:A}=await _({x:m,y:v,initialPlacement:r,placement:g,strategy:i,middlewareData:x,rects:d,platform:s,elements:{reference:e,floating:t}});m=O??m,v=E??v,x={...x,[b]:{...x[b],...C}},A&&j<=50&&(j++,typeof A=="object"&&(A.placement&&(g=A.placement),A.rects&&(d=A.rects===!0?await s.getElementRects({reference:e,floating:t,strategy:i}):A.rects),{x:m,y:v}=tR(d,g,f)),w=-1)}return{x:m,y:v,placement:g,strategy:i,middlewareData:x}};async function yu(e,t){var n;t===void 0&&(t={});const{x:r,y:i,platform:l,rects:s,elements:u,strategy:f}=e,{boundary:d="clippingAncestors",rootBoundary:m="viewport",elementContext:v="floating",altBoundary:g=!1,padding:x=0}=ya(t,e),j=r$(x),b=u[g?v==="floating"?"reference":"floating":v],_=Rh(await l.getClippingRect({element:(n=await(l.isElement==null?void 0:l.isElement(b)))==null||n?b:b.contextElement||await(l.getDocumentElement==null?void 0:l.getDocumentElement(u.floating)),boundary:d,rootBoundary:m,strategy:f})),O=v==="floating"?{x:r,y:i,width:s.floating.width,height:s.floating.height}:s.reference,E=await(l.getOffsetParent==null?void 0:l.getOffsetParent(u.floating)),C=await(l.isElement==null?void 0:l.isElement(E))?await(l.getScale==null?void 0:l.getScale(E))||{x:1,y:1}:{x:1,y:1},A=Rh(l.convertOffsetParentRelativeRectToViewportRelativeRect?await l.convertOffsetParentRelativeRectToViewportRelativeRect({elements:u,rect:O,offsetParent:E,strategy:f}):O);return{top:(_.top-A.top+j.top)/C.y,bottom:(A.bottom-_.bottom+j.bottom)/C.y,left:(_.left-A.left+j.left)/C.x,right:(A.right-_.right+j.right)/C.x}}const _re=e=>({name:"arrow",options:e,async fn(t){const{x:n,y:r,placement:i,rects:l,platform:s,elements:u,middlewareData:f}=t,{element:d,padding:m=0}=ya(e,t)||{};if(d==null)return{};const v=r$(m),g={x:n,y:r},x=SS(i),j=wS(x),w=await s.getDimensions(d),b=x==="y",_=b?"top":"left",O=b?"bottom":"right",E=b?"clientHeight":"clientWidth",C=l.reference[j]+l.reference[x]-g[x]-l.floating[j],A=g[x]-l.reference[x],N=await(s.getOffsetParent==null?void 0:s.getOffsetParent(d));let P=N?N[E]:0;(!P||!await(s.isElement==null?void 0:s.isElement(N)))&&(P=u.floating[E]||l.floating[j]);const D=C/2-A/2,L=P/2-w[j]/2-1,G=ii(v[_],L),I=ii(v[O],L),H=G,V=P-w[j]-I,Z=P/2-w[j]/2+D,Y=G1(H,Z,V),$=!f.arrow&&cs(i)!=null&&Z!==Y&&l.reference[j]/2-(Z<H?G:I)-w[j]/2<0,U=$?Z<H?Z-H:Z-V:0;return{[x]:g[x]+U,data:{[x]:Y,centerOffset:Z-Y-U,...$&&{alignmentOffset:U}},reset:$}}}),Are=function(e){return e===void 0&&(e={}),{name:"flip",options:e,async fn(t){var n,r;const{placement:i,middlewareData:l,rects:s,initialPlacement:u,platform:f,elements:d}=t,{mainAxis:m=!0,crossAxis:v=!0,fallbackPlacements:g,fallbackStrategy:x="bestFit",fallbackAxisSideDirection:j="none",flipAlignment:w=!0,...b}=ya(e,t);if((n=l.arrow)!=null&&n.alignmentOffset)return{};const _=ga(i),O=fa(u),E=ga(u)===u,C=await(f.isRTL==null?void 0:f.isRTL(d.floating)),A=g||(E||!w?[Ph(u)]:xre(u)),N=j!=="none";!g&&N&&A.push(...Sre(u,w,j,C));const P=[u,...A],D=await yu(t,b),L=[];let G=((r=l.flip)==null?void 0:r.overflows)||[];if(m&&L.push(D[_]),v){const Y=bre(i,s,C);L.push(D[Y[0]],D[Y[1]])}if(G=[...G,{placement:i,overflows:L}],!L.every(Y=>Y<=0)){var I,H;const Y=(((I=l.flip)==null?void 0:I.index)||0)+1,$=P[Y];if($){var V;const B=v==="alignment"?O!==fa($):!1,re=((V=G[0])==null?void 0:V.overflows[0])>0;if(!B||re)return{data:{index:Y,overflows:G},reset:{placement:$}}}let U=(H=G.filter(B=>B.overflows[0]<=0).sort((B,re)=>B.overflows[1]-re.overflows[1])[0])==null?void 0:H.placement;if(!U)switch(x){case"bestFit":{var Z;const B=(Z=G.filter(re=>{if(N){const k=fa(re.placement);return k===O||k==="y"}return!0}).map(re=>[re.placement,re.overflows.filter(k=>k>0).reduce((k,X)=>k+X,0)]).sort((re,k)=>re[1]-k[1])[0])==null?void 0:Z[0];B&&(U=B);break}case"initialPlacement":U=u;break}if(i!==U)return{reset:{placement:U}}}return{}}}};function nR(e,t){return{top:e.top-t.height,right:e.right-t.width,bottom:e.bottom-t.height,left:e.left-t.width}}function rR(e){return vre.some(t=>e[t]>=0)}const Ere=function(e){return e===void 0&&(e={}),{name:"hide",options:e,async fn(t){const{rects:n}=t,{strategy:r="referenceHidden",...i}=ya(e,t);switch(r){case"referenceHidden":{const l=await yu(t,{...i,elementContext:"reference"}),s=nR(l,n.reference);return{data:{referenceHiddenOffsets:s,referenceHidden:rR(s)}}}case"escaped":{const l=await yu(t,{...i,altBoundary:!0}),s=nR(l,n.floating);return{data:{escapedOffsets:s,escaped:rR(s)}}}default:return{}}}}};async function Tre(e,t){const{placement:n,platform:r,elements:i}=e,l=await(r.isRTL==null?void 0:r.isRTL(i.floating)),s=ga(n),u=cs(n),f=fa(n)==="y",d=["left","top"].includes(s)?-1:1,m=l&&f?-1:1,v=ya(t,e);let{mainAxis:g,crossAxis:x,alignmentAxis:j}=typeof v=="number"?{mainAxis:v,crossAxis:0,alignmentAxis:null}:{mainAxis:v.mainAxis||0,crossAxis:v.crossAxis||0,alignmentAxis:v.alignmentAxis};return u&&typeof j=="number"&&(x=u==="end"?j*-1:j),f?{x:x*m,y:g*d}:{x:g*d,y:x*m}}const Cre=function(e){return e===void 0&&(e=0),{name:"offset",options:e,async fn(t){var n,r;const{x:i,y:l,placement:s,middlewareData:u}=t,f=await Tre(t,e);return s===((n=u.offset)==null?void 0:n.placement)&&(r=u.arrow)!=null&&r.alignmentOffset?{}:{x:i+f.x,y:l+f.y,data:{...f,placement:s}}}}},Nre=function(e){return e===void 0&&(e={}),{name:"shift",options:e,async fn(t){const{x:n,y:r,placement:i}=t,{mainAxis:l=!0,crossAxis:s=!1,limiter:u={fn:b=>{let{x:_,y:O}=b;return{x:_,y:O}}},...f}=ya(e,t),d={x:n,y:r},m=await yu(t,f),v=fa(ga(i)),g=xS(v);let x=d[g],j=d[v];if(l){const b=g==="y"?"top":"left",_=g==="y"?"bottom":"right",O=x+m[b],E=x-m[_];x=G1(O,x,E)}if(s){const b=v==="y"?"top":"left",_=v==="y"?"bottom":"right",O=j+m[b],E=j-m[_];j=G1(O,j,E)}const w=u.fn({...t,[g]:x,[v]:j});return{...w,data:{x:w.x-n,y:w.y-r,enabled:{[g]:l,[v]:s}}}}}},Mre=function(e){return e===void 0&&(e={}),{options:e,fn(t){const{x:n,y:r,placement:i,rects:l,middlewareData:s}=t,{offset:u=0,mainAxis:f=!0,crossAxis:d=!0}=ya(e,t),m={x:n,y:r},v=fa(i),g=xS(v);let x=m[g],j=m[v];const w=ya(u,t),b=typeof w=="number"?{mainAxis:w,crossAxis:0}:{mainAxis:0,crossAxis:0,...w};if(f){const E=g==="y"?"height":"width",C=l.reference[g]-l.floating[E]+b.mainAxis,A=l.reference[g]+l.reference[E]-b.mainAxis;x<C?x=C:x>A&&(x=A)}if(d){var _,O;const E=g==="y"?"width":"height",C=["top","left"].includes(ga(i)),A=l.reference[v]-l.floating[E]+(C&&((_=s.offset)==null?void 0:_[v])||0)+(C?0:b.crossAxis),N=l.reference[v]+l.reference[E]+(C?0:((O=s.offset)==null?void 0:O[v])||0)-(C?b.crossAxis:0);j<A?j=A:j>N&&(j=N)}return{[g]:x,[v]:j}}}},Pre=function(e){return e===void 0&&(e={}),{name:"size",options:e,async fn(t){var n,r;const{placement:i,rects:l,platform:s,elements:u}=t,{apply:f=()=>{},...d}=ya(e,t),m=await yu(t,d),v=ga(i),g=cs(i),x=fa(i)==="y",{width:j,height:w}=l.floating;let b,_;v==="top"||v==="bottom"?(b=v,_=g===(await(s.isRTL==null?void 0:s.isRTL(u.floating))?"start":"end")?"left":"right"):(_=v,b=g==="end"?"top":"bottom");const O=w-m.top-m.bottom,E=j-m.left-m.right,C=ii(w-m[b],O),A=ii(j-m[_],E),N=!t.middlewareData.shift;let P=C,D=A;if((n=t.middlewareData.shift)!=null&&n.enabled.x&&(D=E),(r=t.middlewareData.shift)!=null&&r.enabled.y&&(P=O),N&&!g){const G=kn(m.left,0),I=kn(m.right,0),H=kn(m.top,0),V=kn(m.bottom,0);x?D=j-2*(G!==0||I!==0?G+I:kn(m.left,m.right)):P=w-2*(H!==0||V!==0?H+V:kn(m.top,m.bottom))}await f({...t,availableWidth:D,availableHeight:P});const L=await s.getDimensions(u.floating);return j!==L.width||w!==L.height?{reset:{rects:!0}}:{}}}};function Np(){return typeof window<"u"}function us(e){return a$(e)?(e.nodeName||"").toLowerCase():"#document"}function In(e){var t;return(e==null||(t=e.ownerDocument)==null?void 0:t.defaultView)||window}function kr(e){var t;return(t=(a$(e)?e.ownerDocument:e.document)||window.document)==null?void 0:t.documentElement}function a$(e){return Np()?e instanceof Node||e instanceof In(e).Node:!1}function mr(e){return Np()?e instanceof Element||e instanceof In(e).Element:!1}function Mr(e){return Np()?e instanceof HTMLElement||e instanceof In(e).HTMLElement:!1}function aR(e){return!Np()||typeof ShadowRoot>"u"?!1:e instanceof ShadowRoot||e instanceof In(e).ShadowRoot}function Ru(e){const{overflow:t,overflowX:n,overflowY:r,display:i}=vr(e);return/auto|scroll|overlay|hidden|clip/.test(t+r+n)&&!["inline","contents"].includes(i)}function Rre(e){return["table","td","th"].includes(us(e))}function Mp(e){return[":popover-open",":modal"].some(t=>{try{return e.matches(t)}catch{return!1}})}function jS(e){const t=OS(),n=mr(e)?vr(e):e;return["transform","translate","scale","rotate","perspective"].some(r=>n[r]?n[r]!=="none":!1)||(n.containerType?n.containerType!=="normal":!1)||!t&&(n.backdropFilter?n.backdropFilter!=="none":!1)||!t&&(n.filter?n.filter!=="none":!1)||["transform","translate","scale","rotate","perspective","filter"].some(r=>(n.willChange||"").includes(r))||["paint","layout","strict","content"].some(r=>(n.contain||"").includes(r))}function Dre(e){let t=oi(e);for(;Mr(t)&&!Wl(t);){if(jS(t))return t;if(Mp(t))return null;t=oi(t)}return null}function OS(){return typeof CSS>"u"||!CSS.supports?!1:CSS.supports("-webkit-backdrop-filter","none")}function Wl(e){return["html","body","#document"].includes(us(e))}function vr(e){return In(e).getComputedStyle(e)}function Pp(e){return mr(e)?{scrollLeft:e.scrollLeft,scrollTop:e.scrollTop}:{scrollLeft:e.scrollX,scrollTop:e.scrollY}}function oi(e){if(us(e)==="html")return e;const t=e.assignedSlot||e.parentNode||aR(e)&&e.host||kr(e);return aR(t)?t.host:t}function i$(e){const t=oi(e);return Wl(t)?e.ownerDocument?e.ownerDocument.body:e.body:Mr(t)&&Ru(t)?t:i$(t)}function gu(e,t,n){var r;t===void 0&&(t=[]),n===void 0&&(n=!0);const i=i$(e),l=i===((r=e.ownerDocument)==null?void 0:r.body),s=In(i);if(l){const u=Y1(s);return t.concat(s,s.visualViewport||[],Ru(i)?i:[],u&&n?gu(u):[])}return t.concat(i,gu(i,[],n))}function Y1(e){return e.parent&&Object.getPrototypeOf(e.parent)?e.frameElement:null}function o$(e){const t=vr(e);let n=parseFloat(t.width)||0,r=parseFloat(t.height)||0;const i=Mr(e),l=i?e.offsetWidth:n,s=i?e.offsetHeight:r,u=Mh(n)!==l||Mh(r)!==s;return u&&(n=l,r=s),{width:n,height:r,$:u}}function _S(e){return mr(e)?e:e.contextElement}function yl(e){const t=_S(e);if(!Mr(t))return Tr(1);const n=t.getBoundingClientRect(),{width:r,height:i,$:l}=o$(t);let s=(l?Mh(n.width):n.width)/r,u=(l?Mh(n.height):n.height)/i;return(!s||!Number.isFinite(s))&&(s=1),(!u||!Number.isFinite(u))&&(u=1),{x:s,y:u}}const kre=Tr(0);function l$(e){const t=In(e);return!OS()||!t.visualViewport?kre:{x:t.visualViewport.offsetLeft,y:t.visualViewport.offsetTop}}function $re(e,t,n){return t===void 0&&(t=!1),!n||t&&n!==In(e)?!1:t}function no(e,t,n,r){t===void 0&&(t=!1),n===void 0&&(n=!1);const i=e.getBoundingClientRect(),l=_S(e);let s=Tr(1);t&&(r?mr(r)&&(s=yl(r)):s=yl(e));const u=$re(l,n,r)?l$(l):Tr(0);let f=(i.left+u.x)/s.x,d=(i.top+u.y)/s.y,m=i.width/s.x,v=i.height/s.y;if(l){const g=In(l),x=r&&mr(r)?In(r):r;let j=g,w=Y1(j);for(;w&&r&&x!==j;){const b=yl(w),_=w.getBoundingClientRect(),O=vr(w),E=_.left+(w.clientLeft+parseFloat(O.paddingLeft))*b.x,C=_.top+(w.clientTop+parseFloat(O.paddingTop))*b.y;f*=b.x,d*=b.y,m*=b.x,v*=b.y,f+=E,d+=C,j=In(w),w=Y1(j)}}return Rh({width:m,height:v,x:f,y:d})}function AS(e,t){const n=Pp(e).scrollLeft;return t?t.left+n:no(kr(e)).left+n}function s$(e,t,n){n===void 0&&(n=!1);const r=e.getBoundingClientRect(),i=r.left+t.scrollLeft-(n?0:AS(e,r)),l=r.top+t.scrollTop;return{x:i,y:l}}function Lre(e){let{elements:t,rect:n,offsetParent:r,strategy:i}=e;const l=i==="fixed",s=kr(r),u=t?Mp(t.floating):!1;if(r===s||u&&l)return n;let f={scrollLeft:0,scrollTop:0},d=Tr(1);const m=Tr(0),v=Mr(r);if((v||!v&&!l)&&((us(r)!=="body"||Ru(s))&&(f=Pp(r)),Mr(r))){const x=no(r);d=yl(r),m.x=x.x+r.clientLeft,m.y=x.y+r.clientTop}const g=s&&!v&&!l?s$(s,f,!0):Tr(0);return{width:n.width*d.x,height:n.height*d.y,x:n.x*d.x-f.scrollLeft*d.x+m.x+g.x,y:n.y*d.y-f.scrollTop*d.y+m.y+g.y}}function Ire(e){return Array.from(e.getClientRects())}function qre(e){const t=kr(e),n=Pp(e),r=e.ownerDocument.body,i=kn(t.scrollWidth,t.clientWidth,r.scrollWidth,r.clientWidth),l=kn(t.scrollHeight,t.clientHeight,r.scrollHeight,r.clientHeight);let s=-n.scrollLeft+AS(e);const u=-n.scrollTop;return vr(r).direction==="rtl"&&(s+=kn(t.clientWidth,r.clientWidth)-i),{width:i,height:l,x:s,y:u}}function Bre(e,t){const n=In(e),r=kr(e),i=n.visualViewport;let l=r.clientWidth,s=r.clientHeight,u=0,f=0;if(i){l=i.width,s=i.height;const d=OS();(!d||d&&t==="fixed")&&(u=i.offsetLeft,f=i.offsetTop)}return{width:l,height:s,x:u,y:f}}function zre(e,t){const n=no(e,!0,t==="fixed"),r=n.top+e.clientTop,i=n.left+e.clientLeft,l=Mr(e)?yl(e):Tr(1),s=e.clientWidth*l.x,u=e.clientHeight*l.y,f=i*l.x,d=r*l.y;return{width:s,height:u,x:f,y:d}}function iR(e,t,n){let r;if(t==="viewport")r=Bre(e,n);else if(t==="document")r=qre(kr(e));else if(mr(t))r=zre(t,n);else{const i=l$(e);r={x:t.x-i.x,y:t.y-i.y,width:t.width,height:t.height}}return Rh(r)}function c$(e,t){const n=oi(e);return n===t||!mr(n)||Wl(n)?!1:vr(n).position==="fixed"||c$(n,t)}function Ure(e,t){const n=t.get(e);if(n)return n;let r=gu(e,[],!1).filter(u=>mr(u)&&us(u)!=="body"),i=null;const l=vr(e).position==="fixed";let s=l?oi(e):e;for(;mr(s)&&!Wl(s);){const u=vr(s),f=jS(s);!f&&u.position==="fixed"&&(i=null),(l?!f&&!i:!f&&u.position==="static"&&!!i&&["absolute","fixed"].includes(i.position)||Ru(s)&&!f&&c$(e,s))?r=r.filter(m=>m!==s):i=u,s=oi(s)}return t.set(e,r),r}function Hre(e){let{element:t,boundary:n,rootBoundary:r,strategy:i}=e;const s=[...n==="clippingAncestors"?Mp(t)?[]:Ure(t,this._c):[].concat(n),r],u=s[0],f=s.reduce((d,m)=>{const v=iR(t,m,i);return d.top=kn(v.top,d.top),d.right=ii(v.right,d.right),d.bottom=ii(v.bottom,d.bottom),d.left=kn(v.left,d.left),d},iR(t,u,i));return{width:f.right-f.left,height:f.bottom-f.top,x:f.left,y:f.top}}function Fre(e){const{width:t,height:n}=o$(e);return{width:t,height:n}}function Gre(e,t,n){const r=Mr(t),i=kr(t),l=n==="fixed",s=no(e,!0,l,t);let u={scrollLeft:0,scrollTop:0};const f=Tr(0);function d(){f.x=AS(i)}if(r||!r&&!l)if((us(t)!=="body"||Ru(i))&&(u=Pp(t)),r){const x=no(t,!0,l,t);f.x=x.x+t.clientLeft,f.y=x.y+t.clientTop}else i&&d();l&&!r&&i&&d();const m=i&&!r&&!l?s$(i,u):Tr(0),v=s.left+u.scrollLeft-f.x-m.x,g=s.top+u.scrollTop-f.y-m.y;return{x:v,y:g,width:s.width,height:s.height}}function px(e){return vr(e).position==="static"}function oR(e,t){if(!Mr(e)||vr(e).position==="fixed")return null;if(t)return t(e);let n=e.offsetParent;return kr(e)===n&&(n=n.ownerDocument.body),n}function u$(e,t){const n=In(e);if(Mp(e))return n;if(!Mr(e)){let i=oi(e);for(;i&&!Wl(i);){if(mr(i)&&!px(i))return i;i=oi(i)}return n}let r=oR(e,t);for(;r&&Rre(r)&&px(r);)r=oR(r,t);return r&&Wl(r)&&px(r)&&!jS(r)?n:r||Dre(e)||n}const Vre=async function(e){const t=this.getOffsetParent||u$,n=this.getDimensions,r=await n(e.floating);return{reference:Gre(e.reference,await t(e.floating),e.strategy),floating:{x:0,y:0,width:r.width,height:r.height}}};function Yre(e){return vr(e).direction==="rtl"}const Kre={convertOffsetParentRelativeRectToViewportRelativeRect:Lre,getDocumentElement:kr,getClippingRect:Hre,getOffsetParent:u$,getElementRects:Vre,getClientRects:Ire,getDimensions:Fre,getScale:yl,isElement:mr,isRTL:Yre};function f$(e,t){return e.x===t.x&&e.y===t.y&&e.width===t.width&&e.height===t.height}function Xre(e,t){let n=null,r;const i=kr(e);function l(){var u;clearTimeout(r),(u=n)==null||u.disconnect(),n=null}function s(u,f){u===void 0&&(u=!1),f===void 0&&(f=1),l();const d=e.getBoundingClientRect(),{left:m,top:v,width:g,height:x}=d;if(u||t(),!g||!x)return;const j=gd(v),w=gd(i.clientWidth-(m+g)),b=gd(i.clientHeight-(v+x)),_=gd(m),E={rootMargin:-j+"px "+-w+"px "+-b+"px "+-_+"px",threshold:kn(0,ii(1,f))||1};let C=!0;function A(N){const P=N[0].intersectionRatio;if(P!==f){if(!C)return s();P?s(!1,P):r=setTimeout(()=>{s(!1,1e-7)},1e3)}P===1&&!f$(d,e.getBoundingClientRect())&&s(),C=!1}try{n=new IntersectionObserver(A,{...E,root:i.ownerDocument})}catch{n=new IntersectionObserver(A,E)}n.observe(e)}return s(!0),l}function Wre(e,t,n,r){r===void 0&&(r={});const{ancestorScroll:i=!0,ancestorResize:l=!0,elementResize:s=typeof ResizeObserver=="function",layoutShift:u=typeof IntersectionObserver=="function",animationFrame:f=!1}=r,d=_S(e),m=i||l?[...d?gu(d):[],...gu(t)]:[];m.forEach(_=>{i&&_.addEventListener("scroll",n,{passive:!0}),l&&_.addEventListener("resize",n)});const v=d&&u?Xre(d,n):null;let g=-1,x=null;s&&(x=new ResizeObserver(_=>{let[O]=_;O&&O.target===d&&x&&(x.unobserve(t),cancelAnimationFrame(g),g=requestAnimationFrame(()=>{var E;(E=x)==null||E.observe(t)})),n()}),d&&!f&&x.observe(d),x.observe(t));let j,w=f?no(e):null;f&&b();function b(){const _=no(e);w&&!f$(w,_)&&n(),w=_,j=requestAnimationFrame(b)}return n(),()=>{var _;m.forEach(O=>{i&&O.removeEventListener("scroll",n),l&&O.removeEventListener("resize",n)}),v==null||v(),(_=x)==null||_.disconnect(),x=null,f&&cancelAnimationFrame(j)}}const Zre=Cre,Qre=Nre,Jre=Are,eae=Pre,tae=Ere,lR=_re,nae=Mre,rae=(e,t,n)=>{const r=new Map,i={platform:Kre,...n},l={...i.platform,_c:r};return Ore(e,t,{...i,platform:l})};var _d=typeof document<"u"?T.useLayoutEffect:T.useEffect;function Dh(e,t){if(e===t)return!0;if(typeof e!=typeof t)return!1;if(typeof e=="function"&&e.toString()===t.toString())return!0;let n,r,i;if(e&&t&&typeof e=="object"){if(Array.isArray(e)){if(n=e.length,n!==t.length)return!1;for(r=n;r--!==0;)if(!Dh(e[r],t[r]))return!1;return!0}if(i=Object.keys(e),n=i.length,n!==Object.keys(t).length)return!1;for(r=n;r--!==0;)if(!{}.hasOwnProperty.call(t,i[r]))return!1;for(r=n;r--!==0;){const l=i[r];if(!(l==="_owner"&&e.$$typeof)&&!Dh(e[l],t[l]))return!1}return!0}return e!==e&&t!==t}function d$(e){return typeof window>"u"?1:(e.ownerDocument.defaultView||window).devicePixelRatio||1}function sR(e,t){const n=d$(e);return Math.round(t*n)/n}function mx(e){const t=T.useRef(e);return _d(()=>{t.current=e}),t}function aae(e){e===void 0&&(e={});const{placement:t="bottom",strategy:n="absolute",middleware:r=[],platform:i,elements:{reference:l,floating:s}={},transform:u=!0,whileElementsMounted:f,open:d}=e,[m,v]=T.useState({x:0,y:0,strategy:n,placement:t,middlewareData:{},isPositioned:!1}),[g,x]=T.useState(r);Dh(g,r)||x(r);const[j,w]=T.useState(null),[b,_]=T.useState(null),O=T.useCallback(B=>{B!==N.current&&(N.current=B,w(B))},[]),E=T.useCallback(B=>{B!==P.current&&(P.current=B,_(B))},[]),C=l||j,A=s||b,N=T.useRef(null),P=T.useRef(null),D=T.useRef(m),L=f!=null,G=mx(f),I=mx(i),H=mx(d),V=T.useCallback(()=>{if(!N.current||!P.current)return;const B={placement:t,strategy:n,middleware:g};I.current&&(B.platform=I.current),rae(N.current,P.current,B).then(re=>{const k={...re,isPositioned:H.current!==!1};Z.current&&!Dh(D.current,k)&&(D.current=k,Su.flushSync(()=>{v(k)}))})},[g,t,n,I,H]);_d(()=>{d===!1&&D.current.isPositioned&&(D.current.isPositioned=!1,v(B=>({...B,isPositioned:!1})))},[d]);const Z=T.useRef(!1);_d(()=>(Z.current=!0,()=>{Z.current=!1}),[]),_d(()=>{if(C&&(N.current=C),A&&(P.current=A),C&&A){if(G.current)return G.current(C,A,V);V()}},[C,A,V,G,L]);const Y=T.useMemo(()=>({reference:N,floating:P,setReference:O,setFloating:E}),[O,E]),$=T.useMemo(()=>({reference:C,floating:A}),[C,A]),U=T.useMemo(()=>{const B={position:n,left:0,top:0};if(!$.floating)return B;const re=sR($.floating,m.x),k=sR($.floating,m.y);return u?{...B,transform:"translate("+re+"px, "+k+"px)",...d$($.floating)>=1.5&&{willChange:"transform"}}:{position:n,left:re,top:k}},[n,u,$.floating,m.x,m.y]);return T.useMemo(()=>({...m,update:V,refs:Y,elements:$,floatingStyles:U}),[m,V,Y,$,U])}const iae=e=>{function t(n){return{}.hasOwnProperty.call(n,"current")}return{name:"arrow",options:e,fn(n){const{element:r,padding:i}=typeof e=="function"?e(n):e;return r&&t(r)?r.current!=null?lR({element:r.current,padding:i}).fn(n):{}:r?lR({element:r,padding:i}).fn(n):{}}}},oae=(e,t)=>({...Zre(e),options:[e,t]}),lae=(e,t)=>({...Qre(e),options:[e,t]}),sae=(e,t)=>({...nae(e),options:[e,t]}),cae=(e,t)=>({...Jre(e),options:[e,t]}),uae=(e,t)=>({...eae(e),options:[e,t]}),fae=(e,t)=>({...tae(e),options:[e,t]}),dae=(e,t)=>({...iae(e),options:[e,t]});var hae="Arrow",h$=T.forwardRef((e,t)=>{const{children:n,width:r=10,height:i=5,...l}=e;return p.jsx(Ke.svg,{...l,ref:t,width:r,height:i,viewBox:"0 0 30 10",preserveAspectRatio:"none",children:e.asChild?n:p.jsx("polygon",{points:"0,0 30,0 15,10"})})});h$.displayName=hae;var pae=h$;function p$(e){const[t,n]=T.useState(void 0);return un(()=>{if(e){n({width:e.offsetWidth,height:e.offsetHeight});const r=new ResizeObserver(i=>{if(!Array.isArray(i)||!i.length)return;const l=i[0];let s,u;if("borderBoxSize"in l){const f=l.borderBoxSize,d=Array.isArray(f)?f[0]:f;s=d.inlineSize,u=d.blockSize}else s=e.offsetWidth,u=e.offsetHeight;n({width:s,height:u})});return r.observe(e,{box:"border-box"}),()=>r.unobserve(e)}else n(void 0)},[e]),t}var ES="Popper",[m$,v$]=uo(ES),[mae,y$]=m$(ES),g$=e=>{const{__scopePopper:t,children:n}=e,[r,i]=T.useState(null);return p.jsx(mae,{scope:t,anchor:r,onAnchorChange:i,children:n})};g$.displayName=ES;var b$="PopperAnchor",x$=T.forwardRef((e,t)=>{const{__scopePopper:n,virtualRef:r,...i}=e,l=y$(b$,n),s=T.useRef(null),u=St(t,s);return T.useEffect(()=>{l.onAnchorChange((r==null?void 0:r.current)||s.current)}),r?null:p.jsx(Ke.div,{...i,ref:u})});x$.displayName=b$;var TS="PopperContent",[vae,yae]=m$(TS),w$=T.forwardRef((e,t)=>{var de,ve,ce,he,pe,ae;const{__scopePopper:n,side:r="bottom",sideOffset:i=0,align:l="center",alignOffset:s=0,arrowPadding:u=0,avoidCollisions:f=!0,collisionBoundary:d=[],collisionPadding:m=0,sticky:v="partial",hideWhenDetached:g=!1,updatePositionStrategy:x="optimized",onPlaced:j,...w}=e,b=y$(TS,n),[_,O]=T.useState(null),E=St(t,Le=>O(Le)),[C,A]=T.useState(null),N=p$(C),P=(N==null?void 0:N.width)??0,D=(N==null?void 0:N.height)??0,L=r+(l!=="center"?"-"+l:""),G=typeof m=="number"?m:{top:0,right:0,bottom:0,left:0,...m},I=Array.isArray(d)?d:[d],H=I.length>0,V={padding:G,boundary:I.filter(bae),altBoundary:H},{refs:Z,floatingStyles:Y,placement:$,isPositioned:U,middlewareData:B}=aae({strategy:"fixed",placement:L,whileElementsMounted:(...Le)=>Wre(...Le,{animationFrame:x==="always"}),elements:{reference:b.anchor},middleware:[oae({mainAxis:i+D,alignmentAxis:s}),f&&lae({mainAxis:!0,crossAxis:!1,limiter:v==="partial"?sae():void 0,...V}),f&&cae({...V}),uae({...V,apply:({elements:Le,rects:Ce,availableWidth:ft,availableHeight:dt})=>{const{width:Je,height:qn}=Ce.reference,vn=Le.floating.style;vn.setProperty("--radix-popper-available-width",`${ft}px`),vn.setProperty("--radix-popper-available-height",`${dt}px`),vn.setProperty("--radix-popper-anchor-width",`${Je}px`),vn.setProperty("--radix-popper-anchor-height",`${qn}px`)}}),C&&dae({element:C,padding:u}),xae({arrowWidth:P,arrowHeight:D}),g&&fae({strategy:"referenceHidden",...V})]}),[re,k]=O$($),X=ai(j);un(()=>{U&&(X==null||X())},[U,X]);const te=(de=B.arrow)==null?void 0:de.x,ne=(ve=B.arrow)==null?void 0:ve.y,ue=((ce=B.arrow)==null?void 0:ce.centerOffset)!==0,[ge,me]=T.useState();return un(()=>{_&&me(window.getComputedStyle(_).zIndex)},[_]),p.jsx("div",{ref:Z.setFloating,"data-radix-popper-content-wrapper":"",style:{...Y,transform:U?Y.transform:"translate(0, -200%)",minWidth:"max-content",zIndex:ge,"--radix-popper-transform-origin":[(he=B.transformOrigin)==null?void 0:he.x,(pe=B.transformOrigin)==null?void 0:pe.y].join(" "),...((ae=B.hide)==null?void 0:ae.referenceHidden)&&{visibility:"hidden",pointerEvents:"none"}},dir:e.dir,children:p.jsx(vae,{scope:n,placedSide:re,onArrowChange:A,arrowX:te,arrowY:ne,shouldHideArrow:ue,children:p.jsx(Ke.div,{"data-side":re,"data-align":k,...w,ref:E,style:{...w.style,animation:U?void 0:"none"}})})})});w$.displayName=TS;var S$="PopperArrow",gae={top:"bottom",right:"left",bottom:"top",left:"right"},j$=T.forwardRef(function(t,n){const{__scopePopper:r,...i}=t,l=yae(S$,r),s=gae[l.placedSide];return p.jsx("span",{ref:l.onArrowChange,style:{position:"absolute",left:l.arrowX,top:l.arrowY,[s]:0,transformOrigin:{top:"",right:"0 0",bottom:"center 0",left:"100% 0"}[l.placedSide],transform:{top:"translateY(100%)",right:"translateY(50%) rotate(90deg) translateX(-50%)",bottom:"rotate(180deg)",left:"translateY(50%) rotate(-90deg) translateX(50%)"}[l.placedSide],visibility:l.shouldHideArrow?"hidden":void 0},children:p.jsx(pae,{...i,ref:n,style:{...i.style,display:"block"}})})});j$.displayName=S$;function bae(e){return e!==null}var xae=e=>({name:"transformOrigin",options:e,fn(t){var b,_,O;const{placement:n,rects:r,middlewareData:i}=t,s=((b=i.arrow)==null?void 0:b.centerOffset)!==0,u=s?0:e.arrowWidth,f=s?0:e.arrowHeight,[d,m]=O$(n),v={start:"0%",center:"50%",end:"100%"}[m],g=(((_=i.arrow)==null?void 0:_.x)??0)+u/2,x=(((O=i.arrow)==null?void 0:O.y)??0)+f/2;let j="",w="";return d==="bottom"?(j=s?v:`${g}px`,w=`${-f}px`):d==="top"?(j=s?v:`${g}px`,w=`${r.floating.height+f}px`):d==="right"?(j=`${-f}px`,w=s?v:`${x}px`):d==="left"&&(j=`${r.floating.width+f}px`,w=s?v:`${x}px`),{data:{x:j,y:w}}}});function O$(e){const[t,n="center"]=e.split("-");return[t,n]}var wae=g$,Sae=x$,jae=w$,Oae=j$;function _$(e){const t=T.useRef({value:e,previous:e});return T.useMemo(()=>(t.current.value!==e&&(t.current.previous=t.current.value,t.current.value=e),t.current.previous),[e])}var A$=Object.freeze({position:"absolute",border:0,width:1,height:1,padding:0,margin:-1,overflow:"hidden",clip:"rect(0, 0, 0, 0)",whiteSpace:"nowrap",wordWrap:"normal"}),_ae="VisuallyHidden",Aae=T.forwardRef((e,t)=>p.jsx(Ke.span,{...e,ref:t,style:{...A$,...e.style}}));Aae.displayName=_ae;var Eae=[" ","Enter","ArrowUp","ArrowDown"],Tae=[" ","Enter"],ro="Select",[Rp,Dp,Cae]=c3(ro),[fs,_ie]=uo(ro,[Cae,v$]),kp=v$(),[Nae,di]=fs(ro),[Mae,Pae]=fs(ro),E$=e=>{const{__scopeSelect:t,children:n,open:r,defaultOpen:i,onOpenChange:l,value:s,defaultValue:u,onValueChange:f,dir:d,name:m,autoComplete:v,disabled:g,required:x,form:j}=e,w=kp(t),[b,_]=T.useState(null),[O,E]=T.useState(null),[C,A]=T.useState(!1),N=fS(d),[P,D]=Xl({prop:r,defaultProp:i??!1,onChange:l,caller:ro}),[L,G]=Xl({prop:s,defaultProp:u,onChange:f,caller:ro}),I=T.useRef(null),H=b?j||!!b.closest("form"):!0,[V,Z]=T.useState(new Set),Y=Array.from(V).map($=>$.props.value).join(";");return p.jsx(wae,{...w,children:p.jsxs(Nae,{required:x,scope:t,trigger:b,onTriggerChange:_,valueNode:O,onValueNodeChange:E,valueNodeHasChildren:C,onValueNodeHasChildrenChange:A,contentId:ri(),value:L,onValueChange:G,open:P,onOpenChange:D,dir:N,triggerPointerDownPosRef:I,disabled:g,children:[p.jsx(Rp.Provider,{scope:t,children:p.jsx(Mae,{scope:e.__scopeSelect,onNativeOptionAdd:T.useCallback($=>{Z(U=>new Set(U).add($))},[]),onNativeOptionRemove:T.useCallback($=>{Z(U=>{const B=new Set(U);return B.delete($),B})},[]),children:n})}),H?p.jsxs(X$,{"aria-hidden":!0,required:x,tabIndex:-1,name:m,autoComplete:v,value:L,onChange:$=>G($.target.value),disabled:g,form:j,children:[L===void 0?p.jsx("option",{value:""}):null,Array.from(V)]},Y):null]})})};E$.displayName=ro;var T$="SelectTrigger",C$=T.forwardRef((e,t)=>{const{__scopeSelect:n,disabled:r=!1,...i}=e,l=kp(n),s=di(T$,n),u=s.disabled||r,f=St(t,s.onTriggerChange),d=Dp(n),m=T.useRef("touch"),[v,g,x]=Z$(w=>{const b=d().filter(E=>!E.disabled),_=b.find(E=>E.value===s.value),O=Q$(b,w,_);O!==void 0&&s.onValueChange(O.value)}),j=w=>{u||(s.onOpenChange(!0),x()),w&&(s.triggerPointerDownPosRef.current={x:Math.round(w.pageX),y:Math.round(w.pageY)})};return p.jsx(Sae,{asChild:!0,...l,children:p.jsx(Ke.button,{type:"button",role:"combobox","aria-controls":s.contentId,"aria-expanded":s.open,"aria-required":s.required,"aria-autocomplete":"none",dir:s.dir,"data-state":s.open?"open":"closed",disabled:u,"data-disabled":u?"":void 0,"data-placeholder":W$(s.value)?"":void 0,...i,ref:f,onClick:Ye(i.onClick,w=>{w.currentTarget.focus(),m.current!=="mouse"&&j(w)}),onPointerDown:Ye(i.onPointerDown,w=>{m.current=w.pointerType;const b=w.target;b.hasPointerCapture(w.pointerId)&&b.releasePointerCapture(w.pointerId),w.button===0&&w.ctrlKey===!1&&w.pointerType==="mouse"&&(j(w),w.preventDefault())}),onKeyDown:Ye(i.onKeyDown,w=>{const b=v.current!=="";!(w.ctrlKey||w.altKey||w.metaKey)&&w.key.length===1&&g(w.key),!(b&&w.key===" ")&&Eae.includes(w.key)&&(j(),w.preventDefault())})})})});C$.displayName=T$;var N$="SelectValue",M$=T.forwardRef((e,t)=>{const{__scopeSelect:n,className:r,style:i,children:l,placeholder:s="",...u}=e,f=di(N$,n),{onValueNodeHasChildrenChange:d}=f,m=l!==void 0,v=St(t,f.onValueNodeChange);return un(()=>{d(m)},[d,m]),p.jsx(Ke.span,{...u,ref:v,style:{pointerEvents:"none"},children:W$(f.value)?p.jsx(p.Fragment,{children:s}):l})});M$.displayName=N$;var Rae="SelectIcon",P$=T.forwardRef((e,t)=>{const{__scopeSelect:n,children:r,...i}=e;return p.jsx(Ke.span,{"aria-hidden":!0,...i,ref:t,children:r||"▼"})});P$.displayName=Rae;var Dae="SelectPortal",R$=e=>p.jsx(mS,{asChild:!0,...e});R$.displayName=Dae;var ao="SelectContent",D$=T.forwardRef((e,t)=>{const n=di(ao,e.__scopeSelect),[r,i]=T.useState();if(un(()=>{i(new DocumentFragment)},[]),!n.open){const l=r;return l?Su.createPortal(p.jsx(k$,{scope:e.__scopeSelect,children:p.jsx(Rp.Slot,{scope:e.__scopeSelect,children:p.jsx("div",{children:e.children})})}),l):null}return p.jsx($$,{...e,ref:t})});D$.displayName=ao;var cr=10,[k$,hi]=fs(ao),kae="SelectContentImpl",$ae=Sl("SelectContent.RemoveScroll"),$$=T.forwardRef((e,t)=>{const{__scopeSelect:n,position:r="item-aligned",onCloseAutoFocus:i,onEscapeKeyDown:l,onPointerDownOutside:s,side:u,sideOffset:f,align:d,alignOffset:m,arrowPadding:v,collisionBoundary:g,collisionPadding:x,sticky:j,hideWhenDetached:w,avoidCollisions:b,..._}=e,O=di(ao,n),[E,C]=T.useState(null),[A,N]=T.useState(null),P=St(t,de=>C(de)),[D,L]=T.useState(null),[G,I]=T.useState(null),H=Dp(n),[V,Z]=T.useState(!1),Y=T.useRef(!1);T.useEffect(()=>{if(E)return B3(E)},[E]),M3();const $=T.useCallback(de=>{const[ve,...ce]=H().map(ae=>ae.ref.current),[he]=ce.slice(-1),pe=document.activeElement;for(const ae of de)if(ae===pe||(ae==null||ae.scrollIntoView({block:"nearest"}),ae===ve&&A&&(A.scrollTop=0),ae===he&&A&&(A.scrollTop=A.scrollHeight),ae==null||ae.focus(),document.activeElement!==pe))return},[H,A]),U=T.useCallback(()=>$([D,E]),[$,D,E]);T.useEffect(()=>{V&&U()},[V,U]);const{onOpenChange:B,triggerPointerDownPosRef:re}=O;T.useEffect(()=>{if(E){let de={x:0,y:0};const ve=he=>{var pe,ae;de={x:Math.abs(Math.round(he.pageX)-(((pe=re.current)==null?void 0:pe.x)??0)),y:Math.abs(Math.round(he.pageY)-(((ae=re.current)==null?void 0:ae.y)??0))}},ce=he=>{de.x<=10&&de.y<=10?he.preventDefault():E.contains(he.target)||B(!1),document.removeEventListener("pointermove",ve),re.current=null};return re.current!==null&&(document.addEventListener("pointermove",ve),document.addEventListener("pointerup",ce,{capture:!0,once:!0})),()=>{document.removeEventListener("pointermove",ve),document.removeEventListener("pointerup",ce,{capture:!0})}}},[E,B,re]),T.useEffect(()=>{const de=()=>B(!1);return window.addEventListener("blur",de),window.addEventListener("resize",de),()=>{window.removeEventListener("blur",de),window.removeEventListener("resize",de)}},[B]);const[k,X]=Z$(de=>{const ve=H().filter(pe=>!pe.disabled),ce=ve.find(pe=>pe.ref.current===document.activeElement),he=Q$(ve,de,ce);he&&setTimeout(()=>he.ref.current.focus())}),te=T.useCallback((de,ve,ce)=>{const he=!Y.current&&!ce;(O.value!==void 0&&O.value===ve||he)&&(L(de),he&&(Y.current=!0))},[O.value]),ne=T.useCallback(()=>E==null?void 0:E.focus(),[E]),ue=T.useCallback((de,ve,ce)=>{const he=!Y.current&&!ce;(O.value!==void 0&&O.value===ve||he)&&I(de)},[O.value]),ge=r==="popper"?K1:L$,me=ge===K1?{side:u,sideOffset:f,align:d,alignOffset:m,arrowPadding:v,collisionBoundary:g,collisionPadding:x,sticky:j,hideWhenDetached:w,avoidCollisions:b}:{};return p.jsx(k$,{scope:n,content:E,viewport:A,onViewportChange:N,itemRefCallback:te,selectedItem:D,onItemLeave:ne,itemTextRefCallback:ue,focusSelectedItem:U,selectedItemText:G,position:r,isPositioned:V,searchRef:k,children:p.jsx(vS,{as:$ae,allowPinchZoom:!0,children:p.jsx(pS,{asChild:!0,trapped:O.open,onMountAutoFocus:de=>{de.preventDefault()},onUnmountAutoFocus:Ye(i,de=>{var ve;(ve=O.trigger)==null||ve.focus({preventScroll:!0}),de.preventDefault()}),children:p.jsx(hS,{asChild:!0,disableOutsidePointerEvents:!0,onEscapeKeyDown:l,onPointerDownOutside:s,onFocusOutside:de=>de.preventDefault(),onDismiss:()=>O.onOpenChange(!1),children:p.jsx(ge,{role:"listbox",id:O.contentId,"data-state":O.open?"open":"closed",dir:O.dir,onContextMenu:de=>de.preventDefault(),..._,...me,onPlaced:()=>Z(!0),ref:P,style:{display:"flex",flexDirection:"column",outline:"none",..._.style},onKeyDown:Ye(_.onKeyDown,de=>{const ve=de.ctrlKey||de.altKey||de.metaKey;if(de.key==="Tab"&&de.preventDefault(),!ve&&de.key.length===1&&X(de.key),["ArrowUp","ArrowDown","Home","End"].includes(de.key)){let he=H().filter(pe=>!pe.disabled).map(pe=>pe.ref.current);if(["ArrowUp","End"].includes(de.key)&&(he=he.slice().reverse()),["ArrowUp","ArrowDown"].includes(de.key)){const pe=de.target,ae=he.indexOf(pe);he=he.slice(ae+1)}setTimeout(()=>$(he)),de.preventDefault()}})})})})})})});$$.displayName=kae;var Lae="SelectItemAlignedPosition",L$=T.forwardRef((e,t)=>{const{__scopeSelect:n,onPlaced:r,...i}=e,l=di(ao,n),s=hi(ao,n),[u,f]=T.useState(null),[d,m]=T.useState(null),v=St(t,P=>m(P)),g=Dp(n),x=T.useRef(!1),j=T.useRef(!0),{viewport:w,selectedItem:b,selectedItemText:_,focusSelectedItem:O}=s,E=T.useCallback(()=>{if(l.trigger&&l.valueNode&&u&&d&&w&&b&&_){const P=l.trigger.getBoundingClientRect(),D=d.getBoundingClientRect(),L=l.valueNode.getBoundingClientRect(),G=_.getBoundingClientRect();if(l.dir!=="rtl"){const pe=G.left-D.left,ae=L.left-pe,Le=P.left-ae,Ce=P.width+Le,ft=Math.max(Ce,D.width),dt=window.innerWidth-cr,Je=eR(ae,[cr,Math.max(cr,dt-ft)]);u.style.minWidth=Ce+"px",u.style.left=Je+"px"}else{const pe=D.right-G.right,ae=window.innerWidth-L.right-pe,Le=window.innerWidth-P.right-ae,Ce=P.width+Le,ft=Math.max(Ce,D.width),dt=window.innerWidth-cr,Je=eR(ae,[cr,Math.max(cr,dt-ft)]);u.style.minWidth=Ce+"px",u.style.right=Je+"px"}const I=g(),H=window.innerHeight-cr*2,V=w.scrollHeight,Z=window.getComputedStyle(d),Y=parseInt(Z.borderTopWidth,10),$=parseInt(Z.paddingTop,10),U=parseInt(Z.borderBottomWidth,10),B=parseInt(Z.paddingBottom,10),re=Y+$+V+B+U,k=Math.min(b.offsetHeight*5,re),X=window.getComputedStyle(w),te=parseInt(X.paddingTop,10),ne=parseInt(X.paddingBottom,10),ue=P.top+P.height/2-cr,ge=H-ue,me=b.offsetHeight/2,de=b.offsetTop+me,ve=Y+$+de,ce=re-ve;if(ve<=ue){const pe=I.length>0&&b===I[I.length-1].ref.current;u.style.bottom="0px";const ae=d.clientHeight-w.offsetTop-w.offsetHeight,Le=Math.max(ge,me+(pe?ne:0)+ae+U),Ce=ve+Le;u.style.height=Ce+"px"}else{const pe=I.length>0&&b===I[0].ref.current;u.style.top="0px";const Le=Math.max(ue,Y+w.offsetTop+(pe?te:0)+me)+ce;u.style.height=Le+"px",w.scrollTop=ve-ue+w.offsetTop}u.style.margin=`${cr}px 0`,u.style.minHeight=k+"px",u.style.maxHeight=H+"px",r==null||r(),requestAnimationFrame(()=>x.current=!0)}},[g,l.trigger,l.valueNode,u,d,w,b,_,l.dir,r]);un(()=>E(),[E]);const[C,A]=T.useState();un(()=>{d&&A(window.getComputedStyle(d).zIndex)},[d]);const N=T.useCallback(P=>{P&&j.current===!0&&(E(),O==null||O(),j.current=!1)},[E,O]);return p.jsx(qae,{scope:n,contentWrapper:u,shouldExpandOnScrollRef:x,onScrollButtonChange:N,children:p.jsx("div",{ref:f,style:{display:"flex",flexDirection:"column",position:"fixed",zIndex:C},children:p.jsx(Ke.div,{...i,ref:v,style:{boxSizing:"border-box",maxHeight:"100%",...i.style}})})})});L$.displayName=Lae;var Iae="SelectPopperPosition",K1=T.forwardRef((e,t)=>{const{__scopeSelect:n,align:r="start",collisionPadding:i=cr,...l}=e,s=kp(n);return p.jsx(jae,{...s,...l,ref:t,align:r,collisionPadding:i,style:{boxSizing:"border-box",...l.style,"--radix-select-content-transform-origin":"var(--radix-popper-transform-origin)","--radix-select-content-available-width":"var(--radix-popper-available-width)","--radix-select-content-available-height":"var(--radix-popper-available-height)","--radix-select-trigger-width":"var(--radix-popper-anchor-width)","--radix-select-trigger-height":"var(--radix-popper-anchor-height)"}})});K1.displayName=Iae;var[qae,CS]=fs(ao,{}),X1="SelectViewport",I$=T.forwardRef((e,t)=>{const{__scopeSelect:n,nonce:r,...i}=e,l=hi(X1,n),s=CS(X1,n),u=St(t,l.onViewportChange),f=T.useRef(0);return p.jsxs(p.Fragment,{children:[p.jsx("style",{dangerouslySetInnerHTML:{__html:"[data-radix-select-viewport]{scrollbar-width:none;-ms-overflow-style:none;-webkit-overflow-scrolling:touch;}[data-radix-select-viewport]::-webkit-scrollbar{display:none}"},nonce:r}),p.jsx(Rp.Slot,{scope:n,children:p.jsx(Ke.div,{"data-radix-select-viewport":"",role:"presentation",...i,ref:u,style:{position:"relative",flex:1,overflow:"hidden auto",...i.style},onScroll:Ye(i.onScroll,d=>{const m=d.currentTarget,{contentWrapper:v,shouldExpandOnScrollRef:g}=s;if(g!=null&&g.current&&v){const x=Math.abs(f.current-m.scrollTop);if(x>0){const j=window.innerHeight-cr*2,w=parseFloat(v.style.minHeight),b=parseFloat(v.style.height),_=Math.max(w,b);if(_<j){const O=_+x,E=Math.min(j,O),C=O-E;v.style.height=E+"px",v.style.bottom==="0px"&&(m.scrollTop=C>0?C:0,v.style.justifyContent="flex-end")}}}f.current=m.scrollTop})})})]})});I$.displayName=X1;var q$="SelectGroup",[Bae,zae]=fs(q$),Uae=T.forwardRef((e,t)=>{const{__scopeSelect:n,...r}=e,i=ri();return p.jsx(Bae,{scope:n,id:i,children:p.jsx(Ke.div,{role:"group","aria-labelledby":i,...r,ref:t})})});Uae.displayName=q$;var B$="SelectLabel",Hae=T.forwardRef((e,t)=>{const{__scopeSelect:n,...r}=e,i=zae(B$,n);return p.jsx(Ke.div,{id:i.id,...r,ref:t})});Hae.displayName=B$;var kh="SelectItem",[Fae,z$]=fs(kh),U$=T.forwardRef((e,t)=>{const{__scopeSelect:n,value:r,disabled:i=!1,textValue:l,...s}=e,u=di(kh,n),f=hi(kh,n),d=u.value===r,[m,v]=T.useState(l??""),[g,x]=T.useState(!1),j=St(t,O=>{var E;return(E=f.itemRefCallback)==null?void 0:E.call(f,O,r,i)}),w=ri(),b=T.useRef("touch"),_=()=>{i||(u.onValueChange(r),u.onOpenChange(!1))};if(r==="")throw new Error("A <Select.Item /> must have a value prop that is not an empty string. This is because the Select value can be set to an empty string to clear the selection and show the placeholder.");return p.jsx(Fae,{scope:n,value:r,disabled:i,textId:w,isSelected:d,onItemTextChange:T.useCallback(O=>{v(E=>E||((O==null?void 0:O.textContent)??"").trim())},[]),children:p.jsx(Rp.ItemSlot,{scope:n,value:r,disabled:i,textValue:m,children:p.jsx(Ke.div,{role:"option","aria-labelledby":w,"data-highlighted":g?"":void 0,"aria-selected":d&&g,"data-state":d?"checked":"unchecked","aria-disabled":i||void 0,"data-disabled":i?"":void 0,tabIndex:i?void 0:-1,...s,ref:j,onFocus:Ye(s.onFocus,()=>x(!0)),onBlur:Ye(s.onBlur,()=>x(!1)),onClick:Ye(s.onClick,()=>{b.current!=="mouse"&&_()}),onPointerUp:Ye(s.onPointerUp,()=>{b.current==="mouse"&&_()}),onPointerDown:Ye(s.onPointerDown,O=>{b.current=O.pointerType}),onPointerMove:Ye(s.onPointerMove,O=>{var E;b.current=O.pointerType,i?(E=f.onItemLeave)==null||E.call(f):b.current==="mouse"&&O.currentTarget.focus({preventScroll:!0})}),onPointerLeave:Ye(s.onPointerLeave,O=>{var E;O.currentTarget===document.activeElement&&((E=f.onItemLeave)==null||E.call(f))}),onKeyDown:Ye(s.onKeyDown,O=>{var C;((C=f.searchRef)==null?void 0:C.current)!==""&&O.key===" "||(Tae.includes(O.key)&&_(),O.key===" "&&O.preventDefault())})})})})});U$.displayName=kh;var Ac="SelectItemText",H$=T.forwardRef((e,t)=>{const{__scopeSelect:n,className:r,style:i,...l}=e,s=di(Ac,n),u=hi(Ac,n),f=z$(Ac,n),d=Pae(Ac,n),[m,v]=T.useState(null),g=St(t,_=>v(_),f.onItemTextChange,_=>{var O;return(O=u.itemTextRefCallback)==null?void 0:O.call(u,_,f.value,f.disabled)}),x=m==null?void 0:m.textContent,j=T.useMemo(()=>p.jsx("option",{value:f.value,disabled:f.disabled,children:x},f.value),[f.disabled,f.value,x]),{onNativeOptionAdd:w,onNativeOptionRemove:b}=d;return un(()=>(w(j),()=>b(j)),[w,b,j]),p.jsxs(p.Fragment,{children:[p.jsx(Ke.span,{id:f.textId,...l,ref:g}),f.isSelected&&s.valueNode&&!s.valueNodeHasChildren?Su.createPortal(l.children,s.valueNode):null]})});H$.displayName=Ac;var F$="SelectItemIndicator",G$=T.forwardRef((e,t)=>{const{__scopeSelect:n,...r}=e;return z$(F$,n).isSelected?p.jsx(Ke.span,{"aria-hidden":!0,...r,ref:t}):null});G$.displayName=F$;var W1="SelectScrollUpButton",V$=T.forwardRef((e,t)=>{const n=hi(W1,e.__scopeSelect),r=CS(W1,e.__scopeSelect),[i,l]=T.useState(!1),s=St(t,r.onScrollButtonChange);return un(()=>{if(n.viewport&&n.isPositioned){let u=function(){const d=f.scrollTop>0;l(d)};const f=n.viewport;return u(),f.addEventListener("scroll",u),()=>f.removeEventListener("scroll",u)}},[n.viewport,n.isPositioned]),i?p.jsx(K$,{...e,ref:s,onAutoScroll:()=>{const{viewport:u,selectedItem:f}=n;u&&f&&(u.scrollTop=u.scrollTop-f.offsetHeight)}}):null});V$.displayName=W1;var Z1="SelectScrollDownButton",Y$=T.forwardRef((e,t)=>{const n=hi(Z1,e.__scopeSelect),r=CS(Z1,e.__scopeSelect),[i,l]=T.useState(!1),s=St(t,r.onScrollButtonChange);return un(()=>{if(n.viewport&&n.isPositioned){let u=function(){const d=f.scrollHeight-f.clientHeight,m=Math.ceil(f.scrollTop)<d;l(m)};const f=n.viewport;return u(),f.addEventListener("scroll",u),()=>f.removeEventListener("scroll",u)}},[n.viewport,n.isPositioned]),i?p.jsx(K$,{...e,ref:s,onAutoScroll:()=>{const{viewport:u,selectedItem:f}=n;u&&f&&(u.scrollTop=u.scrollTop+f.offsetHeight)}}):null});Y$.displayName=Z1;var K$=T.forwardRef((e,t)=>{const{__scopeSelect:n,onAutoScroll:r,...i}=e,l=hi("SelectScrollButton",n),s=T.useRef(null),u=Dp(n),f=T.useCallback(()=>{s.current!==null&&(window.clearInterval(s.current),s.current=null)},[]);return T.useEffect(()=>()=>f(),[f]),un(()=>{var m;const d=u().find(v=>v.ref.current===document.activeElement);(m=d==null?void 0:d.ref.current)==null||m.scrollIntoView({block:"nearest"})},[u]),p.jsx(Ke.div,{"aria-hidden":!0,...i,ref:t,style:{flexShrink:0,...i.style},onPointerDown:Ye(i.onPointerDown,()=>{s.current===null&&(s.current=window.setInterval(r,50))}),onPointerMove:Ye(i.onPointerMove,()=>{var d;(d=l.onItemLeave)==null||d.call(l),s.current===null&&(s.current=window.setInterval(r,50))}),onPointerLeave:Ye(i.onPointerLeave,()=>{f()})})}),Gae="SelectSeparator",Vae=T.forwardRef((e,t)=>{const{__scopeSelect:n,...r}=e;return p.jsx(Ke.div,{"aria-hidden":!0,...r,ref:t})});Vae.displayName=Gae;var Q1="SelectArrow",Yae=T.forwardRef((e,t)=>{const{__scopeSelect:n,...r}=e,i=kp(n),l=di(Q1,n),s=hi(Q1,n);return l.open&&s.position==="popper"?p.jsx(Oae,{...i,...r,ref:t}):null});Yae.displayName=Q1;var Kae="SelectBubbleInput",X$=T.forwardRef(({__scopeSelect:e,value:t,...n},r)=>{const i=T.useRef(null),l=St(r,i),s=_$(t);return T.useEffect(()=>{const u=i.current;if(!u)return;const f=window.HTMLSelectElement.prototype,m=Object.getOwnPropertyDescriptor(f,"value").set;if(s!==t&&m){const v=new Event("change",{bubbles:!0});m.call(u,t),u.dispatchEvent(v)}},[s,t]),p.jsx(Ke.select,{...n,style:{...A$,...n.style},ref:l,defaultValue:t})});X$.displayName=Kae;function W$(e){return e===""||e===void 0}function Z$(e){const t=ai(e),n=T.useRef(""),r=T.useRef(0),i=T.useCallback(s=>{const u=n.current+s;t(u),function f(d){n.current=d,window.clearTimeout(r.current),d!==""&&(r.current=window.setTimeout(()=>f(""),1e3))}(u)},[t]),l=T.useCallback(()=>{n.current="",window.clearTimeout(r.current)},[]);return T.useEffect(()=>()=>window.clearTimeout(r.current),[]),[n,i,l]}function Q$(e,t,n){const i=t.length>1&&Array.from(t).every(d=>d===t[0])?t[0]:t,l=n?e.indexOf(n):-1;let s=Xae(e,Math.max(l,0));i.length===1&&(s=s.filter(d=>d!==n));const f=s.find(d=>d.textValue.toLowerCase().startsWith(i.toLowerCase()));return f!==n?f:void 0}function Xae(e,t){return e.map((n,r)=>e[(t+r)%e.length])}var Wae=E$,Zae=C$,Qae=M$,Jae=P$,eie=R$,tie=D$,nie=I$,rie=U$,aie=H$,iie=G$,oie=V$,lie=Y$;function gl({...e}){return p.jsx(Wae,{"data-slot":"select",...e})}function bl({...e}){return p.jsx(Qae,{"data-slot":"select-value",...e})}function xl({className:e,size:t="default",children:n,...r}){return p.jsxs(Zae,{"data-slot":"select-trigger","data-size":t,className:We("border-input data-[placeholder]:text-muted-foreground [&_svg:not([class*='text-'])]:text-muted-foreground focus-visible:border-ring focus-visible:ring-ring/50 aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive dark:bg-input/30 dark:hover:bg-input/50 flex w-fit items-center justify-between gap-2 rounded-md border bg-transparent px-3 py-2 text-sm whitespace-nowrap shadow-xs transition-[color,box-shadow] outline-none focus-visible:ring-[3px] disabled:cursor-not-allowed disabled:opacity-50 data-[size=default]:h-9 data-[size=sm]:h-8 *:data-[slot=select-value]:line-clamp-1 *:data-[slot=select-value]:flex *:data-[slot=select-value]:items-center *:data-[slot=select-value]:gap-2 [&_svg]:pointer-events-none [&_svg]:shrink-0 [&_svg:not([class*='size-'])]:size-4",e),...r,children:[n,p.jsx(Jae,{asChild:!0,children:p.jsx(zR,{className:"size-4 opacity-50"})})]})}function wl({className:e,children:t,position:n="popper",...r}){return p.jsx(eie,{children:p.jsxs(tie,{"data-slot":"select-content",className:We("bg-popover text-popover-foreground data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 data-[state=closed]:zoom-out-95 data-[state=open]:zoom-in-95 data-[side=bottom]:slide-in-from-top-2 data-[side=left]:slide-in-from-right-2 data-[side=right]:slide-in-from-left-2 data-[side=top]:slide-in-from-bottom-2 relative z-50 max-h-(--radix-select-content-available-height) min-w-[8rem] origin-(--radix-select-content-transform-origin) overflow-x-hidden overflow-y-auto rounded-md border shadow-md",n==="popper"&&"data-[side=bottom]:translate-y-1 data-[side=left]:-translate-x-1 data-[side=right]:translate-x-1 data-[side=top]:-translate-y-1",e),position:n,...r,children:[p.jsx(sie,{}),p.jsx(nie,{className:We("p-1",n==="popper"&&"h-[var(--radix-select-trigger-height)] w-full min-w-[var(--radix-select-trigger-width)] scroll-my-1"),children:t}),p.jsx(cie,{})]})})}function Ct({className:e,children:t,...n}){return p.jsxs(rie,{"data-slot":"select-item",className:We("focus:bg-accent focus:text-accent-foreground [&_svg:not([class*='text-'])]:text-muted-foreground relative flex w-full cursor-default items-center gap-2 rounded-sm py-1.5 pr-8 pl-2 text-sm outline-hidden select-none data-[disabled]:pointer-events-none data-[disabled]:opacity-50 [&_svg]:pointer-events-none [&_svg]:shrink-0 [&_svg:not([class*='size-'])]:size-4 *:[span]:last:flex *:[span]:last:items-center *:[span]:last:gap-2",e),...n,children:[p.jsx("span",{className:"absolute right-2 flex size-3.5 items-center justify-center",children:p.jsx(iie,{children:p.jsx(ez,{className:"size-4"})})}),p.jsx(aie,{children:t})]})}function sie({className:e,...t}){return p.jsx(oie,{"data-slot":"select-scroll-up-button",className:We("flex cursor-default items-center justify-center py-1",e),...t,children:p.jsx(iz,{className:"size-4"})})}function cie({className:e,...t}){return p.jsx(lie,{"data-slot":"select-scroll-down-button",className:We("flex cursor-default items-center justify-center py-1",e),...t,children:p.jsx(zR,{className:"size-4"})})}const uie=({userRole:e})=>{const[t,n]=T.useState(""),[r,i]=T.useState("todos"),[l,s]=T.useState(!1),[u,f]=T.useState(null),[d]=T.useState([{id:1,vehiculoId:1,vehiculo:"BMW X3 - 1234ABC",cliente:"Pedro Martínez",tecnico:"Técnico 1",descripcionFallo:"Ruido extraño en los frenos delanteros al frenar. Cliente reporta vibración en el pedal.",fechaDiagnostico:"2024-12-20",estado:"pendiente",prioridad:"alta",tiempoEstimado:"2 horas",observaciones:"Revisar pastillas y discos de freno. Posible desgaste excesivo.",repuestosNecesarios:["Pastillas de freno delanteras","Discos de freno"],costoEstimado:450},{id:2,vehiculoId:2,vehiculo:"Mercedes C200 - 5678DEF",cliente:"Pedro Martínez",tecnico:"Técnico 1",descripcionFallo:"Cambio de aceite y filtros de mantenimiento programado.",fechaDiagnostico:"2024-12-18",estado:"en_proceso",prioridad:"media",tiempoEstimado:"1 hora",observaciones:"Mantenimiento rutinario según kilometraje.",repuestosNecesarios:["Aceite motor 5W-30","Filtro de aceite","Filtro de aire"],costoEstimado:120},{id:3,vehiculoId:3,vehiculo:"Audi A4 - 9012GHI",cliente:"Laura Gómez",tecnico:"Técnico 1",descripcionFallo:"Problema eléctrico: luces del tablero intermitentes y batería se descarga.",fechaDiagnostico:"2024-12-22",estado:"completado",prioridad:"alta",tiempoEstimado:"3 horas",observaciones:"Alternador defectuoso reemplazado. Sistema eléctrico revisado completamente.",repuestosNecesarios:["Alternador","Correa del alternador"],costoEstimado:680}]),m=b=>{switch(b){case"pendiente":return"bg-yellow-100 text-yellow-800";case"en_proceso":return"bg-blue-100 text-blue-800";case"completado":return"bg-green-100 text-green-800";case"cancelado":return"bg-red-100 text-red-800";default:return"bg-gray-100 text-gray-800"}},v=b=>{switch(b){case"alta":return"bg-red-100 text-red-800";case"media":return"bg-yellow-100 text-yellow-800";case"baja":return"bg-green-100 text-green-800";default:return"bg-gray-100 text-gray-800"}},g=b=>{switch(b){case"pendiente":return p.jsx(hr,{className:"w-4 h-4"});case"en_proceso":return p.jsx(Ki,{className:"w-4 h-4"});case"completado":return p.jsx(jl,{className:"w-4 h-4"});case"cancelado":return p.jsx(Bh,{className:"w-4 h-4"});default:return p.jsx(hr,{className:"w-4 h-4"})}},x=d.filter(b=>{const _=b.vehiculo.toLowerCase().includes(t.toLowerCase())||b.cliente.toLowerCase().includes(t.toLowerCase())||b.descripcionFallo.toLowerCase().includes(t.toLowerCase()),O=r==="todos"||b.estado===r;return _&&O}),j=({diagnostic:b=null,onClose:_})=>{var A;const[O,E]=T.useState({vehiculoId:(b==null?void 0:b.vehiculoId)||"",descripcionFallo:(b==null?void 0:b.descripcionFallo)||"",prioridad:(b==null?void 0:b.prioridad)||"media",tiempoEstimado:(b==null?void 0:b.tiempoEstimado)||"",observaciones:(b==null?void 0:b.observaciones)||"",repuestosNecesarios:((A=b==null?void 0:b.repuestosNecesarios)==null?void 0:A.join(", "))||""}),C=N=>{N.preventDefault(),console.log("Guardando diagnóstico:",O),_()};return p.jsxs("form",{onSubmit:C,className:"space-y-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"vehiculoId",children:"Vehículo"}),p.jsxs(gl,{value:O.vehiculoId,onValueChange:N=>E({...O,vehiculoId:N}),children:[p.jsx(xl,{children:p.jsx(bl,{placeholder:"Seleccionar vehículo"})}),p.jsxs(wl,{children:[p.jsx(Ct,{value:"1",children:"BMW X3 - 1234ABC (Pedro Martínez)"}),p.jsx(Ct,{value:"2",children:"Mercedes C200 - 5678DEF (Pedro Martínez)"}),p.jsx(Ct,{value:"3",children:"Audi A4 - 9012GHI (Laura Gómez)"})]})]})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"descripcionFallo",children:"Descripción del Fallo"}),p.jsx(Vi,{id:"descripcionFallo",placeholder:"Describe detalladamente el problema identificado...",value:O.descripcionFallo,onChange:N=>E({...O,descripcionFallo:N.target.value}),rows:4,required:!0})]}),p.jsxs("div",{className:"grid grid-cols-2 gap-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"prioridad",children:"Prioridad"}),p.jsxs(gl,{value:O.prioridad,onValueChange:N=>E({...O,prioridad:N}),children:[p.jsx(xl,{children:p.jsx(bl,{})}),p.jsxs(wl,{children:[p.jsx(Ct,{value:"baja",children:"Baja"}),p.jsx(Ct,{value:"media",children:"Media"}),p.jsx(Ct,{value:"alta",children:"Alta"})]})]})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"tiempoEstimado",children:"Tiempo Estimado"}),p.jsx(Ie,{id:"tiempoEstimado",placeholder:"ej: 2 horas",value:O.tiempoEstimado,onChange:N=>E({...O,tiempoEstimado:N.target.value}),required:!0})]})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"repuestosNecesarios",children:"Repuestos Necesarios"}),p.jsx(Vi,{id:"repuestosNecesarios",placeholder:"Lista los repuestos necesarios separados por comas...",value:O.repuestosNecesarios,onChange:N=>E({...O,repuestosNecesarios:N.target.value}),rows:3})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"observaciones",children:"Observaciones"}),p.jsx(Vi,{id:"observaciones",placeholder:"Observaciones adicionales, recomendaciones...",value:O.observaciones,onChange:N=>E({...O,observaciones:N.target.value}),rows:3})]}),p.jsxs("div",{className:"flex justify-end gap-2",children:[p.jsx(Pe,{type:"button",variant:"outline",onClick:_,children:"Cancelar"}),p.jsxs(Pe,{type:"submit",children:[b?"Actualizar":"Crear"," Diagnóstico"]})]})]})},w=({diagnostic:b,onClose:_})=>{const[O,E]=T.useState(b.estado),C=A=>{E(A),console.log("Actualizando estado a:",A)};return p.jsxs("div",{className:"space-y-6",children:[p.jsxs("div",{className:"flex justify-between items-start",children:[p.jsxs("div",{children:[p.jsx("h3",{className:"text-lg font-semibold",children:b.vehiculo}),p.jsx("p",{className:"text-gray-600",children:b.cliente})]}),p.jsxs("div",{className:"flex items-center gap-2",children:[p.jsxs(Mt,{className:m(O),children:[g(O),O.replace("_"," ")]}),p.jsx(Mt,{className:v(b.prioridad),children:b.prioridad})]})]}),p.jsxs("div",{className:"grid grid-cols-2 gap-4",children:[p.jsxs("div",{children:[p.jsx(je,{className:"text-sm font-medium text-gray-500",children:"Fecha de Diagnóstico"}),p.jsxs("p",{className:"flex items-center gap-1",children:[p.jsx(Jn,{className:"w-4 h-4"}),new Date(b.fechaDiagnostico).toLocaleDateString("es-ES")]})]}),p.jsxs("div",{children:[p.jsx(je,{className:"text-sm font-medium text-gray-500",children:"Técnico Asignado"}),p.jsxs("p",{className:"flex items-center gap-1",children:[p.jsx(Dc,{className:"w-4 h-4"}),b.tecnico]})]}),p.jsxs("div",{children:[p.jsx(je,{className:"text-sm font-medium text-gray-500",children:"Tiempo Estimado"}),p.jsxs("p",{className:"flex items-center gap-1",children:[p.jsx(hr,{className:"w-4 h-4"}),b.tiempoEstimado]})]}),p.jsxs("div",{children:[p.jsx(je,{className:"text-sm font-medium text-gray-500",children:"Costo Estimado"}),p.jsx("p",{className:"flex items-center gap-1",children:p.jsxs("span",{className:"text-lg font-semibold text-green-600",children:["€",b.costoEstimado]})})]})]}),p.jsxs("div",{children:[p.jsx(je,{className:"text-sm font-medium text-gray-500",children:"Descripción del Fallo"}),p.jsx("p",{className:"mt-1 p-3 bg-gray-50 rounded-lg",children:b.descripcionFallo})]}),p.jsxs("div",{children:[p.jsx(je,{className:"text-sm font-medium text-gray-500",children:"Repuestos Necesarios"}),p.jsx("div",{className:"mt-1 flex flex-wrap gap-2",children:b.repuestosNecesarios.map((A,N)=>p.jsx(Mt,{variant:"outline",children:A},N))})]}),p.jsxs("div",{children:[p.jsx(je,{className:"text-sm font-medium text-gray-500",children:"Observaciones"}),p.jsx("p",{className:"mt-1 p-3 bg-gray-50 rounded-lg",children:b.observaciones})]}),p.jsxs("div",{className:"border-t pt-4",children:[p.jsx(je,{className:"text-sm font-medium text-gray-500",children:"Cambiar Estado"}),p.jsxs("div",{className:"mt-2 flex gap-2",children:[p.jsx(Pe,{size:"sm",variant:O==="pendiente"?"default":"outline",onClick:()=>C("pendiente"),children:"Pendiente"}),p.jsx(Pe,{size:"sm",variant:O==="en_proceso"?"default":"outline",onClick:()=>C("en_proceso"),children:"En Proceso"}),p.jsx(Pe,{size:"sm",variant:O==="completado"?"default":"outline",onClick:()=>C("completado"),children:"Completado"})]})]}),p.jsx("div",{className:"flex justify-end",children:p.jsx(Pe,{onClick:_,children:"Cerrar"})})]})};return p.jsxs("div",{className:"space-y-6",children:[p.jsx("div",{className:"flex justify-between items-center",children:p.jsxs("div",{children:[p.jsx("h1",{className:"text-3xl font-bold text-gray-900",children:"Diagnósticos"}),p.jsx("p",{className:"text-gray-600",children:"Gestión de diagnósticos y reparaciones"})]})}),p.jsxs("div",{className:"flex justify-between items-center gap-4",children:[p.jsxs("div",{className:"flex gap-4 flex-1",children:[p.jsxs("div",{className:"relative max-w-md",children:[p.jsx(qh,{className:"absolute left-3 top-1/2 transform -translate-y-1/2 text-gray-400 w-4 h-4"}),p.jsx(Ie,{placeholder:"Buscar diagnósticos...",value:t,onChange:b=>n(b.target.value),className:"pl-10"})]}),p.jsxs(gl,{value:r,onValueChange:i,children:[p.jsx(xl,{className:"w-48",children:p.jsx(bl,{})}),p.jsxs(wl,{children:[p.jsx(Ct,{value:"todos",children:"Todos los estados"}),p.jsx(Ct,{value:"pendiente",children:"Pendiente"}),p.jsx(Ct,{value:"en_proceso",children:"En Proceso"}),p.jsx(Ct,{value:"completado",children:"Completado"}),p.jsx(Ct,{value:"cancelado",children:"Cancelado"})]})]})]}),e!=="recepcionista"&&p.jsxs(Ah,{open:l,onOpenChange:s,children:[p.jsx(Eh,{asChild:!0,children:p.jsxs(Pe,{className:"flex items-center gap-2",children:[p.jsx(Ol,{className:"w-4 h-4"}),"Nuevo Diagnóstico"]})}),p.jsxs(Th,{className:"max-w-2xl",children:[p.jsxs(Ch,{children:[p.jsx(Nh,{children:"Nuevo Diagnóstico"}),p.jsx(F1,{children:"Registra un nuevo diagnóstico para un vehículo"})]}),p.jsx(j,{onClose:()=>s(!1)})]})]})]}),p.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-4 gap-4",children:[p.jsx(De,{children:p.jsx(ke,{className:"p-4",children:p.jsxs("div",{className:"flex items-center justify-between",children:[p.jsxs("div",{children:[p.jsx("p",{className:"text-sm text-gray-600",children:"Pendientes"}),p.jsx("p",{className:"text-2xl font-bold text-yellow-600",children:d.filter(b=>b.estado==="pendiente").length})]}),p.jsx(hr,{className:"w-8 h-8 text-yellow-600"})]})})}),p.jsx(De,{children:p.jsx(ke,{className:"p-4",children:p.jsxs("div",{className:"flex items-center justify-between",children:[p.jsxs("div",{children:[p.jsx("p",{className:"text-sm text-gray-600",children:"En Proceso"}),p.jsx("p",{className:"text-2xl font-bold text-blue-600",children:d.filter(b=>b.estado==="en_proceso").length})]}),p.jsx(Ki,{className:"w-8 h-8 text-blue-600"})]})})}),p.jsx(De,{children:p.jsx(ke,{className:"p-4",children:p.jsxs("div",{className:"flex items-center justify-between",children:[p.jsxs("div",{children:[p.jsx("p",{className:"text-sm text-gray-600",children:"Completados"}),p.jsx("p",{className:"text-2xl font-bold text-green-600",children:d.filter(b=>b.estado==="completado").length})]}),p.jsx(jl,{className:"w-8 h-8 text-green-600"})]})})}),p.jsx(De,{children:p.jsx(ke,{className:"p-4",children:p.jsxs("div",{className:"flex items-center justify-between",children:[p.jsxs("div",{children:[p.jsx("p",{className:"text-sm text-gray-600",children:"Total"}),p.jsx("p",{className:"text-2xl font-bold text-gray-900",children:d.length})]}),p.jsx(UR,{className:"w-8 h-8 text-gray-600"})]})})})]}),p.jsxs(De,{children:[p.jsxs(pt,{children:[p.jsx(mt,{children:"Lista de Diagnósticos"}),p.jsxs(nn,{children:[x.length," diagnósticos encontrados"]})]}),p.jsx(ke,{children:p.jsxs(sa,{children:[p.jsx(ca,{children:p.jsxs(Wt,{children:[p.jsx(Oe,{children:"Vehículo"}),p.jsx(Oe,{children:"Cliente"}),p.jsx(Oe,{children:"Descripción"}),p.jsx(Oe,{children:"Estado"}),p.jsx(Oe,{children:"Prioridad"}),p.jsx(Oe,{children:"Fecha"}),p.jsx(Oe,{children:"Costo Est."}),p.jsx(Oe,{children:"Acciones"})]})}),p.jsx(ua,{children:x.map(b=>p.jsxs(Wt,{children:[p.jsx(_e,{children:p.jsxs("div",{className:"flex items-center gap-2",children:[p.jsx(Ih,{className:"w-4 h-4 text-gray-400"}),p.jsx("span",{className:"font-medium",children:b.vehiculo})]})}),p.jsx(_e,{children:p.jsxs("div",{className:"flex items-center gap-2",children:[p.jsx(Dc,{className:"w-4 h-4 text-gray-400"}),b.cliente]})}),p.jsx(_e,{children:p.jsx("p",{className:"max-w-xs truncate",title:b.descripcionFallo,children:b.descripcionFallo})}),p.jsx(_e,{children:p.jsxs(Mt,{className:m(b.estado),children:[g(b.estado),b.estado.replace("_"," ")]})}),p.jsx(_e,{children:p.jsx(Mt,{className:v(b.prioridad),children:b.prioridad})}),p.jsx(_e,{children:p.jsxs("div",{className:"flex items-center gap-1 text-sm",children:[p.jsx(Jn,{className:"w-3 h-3"}),new Date(b.fechaDiagnostico).toLocaleDateString("es-ES")]})}),p.jsx(_e,{children:p.jsxs("span",{className:"font-medium text-green-600",children:["€",b.costoEstimado]})}),p.jsx(_e,{children:p.jsxs("div",{className:"flex gap-2",children:[p.jsxs(Ah,{children:[p.jsx(Eh,{asChild:!0,children:p.jsx(Pe,{size:"sm",variant:"outline",children:p.jsx(Ed,{className:"w-4 h-4"})})}),p.jsxs(Th,{className:"max-w-3xl",children:[p.jsx(Ch,{children:p.jsx(Nh,{children:"Detalle del Diagnóstico"})}),p.jsx(w,{diagnostic:b,onClose:()=>{}})]})]}),e!=="recepcionista"&&p.jsx(Pe,{size:"sm",variant:"outline",children:p.jsx(Cd,{className:"w-4 h-4"})})]})})]},b.id))})]})})]})]})},fie=({userRole:e})=>{const[t,n]=T.useState(""),[r,i]=T.useState("todos"),[l]=T.useState([{id:1,diagnosticoId:1,vehiculo:"BMW X3 - 1234ABC",repuesto:"Pastillas de freno delanteras",cantidad:1,estado:"solicitado",fechaSolicitud:"2024-12-20T10:30:00",proveedorSeleccionado:null,precioMejorOferta:null,tiempoEntrega:null,cotizaciones:[{proveedor:"Repuestos Málaga Centro",precio:85,tiempoEntrega:"24h",tipo:"nuevo"},{proveedor:"Desguace del Sur",precio:45,tiempoEntrega:"48h",tipo:"usado"}]},{id:2,diagnosticoId:1,vehiculo:"BMW X3 - 1234ABC",repuesto:"Discos de freno delanteros",cantidad:2,estado:"cotizado",fechaSolicitud:"2024-12-20T10:30:00",proveedorSeleccionado:"Repuestos Málaga Centro",precioMejorOferta:120,tiempoEntrega:"24h",cotizaciones:[{proveedor:"Repuestos Málaga Centro",precio:120,tiempoEntrega:"24h",tipo:"nuevo"},{proveedor:"AutoRecambios Andalucía",precio:135,tiempoEntrega:"48h",tipo:"nuevo"}]},{id:3,diagnosticoId:2,vehiculo:"Mercedes C200 - 5678DEF",repuesto:"Aceite motor 5W-30",cantidad:5,estado:"pedido",fechaSolicitud:"2024-12-18T11:15:00",proveedorSeleccionado:"Repuestos Málaga Centro",precioMejorOferta:35,tiempoEntrega:"24h",cotizaciones:[]},{id:4,diagnosticoId:3,vehiculo:"Audi A4 - 9012GHI",repuesto:"Alternador",cantidad:1,estado:"recibido",fechaSolicitud:"2024-12-22T14:30:00",proveedorSeleccionado:"Desguace del Sur",precioMejorOferta:180,tiempoEntrega:"48h",cotizaciones:[]}]),[s]=T.useState([{id:1,nombre:"Repuestos Málaga Centro",email:"sorin.villamatica@gmail.com",tipo:"nuevo",tiempoRespuesta:"2-4h",activo:!0},{id:2,nombre:"AutoRecambios Andalucía",email:"info@autorecambios.com",tipo:"nuevo",tiempoRespuesta:"4-6h",activo:!0},{id:3,nombre:"Desguace del Sur",email:"mov.sinbarreras@gmail.com",tipo:"usado",tiempoRespuesta:"6-12h",activo:!0},{id:4,nombre:"EcoDesguaces Málaga",email:"info@ecodesguaces.com",tipo:"usado",tiempoRespuesta:"12-24h",activo:!1}]),u=x=>{switch(x){case"solicitado":return"bg-yellow-100 text-yellow-800";case"cotizado":return"bg-blue-100 text-blue-800";case"pedido":return"bg-purple-100 text-purple-800";case"recibido":return"bg-green-100 text-green-800";case"cancelado":return"bg-red-100 text-red-800";default:return"bg-gray-100 text-gray-800"}},f=x=>{switch(x){case"solicitado":return p.jsx(ei,{className:"w-4 h-4"});case"cotizado":return p.jsx(Yi,{className:"w-4 h-4"});case"pedido":return p.jsx(hr,{className:"w-4 h-4"});case"recibido":return p.jsx(jl,{className:"w-4 h-4"});case"cancelado":return p.jsx(Bh,{className:"w-4 h-4"});default:return p.jsx(Td,{className:"w-4 h-4"})}},d=x=>x==="nuevo"?"bg-blue-100 text-blue-800":"bg-green-100 text-green-800",m=l.filter(x=>{const j=x.repuesto.toLowerCase().includes(t.toLowerCase())||x.vehiculo.toLowerCase().includes(t.toLowerCase()),w=r==="todos"||x.estado===r;return j&&w}),v=x=>{console.log("Enviando solicitud de cotización para:",x)},g=(x,j,w)=>{console.log("Seleccionando proveedor:",j,"para solicitud:",x)};return p.jsxs("div",{className:"space-y-6",children:[p.jsx("div",{className:"flex justify-between items-center",children:p.jsxs("div",{children:[p.jsx("h1",{className:"text-3xl font-bold text-gray-900",children:"Gestión de Repuestos"}),p.jsx("p",{className:"text-gray-600",children:"Solicitudes automáticas y gestión de proveedores"})]})}),p.jsxs("div",{className:"flex gap-4",children:[p.jsxs("div",{className:"relative max-w-md",children:[p.jsx(qh,{className:"absolute left-3 top-1/2 transform -translate-y-1/2 text-gray-400 w-4 h-4"}),p.jsx(Ie,{placeholder:"Buscar repuestos...",value:t,onChange:x=>n(x.target.value),className:"pl-10"})]}),p.jsxs(gl,{value:r,onValueChange:i,children:[p.jsx(xl,{className:"w-48",children:p.jsx(bl,{})}),p.jsxs(wl,{children:[p.jsx(Ct,{value:"todos",children:"Todos los estados"}),p.jsx(Ct,{value:"solicitado",children:"Solicitado"}),p.jsx(Ct,{value:"cotizado",children:"Cotizado"}),p.jsx(Ct,{value:"pedido",children:"Pedido"}),p.jsx(Ct,{value:"recibido",children:"Recibido"})]})]})]}),p.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-4 gap-4",children:[p.jsx(De,{children:p.jsx(ke,{className:"p-4",children:p.jsxs("div",{className:"flex items-center justify-between",children:[p.jsxs("div",{children:[p.jsx("p",{className:"text-sm text-gray-600",children:"Solicitados"}),p.jsx("p",{className:"text-2xl font-bold text-yellow-600",children:l.filter(x=>x.estado==="solicitado").length})]}),p.jsx(ei,{className:"w-8 h-8 text-yellow-600"})]})})}),p.jsx(De,{children:p.jsx(ke,{className:"p-4",children:p.jsxs("div",{className:"flex items-center justify-between",children:[p.jsxs("div",{children:[p.jsx("p",{className:"text-sm text-gray-600",children:"Cotizados"}),p.jsx("p",{className:"text-2xl font-bold text-blue-600",children:l.filter(x=>x.estado==="cotizado").length})]}),p.jsx(Yi,{className:"w-8 h-8 text-blue-600"})]})})}),p.jsx(De,{children:p.jsx(ke,{className:"p-4",children:p.jsxs("div",{className:"flex items-center justify-between",children:[p.jsxs("div",{children:[p.jsx("p",{className:"text-sm text-gray-600",children:"Pedidos"}),p.jsx("p",{className:"text-2xl font-bold text-purple-600",children:l.filter(x=>x.estado==="pedido").length})]}),p.jsx(VA,{className:"w-8 h-8 text-purple-600"})]})})}),p.jsx(De,{children:p.jsx(ke,{className:"p-4",children:p.jsxs("div",{className:"flex items-center justify-between",children:[p.jsxs("div",{children:[p.jsx("p",{className:"text-sm text-gray-600",children:"Recibidos"}),p.jsx("p",{className:"text-2xl font-bold text-green-600",children:l.filter(x=>x.estado==="recibido").length})]}),p.jsx(jl,{className:"w-8 h-8 text-green-600"})]})})})]}),p.jsxs(De,{children:[p.jsxs(pt,{children:[p.jsx(mt,{children:"Solicitudes de Repuestos"}),p.jsxs(nn,{children:[m.length," solicitudes encontradas"]})]}),p.jsx(ke,{children:p.jsxs(sa,{children:[p.jsx(ca,{children:p.jsxs(Wt,{children:[p.jsx(Oe,{children:"Repuesto"}),p.jsx(Oe,{children:"Vehículo"}),p.jsx(Oe,{children:"Cantidad"}),p.jsx(Oe,{children:"Estado"}),p.jsx(Oe,{children:"Fecha Solicitud"}),p.jsx(Oe,{children:"Mejor Oferta"}),p.jsx(Oe,{children:"Proveedor"}),p.jsx(Oe,{children:"Acciones"})]})}),p.jsx(ua,{children:m.map(x=>p.jsxs(Wt,{children:[p.jsx(_e,{children:p.jsxs("div",{children:[p.jsx("p",{className:"font-medium",children:x.repuesto}),x.cotizaciones.length>0&&p.jsxs("p",{className:"text-sm text-gray-500",children:[x.cotizaciones.length," cotización",x.cotizaciones.length!==1?"es":""]})]})}),p.jsx(_e,{children:x.vehiculo}),p.jsx(_e,{children:x.cantidad}),p.jsx(_e,{children:p.jsxs(Mt,{className:u(x.estado),children:[f(x.estado),x.estado]})}),p.jsx(_e,{children:new Date(x.fechaSolicitud).toLocaleDateString("es-ES")}),p.jsx(_e,{children:x.precioMejorOferta?p.jsxs("span",{className:"font-medium text-green-600",children:["€",x.precioMejorOferta]}):p.jsx("span",{className:"text-gray-400",children:"-"})}),p.jsx(_e,{children:x.proveedorSeleccionado||p.jsx("span",{className:"text-gray-400",children:"-"})}),p.jsx(_e,{children:p.jsxs("div",{className:"flex gap-2",children:[x.estado==="solicitado"&&p.jsxs(Pe,{size:"sm",onClick:()=>v(x.id),children:[p.jsx(Ez,{className:"w-4 h-4 mr-1"}),"Reenviar"]}),x.estado==="cotizado"&&p.jsxs(Pe,{size:"sm",onClick:()=>g(x.id,x.proveedorSeleccionado,x.precioMejorOferta),children:[p.jsx(VA,{className:"w-4 h-4 mr-1"}),"Pedir"]})]})})]},x.id))})]})})]}),m.some(x=>x.cotizaciones.length>0)&&p.jsxs(De,{children:[p.jsxs(pt,{children:[p.jsx(mt,{children:"Cotizaciones Recibidas"}),p.jsx(nn,{children:"Comparación de ofertas de proveedores"})]}),p.jsx(ke,{children:p.jsx("div",{className:"space-y-4",children:m.filter(x=>x.cotizaciones.length>0).map(x=>p.jsxs("div",{className:"border rounded-lg p-4",children:[p.jsxs("h4",{className:"font-medium mb-3",children:[x.repuesto," - ",x.vehiculo]}),p.jsx("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-3",children:x.cotizaciones.map((j,w)=>p.jsxs("div",{className:`p-3 border rounded-lg ${j.proveedor===x.proveedorSeleccionado?"border-green-500 bg-green-50":"border-gray-200"}`,children:[p.jsxs("div",{className:"flex justify-between items-start mb-2",children:[p.jsx("p",{className:"font-medium",children:j.proveedor}),p.jsx(Mt,{className:d(j.tipo),children:j.tipo})]}),p.jsxs("p",{className:"text-lg font-bold text-green-600",children:["€",j.precio]}),p.jsxs("p",{className:"text-sm text-gray-500",children:["Entrega: ",j.tiempoEntrega]}),j.proveedor===x.proveedorSeleccionado&&p.jsx(Mt,{className:"mt-2 bg-green-100 text-green-800",children:"Seleccionado"})]},w))})]},x.id))})})]}),p.jsxs(De,{children:[p.jsxs(pt,{children:[p.jsx(mt,{children:"Proveedores Registrados"}),p.jsx(nn,{children:"Lista de proveedores para solicitudes automáticas"})]}),p.jsx(ke,{children:p.jsxs(sa,{children:[p.jsx(ca,{children:p.jsxs(Wt,{children:[p.jsx(Oe,{children:"Proveedor"}),p.jsx(Oe,{children:"Email"}),p.jsx(Oe,{children:"Tipo"}),p.jsx(Oe,{children:"Tiempo Respuesta"}),p.jsx(Oe,{children:"Estado"})]})}),p.jsx(ua,{children:s.map(x=>p.jsxs(Wt,{children:[p.jsx(_e,{className:"font-medium",children:x.nombre}),p.jsx(_e,{children:x.email}),p.jsx(_e,{children:p.jsx(Mt,{className:d(x.tipo),children:x.tipo})}),p.jsx(_e,{children:x.tiempoRespuesta}),p.jsx(_e,{children:p.jsx(Mt,{className:x.activo?"bg-green-100 text-green-800":"bg-red-100 text-red-800",children:x.activo?"Activo":"Inactivo"})})]},x.id))})]})})]})]})},die=({userRole:e})=>{const[t,n]=T.useState(new Date),[r,i]=T.useState("day"),[l]=T.useState([{id:1,diagnosticoId:1,vehiculo:"BMW X3 - 1234ABC",cliente:"Pedro Martínez",tecnico:"Técnico 1",fecha:"2024-12-27",horaInicio:"09:00",horaFin:"11:00",duracionEstimada:"2 horas",estado:"programada",tipo:"reparacion",descripcion:"Cambio de pastillas y discos de freno",observaciones:"Cliente prefiere horario matutino"},{id:2,diagnosticoId:2,vehiculo:"Mercedes C200 - 5678DEF",cliente:"Pedro Martínez",tecnico:"Técnico 1",fecha:"2024-12-27",horaInicio:"11:30",horaFin:"12:30",duracionEstimada:"1 hora",estado:"en_curso",tipo:"mantenimiento",descripcion:"Cambio de aceite y filtros",observaciones:""},{id:3,diagnosticoId:3,vehiculo:"Audi A4 - 9012GHI",cliente:"Laura Gómez",tecnico:"Técnico 1",fecha:"2024-12-27",horaInicio:"14:00",horaFin:"17:00",duracionEstimada:"3 horas",estado:"completada",tipo:"reparacion",descripcion:"Reemplazo de alternador",observaciones:"Trabajo completado satisfactoriamente"},{id:4,vehiculo:"Ford Focus - 3456JKL",cliente:"Carlos Ruiz",tecnico:"Técnico 1",fecha:"2024-12-28",horaInicio:"10:00",horaFin:"12:00",duracionEstimada:"2 horas",estado:"programada",tipo:"diagnostico",descripcion:"Diagnóstico de problema eléctrico",observaciones:"Primera visita del cliente"}]),[s]=T.useState([{id:1,nombre:"Técnico 1",especialidades:["Motor","Frenos","Eléctrico"],disponible:!0},{id:2,nombre:"Técnico 2",especialidades:["Transmisión","Suspensión"],disponible:!1},{id:3,nombre:"Técnico 3",especialidades:["Aire Acondicionado","Eléctrico"],disponible:!0}]),u=g=>{switch(g){case"programada":return"bg-blue-100 text-blue-800";case"en_curso":return"bg-yellow-100 text-yellow-800";case"completada":return"bg-green-100 text-green-800";case"cancelada":return"bg-red-100 text-red-800";default:return"bg-gray-100 text-gray-800"}},f=g=>{switch(g){case"reparacion":return"bg-red-100 text-red-800";case"mantenimiento":return"bg-green-100 text-green-800";case"diagnostico":return"bg-purple-100 text-purple-800";default:return"bg-gray-100 text-gray-800"}},d=l.filter(g=>g.fecha===t.toISOString().split("T")[0]),m=Array.from({length:10},(g,x)=>`${(8+x).toString().padStart(2,"0")}:00`),v=g=>d.find(x=>{const j=x.horaInicio,w=x.horaFin;return g>=j&&g<w});return p.jsxs("div",{className:"space-y-6",children:[p.jsxs("div",{className:"flex justify-between items-center",children:[p.jsxs("div",{children:[p.jsx("h1",{className:"text-3xl font-bold text-gray-900",children:"Gestión de Citas"}),p.jsx("p",{className:"text-gray-600",children:"Programación y seguimiento de citas del taller"})]}),p.jsxs(Pe,{className:"flex items-center gap-2",children:[p.jsx(Ol,{className:"w-4 h-4"}),"Nueva Cita"]})]}),p.jsxs("div",{className:"flex justify-between items-center",children:[p.jsxs("div",{className:"flex items-center gap-4",children:[p.jsx(Pe,{variant:"outline",onClick:()=>{const g=new Date(t);g.setDate(g.getDate()-1),n(g)},children:"← Anterior"}),p.jsx("h2",{className:"text-xl font-semibold",children:t.toLocaleDateString("es-ES",{weekday:"long",year:"numeric",month:"long",day:"numeric"})}),p.jsx(Pe,{variant:"outline",onClick:()=>{const g=new Date(t);g.setDate(g.getDate()+1),n(g)},children:"Siguiente →"})]}),p.jsx(Pe,{variant:"outline",onClick:()=>n(new Date),children:"Hoy"})]}),p.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-4 gap-4",children:[p.jsx(De,{children:p.jsx(ke,{className:"p-4",children:p.jsxs("div",{className:"flex items-center justify-between",children:[p.jsxs("div",{children:[p.jsx("p",{className:"text-sm text-gray-600",children:"Citas Hoy"}),p.jsx("p",{className:"text-2xl font-bold text-blue-600",children:d.length})]}),p.jsx(Jn,{className:"w-8 h-8 text-blue-600"})]})})}),p.jsx(De,{children:p.jsx(ke,{className:"p-4",children:p.jsxs("div",{className:"flex items-center justify-between",children:[p.jsxs("div",{children:[p.jsx("p",{className:"text-sm text-gray-600",children:"En Curso"}),p.jsx("p",{className:"text-2xl font-bold text-yellow-600",children:d.filter(g=>g.estado==="en_curso").length})]}),p.jsx(hr,{className:"w-8 h-8 text-yellow-600"})]})})}),p.jsx(De,{children:p.jsx(ke,{className:"p-4",children:p.jsxs("div",{className:"flex items-center justify-between",children:[p.jsxs("div",{children:[p.jsx("p",{className:"text-sm text-gray-600",children:"Completadas"}),p.jsx("p",{className:"text-2xl font-bold text-green-600",children:d.filter(g=>g.estado==="completada").length})]}),p.jsx(Jn,{className:"w-8 h-8 text-green-600"})]})})}),p.jsx(De,{children:p.jsx(ke,{className:"p-4",children:p.jsxs("div",{className:"flex items-center justify-between",children:[p.jsxs("div",{children:[p.jsx("p",{className:"text-sm text-gray-600",children:"Técnicos Disponibles"}),p.jsx("p",{className:"text-2xl font-bold text-purple-600",children:s.filter(g=>g.disponible).length})]}),p.jsx(Dc,{className:"w-8 h-8 text-purple-600"})]})})})]}),p.jsxs("div",{className:"grid grid-cols-1 lg:grid-cols-3 gap-6",children:[p.jsx("div",{className:"lg:col-span-2",children:p.jsxs(De,{children:[p.jsxs(pt,{children:[p.jsxs(mt,{className:"flex items-center gap-2",children:[p.jsx(Jn,{className:"w-5 h-5"}),"Agenda del Día"]}),p.jsxs(nn,{children:["Programación de citas para ",t.toLocaleDateString("es-ES")]})]}),p.jsx(ke,{children:p.jsx("div",{className:"space-y-2",children:m.map(g=>{const x=v(g);return p.jsxs("div",{className:"flex items-center gap-4 p-2 border-b",children:[p.jsx("div",{className:"w-16 text-sm font-medium text-gray-500",children:g}),p.jsx("div",{className:"flex-1",children:x?p.jsxs("div",{className:"p-3 bg-blue-50 border border-blue-200 rounded-lg",children:[p.jsxs("div",{className:"flex justify-between items-start mb-2",children:[p.jsxs("div",{children:[p.jsx("p",{className:"font-medium",children:x.vehiculo}),p.jsx("p",{className:"text-sm text-gray-600",children:x.cliente})]}),p.jsxs("div",{className:"flex gap-2",children:[p.jsx(Mt,{className:u(x.estado),children:x.estado}),p.jsx(Mt,{className:f(x.tipo),children:x.tipo})]})]}),p.jsx("p",{className:"text-sm mb-2",children:x.descripcion}),p.jsxs("div",{className:"flex justify-between items-center text-xs text-gray-500",children:[p.jsxs("span",{children:["👨‍🔧 ",x.tecnico]}),p.jsxs("span",{children:["⏱️ ",x.horaInicio," - ",x.horaFin]})]})]}):p.jsx("div",{className:"p-3 text-gray-400 text-center border-2 border-dashed border-gray-200 rounded-lg",children:"Disponible"})})]},g)})})})]})}),p.jsxs("div",{className:"space-y-6",children:[p.jsxs(De,{children:[p.jsx(pt,{children:p.jsxs(mt,{className:"flex items-center gap-2",children:[p.jsx(hr,{className:"w-5 h-5"}),"Próximas Citas"]})}),p.jsx(ke,{children:p.jsx("div",{className:"space-y-3",children:l.filter(g=>new Date(g.fecha+"T"+g.horaInicio)>new Date).slice(0,3).map(g=>p.jsxs("div",{className:"p-3 border rounded-lg",children:[p.jsxs("div",{className:"flex justify-between items-start mb-2",children:[p.jsxs("div",{children:[p.jsx("p",{className:"font-medium text-sm",children:g.vehiculo}),p.jsx("p",{className:"text-xs text-gray-600",children:g.cliente})]}),p.jsx(Mt,{className:u(g.estado),size:"sm",children:g.estado})]}),p.jsxs("div",{className:"flex items-center gap-2 text-xs text-gray-500",children:[p.jsx(Jn,{className:"w-3 h-3"}),new Date(g.fecha).toLocaleDateString("es-ES"),p.jsx(hr,{className:"w-3 h-3"}),g.horaInicio]})]},g.id))})})]}),p.jsxs(De,{children:[p.jsx(pt,{children:p.jsxs(mt,{className:"flex items-center gap-2",children:[p.jsx(Dc,{className:"w-5 h-5"}),"Estado de Técnicos"]})}),p.jsx(ke,{children:p.jsx("div",{className:"space-y-3",children:s.map(g=>p.jsxs("div",{className:"flex justify-between items-center p-2 border rounded",children:[p.jsxs("div",{children:[p.jsx("p",{className:"font-medium text-sm",children:g.nombre}),p.jsx("p",{className:"text-xs text-gray-600",children:g.especialidades.join(", ")})]}),p.jsx(Mt,{className:g.disponible?"bg-green-100 text-green-800":"bg-red-100 text-red-800",children:g.disponible?"Disponible":"Ocupado"})]},g.id))})})]}),p.jsxs(De,{children:[p.jsx(pt,{children:p.jsx(mt,{children:"Resumen del Día"})}),p.jsx(ke,{children:p.jsxs("div",{className:"space-y-2 text-sm",children:[p.jsxs("div",{className:"flex justify-between",children:[p.jsx("span",{children:"Total de citas:"}),p.jsx("span",{className:"font-medium",children:d.length})]}),p.jsxs("div",{className:"flex justify-between",children:[p.jsx("span",{children:"Horas ocupadas:"}),p.jsxs("span",{className:"font-medium",children:[d.reduce((g,x)=>{const j=parseInt(x.horaInicio.split(":")[0]),w=parseInt(x.horaFin.split(":")[0]);return g+(w-j)},0),"h"]})]}),p.jsxs("div",{className:"flex justify-between",children:[p.jsx("span",{children:"Tiempo libre:"}),p.jsxs("span",{className:"font-medium text-green-600",children:[10-d.reduce((g,x)=>{const j=parseInt(x.horaInicio.split(":")[0]),w=parseInt(x.horaFin.split(":")[0]);return g+(w-j)},0),"h"]})]})]})})]})]})]})]})},hie=({userRole:e})=>{const[t,n]=T.useState(""),[r,i]=T.useState("todos"),[l,s]=T.useState(null),[u]=T.useState([{id:1,numeroFactura:"FT001",diagnosticoId:3,vehiculo:"Audi A4 - 9012GHI",cliente:"Laura Gómez",fechaEmision:"2024-12-22",fechaVencimiento:"2024-01-22",estado:"enviada",subtotalRepuestos:180,margenRepuestos:54,subtotalManoObra:105,iva:71.19,total:410.19,detalleRepuestos:[{descripcion:"Alternador (usado)",precio:180,margen:30,precioFinal:234}],detalleManoObra:[{descripcion:"Reemplazo de alternador",horas:3,tarifa:35,total:105}]},{id:2,numeroFactura:"FT002",diagnosticoId:1,vehiculo:"BMW X3 - 1234ABC",cliente:"Pedro Martínez",fechaEmision:"2024-12-23",fechaVencimiento:"2024-01-23",estado:"borrador",subtotalRepuestos:205,margenRepuestos:41,subtotalManoObra:70,iva:66.36,total:382.36,detalleRepuestos:[{descripcion:"Pastillas de freno (nuevas)",precio:85,margen:20,precioFinal:102},{descripcion:"Discos de freno (nuevos)",precio:120,margen:20,precioFinal:144}],detalleManoObra:[{descripcion:"Cambio de pastillas y discos",horas:2,tarifa:35,total:70}]},{id:3,numeroFactura:"FT003",diagnosticoId:2,vehiculo:"Mercedes C200 - 5678DEF",cliente:"Pedro Martínez",fechaEmision:"2024-12-20",fechaVencimiento:"2024-01-20",estado:"pagada",subtotalRepuestos:55,margenRepuestos:11,subtotalManoObra:35,iva:21.21,total:122.21,detalleRepuestos:[{descripcion:"Aceite motor 5W-30 (5L)",precio:35,margen:20,precioFinal:42},{descripcion:"Filtro de aceite",precio:12,margen:20,precioFinal:14.4},{descripcion:"Filtro de aire",precio:8,margen:20,precioFinal:9.6}],detalleManoObra:[{descripcion:"Cambio de aceite y filtros",horas:1,tarifa:35,total:35}]}]),f=j=>{switch(j){case"borrador":return"bg-gray-100 text-gray-800";case"enviada":return"bg-blue-100 text-blue-800";case"pagada":return"bg-green-100 text-green-800";case"vencida":return"bg-red-100 text-red-800";default:return"bg-gray-100 text-gray-800"}},d=j=>{switch(j){case"borrador":return p.jsx(wd,{className:"w-4 h-4"});case"enviada":return p.jsx(ei,{className:"w-4 h-4"});case"pagada":return p.jsx(jl,{className:"w-4 h-4"});case"vencida":return p.jsx(Bh,{className:"w-4 h-4"});default:return p.jsx(hr,{className:"w-4 h-4"})}},m=u.filter(j=>{const w=j.numeroFactura.toLowerCase().includes(t.toLowerCase())||j.cliente.toLowerCase().includes(t.toLowerCase())||j.vehiculo.toLowerCase().includes(t.toLowerCase()),b=r==="todos"||j.estado===r;return w&&b}),v=u.filter(j=>j.estado==="pagada").reduce((j,w)=>j+w.total,0),g=u.filter(j=>j.estado==="enviada").length,x=({invoice:j})=>j?p.jsxs("div",{className:"space-y-6",children:[p.jsxs("div",{className:"flex justify-between items-start",children:[p.jsxs("div",{children:[p.jsxs("h3",{className:"text-2xl font-bold",children:["Factura ",j.numeroFactura]}),p.jsx("p",{className:"text-gray-600",children:j.vehiculo}),p.jsx("p",{className:"text-gray-600",children:j.cliente})]}),p.jsxs("div",{className:"text-right",children:[p.jsxs(Mt,{className:f(j.estado),size:"lg",children:[d(j.estado),j.estado]}),p.jsxs("p",{className:"text-sm text-gray-500 mt-2",children:["Emitida: ",new Date(j.fechaEmision).toLocaleDateString("es-ES")]}),p.jsxs("p",{className:"text-sm text-gray-500",children:["Vence: ",new Date(j.fechaVencimiento).toLocaleDateString("es-ES")]})]})]}),p.jsxs("div",{className:"bg-gray-50 p-4 rounded-lg",children:[p.jsx("h4",{className:"font-semibold mb-2",children:"Datos del Taller"}),p.jsxs("div",{className:"grid grid-cols-2 gap-4 text-sm",children:[p.jsxs("div",{children:[p.jsxs("p",{children:[p.jsx("strong",{children:"Nombre:"})," Sorin Tomoiaga Coman"]}),p.jsxs("p",{children:[p.jsx("strong",{children:"DNI:"})," 046322922T"]}),p.jsxs("p",{children:[p.jsx("strong",{children:"Teléfono:"})," 660955277"]})]}),p.jsxs("div",{children:[p.jsxs("p",{children:[p.jsx("strong",{children:"Dirección:"})," Cervantes, 43"]}),p.jsxs("p",{children:[p.jsx("strong",{children:"Email:"})," sorin20122@gmail.com"]}),p.jsxs("p",{children:[p.jsx("strong",{children:"Contacto:"})," Sorin"]})]})]})]}),p.jsxs("div",{children:[p.jsx("h4",{className:"font-semibold mb-3",children:"Repuestos"}),p.jsxs(sa,{children:[p.jsx(ca,{children:p.jsxs(Wt,{children:[p.jsx(Oe,{children:"Descripción"}),p.jsx(Oe,{children:"Precio Base"}),p.jsx(Oe,{children:"Margen"}),p.jsx(Oe,{children:"Precio Final"})]})}),p.jsx(ua,{children:j.detalleRepuestos.map((w,b)=>p.jsxs(Wt,{children:[p.jsx(_e,{children:w.descripcion}),p.jsxs(_e,{children:["€",w.precio]}),p.jsxs(_e,{children:[w.margen,"%"]}),p.jsxs(_e,{className:"font-medium",children:["€",w.precioFinal]})]},b))})]})]}),p.jsxs("div",{children:[p.jsx("h4",{className:"font-semibold mb-3",children:"Mano de Obra"}),p.jsxs(sa,{children:[p.jsx(ca,{children:p.jsxs(Wt,{children:[p.jsx(Oe,{children:"Descripción"}),p.jsx(Oe,{children:"Horas"}),p.jsx(Oe,{children:"Tarifa/Hora"}),p.jsx(Oe,{children:"Total"})]})}),p.jsx(ua,{children:j.detalleManoObra.map((w,b)=>p.jsxs(Wt,{children:[p.jsx(_e,{children:w.descripcion}),p.jsxs(_e,{children:[w.horas,"h"]}),p.jsxs(_e,{children:["€",w.tarifa]}),p.jsxs(_e,{className:"font-medium",children:["€",w.total]})]},b))})]})]}),p.jsx("div",{className:"bg-gray-50 p-4 rounded-lg",children:p.jsxs("div",{className:"space-y-2",children:[p.jsxs("div",{className:"flex justify-between",children:[p.jsx("span",{children:"Subtotal Repuestos:"}),p.jsxs("span",{children:["€",(j.subtotalRepuestos+j.margenRepuestos).toFixed(2)]})]}),p.jsxs("div",{className:"flex justify-between",children:[p.jsx("span",{children:"Subtotal Mano de Obra:"}),p.jsxs("span",{children:["€",j.subtotalManoObra.toFixed(2)]})]}),p.jsxs("div",{className:"flex justify-between border-t pt-2",children:[p.jsx("span",{children:"Subtotal:"}),p.jsxs("span",{children:["€",(j.subtotalRepuestos+j.margenRepuestos+j.subtotalManoObra).toFixed(2)]})]}),p.jsxs("div",{className:"flex justify-between",children:[p.jsx("span",{children:"IVA (21%):"}),p.jsxs("span",{children:["€",j.iva.toFixed(2)]})]}),p.jsxs("div",{className:"flex justify-between border-t pt-2 text-lg font-bold",children:[p.jsx("span",{children:"Total:"}),p.jsxs("span",{children:["€",j.total.toFixed(2)]})]})]})}),p.jsxs("div",{className:"flex gap-2",children:[p.jsxs(Pe,{className:"flex items-center gap-2",children:[p.jsx(FA,{className:"w-4 h-4"}),"Descargar PDF"]}),p.jsxs(Pe,{variant:"outline",className:"flex items-center gap-2",children:[p.jsx(ei,{className:"w-4 h-4"}),"Enviar por Email"]}),j.estado==="borrador"&&p.jsx(Pe,{variant:"outline",children:"Marcar como Enviada"}),j.estado==="enviada"&&p.jsx(Pe,{variant:"outline",children:"Marcar como Pagada"})]})]}):null;return p.jsxs("div",{className:"space-y-6",children:[p.jsxs("div",{className:"flex justify-between items-center",children:[p.jsxs("div",{children:[p.jsx("h1",{className:"text-3xl font-bold text-gray-900",children:"Gestión de Facturas"}),p.jsx("p",{className:"text-gray-600",children:"Generación automática y seguimiento de facturas"})]}),p.jsxs(Pe,{className:"flex items-center gap-2",children:[p.jsx(Ol,{className:"w-4 h-4"}),"Nueva Factura"]})]}),p.jsxs("div",{className:"flex gap-4",children:[p.jsxs("div",{className:"relative max-w-md",children:[p.jsx(qh,{className:"absolute left-3 top-1/2 transform -translate-y-1/2 text-gray-400 w-4 h-4"}),p.jsx(Ie,{placeholder:"Buscar facturas...",value:t,onChange:j=>n(j.target.value),className:"pl-10"})]}),p.jsxs(gl,{value:r,onValueChange:i,children:[p.jsx(xl,{className:"w-48",children:p.jsx(bl,{})}),p.jsxs(wl,{children:[p.jsx(Ct,{value:"todos",children:"Todos los estados"}),p.jsx(Ct,{value:"borrador",children:"Borrador"}),p.jsx(Ct,{value:"enviada",children:"Enviada"}),p.jsx(Ct,{value:"pagada",children:"Pagada"}),p.jsx(Ct,{value:"vencida",children:"Vencida"})]})]})]}),p.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-4 gap-4",children:[p.jsx(De,{children:p.jsx(ke,{className:"p-4",children:p.jsxs("div",{className:"flex items-center justify-between",children:[p.jsxs("div",{children:[p.jsx("p",{className:"text-sm text-gray-600",children:"Total Facturas"}),p.jsx("p",{className:"text-2xl font-bold text-blue-600",children:u.length})]}),p.jsx(wd,{className:"w-8 h-8 text-blue-600"})]})})}),p.jsx(De,{children:p.jsx(ke,{className:"p-4",children:p.jsxs("div",{className:"flex items-center justify-between",children:[p.jsxs("div",{children:[p.jsx("p",{className:"text-sm text-gray-600",children:"Pendientes"}),p.jsx("p",{className:"text-2xl font-bold text-orange-600",children:g})]}),p.jsx(hr,{className:"w-8 h-8 text-orange-600"})]})})}),p.jsx(De,{children:p.jsx(ke,{className:"p-4",children:p.jsxs("div",{className:"flex items-center justify-between",children:[p.jsxs("div",{children:[p.jsx("p",{className:"text-sm text-gray-600",children:"Pagadas"}),p.jsx("p",{className:"text-2xl font-bold text-green-600",children:u.filter(j=>j.estado==="pagada").length})]}),p.jsx(jl,{className:"w-8 h-8 text-green-600"})]})})}),p.jsx(De,{children:p.jsx(ke,{className:"p-4",children:p.jsxs("div",{className:"flex items-center justify-between",children:[p.jsxs("div",{children:[p.jsx("p",{className:"text-sm text-gray-600",children:"Ingresos"}),p.jsxs("p",{className:"text-2xl font-bold text-purple-600",children:["€",v.toFixed(0)]})]}),p.jsx(Yi,{className:"w-8 h-8 text-purple-600"})]})})})]}),p.jsxs("div",{className:"grid grid-cols-1 lg:grid-cols-3 gap-6",children:[p.jsx("div",{className:"lg:col-span-2",children:p.jsxs(De,{children:[p.jsxs(pt,{children:[p.jsx(mt,{children:"Lista de Facturas"}),p.jsxs(nn,{children:[m.length," facturas encontradas"]})]}),p.jsx(ke,{children:p.jsxs(sa,{children:[p.jsx(ca,{children:p.jsxs(Wt,{children:[p.jsx(Oe,{children:"Factura"}),p.jsx(Oe,{children:"Cliente"}),p.jsx(Oe,{children:"Fecha"}),p.jsx(Oe,{children:"Estado"}),p.jsx(Oe,{children:"Total"}),p.jsx(Oe,{children:"Acciones"})]})}),p.jsx(ua,{children:m.map(j=>p.jsxs(Wt,{className:(l==null?void 0:l.id)===j.id?"bg-blue-50":"",children:[p.jsx(_e,{children:p.jsxs("div",{children:[p.jsx("p",{className:"font-medium",children:j.numeroFactura}),p.jsx("p",{className:"text-sm text-gray-500",children:j.vehiculo})]})}),p.jsx(_e,{children:p.jsxs("div",{className:"flex items-center gap-2",children:[p.jsx(Dc,{className:"w-4 h-4 text-gray-400"}),j.cliente]})}),p.jsx(_e,{children:p.jsxs("div",{className:"flex items-center gap-1 text-sm",children:[p.jsx(Jn,{className:"w-3 h-3"}),new Date(j.fechaEmision).toLocaleDateString("es-ES")]})}),p.jsx(_e,{children:p.jsxs(Mt,{className:f(j.estado),children:[d(j.estado),j.estado]})}),p.jsx(_e,{children:p.jsxs("span",{className:"font-medium text-green-600",children:["€",j.total.toFixed(2)]})}),p.jsx(_e,{children:p.jsxs("div",{className:"flex gap-2",children:[p.jsx(Pe,{size:"sm",variant:"outline",onClick:()=>s(j),children:p.jsx(Ed,{className:"w-4 h-4"})}),p.jsx(Pe,{size:"sm",variant:"outline",children:p.jsx(FA,{className:"w-4 h-4"})}),p.jsx(Pe,{size:"sm",variant:"outline",children:p.jsx(ei,{className:"w-4 h-4"})})]})})]},j.id))})]})})]})}),p.jsx("div",{children:p.jsxs(De,{children:[p.jsx(pt,{children:p.jsx(mt,{children:"Detalle de Factura"})}),p.jsx(ke,{children:l?p.jsx(x,{invoice:l}):p.jsxs("div",{className:"text-center text-gray-500 py-8",children:[p.jsx(wd,{className:"w-12 h-12 mx-auto mb-4 text-gray-300"}),p.jsx("p",{children:"Selecciona una factura para ver los detalles"})]})})]})})]})]})};var $p="Switch",[pie,Aie]=uo($p),[mie,vie]=pie($p),J$=T.forwardRef((e,t)=>{const{__scopeSwitch:n,name:r,checked:i,defaultChecked:l,required:s,disabled:u,value:f="on",onCheckedChange:d,form:m,...v}=e,[g,x]=T.useState(null),j=St(t,E=>x(E)),w=T.useRef(!1),b=g?m||!!g.closest("form"):!0,[_,O]=Xl({prop:i,defaultProp:l??!1,onChange:d,caller:$p});return p.jsxs(mie,{scope:n,checked:_,disabled:u,children:[p.jsx(Ke.button,{type:"button",role:"switch","aria-checked":_,"aria-required":s,"data-state":rL(_),"data-disabled":u?"":void 0,disabled:u,value:f,...v,ref:j,onClick:Ye(e.onClick,E=>{O(C=>!C),b&&(w.current=E.isPropagationStopped(),w.current||E.stopPropagation())})}),b&&p.jsx(nL,{control:g,bubbles:!w.current,name:r,value:f,checked:_,required:s,disabled:u,form:m,style:{transform:"translateX(-100%)"}})]})});J$.displayName=$p;var eL="SwitchThumb",tL=T.forwardRef((e,t)=>{const{__scopeSwitch:n,...r}=e,i=vie(eL,n);return p.jsx(Ke.span,{"data-state":rL(i.checked),"data-disabled":i.disabled?"":void 0,...r,ref:t})});tL.displayName=eL;var yie="SwitchBubbleInput",nL=T.forwardRef(({__scopeSwitch:e,control:t,checked:n,bubbles:r=!0,...i},l)=>{const s=T.useRef(null),u=St(s,l),f=_$(n),d=p$(t);return T.useEffect(()=>{const m=s.current;if(!m)return;const v=window.HTMLInputElement.prototype,x=Object.getOwnPropertyDescriptor(v,"checked").set;if(f!==n&&x){const j=new Event("click",{bubbles:r});x.call(m,n),m.dispatchEvent(j)}},[f,n,r]),p.jsx("input",{type:"checkbox","aria-hidden":!0,defaultChecked:n,...i,tabIndex:-1,ref:u,style:{...i.style,...d,position:"absolute",pointerEvents:"none",opacity:0,margin:0}})});nL.displayName=yie;function rL(e){return e?"checked":"unchecked"}var aL=J$,gie=tL;const iL=T.forwardRef(({className:e,...t},n)=>p.jsx(aL,{className:We("peer inline-flex h-6 w-11 shrink-0 cursor-pointer items-center rounded-full border-2 border-transparent transition-colors focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring focus-visible:ring-offset-2 focus-visible:ring-offset-background disabled:cursor-not-allowed disabled:opacity-50 data-[state=checked]:bg-primary data-[state=unchecked]:bg-input",e),...t,ref:n,children:p.jsx(gie,{className:We("pointer-events-none block h-5 w-5 rounded-full bg-background shadow-lg ring-0 transition-transform data-[state=checked]:translate-x-5 data-[state=unchecked]:translate-x-0")})}));iL.displayName=aL.displayName;const bie=({userRole:e})=>{const[t,n]=T.useState("general"),[r,i]=T.useState({nombreTaller:"AutoRepair Pro",propietario:"Sorin Tomoiaga Coman",dni:"046322922T",telefono:"660955277",email:"sorin20122@gmail.com",direccion:"Cervantes, 43",personaContacto:"Sorin",horarioApertura:"08:00",horarioCierre:"18:00",diasLaborales:["lunes","martes","miercoles","jueves","viernes","sabado"]}),[l,s]=T.useState({servidorSMTP:"smtp.gmail.com",puerto:"587",usuario:"sorin20122@gmail.com",contraseña:"****",usarTLS:!0,emailTaller:"sorin20122@gmail.com",plantillaSolicitudRepuesto:`Estimado proveedor,
-
-Solicitamos cotización para el siguiente repuesto:
-
-{repuesto}
-
-Cantidad: {cantidad}
-
-Gracias por su atención.`,plantillaPedidoRepuesto:`Estimado proveedor,
-
-Confirmamos el pedido del siguiente repuesto:
-
-{repuesto}
-Cantidad: {cantidad}
-Precio acordado: €{precio}
-
-Gracias.`,plantillaNotificacionCliente:`Estimado {cliente},
-
-Su vehículo {vehiculo} está programado para reparación el {fecha}.
-
-Por favor, asegúrese de que esté disponible en el taller.
-
-Saludos,
-AutoRepair Pro`}),[u,f]=T.useState({margenRepuestosNuevos:20,margenRepuestosUsados:30,tarifaHoraTecnico1:35,tarifaHoraTecnico2:30,tarifaHoraTecnico3:32,iva:21,descuentoClienteRecurrente:5,recargoPrioridad:15}),[d,m]=T.useState([{id:1,nombre:"Administrador",usuario:"admin",email:"admin@taller.com",rol:"admin",activo:!0,ultimoAcceso:"2024-12-27"},{id:2,nombre:"Técnico Principal",usuario:"tecnico1",email:"tecnico1@taller.com",rol:"tecnico",activo:!0,ultimoAcceso:"2024-12-26"},{id:3,nombre:"Recepcionista",usuario:"recepcion",email:"recepcion@taller.com",rol:"recepcionista",activo:!0,ultimoAcceso:"2024-12-25"}]),v=()=>{console.log("Guardando configuración general:",r)},g=()=>{console.log("Guardando configuración de email:",l)},x=()=>{console.log("Guardando configuración de precios:",u)},j=()=>{console.log("Enviando email de prueba...")},w=b=>{switch(b){case"admin":return"bg-red-100 text-red-800";case"tecnico":return"bg-blue-100 text-blue-800";case"recepcionista":return"bg-green-100 text-green-800";default:return"bg-gray-100 text-gray-800"}};return p.jsxs("div",{className:"space-y-6",children:[p.jsx("div",{className:"flex justify-between items-center",children:p.jsxs("div",{children:[p.jsx("h1",{className:"text-3xl font-bold text-gray-900",children:"Configuración del Sistema"}),p.jsx("p",{className:"text-gray-600",children:"Gestión de configuraciones y parámetros del taller"})]})}),p.jsxs(A3,{value:t,onValueChange:n,children:[p.jsxs(E3,{className:"grid w-full grid-cols-4",children:[p.jsxs(ul,{value:"general",className:"flex items-center gap-2",children:[p.jsx(HA,{className:"w-4 h-4"}),"General"]}),p.jsxs(ul,{value:"email",className:"flex items-center gap-2",children:[p.jsx(ei,{className:"w-4 h-4"}),"Email"]}),p.jsxs(ul,{value:"precios",className:"flex items-center gap-2",children:[p.jsx(Yi,{className:"w-4 h-4"}),"Precios"]}),p.jsxs(ul,{value:"usuarios",className:"flex items-center gap-2",children:[p.jsx(kc,{className:"w-4 h-4"}),"Usuarios"]})]}),p.jsx(fl,{value:"general",className:"space-y-6",children:p.jsxs(De,{children:[p.jsxs(pt,{children:[p.jsxs(mt,{className:"flex items-center gap-2",children:[p.jsx(HA,{className:"w-5 h-5"}),"Información del Taller"]}),p.jsx(nn,{children:"Datos básicos del taller que aparecerán en facturas y comunicaciones"})]}),p.jsxs(ke,{className:"space-y-4",children:[p.jsxs("div",{className:"grid grid-cols-2 gap-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"nombreTaller",children:"Nombre del Taller"}),p.jsx(Ie,{id:"nombreTaller",value:r.nombreTaller,onChange:b=>i({...r,nombreTaller:b.target.value})})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"propietario",children:"Propietario"}),p.jsx(Ie,{id:"propietario",value:r.propietario,onChange:b=>i({...r,propietario:b.target.value})})]})]}),p.jsxs("div",{className:"grid grid-cols-2 gap-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"dni",children:"DNI"}),p.jsx(Ie,{id:"dni",value:r.dni,onChange:b=>i({...r,dni:b.target.value})})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"telefono",children:"Teléfono"}),p.jsx(Ie,{id:"telefono",value:r.telefono,onChange:b=>i({...r,telefono:b.target.value})})]})]}),p.jsxs("div",{className:"grid grid-cols-2 gap-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"email",children:"Email"}),p.jsx(Ie,{id:"email",type:"email",value:r.email,onChange:b=>i({...r,email:b.target.value})})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"personaContacto",children:"Persona de Contacto"}),p.jsx(Ie,{id:"personaContacto",value:r.personaContacto,onChange:b=>i({...r,personaContacto:b.target.value})})]})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"direccion",children:"Dirección"}),p.jsx(Ie,{id:"direccion",value:r.direccion,onChange:b=>i({...r,direccion:b.target.value})})]}),p.jsxs("div",{className:"grid grid-cols-2 gap-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"horarioApertura",children:"Horario de Apertura"}),p.jsx(Ie,{id:"horarioApertura",type:"time",value:r.horarioApertura,onChange:b=>i({...r,horarioApertura:b.target.value})})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"horarioCierre",children:"Horario de Cierre"}),p.jsx(Ie,{id:"horarioCierre",type:"time",value:r.horarioCierre,onChange:b=>i({...r,horarioCierre:b.target.value})})]})]}),p.jsx("div",{className:"flex justify-end",children:p.jsxs(Pe,{onClick:v,className:"flex items-center gap-2",children:[p.jsx(ay,{className:"w-4 h-4"}),"Guardar Configuración"]})})]})]})}),p.jsxs(fl,{value:"email",className:"space-y-6",children:[p.jsxs(De,{children:[p.jsxs(pt,{children:[p.jsxs(mt,{className:"flex items-center gap-2",children:[p.jsx(ei,{className:"w-5 h-5"}),"Configuración SMTP"]}),p.jsx(nn,{children:"Configuración del servidor de email para envío automático"})]}),p.jsxs(ke,{className:"space-y-4",children:[p.jsxs("div",{className:"grid grid-cols-2 gap-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"servidorSMTP",children:"Servidor SMTP"}),p.jsx(Ie,{id:"servidorSMTP",value:l.servidorSMTP,onChange:b=>s({...l,servidorSMTP:b.target.value})})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"puerto",children:"Puerto"}),p.jsx(Ie,{id:"puerto",value:l.puerto,onChange:b=>s({...l,puerto:b.target.value})})]})]}),p.jsxs("div",{className:"grid grid-cols-2 gap-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"usuario",children:"Usuario"}),p.jsx(Ie,{id:"usuario",value:l.usuario,onChange:b=>s({...l,usuario:b.target.value})})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"contraseña",children:"Contraseña"}),p.jsx(Ie,{id:"contraseña",type:"password",value:l.contraseña,onChange:b=>s({...l,contraseña:b.target.value})})]})]}),p.jsxs("div",{className:"flex items-center space-x-2",children:[p.jsx(iL,{id:"usarTLS",checked:l.usarTLS,onCheckedChange:b=>s({...l,usarTLS:b})}),p.jsx(je,{htmlFor:"usarTLS",children:"Usar TLS/SSL"})]}),p.jsxs("div",{className:"flex gap-2",children:[p.jsxs(Pe,{onClick:g,className:"flex items-center gap-2",children:[p.jsx(ay,{className:"w-4 h-4"}),"Guardar"]}),p.jsxs(Pe,{variant:"outline",onClick:j,className:"flex items-center gap-2",children:[p.jsx(Lz,{className:"w-4 h-4"}),"Probar Conexión"]})]})]})]}),p.jsxs(De,{children:[p.jsxs(pt,{children:[p.jsx(mt,{children:"Plantillas de Email"}),p.jsx(nn,{children:"Personaliza las plantillas de email automático"})]}),p.jsxs(ke,{className:"space-y-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"plantillaSolicitud",children:"Solicitud de Repuesto"}),p.jsx(Vi,{id:"plantillaSolicitud",rows:4,value:l.plantillaSolicitudRepuesto,onChange:b=>s({...l,plantillaSolicitudRepuesto:b.target.value})}),p.jsxs("p",{className:"text-xs text-gray-500",children:["Variables disponibles: ","{repuesto}",", ","{cantidad}"]})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"plantillaPedido",children:"Pedido de Repuesto"}),p.jsx(Vi,{id:"plantillaPedido",rows:4,value:l.plantillaPedidoRepuesto,onChange:b=>s({...l,plantillaPedidoRepuesto:b.target.value})}),p.jsxs("p",{className:"text-xs text-gray-500",children:["Variables disponibles: ","{repuesto}",", ","{cantidad}",", ","{precio}"]})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"plantillaCliente",children:"Notificación a Cliente"}),p.jsx(Vi,{id:"plantillaCliente",rows:4,value:l.plantillaNotificacionCliente,onChange:b=>s({...l,plantillaNotificacionCliente:b.target.value})}),p.jsxs("p",{className:"text-xs text-gray-500",children:["Variables disponibles: ","{cliente}",", ","{vehiculo}",", ","{fecha}"]})]})]})]})]}),p.jsx(fl,{value:"precios",className:"space-y-6",children:p.jsxs(De,{children:[p.jsxs(pt,{children:[p.jsxs(mt,{className:"flex items-center gap-2",children:[p.jsx(Yi,{className:"w-5 h-5"}),"Márgenes y Tarifas"]}),p.jsx(nn,{children:"Configuración de precios y márgenes comerciales"})]}),p.jsxs(ke,{className:"space-y-4",children:[p.jsxs("div",{className:"grid grid-cols-2 gap-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"margenNuevos",children:"Margen Repuestos Nuevos (%)"}),p.jsx(Ie,{id:"margenNuevos",type:"number",value:u.margenRepuestosNuevos,onChange:b=>f({...u,margenRepuestosNuevos:parseInt(b.target.value)})})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"margenUsados",children:"Margen Repuestos Usados (%)"}),p.jsx(Ie,{id:"margenUsados",type:"number",value:u.margenRepuestosUsados,onChange:b=>f({...u,margenRepuestosUsados:parseInt(b.target.value)})})]})]}),p.jsxs("div",{className:"grid grid-cols-3 gap-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"tarifa1",children:"Tarifa Técnico 1 (€/h)"}),p.jsx(Ie,{id:"tarifa1",type:"number",value:u.tarifaHoraTecnico1,onChange:b=>f({...u,tarifaHoraTecnico1:parseInt(b.target.value)})})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"tarifa2",children:"Tarifa Técnico 2 (€/h)"}),p.jsx(Ie,{id:"tarifa2",type:"number",value:u.tarifaHoraTecnico2,onChange:b=>f({...u,tarifaHoraTecnico2:parseInt(b.target.value)})})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"tarifa3",children:"Tarifa Técnico 3 (€/h)"}),p.jsx(Ie,{id:"tarifa3",type:"number",value:u.tarifaHoraTecnico3,onChange:b=>f({...u,tarifaHoraTecnico3:parseInt(b.target.value)})})]})]}),p.jsxs("div",{className:"grid grid-cols-3 gap-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"iva",children:"IVA (%)"}),p.jsx(Ie,{id:"iva",type:"number",value:u.iva,onChange:b=>f({...u,iva:parseInt(b.target.value)})})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"descuento",children:"Descuento Cliente Recurrente (%)"}),p.jsx(Ie,{id:"descuento",type:"number",value:u.descuentoClienteRecurrente,onChange:b=>f({...u,descuentoClienteRecurrente:parseInt(b.target.value)})})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"recargo",children:"Recargo Prioridad (%)"}),p.jsx(Ie,{id:"recargo",type:"number",value:u.recargoPrioridad,onChange:b=>f({...u,recargoPrioridad:parseInt(b.target.value)})})]})]}),p.jsx("div",{className:"flex justify-end",children:p.jsxs(Pe,{onClick:x,className:"flex items-center gap-2",children:[p.jsx(ay,{className:"w-4 h-4"}),"Guardar Configuración"]})})]})]})}),p.jsx(fl,{value:"usuarios",className:"space-y-6",children:p.jsxs(De,{children:[p.jsx(pt,{children:p.jsxs("div",{className:"flex justify-between items-center",children:[p.jsxs("div",{children:[p.jsxs(mt,{className:"flex items-center gap-2",children:[p.jsx(kc,{className:"w-5 h-5"}),"Usuarios del Sistema"]}),p.jsx(nn,{children:"Gestión de usuarios y permisos de acceso"})]}),p.jsxs(Pe,{className:"flex items-center gap-2",children:[p.jsx(Ol,{className:"w-4 h-4"}),"Nuevo Usuario"]})]})}),p.jsx(ke,{children:p.jsxs(sa,{children:[p.jsx(ca,{children:p.jsxs(Wt,{children:[p.jsx(Oe,{children:"Usuario"}),p.jsx(Oe,{children:"Email"}),p.jsx(Oe,{children:"Rol"}),p.jsx(Oe,{children:"Estado"}),p.jsx(Oe,{children:"Último Acceso"}),p.jsx(Oe,{children:"Acciones"})]})}),p.jsx(ua,{children:d.map(b=>p.jsxs(Wt,{children:[p.jsx(_e,{children:p.jsxs("div",{children:[p.jsx("p",{className:"font-medium",children:b.nombre}),p.jsxs("p",{className:"text-sm text-gray-500",children:["@",b.usuario]})]})}),p.jsx(_e,{children:b.email}),p.jsx(_e,{children:p.jsx(Mt,{className:w(b.rol),children:b.rol})}),p.jsx(_e,{children:p.jsx(Mt,{className:b.activo?"bg-green-100 text-green-800":"bg-red-100 text-red-800",children:b.activo?"Activo":"Inactivo"})}),p.jsx(_e,{children:new Date(b.ultimoAcceso).toLocaleDateString("es-ES")}),p.jsx(_e,{children:p.jsxs("div",{className:"flex gap-2",children:[p.jsx(Pe,{size:"sm",variant:"outline",children:p.jsx(Cd,{className:"w-4 h-4"})}),p.jsx(Pe,{size:"sm",variant:"outline",children:p.jsx(qz,{className:"w-4 h-4"})})]})})]},b.id))})]})})]})})]})]})},xie=({onLogin:e})=>{const[t,n]=T.useState({username:"",password:"",role:""}),r=l=>{l.preventDefault(),t.username&&t.password&&t.role&&e(t.role)},i=[{value:"admin",label:"Administrador",icon:Rz},{value:"tecnico",label:"Técnico",icon:Ki},{value:"recepcionista",label:"Recepcionista",icon:Ih}];return p.jsx("div",{className:"min-h-screen bg-gradient-to-br from-blue-50 to-indigo-100 flex items-center justify-center p-4",children:p.jsxs("div",{className:"w-full max-w-md",children:[p.jsxs("div",{className:"text-center mb-8",children:[p.jsx("div",{className:"inline-flex items-center justify-center w-16 h-16 bg-blue-600 rounded-full mb-4",children:p.jsx(Ki,{className:"w-8 h-8 text-white"})}),p.jsx("h1",{className:"text-3xl font-bold text-gray-900 mb-2",children:"AutoRepair Pro"}),p.jsx("p",{className:"text-gray-600",children:"Sistema de Gestión de Taller"})]}),p.jsxs(De,{className:"shadow-xl",children:[p.jsxs(pt,{children:[p.jsx(mt,{children:"Iniciar Sesión"}),p.jsx(nn,{children:"Ingresa tus credenciales para acceder al sistema"})]}),p.jsxs(ke,{children:[p.jsxs("form",{onSubmit:r,className:"space-y-4",children:[p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"username",children:"Usuario"}),p.jsx(Ie,{id:"username",type:"text",placeholder:"Ingresa tu usuario",value:t.username,onChange:l=>n({...t,username:l.target.value}),required:!0})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"password",children:"Contraseña"}),p.jsx(Ie,{id:"password",type:"password",placeholder:"Ingresa tu contraseña",value:t.password,onChange:l=>n({...t,password:l.target.value}),required:!0})]}),p.jsxs("div",{className:"space-y-2",children:[p.jsx(je,{htmlFor:"role",children:"Rol"}),p.jsxs(gl,{value:t.role,onValueChange:l=>n({...t,role:l}),children:[p.jsx(xl,{children:p.jsx(bl,{placeholder:"Selecciona tu rol"})}),p.jsx(wl,{children:i.map(l=>{const s=l.icon;return p.jsx(Ct,{value:l.value,children:p.jsxs("div",{className:"flex items-center gap-2",children:[p.jsx(s,{className:"w-4 h-4"}),l.label]})},l.value)})})]})]}),p.jsx(Pe,{type:"submit",className:"w-full",children:"Iniciar Sesión"})]}),p.jsxs("div",{className:"mt-6 p-4 bg-gray-50 rounded-lg",children:[p.jsx("p",{className:"text-sm text-gray-600 mb-2",children:"Credenciales de prueba:"}),p.jsxs("div",{className:"text-xs space-y-1",children:[p.jsxs("p",{children:[p.jsx("strong",{children:"Usuario:"})," admin | ",p.jsx("strong",{children:"Contraseña:"})," admin123"]}),p.jsxs("p",{children:[p.jsx("strong",{children:"Usuario:"})," tecnico | ",p.jsx("strong",{children:"Contraseña:"})," tecnico123"]}),p.jsxs("p",{children:[p.jsx("strong",{children:"Usuario:"})," recepcion | ",p.jsx("strong",{children:"Contraseña:"})," recepcion123"]})]})]})]})]})]})})};function wie(){const[e,t]=T.useState(!1),[n,r]=T.useState("admin"),[i,l]=T.useState(!0),s=f=>{t(!0),r(f)},u=()=>{t(!1),r("")};return e?p.jsx(YB,{children:p.jsxs("div",{className:"flex h-screen bg-gray-50",children:[p.jsx(Xz,{isOpen:i,onToggle:()=>l(!i),userRole:n,onLogout:u}),p.jsx("main",{className:`flex-1 overflow-auto transition-all duration-300 ${i?"ml-64":"ml-16"}`,children:p.jsx("div",{className:"p-6",children:p.jsxs(jB,{children:[p.jsx(ea,{path:"/",element:p.jsx(zP,{userRole:n})}),p.jsx(ea,{path:"/dashboard",element:p.jsx(zP,{userRole:n})}),p.jsx(ea,{path:"/clientes",element:p.jsx(mre,{userRole:n})}),p.jsx(ea,{path:"/diagnosticos",element:p.jsx(uie,{userRole:n})}),p.jsx(ea,{path:"/repuestos",element:p.jsx(fie,{userRole:n})}),p.jsx(ea,{path:"/citas",element:p.jsx(die,{userRole:n})}),p.jsx(ea,{path:"/facturas",element:p.jsx(hie,{userRole:n})}),p.jsx(ea,{path:"/configuracion",element:p.jsx(bie,{userRole:n})})]})})})]})}):p.jsx(xie,{onLogin:s})}Mq.createRoot(document.getElementById("root")).render(p.jsx(T.StrictMode,{children:p.jsx(wie,{})}));
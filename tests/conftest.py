@@ -0,0 +1,98 @@
+import contextlib
+import os
+import shutil
+import sys
+
+# Raíz del proyecto en sys.path para poder importar src.* al ejecutar pytest desde cualquier directorio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import event
+
+from src.main import create_app
+from src.models import db
+from src.utils.datos_sinteticos import generar_datos_sinteticos
+from src.utils.inicializacion import inicializar_base_datos
+
+# Conjunto sintético pequeño: basta para páginas de 50 filas y tarda menos de un segundo
+CLIENTES_PRUEBAS = 40
+
+
+def _crear_app(ruta_db, **config):
+    return create_app({
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{ruta_db}',
+        'CACHE_RESPUESTAS': 'off',
+        'TESTING': True,
+        **config
+    })
+
+
+@pytest.fixture(scope='session')
+def plantilla_db(tmp_path_factory):
+    """Fichero SQLite con el esquema y el conjunto sintético, generado una vez por sesión"""
+    ruta = str(tmp_path_factory.mktemp('plantilla') / 'taller.db')
+    app = _crear_app(ruta)
+    with app.app_context():
+        inicializar_base_datos()
+        generar_datos_sinteticos(1, semilla=7, clientes_por_escala=CLIENTES_PRUEBAS)
+        db.session.remove()
+        db.engine.dispose()
+    return ruta
+
+
+@pytest.fixture
+def crear_app(plantilla_db, tmp_path):
+    """Fábrica de apps sobre copias de la plantilla propias de cada test, una por nombre de fichero"""
+    apps = []
+    
+    def fabrica(nombre_db='taller.db', **config):
+        ruta = str(tmp_path / nombre_db)
+        if not os.path.exists(ruta):
+            shutil.copyfile(plantilla_db, ruta)
+        app = _crear_app(ruta, **config)
+        apps.append(app)
+        return app
+    
+    yield fabrica
+    for app in apps:
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+
+@pytest.fixture
+def app(crear_app):
+    return crear_app()
+
+
+@pytest.fixture
+def cliente(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def cliente_medido(crear_app):
+    """Cliente de una app con INSTRUMENTACION_SQL: cada respuesta lleva X-Query-Count"""
+    return crear_app(INSTRUMENTACION_SQL=True).test_client()
+
+
+@pytest.fixture
+def contar_consultas(app):
+    """Context manager que cuenta las sentencias SQL enviadas al engine dentro del bloque"""
+    with app.app_context():
+        engine = db.engine
+    
+    @contextlib.contextmanager
+    def contador():
+        cuenta = [0]
+        
+        def anotar(*args):
+            cuenta[0] += 1
+        
+        event.listen(engine, 'before_cursor_execute', anotar)
+        try:
+            yield cuenta
+        finally:
+            event.remove(engine, 'before_cursor_execute', anotar)
+    
+    return contador
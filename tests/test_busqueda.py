@@ -0,0 +1,65 @@
+import pytest
+
+from src.models import db
+from src.models.cliente import Cliente
+from src.models.vehiculo import Vehiculo
+from src.utils.busqueda import crear_indices_busqueda
+
+
+@pytest.fixture
+def cliente_buscado(app):
+    with app.app_context():
+        cliente = Cliente(
+            nombre_completo='Eulalia Zubizarreta', dni='1234QWK', telefono='+34 611 222 333',
+            email='eulalia@taller.com', direccion='Calle Prueba 2', persona_contacto='Eulalia'
+        )
+        db.session.add(cliente)
+        db.session.flush()
+        db.session.add(Vehiculo(
+            cliente_id=cliente.id, marca='Lancia', modelo='Delta', año=1992, matricula='9876QWZ',
+            numero_bastidor='ZLA83100000547321', kilometraje=210000
+        ))
+        db.session.commit()
+        return cliente.id
+
+
+def _ids(cliente, ruta):
+    respuesta = cliente.get(ruta)
+    assert respuesta.status_code == 200
+    return [fila['id'] for fila in respuesta.get_json()['data']]
+
+
+@pytest.mark.parametrize('termino', ['zubiz', 'eulalia zubizarreta', 'QWK', '1234qwk', '222 333', '611222'])
+def test_clientes_por_nombre_o_fragmento_de_identificador(cliente, cliente_buscado, termino):
+    assert cliente_buscado in _ids(cliente, f'/api/clientes?search={termino}')
+
+
+@pytest.mark.parametrize('termino', ['lancia', '9876-QWZ', 'qwz', '6QW', '547321'])
+def test_vehiculos_por_marca_o_fragmento_de_identificador(app, cliente, cliente_buscado, termino):
+    with app.app_context():
+        vehiculo_id = Vehiculo.query.filter_by(cliente_id=cliente_buscado).one().id
+    
+    assert vehiculo_id in _ids(cliente, f'/api/vehiculos?search={termino}')
+
+
+def test_indices_de_identificadores_siguen_actualizaciones_y_borrados(app, cliente, cliente_buscado):
+    with app.app_context():
+        db.session.get(Cliente, cliente_buscado).dni = '5555XJV'
+        db.session.commit()
+    
+    assert cliente_buscado not in _ids(cliente, '/api/clientes?search=QWK')
+    assert cliente_buscado in _ids(cliente, '/api/clientes?search=XJV')
+    
+    with app.app_context():
+        db.session.delete(Vehiculo.query.filter_by(cliente_id=cliente_buscado).one())
+        db.session.commit()
+    
+    assert _ids(cliente, '/api/vehiculos?search=9876QWZ') == []
+
+
+def test_reconstruir_indices_conserva_los_resultados(app, cliente, cliente_buscado):
+    with app.app_context():
+        reconstruidos = crear_indices_busqueda(reconstruir=True)
+    
+    assert 'clientes_ident_fts' in reconstruidos
+    assert cliente_buscado in _ids(cliente, '/api/clientes?search=QWK')
@@ -0,0 +1,35 @@
+from sqlalchemy import update
+
+from src.models import db
+from src.models.contador import Contador
+
+
+def test_bases_distintas_no_comparten_respuestas(crear_app, tmp_path):
+    config = {'CACHE_RESPUESTAS': 'sqlite', 'CACHE_RESPUESTAS_RUTA': str(tmp_path / 'cache.db')}
+    app_a = crear_app('a.db', **config)
+    app_b = crear_app('b.db', **config)
+    # Mismas versiones de tablas en las dos copias y datos distintos en b
+    with app_b.app_context():
+        db.session.execute(update(Contador.__table__).where(Contador.clave == 'clientes_activos').values(valor=-1))
+        db.session.commit()
+    
+    a = app_a.test_client().get('/api/dashboard/stats')
+    b = app_b.test_client().get('/api/dashboard/stats')
+    
+    assert a.headers['ETag'] == b.headers['ETag']
+    assert b.headers['X-Cache'] == 'MISS'
+    assert b.get_json()['data']['clientes_activos'] == -1
+    assert app_b.test_client().get('/api/dashboard/stats').headers['X-Cache'] == 'HIT'
+
+
+def test_invalidacion_solo_afecta_a_su_base(crear_app, tmp_path):
+    config = {'CACHE_RESPUESTAS': 'sqlite', 'CACHE_RESPUESTAS_RUTA': str(tmp_path / 'cache.db')}
+    app_a = crear_app('a.db', **config)
+    app_b = crear_app('b.db', **config)
+    for app in (app_a, app_b):
+        app.test_client().get('/api/dashboard/stats')
+    
+    app_a.extensions['cache_respuestas'].invalidar(['clientes'])
+    
+    assert app_b.test_client().get('/api/dashboard/stats').headers['X-Cache'] == 'HIT'
+    assert app_a.test_client().get('/api/dashboard/stats').headers['X-Cache'] == 'MISS'
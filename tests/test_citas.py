@@ -0,0 +1,87 @@
+from datetime import datetime
+
+import pytest
+
+from src.models import db
+from src.models.cita import Cita
+
+
+@pytest.fixture
+def citas_fijadas(app):
+    """Dos citas en los extremos del 10 de marzo de 2031 y otra al empezar el día 11"""
+    with app.app_context():
+        citas = Cita.query.order_by(Cita.id).limit(3).all()
+        for cita, fecha_hora in zip(citas, (
+            datetime(2031, 3, 10, 0, 0), datetime(2031, 3, 10, 23, 30), datetime(2031, 3, 11, 0, 0)
+        )):
+            cita.fecha_hora = fecha_hora
+        citas[0].estado = 'cancelada'
+        db.session.commit()
+        return [(cita.id, cita.tecnico_id) for cita in citas]
+
+
+def _ids(respuesta):
+    assert respuesta.status_code == 200
+    return {cita['id'] for cita in respuesta.get_json()['data']}
+
+
+def test_hasta_de_solo_fecha_incluye_el_dia_completo(cliente, citas_fijadas):
+    (primera, _), (segunda, _), (tercera, _) = citas_fijadas
+    
+    assert _ids(cliente.get('/api/citas?desde=2031-03-10&hasta=2031-03-10')) == {primera, segunda}
+    assert _ids(cliente.get('/api/citas?desde=2031-03-10&hasta=2031-03-10T23:30:00')) == {primera}
+    assert _ids(cliente.get('/api/citas?desde=2031-03-11&hasta=2031-03-11')) == {tercera}
+
+
+def test_filtros_por_tecnico_y_estado(cliente, citas_fijadas):
+    (primera, tecnico), (segunda, _), _ = citas_fijadas
+    
+    datos = cliente.get(f'/api/citas?desde=2031-03-10&hasta=2031-03-10&tecnico_id={tecnico}').get_json()['data']
+    assert primera in {cita['id'] for cita in datos}
+    assert {cita['tecnico_id'] for cita in datos} == {tecnico}
+    
+    assert _ids(cliente.get('/api/citas?desde=2031-03-10&hasta=2031-03-10&estado=cancelada')) == {primera}
+    assert _ids(cliente.get('/api/citas?desde=2031-03-10&hasta=2031-03-10&estado=todos')) == {primera, segunda}
+
+
+def test_fechas_con_zona_horaria_se_comparan_en_utc(cliente, citas_fijadas):
+    (primera, _), (segunda, _), (tercera, _) = citas_fijadas
+    
+    # 01:00+02:00 es 23:00 UTC del día anterior; hasta sin zona se toma tal cual
+    respuesta = cliente.get('/api/citas?desde=2031-03-11T01:00:00%2B02:00&hasta=2031-03-11')
+    assert _ids(respuesta) == {segunda, tercera}
+
+
+@pytest.mark.parametrize('argumentos', [
+    'tecnico_id=abc', 'desde=ayer', 'desde=2031-03-11&hasta=2031-03-10', 'per_page=0', 'page=-1'
+])
+def test_parametros_invalidos_devuelven_400(cliente, argumentos):
+    respuesta = cliente.get(f'/api/citas?{argumentos}')
+    
+    assert respuesta.status_code == 400
+    assert respuesta.get_json()['success'] is False
+
+
+def test_sin_ventana_se_pagina_por_defecto(app, cliente):
+    with app.app_context():
+        total = Cita.query.count()
+    
+    datos = cliente.get('/api/citas').get_json()
+    
+    assert datos['pagination'] == {'page': 1, 'pages': -(-total // 50), 'per_page': 50, 'total': total}
+    assert len(datos['data']) == min(total, 50)
+    # Una ventana mayor que la del calendario también se pagina
+    assert 'pagination' in cliente.get('/api/citas?desde=2000-01-01&hasta=2040-01-01').get_json()
+    assert 'pagination' not in cliente.get('/api/citas?desde=2031-03-01&hasta=2031-03-31').get_json()
+
+
+def test_consultas_no_dependen_del_tamaño_de_pagina(cliente, contar_consultas):
+    cuentas = []
+    for per_page in (5, 50):
+        with contar_consultas() as cuenta:
+            datos = cliente.get(f'/api/citas?per_page={per_page}').get_json()
+        assert len(datos['data']) == per_page
+        assert all(cita['vehiculo_info'] and cita['cliente_nombre'] and cita['tecnico_nombre'] for cita in datos['data'])
+        cuentas.append(cuenta[0])
+    
+    assert cuentas[0] == cuentas[1]
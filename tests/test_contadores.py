@@ -0,0 +1,79 @@
+from datetime import datetime
+
+from sqlalchemy import update
+
+from src.models import db
+from src.models.cita import Cita
+from src.models.cliente import Cliente
+from src.models.contador import Contador, reconciliar_contadores, reconciliar_si_toca
+from src.models.secuencia import Secuencia
+from src.models.vehiculo import Vehiculo
+
+
+def _mantenidos():
+    return {clave: valor for clave, valor in db.session.query(Contador.clave, Contador.valor) if valor}
+
+
+def _recalculados():
+    return {clave: valor for clave, valor in reconciliar_contadores().items() if valor}
+
+
+def test_contadores_siguen_las_escrituras_del_orm(app):
+    with app.app_context():
+        reconciliar_contadores()
+        
+        db.session.add(Cliente(
+            nombre_completo='Cliente Contadores', dni='00000001T', telefono='600000000',
+            email='contadores@taller.com', direccion='Calle Prueba 1', persona_contacto='Prueba'
+        ))
+        vehiculo = Vehiculo.query.filter(Vehiculo.estado != 'en_taller').first()
+        vehiculo.estado = 'en_taller'
+        cita = Cita.query.first()
+        cita.fecha_hora = datetime(2030, 1, 15, 10, 0)
+        db.session.delete(Cita.query.order_by(Cita.id.desc()).first())
+        db.session.commit()
+        
+        assert _mantenidos() == _recalculados()
+
+
+def test_contadores_con_instancias_expiradas(app):
+    # Tras un commit las instancias quedan expiradas: el valor previo de cada
+    # atributo ya no está en memoria y el listener tiene que cargarlo
+    with app.app_context():
+        reconciliar_contadores()
+        cliente = Cliente.query.filter_by(activo=True).first()
+        vehiculo = Vehiculo.query.filter(Vehiculo.estado != 'en_taller').first()
+        
+        for activo, estado in ((False, 'en_taller'), (True, 'activo')):
+            cliente.activo = activo
+            vehiculo.estado = estado
+            db.session.commit()
+        
+        assert _mantenidos() == _recalculados()
+
+
+def test_dashboard_stats_refleja_los_contadores(app, cliente):
+    with app.app_context():
+        reconciliar_contadores()
+        activos = Cliente.query.filter_by(activo=True).count()
+    
+    respuesta = cliente.get('/api/dashboard/stats')
+    
+    assert respuesta.status_code == 200
+    assert respuesta.get_json()['data']['clientes_activos'] == activos
+
+
+def test_reconciliacion_periodica_una_vez_por_intervalo(app):
+    with app.app_context():
+        # Dos workers que despiertan en el mismo intervalo: sólo el primero reconstruye
+        assert reconciliar_si_toca(60) is True
+        assert reconciliar_si_toca(60) is False
+        
+        # Pasado el intervalo vuelve a tocar
+        db.session.execute(
+            update(Secuencia.__table__).where(Secuencia.nombre == 'turno:reconciliar_contadores')
+            .values(valor=Secuencia.valor - 61)
+        )
+        db.session.commit()
+        assert reconciliar_si_toca(60) is True
+        assert _mantenidos() == _recalculados()
@@ -0,0 +1,51 @@
+from collections import defaultdict
+from datetime import date, timedelta
+
+import pytest
+
+from src.models.factura import Factura
+
+
+def _lunes(dia):
+    return dia - timedelta(days=dia.weekday())
+
+
+def _primero_de_mes(dia):
+    return dia.replace(day=1)
+
+
+def _pagadas_por_periodo(inicio, agrupar):
+    ingresos = defaultdict(float)
+    for factura in Factura.query.filter(Factura.estado == 'pagada', Factura.fecha_emision >= inicio):
+        ingresos[agrupar(factura.fecha_emision.date())] += factura.total or 0
+    return ingresos
+
+
+@pytest.mark.parametrize('granularidad', ['month', 'week'])
+def test_grafico_de_ingresos_coincide_con_las_facturas(app, cliente, granularidad):
+    datos = cliente.get(f'/api/dashboard/revenue-chart?months=60&granularity={granularidad}').get_json()['data']
+    
+    inicio = date.fromisoformat(datos[0]['period'])
+    with app.app_context():
+        esperados = _pagadas_por_periodo(inicio, _lunes if granularidad == 'week' else _primero_de_mes)
+    
+    obtenidos = {date.fromisoformat(barra['period']): barra['revenue'] for barra in datos}
+    assert {periodo: round(total, 2) for periodo, total in esperados.items() if periodo in obtenidos} == \
+        {periodo: total for periodo, total in obtenidos.items() if total}
+    assert sum(obtenidos.values()) == pytest.approx(sum(esperados.values()), abs=0.01 * len(obtenidos))
+
+
+def test_grafico_de_ingresos_no_depende_del_horizonte(cliente_medido):
+    cuentas = set()
+    for argumentos in ('months=1', 'months=6', 'months=60', 'months=6&granularity=week', 'months=60&granularity=week'):
+        respuesta = cliente_medido.get(f'/api/dashboard/revenue-chart?{argumentos}')
+        assert respuesta.status_code == 200
+        cuentas.add(respuesta.headers['X-Query-Count'])
+    
+    # Lectura de versiones para el ETag y una consulta de ingresos, sea cual sea el horizonte
+    assert cuentas == {'2'}
+
+
+@pytest.mark.parametrize('argumentos', ['months=0', 'months=61', 'months=abc', 'granularity=day'])
+def test_grafico_de_ingresos_parametros_invalidos(cliente, argumentos):
+    assert cliente.get(f'/api/dashboard/revenue-chart?{argumentos}').status_code == 400
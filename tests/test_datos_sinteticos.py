@@ -0,0 +1,19 @@
+from src.models.cliente import Cliente
+
+
+def test_generate_data_acepta_clientes_por_escala(app):
+    with app.app_context():
+        antes = Cliente.query.count()
+    
+    resultado = app.test_cli_runner().invoke(args=['generate-data', '--scale', '2', '--clients-per-scale', '3', '--seed', '1'])
+    
+    assert resultado.exit_code == 0, resultado.output
+    assert '6/6 clientes' in resultado.output
+    with app.app_context():
+        assert Cliente.query.count() == antes + 6
+
+
+def test_generate_data_rechaza_clientes_por_escala_no_positivo(app):
+    resultado = app.test_cli_runner().invoke(args=['generate-data', '--scale', '1', '--clients-per-scale', '0'])
+    
+    assert resultado.exit_code != 0
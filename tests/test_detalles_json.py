@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from sqlalchemy import select, text
+
+from src.models import db
+from src.models.factura import Factura, detalles_cuarentena
+from src.utils.schema import actualizar_esquema, migraciones
+
+BUENO = json.dumps([{'nombre': 'Pastillas de freno', 'precio': 40.0, 'tipo': 'nuevo'}])
+CORRUPTOS = {
+    'detalle_repuestos': '[{"nombre": "Filtro", "precio": 12',
+    'detalle_mano_obra': '{"horas": 2}',
+}
+
+
+def _escribir_texto(factura_id, **columnas):
+    asignaciones = ', '.join(f'{columna} = :{columna}' for columna in columnas)
+    db.session.execute(text(f'UPDATE facturas SET {asignaciones} WHERE id = :id'), {'id': factura_id, **columnas})
+
+
+def test_migracion_pone_en_cuarentena_los_detalles_corruptos(app):
+    with app.app_context():
+        buena, corrupta = [id for id, in db.session.query(Factura.id).order_by(Factura.id).limit(2)]
+        _escribir_texto(buena, detalle_repuestos=BUENO, detalle_mano_obra='[]')
+        _escribir_texto(corrupta, **CORRUPTOS)
+        # Base de datos anterior a la migración
+        db.session.execute(migraciones.delete().where(migraciones.c.nombre == '0001_facturas_detalles_json'))
+        db.session.commit()
+        
+        assert '0001_facturas_detalles_json' in actualizar_esquema()
+        db.session.expire_all()
+        
+        factura = db.session.get(Factura, buena)
+        assert factura.detalle_repuestos == json.loads(BUENO) and factura.detalle_mano_obra == []
+        
+        factura = db.session.get(Factura, corrupta)
+        assert factura.detalle_repuestos is None and factura.detalle_mano_obra is None
+        assert factura.to_dict()['detalle_repuestos'] == []
+        
+        cuarentena = db.session.execute(select(
+            detalles_cuarentena.c.factura_id, detalles_cuarentena.c.numero_factura,
+            detalles_cuarentena.c.columna, detalles_cuarentena.c.contenido
+        )).all()
+        assert sorted(cuarentena) == sorted(
+            (corrupta, factura.numero_factura, columna, contenido) for columna, contenido in CORRUPTOS.items()
+        )
+        
+        # Ya aplicada: no se vuelve a ejecutar
+        assert actualizar_esquema() == []
+
+
+def test_lista_mutable_registra_los_cambios(app):
+    with app.app_context():
+        factura = Factura.query.filter(Factura.detalle_repuestos.isnot(None)).first()
+        factura_id = factura.id
+        factura.detalle_repuestos = [{'nombre': 'Aceite', 'precio': 30.0, 'tipo': 'nuevo'}]
+        db.session.commit()
+        
+        factura = db.session.get(Factura, factura_id)
+        factura.detalle_repuestos.append({'nombre': 'Junta', 'precio': 10.0, 'tipo': 'usado'})
+        factura.detalle_mano_obra = []
+        factura.detalle_mano_obra.append({'descripcion': 'Cambio de aceite', 'total': 25.0})
+        db.session.commit()
+        db.session.expire_all()
+        
+        factura = db.session.get(Factura, factura_id)
+        assert [r['nombre'] for r in factura.detalle_repuestos] == ['Aceite', 'Junta']
+        
+        # Los cambios dentro de un elemento los marca calcular_totales() con flag_modified
+        factura.calcular_totales(margen_nuevos=20, margen_usados=30, iva_porcentaje=21)
+        db.session.commit()
+        db.session.expire_all()
+        
+        factura = db.session.get(Factura, factura_id)
+        assert [r['precio_final'] for r in factura.detalle_repuestos] == [36.0, 13.0]
+        assert factura.total == pytest.approx((36.0 + 13.0 + 25.0) * 1.21)
+        
+        factura.detalle_repuestos.pop()
+        db.session.commit()
+        db.session.expire_all()
+        assert len(db.session.get(Factura, factura_id).detalle_repuestos) == 1
@@ -0,0 +1,36 @@
+def _consultas_listado(cliente, contar_consultas, ruta):
+    with contar_consultas() as cuenta:
+        respuesta = cliente.get(ruta)
+    assert respuesta.status_code == 200
+    return cuenta[0], respuesta.get_json()['data']
+
+
+def test_listado_consultas_constantes_con_el_tamaño_de_pagina(cliente, contar_consultas):
+    # Una petición previa para que el arranque del engine no cuente en la comparación
+    cliente.get('/api/diagnosticos?per_page=1')
+    
+    pocas, datos_pocos = _consultas_listado(cliente, contar_consultas, '/api/diagnosticos?per_page=5')
+    muchas, datos_muchos = _consultas_listado(cliente, contar_consultas, '/api/diagnosticos?per_page=50')
+    
+    assert len(datos_pocos) == 5
+    assert len(datos_muchos) == 50
+    assert muchas == pocas
+
+
+def test_listado_por_cursor_consultas_constantes(cliente, contar_consultas):
+    cliente.get('/api/diagnosticos?cursor=&per_page=1')
+    
+    pocas, _ = _consultas_listado(cliente, contar_consultas, '/api/diagnosticos?cursor=&per_page=5')
+    muchas, datos = _consultas_listado(cliente, contar_consultas, '/api/diagnosticos?cursor=&per_page=50')
+    
+    assert len(datos) == 50
+    assert muchas == pocas
+
+
+def test_listado_incluye_vehiculo_cliente_y_tecnico(cliente):
+    datos = cliente.get('/api/diagnosticos?per_page=5').get_json()['data']
+    
+    for diagnostico in datos:
+        assert diagnostico['vehiculo_info']
+        assert diagnostico['cliente_nombre']
+        assert isinstance(diagnostico['repuestos_necesarios'], list)
@@ -0,0 +1,23 @@
+import pytest
+
+
+@pytest.mark.parametrize('ruta', ['/', '/clientes/15'])
+def test_spa_sin_index_devuelve_404(crear_app, tmp_path, ruta):
+    (tmp_path / 'static').mkdir()
+    cliente = crear_app(ESTATICOS_CARPETA=str(tmp_path / 'static')).test_client()
+    
+    respuesta = cliente.get(ruta)
+    
+    assert respuesta.status_code == 404
+    assert respuesta.get_json() == {'error': 'index.html not found'}
+
+
+def test_spa_sirve_el_index(crear_app, tmp_path):
+    (tmp_path / 'static').mkdir()
+    (tmp_path / 'static' / 'index.html').write_text('<!doctype html><title>Taller</title>')
+    cliente = crear_app(ESTATICOS_CARPETA=str(tmp_path / 'static')).test_client()
+    
+    for ruta in ('/', '/clientes/15'):
+        respuesta = cliente.get(ruta)
+        assert respuesta.status_code == 200
+        assert b'Taller' in respuesta.data
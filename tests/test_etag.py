@@ -0,0 +1,51 @@
+from sqlalchemy import update
+
+from src.models import db
+from src.models.contador import Contador, reconciliar_contadores
+from src.models.revenue_rollup import RevenueRollup, reconstruir_revenue_rollup
+
+
+def _provocar_deriva(app, tabla, valores):
+    # Escritura directa sin versionar, como la que deja un listener que no se ejecutó
+    with app.app_context():
+        db.session.execute(update(tabla).values(**valores))
+        db.session.commit()
+
+
+def test_reconciliar_contadores_invalida_etag_y_cache(crear_app):
+    app = crear_app(CACHE_RESPUESTAS='memoria')
+    cliente = app.test_client()
+    primera = cliente.get('/api/dashboard/stats')
+    etag = primera.headers['ETag']
+    
+    _provocar_deriva(app, Contador.__table__, {'valor': 0})
+    assert cliente.get('/api/dashboard/stats', headers={'If-None-Match': etag}).status_code == 304
+    assert cliente.get('/api/dashboard/stats').headers['X-Cache'] == 'HIT'
+    
+    with app.app_context():
+        reconciliar_contadores()
+    
+    respuesta = cliente.get('/api/dashboard/stats', headers={'If-None-Match': etag})
+    assert respuesta.status_code == 200
+    assert respuesta.headers['X-Cache'] == 'MISS'
+    assert respuesta.get_json() == primera.get_json()
+
+
+def test_reconstruir_rollup_invalida_etag_y_cache(crear_app):
+    app = crear_app(CACHE_RESPUESTAS='memoria')
+    cliente = app.test_client()
+    with app.app_context():
+        reconstruir_revenue_rollup()
+    primera = cliente.get('/api/dashboard/revenue-chart?months=60')
+    etag = primera.headers['ETag']
+    
+    _provocar_deriva(app, RevenueRollup.__table__, {'total': 0})
+    assert cliente.get('/api/dashboard/revenue-chart?months=60', headers={'If-None-Match': etag}).status_code == 304
+    
+    with app.app_context():
+        reconstruir_revenue_rollup()
+    
+    respuesta = cliente.get('/api/dashboard/revenue-chart?months=60', headers={'If-None-Match': etag})
+    assert respuesta.status_code == 200
+    assert respuesta.headers['X-Cache'] == 'MISS'
+    assert respuesta.get_json() == primera.get_json()
@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+import re
+from datetime import datetime
+
+import pytest
+
+from src.models import db
+from src.routes import facturas
+from src.models.diagnostico import Diagnostico
+from src.models.factura import Factura
+
+
+@pytest.mark.parametrize('limite', [True, 0, -2, 1.5, '3'])
+def test_bulk_generate_limite_invalido(cliente, limite):
+    respuesta = cliente.post('/api/facturas/bulk-generate', json={'limite': limite})
+    
+    assert respuesta.status_code == 400
+
+
+def test_bulk_generate_factura_cada_diagnostico_una_vez(app, cliente):
+    with app.app_context():
+        Diagnostico.query.filter(~Diagnostico.factura.has()).update(
+            {Diagnostico.estado: 'completado'}, synchronize_session=False
+        )
+        db.session.commit()
+        antes = Factura.query.count()
+    
+    datos = cliente.post('/api/facturas/bulk-generate', json={'limite': 5}).get_json()['data']
+    assert datos['facturas'] == 5
+    primero, ultimo = (int(re.search(r'\d+$', datos[clave]).group()) for clave in ('primer_numero', 'ultimo_numero'))
+    assert ultimo - primero == 4
+    
+    resto = cliente.post('/api/facturas/bulk-generate', json={}).get_json()['data']
+    assert cliente.post('/api/facturas/bulk-generate', json={}).get_json()['data']['facturas'] == 0
+    
+    with app.app_context():
+        assert Factura.query.count() == antes + 5 + resto['facturas']
+        numeros = [n for n, in db.session.query(Factura.numero_factura)]
+        assert len(numeros) == len(set(numeros))
+
+
+def test_listado_carga_diagnostico_vehiculo_y_cliente_en_una_consulta(app, cliente_medido):
+    with app.app_context():
+        total = Factura.query.count()
+    
+    respuesta = cliente_medido.get('/api/facturas')
+    datos = respuesta.get_json()['data']
+    
+    assert len(datos) == total
+    assert all(factura['vehiculo_info'] and factura['cliente_nombre'] for factura in datos)
+    assert respuesta.headers['X-Query-Count'] == '1'
+
+
+@pytest.mark.parametrize('formato', ['ndjson', 'csv'])
+def test_exportacion_por_lotes_con_una_sola_consulta(app, cliente, contar_consultas, monkeypatch, formato):
+    monkeypatch.setattr(facturas, 'EXPORT_BATCH_SIZE', 7)
+    with app.app_context():
+        numeros = [n for n, in db.session.query(Factura.numero_factura).order_by(Factura.fecha_emision, Factura.id)]
+    
+    with contar_consultas() as cuenta:
+        cuerpo = cliente.get(f'/api/facturas/export?format={formato}').get_data(as_text=True)
+    
+    if formato == 'csv':
+        filas = list(csv.DictReader(io.StringIO(cuerpo)))
+    else:
+        filas = [json.loads(linea) for linea in cuerpo.splitlines()]
+    assert [fila['numero_factura'] for fila in filas] == numeros
+    assert all(fila['cliente_nombre'] for fila in filas)
+    assert cuenta[0] == 1
+
+
+def test_exportacion_filtrada_por_estado_y_fechas(app, cliente):
+    with app.app_context():
+        esperadas = {
+            factura.numero_factura for factura in Factura.query.filter(
+                Factura.estado == 'pagada', Factura.fecha_emision >= datetime(2000, 1, 1)
+            )
+        }
+    
+    cuerpo = cliente.get('/api/facturas/export?estado=pagada&desde=2000-01-01').get_data(as_text=True)
+    
+    assert {json.loads(linea)['numero_factura'] for linea in cuerpo.splitlines()} == esperadas
+    assert cliente.get('/api/facturas/export?format=xml').status_code == 400
@@ -0,0 +1,99 @@
+import io
+import json
+
+from sqlalchemy import insert
+
+from src.models import db
+from src.models.cliente import Cliente
+from src.models.contador import Contador, reconciliar_contadores
+from src.models.vehiculo import Vehiculo
+from src.utils.importacion import importar_clientes, leer_registros
+
+
+def _cliente(dni, **campos):
+    return {
+        'nombre_completo': f'Cliente {dni}', 'dni': dni, 'telefono': '600000000',
+        'email': f'{dni.lower()}@taller.com', 'direccion': 'Calle Importación 1', 'persona_contacto': 'Prueba',
+        **campos
+    }
+
+
+def _mantenidos():
+    return {clave: valor for clave, valor in db.session.query(Contador.clave, Contador.valor) if valor}
+
+
+def test_importar_clientes_csv_informa_las_filas_erroneas(app, cliente):
+    with app.app_context():
+        existente = Cliente.query.first().dni
+    
+    csv = '\n'.join([
+        'nombre_completo,dni,telefono,email,direccion,persona_contacto,activo',
+        'Ana Uno,IMP0001A,600000001,ana@taller.com,Calle 1,Ana,1',
+        f'Repetido,{existente},600000002,rep@taller.com,Calle 2,Rep,1',
+        'Sin Dni,,600000003,sin@taller.com,Calle 3,Sin,1',
+        'Ana Dos,IMP0001A,600000004,ana2@taller.com,Calle 4,Ana,1',
+        'Baja,IMP0002B,600000005,baja@taller.com,Calle 5,Baja,no',
+    ]) + '\n'
+    
+    datos = cliente.post('/api/clientes/import?format=csv', data=csv.encode()).get_json()['data']
+    
+    assert (datos['procesados'], datos['importados'], datos['errores']) == (5, 2, 3)
+    assert [error['linea'] for error in datos['detalle_errores']] == [3, 4, 5]
+    with app.app_context():
+        assert Cliente.query.filter_by(dni='IMP0002B').one().activo is False
+
+
+def test_importar_vehiculos_ndjson_calcula_columnas_normalizadas(app, cliente):
+    with app.app_context():
+        dni = Cliente.query.first().dni
+    
+    lineas = [
+        json.dumps({'cliente_dni': dni, 'marca': 'Seat', 'modelo': 'Ibiza', 'año': 2019,
+                    'matricula': '4321-xyz', 'numero_bastidor': 'vsszzz6jzkr000123', 'kilometraje': 1000}),
+        '{no es json',
+        json.dumps({'cliente_dni': 'NOEXISTE', 'marca': 'Seat', 'modelo': 'León', 'año': 2018,
+                    'matricula': '1111AAA', 'numero_bastidor': 'VSS000000000000001', 'kilometraje': 5}),
+    ]
+    
+    datos = cliente.post('/api/vehiculos/import?format=ndjson', data='\n'.join(lineas).encode()).get_json()['data']
+    
+    assert (datos['importados'], datos['errores']) == (1, 2)
+    encontrado = cliente.get('/api/vehiculos/lookup?q=4321XYZ').get_json()['data']
+    assert [v['coincidencia'] for v in encontrado] == ['exacta']
+    with app.app_context():
+        vehiculo = Vehiculo.query.filter_by(matricula='4321-xyz').one()
+        assert vehiculo.bastidor_norm_inv == 'VSSZZZ6JZKR000123'[::-1]
+
+
+def test_importar_clientes_repite_el_lote_fila_a_fila_tras_un_conflicto(app):
+    with app.app_context():
+        reconciliar_contadores()
+        
+        def registros():
+            yield 1, _cliente('CONF0001')
+            yield 2, _cliente('CONF0002')
+            # Otra escritura ocupa un DNI del lote después de la precarga y antes del INSERT
+            with db.engine.begin() as connection:
+                connection.execute(insert(Cliente.__table__), [_cliente('CONF0002', activo=True)])
+            yield 3, _cliente('CONF0003')
+        
+        informe = importar_clientes(registros(), chunk=10)
+        
+        assert (informe['importados'], informe['errores']) == (2, 1)
+        assert informe['detalle_errores'][0]['linea'] == 2
+        assert 'duplicado' in informe['detalle_errores'][0]['error']
+        assert Cliente.query.filter(Cliente.dni.like('CONF%')).count() == 3
+        
+        # Los lotes repetidos fila a fila ajustan los contadores una sola vez por fila importada
+        mantenidos = _mantenidos()
+        mantenidos['clientes_activos'] += 1  # el cliente insertado por fuera no pasa por los contadores
+        assert mantenidos == {clave: valor for clave, valor in reconciliar_contadores().items() if valor}
+
+
+def test_leer_registros_csv_con_columnas_de_mas():
+    flujo = io.BytesIO('dni,nombre_completo\nA,B,C\nD,E\n'.encode())
+    
+    registros = list(leer_registros(flujo, 'csv'))
+    
+    assert isinstance(registros[0][1], ValueError)
+    assert registros[1] == (3, {'dni': 'D', 'nombre_completo': 'E'})
@@ -0,0 +1,57 @@
+import pytest
+
+from src.models import db
+from src.models.diagnostico import Diagnostico
+from src.utils.paginacion import codificar_cursor, decodificar_cursor
+
+
+def _recorrer(cliente, ruta, per_page):
+    ids = []
+    cursor = ''
+    while True:
+        datos = cliente.get(f'{ruta}?cursor={cursor}&per_page={per_page}').get_json()
+        ids += [fila['id'] for fila in datos['data']]
+        if not datos['pagination']['has_more']:
+            return ids
+        cursor = datos['pagination']['next_cursor']
+
+
+def test_cursor_ida_y_vuelta():
+    assert decodificar_cursor(codificar_cursor(None, 7)) == (None, 7)
+
+
+def test_cursor_recorre_todas_las_filas_incluidas_las_sin_fecha(app, cliente):
+    with app.app_context():
+        sin_fecha = [id for id, in db.session.query(Diagnostico.id).order_by(Diagnostico.id).limit(12)]
+        Diagnostico.query.filter(Diagnostico.id.in_(sin_fecha)).update(
+            {Diagnostico.fecha_diagnostico: None}, synchronize_session=False
+        )
+        db.session.commit()
+        todos = {id for id, in db.session.query(Diagnostico.id)}
+    
+    # Con 7 por página el salto de las fechadas a las sin fecha cae a mitad de página
+    ids = _recorrer(cliente, '/api/diagnosticos', 7)
+    
+    assert len(ids) == len(set(ids))
+    assert set(ids) == todos
+    assert ids[-len(sin_fecha):] == sorted(sin_fecha, reverse=True)
+
+
+def test_cursor_invalido_devuelve_400(cliente):
+    assert cliente.get('/api/diagnosticos?cursor=no-es-un-cursor').status_code == 400
+
+
+@pytest.mark.parametrize('ruta', ['/api/clientes', '/api/vehiculos', '/api/diagnosticos'])
+@pytest.mark.parametrize('argumentos', ['cursor=&per_page=0', 'cursor=&per_page=-3', 'per_page=0', 'per_page=201', 'per_page=abc', 'page=0'])
+def test_tamaño_de_pagina_fuera_de_rango_devuelve_400(cliente, ruta, argumentos):
+    respuesta = cliente.get(f'{ruta}?{argumentos}')
+    
+    assert respuesta.status_code == 400
+    assert respuesta.get_json()['success'] is False
+
+
+def test_cursor_con_una_fila_por_pagina(cliente):
+    datos = cliente.get('/api/clientes?cursor=&per_page=1').get_json()
+    
+    assert len(datos['data']) == 1
+    assert datos['pagination']['has_more'] is True
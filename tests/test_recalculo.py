@@ -0,0 +1,100 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy import update
+
+from src.models import db
+from src.models.factura import Factura
+from src.models.revenue_rollup import RevenueRollup, reconstruir_revenue_rollup
+from src.utils import facturacion
+from src.utils.facturacion import ESTADOS_RECALCULABLES, recalcular_facturas
+
+MARGENES = {'margen_nuevos': 25, 'margen_usados': 35, 'iva_porcentaje': 10}
+COLUMNAS = ('subtotal_repuestos', 'margen_repuestos', 'subtotal_mano_obra', 'iva', 'total')
+
+
+def _importes(factura):
+    return {
+        **{columna: getattr(factura, columna) for columna in COLUMNAS},
+        'precios_finales': [r.get('precio_final') for r in factura.detalle_repuestos or []],
+    }
+
+
+def _estado_facturas():
+    return {
+        factura.id: (_importes(factura), factura.fecha_vencimiento)
+        for factura in Factura.query.order_by(Factura.id)
+    }
+
+
+def test_recalculo_coincide_con_calcular_totales(app):
+    with app.app_context():
+        facturas = Factura.query.filter(Factura.estado.in_(ESTADOS_RECALCULABLES)).all()
+        assert any(f.detalle_repuestos for f in facturas) and any(f.detalle_mano_obra for f in facturas)
+        for factura in facturas:
+            factura.calcular_totales(**MARGENES)
+        esperados = {factura.id: _importes(factura) for factura in facturas}
+        db.session.rollback()
+        
+        # Lotes pequeños para cruzar varias transacciones
+        resumen = recalcular_facturas(**MARGENES, chunk=7)
+        db.session.expire_all()
+        
+        assert resumen['facturas'] == len(esperados)
+        for factura in Factura.query.filter(Factura.id.in_(esperados)):
+            obtenidos = _importes(factura)
+            assert obtenidos == pytest.approx(esperados[factura.id]), factura.numero_factura
+
+
+def test_recalculo_ajusta_el_rollup(app):
+    with app.app_context():
+        recalcular_facturas(**MARGENES, chunk=7)
+        mantenido = {(f.año, f.mes, f.estado): round(f.total, 2) for f in RevenueRollup.query}
+        reconstruir_revenue_rollup()
+        assert mantenido == {(f.año, f.mes, f.estado): round(f.total, 2) for f in RevenueRollup.query}
+
+
+def test_dry_run_no_escribe_nada(app):
+    with app.app_context():
+        antes = _estado_facturas()
+        
+        resumen = recalcular_facturas(**MARGENES, dry_run=True, chunk=7)
+        db.session.expire_all()
+        
+        assert resumen['dry_run'] is True and resumen['diferencia']
+        assert _estado_facturas() == antes
+        assert recalcular_facturas(**MARGENES)['diferencia'] == pytest.approx(resumen['diferencia'])
+
+
+def test_edicion_simultanea_no_se_pierde(app, monkeypatch):
+    with app.app_context():
+        factura = Factura.query.filter(
+            Factura.estado.in_(ESTADOS_RECALCULABLES), Factura.detalle_repuestos.isnot(None)
+        ).order_by(Factura.id).first()
+        factura_id = factura.id
+        editado = [{'nombre': 'Editado durante el recálculo', 'precio': 1.0, 'tipo': 'nuevo'}]
+        engine = db.engine
+        
+        def editar():
+            with engine.begin() as connection:
+                connection.execute(update(Factura.__table__).where(Factura.id == factura_id).values(
+                    detalle_repuestos=editado
+                ))
+        
+        calcular_lote = facturacion._calcular_lote
+        editor = threading.Thread(target=editar)
+        
+        def calcular_con_edicion(*args, **kwargs):
+            # La edición llega entre la lectura del lote y su UPDATE
+            if not editor.is_alive() and editor.ident is None:
+                editor.start()
+                time.sleep(0.3)
+            return calcular_lote(*args, **kwargs)
+        
+        monkeypatch.setattr(facturacion, '_calcular_lote', calcular_con_edicion)
+        recalcular_facturas(**MARGENES)
+        editor.join()
+        db.session.expire_all()
+        
+        assert db.session.get(Factura, factura_id).detalle_repuestos == editado
@@ -0,0 +1,52 @@
+import pytest
+from sqlalchemy import inspect
+
+from src.models import db
+from src.models.cliente import Cliente
+from src.models.proveedor import Proveedor
+from src.models.repuesto import CotizacionRepuesto, SolicitudRepuesto
+from src.models.vehiculo import Vehiculo
+
+
+def test_clientes_con_recuento_de_vehiculos_en_la_misma_consulta(app, cliente_medido):
+    with app.app_context():
+        esperados = dict(
+            db.session.query(Cliente.id, db.func.count(Vehiculo.id)).outerjoin(Vehiculo).group_by(Cliente.id)
+        )
+    
+    respuestas = [cliente_medido.get(f'/api/clientes?per_page={per_page}') for per_page in (5, 50)]
+    
+    datos = respuestas[1].get_json()['data']
+    assert {c['id']: c['vehiculos_count'] for c in datos} == {c['id']: esperados[c['id']] for c in datos}
+    assert any(c['vehiculos_count'] > 1 for c in datos)
+    # Versiones del ETag, página y COUNT de la paginación, con 5 o con 50 clientes
+    assert [r.headers['X-Query-Count'] for r in respuestas] == ['3', '3']
+
+
+def test_proveedores_con_recuentos_de_cotizaciones_y_pedidos(app, cliente_medido):
+    with app.app_context():
+        esperados = {
+            proveedor.id: (
+                CotizacionRepuesto.query.filter_by(proveedor_id=proveedor.id).count(),
+                SolicitudRepuesto.query.filter_by(proveedor_seleccionado_id=proveedor.id).count()
+            )
+            for proveedor in Proveedor.query
+        }
+    
+    respuesta = cliente_medido.get('/api/proveedores')
+    
+    datos = respuesta.get_json()['data']
+    assert {p['id']: (p['cotizaciones_enviadas'], p['pedidos_realizados']) for p in datos} == esperados
+    assert respuesta.headers['X-Query-Count'] == '2'
+
+
+@pytest.mark.parametrize('tabla, columna', [
+    ('vehiculos', 'cliente_id'),
+    ('cotizaciones_repuestos', 'proveedor_id'),
+    ('solicitudes_repuestos', 'proveedor_seleccionado_id'),
+])
+def test_subconsultas_de_recuento_tienen_indice(app, tabla, columna):
+    with app.app_context():
+        indices = inspect(db.engine).get_indexes(tabla)
+    
+    assert any(indice['column_names'][0] == columna for indice in indices)
@@ -0,0 +1,59 @@
+from datetime import datetime
+
+from src.models import db
+from src.models.factura import Factura
+from src.models.revenue_rollup import RevenueRollup, reconstruir_revenue_rollup
+
+
+def _rollup():
+    return {
+        (fila.año, fila.mes, fila.estado): (round(fila.total, 2), fila.num_facturas)
+        for fila in RevenueRollup.query.all() if fila.num_facturas
+    }
+
+
+def _comprobar_contra_reconstruccion():
+    mantenido = _rollup()
+    reconstruir_revenue_rollup()
+    assert mantenido == _rollup()
+
+
+def test_rollup_sigue_las_escrituras_del_orm(app):
+    with app.app_context():
+        reconstruir_revenue_rollup()
+        
+        factura = Factura.query.filter_by(estado='enviada').first()
+        factura.estado = 'pagada'
+        otra = Factura.query.filter(Factura.id != factura.id).first()
+        otra.total = (otra.total or 0) + 100
+        otra.fecha_emision = datetime(2020, 3, 1)
+        db.session.delete(Factura.query.order_by(Factura.id.desc()).first())
+        db.session.commit()
+        
+        _comprobar_contra_reconstruccion()
+
+
+def test_rollup_con_instancias_expiradas(app):
+    with app.app_context():
+        reconstruir_revenue_rollup()
+        factura = Factura.query.filter_by(estado='enviada').first()
+        
+        factura.estado = 'pagada'
+        db.session.commit()
+        # La instancia está expirada: sin historial activo se perdería el estado previo
+        factura.fecha_emision = datetime(2021, 6, 1)
+        db.session.commit()
+        
+        _comprobar_contra_reconstruccion()
+
+
+def test_grafico_de_ingresos_usa_el_rollup(app, cliente, contar_consultas):
+    with app.app_context():
+        reconstruir_revenue_rollup()
+    cliente.get('/api/dashboard/revenue-chart?months=12')
+    
+    with contar_consultas() as cuenta:
+        respuesta = cliente.get('/api/dashboard/revenue-chart?months=12')
+    
+    assert respuesta.status_code == 200
+    assert cuenta[0] <= 2
@@ -0,0 +1,50 @@
+import re
+from datetime import datetime
+
+import pytest
+
+from src.models import db
+from src.models.factura import Factura, reservar_numeros_factura
+from src.models.secuencia import Secuencia
+
+
+def _numero(numero_factura):
+    return int(re.search(r'(\d+)$', numero_factura).group(1))
+
+
+def test_numeracion_continua_la_existente(app):
+    with app.app_context():
+        mayor = max(_numero(n) for n, in db.session.query(Factura.numero_factura))
+        
+        numeros = reservar_numeros_factura(3)
+        db.session.commit()
+        
+        assert [_numero(n) for n in numeros] == [mayor + 1, mayor + 2, mayor + 3]
+        assert [_numero(n) for n in reservar_numeros_factura()] == [mayor + 4]
+
+
+def test_reserva_deshecha_libera_los_numeros(app):
+    with app.app_context():
+        primero = reservar_numeros_factura(2)
+        db.session.commit()
+        
+        reservar_numeros_factura(5)
+        db.session.rollback()
+        
+        siguiente = reservar_numeros_factura()[0]
+        assert _numero(siguiente) == _numero(primero[-1]) + 1
+
+
+def test_serie_anual(crear_app):
+    app = crear_app(FACTURA_SERIE_ANUAL=True)
+    with app.app_context():
+        numeros = reservar_numeros_factura(2, datetime(2031, 5, 1))
+        db.session.commit()
+        
+        assert numeros == ['FT2031-000001', 'FT2031-000002']
+        assert db.session.get(Secuencia, 'facturas:2031').valor == 2
+
+
+def test_bloques_no_admitidos_con_sqlite(crear_app):
+    with pytest.raises(ValueError, match='FACTURA_BLOQUE_NUMEROS'):
+        crear_app(FACTURA_BLOQUE_NUMEROS=10)
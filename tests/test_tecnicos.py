@@ -0,0 +1,47 @@
+from src.models import db
+from src.models.diagnostico import Diagnostico
+from src.models.tecnico import ESTADOS_DIAGNOSTICO_ACTIVO, Tecnico
+
+
+def _añadir_tecnicos(app, cantidad):
+    with app.app_context():
+        for i in range(cantidad):
+            tecnico = Tecnico(nombre=f'Técnico {i}', telefono='600000000', email=f't{i}@taller.com', tarifa_hora=40)
+            tecnico.set_especialidades(['frenos', 'electricidad'] if i % 2 else ['motor'])
+            db.session.add(tecnico)
+        db.session.commit()
+
+
+def test_listado_con_especialidades_y_diagnosticos_activos(app, cliente):
+    _añadir_tecnicos(app, 3)
+    with app.app_context():
+        esperados = {
+            tecnico.id: (
+                sorted(tecnico.get_especialidades()),
+                Diagnostico.query.filter(
+                    Diagnostico.tecnico_id == tecnico.id, Diagnostico.estado.in_(ESTADOS_DIAGNOSTICO_ACTIVO)
+                ).count()
+            )
+            for tecnico in Tecnico.query.filter_by(activo=True)
+        }
+    
+    datos = cliente.get('/api/tecnicos').get_json()['data']
+    
+    assert {t['id']: (t['especialidades'], t['diagnosticos_activos']) for t in datos} == esperados
+    assert any(activos for _, activos in esperados.values())
+    
+    frenos = cliente.get('/api/tecnicos?especialidad=frenos').get_json()['data']
+    assert frenos and all('frenos' in t['especialidades'] for t in frenos)
+    assert {t['id'] for t in frenos} == {id for id, (esp, _) in esperados.items() if 'frenos' in esp}
+
+
+def test_consultas_no_dependen_del_numero_de_tecnicos(app, cliente_medido):
+    antes = cliente_medido.get('/api/tecnicos').headers['X-Query-Count']
+    _añadir_tecnicos(app, 20)
+    
+    respuesta = cliente_medido.get('/api/tecnicos')
+    
+    assert len(respuesta.get_json()['data']) >= 20
+    # Versiones del ETag, técnicos, especialidades (SELECT ... IN) y recuento agrupado de diagnósticos
+    assert respuesta.headers['X-Query-Count'] == antes == '4'
+    assert cliente_medido.get('/api/tecnicos?especialidad=motor').headers['X-Query-Count'] == '4'
@@ -0,0 +1,29 @@
+import pytest
+
+
+@pytest.mark.parametrize('limit', ['abc', '2.5', '0', '-3'])
+def test_lookup_limit_invalido_devuelve_400(cliente, limit):
+    respuesta = cliente.get(f'/api/vehiculos/lookup?q=1&limit={limit}')
+    
+    assert respuesta.status_code == 400
+    assert respuesta.get_json()['success'] is False
+
+
+def test_lookup_limit_se_acota(cliente):
+    datos = cliente.get('/api/vehiculos/lookup?q=1&limit=1000').get_json()
+    
+    assert datos['success'] is True
+    assert len(datos['data']) <= 20
+
+
+@pytest.mark.parametrize('meses', ['abc', '-1', '1000000'])
+def test_sin_servicio_meses_fuera_de_rango_devuelve_400(cliente, meses):
+    respuesta = cliente.get(f'/api/vehiculos?sin_servicio_meses={meses}')
+    
+    assert respuesta.status_code == 400
+    assert respuesta.get_json()['success'] is False
+
+
+@pytest.mark.parametrize('meses', ['0', '6', '1200'])
+def test_sin_servicio_meses_en_rango(cliente, meses):
+    assert cliente.get(f'/api/vehiculos?sin_servicio_meses={meses}').status_code == 200